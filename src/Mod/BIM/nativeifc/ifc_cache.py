@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 2.1 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+
+"""This module contains the on-disk geometry cache of NativeIFC. The geometry the
+ifcopenshell iterator produced for an element is stored in a database per IFC file,
+under the GlobalId of the element and a hash of everything its geometry depends on,
+so elements that didn't change don't go through the iterator again when the file
+is reopened"""
+
+import hashlib
+import marshal
+import os
+import re
+import sqlite3
+import sys
+import zlib
+
+import ifcopenshell
+
+import FreeCAD
+
+from . import ifc_tools
+
+VERSION = 1  # increase when the format of the cached data changes
+REFERENCE = re.compile(r"#(\d+)")
+
+
+def get_disk_cache(ifcfile, cache):
+    """Returns the disk cache of the given ifc file, which is kept in its session
+    cache dictionary, or None if the file has no disk cache"""
+
+    if "Disk" not in cache:
+        cache["Disk"] = None
+        if ifc_tools.PARAMS.GetBool("DiskCache", True):
+            project = ifc_tools.get_project(ifcfile)
+            filepath = getattr(project, "IfcFilePath", None)
+            if filepath:
+                try:
+                    cache["Disk"] = DiskCache(get_cache_path(filepath), ifcfile)
+                except (OSError, sqlite3.Error) as e:
+                    FreeCAD.Console.PrintWarning(
+                        "NativeIFC: Unable to open the geometry cache: {}\n".format(e)
+                    )
+    return cache["Disk"]
+
+
+def get_cache_path(filepath):
+    """Returns the path of the cache database of the given IFC file"""
+
+    name = hashlib.sha1(os.path.abspath(filepath).encode("utf8")).hexdigest()
+    return os.path.join(FreeCAD.getUserCachePath(), "NativeIFC", name + ".sqlite")
+
+
+def get_entity_hash(ifcfile, entity, hashes):
+    """Returns a hash of the contents of the given entity and all the entities it
+    references, which doesn't depend on their step ids. The hashes of the entities
+    already seen are kept in the hashes dictionary"""
+
+    if entity is None:
+        return ""
+    texts = {}
+    stack = [entity.id()]
+    while stack:
+        eid = stack[-1]
+        if eid in hashes:
+            stack.pop()
+            continue
+        if eid not in texts:
+            try:
+                texts[eid] = str(ifcfile.by_id(eid)).split("=", 1)[1]
+            except RuntimeError:
+                # not a reference but a number in a string that looks like one
+                hashes[eid] = "#" + str(eid)
+                stack.pop()
+                continue
+            refs = [int(r) for r in REFERENCE.findall(texts[eid])]
+            refs = [r for r in refs if r not in hashes and r not in texts]
+            if refs:
+                stack.extend(refs)
+                continue
+        text = REFERENCE.sub(lambda m: hashes.get(int(m.group(1)), m.group(0)), texts[eid])
+        hashes[eid] = hashlib.sha1(text.encode("utf8")).hexdigest()
+        stack.pop()
+    return hashes[entity.id()]
+
+
+def get_context_key(ifcfile, hashes):
+    """Returns a hash of what the geometry of all elements of the file depends on"""
+
+    key = hashlib.sha1()
+    settings = (
+        VERSION,
+        ifcopenshell.version,
+        sys.version_info[:2],
+        ifc_tools.SCALE,
+        ifcfile.schema,
+        sorted(ifc_tools.get_body_context_ids(ifcfile)),
+    )
+    key.update(repr(settings).encode("utf8"))
+    # styles refer to the geometry they apply to, not the other way round
+    for styled in ifcfile.by_type("IfcStyledItem"):
+        key.update(str(styled.Item.id() if styled.Item else 0).encode("utf8"))
+        for style in styled.Styles or []:
+            key.update(get_entity_hash(ifcfile, style, hashes).encode("utf8"))
+    for rel in ifcfile.by_type("IfcRelAssociatesMaterial"):
+        key.update(str([o.id() for o in rel.RelatedObjects]).encode("utf8"))
+        key.update(get_entity_hash(ifcfile, rel.RelatingMaterial, hashes).encode("utf8"))
+    for rep in ifcfile.by_type("IfcMaterialDefinitionRepresentation"):
+        key.update(get_entity_hash(ifcfile, rep, hashes).encode("utf8"))
+    return key.hexdigest()
+
+
+def get_element_key(ifcfile, element, context, hashes):
+    """Returns a hash of everything the geometry of the given element depends on"""
+
+    entities = [element.Representation, element.ObjectPlacement]
+    for rel in getattr(element, "HasOpenings", None) or []:
+        opening = rel.RelatedOpeningElement
+        entities.extend([opening.Representation, opening.ObjectPlacement])
+    for rel in getattr(element, "HasProjections", None) or []:
+        projection = rel.RelatedFeatureElement
+        entities.extend([projection.Representation, projection.ObjectPlacement])
+    key = hashlib.sha1(context.encode("utf8"))
+    for entity in entities:
+        key.update(get_entity_hash(ifcfile, entity, hashes).encode("utf8"))
+    return key.hexdigest()
+
+
+class DiskCache:
+    """The geometry cache of an ifc file, kept in the given database file"""
+
+    def __init__(self, path, ifcfile):
+        self.ifcfile = ifcfile
+        self.context = None
+        self.hits = 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS geometry "
+            "(guid TEXT, mode TEXT, key TEXT, data BLOB, PRIMARY KEY (guid, mode))"
+        )
+
+    def reset(self):
+        """Forgets the context key, it is computed again on the next get_keys call.
+        Used after the file was modified, as styles or materials may have changed"""
+
+        self.context = None
+
+    def get_keys(self, elements):
+        """Returns a dictionary with the GlobalId and key of the given elements by id"""
+
+        hashes = {}
+        if self.context is None:
+            self.context = get_context_key(self.ifcfile, hashes)
+        keys = {}
+        for element in elements:
+            key = get_element_key(self.ifcfile, element, self.context, hashes)
+            keys[element.id()] = (element.GlobalId, key)
+        return keys
+
+    def read(self, mode, keys):
+        """Returns the data cached for the given mode ("Shape" or "Coin") by element id,
+        for the elements of keys (see get_keys) whose key didn't change"""
+
+        result = {}
+        query = "SELECT key, data FROM geometry WHERE guid = ? AND mode = ?"
+        try:
+            for eid, (guid, key) in keys.items():
+                row = self.db.execute(query, (guid, mode)).fetchone()
+                if row and row[0] == key:
+                    result[eid] = marshal.loads(zlib.decompress(row[1]))
+        except (sqlite3.Error, zlib.error, ValueError, EOFError) as e:
+            FreeCAD.Console.PrintWarning(
+                "NativeIFC: Unable to read the geometry cache: {}\n".format(e)
+            )
+        self.hits += len(result)
+        return result
+
+    def write(self, mode, entries):
+        """Stores a list of (guid, key, data) entries for the given mode"""
+
+        rows = [
+            (guid, mode, key, zlib.compress(marshal.dumps(data), 1)) for guid, key, data in entries
+        ]
+        try:
+            with self.db:
+                self.db.executemany("INSERT OR REPLACE INTO geometry VALUES (?, ?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            FreeCAD.Console.PrintWarning(
+                "NativeIFC: Unable to write the geometry cache: {}\n".format(e)
+            )
+
+    def count(self, mode):
+        """Returns the number of elements cached for the given mode"""
+
+        query = "SELECT COUNT(*) FROM geometry WHERE mode = ?"
+        return self.db.execute(query, (mode,)).fetchone()[0]
@@ -42,6 +42,7 @@ from FreeCAD import Base
 
 from . import ifc_tools
 from . import ifc_export
+from . import ifc_cache
 
 
 def generate_geometry(obj, cached=False):
@@ -77,7 +78,8 @@ def generate_geometry(obj, cached=False):
                 if placement:
                     obj.Placement = placement
                     return
-        elif obj.ViewObject and obj.ShapeMode == "Coin":
+        elif obj.ViewObject and obj.ShapeMode in ("Coin", "Mesh"):
+            # annotations have no body to mesh, Mesh mode shows them like Coin mode
             done = False
             node, placement = get_annotation_shape(element, ifcfile, coin=True)
             if node:
@@ -103,6 +105,28 @@ def generate_geometry(obj, cached=False):
         else:
             obj.Shape = Part.Shape()
             print_debug(obj)
+    elif obj.ShapeMode == "Mesh":
+        # lightweight triangulated geometry, the BREP is only built when the
+        # object is switched to Shape mode, for ex. when it gets edited
+        node, placement = generate_coin(ifcfile, elements, cached)
+        obj.Shape = Part.Shape()
+        mesh = get_mesh(node)
+        if placement:
+            obj.Placement = placement
+        else:
+            # the placements of several elements are baked into the node
+            mesh.transform(obj.Placement.inverse().toMatrix())
+        # the mesh follows the placement of the object, see ifc_objects.place_mesh
+        mesh.Placement = obj.Placement
+        set_mesh(obj, mesh)
+        if node:
+            if obj.ViewObject:
+                set_representation(obj.ViewObject, node)
+            colors = node[0]
+        else:
+            if obj.ViewObject:
+                set_representation(obj.ViewObject, None)
+            print_debug(obj)
     elif obj.ViewObject and obj.ShapeMode == "Coin":
         node, placement = generate_coin(ifcfile, elements, cached)
         if node:
@@ -116,6 +140,11 @@ def generate_geometry(obj, cached=False):
         if placement:
             obj.Placement = placement
 
+    # free the mesh of objects that left Mesh mode
+    if obj.ShapeMode != "Mesh" and "Mesh" in obj.PropertiesList:
+        if obj.Mesh.CountFacets:
+            set_mesh(obj, None)
+
     # set shape and diffuse colors
     if colors:
         QtCore.QTimer.singleShot(0, lambda: ifc_tools.set_colors(obj, colors))  # TODO migrate here?
@@ -130,28 +159,33 @@ def generate_shape(ifcfile, elements, cached=False):
     shapes = []
     colors = []
     cache = get_cache(ifcfile)
+    disk = ifc_cache.get_disk_cache(ifcfile, cache) if cached else None
+    keys = {}
 
     # get cached elements
     if cached:
+        if disk:
+            # elements not in the session cache might be in the disk cache
+            keys = disk.get_keys([e for e in elements if e.id() not in cache["Shape"]])
+            for eid, (brep, matrix, scolors) in disk.read("Shape", keys).items():
+                cache["Shape"][eid] = get_brep_shape(brep, FreeCAD.Matrix(*matrix))
+                cache["Color"][eid] = scolors
         rest = []
         for element in elements:
-            if element.id in cache["Shape"]:
-                shape = cache["Shape"][element.id]
+            if element.id() in cache["Shape"]:
+                shape = cache["Shape"][element.id()]
                 shapes.append(shape.copy())
-                if element.id in cache["Color"]:
-                    color = cache["Color"][element.id]
-                else:
-                    color = (0.8, 0.8, 0.8)
-                if len(color) <= 4:
-                    for face in shape.Faces:
-                        colors.append(color)
+                if element.id() in cache["Color"]:
+                    colors.extend(cache["Color"][element.id()])
                 else:
-                    colors = color
+                    colors.extend([(0.8, 0.8, 0.8)] * len(shape.Faces))
             else:
                 rest.append(element)
         if not rest:
             # all elements have been taken from cache, nothing more to do
-            return shapes, colors
+            if disk:
+                set_cache(ifcfile, cache)
+            return get_compound(shapes), colors
         elements = rest
 
     # prepare the iterator
@@ -161,25 +195,23 @@ def generate_shape(ifcfile, elements, cached=False):
     total = len(elements)
     progressbar = Base.ProgressIndicator()
     progressbar.start("Generating " + str(total) + " shapes...", total)
-    done = []
+    done = set()
+    entries = []
 
     # iterate
     while True:
         item = iterator.get()
         if item and item.id not in done:
-            done.append(item.id)
+            done.add(item.id)
             # get and transfer brep data
             brep = item.geometry.brep_data
-            shape = Part.Shape()
-            shape.importBrepFromString(brep, False)
             if hasattr(item.transformation.matrix, "data"):
                 # IfcOpenShell 0.7
                 mat = ifc_tools.get_freecad_matrix(item.transformation.matrix.data)
             else:
                 # IfcOpenShell 0.8
                 mat = ifc_tools.get_freecad_matrix(item.transformation.matrix)
-            shape.scale(ifc_tools.SCALE)
-            shape.transformShape(mat)
+            shape = get_brep_shape(brep, mat)
             shapes.append(shape)
 
             # get colors
@@ -214,6 +246,9 @@ def generate_shape(ifcfile, elements, cached=False):
             # update the cache
             cache["Shape"][item.id] = shape
             cache["Color"][item.id] = scolors
+            if item.id in keys:
+                guid, key = keys[item.id]
+                entries.append((guid, key, (brep, tuple(mat.A), scolors)))
             colors.extend(scolors)
             progressbar.next(True)
         if not iterator.next():
@@ -221,15 +256,29 @@ def generate_shape(ifcfile, elements, cached=False):
 
     # write the cache
     set_cache(ifcfile, cache)
-
-    # compound the shape if needed
-    if len(shapes) == 1:
-        shape = shapes[0]
-    else:
-        shape = Part.makeCompound(shapes)
+    if entries:
+        disk.write("Shape", entries)
 
     progressbar.stop()
-    return shape, colors
+    return get_compound(shapes), colors
+
+
+def get_brep_shape(brep, matrix):
+    """Returns a Part shape from brep data of the iterator and its FreeCAD matrix"""
+
+    shape = Part.Shape()
+    shape.importBrepFromString(brep, False)
+    shape.scale(ifc_tools.SCALE)
+    shape.transformShape(matrix)
+    return shape
+
+
+def get_compound(shapes):
+    """Returns a compound of the given shapes, or the shape if there is only one"""
+
+    if len(shapes) == 1:
+        return shapes[0]
+    return Part.makeCompound(shapes)
 
 
 def generate_coin(ifcfile, elements, cached=False):
@@ -248,7 +297,15 @@ def generate_coin(ifcfile, elements, cached=False):
     # process cached elements
     placement = None
     cache = get_cache(ifcfile)
+    disk = ifc_cache.get_disk_cache(ifcfile, cache) if cached else None
+    keys = {}
     if cached:
+        if disk:
+            # elements not in the session cache might be in the disk cache
+            keys = disk.get_keys([e for e in elements if e.id() not in cache["Coin"]])
+            for eid, (node, matrix) in disk.read("Coin", keys).items():
+                cache["Coin"][eid] = node
+                cache["Placement"][eid] = FreeCAD.Placement(FreeCAD.Matrix(*matrix))
         rest = []
         for element in elements:
             if element.id() in cache["Placement"]:
@@ -264,6 +321,8 @@ def generate_coin(ifcfile, elements, cached=False):
             placement = None
         if not rest:
             # all elements have been taken from cache, nothing more to do
+            if disk:
+                set_cache(ifcfile, cache)
             return unify(nodes), placement
         elements = rest
 
@@ -274,13 +333,14 @@ def generate_coin(ifcfile, elements, cached=False):
     total = len(elements)
     progressbar = Base.ProgressIndicator()
     progressbar.start("Generating " + str(total) + " shapes...", total)
-    done = []
+    done = set()
+    entries = []
 
     # iterate
     while True:
         item = iterator.get()
         if item and item.id not in done:
-            done.append(item.id)
+            done.add(item.id)
 
             # colors
             if item.geometry.materials:
@@ -305,9 +365,8 @@ def generate_coin(ifcfile, elements, cached=False):
                 # IfcOpenShell 0.8
                 matrix = ifc_tools.get_freecad_matrix(item.transformation.matrix)
             placement = FreeCAD.Placement(matrix)
-            verts = item.geometry.verts
-            verts = [FreeCAD.Vector(verts[i : i + 3]) for i in range(0, len(verts), 3)]
-            verts = [tuple(v.multiply(ifc_tools.SCALE)) for v in verts]
+            verts = [v * ifc_tools.SCALE for v in item.geometry.verts]
+            verts = list(zip(verts[0::3], verts[1::3], verts[2::3]))
 
             # faces
             faces = list(item.geometry.faces)
@@ -325,6 +384,9 @@ def generate_coin(ifcfile, elements, cached=False):
             node = [color, verts, faces, edges]
             cache["Coin"][item.id] = node
             cache["Placement"][item.id] = placement
+            if item.id in keys:
+                guid, key = keys[item.id]
+                entries.append((guid, key, (node, tuple(matrix.A))))
 
             if grouping:
                 # if we are joining nodes together, their placement
@@ -344,16 +406,47 @@ def generate_coin(ifcfile, elements, cached=False):
 
     # write cache
     set_cache(ifcfile, cache)
+    if entries:
+        disk.write("Coin", entries)
 
     progressbar.stop()
     return nodes, placement
 
 
+def get_mesh(node):
+    """Returns a Mesh from unified coin node data. The triangles are gathered
+    from the vertex and index buffers in one go and passed to the mesh as
+    one list of 9 floats per triangle"""
+
+    import numpy
+    import Mesh
+
+    mesh = Mesh.Mesh()
+    if node and node[1] and node[2]:
+        verts = numpy.array(node[1], dtype=float)
+        faces = numpy.array(node[2], dtype=int).reshape(-1, 4)[:, :3]
+        mesh.addFacets(verts[faces].reshape(-1, 9).tolist())
+    return mesh
+
+
+def set_mesh(obj, mesh):
+    """Sets the given mesh as the Mesh property of the object, adding the
+    property if needed. The mesh is not saved with the file, it is rebuilt
+    from the IFC data on recompute"""
+
+    import Mesh
+
+    if "Mesh" not in obj.PropertiesList:
+        obj.addProperty("Mesh::PropertyMeshKernel", "Mesh", "Base", locked=True)
+        obj.setPropertyStatus("Mesh", ["ReadOnly", "Transient"])
+    obj.Mesh = mesh if mesh else Mesh.Mesh()
+
+
 def get_decomposition(obj):
     """Gets the elements we need to render this object"""
 
     # stime = time.time()
-    obj_ids = [c.StepId for c in obj.OutListRecursive if hasattr(c, "StepId")]
+    obj_ids = {c.StepId for c in obj.OutListRecursive if hasattr(c, "StepId")}
     element = ifc_tools.get_ifc_element(obj)
     elements = get_decomposed_elements(element, obj)
     elements = filter_types(elements, obj_ids)
@@ -361,7 +454,7 @@ def get_decomposition(obj):
     return elements
 
 
-def filter_types(elements, obj_ids=[]):
+def filter_types(elements, obj_ids=()):
     """Remove unrenderable (for now) elements from the given list"""
 
     elements = [e for e in elements if e.is_a("IfcProduct")]
@@ -376,15 +469,17 @@ def filter_types(elements, obj_ids=[]):
 def get_decomposed_elements(element, obj=None):
     """Returns a list of renderable elements form a base element"""
 
+    # the seen set avoids searching the result list for each element
     result = []
+    seen = set()
     if getattr(element, "Representation", None):
-        if element not in result:
-            result.append(element)
+        result.append(element)
+        seen.add(element.id())
     if not obj or not hasattr(obj, "Group"):
-        child_ids = []
+        child_ids = set()
     else:
         # add child elements that are not yet rendered
-        child_ids = [c.StepId for c in obj.Group if hasattr(c, "StepId")]
+        child_ids = {c.StepId for c in obj.Group if hasattr(c, "StepId")}
     try:
         dec = ifcopenshell.util.element.get_decomposition(element, is_recursive=False)
     except:
@@ -392,12 +487,14 @@ def get_decomposed_elements(element, obj=None):
         dec = ifcopenshell.util.element.get_decomposition(element)
     for child in dec:
         if child.id() not in child_ids:
-            if child not in result:
+            if child.id() not in seen:
                 result.append(child)
+                seen.add(child.id())
             # for el in get_decomposed_elements(child, obj):
             for el in ifcopenshell.util.element.get_decomposition(child):
-                if el not in result:
+                if el.id() not in seen:
                     result.append(el)
+                    seen.add(el.id())
     return result
 
 
@@ -436,33 +533,23 @@ def get_geom_iterator(ifcfile, elements, brep_mode):
 def get_cache(ifcfile):
     """Returns the shape cache dictionary associated with this ifc file"""
 
-    for d in FreeCAD.listDocuments().values():
-        if hasattr(d, "Proxy") and hasattr(d.Proxy, "ifcfile"):
-            if d.Proxy.ifcfile == ifcfile:
-                if hasattr(d.Proxy, "ifccache") and d.Proxy.ifccache:
-                    return d.Proxy.ifccache
-        for o in d.Objects:
-            if hasattr(o, "Proxy") and hasattr(o.Proxy, "ifcfile"):
-                if o.Proxy.ifcfile == ifcfile:
-                    if hasattr(o.Proxy, "ifccache") and o.Proxy.ifccache:
-                        return o.Proxy.ifccache
+    project = ifc_tools.get_project(ifcfile)
+    cache = getattr(getattr(project, "Proxy", None), "ifccache", None)
+    if cache:
+        return cache
     # init a new cache
-    return {"Shape": {}, "Color": {}, "Coin": {}, "Placement": {}}
+    cache = {"Shape": {}, "Color": {}, "Coin": {}, "Placement": {}}
+    if project:
+        project.Proxy.ifccache = cache
+    return cache
 
 
 def set_cache(ifcfile, cache):
     """Sets the given dictionary as shape cache for the given ifc file"""
 
-    for d in FreeCAD.listDocuments().values():
-        if hasattr(d, "Proxy") and hasattr(d.Proxy, "ifcfile"):
-            if d.Proxy.ifcfile == ifcfile:
-                d.Proxy.ifccache = cache
-                return
-        for o in d.Objects:
-            if hasattr(o, "Proxy") and hasattr(o.Proxy, "ifcfile"):
-                if o.Proxy.ifcfile == ifcfile:
-                    o.Proxy.ifccache = cache
-                    return
+    project = ifc_tools.get_project(ifcfile)
+    if project:
+        project.Proxy.ifccache = cache
 
 
 def set_representation(vobj, node):
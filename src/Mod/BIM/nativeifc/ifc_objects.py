@@ -82,6 +82,7 @@ class ifc_object:
         elif prop in ["DisplayLength","DisplayHeight","Depth"]:
             self.edit_annotation(obj, prop)
         elif prop == "Placement":
+            self.place_mesh(obj)
             if getattr(self, "virgin_placement", False):
                 self.virgin_placement = False
             elif obj.Placement != getattr(self, "old_placement", None):
@@ -107,7 +108,7 @@ class ifc_object:
 
             if obj.OutListRecursive:
                 for child in obj.OutListRecursive:
-                    if getattr(child, "ShapeMode", None) == "Coin":
+                    if getattr(child, "ShapeMode", None) in ("Coin", "Mesh"):
                         child.Proxy.cached = True
                         child.touch()
             else:
@@ -274,6 +275,9 @@ class ifc_object:
 
         result = ifc_geometry.set_geom_property(obj, prop)
         if result:
+            if getattr(obj, "ShapeMode", None) == "Mesh":
+                # edited objects get their full shape
+                obj.ShapeMode = "Shape"
             obj.touch()
 
     def edit_schema(self, obj, schema):
@@ -309,6 +313,15 @@ class ifc_object:
 
         ifc_tools.set_placement(obj)
 
+    def place_mesh(self, obj):
+        """Moves the mesh of objects in Mesh mode along with their placement"""
+
+        mesh = getattr(obj, "Mesh", None)
+        if mesh is not None and mesh.CountFacets and mesh.Placement != obj.Placement:
+            mesh = mesh.copy()
+            mesh.Placement = obj.Placement
+            obj.Mesh = mesh
+
     def edit_pset(self, obj, prop):
         """Edits a Pset value"""
 
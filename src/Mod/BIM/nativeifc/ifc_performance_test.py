@@ -22,6 +22,7 @@
 # *                                                                         *
 # ***************************************************************************
 
+import json
 import os
 import time
 import unittest
@@ -29,6 +30,7 @@ import unittest
 import FreeCAD
 
 from . import ifc_import
+from . import ifc_tools
 
 
 FILES = [
@@ -43,6 +45,14 @@ FILES = [
 
 BBIM = ["00:00", "00:01", "00:04", "00:05", "00:05", "00:14", "00:36"]
 
+# the benchmark compares the import times with the ones stored in the file
+# given by this environment variable
+BASELINE_VARIABLE = "NATIVEIFC_BENCHMARK_BASELINE"
+
+# tolerated slowdown factor, and seconds added to absorb noise on small files
+SLOWDOWN = 1.25
+MARGIN = 0.5
+
 
 class NativeIFCTest(unittest.TestCase):
     results = []
@@ -158,6 +168,78 @@ class NativeIFCTest(unittest.TestCase):
                 print("| " + " | ".join(l) + " |")
 
 
+class NativeIFCBenchmark(unittest.TestCase):
+    """Guards the import times of the files above against a baseline file,
+    given by the NATIVEIFC_BENCHMARK_BASELINE environment variable. The
+    first run creates the baseline, delete the file to make a new one"""
+
+    def test_benchmark(self):
+        baseline = os.environ.get(BASELINE_VARIABLE)
+        if not baseline:
+            self.skipTest("No baseline file given in " + BASELINE_VARIABLE)
+        if not get_benchmark_files():
+            self.skipTest("None of the benchmark files found")
+        slower = benchmark(baseline)
+        if slower is None:
+            self.skipTest("Baseline created: " + baseline)
+        self.assertFalse(slower, "Import got slower: " + ", ".join(slower))
+
+
+def get_benchmark_files():
+    """Returns the paths of the files above found in the home directory"""
+
+    paths = [os.path.join(os.path.expanduser("~"), f) for f in FILES]
+    return [p for p in paths if os.path.exists(p)]
+
+
+def benchmark(baseline):
+    """Imports the available files in coin and shape mode and compares the
+    import times with the ones of the given baseline file. Returns the list
+    of imports that got slower, or None if the baseline didn't exist and
+    was created"""
+
+    times = {}
+    for path in get_benchmark_files():
+        f = os.path.basename(path)
+        times[f + " (coin)"] = time_import(path, 1)
+        if FILES.index(f) < 5:
+            # the bigger files take too long in shape mode
+            times[f + " (shape)"] = time_import(path, 0)
+    base = {}
+    if os.path.exists(baseline):
+        with open(baseline) as fp:
+            base = json.load(fp)
+    print("| File | Import time | Baseline |")
+    print("| ---- | ----------- | -------- |")
+    for key, t in times.items():
+        b = "%.2f s" % base[key] if key in base else "-"
+        print("| " + " | ".join([key, "%.2f s" % t, b]) + " |")
+    if not base:
+        with open(baseline, "w") as fp:
+            json.dump(times, fp, indent=1)
+        print("Baseline created:", baseline)
+        return None
+    return [k for k, t in times.items() if k in base and t > base[k] * SLOWDOWN + MARGIN]
+
+
+def time_import(path, shapemode):
+    """Returns the time in seconds it takes to import the given file
+    in a new document. The disk cache is turned off, so the geometry
+    is always generated"""
+
+    diskcache = ifc_tools.PARAMS.GetBool("DiskCache", True)
+    ifc_tools.PARAMS.SetBool("DiskCache", False)
+    d = FreeCAD.newDocument()
+    try:
+        stime = time.perf_counter()
+        ifc_import.insert(path, d.Name, strategy=0, shapemode=shapemode, switchwb=0, silent=True)
+        t = time.perf_counter() - stime
+    finally:
+        FreeCAD.closeDocument(d.Name)
+        ifc_tools.PARAMS.SetBool("DiskCache", diskcache)
+    return t
+
+
 def test():
     "This is meant to be used from a terminal, to run the tests without the GUI"
 
@@ -44,6 +44,7 @@ from . import ifc_layers
 from . import ifc_psets
 from . import ifc_objects
 from . import ifc_generator
+from . import ifc_cache
 
 
 IFC_FILE_PATH = None  # downloaded IFC file path
@@ -392,6 +393,92 @@ class NativeIFCTest(unittest.TestCase):
         ifc_psets.add_property(ifcfile, pset, "MyMessageToTheWorld", "Hello, World!")
         self.assertTrue(ifc_psets.has_psets(obj), "Psets failed")
 
+    def test16_DiskCache(self):
+        FreeCAD.Console.PrintMessage("NativeIFC 16: Disk cache...")
+
+        def import_volumes():
+            clearObjects()
+            ifc_import.insert(
+                fp,
+                "IfcTest",
+                strategy=2,
+                shapemode=0,
+                switchwb=0,
+                silent=True,
+                singledoc=SINGLEDOC,
+            )
+            objs = FreeCAD.getDocument("IfcTest").Objects
+            return {o.StepId: o.Shape.Volume for o in objs if hasattr(o, "StepId")}
+
+        fp = getIfcFilePath()
+        cache_path = ifc_cache.get_cache_path(fp)
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        volumes = import_volumes()
+        ifcfile = ifc_tools.get_ifcfile(FreeCAD.getDocument("IfcTest").Objects[-1])
+        self.assertEqual(ifc_generator.get_cache(ifcfile)["Disk"].hits, 0)
+        cached_volumes = import_volumes()
+        ifcfile = ifc_tools.get_ifcfile(FreeCAD.getDocument("IfcTest").Objects[-1])
+        disk = ifc_generator.get_cache(ifcfile)["Disk"]
+        self.assertTrue(disk.hits > 0, "DiskCache failed")
+        self.assertEqual(volumes.keys(), cached_volumes.keys())
+        for stepid, volume in volumes.items():
+            self.assertAlmostEqual(cached_volumes[stepid], volume, places=3)
+        # edits reset the context of the keys, a new material changes them
+        element = ifcfile[next(iter(volumes))]
+        keys = disk.get_keys([element])
+        material = ifc_tools.api_run("material.add_material", ifcfile, name="DiskCache")
+        self.assertIsNone(disk.context, "DiskCache context not reset")
+        try:
+            ifc_tools.api_run(
+                "material.assign_material", ifcfile, products=[element], material=material
+            )
+        except TypeError:
+            ifc_tools.api_run(
+                "material.assign_material", ifcfile, product=element, material=material
+            )
+        self.assertNotEqual(disk.get_keys([element]), keys, "DiskCache key not changed")
+
+    def test17_MeshMode(self):
+        FreeCAD.Console.PrintMessage("NativeIFC 17: Mesh mode...")
+
+        def import_objects(shapemode):
+            clearObjects()
+            ifc_import.insert(
+                getIfcFilePath(),
+                "IfcTest",
+                strategy=2,
+                shapemode=shapemode,
+                switchwb=0,
+                silent=True,
+                singledoc=SINGLEDOC,
+            )
+            objs = FreeCAD.getDocument("IfcTest").Objects
+            return {o.StepId: o for o in objs if hasattr(o, "StepId")}
+
+        objs = import_objects(0)
+        volumes = {k: o.Shape.Volume for k, o in objs.items() if not o.Shape.isNull()}
+        objs = import_objects(3)
+        meshes = [o for o in objs.values() if "Mesh" in o.PropertiesList]
+        meshes = [o for o in meshes if o.Mesh.CountFacets]
+        self.assertTrue(meshes, "Mesh mode failed")
+        for obj in meshes:
+            self.assertTrue(obj.Shape.isNull(), "Mesh mode built a shape")
+            volume = volumes.get(obj.StepId)
+            if volume and obj.Mesh.isSolid():
+                self.assertTrue(abs(obj.Mesh.Volume - volume) <= volume * 0.01)
+        obj = meshes[0]
+        center = obj.Mesh.BoundBox.Center
+        placement = obj.Placement.copy()
+        placement.move(FreeCAD.Vector(1000, 0, 0))
+        obj.Placement = placement
+        self.assertTrue(obj.Mesh.Placement.isSame(placement), "Mesh did not follow the placement")
+        self.assertAlmostEqual(obj.Mesh.BoundBox.Center.x, center.x + 1000, places=3)
+        obj.ShapeMode = "Shape"
+        obj.Document.recompute()
+        self.assertFalse(obj.Shape.isNull(), "Switching from mesh to shape failed")
+        self.assertEqual(obj.Mesh.CountFacets, 0)
+
 
 IFCFILECONTENT="""ISO-10303-21;
 HEADER;
@@ -25,6 +25,7 @@
 """This is the main NativeIFC module"""
 
 import os
+import weakref
 
 from PySide import QtCore
 
@@ -73,6 +74,7 @@ SHORT = False  # If True, only Step ID attribute is created
 ROUND = 8  # rounding value for placements
 DEFAULT_SHAPEMODE = "Coin"  # Can be Shape, Coin or None
 PARAMS = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/NativeIFC")
+PROJECTS = {}  # id(ifcfile): (weak reference to ifcfile, project), see find_project
 
 
 def create_document(document, filename=None, shapemode=0, strategy=0, silent=False):
@@ -83,6 +85,7 @@ def create_document(document, filename=None, shapemode=0, strategy=0, silent=Fal
     shapemode: 0 = full shape
                1 = coin only
                2 = no representation
+               3 = mesh only
     strategy:  0 = only root object
                1 = only building structure
                2 = all children
@@ -103,6 +106,7 @@ def create_document_object(
     shapemode: 0 = full shape
                1 = coin only
                2 = no representation
+               3 = mesh only
     strategy:  0 = only root object
                1 = only building structure
                2 = all children
@@ -132,6 +136,7 @@ def convert_document(document, filename=None, shapemode=0, strategy=0, silent=Fa
     shapemode: 0 = full shape
                1 = coin only
                2 = no representation
+               3 = mesh only
     strategy:  0 = only root object
                1 = only bbuilding structure
                2 = all children
@@ -270,12 +275,13 @@ def api_run(*args, **kwargs):
     result = ifcopenshell.api.run(*args, **kwargs)
     # *args are typically command, ifcfile
     if len(args) > 1:
-        ifcfile = args[1]
-        for d in FreeCAD.listDocuments().values():
-            for o in d.Objects:
-                if hasattr(o, "Proxy") and hasattr(o.Proxy, "ifcfile"):
-                    if o.Proxy.ifcfile == ifcfile:
-                        o.Modified = True
+        project = find_project(args[1])
+        if isinstance(project, FreeCAD.DocumentObject):
+            project.Modified = True
+        # the keys of the disk cache depend on the styles and materials of the file
+        cache = getattr(getattr(project, "Proxy", None), "ifccache", None)
+        if cache and cache.get("Disk"):
+            cache["Disk"].reset()
     return result
 
 
@@ -483,12 +489,7 @@ def get_project(obj):
 
     proj_types = ("IfcProject", "IfcProjectLibrary")
     if isinstance(obj, ifcopenshell.file):
-        for d in FreeCAD.listDocuments().values():
-            for o in d.Objects:
-                if hasattr(o, "Proxy") and hasattr(o.Proxy, "ifcfile"):
-                    if o.Proxy.ifcfile == obj:
-                        return o
-        return None
+        return find_project(obj)
     if isinstance(obj, ifcopenshell.entity_instance):
         obj = get_object(obj)
     if hasattr(obj, "IfcFilePath"):
@@ -504,6 +505,31 @@ def get_project(obj):
     return None
 
 
+def find_project(ifcfile):
+    """Returns the document or document object whose proxy holds the given ifcfile.
+    Once found, the project is kept in the PROJECTS registry, so the documents only
+    need to be searched again if the project doesn't hold the ifcfile anymore"""
+
+    key = id(ifcfile)
+    if key in PROJECTS:
+        ref, project = PROJECTS[key]
+        if ref() is ifcfile:
+            try:
+                if project.Proxy.ifcfile == ifcfile:
+                    return project
+            except (AttributeError, ReferenceError, RuntimeError):
+                # the object was deleted or the document closed
+                pass
+        del PROJECTS[key]
+    for d in FreeCAD.listDocuments().values():
+        for o in [d] + d.Objects:
+            if getattr(getattr(o, "Proxy", None), "ifcfile", None) == ifcfile:
+                ref = weakref.ref(ifcfile, lambda r: PROJECTS.pop(key, None))
+                PROJECTS[key] = (ref, o)
+                return o
+    return None
+
+
 def can_expand(obj, ifcfile=None):
     """Returns True if this object can have any more child extracted"""
 
@@ -618,6 +644,7 @@ def add_properties(
             "Shape",
             "Coin",
             "None",
+            "Mesh",
         ]  # possible shape modes for all IFC objects
         if isinstance(shapemode, int):
             shapemode = shapemodes[shapemode]
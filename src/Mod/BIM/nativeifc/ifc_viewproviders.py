@@ -50,12 +50,12 @@ class ifc_vp_object:
             for child in vobj.Object.Group:
                 child.ViewObject.Visibility = vobj.Visibility
             return True
-        elif prop == "LineColor" and vobj.Object.ShapeMode == "Coin":
+        elif prop == "LineColor" and vobj.Object.ShapeMode in ("Coin", "Mesh"):
             lc = vobj.LineColor
             basenode = vobj.RootNode.getChild(2).getChild(0)
             if basenode.getNumChildren() == 5:
                 basenode[4][0][3].diffuseColor.setValue(lc[0], lc[1], lc[2])
-        elif prop == "LineWidth" and vobj.Object.ShapeMode == "Coin":
+        elif prop == "LineWidth" and vobj.Object.ShapeMode in ("Coin", "Mesh"):
             basenode = vobj.RootNode.getChild(2).getChild(0)
             if basenode.getNumChildren() == 5:
                 basenode[4][0][4].lineWidth = vobj.LineWidth
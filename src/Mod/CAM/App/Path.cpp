@@ -22,6 +22,9 @@
 
 #include "PreCompiled.h"
 
+#include <cmath>
+#include <set>
+
 #include <App/Application.h>
 #include <Base/Console.h>
 #include <Base/Reader.h>
@@ -118,6 +121,73 @@ void Toolpath::deleteCommand(int pos)
     recalculate();
 }
 
+std::vector<std::string> Toolpath::getParameterNames() const
+{
+    // the axes first, in the order of the gcode, followed by all others
+    std::vector<std::string> names = {"X", "Y", "Z", "A", "B", "C", "I", "J", "K", "F"};
+    std::set<std::string> known(names.begin(), names.end());
+    std::set<std::string> others;
+    for (const Command* cmd : vpcCommands) {
+        for (const auto& param : cmd->Parameters) {
+            if (known.find(param.first) == known.end()) {
+                others.insert(param.first);
+            }
+        }
+    }
+    names.insert(names.end(), others.begin(), others.end());
+    return names;
+}
+
+void Toolpath::getArrays(const std::vector<std::string>& columns,
+                         std::vector<std::string>& names,
+                         int* codes,
+                         double* values) const
+{
+    std::map<std::string, int> nameIndex;
+    const std::size_t width = columns.size();
+    const double missing = std::numeric_limits<double>::quiet_NaN();
+    for (std::size_t i = 0; i < vpcCommands.size(); ++i) {
+        const Command* cmd = vpcCommands[i];
+        auto it = nameIndex.find(cmd->Name);
+        if (it == nameIndex.end()) {
+            it = nameIndex.emplace(cmd->Name, static_cast<int>(names.size())).first;
+            names.push_back(cmd->Name);
+        }
+        codes[i] = it->second;
+        double* row = values + i * width;
+        for (std::size_t j = 0; j < width; ++j) {
+            row[j] = cmd->getParam(columns[j], missing);
+        }
+    }
+}
+
+void Toolpath::addArrays(const std::vector<std::string>& names,
+                         const std::vector<std::string>& columns,
+                         const int* codes,
+                         const double* values,
+                         std::size_t count)
+{
+    const std::size_t width = columns.size();
+    for (std::size_t i = 0; i < count; ++i) {
+        if (codes[i] < 0 || codes[i] >= static_cast<int>(names.size())) {
+            throw Base::IndexError("Command code not in range");
+        }
+    }
+    vpcCommands.reserve(vpcCommands.size() + count);
+    for (std::size_t i = 0; i < count; ++i) {
+        Command* cmd = new Command();
+        cmd->Name = names[codes[i]];
+        const double* row = values + i * width;
+        for (std::size_t j = 0; j < width; ++j) {
+            if (!std::isnan(row[j])) {
+                cmd->Parameters[columns[j]] = row[j];
+            }
+        }
+        vpcCommands.push_back(cmd);
+    }
+    recalculate();
+}
+
 double Toolpath::getLength()
 {
     if (vpcCommands.empty()) {
@@ -66,6 +66,19 @@ public:
     std::string toGCode() const;      // gets a gcode string representation from the Path
     Base::BoundBox3d getBoundBox() const;
 
+    // bulk access to the commands as a table of parameter values with one row per command and
+    // one column per parameter name, a parameter a command doesn't have is NaN
+    std::vector<std::string> getParameterNames() const;  // all parameter names of the commands
+    void getArrays(const std::vector<std::string>& columns,
+                   std::vector<std::string>& names,  // the distinct command names
+                   int* codes,                       // index into names for each command
+                   double* values) const;            // getSize() * columns.size() values
+    void addArrays(const std::vector<std::string>& names,
+                   const std::vector<std::string>& columns,
+                   const int* codes,
+                   const double* values,
+                   std::size_t count);  // adds count commands at the end
+
     // shortcut functions
     unsigned int getSize() const
     {
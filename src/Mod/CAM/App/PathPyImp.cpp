@@ -22,6 +22,8 @@
 
 #include "PreCompiled.h"
 
+#include <boost/algorithm/string.hpp>
+
 #include "Base/GeometryPyCXX.h"
 
 // inclusion of the generated files (generated out of PathPy.xml)
@@ -192,6 +194,118 @@ PyObject* PathPy::deleteCommand(PyObject* args)
     Py_Error(PyExc_TypeError, "Wrong parameters - expected an integer (optional)");
 }
 
+static std::vector<std::string> stringList(PyObject* obj, bool upper)
+{
+    std::vector<std::string> strings;
+    Py::Sequence seq(obj);
+    for (Py::Sequence::iterator it = seq.begin(); it != seq.end(); ++it) {
+        std::string str = Py::String(*it).as_std_string("ascii");
+        if (upper) {
+            boost::to_upper(str);
+        }
+        strings.push_back(str);
+    }
+    return strings;
+}
+
+namespace
+{
+// a contiguous buffer of one of the given struct format types, released when going out of scope
+class Buffer
+{
+public:
+    Buffer(PyObject* obj, Py_ssize_t itemsize, const char* formats, const char* name)
+    {
+        if (PyObject_GetBuffer(obj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0) {
+            throw Py::Exception();
+        }
+        // skip the byte order, only native data is supported
+        std::string format(view.format ? view.format : "B");
+        format.erase(0, format.find_first_not_of("@="));
+        if (view.itemsize != itemsize || format.size() != 1
+            || std::string(formats).find(format[0]) == std::string::npos) {
+            PyBuffer_Release(&view);
+            std::string msg = std::string(name) + " has the wrong item type";
+            throw Py::TypeError(msg);
+        }
+    }
+    ~Buffer()
+    {
+        PyBuffer_Release(&view);
+    }
+    Buffer(const Buffer&) = delete;
+    Buffer& operator=(const Buffer&) = delete;
+
+    std::size_t size() const
+    {
+        return view.len / view.itemsize;
+    }
+    const void* data() const
+    {
+        return view.buf;
+    }
+
+private:
+    Py_buffer view;
+};
+}  // namespace
+
+PyObject* PathPy::getArrays(PyObject* args) const
+{
+    PyObject* pcColumns = Py_None;
+    if (!PyArg_ParseTuple(args, "|O", &pcColumns)) {
+        return nullptr;
+    }
+    const Toolpath* path = getToolpathPtr();
+    std::vector<std::string> columns = pcColumns == Py_None ? path->getParameterNames()
+                                                            : stringList(pcColumns, true);
+    const std::size_t count = path->getSize();
+
+    Py::Bytes codes(PyBytes_FromStringAndSize(nullptr, count * sizeof(int)), true);
+    Py::Bytes values(
+        PyBytes_FromStringAndSize(nullptr, count * columns.size() * sizeof(double)),
+        true);
+    std::vector<std::string> names;
+    path->getArrays(columns,
+                    names,
+                    reinterpret_cast<int*>(PyBytes_AsString(codes.ptr())),
+                    reinterpret_cast<double*>(PyBytes_AsString(values.ptr())));
+
+    Py::List pyNames;
+    for (const auto& name : names) {
+        pyNames.append(Py::String(name));
+    }
+    Py::List pyColumns;
+    for (const auto& column : columns) {
+        pyColumns.append(Py::String(column));
+    }
+    return Py::new_reference_to(Py::TupleN(pyNames, pyColumns, codes, values));
+}
+
+PyObject* PathPy::addArrays(PyObject* args)
+{
+    PyObject* pcNames;
+    PyObject* pcColumns;
+    PyObject* pcCodes;
+    PyObject* pcValues;
+    if (!PyArg_ParseTuple(args, "OOOO", &pcNames, &pcColumns, &pcCodes, &pcValues)) {
+        return nullptr;
+    }
+    std::vector<std::string> names = stringList(pcNames, false);
+    std::vector<std::string> columns = stringList(pcColumns, true);
+    Buffer codes(pcCodes, sizeof(int), "il", "codes");
+    Buffer values(pcValues, sizeof(double), "d", "values");
+    if (values.size() != codes.size() * columns.size()) {
+        throw Py::ValueError("values must have one row of columns for each code");
+    }
+    getToolpathPtr()->addArrays(names,
+                                columns,
+                                static_cast<const int*>(codes.data()),
+                                static_cast<const double*>(values.data()),
+                                codes.size());
+    Py_Return;
+}
+
 PyObject* PathPy::getCycleTime(PyObject* args) const
 {
     double hFeed, vFeed, hRapid, vRapid;
@@ -24,6 +24,8 @@
 
 import FreeCAD
 import Part
+import threading
+from unittest.mock import MagicMock, patch
 import Path.Op.Adaptive as PathAdaptive
 import Path.Main.Job as PathJob
 from CAMTests.PathTestUtils import PathTestBase
@@ -682,6 +684,125 @@ class TestPathAdaptive(PathTestBase):
 
         self.assertTrue(okAt10 and okAt5, "Path feeds extend excessively in +X")
 
+    def testRegionCache(self):
+        """testRegionCache() Verify changing the order of the cuts reuses the toolpaths of the
+        regions."""
+        adaptive = PathAdaptive.Create("Adaptive")
+        adaptive.Base = [(self.doc.Fusion, ["Face3", "Face10"])]  # (base, subs_list)
+        adaptive.Label = "testRegionCache+"
+        adaptive.Comment = "testRegionCache() Verify region toolpaths are reused."
+
+        # Set additional operation properties
+        setDepthsAndHeights(adaptive, 15, 0)
+        adaptive.FinishingProfile = False
+        adaptive.HelixAngle = 75.0
+        adaptive.HelixDiameterLimit.Value = 1.0
+        adaptive.LiftDistance.Value = 1.0
+        adaptive.StepOver = 75
+        adaptive.UseOutline = False
+        adaptive.StepDown.Value = 5.0
+
+        _addViewProvider(adaptive)
+        adaptive.recompute()
+        self.assertTrue(len(adaptive.Path.Commands) > 100, "Command count not greater than 100.")
+        self.assertTrue(adaptive.Proxy.regionCache)
+
+        with patch.object(
+            PathAdaptive, "_computeRegion", wraps=PathAdaptive._computeRegion
+        ) as computeRegion:
+            adaptive.OrderCutsByRegion = True
+            adaptive.recompute()
+            self.assertEqual(computeRegion.call_count, 0)
+        self.assertTrue(len(adaptive.Path.Commands) > 100, "Command count not greater than 100.")
+
+    def testRegionWorker(self):
+        """testRegionWorker() Verify the toolpaths computed by a RegionWorker in its thread match
+        the ones of the operation, a cancelled worker keeps no results and polling the worker
+        hands its results over to the operation."""
+        adaptive = PathAdaptive.Create("Adaptive")
+        adaptive.Base = [(self.doc.Fusion, ["Face3"])]  # (base, subs_list)
+        adaptive.Label = "testRegionWorker+"
+        adaptive.Comment = "testRegionWorker() Verify region toolpaths computed in a thread."
+
+        # Set additional operation properties
+        setDepthsAndHeights(adaptive, 15, 10)
+        adaptive.FinishingProfile = False
+        adaptive.HelixAngle = 75.0
+        adaptive.HelixDiameterLimit.Value = 1.0
+        adaptive.LiftDistance.Value = 1.0
+        adaptive.StepOver = 75
+        adaptive.UseOutline = False
+        _addViewProvider(adaptive)
+
+        # toolpaths of the regions computed in the operation
+        computed = []
+        computeRegion = PathAdaptive._computeRegion
+
+        def recordRegion(stockPaths, path2d, opType, params, progressFn):
+            toolpaths = computeRegion(stockPaths, path2d, opType, params, progressFn)
+            computed.append(((stockPaths, path2d, opType, params), toolpaths))
+            return toolpaths
+
+        with patch.object(PathAdaptive, "_computeRegion", side_effect=recordRegion):
+            adaptive.recompute()
+        self.assertTrue(computed, "No region computed.")
+        commands = [c.toGCode() for c in adaptive.Path.Commands]
+        cache = adaptive.Proxy.regionCache
+        regions = []
+        for args, toolpaths in computed:
+            key = next(k for k, v in cache.items() if v is toolpaths)
+            regions.append((key,) + args)
+
+        # the same toolpaths in the worker thread, the engine reports progress from it
+        worker = PathAdaptive.RegionWorker(regions[:1])
+        worker.start()
+        worker.thread.join(60)
+        self.assertFalse(worker.isRunning())
+        self.assertIsNone(worker.error)
+        self.assertEqual(worker.results, {regions[0][0]: computed[0][1]})
+        self.assertFalse(worker.previews.empty(), "No progress reported by the worker.")
+
+        # the toolpaths of a cancelled region are incomplete and not kept
+        worker = PathAdaptive.RegionWorker(regions[:1])
+        worker.cancel()
+        worker.start()
+        worker.thread.join(60)
+        self.assertFalse(worker.isRunning())
+        self.assertEqual(worker.results, {})
+
+        # polling a running worker keeps the timer, once finished the operation is
+        # recomputed from its results
+        adaptive.Proxy.regionCache = {}
+        worker = PathAdaptive.RegionWorker(regions)
+        release = threading.Event()
+        progress = worker._progress
+
+        def blockedProgress(tpaths):
+            release.wait()
+            return progress(tpaths)
+
+        worker._progress = blockedProgress
+        adaptive.Proxy.regionWorker = worker
+        timer = MagicMock()
+        with patch.object(PathAdaptive, "_drawProgress") as drawProgress:
+            worker.start()
+            try:
+                PathAdaptive._pollRegionWorker(adaptive.Proxy, adaptive, worker, timer)
+                self.assertTrue(worker.isRunning())
+                timer.stop.assert_not_called()
+                self.assertIs(adaptive.Proxy.regionWorker, worker)
+            finally:
+                release.set()
+            worker.thread.join(60)
+            with patch.object(PathAdaptive, "_computeRegion") as computeRegionMock:
+                PathAdaptive._pollRegionWorker(adaptive.Proxy, adaptive, worker, timer)
+                self.assertEqual(computeRegionMock.call_count, 0)
+        timer.stop.assert_called_once()
+        self.assertTrue(drawProgress.called, "Progress of the worker not drawn.")
+        self.assertIsNone(adaptive.Proxy.regionWorker)
+        self.assertEqual(set(adaptive.Proxy.regionCache), set(r[0] for r in regions))
+        self.assertEqual([c.toGCode() for c in adaptive.Path.Commands], commands)
+
     # POSSIBLY MISSING TESTS:
     # - Something for region ordering
     # - Known-edge cases: cones/spheres/cylinders (especially partials on edges
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import FreeCAD
+import Part
+import Path
+import Path.Base.BoundBoxTree as PathBoundBoxTree
+import Path.Dressup.Boundary as PathBoundary
+import CAMTests.PathTestUtils as PathTestUtils
+import random
+
+
+def _box(x, y, z, size=1.0):
+    return FreeCAD.BoundBox(x, y, z, x + size, y + size, z + size)
+
+
+class TestPathBoundBoxTree(PathTestUtils.PathTestBase):
+    def test00(self):
+        """An empty tree doesn't find anything."""
+        tree = PathBoundBoxTree.BoundBoxTree([])
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.intersecting(_box(0, 0, 0)), [])
+
+    def test01(self):
+        """The tree finds the same boxes as testing all of them."""
+        rnd = random.Random(17)
+        boxes = [
+            _box(rnd.uniform(0, 100), rnd.uniform(0, 100), rnd.uniform(0, 10), rnd.uniform(0, 5))
+            for i in range(500)
+        ]
+        tree = PathBoundBoxTree.BoundBoxTree(boxes)
+        for i in range(100):
+            box = _box(rnd.uniform(0, 100), rnd.uniform(0, 100), rnd.uniform(0, 10), 3)
+            expected = [j for j, b in enumerate(boxes) if b.intersect(box)]
+            self.assertEqual(tree.intersecting(box), expected)
+
+    def test02(self):
+        """Boxes are enlarged by the tolerance."""
+        tree = PathBoundBoxTree.BoundBoxTree([_box(0, 0, 0), _box(2, 0, 0)], 0.2)
+        self.assertEqual(tree.intersecting(_box(1.3, 0, 0, 0.4)), [])
+        self.assertEqual(tree.intersecting(_box(1.1, 0, 0, 0.4)), [0])
+        self.assertEqual(tree.intersecting(_box(1.1, 0, 0, 0.8)), [0, 1])
+        self.assertEqual(tree.intersecting(_box(1.5, 0, 0, 0.4), 0.2), [1])
+
+    def test03(self):
+        """Boundary dressup only splits edges touching the boundary."""
+        boundary = PathBoundary.PathBoundary(None, Part.makeBox(10, 10, 10))
+        faceTree = PathBoundBoxTree.BoundBoxTree(
+            [f.BoundBox for f in boundary.boundary.Faces], Path.Geom.Tolerance
+        )
+        edges = [
+            Part.Edge(Part.LineSegment(FreeCAD.Vector(2, 2, 2), FreeCAD.Vector(8, 8, 2))),
+            Part.Edge(Part.LineSegment(FreeCAD.Vector(12, 2, 2), FreeCAD.Vector(18, 8, 2))),
+            Part.Edge(Part.LineSegment(FreeCAD.Vector(5, 5, 5), FreeCAD.Vector(15, 5, 5))),
+        ]
+        for edge in edges:
+            inside, outside = boundary.splitEdge(edge, faceTree)
+            expectedInside, expectedOutside = boundary.splitEdge(edge, None)
+            self.assertEqual(len(inside), len(expectedInside))
+            self.assertEqual(len(outside), len(expectedOutside))
+            for e1, e2 in zip(inside + outside, expectedInside + expectedOutside):
+                self.assertRoughly(e1.Length, e2.Length)
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import Path
+import Path.Base.CommandArray as PathCommandArray
+import CAMTests.PathTestUtils as PathTestUtils
+import math
+import numpy
+
+
+class TestPathCommandArray(PathTestUtils.PathTestBase):
+    def setUp(self):
+        self.commands = [
+            Path.Command("G0", {"Z": 5}),
+            Path.Command("G1", {"X": 10, "Y": 2, "F": 100}),
+            Path.Command("G2", {"X": 0, "Y": 2, "I": -5, "J": 0, "Z": -1}),
+            Path.Command("M3", {"S": 1000}),
+            Path.Command("(comment)", {}),
+        ]
+
+    def assertCommands(self, commands, expected):
+        self.assertEqual(len(commands), len(expected))
+        for cmd, exp in zip(commands, expected):
+            self.assertEqual(cmd.Name, exp.Name)
+            self.assertEqual(cmd.Parameters, exp.Parameters)
+
+    def test00(self):
+        """Commands of a path are read as arrays."""
+        ca = PathCommandArray.CommandArray.fromPath(Path.Path(self.commands))
+        self.assertEqual(len(ca), 5)
+        self.assertEqual(ca.names, ["G0", "G1", "G2", "M3", "(comment)"])
+        self.assertEqual(ca.columns, ["X", "Y", "Z", "A", "B", "C", "I", "J", "K", "F", "S"])
+        self.assertEqual(ca.codes.tolist(), [0, 1, 2, 3, 4])
+        x = ca.column("x")
+        self.assertTrue(numpy.isnan(x[0]))
+        self.assertEqual(x[1:3].tolist(), [10, 0])
+        self.assertEqual(ca.column("S")[3], 1000)
+        self.assertTrue(numpy.all(numpy.isnan(ca.column("R"))))
+
+        ca = PathCommandArray.CommandArray.fromPath(Path.Path(self.commands), ["x", "F"])
+        self.assertEqual(ca.columns, ["X", "F"])
+        self.assertEqual(ca.values.shape, (5, 2))
+
+    def test01(self):
+        """Arrays are written to a path without losing any parameters."""
+        path = PathCommandArray.CommandArray.fromPath(Path.Path(self.commands)).toPath()
+        self.assertCommands(path.Commands, self.commands)
+        self.assertCommands(PathCommandArray.CommandArray.fromPath(path).commands(), self.commands)
+
+    def test02(self):
+        """Commands are made from columns of values."""
+        xs = numpy.linspace(0, 10, 11)
+        ca = PathCommandArray.CommandArray.fromColumns("G1", X=xs, Y=2, F=100)
+        path = ca.toPath()
+        self.assertEqual(path.Size, 11)
+        self.assertEqual(path.Commands[3].Name, "G1")
+        self.assertEqual(path.Commands[3].Parameters, {"X": 3, "Y": 2, "F": 100})
+
+        ca = PathCommandArray.CommandArray.fromColumns(["G0", "G1", "G0"], Z=[5, numpy.nan, 1])
+        commands = ca.toPath().Commands
+        self.assertEqual([c.Name for c in commands], ["G0", "G1", "G0"])
+        self.assertEqual([c.Parameters for c in commands], [{"Z": 5}, {}, {"Z": 1}])
+
+    def test03(self):
+        """Arrays are concatenated, selected and scanned for modal values."""
+        ca = PathCommandArray.CommandArray.concatenate(
+            [
+                PathCommandArray.CommandArray.fromColumns("G1", X=[1, 2], F=10),
+                PathCommandArray.CommandArray.fromColumns("G0", Z=[5]),
+                PathCommandArray.CommandArray.fromColumns("G1", X=[3], Y=1),
+            ]
+        )
+        self.assertEqual(ca.names, ["G1", "G0"])
+        self.assertEqual(ca.codes.tolist(), [0, 0, 1, 0])
+        self.assertEqual(ca.modal("X", 0.0).tolist(), [1, 2, 2, 3])
+        self.assertEqual(ca.modal("Z", 0.0).tolist(), [0, 0, 5, 5])
+        self.assertTrue(math.isnan(ca.modal("Y")[0]))
+        moves = ca[ca.isCommand(["G1"])]
+        self.assertEqual(len(moves), 3)
+        self.assertEqual(moves.column("X").tolist(), [1, 2, 3])
+
+    def test04(self):
+        """Adding arrays checks the codes and the size of the values."""
+        path = Path.Path()
+        values = numpy.zeros((2, 1))
+        with self.assertRaises(IndexError):
+            path.addArrays(["G1"], ["X"], numpy.array([0, 1], dtype=numpy.intc), values)
+        with self.assertRaises(ValueError):
+            path.addArrays(["G1"], ["X", "Y"], numpy.array([0, 0], dtype=numpy.intc), values)
+        with self.assertRaises(TypeError):
+            path.addArrays(["G1"], ["X"], numpy.array([0, 0], dtype=numpy.intc), values != 0)
+        self.assertEqual(path.Size, 0)
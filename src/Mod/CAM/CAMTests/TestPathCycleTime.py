@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import Path
+import Path.Base.CycleTime as PathCycleTime
+import CAMTests.PathTestUtils as PathTestUtils
+import math
+
+
+def _commands(gcode):
+    return [Path.Command(line) for line in gcode.strip().splitlines()]
+
+
+class TestPathCycleTime(PathTestUtils.PathTestBase):
+    def setUp(self):
+        self.rates = PathCycleTime.Rates(10.0, 5.0, 50.0, 20.0)
+        self.unlimited = PathCycleTime.MotionModel()
+
+    def estimate(self, gcode, model=None):
+        return PathCycleTime.estimateCommands(_commands(gcode), self.rates, model or self.unlimited)
+
+    def test00(self):
+        """Without acceleration limits moves take their length divided by the feed rate."""
+        self.assertRoughly(self.estimate("G1 X100 F20"), 5.0)
+        # feed rates of the tool controller if the path has none
+        self.assertRoughly(self.estimate("G1 X100\nG1 Z-10"), 10.0 + 2.0)
+        self.assertRoughly(self.estimate("G0 X100\nG0 Z-40"), 2.0 + 2.0)
+        # the feed rate is modal
+        self.assertRoughly(self.estimate("G1 X10 F1\nG1 X20"), 20.0)
+
+    def test01(self):
+        """Arcs take their length, full circles if start and end coincide."""
+        self.assertRoughly(self.estimate("G0 X10\nG2 X-10 I-10 J0 F10"), 0.2 + math.pi)
+        self.assertRoughly(self.estimate("G0 X10\nG3 X-10 I-10 J0 F10"), 0.2 + math.pi)
+        self.assertRoughly(self.estimate("G0 X10\nG2 X10 I-10 J0 F10"), 0.2 + 2 * math.pi)
+        self.assertRoughly(self.estimate("G0 X10\nG3 X0 Y10 I-10 J0 F10"), 0.2 + math.pi / 2)
+        self.assertRoughly(self.estimate("G0 X10\nG2 X0 Y10 I-10 J0 F10"), 0.2 + 1.5 * math.pi)
+
+    def test02(self):
+        """Acceleration slows moves down, a trapezoid and a triangle profile."""
+        model = PathCycleTime.MotionModel((100.0, 100.0, 100.0))
+        # 0.1s to reach 10mm/s over 0.5mm, twice, and 99mm at full speed
+        self.assertRoughly(self.estimate("G1 X100 F10", model), 0.2 + 9.9)
+        # 1mm is too short to reach the feed rate, the peak speed is 10mm/s
+        self.assertRoughly(self.estimate("G1 X1 F100", model), 0.2)
+
+        # the acceleration along a diagonal is limited by the axis reaching its limit first
+        model = PathCycleTime.MotionModel((100.0, 50.0, 100.0))
+        accel = 50.0 * math.sqrt(2)
+        diagonal = self.estimate("G1 X100 Y100 F10", model)
+        self.assertRoughly(diagonal, 20.0 / accel + (100 * math.sqrt(2) - 100.0 / accel) / 10)
+
+    def test03(self):
+        """Straight junctions keep the speed, corners and stops slow down."""
+        model = PathCycleTime.MotionModel((100.0, 100.0, 100.0), junctionDeviation=0.01)
+        straight = self.estimate("G1 X50 F10\nG1 X100", model)
+        corner = self.estimate("G1 X50 F10\nG1 Y50", model)
+        reverse = self.estimate("G1 X50 F10\nG1 X0", model)
+        self.assertRoughly(straight, 0.2 + 9.9)
+        self.assertGreater(corner, straight)
+        self.assertRoughly(reverse, 0.4 + 9.8)
+        self.assertGreater(reverse, corner)
+        # a dwell stops the motion and adds its time
+        self.assertRoughly(self.estimate("G1 X50 F10\nG4 P2\nG1 X100", model), reverse + 2.0)
+
+    def test04(self):
+        """Jerk limits add the time to ramp up the acceleration."""
+        model = PathCycleTime.MotionModel((100.0, 100.0, 100.0))
+        jerk = PathCycleTime.MotionModel((100.0, 100.0, 100.0), jerk=1000.0)
+        self.assertGreater(self.estimate("G1 X100 F10", jerk), self.estimate("G1 X100 F10", model))
+
+    def test05(self):
+        """Drill cycles are expanded into their moves."""
+        # rapid to X10, to R, drill 10mm, retract to the initial height
+        self.assertRoughly(
+            self.estimate("G0 Z5\nG98\nG81 X10 Z-8 R2 F1"),
+            0.25 + 0.2 + 3.0 / 20 + 10.0 + 3.0 / 20 + 10.0 / 20,
+        )
+        # G99 retracts to R
+        self.assertRoughly(
+            self.estimate("G0 Z5\nG99\nG81 X10 Z-8 R2 F1"),
+            0.25 + 0.2 + 3.0 / 20 + 10.0 + 10.0 / 20,
+        )
+        # dwell at the bottom and feed out
+        self.assertRoughly(
+            self.estimate("G0 Z2\nG99\nG89 X10 Z-8 R2 P1.5 F1"), 0.1 + 0.2 + 10.0 + 1.5 + 10.0
+        )
+        # G83 retracts to R after each peck
+        self.assertRoughly(
+            self.estimate("G0 Z2\nG99\nG83 X10 Z-8 R2 Q4 F1"),
+            0.1 + 0.2 + 10.0 + (4.0 + 4.0 + 8.0 + 8.0) / 20 + 10.0 / 20,
+        )
+
+    def test06(self):
+        """Time of groups of moves."""
+        segs = PathCycleTime.Segments()
+        segs.addCommands(_commands("G1 X100 F10"), self.rates, 0)
+        segs.addCommands(_commands("G1 X0 F20"), self.rates, 2)
+        estimate = PathCycleTime.estimateSegments(segs, self.unlimited)
+        self.assertEqual(len(estimate.groups), 3)
+        self.assertRoughly(estimate.groups[0], 10.0)
+        self.assertRoughly(estimate.groups[1], 0.0)
+        self.assertRoughly(estimate.groups[2], 5.0)
+        self.assertRoughly(estimate.total, 15.0)
+
+    def test07(self):
+        """Paths are estimated from their command arrays like their commands."""
+        model = PathCycleTime.MotionModel((100.0, 100.0, 50.0))
+        gcodes = [
+            "G0 Z5\nG0 X10\nG1 Z-1 F5\nG2 X-10 I-10 J0 F10\nM3 S100\nG1 Y10\nG4 P1\nG1 X0",
+            "G0 Z2\nG99\nG83 X10 Z-8 R2 Q4 F1\nG1 X0 F20",
+        ]
+        for gcode in gcodes:
+            commands = _commands(gcode)
+            expected = PathCycleTime.estimateCommands(commands, self.rates, model)
+            estimate = PathCycleTime.estimatePath(Path.Path(commands), self.rates, model)
+            self.assertRoughly(estimate, expected)
+
+    def test08(self):
+        """Cycle times are formatted as HH:MM:SS."""
+        self.assertEqual(PathCycleTime.formatTime(3723.4), "01:02:03")
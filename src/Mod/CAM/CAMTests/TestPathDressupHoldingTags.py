@@ -21,7 +21,11 @@
 # ***************************************************************************
 
 import CAMTests.PathTestUtils as PathTestUtils
+import Part
+import Path
+import Path.Base.BoundBoxTree as PathBoundBoxTree
 import math
+import time
 
 from FreeCAD import Vector
 from Path.Dressup.Tags import Tag
@@ -67,3 +71,41 @@ class TestHoldingTags(PathTestUtils.PathTestBase):
         h = 2.5 * math.tan((60 / 180.0) * math.pi) * 1.01
         print(h)
         self.assertConeAt(tag.solid, Vector(0, 0, -h * 0.01), 2.5, 0, h)
+
+    def test05(self):
+        """Benchmark the bound box tree on a large profile, it must find the same intersections."""
+        radius = 100
+        points = [
+            Vector(radius * math.cos(a), radius * math.sin(a), 0)
+            for a in (2 * math.pi * i / 720 for i in range(720))
+        ]
+        edges = [
+            Part.Edge(Part.LineSegment(p1, p2)) for p1, p2 in zip(points, points[1:] + points[:1])
+        ]
+        tags = []
+        for i in range(12):
+            pt = points[i * 60 + 30]
+            tag = Tag(i, pt.x, pt.y, 4, 5, 90, 0, True)
+            tag.createSolidsAt(0, 1.5)
+            tags.append(tag)
+
+        start = time.perf_counter()
+        expected = [
+            [n for n, tag in enumerate(tags) if tag.intersects(e, e.FirstParameter)] for e in edges
+        ]
+        middle = time.perf_counter()
+        tree = PathBoundBoxTree.BoundBoxTree(
+            [tag.solid.BoundBox for tag in tags], Path.Geom.Tolerance
+        )
+        found = [
+            [n for n in tree.intersecting(e.BoundBox) if tags[n].intersects(e, e.FirstParameter)]
+            for e in edges
+        ]
+        end = time.perf_counter()
+
+        self.assertEqual(found, expected)
+        self.assertTrue(any(found))
+        Path.Log.debug(
+            f"{len(edges)} edges, {len(tags)} tags: all pairs {middle - start:.3f}s, "
+            f"bound box tree {end - middle:.3f}s"
+        )
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import Path.Op.SurfaceSupport as PathSurfaceSupport
+import CAMTests.PathTestUtils as PathTestUtils
+import math
+import threading
+import time
+import types
+
+
+def _height(x, y):
+    return math.sin(x) + 0.5 * math.cos(y)
+
+
+def _makeOcl(joinSpans=False):
+    """Returns a stand-in for the OCL classes used by DropCutterScanner, OCL is not needed
+    for the tests. The drop-cutter samples every span like OCL does. If joinSpans is True
+    the shared points of consecutive spans are only returned once, thus the points of a
+    tile can't be split back to its lines."""
+
+    stats = types.SimpleNamespace(runs=[], cutters=0, threads=set())
+
+    class Point:
+        def __init__(self, x, y, z):
+            self.x = x
+            self.y = y
+            self.z = z
+
+    class Line:
+        def __init__(self, p1, p2):
+            self.p1 = p1
+            self.p2 = p2
+
+        def points(self, sampling):
+            length = math.hypot(self.p2.x - self.p1.x, self.p2.y - self.p1.y)
+            count = int(length / sampling + 1) + 1
+            return [
+                (
+                    self.p1.x + (self.p2.x - self.p1.x) * i / (count - 1),
+                    self.p1.y + (self.p2.y - self.p1.y) * i / (count - 1),
+                )
+                for i in range(count)
+            ]
+
+    class Arc:
+        def __init__(self, p1, p2, c, ccw):
+            self.p1 = p1
+            self.p2 = p2
+            self.c = c
+            self.ccw = ccw
+
+        def points(self, sampling):
+            return [(self.p1.x, self.p1.y), (self.c.x, self.c.y), (self.p2.x, self.p2.y)]
+
+    class PathDropCutter:
+        def __init__(self):
+            stats.cutters += 1
+            self.path = None
+            self.points = []
+
+        def setSTL(self, stl):
+            self.stl = stl
+
+        def setCutter(self, cutter):
+            self.cutter = cutter
+
+        def setZ(self, z):
+            self.z = z
+
+        def setSampling(self, sampling):
+            self.sampling = sampling
+
+        def setPath(self, path):
+            self.path = path
+
+        def run(self):
+            # like OCL keep the GIL while dropping the cutter
+            end = time.perf_counter() + 0.001
+            while time.perf_counter() < end:
+                pass
+            xy = []
+            for span in self.path:
+                points = span.points(self.sampling)
+                if joinSpans and xy:
+                    points = points[1:]
+                xy.extend(points)
+            self.points = [Point(x, y, max(self.z, _height(x, y))) for x, y in xy]
+            stats.runs.append(len(self.path))
+            stats.threads.add(threading.get_ident())
+
+        def getCLPoints(self):
+            return self.points
+
+    return types.SimpleNamespace(
+        Point=Point,
+        Line=Line,
+        Arc=Arc,
+        Path=list,
+        PathDropCutter=PathDropCutter,
+        stats=stats,
+    )
+
+
+class TestPathDropCutterScanner(PathTestUtils.PathTestBase):
+    def setUp(self):
+        # lines of different length in alternating directions
+        self.lines = []
+        for i in range(150):
+            y = i * 0.25
+            x = 10.0 + (i % 7)
+            self.lines.append(((0.0, y), (x, y)) if i % 2 else ((x, y), (0.0, y)))
+
+    def scanner(self, ocl, cancelHook=None):
+        return PathSurfaceSupport.DropCutterScanner(
+            ocl, "stl", "cutter", -1.0, 0.5, cancelHook=cancelHook
+        )
+
+    def serialScans(self, ocl):
+        scanner = self.scanner(ocl)
+        scanner.tileSize = 1
+        return scanner.scanLines(self.lines)
+
+    def assertScansEqual(self, scans, expected):
+        self.assertEqual(len(scans), len(expected))
+        for scan, exp in zip(scans, expected):
+            self.assertEqual(len(scan), len(exp))
+            for pt, ept in zip(scan, exp):
+                self.assertCoincide(pt, ept)
+
+    def test00(self):
+        """Tiled scans match the line by line scans point for point and in order."""
+        expected = self.serialScans(_makeOcl())
+
+        ocl = _makeOcl()
+        scans = self.scanner(ocl).scanLines(self.lines)
+        self.assertScansEqual(scans, expected)
+        # one OCL run per tile with a single PathDropCutter
+        tileSize = PathSurfaceSupport.DropCutterScanner.tileSize
+        self.assertEqual(ocl.stats.runs, [tileSize, tileSize, 150 - 2 * tileSize])
+        self.assertEqual(ocl.stats.cutters, 1)
+
+        for scan, ((x1, y1), (x2, y2)) in zip(scans, self.lines):
+            self.assertRoughly(scan[0].x, x1)
+            self.assertRoughly(scan[0].y, y1)
+            self.assertRoughly(scan[-1].x, x2)
+            self.assertRoughly(scan[-1].y, y2)
+
+    def test01(self):
+        """The tiles are scanned in the calling thread."""
+        ocl = _makeOcl()
+        self.scanner(ocl).scanLines(self.lines)
+        self.assertEqual(ocl.stats.threads, {threading.get_ident()})
+
+    def test02(self):
+        """Tiles are scanned line by line if the points don't match the lines."""
+        expected = self.serialScans(_makeOcl())
+
+        ocl = _makeOcl(joinSpans=True)
+        scans = self.scanner(ocl).scanLines(self.lines)
+        self.assertScansEqual(scans, expected)
+        # every tile is run once, then each of its lines on its own
+        self.assertEqual(len(ocl.stats.runs), 3 + len(self.lines))
+        self.assertEqual(ocl.stats.runs.count(1), len(self.lines))
+
+    def test03(self):
+        """Arcs are returned in the order of the input."""
+        arcs = [(((i, 0, 0), (i, 2, 0), (i, 1, 0)), i % 2 == 0) for i in range(200)]
+        scans = self.scanner(_makeOcl()).scanArcs(arcs)
+        self.assertEqual(len(scans), len(arcs))
+        for scan, ((sp, ep, cp), _) in zip(scans, arcs):
+            self.assertRoughly(scan[0].x, sp[0])
+            self.assertRoughly(scan[-1].y, ep[1])
+
+    def test04(self):
+        """The cancel hook stops the scan between tiles."""
+        calls = []
+
+        def cancel():
+            calls.append(1)
+            return len(calls) > 1
+
+        ocl = _makeOcl()
+        with self.assertRaises(PathSurfaceSupport.ScanCancelled):
+            self.scanner(ocl, cancel).scanLines(self.lines)
+        self.assertEqual(len(calls), 2)
+        # the second tile was not scanned
+        self.assertEqual(len(ocl.stats.runs), 1)
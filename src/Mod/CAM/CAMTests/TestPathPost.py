@@ -26,11 +26,15 @@ from Path.Post.Processor import PostProcessor, PostProcessorFactory
 from unittest.mock import patch, MagicMock
 import FreeCAD
 import Path
+import Path.Post.Batch as PathBatch
 import Path.Post.Command as PathCommand
 import Path.Post.Processor as PathPost
 import Path.Post.Utils as PostUtils
 import difflib
+import json
 import os
+import shutil
+import tempfile
 import unittest
 
 from .FilePathTestUtils import assertFilePathsEqual
@@ -366,6 +370,65 @@ class TestPostProcessorFactory(unittest.TestCase):
         self.assertEqual(post.script_module.__name__, "linuxcnc_post")
 
 
+class TestBatchPost(unittest.TestCase):
+    """Test postprocessing documents without the GUI."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.document = FreeCAD.getHomePath() + "/Mod/CAM/CAMTests/boxtest.fcstd"
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test010(self):
+        """Test that each job is postprocessed with each postprocessor."""
+        summary = PathBatch.batchPost(
+            [self.document],
+            ["linuxcnc", "grbl"],
+            "--no-show-editor",
+            self.directory,
+            workers=1,
+            jobs=["Job"],
+        )
+        self.assertEqual([d["error"] for d in summary["documents"]], [None])
+        self.assertEqual([p["post"] for p in summary["posts"]], ["linuxcnc", "grbl"])
+        for result in summary["posts"]:
+            self.assertIsNone(result["error"])
+            self.assertTrue(result["files"])
+            for f in result["files"]:
+                self.assertEqual(
+                    os.path.dirname(f["name"]), os.path.join(self.directory, result["post"])
+                )
+                self.assertEqual(os.path.getsize(f["name"]), f["bytes"])
+                self.assertGreater(f["bytes"], 0)
+
+    def test020(self):
+        """Test the command line entry point and its summary."""
+        summaryFile = os.path.join(self.directory, "summary.json")
+        argv = [
+            "--post",
+            "linuxcnc",
+            "--args=--no-show-editor",
+            "--output",
+            self.directory,
+            "--job",
+            "Job",
+            "--workers",
+            "1",
+            "--summary",
+            summaryFile,
+            self.document,
+        ]
+        self.assertEqual(PathBatch.main(argv), 0)
+        with open(summaryFile) as fp:
+            summary = json.load(fp)
+        self.assertEqual(len(summary["posts"]), 1)
+        self.assertTrue(os.path.isfile(summary["posts"][0]["files"][0]["name"]))
+
+        argv = ["--post", "nonexistent", "--workers", "1", "-o", self.directory, self.document]
+        self.assertEqual(PathBatch.main(argv), 1)
+
+
 class TestPostProcessorClass(unittest.TestCase):
     """Test new post structure objects."""
 
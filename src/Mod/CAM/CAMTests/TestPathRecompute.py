@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import FreeCAD
+import Path
+import Path.Main.Recompute as PathRecompute
+import CAMTests.PathTestUtils as PathTestUtils
+import json
+import os
+import shutil
+import tempfile
+
+
+class TestPathRecompute(PathTestUtils.PathTestBase):
+    @classmethod
+    def setUpClass(cls):
+        FreeCAD.ConfigSet("SuppressRecomputeRequiredDialog", "True")
+        cls.doc = FreeCAD.open(FreeCAD.getHomePath() + "/Mod/CAM/CAMTests/boxtest.fcstd")
+        FreeCAD.ConfigSet("SuppressRecomputeRequiredDialog", "")
+        cls.job = cls.doc.getObject("Job")
+
+    @classmethod
+    def tearDownClass(cls):
+        FreeCAD.closeDocument(cls.doc.Name)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test00(self):
+        """Independent operations don't depend on other operations of the job."""
+        ops = self.job.Proxy.allOperations()
+        independent = PathRecompute.independentOperations(self.job)
+        self.assertTrue(independent)
+        for op in independent:
+            self.assertIn(op, ops)
+            self.assertFalse([dep for dep in op.OutListRecursive if dep in ops])
+
+    def test01(self):
+        """A worker computes the same paths as a serial recompute."""
+        ops = PathRecompute.independentOperations(self.job)
+        # the paths are restored from the results of the worker
+        for op in ops:
+            op.Path = Path.Path()
+        document = os.path.join(self.directory, "job.FCStd")
+        self.doc.saveCopy(document)
+        task = os.path.join(self.directory, "task.json")
+        resultFile = os.path.join(self.directory, "result.json")
+        with open(task, "w") as fp:
+            json.dump(
+                {"document": document, "operations": [op.Name for op in ops], "result": resultFile},
+                fp,
+            )
+        PathRecompute.runWorker(task)
+        with open(resultFile) as fp:
+            results = json.load(fp)
+        self.assertEqual([r["name"] for r in results], [op.Name for op in ops])
+
+        for result in results:
+            self.assertIn("Path", result["properties"])
+            self.assertTrue(PathRecompute.applyResult(self.doc, result))
+        for op in ops:
+            self.assertTrue(op.Path.Commands)
+            self.assertNotIn("Touched", op.State)
+        parallel = [op.Path.toGCode() for op in ops]
+
+        results = PathRecompute.recomputeOperations(self.job, workers=1)
+        self.assertEqual(len(results), len(self.job.Proxy.allOperations()))
+        self.assertTrue(all(r.worker is None and r.error is None for r in results))
+        self.assertEqual([op.Path.toGCode() for op in ops], parallel)
+
+    def test02(self):
+        """Worker processes recompute the independent operations of a job."""
+        if PathRecompute.consoleExecutable() is None:
+            self.skipTest("FreeCADCmd not found")
+        job = self.doc.getObject("Job001")
+        ops = PathRecompute.independentOperations(job)
+        self.assertTrue(len(ops) > 1)
+        PathRecompute.recomputeOperations(job, workers=1)
+        serial = [op.Path.toGCode() for op in ops]
+
+        for op in ops:
+            op.Path = Path.Path()
+        results = PathRecompute.recomputeOperations(job, workers=2)
+        workers = {r.name: r.worker for r in results if r.error is None}
+        self.assertEqual(len(results), len(job.Proxy.allOperations()))
+        self.assertEqual(set(workers[op.Name] for op in ops), {0, 1})
+        self.assertEqual([op.Path.toGCode() for op in ops], serial)
+
+    def test03(self):
+        """Operations a worker process failed on are reported as errors."""
+        executable = PathRecompute.consoleExecutable()
+        if executable is None:
+            self.skipTest("FreeCADCmd not found")
+        document = os.path.join(self.directory, "job.FCStd")
+        self.doc.saveCopy(document)
+        results = PathRecompute._runWorkerProcess(
+            executable, self.directory, 0, document, ["NoOperation"]
+        )
+        self.assertEqual(results, [{"name": "NoOperation", "error": "worker failed"}])
+        self.assertFalse(PathRecompute.applyResult(self.doc, results[0]))
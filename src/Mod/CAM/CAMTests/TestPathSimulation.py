@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import Path
+import Path.Main.Simulation as PathSimulation
+import CAMTests.PathTestUtils as PathTestUtils
+
+
+def _path(gcode):
+    return Path.Path([Path.Command(line) for line in gcode.strip().splitlines()])
+
+
+class TestPathSimulation(PathTestUtils.PathTestBase):
+    def setUp(self):
+        # a 100 x 20 x 10 block on a 0.5 grid
+        self.stock = PathSimulation.HeightField.box(0, 0, 0, 100, 20, 10, 0.5)
+        self.endmill = PathSimulation.ToolProfile.flat(6.0, cuttingHeight=5.0)
+        self.slot = _path("G0 Z15\nG0 X-10 Y10\nG1 Z8\nG1 X110\nG0 Z15")
+
+    def test00(self):
+        """Tool profiles give the height of the tool above its tip."""
+        ball = PathSimulation.ToolProfile.ball(6.0)
+        self.assertRoughly(float(ball.heightAt(0.0)), 0.0)
+        self.assertRoughly(float(ball.heightAt(3.0)), 3.0)
+        self.assertRoughly(float(ball.heightAt(1.5)), 3.0 - (9.0 - 2.25) ** 0.5, 0.01)
+        vee = PathSimulation.ToolProfile.vee(10.0, 90.0)
+        self.assertRoughly(float(vee.heightAt(2.0)), 2.0)
+        self.assertEqual(float(self.endmill.heightAt(3.5)), float("inf"))
+
+    def test01(self):
+        """The removed volume of a slot is its cross section times its length."""
+        sim = PathSimulation.Simulation(self.stock)
+        result = sim.simulate([("slot", self.slot, self.endmill)])[0]
+        self.assertRoughly(result.removedVolume, 100 * 6 * 2)
+        self.assertEqual(result.collisionCount, 0)
+        self.assertRoughly(self.stock.volume() - self.stock.volume(sim.heights()), 1200)
+
+    def test02(self):
+        """Arcs remove material along the arc."""
+        sim = PathSimulation.Simulation(self.stock)
+        circle = _path("G0 Z15\nG0 X40 Y10\nG1 Z9\nG2 X40 Y10 I6 J0\nG0 Z15")
+        result = sim.simulate([("circle", circle, self.endmill)])[0]
+        # an annulus of radius 3 to 9 around (46, 10)
+        self.assertRoughly(result.removedVolume, 3.1416 * (81 - 9), 6)
+
+    def test03(self):
+        """Only the operations from the first changed one are simulated again."""
+        sim = PathSimulation.Simulation(self.stock)
+        deeper = _path("G0 Z15\nG0 X-10 Y10\nG1 Z6\nG1 X110\nG0 Z15")
+        ops = [("slot", self.slot, self.endmill), ("deeper", deeper, self.endmill)]
+        results = sim.simulate(ops)
+        self.assertEqual([r.cached for r in results], [False, False])
+        self.assertRoughly(results[1].removedVolume, 1200)
+
+        results = sim.simulate(ops)
+        self.assertEqual([r.cached for r in results], [True, True])
+
+        deepest = _path("G0 Z15\nG0 X-10 Y10\nG1 Z5\nG1 X110\nG0 Z15")
+        results = sim.simulate([ops[0], ("deeper", deepest, self.endmill)])
+        self.assertEqual([r.cached for r in results], [True, False])
+        self.assertRoughly(results[1].removedVolume, 1800)
+
+        results = sim.simulate([("deeper", deepest, self.endmill)])
+        self.assertEqual([r.cached for r in results], [False])
+        self.assertRoughly(results[0].removedVolume, 3000)
+
+    def test04(self):
+        """Cuts below the model are gouges."""
+        model = PathSimulation.HeightField.box(0, 0, 0, 100, 20, 8.5, 0.5)
+        sim = PathSimulation.Simulation(self.stock, model)
+        result = sim.simulate([("slot", self.slot, self.endmill)])[0]
+        self.assertEqual(result.gouges, 12 * 200)
+        self.assertRoughly(result.gougeDepth, 0.5)
+        self.assertRoughly(result.gougePosition[2], 8.0)
+
+        sim = PathSimulation.Simulation(self.stock, model)
+        safe = _path("G0 Z15\nG0 X-10 Y10\nG1 Z8.5\nG1 X110\nG0 Z15")
+        self.assertEqual(sim.simulate([("slot", safe, self.endmill)])[0].gouges, 0)
+
+    def test05(self):
+        """Rapids through material and material above the cutting edges are collisions."""
+        sim = PathSimulation.Simulation(self.stock)
+        rapid = _path("G0 Z15\nG0 X-10 Y10\nG0 Z8\nG0 X110\nG0 Z15")
+        result = sim.simulate([("rapid", rapid, self.endmill)])[0]
+        self.assertEqual(result.collisionCount, 1)
+        self.assertEqual(result.collisions[0].kind, "rapid")
+        self.assertRoughly(result.collisions[0].depth, 2.0)
+
+        sim = PathSimulation.Simulation(self.stock)
+        deep = _path("G0 Z15\nG0 X-10 Y10\nG1 Z3\nG1 X110\nG0 Z15")
+        result = sim.simulate([("deep", deep, self.endmill)])[0]
+        self.assertEqual([c.kind for c in result.collisions], ["shank"])
+        self.assertRoughly(result.collisions[0].depth, 7.0)
+
+    def test06(self):
+        """Sloped moves cut along the slope."""
+        sim = PathSimulation.Simulation(self.stock)
+        ramp = _path("G0 Z15\nG0 X-10 Y10\nG1 Z10\nG1 X0\nG1 X100 Z5\nG0 Z15")
+        result = sim.simulate([("ramp", ramp, self.endmill)])[0]
+        # a wedge with the tool radius ahead of the slope
+        self.assertRoughly(result.removedVolume, 6 * 5 * 100 / 2 + 6 * 3 * 5 / 2, 40)
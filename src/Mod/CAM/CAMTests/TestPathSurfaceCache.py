@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Part
+import Path.Op.SurfaceCache as PathSurfaceCache
+import CAMTests.PathTestUtils as PathTestUtils
+import shutil
+import tempfile
+import types
+
+
+class _STLSurf(list):
+    def addTriangle(self, t):
+        self.append(t)
+
+
+# stand-in for the few OCL classes used to build an STL, OCL is not needed for the tests
+ocl = types.SimpleNamespace(STLSurf=_STLSurf, Triangle=lambda *p: p, Point=lambda *c: c)
+
+
+class _Cutter:
+    def __str__(self):
+        return "CylCutter (d=6)"
+
+    def getDiameter(self):
+        return 6.0
+
+    def getLength(self):
+        return 20.0
+
+
+class TestPathSurfaceCache(PathTestUtils.PathTestBase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.facetCalls = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def facets(self):
+        self.facetCalls += 1
+        return [((0, 0, 0), (1, 0, 0), (0, 1, 0)), ((1, 0, 0), (1, 1, 0), (0, 1, 0))]
+
+    def test00(self):
+        """Shape hash depends on the geometry only."""
+        box = Part.makeBox(10, 10, 10)
+        self.assertEqual(
+            PathSurfaceCache.shapeHash(box), PathSurfaceCache.shapeHash(Part.makeBox(10, 10, 10))
+        )
+        self.assertNotEqual(
+            PathSurfaceCache.shapeHash(box), PathSurfaceCache.shapeHash(Part.makeBox(10, 10, 11))
+        )
+
+    def test01(self):
+        """An STL is tessellated once and reused."""
+        cache = PathSurfaceCache.SurfaceCache(1024 * 1024)
+        key = PathSurfaceCache.stlKey("model", 0.01)
+        stl = cache.getSTL(key, ocl, self.facets)
+        self.assertEqual(len(stl), 2)
+        self.assertIs(cache.getSTL(key, ocl, self.facets), stl)
+        self.assertEqual(self.facetCalls, 1)
+        self.assertEqual(cache.stlKeyOf(stl), key)
+        self.assertNotEqual(key, PathSurfaceCache.stlKey("model", 0.02))
+
+    def test02(self):
+        """Scans are returned as copies and are reused from the cache directory."""
+        stlKey = PathSurfaceCache.stlKey("model", 0.01)
+        key = PathSurfaceCache.scanKey(stlKey, _Cutter(), -5.0, 0.25, "lines", [((0, 0), (1, 0))])
+        scans = [[FreeCAD.Vector(0, 0, 1), FreeCAD.Vector(1, 0, 2)], [FreeCAD.Vector(2, 2, 2)]]
+
+        cache = PathSurfaceCache.SurfaceCache(1024 * 1024, self.directory)
+        self.assertIsNone(cache.getScans(key))
+        cache.putScans(key, scans)
+        cached = cache.getScans(key)
+        cached[0].append(FreeCAD.Vector())
+        self.assertEqual(len(cache.getScans(key)[0]), 2)
+
+        # a new session only has the directory
+        cached = PathSurfaceCache.SurfaceCache(1024 * 1024, self.directory).getScans(key)
+        self.assertEqual([len(scan) for scan in cached], [2, 1])
+        for scan, cachedScan in zip(scans, cached):
+            for pt, cachedPt in zip(scan, cachedScan):
+                self.assertCoincide(pt, cachedPt)
+
+    def test03(self):
+        """The least recently used entries are dropped first."""
+        size = 3 * 2 * PathSurfaceCache.TRIANGLE_SIZE
+        cache = PathSurfaceCache.SurfaceCache(size)
+        stls = [cache.getSTL(str(i), ocl, self.facets) for i in range(3)]
+        cache.getSTL("0", ocl, self.facets)
+        cache.getSTL("3", ocl, self.facets)
+        self.assertEqual(self.facetCalls, 4)
+        self.assertIsNone(cache.stlKeyOf(stls[1]))
+        self.assertEqual(cache.stlKeyOf(stls[0]), "0")
+        self.assertLessEqual(cache.size, size)
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import FreeCAD
+import Path.Tool.Bit as PathToolBit
+import Path.Tool.Index as PathToolIndex
+import CAMTests.PathTestUtils as PathTestUtils
+import json
+import os
+import shutil
+import tempfile
+
+TestToolDir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "Tools")
+TestToolShape = os.path.join(TestToolDir, "Shape", "test-path-tool-bit-shape-00.fcstd")
+TestToolBit = os.path.join(TestToolDir, "Bit", "test-path-tool-bit-bit-00.fctb")
+
+
+class TestPathToolIndex(PathTestUtils.PathTestBase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="cam-tool-index-")
+        self.tools = os.path.join(self.directory, "Tools")
+        os.makedirs(os.path.join(self.tools, "Bit", "Mill"))
+        # keep the index of the user cache out of the tests
+        self.index = PathToolIndex._Index
+        fileName = os.path.join(self.directory, "ToolIndex.json")
+        PathToolIndex._Index = PathToolIndex.ToolIndex(fileName)
+
+    def tearDown(self):
+        PathToolIndex._Index = self.index
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def writeBit(self, name, diameter):
+        path = os.path.join(self.tools, "Bit", "Mill", name)
+        with open(path, "w") as fp:
+            json.dump({"version": 2, "name": name, "parameter": {"Diameter": diameter}}, fp)
+        return path
+
+    def touch(self, path, age):
+        # set the mtime explicitly, changes within its granularity aren't noticed
+        mtime = os.stat(path).st_mtime - age
+        os.utime(path, (mtime, mtime))
+
+    def test00(self):
+        """Find tool files in subdirectories."""
+        path = self.writeBit("6mm.fctb", "6 mm")
+        index = PathToolIndex.ToolIndex()
+        roots = [os.path.join(self.tools, "Bit")]
+        self.assertEqual(index.find("6mm.fctb", roots), path)
+        self.assertEqual(index.find(os.path.join("Mill", "6mm.fctb"), roots), path)
+        self.assertIsNone(index.find("ll/6mm.fctb", roots))
+        self.assertIsNone(index.find("8mm.fctb", roots))
+
+    def test01(self):
+        """Only list directories again which changed."""
+        self.writeBit("6mm.fctb", "6 mm")
+        self.touch(os.path.join(self.tools, "Bit"), 10)
+        self.touch(os.path.join(self.tools, "Bit", "Mill"), 10)
+        fileName = os.path.join(self.directory, "index.json")
+        index = PathToolIndex.ToolIndex(fileName)
+        roots = [os.path.join(self.tools, "Bit")]
+        self.assertIsNone(index.find("8mm.fctb", roots))
+        index.save()
+        self.assertFalse(index.dirty)
+
+        index = PathToolIndex.ToolIndex(fileName)
+        self.assertIsNone(index.find("8mm.fctb", roots))
+        self.assertFalse(index.dirty)
+
+        path = self.writeBit("8mm.fctb", "8 mm")
+        self.assertEqual(index.find("8mm.fctb", roots), path)
+        self.assertTrue(index.dirty)
+
+    def test02(self):
+        """Read a tool bit again if it changed."""
+        path = self.writeBit("6mm.fctb", "6 mm")
+        index = PathToolIndex.ToolIndex()
+        self.assertEqual(index.bit(path)["parameter"]["Diameter"], "6 mm")
+        # callers can't modify the index
+        index.bit(path)["parameter"]["Diameter"] = "7 mm"
+        self.assertEqual(index.bit(path)["parameter"]["Diameter"], "6 mm")
+
+        self.writeBit("6mm.fctb", "6.35 mm")
+        self.assertEqual(index.bit(path)["parameter"]["Diameter"], "6.35 mm")
+        os.remove(path)
+        self.assertIsNone(index.bit(path))
+
+    def test03(self):
+        """Read the thumbnail of a shape."""
+        index = PathToolIndex.ToolIndex()
+        png = index.thumbnail(TestToolShape)
+        self.assertTrue(png.startswith(b"\x89PNG"))
+
+    def test04(self):
+        """Read a tool library through the index."""
+        path = os.path.join(self.tools, "lib.fctl")
+        with open(path, "w") as fp:
+            json.dump({"version": 1, "tools": [{"nr": 1, "path": "6mm.fctb"}]}, fp)
+        library = PathToolIndex.index().library(path)
+        self.assertEqual(library["tools"][0]["path"], "6mm.fctb")
+        self.assertIs(PathToolIndex.index(), PathToolIndex._Index)
+        self.assertIsNone(PathToolIndex.index().library(os.path.join(self.tools, "none.fctl")))
+
+    def test10(self):
+        """Read the properties of a shape."""
+        index = PathToolIndex.ToolIndex()
+        info = index.shape(TestToolShape)
+        names = [spec["name"] for spec in info["properties"]]
+        self.assertIn("Diameter", names)
+        spec = info["properties"][names.index("Diameter")]
+        self.assertEqual(spec["type"], "App::PropertyLength")
+        self.assertEqual(FreeCAD.Units.Quantity(spec["value"]).Unit, FreeCAD.Units.Length)
+
+    def test11(self):
+        """Create a tool bit without loading its body."""
+        doc = FreeCAD.newDocument("TestPathToolIndex")
+        try:
+            attrs = PathToolBit.Declaration(TestToolBit)
+            attrs["shape"] = TestToolShape
+            tool = PathToolBit.Factory.CreateFromAttrs(attrs, "T1")
+            self.assertIsNone(tool.BitBody)
+            self.assertTrue(tool.Shape.isNull())
+            self.assertRoughly(tool.Diameter.Value, 5)
+            self.assertIn("Diameter", tool.BitPropertyNames)
+
+            shape = PathToolBit.toolShape(tool)
+            self.assertFalse(shape.isNull())
+            self.assertRoughly(shape.BoundBox.XLength, 5)
+            self.assertIsNone(tool.BitBody)
+            self.assertEqual(len(doc.Objects), 1)
+        finally:
+            FreeCAD.closeDocument(doc.Name)
@@ -20,6 +20,7 @@
 # *   USA                                                                   *
 # *                                                                         *
 # ***************************************************************************
+from io import StringIO
 from os import linesep, path, remove
 import tempfile
 from unittest.mock import mock_open, patch
@@ -30,6 +31,7 @@ import Path
 import CAMTests.PathTestUtils as PathTestUtils
 from Path.Post.Command import CommandPathPost
 from Path.Post.Processor import PostProcessorFactory
+import Path.Post.UtilsParse as UtilsParse
 from Path.Post.Utils import FilenameGenerator
 
 from PySide.QtCore import QT_TRANSLATE_NOOP  # type: ignore
@@ -1308,3 +1310,66 @@ G0 X2.000
         # print(f"--------{nl}{gcode}--------{nl}")
         self.assertEqual(split_gcode[3], "M4 S3000")
         self.assertEqual(split_gcode[4], "G4 P1.23456")
+
+    #############################################################################
+
+    def test00280(self):
+        """Test that streaming the output writes the same gcode as export."""
+        c = Path.Command("G0 X10 Y20 Z30")
+        c1 = Path.Command("G1 X20 Y30 Z10 F100")
+        self.profile_op.Path = Path.Path([c, c1] * 1000)
+        self.assertTrue(self.post.supports_streaming)
+
+        for args in (
+            "",
+            "--line-numbers --comments",
+            "--end_of_line_characters='\n'",
+            "--end_of_line_characters='\r\n'",
+        ):
+            self.job.PostProcessorArgs = args
+            gcode = self.post.export()[0][1]
+            if gcode[0:2] == "\n\n":
+                gcode = gcode[2:]
+            self.post.reinitialize()
+            outputs = {}
+            line_counts = self.post.export_stream(lambda name: outputs.setdefault(name, StringIO()))
+            self.assertEqual(list(outputs), ["allitems"])
+            self.assertEqual(outputs["allitems"].getvalue(), gcode)
+            self.assertEqual(line_counts, [("allitems", len(gcode.splitlines()))])
+            self.post.reinitialize()
+
+    def test00290(self):
+        """Test that the compiled command formatter writes the same gcode as the parameter functions."""
+        commands = [
+            Path.Command("G0 X10 Y20 Z30"),
+            Path.Command("G1 X20 Y30 Z10 F100"),
+            Path.Command("G1 X20.000001 Y30 Z10 F100"),
+            Path.Command("G2 X25.12345 Y35 I2.5 J2.5 F120.5"),
+            Path.Command("G03 X0 Y0 R17.333333 F0"),
+            Path.Command("G1 A90 F50"),
+            Path.Command("G1 B45 C-12.5 X1 F50"),
+            Path.Command("G1 F75"),
+            Path.Command("G00 Z5 A0"),
+            Path.Command("(comment)"),
+            Path.Command("M6 T2"),
+            Path.Command("G1 X-1.23456789 Y-0.0004 Z0.0005 F99.99999"),
+        ]
+        self.profile_op.Path = Path.Path(commands)
+
+        for args in (
+            "",
+            "--inches",
+            "--modal",
+            "--axis-modal",
+            "--line-numbers --comments",
+            "--axis-precision=5 --feed-precision=1",
+            "--inches --modal --axis-modal --line-numbers --precision=4",
+        ):
+            self.job.PostProcessorArgs = args
+            # the original formatting of the parameter functions for every command
+            with patch.object(UtilsParse.CommandFormatter, "FAST_COMMANDS", ()):
+                expected = self.post.export()[0][1]
+            self.post.reinitialize()
+            gcode = self.post.export()[0][1]
+            self.post.reinitialize()
+            self.assertEqual(gcode, expected)
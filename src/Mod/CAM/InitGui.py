@@ -95,7 +95,7 @@ class CAMWorkbench(Workbench):
         Path.GuiInit.Startup()
 
         # build commands list
-        projcmdlist = ["CAM_Job", "CAM_Post", "CAM_Sanity"]
+        projcmdlist = ["CAM_Job", "CAM_JobRecomputeOperations", "CAM_Post", "CAM_Sanity"]
         toolcmdlist = [
             "CAM_Inspect",
             "CAM_Simulator",
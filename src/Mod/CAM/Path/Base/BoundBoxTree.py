@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+__title__ = "CAM Bounding Box Tree"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Spatial index of bounding boxes to find the candidates for exact shape tests."
+
+import Path
+
+# The dressups test path edges against tag solids and boundaries with OCC booleans and
+# distance calls, which are expensive. A tree over the bounding boxes of one side
+# returns the few objects whose boxes overlap the box of an object of the other side,
+# only those need the exact test.
+
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+def _bounds(box, tolerance):
+    return (
+        box.XMin - tolerance,
+        box.YMin - tolerance,
+        box.ZMin - tolerance,
+        box.XMax + tolerance,
+        box.YMax + tolerance,
+        box.ZMax + tolerance,
+    )
+
+
+def _overlap(b1, b2):
+    return (
+        b1[0] <= b2[3]
+        and b2[0] <= b1[3]
+        and b1[1] <= b2[4]
+        and b2[1] <= b1[4]
+        and b1[2] <= b2[5]
+        and b2[2] <= b1[5]
+    )
+
+
+class _Node:
+    def __init__(self, bounds, indices=None, children=None):
+        self.bounds = bounds
+        self.indices = indices
+        self.children = children
+
+
+class BoundBoxTree:
+    """BoundBoxTree(boxes, tolerance=0) ... tree of axis aligned bounding boxes.
+    boxes are FreeCAD.BoundBox or other objects with the XMin ... ZMax attributes, each
+    one is enlarged by tolerance. The tree is built once, intersecting(box) returns the
+    indices of all boxes overlapping box."""
+
+    LeafSize = 8
+
+    def __init__(self, boxes, tolerance=0.0):
+        self.bounds = [_bounds(box, tolerance) for box in boxes]
+        self.root = self._build(list(range(len(self.bounds)))) if self.bounds else None
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def _build(self, indices):
+        bounds = [self.bounds[i] for i in indices]
+        union = (
+            min(b[0] for b in bounds),
+            min(b[1] for b in bounds),
+            min(b[2] for b in bounds),
+            max(b[3] for b in bounds),
+            max(b[4] for b in bounds),
+            max(b[5] for b in bounds),
+        )
+        if len(indices) <= self.LeafSize:
+            return _Node(union, indices=indices)
+        # split at the median of the box centers along the longest side
+        axis = max(range(3), key=lambda a: union[a + 3] - union[a])
+        indices = sorted(indices, key=lambda i: self.bounds[i][axis] + self.bounds[i][axis + 3])
+        half = len(indices) // 2
+        return _Node(union, children=(self._build(indices[:half]), self._build(indices[half:])))
+
+    def intersecting(self, box, tolerance=0.0):
+        """intersecting(box, tolerance=0) ... return the sorted indices of all boxes which
+        overlap box, enlarged by tolerance."""
+        if self.root is None:
+            return []
+        bounds = _bounds(box, tolerance)
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if not _overlap(node.bounds, bounds):
+                continue
+            if node.children:
+                stack.extend(node.children)
+            else:
+                found.extend(i for i in node.indices if _overlap(self.bounds[i], bounds))
+        return sorted(found)
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+__title__ = "CAM Command Arrays"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Commands of a path as columns of numpy arrays."
+
+import Path
+import math
+
+# lazily loaded modules
+from lazy_loader.lazy_loader import LazyLoader
+
+numpy = LazyLoader("numpy", globals(), "numpy")
+
+# Large paths are expensive to create and scan as lists of Path.Command, each one is a
+# Python object with a dict of parameters. A CommandArray holds the same commands as a
+# code per command, the index of its name, and a table of parameter values with a column
+# per parameter. The table is read from and written to a Path.Path in one call, see
+# Path.Path.getArrays and Path.Path.addArrays.
+
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+class CommandArray:
+    """CommandArray(names, columns, codes, values) ... commands as arrays.
+    names are the distinct command names, columns the parameter names. codes has the index
+    of the name of each command, values a row of parameter values for each command with
+    NaN for parameters a command doesn't have. The columns of values are numpy views, see
+    column()."""
+
+    def __init__(self, names, columns, codes, values):
+        self.names = list(names)
+        self.columns = [c.upper() for c in columns]
+        self.codes = numpy.asarray(codes, dtype=numpy.intc)
+        self.values = numpy.asarray(values, dtype=float).reshape(
+            (len(self.codes), len(self.columns))
+        )
+
+    @classmethod
+    def fromPath(cls, path, columns=None):
+        """fromPath(path, columns=None) ... return the commands of path.
+        columns defaults to all parameters used in path. The arrays share the memory of
+        the data returned by the path and are read only, use copy() to modify them."""
+        if columns is None:
+            names, columns, codes, values = path.getArrays()
+        else:
+            names, columns, codes, values = path.getArrays(columns)
+        codes = numpy.frombuffer(codes, dtype=numpy.intc)
+        values = numpy.frombuffer(values, dtype=float).reshape((len(codes), len(columns)))
+        return cls(names, columns, codes, values)
+
+    @classmethod
+    def fromColumns(cls, name, **columns):
+        """fromColumns(name, **columns) ... return commands made of arrays of parameter values.
+        name is the name of all commands or a sequence with the name of each command. Scalar
+        parameters are used for all commands, e.g. fromColumns("G1", X=xs, Y=ys, F=100)."""
+        arrays = {c.upper(): numpy.asarray(v, dtype=float) for c, v in columns.items()}
+        if isinstance(name, str):
+            sizes = [a.size for a in arrays.values() if a.ndim > 0]
+            count = max(sizes) if sizes else 1
+            names = [name]
+            codes = numpy.zeros(count, dtype=numpy.intc)
+        else:
+            names, codes = numpy.unique(numpy.asarray(name, dtype=str), return_inverse=True)
+            names = names.tolist()
+            count = len(codes)
+        values = numpy.empty((count, len(arrays)))
+        for i, array in enumerate(arrays.values()):
+            values[:, i] = array
+        return cls(names, arrays.keys(), codes, values)
+
+    @classmethod
+    def concatenate(cls, commandArrays):
+        """concatenate(commandArrays) ... return the commands of all commandArrays in one"""
+        names = []
+        columns = []
+        for ca in commandArrays:
+            names.extend(n for n in ca.names if n not in names)
+            columns.extend(c for c in ca.columns if c not in columns)
+        codes = []
+        values = []
+        for ca in commandArrays:
+            nameCodes = numpy.array([names.index(n) for n in ca.names], dtype=numpy.intc)
+            codes.append(nameCodes[ca.codes] if len(ca.codes) else ca.codes)
+            table = numpy.full((len(ca), len(columns)), numpy.nan)
+            table[:, [columns.index(c) for c in ca.columns]] = ca.values
+            values.append(table)
+        if not codes:
+            return cls([], [], [], [])
+        return cls(names, columns, numpy.concatenate(codes), numpy.concatenate(values))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        """Return the commands selected by a slice, index array or mask as a CommandArray"""
+        return CommandArray(self.names, self.columns, self.codes[index], self.values[index])
+
+    def copy(self):
+        return CommandArray(self.names, self.columns, self.codes.copy(), self.values.copy())
+
+    def column(self, name):
+        """column(name) ... return the values of the parameter name, NaN where a command
+        doesn't have it. The array is a view of the values if the parameter is a column."""
+        name = name.upper()
+        if name in self.columns:
+            return self.values[:, self.columns.index(name)]
+        return numpy.full(len(self), numpy.nan)
+
+    def modal(self, name, initial=math.nan, mask=None):
+        """modal(name, initial=NaN, mask=None) ... return the value of parameter name in
+        effect at each command, the last value given up to and including the command or
+        initial. If mask is given only the values of the commands in mask are taken."""
+        col = self.column(name)
+        given = ~numpy.isnan(col)
+        if mask is not None:
+            given &= mask
+        last = numpy.where(given, numpy.arange(len(col)), -1)
+        numpy.maximum.accumulate(last, out=last)
+        return numpy.where(last >= 0, col[numpy.maximum(last, 0)], initial)
+
+    def isCommand(self, names):
+        """isCommand(names) ... return a mask of the commands with one of the given names"""
+        codes = [i for i, n in enumerate(self.names) if n in names]
+        return numpy.isin(self.codes, codes)
+
+    def addToPath(self, path):
+        """addToPath(path) ... add the commands at the end of path"""
+        path.addArrays(
+            self.names,
+            self.columns,
+            numpy.ascontiguousarray(self.codes, dtype=numpy.intc),
+            numpy.ascontiguousarray(self.values, dtype=float),
+        )
+        return path
+
+    def toPath(self):
+        """toPath() ... return a new Path.Path of the commands"""
+        return self.addToPath(Path.Path())
+
+    def commands(self):
+        """commands() ... return the commands as a list of Path.Command"""
+        commands = []
+        for code, row in zip(self.codes.tolist(), self.values.tolist()):
+            params = {c: v for c, v in zip(self.columns, row) if v == v}
+            commands.append(Path.Command(self.names[code], params))
+        return commands
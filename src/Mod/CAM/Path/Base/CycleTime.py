@@ -0,0 +1,491 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "CAM Cycle Time Estimator"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Estimate the machining time of paths with an acceleration model of the machine."
+
+import Path
+import Path.Base.CommandArray as PathCommandArray
+import math
+import time
+
+# lazily loaded modules
+from lazy_loader.lazy_loader import LazyLoader
+
+numpy = LazyLoader("numpy", globals(), "numpy")
+
+# The commands are converted into arrays of linear and arc segments, with their
+# lengths, entry and exit directions and feed rates. Canned drill cycles are expanded
+# into their moves. The time of all segments is then computed at once: the speed at
+# the junction of two segments is limited by the junction deviation of the machine
+# (as in grbl) and by the distance needed to accelerate and decelerate, the segments
+# themselves follow a trapezoidal speed profile with the acceleration the axes allow in
+# the direction of the segment. A jerk limit adds the time needed to ramp the
+# acceleration up and down, the distance covered meanwhile is not accounted for.
+# All values are in FreeCAD's internal units, mm and s.
+
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+# segment kinds
+LINE = 0
+ARC_CW = 1
+ARC_CCW = 2
+
+CmdDwell = ["G4", "G04"]
+CmdDrill = Path.Geom.CmdMoveDrill + ["G86", "G89"]
+CmdRetractInitial = ["G98"]
+CmdRetractR = ["G99"]
+
+
+class MotionModel:
+    """MotionModel(acceleration=(0, 0, 0), jerk=0, junctionDeviation=0.01) ...
+    Motion limits of a machine. acceleration are the limits of the X, Y and Z axis in
+    mm/s^2, jerk the limit in mm/s^3 of all axes, 0 means unlimited. junctionDeviation in
+    mm determines the speed at the corners between segments.
+    Without any limits the time of a move is its length divided by its feed rate."""
+
+    def __init__(self, acceleration=(0.0, 0.0, 0.0), jerk=0.0, junctionDeviation=0.01):
+        self.acceleration = numpy.array(
+            [a if a > 0 else math.inf for a in acceleration], dtype=float
+        )
+        self.jerk = jerk if jerk > 0 else math.inf
+        self.junctionDeviation = junctionDeviation
+
+    @classmethod
+    def fromPreferences(cls):
+        """fromPreferences() ... return the MotionModel of the CAM preferences"""
+        xy = Path.Preferences.machineAccelerationXY()
+        return cls(
+            (xy, xy, Path.Preferences.machineAccelerationZ()),
+            Path.Preferences.machineJerk(),
+            Path.Preferences.machineJunctionDeviation(),
+        )
+
+    def isUnlimited(self):
+        return numpy.all(numpy.isinf(self.acceleration))
+
+
+class Rates:
+    """Rates(hFeed, vFeed, hRapid=0, vRapid=0) ... feed rates in mm/s used for moves
+    without a feed rate of their own, as set in a tool controller. Rapid moves fall
+    back to the feed rates if the rapid rates are 0."""
+
+    def __init__(self, hFeed, vFeed, hRapid=0.0, vRapid=0.0):
+        self.hFeed = hFeed
+        self.vFeed = vFeed
+        self.hRapid = hRapid if hRapid > 0 else hFeed
+        self.vRapid = vRapid if vRapid > 0 else vFeed
+
+    @classmethod
+    def fromToolController(cls, tc):
+        """fromToolController(tc) ... return the Rates of a tool controller"""
+        return cls(tc.HorizFeed.Value, tc.VertFeed.Value, tc.HorizRapid.Value, tc.VertRapid.Value)
+
+
+class Segments:
+    """Segments() ... the moves of paths, collected with addPath() or addCommands() and
+    converted to arrays by arrays(). Each move is stored with the group it belongs to, the
+    groups are the operations when estimating a job."""
+
+    def __init__(self):
+        self.rows = []  # start xyz, end xyz, center xy, kind, feed, group, stop
+        self.tables = []  # rows added by addPath and the rows before them
+        self.dwells = []  # (group, seconds)
+        self.position = (0.0, 0.0, 0.0)
+
+    def _move(self, end, feed, group, stop=False, kind=LINE, center=(0.0, 0.0)):
+        start = self.position
+        self.rows.append((*start, *end, center[0], center[1], kind, feed, group, stop))
+        self.position = end
+
+    def addPath(self, path, rates, group=0):
+        """addPath(path, rates, group=0) ... add the moves of a Path.Path.
+        The commands are processed as arrays, without Path.Command objects. Paths with
+        canned drill cycles are added with addCommands()."""
+        ca = PathCommandArray.CommandArray.fromPath(path, ["X", "Y", "Z", "I", "J", "F", "P"])
+        if not len(ca):
+            return
+        if numpy.any(ca.isCommand(CmdDrill + CmdRetractInitial + CmdRetractR)):
+            self.addCommands(path.Commands, rates, group)
+            return
+
+        rapid = ca.isCommand(Path.Geom.CmdMoveRapid)
+        cw = ca.isCommand(Path.Geom.CmdMoveCW)
+        ccw = ca.isCommand(Path.Geom.CmdMoveCCW)
+        move = rapid | cw | ccw | ca.isCommand(Path.Geom.CmdMoveStraight)
+        for seconds in numpy.nan_to_num(ca.column("P")[ca.isCommand(CmdDwell)]).tolist():
+            self.dwells.append((group, seconds))
+        if not numpy.any(move):
+            return
+
+        end = numpy.column_stack(
+            [ca.modal(axis, self.position[i], move)[move] for i, axis in enumerate("XYZ")]
+        )
+        start = numpy.vstack([self.position, end[:-1]])
+        feed = ca.modal("F", 0.0, ca.column("F") > 0)[move]
+        vertical = start[:, 2] != end[:, 2]
+        rate = numpy.where(vertical, rates.vFeed, rates.hFeed)
+        rate = numpy.where(feed > 0, feed, rate)
+        rate = numpy.where(rapid[move], numpy.where(vertical, rates.vRapid, rates.hRapid), rate)
+        center = start[:, 0:2] + numpy.nan_to_num(
+            numpy.column_stack([ca.column("I")[move], ca.column("J")[move]])
+        )
+        kind = numpy.where(cw[move], ARC_CW, numpy.where(ccw[move], ARC_CCW, LINE))
+        # the motion stops at the first move and after any other command
+        stop = ~numpy.concatenate([[False], move[:-1]])[move]
+
+        self._flushRows()
+        self.tables.append(
+            numpy.column_stack(
+                [start, end, center, kind, rate, numpy.full(len(end), group), stop]
+            ).astype(float)
+        )
+        self.position = tuple(end[-1].tolist())
+
+    def _flushRows(self):
+        if self.rows:
+            self.tables.append(numpy.array(self.rows, dtype=float))
+            self.rows = []
+
+    def addCommands(self, commands, rates, group=0):
+        """addCommands(commands, rates, group=0) ... add the moves of commands.
+        The first move of the commands starts from rest."""
+        stop = True
+        feed = 0.0
+        retract = "G98"
+        for cmd in commands:
+            name = cmd.Name
+            params = cmd.Parameters
+            if "F" in params and params["F"] > 0:
+                feed = params["F"]
+            x, y, z = self.position
+            end = (params.get("X", x), params.get("Y", y), params.get("Z", z))
+
+            if name in Path.Geom.CmdMoveRapid:
+                rate = rates.hRapid if end[2] == z else rates.vRapid
+                self._move(end, rate, group, stop)
+            elif name in Path.Geom.CmdMoveStraight:
+                self._move(end, self._feed(feed, rates, z, end[2]), group, stop)
+            elif name in Path.Geom.CmdMoveArc:
+                kind = ARC_CW if name in Path.Geom.CmdMoveCW else ARC_CCW
+                center = (x + params.get("I", 0.0), y + params.get("J", 0.0))
+                rate = self._feed(feed, rates, z, end[2])
+                self._move(end, rate, group, stop, kind, center)
+            elif name in CmdDrill:
+                self._drill(name, params, end, feed, rates, retract, group)
+                # the spindle stops at the bottom of the hole and on the retract
+                stop = True
+                continue
+            elif name in CmdDwell:
+                self.dwells.append((group, params.get("P", 0.0)))
+            elif name in CmdRetractInitial + CmdRetractR:
+                retract = name
+                continue
+            else:
+                # other commands, like tool and spindle changes, stop the motion
+                stop = True
+                continue
+            stop = name in CmdDwell
+
+    @staticmethod
+    def _feed(feed, rates, z0, z1):
+        if feed > 0:
+            return feed
+        return rates.hFeed if z0 == z1 else rates.vFeed
+
+    def _drill(self, name, params, end, feed, rates, retract, group):
+        x, y, z = self.position
+        r = params.get("R", z)
+        initial = max(z, r)
+        feedRate = self._feed(feed, rates, r, end[2])
+        vRapid = rates.vRapid
+
+        # position over the hole, above the retract plane
+        if z < r:
+            self._move((x, y, r), vRapid, group, True)
+        self._move((end[0], end[1], initial), rates.hRapid, group, True)
+        if initial > r:
+            self._move((end[0], end[1], r), vRapid, group, True)
+
+        # drill, G73 and G83 in pecks of Q
+        peck = params.get("Q", 0.0) if name in ["G73", "G83"] else 0.0
+        depth = r
+        while depth > end[2]:
+            nextDepth = max(depth - peck, end[2]) if peck > 0 else end[2]
+            self._move((end[0], end[1], nextDepth), feedRate, group, True)
+            depth = nextDepth
+            if depth > end[2]:
+                if name == "G83":
+                    # retract to R and rapid back down to just above the last depth
+                    self._move((end[0], end[1], r), vRapid, group, True)
+                    self._move((end[0], end[1], depth), vRapid, group, True)
+        if name in ["G82", "G89"]:
+            self.dwells.append((group, params.get("P", 0.0)))
+
+        # retract, bored holes are left at feed rate
+        height = initial if retract == "G98" else r
+        rate = feedRate if name in ["G85", "G89"] else vRapid
+        self._move((end[0], end[1], height), rate, group, True)
+
+    def arrays(self):
+        """arrays() ... return a dict of arrays of the moves"""
+        self._flushRows()
+        if self.tables:
+            data = numpy.concatenate(self.tables)
+        else:
+            data = numpy.zeros((0, 12))
+        return {
+            "start": data[:, 0:3],
+            "end": data[:, 3:6],
+            "center": data[:, 6:8],
+            "kind": data[:, 8].astype(int),
+            "feed": data[:, 9],
+            "group": data[:, 10].astype(int),
+            "stop": data[:, 11].astype(bool),
+        }
+
+
+def _unit(vectors):
+    lengths = numpy.linalg.norm(vectors, axis=1)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        units = vectors / lengths[:, None]
+    return numpy.where(lengths[:, None] > 0, units, 0.0)
+
+
+def _geometry(segs):
+    """Return length, entry and exit directions and radius (0 for lines) of the segments"""
+    start, end = segs["start"], segs["end"]
+    delta = end - start
+    length = numpy.linalg.norm(delta, axis=1)
+    entry = _unit(delta)
+    exit = entry.copy()
+    radius = numpy.zeros(len(length))
+
+    arcs = segs["kind"] != LINE
+    if numpy.any(arcs):
+        center = segs["center"][arcs]
+        r0 = start[arcs, 0:2] - center
+        r1 = end[arcs, 0:2] - center
+        radius[arcs] = numpy.linalg.norm(r0, axis=1)
+        cw = segs["kind"][arcs] == ARC_CW
+        # counter clockwise sweep from start to end, clockwise arcs sweep the other way
+        sweep = numpy.arctan2(r1[:, 1], r1[:, 0]) - numpy.arctan2(r0[:, 1], r0[:, 0])
+        sweep = numpy.where(cw, -sweep, sweep) % (2 * math.pi)
+        # start and end at the same point is a full circle
+        sweep = numpy.where(sweep < 1e-9, 2 * math.pi, sweep)
+        dz = delta[arcs, 2]
+        length[arcs] = numpy.hypot(sweep * radius[arcs], dz)
+
+        # tangents, perpendicular to the radius in the direction of the motion
+        sign = numpy.where(cw, -1.0, 1.0)[:, None]
+        planar = sweep * radius[arcs]
+        t0 = numpy.column_stack([-r0[:, 1], r0[:, 0]]) * sign
+        t1 = numpy.column_stack([-r1[:, 1], r1[:, 0]]) * sign
+        t0 = _unit(numpy.column_stack([_unit(t0) * planar[:, None], dz]))
+        t1 = _unit(numpy.column_stack([_unit(t1) * planar[:, None], dz]))
+        entry[arcs] = t0
+        exit[arcs] = t1
+
+    return length, entry, exit, radius
+
+
+def _phaseTime(dv, accel, jerk):
+    """time to change the speed by dv with the acceleration accel and the jerk limit"""
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        t = numpy.where(numpy.isfinite(accel), dv / accel, 0.0)
+        if math.isfinite(jerk):
+            # the acceleration is ramped up and down, short changes don't reach accel
+            ramped = numpy.where(
+                dv * jerk >= accel * accel, dv / accel + accel / jerk, 2 * numpy.sqrt(dv / jerk)
+            )
+            t = numpy.where(numpy.isfinite(accel) & (dv > 0), ramped, t)
+    return t
+
+
+def _junctionLimits(entry, exit, accel, feed, model):
+    """speed limits at the junctions of consecutive segments, from the junction deviation"""
+    cosTheta = -numpy.sum(exit[:-1] * entry[1:], axis=1)
+    a = numpy.minimum(accel[:-1], accel[1:])
+    sinHalf = numpy.sqrt(numpy.clip(0.5 * (1.0 - cosTheta), 0.0, 1.0))
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        vj = numpy.sqrt(a * model.junctionDeviation * sinHalf / (1.0 - sinHalf))
+    # reversals stop, straight junctions are only limited by the feed rates
+    vj = numpy.where(cosTheta > 0.999999, 0.0, vj)
+    vj = numpy.where(numpy.isnan(vj), math.inf, vj)
+    return numpy.minimum(vj, numpy.minimum(feed[:-1], feed[1:]))
+
+
+def _plan(limits, length, accel):
+    """Return the speeds at the junctions, limits are the speed limits of all junctions,
+    including the start of the first and the end of the last segment.
+    Like the planners of machine controllers the speeds are reduced in a backward pass so
+    the machine can decelerate to the next junction, and in a forward pass so it can
+    accelerate to them. With squared speeds w both passes become running minimums:
+    w[i] <= w[i + 1] + d[i] with d = 2 * a * L is min(w[i] + D[i], w[i + 1] + D[i + 1])
+    with D the cumulative sum of d."""
+    w = limits**2
+    # a segment longer than needed to reach the highest speed doesn't limit anything,
+    # this also keeps the sums finite for unlimited axes
+    d = numpy.minimum(2 * accel * length, numpy.max(w[numpy.isfinite(w)], initial=0.0))
+    D = numpy.concatenate([[0.0], numpy.cumsum(d)])
+    w = numpy.minimum.accumulate((w + D)[::-1])[::-1] - D
+    w = numpy.minimum.accumulate(w - D) + D
+    return numpy.sqrt(numpy.maximum(w, 0.0))
+
+
+def segmentTimes(segs, model):
+    """segmentTimes(segs, model) ... return the time of each segment of segs in seconds"""
+    length, entry, exit, radius = _geometry(segs)
+    feed = segs["feed"].copy()
+    times = numpy.zeros(len(length))
+
+    # moves without length take no time, but stops on them apply to the next move
+    moves = numpy.flatnonzero(length > 0)
+    if len(moves) == 0:
+        return times
+    stops = numpy.concatenate([[0], numpy.cumsum(segs["stop"])])
+    stop = stops[moves + 1] - stops[numpy.concatenate([[0], moves[:-1] + 1])] > 0
+    length, entry, exit, radius, feed = (
+        length[moves],
+        entry[moves],
+        exit[moves],
+        radius[moves],
+        feed[moves],
+    )
+
+    # the acceleration along a segment is limited by the axis reaching its limit first
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        axisLimits = model.acceleration[None, :] / numpy.abs(entry)
+    accel = numpy.min(numpy.where(numpy.abs(entry) > 0, axisLimits, math.inf), axis=1)
+    arcs = radius > 0
+    accel[arcs] = numpy.minimum(accel[arcs], numpy.min(model.acceleration))
+    # centripetal acceleration on arcs
+    feed[arcs] = numpy.minimum(feed[arcs], numpy.sqrt(accel[arcs] * radius[arcs]))
+
+    if model.isUnlimited():
+        times[moves] = length / feed
+        return times
+
+    # the machine starts and ends at rest
+    limits = numpy.zeros(len(length) + 1)
+    limits[1:-1] = _junctionLimits(entry, exit, accel, feed, model)
+    limits[1:-1][stop[1:]] = 0.0
+    junction = _plan(limits, length, accel)
+    v0 = junction[:-1]
+    v1 = junction[1:]
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        limited = numpy.isfinite(accel)
+        accelDist = numpy.where(limited, (feed**2 - v0**2) / (2 * accel), 0.0)
+        decelDist = numpy.where(limited, (feed**2 - v1**2) / (2 * accel), 0.0)
+        cruise = length - accelDist - decelDist
+        trapezoid = cruise >= 0
+        # the peak speed of a triangular profile
+        peak = numpy.sqrt(numpy.maximum((2 * accel * length + v0**2 + v1**2) / 2, 0.0))
+        top = numpy.where(trapezoid, feed, numpy.minimum(peak, feed))
+        times[moves] = (
+            _phaseTime(numpy.maximum(top - v0, 0.0), accel, model.jerk)
+            + _phaseTime(numpy.maximum(top - v1, 0.0), accel, model.jerk)
+            + numpy.where(trapezoid, cruise / feed, 0.0)
+        )
+    return times
+
+
+class Estimate:
+    """Estimate(total, groups) ... the result of an estimation, total and per group times
+    in seconds. operations and tools map the names of the operations and the tool
+    numbers to their time when estimating a job."""
+
+    def __init__(self, total, groups, operations=None, tools=None):
+        self.total = total
+        self.groups = groups
+        self.operations = operations or {}
+        self.tools = tools or {}
+
+
+def estimateSegments(segs, model=None, groupCount=None):
+    """estimateSegments(segs, model=None, groupCount=None) ... return the Estimate of the
+    moves in segs, a Segments object."""
+    if model is None:
+        model = MotionModel.fromPreferences()
+    arrays = segs.arrays()
+    times = segmentTimes(arrays, model)
+    if groupCount is None:
+        groupCount = int(arrays["group"].max()) + 1 if len(times) else 0
+        groupCount = max([groupCount] + [g + 1 for g, _ in segs.dwells])
+    groups = numpy.bincount(arrays["group"], weights=times, minlength=groupCount)
+    for group, seconds in segs.dwells:
+        groups[group] += seconds
+    return Estimate(float(groups.sum()), groups)
+
+
+def estimateCommands(commands, rates, model=None):
+    """estimateCommands(commands, rates, model=None) ... return the time in seconds of
+    commands with the Rates rates, model defaults to the CAM preferences."""
+    segs = Segments()
+    segs.addCommands(commands, rates)
+    return estimateSegments(segs, model, 1).total
+
+
+def estimatePath(path, rates, model=None):
+    """estimatePath(path, rates, model=None) ... return the time in seconds of the Path.Path
+    path with the Rates rates, model defaults to the CAM preferences."""
+    segs = Segments()
+    segs.addPath(path, rates)
+    return estimateSegments(segs, model, 1).total
+
+
+def estimateJob(job, model=None):
+    """estimateJob(job, model=None) ... return the Estimate of all active operations of
+    job, with the times per operation and per tool. All operations are evaluated in
+    one pass."""
+    import Path.Dressup.Utils as PathDressup
+
+    segs = Segments()
+    ops = []
+    for op in job.Operations.Group:
+        if not getattr(op, "Active", True):
+            continue
+        tc = PathDressup.toolController(op)
+        if tc is None or tc.HorizFeed.Value == 0 or tc.VertFeed.Value == 0:
+            continue
+        segs.addPath(op.Path, Rates.fromToolController(tc), len(ops))
+        ops.append((op, tc))
+
+    estimate = estimateSegments(segs, model, len(ops))
+    for (op, tc), seconds in zip(ops, estimate.groups.tolist()):
+        estimate.operations[op.Name] = seconds
+        estimate.tools[tc.ToolNumber] = estimate.tools.get(tc.ToolNumber, 0.0) + seconds
+    return estimate
+
+
+def formatTime(seconds):
+    """formatTime(seconds) ... return seconds in the HH:MM:SS format of the CycleTime properties"""
+    return time.strftime("%H:%M:%S", time.gmtime(seconds))
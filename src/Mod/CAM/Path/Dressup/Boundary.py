@@ -23,6 +23,7 @@
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import FreeCAD
 import Path
+import Path.Base.BoundBoxTree as PathBoundBoxTree
 import Path.Base.Util as PathUtil
 import Path.Dressup.Utils as PathDressup
 import Path.Main.Stock as PathStock
@@ -174,6 +175,17 @@ class PathBoundary:
 
         return cmds
 
+    def splitEdge(self, edge, faceTree):
+        """splitEdge(edge, faceTree) ... return the parts of edge inside and outside the boundary.
+        Edges not touching any face of the boundary are classified by one point instead of
+        the boolean operations."""
+        if faceTree is None or faceTree.intersecting(edge.BoundBox):
+            return (edge.common(self.boundary).Edges, edge.cut(self.boundary).Edges)
+        pt = edge.valueAt((edge.FirstParameter + edge.LastParameter) / 2)
+        if self.boundary.isInside(pt, Path.Geom.Tolerance, True):
+            return ([edge], [])
+        return ([], [edge])
+
     def execute(self):
         if (
             not self.baseOp
@@ -196,6 +208,12 @@ class PathBoundary:
         )
         self.strG0ZclearanceHeight = Path.Command("G0", {"Z": self.clearanceHeight})
 
+        faceTree = None
+        if self.boundary.Solids:
+            faceTree = PathBoundBoxTree.BoundBoxTree(
+                [f.BoundBox for f in self.boundary.Faces], Path.Geom.Tolerance
+            )
+
         cmd = path.Commands[0]
         pos = cmd.Placement.Base  # bogus m/c position to create first edge
         bogusX = True
@@ -211,8 +229,7 @@ class PathBoundary:
                     bogusY = "Y" not in cmd.Parameters
                 edge = Path.Geom.edgeForCmd(cmd, pos)
                 if edge:
-                    inside = edge.common(self.boundary).Edges
-                    outside = edge.cut(self.boundary).Edges
+                    inside, outside = self.splitEdge(edge, faceTree)
                     if not self.inside:  # UI "inside boundary" param
                         tmp = inside
                         inside = outside
@@ -25,6 +25,7 @@ from PathScripts.PathUtils import waiting_effects
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import FreeCAD
 import Path
+import Path.Base.BoundBoxTree as PathBoundBoxTree
 import Path.Dressup.Utils as PathDressup
 import PathScripts.PathUtils as PathUtils
 import copy
@@ -621,12 +622,14 @@ class MapWireToTag:
 class _RapidEdges:
     def __init__(self, rapid):
         self.rapid = rapid
+        self.tree = PathBoundBoxTree.BoundBoxTree([r.BoundBox for r in rapid], Path.Geom.Tolerance)
 
     def isRapid(self, edge):
         if type(edge.Curve) == Part.Line or type(edge.Curve) == Part.LineSegment:
             v0 = edge.Vertexes[0]
             v1 = edge.Vertexes[1]
-            for r in self.rapid:
+            for i in self.tree.intersecting(edge.BoundBox):
+                r = self.rapid[i]
                 r0 = r.Vertexes[0]
                 r1 = r.Vertexes[1]
                 if (
@@ -665,6 +668,7 @@ class PathData:
             and Path.Geom.isRoughly(e.Vertexes[1].Point.z, minZ)
         ]
         self.bottomEdges = bottom
+        self.bottomEdgeTree = PathBoundBoxTree.BoundBoxTree([e.BoundBox for e in bottom])
         try:
             wire = Part.Wire(bottom)
             if wire.isClosed():
@@ -858,13 +862,15 @@ class PathData:
 
     def sortedTags(self, tags):
         ordered = []
+        allTags = list(tags)
+        origins = [t.originAt(self.minZ) for t in allTags]
+        tree = PathBoundBoxTree.BoundBoxTree([FreeCAD.BoundBox(o, o) for o in origins], 0.1)
         for edge in self.bottomEdges:
             ts = [
-                t
-                for t in tags
-                if Path.Geom.isRoughly(
-                    0, Part.Vertex(t.originAt(self.minZ)).distToShape(edge)[0], 0.1
-                )
+                allTags[i]
+                for i in tree.intersecting(edge.BoundBox)
+                if allTags[i] in tags
+                and Path.Geom.isRoughly(0, Part.Vertex(origins[i]).distToShape(edge)[0], 0.1)
             ]
             for t in sorted(
                 ts,
@@ -887,7 +893,8 @@ class PathData:
     def pointIsOnPath(self, p):
         v = Part.Vertex(self.pointAtBottom(p))
         Path.Log.debug("pt = (%f, %f, %f)" % (v.X, v.Y, v.Z))
-        for e in self.bottomEdges:
+        for i in self.bottomEdgeTree.intersecting(v.BoundBox, 0.1):
+            e = self.bottomEdges[i]
             indent = "{} ".format(e.distToShape(v)[0])
             debugEdge(e, indent, True)
             if Path.Geom.isRoughly(0.0, v.distToShape(e)[0], 0.1):
@@ -1059,6 +1066,13 @@ class ObjectTagDressup:
         horizRapid = tc.HorizRapid.Value
         vertRapid = tc.VertRapid.Value
 
+        # only tags whose bound box overlaps the edge's can intersect it
+        tagTree = PathBoundBoxTree.BoundBoxTree(
+            [tag.solid.BoundBox for tag in tags], Path.Geom.Tolerance
+        )
+        candidates = []
+        candidatesOf = None
+
         while edge or lastEdge < len(pathData.edges):
             Path.Log.debug("------- lastEdge = %d/%d.%d/%d" % (lastEdge, lastTag, t, len(tags)))
             if not edge:
@@ -1077,9 +1091,17 @@ class ObjectTagDressup:
                     edge = None
 
             if edge:
+                if edge is not candidatesOf:
+                    candidates = set(tagTree.intersecting(edge.BoundBox))
+                    candidatesOf = edge
+                # skip the tags which can't intersect, the last one is left to consume the edge
+                while t < len(tags) - 1 and (t + lastTag) % len(tags) not in candidates:
+                    t += 1
                 tIndex = (t + lastTag) % len(tags)
                 t += 1
-                i = tags[tIndex].intersects(edge, edge.FirstParameter)
+                i = None
+                if tIndex in candidates:
+                    i = tags[tIndex].intersects(edge, edge.FirstParameter)
                 if i and self.isValidTagStartIntersection(edge, i):
                     mapper = MapWireToTag(
                         edge,
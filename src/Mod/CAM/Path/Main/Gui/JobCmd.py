@@ -41,6 +41,23 @@ else:
     Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
 
 
+def selectedJob():
+    """selectedJob() ... return the only job of the document or the selected one"""
+    # if there's only one Job in the document ...
+    jobs = PathJob.Instances()
+    if not jobs:
+        return None
+    if len(jobs) == 1:
+        return jobs[0]
+    # more than one job, is one of them selected?
+    sel = FreeCADGui.Selection.getSelection()
+    if len(sel) == 1:
+        job = sel[0]
+        if hasattr(job, "Proxy") and isinstance(job.Proxy, PathJob.ObjectJob):
+            return job
+    return None
+
+
 class CommandJobCreate:
     """
     Command used to create a command.
@@ -106,19 +123,7 @@ class CommandJobTemplateExport:
         }
 
     def GetJob(self):
-        # if there's only one Job in the document ...
-        jobs = PathJob.Instances()
-        if not jobs:
-            return None
-        if len(jobs) == 1:
-            return jobs[0]
-        # more than one job, is one of them selected?
-        sel = FreeCADGui.Selection.getSelection()
-        if len(sel) == 1:
-            job = sel[0]
-            if hasattr(job, "Proxy") and isinstance(job.Proxy, PathJob.ObjectJob):
-                return job
-        return None
+        return selectedJob()
 
     def IsActive(self):
         return self.GetJob() is not None
@@ -195,9 +200,38 @@ class CommandJobTemplateExport:
             json.dump(encoded, fp, sort_keys=True, indent=2)
 
 
+class CommandJobRecomputeOperations:
+    """
+    Command to recompute all operations of a job.
+    The operations not depending on other operations are recomputed in parallel by worker processes,
+    the time each operation took is printed to the report view.
+    """
+
+    def GetResources(self):
+        return {
+            "Pixmap": "view-refresh",
+            "MenuText": QT_TRANSLATE_NOOP("CAM_JobRecomputeOperations", "Recompute Operations"),
+            "ToolTip": QT_TRANSLATE_NOOP(
+                "CAM_JobRecomputeOperations",
+                "Recomputes all operations of the CAM Job, independent operations in parallel",
+            ),
+        }
+
+    def IsActive(self):
+        return selectedJob() is not None
+
+    def Activated(self):
+        job = selectedJob()
+        FreeCADGui.addModule("Path.Main.Recompute")
+        FreeCADGui.doCommand(
+            "Path.Main.Recompute.recomputeOperations(App.ActiveDocument.%s)" % job.Name
+        )
+
+
 if FreeCAD.GuiUp:
     # register the FreeCAD command
     FreeCADGui.addCommand("CAM_Job", CommandJobCreate())
     FreeCADGui.addCommand("CAM_ExportTemplate", CommandJobTemplateExport())
+    FreeCADGui.addCommand("CAM_JobRecomputeOperations", CommandJobRecomputeOperations())
 
 FreeCAD.Console.PrintLog("Loading PathJobCmd... done\n")
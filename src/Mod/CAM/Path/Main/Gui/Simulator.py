@@ -26,6 +26,7 @@ import Path.Base.Util as PathUtil
 import Path.Dressup.Utils as PathDressup
 import PathScripts.PathUtils as PathUtils
 import Path.Main.Job as PathJob
+import Path.Tool.Bit as PathToolBit
 import PathGui
 import PathSimulator
 import math
@@ -184,7 +185,7 @@ class PathSimulation:
             self.tool = None
 
         if self.tool is not None:
-            self.cutTool.Shape = self.tool.Shape
+            self.cutTool.Shape = PathToolBit.toolShape(self.tool)
 
             if not self.cutTool.Shape.isValid() or self.cutTool.Shape.isNull():
                 self.EndSimulation()
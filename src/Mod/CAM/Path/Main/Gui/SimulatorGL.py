@@ -30,6 +30,7 @@ import FreeCAD
 import Path.Base.Util as PathUtil
 import Path.Dressup.Utils as PathDressup
 import Path.Main.Job as PathJob
+import Path.Tool.Bit as PathToolBit
 from PathScripts import PathUtils
 import CAMSimulator
 
@@ -164,7 +165,7 @@ class CAMSimulation:
         """
         originalPlacement = tool.Placement
         tool.Placement = Placement(Vector(0, 0, 0), Rotation(Vector(0, 0, 1), 0), Vector(0, 0, 0))
-        shape = tool.Shape
+        shape = PathToolBit.toolShape(tool)
         tool.Placement = originalPlacement
         sideEdgeList = []
         for _i, edge in enumerate(shape.Edges):
@@ -732,6 +732,13 @@ class ObjectJob:
 
         return ops
 
+    def recomputeOperations(self, workers=None):
+        """recomputeOperations(workers=None) ... recompute all operations, the ones not depending
+        on other operations in worker processes, see Path.Main.Recompute."""
+        import Path.Main.Recompute as PathRecompute
+
+        return PathRecompute.recomputeOperations(self.obj, workers)
+
     def setCenterOfRotation(self, center):
         if center != self.obj.Path.Center:
             self.obj.Path.Center = center
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+__title__ = "CAM Job Parallel Recompute"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Recompute the independent operations of a job in worker processes."
+
+import FreeCAD
+import Path
+import base64
+import concurrent.futures
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# The operations of a job which don't depend on other operations are recomputed by
+# FreeCADCmd worker processes. The workers open a copy of the document, recompute their
+# share of the operations and write the changed property contents of each operation to
+# a json file. These are restored in the original document, the operations depending
+# on others (dressups, arrays) are recomputed afterwards in the usual way.
+
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+class OpResult:
+    """OpResult(name, label, seconds, worker=None, error=None) ...
+    Outcome of recomputing one operation, worker is None if it was recomputed in
+    this process."""
+
+    def __init__(self, name, label, seconds, worker=None, error=None):
+        self.name = name
+        self.label = label
+        self.seconds = seconds
+        self.worker = worker
+        self.error = error
+
+    def __str__(self):
+        where = "serial" if self.worker is None else "worker {}".format(self.worker)
+        text = "{}: {:.2f}s ({})".format(self.label, self.seconds, where)
+        if self.error:
+            text += " - {}".format(self.error)
+        return text
+
+
+def consoleExecutable():
+    """consoleExecutable() ... return the path of FreeCADCmd, None if it can't be found"""
+    names = ["FreeCADCmd", "freecadcmd"]
+    if sys.platform == "win32":
+        names = [name + ".exe" for name in names]
+    for directory in [os.path.join(FreeCAD.getHomePath(), "bin"), os.path.dirname(sys.executable)]:
+        for name in names:
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate):
+                return candidate
+    for name in names:
+        candidate = shutil.which(name)
+        if candidate:
+            return candidate
+    return None
+
+
+def independentOperations(job):
+    """independentOperations(job) ... return the active operations of job which don't
+    depend on any other operation, in the order of the job."""
+    ops = job.Proxy.allOperations()
+    names = set(op.Name for op in ops)
+    independent = []
+    for op in ops:
+        if not getattr(op, "Active", True):
+            continue
+        if any(dep.Name in names for dep in op.OutListRecursive):
+            continue
+        independent.append(op)
+    return independent
+
+
+def _restorableProperties(op):
+    # links are not restored, they refer to objects of the worker's document
+    props = []
+    for prop in op.PropertiesList:
+        typeId = op.getTypeIdOfProperty(prop)
+        if "Link" in typeId or typeId == "App::PropertyPythonObject":
+            continue
+        props.append(prop)
+    return props
+
+
+def _dumpProperties(op):
+    return {prop: op.dumpPropertyContent(prop) for prop in _restorableProperties(op)}
+
+
+def _recomputeOp(doc, op):
+    op.touch()
+    start = time.perf_counter()
+    doc.recompute([op])
+    seconds = time.perf_counter() - start
+    error = None
+    if "Invalid" in op.State or "Error" in op.State:
+        error = op.getStatusString() or "recompute failed"
+    return seconds, error
+
+
+def runWorker(taskFile):
+    """runWorker(taskFile) ... recompute the operations of a task, called in the workers.
+    The task is a json file with the keys document, operations (names) and result, the
+    file the results are written to."""
+    with open(taskFile) as fp:
+        task = json.load(fp)
+    doc = FreeCAD.openDocument(task["document"])
+    results = []
+    for name in task["operations"]:
+        op = doc.getObject(name)
+        before = _dumpProperties(op)
+        seconds, error = _recomputeOp(doc, op)
+        changed = {}
+        if not error:
+            for prop, content in _dumpProperties(op).items():
+                if content != before.get(prop):
+                    changed[prop] = base64.b64encode(content).decode("ascii")
+        results.append({"name": name, "seconds": seconds, "error": error, "properties": changed})
+    FreeCAD.closeDocument(doc.Name)
+    with open(task["result"], "w") as fp:
+        json.dump(results, fp)
+
+
+def applyResult(doc, result):
+    """applyResult(doc, result) ... restore the properties a worker computed for an
+    operation, returns False if the worker failed to recompute it."""
+    op = doc.getObject(result["name"])
+    if op is None or result["error"]:
+        return False
+    for prop, content in result["properties"].items():
+        op.restorePropertyContent(prop, base64.b64decode(content))
+    # the operation is up to date, only its dependents need a recompute
+    op.purgeTouched()
+    return True
+
+
+def _runWorkerProcess(executable, directory, index, document, names):
+    taskFile = os.path.join(directory, "task{}.json".format(index))
+    resultFile = os.path.join(directory, "result{}.json".format(index))
+    scriptFile = os.path.join(directory, "worker{}.py".format(index))
+    with open(taskFile, "w") as fp:
+        json.dump({"document": document, "operations": names, "result": resultFile}, fp)
+    with open(scriptFile, "w") as fp:
+        fp.write("import Path.Main.Recompute\n")
+        fp.write("Path.Main.Recompute.runWorker({!r})\n".format(taskFile))
+    proc = subprocess.run(
+        [executable, scriptFile],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        with open(resultFile) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        output = proc.stdout.decode("utf-8", "replace").strip()
+        Path.Log.warning("Recompute worker {} failed: {}".format(index, output[-1000:]))
+        return [{"name": name, "error": "worker failed"} for name in names]
+
+
+def recomputeOperations(job, workers=None):
+    """recomputeOperations(job, workers=None) ... recompute all operations of job.
+    The independent operations are recomputed by up to workers processes, 0 or None uses
+    the CAM preference RecomputeWorkers. Operations depending on others and those a
+    worker failed on are recomputed in this process. Returns a list of OpResult."""
+    doc = job.Document
+    if not workers:
+        workers = Path.Preferences.recomputeWorkers() or os.cpu_count() or 1
+    parallel = independentOperations(job)
+    workers = min(workers, len(parallel))
+    executable = consoleExecutable() if workers > 1 else None
+    if workers > 1 and executable is None:
+        Path.Log.warning("FreeCADCmd not found, operations are recomputed serially.")
+
+    results = []
+    done = set()
+    if executable:
+        directory = tempfile.mkdtemp(prefix="cam-recompute-")
+        try:
+            document = os.path.join(directory, "job.FCStd")
+            doc.saveCopy(document)
+            groups = [[op.Name for op in parallel[i::workers]] for i in range(workers)]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_runWorkerProcess, executable, directory, i, document, names)
+                    for i, names in enumerate(groups)
+                ]
+                for i, future in enumerate(futures):
+                    for result in future.result():
+                        if applyResult(doc, result):
+                            op = doc.getObject(result["name"])
+                            done.add(op.Name)
+                            results.append(OpResult(op.Name, op.Label, result["seconds"], i))
+                        else:
+                            Path.Log.warning("{}: {}".format(result["name"], result["error"]))
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    # dependencies come after their dependents in allOperations
+    for op in reversed(job.Proxy.allOperations()):
+        if op.Name in done:
+            continue
+        seconds, error = _recomputeOp(doc, op)
+        results.append(OpResult(op.Name, op.Label, seconds, error=error))
+
+    doc.recompute()
+    job.Proxy.getCycleTime()
+    for result in results:
+        Path.Log.info(str(result))
+    return results
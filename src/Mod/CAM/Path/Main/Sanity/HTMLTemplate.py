@@ -462,6 +462,14 @@ tool_template = Template(
             ${diameter}
         </td>
     </tr>
+    <tr>
+        <td style="border: 1px solid #dedede; padding: 0.05cm">
+            <strong>${cycleTimeLabel}</strong>
+        </td>
+        <td style="border: 1px solid #dedede; padding: 0.05cm" colspan="2">
+            ${cycleTime}
+        </td>
+    </tr>
 </table>
 ${ops}
         """
@@ -471,10 +479,11 @@ op_tool_template = Template(
     """
 <table cellpadding="2" cellspacing="2" bgcolor="#ffffff" style="background: #ffffff;">
     <colgroup>
-        <col width="262"/>
-        <col width="262"/>
-        <col width="262"/>
-        <col width="262"/>
+        <col width="210"/>
+        <col width="210"/>
+        <col width="210"/>
+        <col width="210"/>
+        <col width="210"/>
     </colgroup>
     <tr>
         <td style="border: 1px solid #dedede; padding: 0.05cm">
@@ -489,6 +498,9 @@ op_tool_template = Template(
         <td style="border: 1px solid #dedede; padding: 0.05cm">
             <strong>${speedLabel}</strong>
         </td>
+        <td style="border: 1px solid #dedede; padding: 0.05cm">
+            <strong>${cycleTimeLabel}</strong>
+        </td>
     </tr>
     <tr>
         <td style="border: 1px solid #dedede; padding: 0.05cm">
@@ -503,6 +515,9 @@ op_tool_template = Template(
         <td style="border: 1px solid #dedede; padding: 0.05cm">
             ${Speed}
         </td>
+        <td style="border: 1px solid #dedede; padding: 0.05cm">
+            ${CycleTime}
+        </td>
     </tr>
 </table>
         """
@@ -32,6 +32,7 @@ from collections import Counter
 from datetime import datetime
 import FreeCAD
 import Path
+import Path.Base.CycleTime as PathCycleTime
 import Path.Log
 import Path.Main.Sanity.ImageBuilder as ImageBuilder
 import Path.Main.Sanity.ReportGenerator as ReportGenerator
@@ -69,6 +70,7 @@ class CAMSanity:
             )
 
         self.image_builder = ImageBuilder.ImageBuilderFactory.get_image_builder(self.filelocation)
+        self.cycleTimeEstimate = None
         self.data = self.summarize()
 
     def summarize(self):
@@ -245,7 +247,11 @@ class CAMSanity:
             "squawkData": [],
         }
 
+        # all operations are estimated in one pass, with the machine's acceleration
+        estimate = self._cycleTimeEstimate()
         data["cycletotal"] = str(obj.CycleTime)
+        if estimate.operations:
+            data["cycletotal"] = PathCycleTime.formatTime(estimate.total)
         data["jobMinZ"] = FreeCAD.Units.Quantity(
             obj.Path.BoundBox.ZMin, FreeCAD.Units.Length
         ).UserString
@@ -269,6 +275,9 @@ class CAMSanity:
                     ctime = o.CycleTime
                 cool = o.CoolantMode if hasattr(o, "CoolantMode") else cool
 
+            if op.Name in estimate.operations:
+                ctime = PathCycleTime.formatTime(estimate.operations[op.Name])
+
             if hasattr(op, "Active") and not op.Active:
                 oplabel = "{} (INACTIVE)".format(oplabel)
                 ctime = "00:00:00"
@@ -295,6 +304,15 @@ class CAMSanity:
 
         return data
 
+    def _cycleTimeEstimate(self):
+        if self.cycleTimeEstimate is None:
+            try:
+                self.cycleTimeEstimate = PathCycleTime.estimateJob(self.job)
+            except Exception as e:
+                Path.Log.warning("Cycle time estimate failed: {}".format(e))
+                self.cycleTimeEstimate = PathCycleTime.Estimate(0.0, [])
+        return self.cycleTimeEstimate
+
     def _stockData(self):
         obj = self.job
         data = {
@@ -350,6 +368,7 @@ class CAMSanity:
 
         obj = self.job
         data = {"squawkData": []}
+        estimate = self._cycleTimeEstimate()
 
         for TC in obj.Tools.Group:
             if not hasattr(TC.Tool, "BitBody"):
@@ -423,6 +442,8 @@ class CAMSanity:
                     )
                 )
 
+            tooldata["cycleTime"] = PathCycleTime.formatTime(estimate.tools.get(TC.ToolNumber, 0.0))
+
             tooldata["spindlespeed"] = str(TC.SpindleSpeed)
             if TC.SpindleSpeed == 0.0:
                 data["squawkData"].append(
@@ -446,6 +467,9 @@ class CAMSanity:
                             "ToolController": TC.Label,
                             "Feed": str(TC.HorizFeed),
                             "Speed": str(TC.SpindleSpeed),
+                            "CycleTime": PathCycleTime.formatTime(
+                                estimate.operations.get(op.Name, 0.0)
+                            ),
                         }
                     )
 
@@ -0,0 +1,528 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+__title__ = "CAM Stock Removal Simulation"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Headless, incremental stock removal simulation on a height field."
+
+import FreeCAD
+import Path
+import Path.Base.CommandArray as PathCommandArray
+import Path.Base.CycleTime as PathCycleTime
+import Path.Tool.Bit as PathToolBit
+import hashlib
+import math
+import time
+
+# lazily loaded modules
+from lazy_loader.lazy_loader import LazyLoader
+
+numpy = LazyLoader("numpy", globals(), "numpy")
+Part = LazyLoader("Part", globals(), "Part")
+
+# The stock is a height field, the height of the material at the center of each cell
+# of a grid over the stock's XY bounding box. The moves of an operation are swept
+# with the rotationally symmetric profile of its tool: each cell is lowered to the
+# lowest point of the tool above it. The state after each operation is kept as a
+# checkpoint, keyed by the operation's commands, its tool and everything before it,
+# so only the first changed operation and the ones after it are simulated again.
+# Undercuts can't be represented, the simulation is meant for 3 axis milling.
+
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+# distance between the samples of sloped moves, in cells
+SampleStep = 0.5
+# collisions reported in detail per operation, all of them are counted
+MaxCollisions = 100
+
+
+def _hash(*items):
+    sha = hashlib.sha1()
+    for item in items:
+        if isinstance(item, bytes):
+            sha.update(item)
+        else:
+            sha.update(repr(item).encode("utf-8"))
+        sha.update(b"\0")
+    return sha.hexdigest()
+
+
+def pathKey(path):
+    """pathKey(path) ... return a hash of the commands of a Path.Path"""
+    ca = PathCommandArray.CommandArray.fromPath(path)
+    return _hash(ca.names, ca.columns, ca.codes.tobytes(), ca.values.tobytes())
+
+
+class ToolProfile:
+    """ToolProfile(radii, heights, cuttingHeight=math.inf) ...
+    Rotationally symmetric shape of a tool, the heights of its lower surface above the
+    tip at increasing radii, the last radius is the radius of the tool. Material higher
+    than cuttingHeight above the tip is hit by the shank or holder."""
+
+    def __init__(self, radii, heights, cuttingHeight=math.inf):
+        self.radii = numpy.asarray(radii, dtype=float)
+        self.heights = numpy.asarray(heights, dtype=float)
+        self.radius = float(self.radii[-1])
+        self.cuttingHeight = cuttingHeight
+
+    @classmethod
+    def flat(cls, diameter, cuttingHeight=math.inf):
+        return cls([0.0, diameter / 2], [0.0, 0.0], cuttingHeight)
+
+    @classmethod
+    def ball(cls, diameter, cuttingHeight=math.inf, samples=33):
+        radius = diameter / 2
+        radii = radius * numpy.sin(numpy.linspace(0, math.pi / 2, samples))
+        return cls(radii, radius - numpy.sqrt(radius * radius - radii * radii), cuttingHeight)
+
+    @classmethod
+    def vee(cls, diameter, angle, tipDiameter=0.0, cuttingHeight=math.inf):
+        """vee(diameter, angle, tipDiameter=0.0, cuttingHeight=math.inf) ... a chamfer or
+        engraving tool, angle is the included angle in degrees"""
+        radius = diameter / 2
+        tip = tipDiameter / 2
+        height = (radius - tip) / math.tan(math.radians(angle) / 2)
+        return cls([0.0, tip, radius], [0.0, 0.0, height], cuttingHeight)
+
+    @classmethod
+    def fromShape(cls, shape, radius=None, cuttingHeight=math.inf, samples=32):
+        """fromShape(shape, radius=None, cuttingHeight=math.inf, samples=32) ... sample the
+        profile of a tool shape with its tip at the origin and its axis along Z. radius
+        defaults to the radius of the shape's bounding box."""
+        bb = shape.BoundBox
+        if radius is None:
+            radius = max(bb.XMax, -bb.XMin, bb.YMax, -bb.YMin)
+        radii = []
+        heights = []
+        for r in numpy.linspace(0, radius, samples).tolist():
+            # the outer surface may just touch the line
+            x = min(r, radius * (1 - 1e-6))
+            line = Part.makeLine(
+                FreeCAD.Vector(x, 0, bb.ZMin - 1), FreeCAD.Vector(x, 0, bb.ZMax + 1)
+            )
+            common = shape.common(line)
+            if not common.Edges:
+                break
+            radii.append(r)
+            heights.append(common.BoundBox.ZMin)
+        if len(radii) < 2:
+            raise ValueError("Tool shape has no profile")
+        return cls(radii, heights, cuttingHeight)
+
+    @classmethod
+    def fromTool(cls, tool):
+        """fromTool(tool) ... return the profile of a tool bit"""
+        radius = None
+        if hasattr(tool, "Diameter"):
+            radius = FreeCAD.Units.Quantity(tool.Diameter).Value / 2
+        cuttingHeight = math.inf
+        if hasattr(tool, "CuttingEdgeHeight"):
+            cuttingHeight = FreeCAD.Units.Quantity(tool.CuttingEdgeHeight).Value or math.inf
+        return cls.fromShape(PathToolBit.toolShape(tool), radius, cuttingHeight)
+
+    def key(self):
+        return _hash(self.radii.tolist(), self.heights.tolist(), self.cuttingHeight)
+
+    def heightAt(self, distance):
+        """heightAt(distance) ... heights above the tip at the distances from the axis,
+        inf outside the tool"""
+        heights = numpy.interp(distance, self.radii, self.heights)
+        return numpy.where(distance <= self.radius, heights, math.inf)
+
+
+class HeightField:
+    """HeightField(x0, y0, resolution, heights, zMin) ...
+    heights[row, column] is the height at x0 + (column + 0.5) * resolution,
+    y0 + (row + 0.5) * resolution. Stock has no material below zMin, a model
+    height field is -inf where there is no model."""
+
+    def __init__(self, x0, y0, resolution, heights, zMin):
+        self.x0 = x0
+        self.y0 = y0
+        self.resolution = resolution
+        self.heights = heights
+        self.zMin = zMin
+
+    @classmethod
+    def box(cls, xMin, yMin, zMin, xMax, yMax, zMax, resolution):
+        """box(xMin, yMin, zMin, xMax, yMax, zMax, resolution) ... a box shaped stock"""
+        columns = max(int(math.ceil((xMax - xMin) / resolution)), 1)
+        rows = max(int(math.ceil((yMax - yMin) / resolution)), 1)
+        return cls(xMin, yMin, resolution, numpy.full((rows, columns), float(zMax)), zMin)
+
+    @classmethod
+    def fromShape(cls, shape, resolution, grid=None, deflection=None):
+        """fromShape(shape, resolution, grid=None, deflection=None) ... the height field of
+        the top of shape, on the cells of grid if given. deflection is the tolerance of
+        the tessellation, it defaults to a tenth of the resolution."""
+        bb = shape.BoundBox
+        if grid is None:
+            grid = cls.box(bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax, bb.ZMax, resolution)
+        points, facets = shape.tessellate(deflection or resolution / 10)
+        if facets:
+            points = numpy.array([(p.x, p.y, p.z) for p in points], dtype=float)
+            triangles = points[numpy.array(facets, dtype=int)]
+        else:
+            triangles = numpy.zeros((0, 3, 3))
+        heights = _rasterize(triangles, grid.x0, grid.y0, grid.resolution, grid.heights.shape)
+        return cls(grid.x0, grid.y0, grid.resolution, heights, bb.ZMin)
+
+    def key(self):
+        return _hash(self.x0, self.y0, self.resolution, self.zMin, self.heights.tobytes())
+
+    def volume(self, heights=None):
+        """volume(heights=None) ... the volume of material of the stock"""
+        if heights is None:
+            heights = self.heights
+        return float((heights - self.zMin).sum()) * self.resolution**2
+
+    def cellCenter(self, row, column):
+        return (
+            self.x0 + (column + 0.5) * self.resolution,
+            self.y0 + (row + 0.5) * self.resolution,
+        )
+
+
+def _rasterize(triangles, x0, y0, resolution, shape):
+    """Return the highest point of triangles at the cell centers, -inf if there is none"""
+    heights = numpy.full(shape, -math.inf)
+    rows, columns = shape
+    # the top of a solid is formed by the faces pointing up
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    nz = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    for (xa, ya, za), (xb, yb, zb), (xc, yc, zc) in triangles[nz > 1e-12].tolist():
+        c0 = max(int(math.ceil((min(xa, xb, xc) - x0) / resolution - 0.5)), 0)
+        c1 = min(int(math.floor((max(xa, xb, xc) - x0) / resolution - 0.5)), columns - 1)
+        r0 = max(int(math.ceil((min(ya, yb, yc) - y0) / resolution - 0.5)), 0)
+        r1 = min(int(math.floor((max(ya, yb, yc) - y0) / resolution - 0.5)), rows - 1)
+        if c1 < c0 or r1 < r0:
+            continue
+        x = (x0 + (numpy.arange(c0, c1 + 1) + 0.5) * resolution)[None, :] - xc
+        y = (y0 + (numpy.arange(r0, r1 + 1) + 0.5) * resolution)[:, None] - yc
+        det = (yb - yc) * (xa - xc) + (xc - xb) * (ya - yc)
+        l1 = ((yb - yc) * x + (xc - xb) * y) / det
+        l2 = ((yc - ya) * x + (xa - xc) * y) / det
+        l3 = 1 - l1 - l2
+        inside = (l1 >= -1e-9) & (l2 >= -1e-9) & (l3 >= -1e-9)
+        window = heights[r0 : r1 + 1, c0 : c1 + 1]
+        z = l1 * za + l2 * zb + l3 * zc
+        numpy.maximum(window, numpy.where(inside, z, -math.inf), out=window)
+    return heights
+
+
+def _linearize(arrays, tolerance):
+    """Return start, end and rapid of the moves in arrays with the arcs split into chords"""
+    start, end, center = arrays["start"], arrays["end"], arrays["center"]
+    arcs = arrays["kind"] != PathCycleTime.LINE
+    radius = numpy.linalg.norm(start[:, 0:2] - center, axis=1)
+    a0 = numpy.arctan2(start[:, 1] - center[:, 1], start[:, 0] - center[:, 0])
+    a1 = numpy.arctan2(end[:, 1] - center[:, 1], end[:, 0] - center[:, 0])
+    cw = arrays["kind"] == PathCycleTime.ARC_CW
+    sweep = numpy.where(cw, a0 - a1, a1 - a0) % (2 * math.pi)
+    sweep = numpy.where(sweep < 1e-9, 2 * math.pi, sweep)
+    sweep = numpy.where(cw, -sweep, sweep)
+
+    # chords deviating at most tolerance from the arcs
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        step = 2 * numpy.arccos(numpy.clip(1 - tolerance / radius, -1, 1))
+        count = numpy.ceil(numpy.abs(sweep) / step)
+    count = numpy.where(arcs & (radius > tolerance), numpy.nan_to_num(count), 1)
+    count = numpy.maximum(count, 1).astype(int)
+
+    index = numpy.repeat(numpy.arange(len(count)), count)
+    piece = numpy.arange(len(index)) - numpy.repeat(numpy.cumsum(count) - count, count)
+
+    def points(fraction):
+        s, e = start[index], end[index]
+        pts = s + (e - s) * fraction[:, None]
+        arc = arcs[index]
+        angle = a0[index] + sweep[index] * fraction
+        r = radius[index]
+        pts[arc, 0] = center[index, 0][arc] + r[arc] * numpy.cos(angle[arc])
+        pts[arc, 1] = center[index, 1][arc] + r[arc] * numpy.sin(angle[arc])
+        return pts
+
+    last = piece == count[index] - 1
+    p0 = points(piece / count[index])
+    p1 = points((piece + 1) / count[index])
+    p1[last] = end[index[last]]
+    return p0, p1, numpy.isinf(arrays["feed"][index])
+
+
+class Collision:
+    """Collision(kind, position, depth) ... a rapid move through material ("rapid") or
+    material above the cutting height of the tool ("shank"), position is the end of the
+    move and depth the height of the material above the tip."""
+
+    def __init__(self, kind, position, depth):
+        self.kind = kind
+        self.position = position
+        self.depth = depth
+
+    def __str__(self):
+        return "{} collision at ({:.3f}, {:.3f}, {:.3f}), {:.3f} deep".format(
+            self.kind, *self.position, self.depth
+        )
+
+
+class OpResult:
+    """OpResult(name) ... the result of simulating an operation. removedVolume is in mm^3,
+    gouges is the number of cells cut below the model, gougeDepth the deepest of them at
+    gougePosition. cached is True if the result is from a checkpoint."""
+
+    def __init__(self, name):
+        self.name = name
+        self.removedVolume = 0.0
+        self.gouges = 0
+        self.gougeDepth = 0.0
+        self.gougePosition = None
+        self.collisions = []
+        self.collisionCount = 0
+        self.seconds = 0.0
+        self.cached = False
+
+    def addCollision(self, collision):
+        self.collisionCount += 1
+        if len(self.collisions) < MaxCollisions:
+            self.collisions.append(collision)
+
+    def __str__(self):
+        text = "{}: {:.1f} mm^3 removed".format(self.name, self.removedVolume)
+        if self.gouges:
+            text += ", {} gouges up to {:.3f}".format(self.gouges, self.gougeDepth)
+        if self.collisionCount:
+            text += ", {} collisions".format(self.collisionCount)
+        return text
+
+
+class Checkpoint:
+    def __init__(self, key, heights, result):
+        self.key = key
+        self.heights = heights
+        self.result = result
+
+
+class Simulation:
+    """Simulation(stock, model=None, tolerance=None, start=None) ...
+    Incremental stock removal simulation of a sequence of operations. stock is the
+    HeightField of the initial stock, model the HeightField of the part on the same grid,
+    used to find gouges. Material cut deeper than tolerance below the model is a gouge,
+    tolerance defaults to a tenth of the resolution. Each operation starts at start,
+    which defaults to the origin at the top of the stock."""
+
+    def __init__(self, stock, model=None, tolerance=None, start=None):
+        self.stock = stock
+        self.model = model
+        self.tolerance = stock.resolution / 10 if tolerance is None else tolerance
+        if start is None:
+            start = (0.0, 0.0, float(stock.heights.max()))
+        self.start = start
+        self.checkpoints = []
+        self._key = _hash(stock.key(), model.key() if model else None, self.tolerance, start)
+
+    def heights(self, index=-1):
+        """heights(index=-1) ... the heights of the stock after the operation at index of
+        the last simulate() call"""
+        if not self.checkpoints:
+            return self.stock.heights
+        return self.checkpoints[index].heights
+
+    def simulate(self, operations):
+        """simulate(operations) ... simulate operations, a list of (name, path, profile),
+        and return a list of OpResult. Operations up to the first one which differs from
+        the last call are taken from their checkpoints."""
+        key = self._key
+        heights = self.stock.heights
+        results = []
+        for i, (name, path, profile) in enumerate(operations):
+            key = _hash(key, profile.key(), pathKey(path))
+            if i < len(self.checkpoints) and self.checkpoints[i].key == key:
+                checkpoint = self.checkpoints[i]
+                checkpoint.result.cached = True
+            else:
+                del self.checkpoints[i:]
+                start = time.perf_counter()
+                result = OpResult(name)
+                after = heights.copy()
+                self._simulate(path, profile, after, result)
+                self._checkGouges(heights, after, result)
+                result.seconds = time.perf_counter() - start
+                checkpoint = Checkpoint(key, after, result)
+                self.checkpoints.append(checkpoint)
+                Path.Log.debug(str(result))
+            heights = checkpoint.heights
+            results.append(checkpoint.result)
+        del self.checkpoints[len(operations) :]
+        return results
+
+    def _simulate(self, path, profile, heights, result):
+        segs = PathCycleTime.Segments()
+        segs.position = tuple(self.start)
+        # rapids are told apart from the feed moves by their infinite rate
+        segs.addPath(path, PathCycleTime.Rates(1.0, 1.0, math.inf, math.inf))
+        p0, p1, rapid = _linearize(segs.arrays(), self.stock.resolution / 4)
+
+        # heights only decrease, moves above the highest material cut nothing
+        active = numpy.minimum(p0[:, 2], p1[:, 2]) < heights.max()
+        for start, end, isRapid in zip(
+            p0[active].tolist(), p1[active].tolist(), rapid[active].tolist()
+        ):
+            volume, depth = self._sweep(heights, start, end, profile)
+            if volume <= 0:
+                continue
+            result.removedVolume += volume
+            if isRapid and depth > self.tolerance:
+                result.addCollision(Collision("rapid", tuple(end), depth))
+            elif depth > profile.cuttingHeight + self.tolerance:
+                result.addCollision(Collision("shank", tuple(end), depth))
+
+    def _sweep(self, heights, start, end, profile):
+        """Cut heights with profile moving from start to end, return the removed volume and
+        the height of the removed material above the tip"""
+        stock = self.stock
+        res = stock.resolution
+        rows, columns = heights.shape
+        radius = profile.radius
+        (x0, y0, z0), (x1, y1, z1) = start, end
+        c0 = max(int(math.ceil((min(x0, x1) - radius - stock.x0) / res - 0.5)), 0)
+        c1 = min(int(math.floor((max(x0, x1) + radius - stock.x0) / res - 0.5)), columns - 1)
+        r0 = max(int(math.ceil((min(y0, y1) - radius - stock.y0) / res - 0.5)), 0)
+        r1 = min(int(math.floor((max(y0, y1) + radius - stock.y0) / res - 0.5)), rows - 1)
+        if c1 < c0 or r1 < r0:
+            return 0.0, 0.0
+        window = heights[r0 : r1 + 1, c0 : c1 + 1]
+        tip = min(z0, z1)
+        if tip >= window.max():
+            return 0.0, 0.0
+
+        x = (stock.x0 + (numpy.arange(c0, c1 + 1) + 0.5) * res)[None, :] - x0
+        y = (stock.y0 + (numpy.arange(r0, r1 + 1) + 0.5) * res)[:, None] - y0
+        dx, dy, dz = x1 - x0, y1 - y0, z1 - z0
+        lengthXY = math.hypot(dx, dy)
+        if lengthXY == 0:
+            cut = tip + profile.heightAt(numpy.hypot(x, y))
+        elif dz == 0:
+            # the lowest point of the tool over a cell is where the axis passes closest
+            t = numpy.clip((x * dx + y * dy) / (lengthXY * lengthXY), 0, 1)
+            cut = tip + profile.heightAt(numpy.hypot(x - t * dx, y - t * dy))
+        else:
+            # sloped moves are sampled, in chunks to limit the memory used
+            samples = numpy.linspace(0, 1, int(math.ceil(lengthXY / (res * SampleStep))) + 1)
+            chunk = max(1, 4000000 // window.size)
+            cut = numpy.full(window.shape, math.inf)
+            for i in range(0, len(samples), chunk):
+                t = samples[i : i + chunk, None, None]
+                distance = numpy.hypot(x - t * dx, y - t * dy)
+                numpy.minimum(cut, (z0 + t * dz + profile.heightAt(distance)).min(axis=0), out=cut)
+
+        new = numpy.maximum(numpy.minimum(window, cut), stock.zMin)
+        removed = window - new
+        cells = removed > 0
+        if not numpy.any(cells):
+            return 0.0, 0.0
+        depth = float(window[cells].max()) - tip
+        window[...] = new
+        return float(removed.sum()) * res * res, depth
+
+    def _checkGouges(self, before, after, result):
+        if self.model is None:
+            return
+        # only cells cut by the operation are its gouges
+        depth = numpy.where(after < before, self.model.heights - after, 0.0)
+        gouges = depth > self.tolerance
+        result.gouges = int(numpy.count_nonzero(gouges))
+        if result.gouges:
+            row, column = numpy.unravel_index(int(numpy.argmax(depth)), depth.shape)
+            result.gougeDepth = float(depth[row, column])
+            x, y = self.stock.cellCenter(row, column)
+            result.gougePosition = (x, y, float(after[row, column]))
+
+
+def getJobSimulation(job, resolution=None, tolerance=None):
+    """getJobSimulation(job, resolution=None, tolerance=None) ... return the Simulation of
+    job. It lives on the job proxy and is reused as long as the stock, the model and the
+    parameters are unchanged. resolution defaults to 1/500 of the stock's size."""
+    import Path.Op.SurfaceCache as PathSurfaceCache
+
+    stockShape = job.Stock.Shape
+    bb = stockShape.BoundBox
+    if not resolution:
+        resolution = max(bb.XLength, bb.YLength) / 500
+    models = [obj.Shape for obj in job.Model.Group if hasattr(obj, "Shape")]
+    key = _hash(
+        PathSurfaceCache.shapeHash(stockShape),
+        [PathSurfaceCache.shapeHash(shape) for shape in models],
+        resolution,
+        tolerance,
+    )
+    sim = getattr(job.Proxy, "simulation", None)
+    if sim is not None and getattr(job.Proxy, "simulationKey", None) == key:
+        return sim
+
+    stock = HeightField.fromShape(stockShape, resolution)
+    # there is no material where the stock has no top
+    stock.heights = numpy.maximum(stock.heights, stock.zMin)
+    model = None
+    for shape in models:
+        field = HeightField.fromShape(shape, resolution, stock)
+        if model is None:
+            model = field
+        else:
+            numpy.maximum(model.heights, field.heights, out=model.heights)
+    sim = Simulation(stock, model, tolerance, (0.0, 0.0, bb.ZMax))
+    job.Proxy.simulation = sim
+    job.Proxy.simulationKey = key
+    return sim
+
+
+def simulateJob(job, resolution=None, tolerance=None):
+    """simulateJob(job, resolution=None, tolerance=None) ... simulate the active operations
+    of job and return a list of OpResult. Operations without a tool are skipped. Only the
+    operations from the first one changed since the last call are simulated."""
+    import Path.Dressup.Utils as PathDressup
+    import PathScripts.PathUtils as PathUtils
+
+    sim = getJobSimulation(job, resolution, tolerance)
+    profiles = getattr(job.Proxy, "simulationProfiles", {})
+    operations = []
+    for op in job.Operations.Group:
+        if not getattr(op, "Active", True):
+            continue
+        tc = PathDressup.toolController(op)
+        tool = getattr(tc, "Tool", None)
+        if tool is None or PathToolBit.toolShape(tool).isNull():
+            Path.Log.warning("{}: no tool to simulate".format(op.Label))
+            continue
+        profileKey = (tool.Name, tool.Shape.hashCode())
+        if profileKey not in profiles:
+            profiles[profileKey] = ToolProfile.fromTool(tool)
+        operations.append((op.Name, PathUtils.getPathWithPlacement(op), profiles[profileKey]))
+    job.Proxy.simulationProfiles = profiles
+    return sim.simulate(operations)
@@ -34,12 +34,16 @@ import PathScripts.PathUtils as PathUtils
 import FreeCAD
 import time
 import json
+import hashlib
 import math
+import queue
+import threading
 import area
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
 if FreeCAD.GuiUp:
     from pivy import coin
+    from PySide import QtCore
     import FreeCADGui
 
 __doc__ = "Class and implementation of the Adaptive CAM operation."
@@ -512,28 +516,205 @@ def GenerateGCode(op, obj, adaptiveResults, helixDiameter):
         op.commandlist.append(Path.Command("G0", {"Z": z}))
 
 
+def _regionKey(rdict, stockPaths, params):
+    # everything the 2D adaptive toolpath of a region depends on
+    data = [int(rdict["opType"]), rdict["path2d"], stockPaths[rdict["startdepth"]], params]
+    return hashlib.sha1(json.dumps(data).encode("utf-8")).hexdigest()
+
+
+def _computeRegion(stockPaths, path2d, opType, params, progressFn):
+    """_computeRegion(stockPaths, path2d, opType, params, progressFn) ... return the
+    adaptive toolpaths of a region as json serializable dicts. It doesn't access the
+    document and is called in the worker thread of background processing."""
+    # NOTE: Seem to need to create a new a2d for each area when we're
+    # stepping down depths like this. If we don't, it will keep history
+    # from the last region we did.
+    a2d = area.Adaptive2d()
+    a2d.stepOverFactor = 0.01 * params["stepover"]
+    a2d.toolDiameter = params["tool"]
+    a2d.helixRampDiameter = params["effectiveHelixDiameter"]
+    a2d.keepToolDownDistRatio = params["keepToolDownRatio"]
+    # NOTE: Z stock is handled in our stepdowns
+    a2d.stockToLeave = params["stockToLeave"]
+    a2d.tolerance = params["tolerance"]
+    a2d.forceInsideOut = params["forceInsideOut"]
+    a2d.finishingProfile = params["finishingProfile"]
+    a2d.opType = opType
+
+    return [
+        {
+            "HelixCenterPoint": result.HelixCenterPoint,
+            "StartPoint": result.StartPoint,
+            "AdaptivePaths": result.AdaptivePaths,
+            "ReturnMotionType": result.ReturnMotionType,
+        }
+        for result in a2d.Execute(stockPaths, path2d, progressFn)
+    ]
+
+
+def _drawProgress(tpaths):
+    for path in tpaths:  # path[0] contains the MotionType, #path[1] contains list of points
+        if path[0] == area.AdaptiveMotionType.Cutting:
+            sceneDrawPath(path[1], (0, 0, 1))
+        else:
+            sceneDrawPath(path[1], (1, 0, 1))
+
+
+def _runInBackground():
+    return FreeCAD.GuiUp and Path.Preferences.adaptiveBackground()
+
+
+class RegionWorker:
+    """RegionWorker(regions) ... computes the toolpaths of regions in a worker thread.
+    regions is a list of (key, stockPaths, path2d, opType, params), the finished ones are
+    collected in results. The paths reported by the adaptive engine are queued in
+    previews for drawing them in the GUI thread."""
+
+    def __init__(self, regions):
+        self.regions = regions
+        self.keys = set(r[0] for r in regions)
+        self.results = {}
+        self.previews = queue.Queue()
+        self.cancelled = threading.Event()
+        self.error = None
+        self.startTime = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.startTime = time.time()
+        self.thread.start()
+
+    def isRunning(self):
+        return self.thread.is_alive()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def _progress(self, tpaths):
+        self.previews.put(tpaths)
+        return self.cancelled.is_set()
+
+    def _run(self):
+        try:
+            for key, stockPaths, path2d, opType, params in self.regions:
+                toolpaths = _computeRegion(stockPaths, path2d, opType, params, self._progress)
+                if self.cancelled.is_set():
+                    # the toolpaths of a cancelled region are incomplete
+                    break
+                self.results[key] = toolpaths
+        except Exception as e:
+            self.error = e
+
+
+def _startRegionWorker(op, obj, regions):
+    """Start computing the regions in the background, the operation is recomputed once
+    all toolpaths are available. A worker computing other regions is cancelled."""
+    global sceneGraph
+
+    worker = getattr(op, "regionWorker", None)
+    if worker is not None:
+        if worker.keys == set(r[0] for r in regions) and not worker.cancelled.is_set():
+            Path.Log.info("*** Adaptive toolpath processing continues in the background.\n")
+            return
+        worker.cancel()
+
+    sceneGraph = FreeCADGui.ActiveDocument.ActiveView.getSceneGraph()
+    worker = RegionWorker(regions)
+    op.regionWorker = worker
+    timer = QtCore.QTimer()
+    timer.setInterval(100)
+    timer.timeout.connect(lambda: _pollRegionWorker(op, obj, worker, timer))
+    worker.timer = timer
+    worker.start()
+    timer.start()
+    Path.Log.info("*** Adaptive toolpath processing started in the background...\n")
+
+
+def _pollRegionWorker(op, obj, worker, timer):
+    try:
+        if obj.StopProcessing:
+            worker.cancel()
+    except Exception:
+        # the operation was deleted
+        worker.cancel()
+        obj = None
+
+    while True:
+        try:
+            _drawProgress(worker.previews.get_nowait())
+        except queue.Empty:
+            break
+    if worker.isRunning():
+        return
+
+    timer.stop()
+    sceneClean()
+    if getattr(op, "regionWorker", None) is worker:
+        op.regionWorker = None
+    _regionCache(op).update(worker.results)
+    elapsed = time.time() - worker.startTime
+    if worker.error is not None:
+        Path.Log.error("Adaptive toolpath processing failed: {}".format(worker.error))
+    elif worker.cancelled.is_set():
+        Path.Log.info("*** Processing cancelled (after: %f sec).\n\n" % elapsed)
+    elif obj is not None:
+        Path.Log.info("*** Toolpaths computed in the background: %f sec\n" % elapsed)
+        # generate the gcode from the cached toolpaths
+        obj.touch()
+        obj.Document.recompute()
+
+
+def _regionCache(op):
+    # the cache lives on the proxy only, it is not saved with the document
+    if getattr(op, "regionCache", None) is None:
+        op.regionCache = {}
+    return op.regionCache
+
+
+def _previousCommands(obj):
+    # the commands of the current path, without the final rapid to clearance height
+    # which is added again by the base operation
+    commands = obj.Path.Commands
+    if commands and commands[-1].Name == "G0" and list(commands[-1].Parameters) == ["Z"]:
+        commands = commands[:-1]
+    return commands
+
+
 def Execute(op, obj):
     global sceneGraph
     global topZ
 
+    # a stop requested while computing in the background cancels the worker
+    worker = getattr(op, "regionWorker", None)
+    stopped = worker is not None and obj.StopProcessing
+    if stopped:
+        worker.cancel()
+
     if FreeCAD.GuiUp:
         sceneGraph = FreeCADGui.ActiveDocument.ActiveView.getSceneGraph()
 
-    Path.Log.info("*** Adaptive toolpath processing started...\n")
+    hidden = False
 
-    # hide old toolpaths during recalculation
-    obj.Path = Path.Path("(Calculating...)")
+    def hideOldPaths():
+        nonlocal hidden, job, oldObjVisibility, oldJobVisibility
+        Path.Log.info("*** Adaptive toolpath processing started...\n")
 
-    if FreeCAD.GuiUp:
-        # store old visibility state
-        job = op.getJob(obj)
-        oldObjVisibility = obj.ViewObject.Visibility
-        oldJobVisibility = job.ViewObject.Visibility
+        # hide old toolpaths during recalculation
+        obj.Path = Path.Path("(Calculating...)")
+
+        if FreeCAD.GuiUp:
+            # store old visibility state
+            job = op.getJob(obj)
+            oldObjVisibility = obj.ViewObject.Visibility
+            oldJobVisibility = job.ViewObject.Visibility
+
+            obj.ViewObject.Visibility = False
+            job.ViewObject.Visibility = False
+            hidden = True
 
-        obj.ViewObject.Visibility = False
-        job.ViewObject.Visibility = False
+            FreeCADGui.updateGui()
 
-        FreeCADGui.updateGui()
+    job = oldObjVisibility = oldJobVisibility = None
 
     try:
         helixDiameter = obj.HelixDiameterLimit.Value
@@ -649,15 +830,7 @@ def Execute(op, obj):
         # progress callback fn, if return true it will stop processing
         def progressFn(tpaths):
             if FreeCAD.GuiUp:
-                for (
-                    path
-                ) in tpaths:  # path[0] contains the MotionType, #path[1] contains list of points
-                    if path[0] == area.AdaptiveMotionType.Cutting:
-                        sceneDrawPath(path[1], (0, 0, 1))
-
-                    else:
-                        sceneDrawPath(path[1], (1, 0, 1))
-
+                _drawProgress(tpaths)
                 FreeCADGui.updateGui()
 
             return obj.StopProcessing
@@ -665,36 +838,47 @@ def Execute(op, obj):
         start = time.time()
 
         if inputStateChanged or adaptiveResults is None:
-            # NOTE: Seem to need to create a new a2d for each area when we're
-            # stepping down depths like this. If we don't, it will keep history
-            # from the last region we did.
+            # The 2D toolpaths of the regions are cached, changing only the
+            # step down or the order of the cuts reuses them
+            regionParams = {
+                "tool": op.tool.Diameter.Value,
+                "tolerance": obj.Tolerance,
+                "stepover": obj.StepOver,
+                "effectiveHelixDiameter": helixDiameter,
+                "forceInsideOut": obj.ForceInsideOut,
+                "finishingProfile": obj.FinishingProfile,
+                "keepToolDownRatio": keepToolDownRatio,
+                "stockToLeave": obj.StockToLeave.Value,
+            }
+            cache = _regionCache(op)
+            missing = []
+            for rdict in regionOps:
+                rdict["key"] = _regionKey(rdict, stockPaths, regionParams)
+                if rdict["key"] not in cache and rdict["key"] not in [r[0] for r in missing]:
+                    stock = stockPaths[rdict["startdepth"]]
+                    missing.append(
+                        (rdict["key"], stock, rdict["path2d"], rdict["opType"], regionParams)
+                    )
 
-            # TODO: QThread/QRunnable trigger Python's global interpreter lock
-            # (GIL). To calculate toolpaths in parallel, making a C++ shim that
-            # takes in the array of regions/stock paths and parallelizes in
-            # C++-land is probably the way to do it.
+            if missing and _runInBackground():
+                # keep the current path until the toolpaths are computed
+                if not stopped:
+                    _startRegionWorker(op, obj, missing)
+                op.commandlist = _previousCommands(obj)
+                return
 
+            if missing:
+                hideOldPaths()
             # Create a toolpath for each region to avoid re-calculating for
             # identical stepdowns
+            for key, stock, path2d, opType, params in missing:
+                cache[key] = _computeRegion(stock, path2d, opType, params, progressFn)
+                if obj.StopProcessing:
+                    # the toolpaths of a cancelled region are incomplete
+                    del cache[key]
+                    break
             for rdict in regionOps:
-                path2d = rdict["path2d"]
-                opType = rdict["opType"]
-
-                a2d = area.Adaptive2d()
-                a2d.stepOverFactor = 0.01 * obj.StepOver
-                a2d.toolDiameter = op.tool.Diameter.Value
-                a2d.helixRampDiameter = helixDiameter
-                a2d.keepToolDownDistRatio = keepToolDownRatio
-                # NOTE: Z stock is handled in our stepdowns
-                a2d.stockToLeave = obj.StockToLeave.Value
-                a2d.tolerance = obj.Tolerance
-                a2d.forceInsideOut = obj.ForceInsideOut
-                a2d.finishingProfile = obj.FinishingProfile
-                a2d.opType = opType
-
-                rdict["toolpaths"] = a2d.Execute(
-                    stockPaths[rdict["startdepth"]], path2d, progressFn
-                )
+                rdict["toolpaths"] = cache.get(rdict["key"], [])
 
             # Sort regions to cut by either depth or area.
             # TODO: Bonus points for ordering to minimize rapids
@@ -735,16 +919,12 @@ def Execute(op, obj):
             for depths, region in cutlist:
                 for result in region["toolpaths"]:
                     adaptiveResults.append(
-                        {
-                            "HelixCenterPoint": result.HelixCenterPoint,
-                            "StartPoint": result.StartPoint,
-                            "AdaptivePaths": result.AdaptivePaths,
-                            "ReturnMotionType": result.ReturnMotionType,
-                            "TopDepth": depths[0] + stepdown,
-                            "BottomDepth": depths[-1],
-                        }
+                        dict(result, TopDepth=depths[0] + stepdown, BottomDepth=depths[-1])
                     )
 
+            # only keep the toolpaths of the current regions
+            op.regionCache = {r["key"]: cache[r["key"]] for r in regionOps if r["key"] in cache}
+
         # GENERATE
         GenerateGCode(op, obj, adaptiveResults, helixDiameter)
 
@@ -757,7 +937,7 @@ def Execute(op, obj):
             Path.Log.info("*** Processing cancelled (after: %f sec).\n\n" % (time.time() - start))
 
     finally:
-        if FreeCAD.GuiUp:
+        if hidden:
             obj.ViewObject.Visibility = oldObjVisibility
             job.ViewObject.Visibility = oldJobVisibility
             sceneClean()
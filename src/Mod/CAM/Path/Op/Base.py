@@ -24,10 +24,10 @@ import FreeCAD
 from PathScripts.PathUtils import waiting_effects
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import Path
+import Path.Base.CycleTime as PathCycleTime
 import Path.Base.Util as PathUtil
 import PathScripts.PathUtils as PathUtils
 import math
-import time
 
 
 # lazily loaded modules
@@ -866,12 +866,11 @@ def getCycleTimeEstimate(obj):
         )
 
     # Get the cycle time in seconds
-    seconds = obj.Path.getCycleTime(hFeedrate, vFeedrate, hRapidrate, vRapidrate)
+    rates = PathCycleTime.Rates(hFeedrate, vFeedrate, hRapidrate, vRapidrate)
+    seconds = PathCycleTime.estimatePath(obj.Path, rates)
 
-    if math.isnan(seconds):
+    if math.isnan(seconds) or math.isinf(seconds):
         return translate("CAM", "Cycletime Error")
 
     # Convert the cycle time to a HH:MM:SS format
-    cycleTime = time.strftime("%H:%M:%S", time.gmtime(seconds))
-
-    return cycleTime
+    return PathCycleTime.formatTime(seconds)
@@ -47,6 +47,7 @@ except ImportError:
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import Path
 import Path.Op.Base as PathOp
+import Path.Op.SurfaceCache as PathSurfaceCache
 import Path.Op.SurfaceSupport as PathSurfaceSupport
 import PathScripts.PathUtils as PathUtils
 import math
@@ -71,6 +72,9 @@ else:
 class ObjectSurface(PathOp.ObjectOp):
     """Proxy object for Surfacing operation."""
 
+    # callable returning True to cancel the drop-cutter scans, see DropCutterScanner
+    scanCancelHook = None
+
     def opFeatures(self, obj):
         """opFeatures(obj) ... return all standard features"""
         return (
@@ -768,6 +772,7 @@ class ObjectSurface(PathOp.ObjectOp):
             Path.Log.error(translate("PathSurface", "No job"))
             return
         self.stockZMin = JOB.Stock.Shape.BoundBox.ZMin
+        self.surfaceCache = PathSurfaceCache.getJobCache(JOB)
 
         # set cut mode; reverse as needed
         if obj.CutMode == "Climb":
@@ -902,30 +907,36 @@ class ObjectSurface(PathOp.ObjectOp):
             self.modelSTLs = PSF.modelSTLs
             self.profileShapes = PSF.profileShapes
 
-            for idx, model in enumerate(JOB.Model.Group):
-                Path.Log.debug(idx)
-                # Create OCL.stl model objects
-                PathSurfaceSupport._prepareModelSTLs(self, JOB, obj, idx, ocl)
-
-                if FACES[idx]:
-                    Path.Log.debug("Working on Model.Group[{}]: {}".format(idx, model.Label))
-                    if idx > 0:
-                        # Raise to clearance between models
-                        CMDS.append(Path.Command("N (Transition to base: {}.)".format(model.Label)))
-                        CMDS.append(
-                            Path.Command(
-                                "G0",
-                                {"Z": obj.ClearanceHeight.Value, "F": self.vertRapid},
+            try:
+                for idx, model in enumerate(JOB.Model.Group):
+                    Path.Log.debug(idx)
+                    # Create OCL.stl model objects
+                    PathSurfaceSupport._prepareModelSTLs(self, JOB, obj, idx, ocl)
+
+                    if FACES[idx]:
+                        Path.Log.debug("Working on Model.Group[{}]: {}".format(idx, model.Label))
+                        if idx > 0:
+                            # Raise to clearance between models
+                            CMDS.append(
+                                Path.Command("N (Transition to base: {}.)".format(model.Label))
+                            )
+                            CMDS.append(
+                                Path.Command(
+                                    "G0",
+                                    {"Z": obj.ClearanceHeight.Value, "F": self.vertRapid},
+                                )
                             )
+                        # make stock-model-voidShapes STL model for avoidance detection on transitions
+                        PathSurfaceSupport._makeSafeSTL(
+                            self, JOB, obj, idx, FACES[idx], VOIDS[idx], ocl
                         )
-                    # make stock-model-voidShapes STL model for avoidance detection on transitions
-                    PathSurfaceSupport._makeSafeSTL(
-                        self, JOB, obj, idx, FACES[idx], VOIDS[idx], ocl
-                    )
-                    # Process model/faces - OCL objects must be ready
-                    CMDS.extend(self._processCutAreas(JOB, obj, idx, FACES[idx], VOIDS[idx]))
-                else:
-                    Path.Log.debug("No data for model base: {}".format(model.Label))
+                        # Process model/faces - OCL objects must be ready
+                        CMDS.extend(self._processCutAreas(JOB, obj, idx, FACES[idx], VOIDS[idx]))
+                    else:
+                        Path.Log.debug("No data for model base: {}".format(model.Label))
+            except PathSurfaceSupport.ScanCancelled:
+                Path.Log.warning(translate("PathSurface", "Drop-cutter scan canceled."))
+                CMDS = []
 
             # Save gcode produced
             self.commandlist.extend(CMDS)
@@ -1100,6 +1111,15 @@ class ObjectSurface(PathOp.ObjectOp):
             obj.SampleInterval.Value,
             self.cutter,
         )
+        scanner = PathSurfaceSupport.DropCutterScanner(
+            ocl,
+            self.modelSTLs[mdlIdx],
+            self.cutter,
+            depthparams[lenDP - 1],
+            obj.SampleInterval.Value,
+            cancelHook=self.scanCancelHook,
+            cache=self.surfaceCache,
+        )
 
         profScan = []
         if obj.ProfileEdges != "None":
@@ -1115,7 +1135,7 @@ class ObjectSurface(PathOp.ObjectOp):
                 msg = translate("PathSurface", "No profile path geometry returned.")
                 Path.Log.error(msg)
                 return []
-            profScan = [self._planarPerformOclScan(obj, pdc, pathOffsetGeom, True)]
+            profScan = [self._planarPerformOclScan(obj, scanner, pathOffsetGeom, True)]
 
         geoScan = []
         if obj.ProfileEdges != "Only":
@@ -1136,9 +1156,9 @@ class ObjectSurface(PathOp.ObjectOp):
                     msg = translate("PathSurface", "No clearing path geometry returned.")
                     Path.Log.error(msg)
                     return []
-                geoScan = [self._planarPerformOclScan(obj, pdc, useGeom, True)]
+                geoScan = [self._planarPerformOclScan(obj, scanner, useGeom, True)]
             else:
-                geoScan = self._planarPerformOclScan(obj, pdc, pathGeom, False)
+                geoScan = self._planarPerformOclScan(obj, scanner, pathGeom, False)
 
         if obj.ProfileEdges == "Only":  # ['None', 'Only', 'First', 'Last']
             SCANDATA.extend(profScan)
@@ -1213,15 +1233,18 @@ class ObjectSurface(PathOp.ObjectOp):
 
         return offsetLists
 
-    def _planarPerformOclScan(self, obj, pdc, pathGeom, offsetPoints=False):
-        """_planarPerformOclScan(obj, pdc, pathGeom, offsetPoints=False)...
+    def _planarPerformOclScan(self, obj, scanner, pathGeom, offsetPoints=False):
+        """_planarPerformOclScan(obj, scanner, pathGeom, offsetPoints=False)...
         Switching function for calling the appropriate path-geometry to OCL points conversion function
-        for the various cut patterns."""
+        for the various cut patterns. The scan lines/arcs of all step-overs are collected first and
+        scanned at once by the DropCutterScanner, then the SCANS structure is assembled in order."""
         Path.Log.debug("_planarPerformOclScan()")
         SCANS = []
 
         if offsetPoints or obj.CutPattern == "Offset":
             PNTSET = PathSurfaceSupport.pathGeomToOffsetPointSet(obj, pathGeom)
+            # D format is ((p1, p2), (p3, p4))
+            scans = iter(scanner.scanLines([I for D in PNTSET for I in D if I != "BRK"]))
             for D in PNTSET:
                 stpOvr = []
                 ofst = []
@@ -1231,9 +1254,7 @@ class ObjectSurface(PathOp.ObjectOp):
                         stpOvr.append(I)
                         ofst = []
                     else:
-                        # D format is ((p1, p2), (p3, p4))
-                        (A, B) = I
-                        ofst.extend(self._planarDropCutScan(pdc, A, B))
+                        ofst.extend(next(scans))
                 if len(ofst) > 0:
                     stpOvr.append(ofst)
                 SCANS.extend(stpOvr)
@@ -1248,14 +1269,14 @@ class ObjectSurface(PathOp.ObjectOp):
             elif obj.CutPattern == "Spiral":
                 PNTSET = PathSurfaceSupport.pathGeomToSpiralPointSet(obj, pathGeom)
 
+            # LN format is ((p1, p2), (p3, p4))
+            scans = iter(scanner.scanLines([LN for STEP in PNTSET for LN in STEP if LN != "BRK"]))
             for STEP in PNTSET:
                 for LN in STEP:
                     if LN == "BRK":
                         stpOvr.append(LN)
                     else:
-                        # D format is ((p1, p2), (p3, p4))
-                        (A, B) = LN
-                        stpOvr.append(self._planarDropCutScan(pdc, A, B))
+                        stpOvr.append(next(scans))
                 SCANS.append(stpOvr)
                 stpOvr = []
         elif obj.CutPattern in ["Circular", "CircularZigZag"]:
@@ -1264,30 +1285,28 @@ class ObjectSurface(PathOp.ObjectOp):
             # PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(obj, pathGeom, self.CutClimb, self.toolDiam, self.closedGap, self.gaps, self.tmpCOM)
             PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(self, obj, pathGeom)
 
+            # dirFlg 1 is a cMode True arc
+            ARCS = [
+                (Arc, dirFlg == 1)
+                for (aTyp, dirFlg, arcs) in PNTSET
+                for Arc in arcs
+                if Arc != "BRK"
+            ]
+            scans = iter(scanner.scanArcs(ARCS))
             for so in range(0, len(PNTSET)):
                 stpOvr = []
-                erFlg = False
                 (aTyp, dirFlg, ARCS) = PNTSET[so]
 
-                if dirFlg == 1:  # 1
-                    cMode = True
-                else:
-                    cMode = False
-
                 for a in range(0, len(ARCS)):
                     Arc = ARCS[a]
                     if Arc == "BRK":
                         stpOvr.append("BRK")
                     else:
-                        scan = self._planarCircularDropCutScan(pdc, Arc, cMode)
-                        if scan is False:
-                            erFlg = True
-                        else:
-                            if aTyp == "L":
-                                scan.append(FreeCAD.Vector(scan[0].x, scan[0].y, scan[0].z))
-                            stpOvr.append(scan)
-                if erFlg is False:
-                    SCANS.append(stpOvr)
+                        scan = next(scans)
+                        if aTyp == "L":
+                            scan.append(FreeCAD.Vector(scan[0].x, scan[0].y, scan[0].z))
+                        stpOvr.append(scan)
+                SCANS.append(stpOvr)
         # Eif
 
         return SCANS
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+__title__ = "CAM Surface Cache Module"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Cache of OCL STL surfaces and drop-cutter scans for 3D Surface and Waterline."
+
+import FreeCAD
+import Path
+import collections
+import hashlib
+import os
+import threading
+
+# lazily loaded modules
+from lazy_loader.lazy_loader import LazyLoader
+
+numpy = LazyLoader("numpy", globals(), "numpy")
+
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+# estimated memory use of the cached data, in bytes
+TRIANGLE_SIZE = 200
+POINT_SIZE = 80
+
+
+class SurfaceCache:
+    """SurfaceCache(maxSize, directory=None) ...
+    LRU cache of the OCL STL surfaces and drop-cutter scans of a Job.
+    Entries are looked up by keys made from a hash of the model shape, the tessellation
+    tolerance, the cutter and the scan parameters, see stlKey() and scanKey(). The least
+    recently used entries are dropped once the estimated size exceeds maxSize bytes.
+    If directory is given, tessellations and scans are stored there as well and are
+    reused across sessions."""
+
+    def __init__(self, maxSize, directory=None):
+        self.maxSize = maxSize
+        self.directory = directory
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._stlKeys = {}
+        self._lock = threading.RLock()
+
+    def clear(self):
+        """clear() ... drop all entries held in memory"""
+        with self._lock:
+            self._entries.clear()
+            self._stlKeys.clear()
+            self.size = 0
+
+    def getSTL(self, key, ocl, facets):
+        """getSTL(key, ocl, facets) ... return the ocl.STLSurf for key.
+        facets is called without arguments to tessellate the model if the STL is neither
+        in memory nor on disk, it returns an iterable of triangles ((x, y, z) * 3)."""
+        stl = self._get(key)
+        if stl is None:
+            triangles = self._load(key, "triangles")
+            if triangles is None:
+                triangles = numpy.array(list(facets()), dtype=float).reshape((-1, 3, 3))
+                self._save(key, triangles=triangles)
+            stl = _makeSTLSurf(ocl, triangles)
+            if self._put(key, stl, len(triangles) * TRIANGLE_SIZE):
+                with self._lock:
+                    self._stlKeys[id(stl)] = key
+        return stl
+
+    def stlKeyOf(self, stl):
+        """stlKeyOf(stl) ... return the key of a cached STL, None if stl is not cached"""
+        with self._lock:
+            return self._stlKeys.get(id(stl))
+
+    def getScans(self, key):
+        """getScans(key) ... return the scans stored for key or None.
+        The scans are lists of FreeCAD.Vector, one for each scan line or arc."""
+        scans = self._get(key)
+        if scans is None:
+            data = self._load(key, "points", "counts")
+            if data is None:
+                return None
+            scans = _splitPoints(*data)
+            self._put(key, scans, len(data[0]) * POINT_SIZE)
+        # the callers modify the returned lists
+        return [[FreeCAD.Vector(p) for p in scan] for scan in scans]
+
+    def putScans(self, key, scans):
+        """putScans(key, scans) ... store the scans of key"""
+        scans = [[FreeCAD.Vector(p) for p in scan] for scan in scans]
+        count = sum(len(scan) for scan in scans)
+        self._put(key, scans, count * POINT_SIZE)
+        points = numpy.array([(p.x, p.y, p.z) for scan in scans for p in scan], dtype=float)
+        self._save(
+            key,
+            points=points.reshape((-1, 3)),
+            counts=numpy.array([len(scan) for scan in scans], dtype=numpy.int64),
+        )
+
+    def _get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value[0]
+
+    def _put(self, key, value, size):
+        if size > self.maxSize:
+            return False
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._stlKeys.pop(id(old[0]), None)
+                self.size -= old[1]
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.maxSize:
+                oldKey, (oldValue, oldSize) = self._entries.popitem(last=False)
+                self._stlKeys.pop(id(oldValue), None)
+                self.size -= oldSize
+                Path.Log.debug("Dropped {} from the surface cache.".format(oldKey))
+        return True
+
+    def _fileName(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    def _load(self, key, *names):
+        if not self.directory:
+            return None
+        fileName = self._fileName(key)
+        try:
+            with numpy.load(fileName) as data:
+                arrays = [data[name] for name in names]
+            # mark as recently used for trimming the directory
+            os.utime(fileName)
+        except (OSError, KeyError, ValueError):
+            return None
+        Path.Log.debug("Loaded {} from the surface cache directory.".format(key))
+        return arrays[0] if len(arrays) == 1 else arrays
+
+    def _save(self, key, **arrays):
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # write to a temporary file first, other sessions may read the directory
+            tmpName = "{}.{}.{}.tmp.npz".format(key, os.getpid(), threading.get_ident())
+            tmpName = os.path.join(self.directory, tmpName)
+            numpy.savez_compressed(tmpName, **arrays)
+            os.replace(tmpName, self._fileName(key))
+            self._trimDirectory()
+        except OSError as e:
+            Path.Log.warning("Surface cache not saved: {}".format(e))
+
+    def _trimDirectory(self):
+        # the directory is limited to the same size as the memory cache, the least
+        # recently used files are removed first
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz") and ".tmp." not in entry.name:
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(f[1] for f in files)
+        for mtime, size, fileName in sorted(files):
+            if total <= self.maxSize:
+                break
+            try:
+                os.remove(fileName)
+            except OSError:
+                continue
+            total -= size
+
+
+def _makeSTLSurf(ocl, triangles):
+    stl = ocl.STLSurf()
+    for v1, v2, v3 in triangles.tolist():
+        stl.addTriangle(
+            ocl.Triangle(
+                ocl.Point(v1[0], v1[1], v1[2]),
+                ocl.Point(v2[0], v2[1], v2[2]),
+                ocl.Point(v3[0], v3[1], v3[2]),
+            )
+        )
+    return stl
+
+
+def _splitPoints(points, counts):
+    scans = []
+    start = 0
+    for count in counts.tolist():
+        scans.append([FreeCAD.Vector(*p) for p in points[start : start + count].tolist()])
+        start += count
+    return scans
+
+
+def _hash(*items):
+    sha = hashlib.sha1()
+    for item in items:
+        sha.update(repr(item).encode("utf-8"))
+        sha.update(b"\0")
+    return sha.hexdigest()
+
+
+def shapeHash(model, model_type=None):
+    """shapeHash(model, model_type=None) ... return a hash of the geometry of model.
+    model is a document object or a shape, model_type "M" is a mesh object."""
+    sha = hashlib.sha1()
+    if model_type == "M":
+        for tri in model.Mesh.Facets.Points:
+            sha.update(repr(tri).encode("utf-8"))
+    else:
+        shape = model.Shape if hasattr(model, "Shape") else model
+        sha.update(shape.exportBrepToString().encode("utf-8"))
+    return sha.hexdigest()
+
+
+def stlKey(geomHash, linearDeflection):
+    """stlKey(geomHash, linearDeflection) ... return the key of the STL of a model"""
+    return "stl-" + _hash(geomHash, round(linearDeflection, 9))
+
+
+def scanKey(stlKey, cutter, minZ, sampling, kind, items):
+    """scanKey(stlKey, cutter, minZ, sampling, kind, items) ... return the key of a scan.
+    kind is "lines" or "arcs", items the scan lines or arcs as passed to the scanner."""
+    cutterKey = (type(cutter).__name__, str(cutter), cutter.getDiameter(), cutter.getLength())
+    return "scan-" + _hash(stlKey, cutterKey, round(minZ, 9), round(sampling, 9), kind, items)
+
+
+def getJobCache(job):
+    """getJobCache(job) ... return the SurfaceCache of job, None if caching is disabled.
+    The cache lives on the job proxy, it is not saved with the document."""
+    maxSize = Path.Preferences.surfaceCacheSize() * 1024 * 1024
+    if maxSize <= 0 or job is None or not hasattr(job, "Proxy"):
+        return None
+    directory = Path.Preferences.surfaceCacheDirectory() or None
+    cache = getattr(job.Proxy, "surfaceCache", None)
+    if cache is None:
+        cache = SurfaceCache(maxSize, directory)
+        job.Proxy.surfaceCache = cache
+    else:
+        cache.maxSize = maxSize
+        cache.directory = directory
+    return cache
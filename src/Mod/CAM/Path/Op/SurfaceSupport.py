@@ -29,9 +29,11 @@ __contributors__ = ""
 
 import FreeCAD
 import Path
+import Path.Op.SurfaceCache as PathSurfaceCache
 import Path.Op.Util as PathOpUtil
 import PathScripts.PathUtils as PathUtils
 import math
+import threading
 
 # lazily loaded modules
 from lazy_loader.lazy_loader import LazyLoader
@@ -1161,7 +1163,7 @@ def _prepareModelSTLs(self, JOB, obj, m, ocl):
     objects"""
     if self.modelSTLs[m] is True:
         model = JOB.Model.Group[m]
-        self.modelSTLs[m] = _makeSTL(model, obj, ocl, self.modelTypes[m])
+        self.modelSTLs[m] = _makeSTL(model, obj, ocl, self.modelTypes[m], self.surfaceCache)
 
 
 def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
@@ -1246,24 +1248,21 @@ def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
         T.purgeTouched()
         self.tempGroup.addObject(T)
 
-    self.safeSTLs[mdlIdx] = _makeSTL(fused, obj, ocl)
+    self.safeSTLs[mdlIdx] = _makeSTL(fused, obj, ocl, cache=self.surfaceCache)
 
 
-def _makeSTL(model, obj, ocl, model_type=None):
+def _makeSTL(model, obj, ocl, model_type=None, cache=None):
     """Convert a mesh or shape into an OCL STL, using the tessellation
     tolerance specified in obj.LinearDeflection.
+    If a SurfaceCache is given, the STL of an unchanged model is reused.
     Returns an ocl.STLSurf()."""
-    if model_type == "M":
-        facets = model.Mesh.Facets.Points
-    else:
-        if hasattr(model, "Shape"):
-            shape = model.Shape
-        else:
-            shape = model
-        vertices, facet_indices = shape.tessellate(obj.LinearDeflection.Value)
-        facets = ((vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in facet_indices)
+    if cache is not None:
+        key = PathSurfaceCache.stlKey(
+            PathSurfaceCache.shapeHash(model, model_type), obj.LinearDeflection.Value
+        )
+        return cache.getSTL(key, ocl, lambda: _getFacets(model, obj, model_type))
     stl = ocl.STLSurf()
-    for tri in facets:
+    for tri in _getFacets(model, obj, model_type):
         v1, v2, v3 = tri
         t = ocl.Triangle(
             ocl.Point(v1[0], v1[1], v1[2]),
@@ -1274,6 +1273,156 @@ def _makeSTL(model, obj, ocl, model_type=None):
     return stl
 
 
+def _getFacets(model, obj, model_type=None):
+    if model_type == "M":
+        return model.Mesh.Facets.Points
+    if hasattr(model, "Shape"):
+        shape = model.Shape
+    else:
+        shape = model
+    vertices, facet_indices = shape.tessellate(obj.LinearDeflection.Value)
+    return ((vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in facet_indices)
+
+
+class ScanCancelled(Exception):
+    """Raised by DropCutterScanner if its cancel hook asks to stop scanning."""
+
+
+class DropCutterScanner:
+    """DropCutterScanner(ocl, stl, cutter, minZ, sampling, cancelHook=None, cache=None) ...
+    Runs OCL drop-cutter scans of many scan lines or arcs against one STL.
+    The scan lines/arcs are partitioned into tiles of tileSize items, all lines of a tile
+    are sampled and dropped in a single OCL run with one PathDropCutter. The results are
+    returned in the order of the input, one list of FreeCAD.Vector points per line or arc,
+    thus the SCANS structures of the operations are rebuilt exactly as with single scans.
+    The tiles are scanned one after another in the calling thread, PathDropCutter.run()
+    holds the Python GIL so worker threads would not scan in parallel.
+    cancelHook is a callable without arguments, it is called between tiles and if it
+    returns True the scan is stopped with a ScanCancelled exception.
+    cache is the SurfaceCache the STL was taken from, the scans are stored in it and
+    reused as long as the model, the cutter and the scan parameters do not change."""
+
+    tileSize = 64
+
+    def __init__(self, ocl, stl, cutter, minZ, sampling, cancelHook=None, cache=None):
+        self.ocl = ocl
+        self.stl = stl
+        self.cutter = cutter
+        self.minZ = minZ
+        self.sampling = sampling
+        self.cancelHook = cancelHook
+        self.cache = cache
+        self._pdc = None
+
+    def scanLines(self, lines):
+        """scanLines(lines) ... lines is a list of ((x1, y1), (x2, y2)) scan lines.
+        Returns a list with the list of cutter location points of each line."""
+        return self._cachedScan("lines", lines, self._scanLineTile)
+
+    def scanArcs(self, arcs):
+        """scanArcs(arcs) ... arcs is a list of ((sp, ep, cp), cMode) scan arcs.
+        Returns a list with the list of cutter location points of each arc."""
+        return self._cachedScan("arcs", arcs, self._scanArcTile)
+
+    def _cachedScan(self, kind, items, scanTile):
+        key = None
+        stlKey = self.cache.stlKeyOf(self.stl) if self.cache is not None else None
+        if stlKey is not None:
+            key = PathSurfaceCache.scanKey(
+                stlKey, self.cutter, self.minZ, self.sampling, kind, items
+            )
+            scans = self.cache.getScans(key)
+            if scans is not None:
+                Path.Log.debug("Reusing cached drop-cutter scan of {} {}.".format(len(items), kind))
+                return scans
+        scans = self._scanTiles(items, scanTile)
+        if key is not None:
+            self.cache.putScans(key, scans)
+        return scans
+
+    def _scanTiles(self, items, scanTile):
+        scans = []
+        for i in range(0, len(items), self.tileSize):
+            self._checkCancel()
+            if i and FreeCAD.GuiUp and threading.current_thread() is threading.main_thread():
+                # keep the GUI responsive between the tiles
+                import FreeCADGui
+
+                FreeCADGui.updateGui()
+            scans.extend(scanTile(items[i : i + self.tileSize]))
+        return scans
+
+    def _checkCancel(self):
+        if self.cancelHook is not None and self.cancelHook():
+            Path.Log.info("OCL drop-cutter scan cancelled.")
+            raise ScanCancelled()
+
+    def _getPDC(self):
+        if self._pdc is None:
+            pdc = self.ocl.PathDropCutter()
+            pdc.setSTL(self.stl)
+            pdc.setCutter(self.cutter)
+            pdc.setZ(self.minZ)
+            pdc.setSampling(self.sampling)
+            self._pdc = pdc
+        return self._pdc
+
+    def _dropCut(self, spans):
+        ocl = self.ocl
+        pdc = self._getPDC()
+        path = ocl.Path()
+        for span in spans:
+            path.append(span)
+        pdc.setPath(path)
+        pdc.run()
+        return [FreeCAD.Vector(p.x, p.y, p.z) for p in pdc.getCLPoints()]
+
+    def _lineSpan(self, line):
+        (x1, y1), (x2, y2) = line
+        return self.ocl.Line(self.ocl.Point(x1, y1, 0), self.ocl.Point(x2, y2, 0))
+
+    def _scanLineTile(self, lines):
+        # PathDropCutter samples every span with int(length / sampling + 1) steps,
+        # the points are split back to the lines and verified by the line end points
+        points = self._dropCut([self._lineSpan(line) for line in lines])
+        scans = []
+        start = 0
+        for (x1, y1), (x2, y2) in lines:
+            count = int(math.hypot(x2 - x1, y2 - y1) / self.sampling + 1) + 1
+            scan = points[start : start + count]
+            start += count
+            if (
+                len(scan) != count
+                or not _isSamePointXY(scan[0], x1, y1)
+                or not _isSamePointXY(scan[-1], x2, y2)
+            ):
+                break
+            scans.append(scan)
+        else:
+            if start == len(points):
+                return scans
+        # not the sampling expected, scan the lines one by one
+        Path.Log.debug("Scanning tile of {} lines line by line.".format(len(lines)))
+        return [self._dropCut([self._lineSpan(line)]) for line in lines]
+
+    def _scanArcTile(self, arcs):
+        ocl = self.ocl
+        scans = []
+        for (sp, ep, cp), cMode in arcs:
+            arc = ocl.Arc(
+                ocl.Point(sp[0], sp[1], 0),
+                ocl.Point(ep[0], ep[1], 0),
+                ocl.Point(cp[0], cp[1], 0),
+                cMode,
+            )
+            scans.append(self._dropCut([arc]))
+        return scans
+
+
+def _isSamePointXY(point, x, y):
+    return abs(point.x - x) < 1.0e-6 and abs(point.y - y) < 1.0e-6
+
+
 # Functions to convert path geometry into line/arc segments for OCL input or directly to g-code
 def pathGeomToLinesPointSet(self, obj, compGeoShp):
     """pathGeomToLinesPointSet(self, obj, compGeoShp)...
@@ -44,6 +44,7 @@ except ImportError:
 
 import Path
 import Path.Op.Base as PathOp
+import Path.Op.SurfaceCache as PathSurfaceCache
 import Path.Op.SurfaceSupport as PathSurfaceSupport
 import PathScripts.PathUtils as PathUtils
 import math
@@ -68,6 +69,9 @@ else:
 class ObjectWaterline(PathOp.ObjectOp):
     """Proxy object for Surfacing operation."""
 
+    # callable returning True to cancel the drop-cutter scans, see DropCutterScanner
+    scanCancelHook = None
+
     def opFeatures(self, obj):
         """opFeatures(obj) ... return all standard features"""
         return (
@@ -756,6 +760,7 @@ class ObjectWaterline(PathOp.ObjectOp):
             Path.Log.error(translate("PathWaterline", "No JOB"))
             return
         self.stockZMin = JOB.Stock.Shape.BoundBox.ZMin
+        self.surfaceCache = PathSurfaceCache.getJobCache(JOB)
 
         # set cut mode; reverse as needed
         if obj.CutMode == "Climb":
@@ -906,30 +911,40 @@ class ObjectWaterline(PathOp.ObjectOp):
             self.modelSTLs = PSF.modelSTLs
             self.profileShapes = PSF.profileShapes
 
-            for m in range(0, len(JOB.Model.Group)):
-                # Create OCL.stl model objects
-                if obj.Algorithm == "OCL Dropcutter":
-                    PathSurfaceSupport._prepareModelSTLs(self, JOB, obj, m, ocl)
+            try:
+                for m in range(0, len(JOB.Model.Group)):
+                    # Create OCL.stl model objects
+                    if obj.Algorithm == "OCL Dropcutter":
+                        PathSurfaceSupport._prepareModelSTLs(self, JOB, obj, m, ocl)
 
-                Mdl = JOB.Model.Group[m]
-                if FACES[m] is False:
-                    Path.Log.error("No data for model base: {}".format(JOB.Model.Group[m].Label))
-                else:
-                    if m > 0:
-                        # Raise to clearance between models
-                        CMDS.append(Path.Command("N (Transition to base: {}.)".format(Mdl.Label)))
-                        CMDS.append(
-                            Path.Command(
-                                "G0",
-                                {"Z": obj.ClearanceHeight.Value, "F": self.vertRapid},
-                            )
+                    Mdl = JOB.Model.Group[m]
+                    if FACES[m] is False:
+                        Path.Log.error(
+                            "No data for model base: {}".format(JOB.Model.Group[m].Label)
                         )
-                        Path.Log.info("Working on Model.Group[{}]: {}".format(m, Mdl.Label))
-                    # make stock-model-voidShapes STL model for avoidance detection on transitions
-                    if obj.Algorithm == "OCL Dropcutter":
-                        PathSurfaceSupport._makeSafeSTL(self, JOB, obj, m, FACES[m], VOIDS[m], ocl)
-                    # Process model/faces - OCL objects must be ready
-                    CMDS.extend(self._processWaterlineAreas(JOB, obj, m, FACES[m], VOIDS[m]))
+                    else:
+                        if m > 0:
+                            # Raise to clearance between models
+                            CMDS.append(
+                                Path.Command("N (Transition to base: {}.)".format(Mdl.Label))
+                            )
+                            CMDS.append(
+                                Path.Command(
+                                    "G0",
+                                    {"Z": obj.ClearanceHeight.Value, "F": self.vertRapid},
+                                )
+                            )
+                            Path.Log.info("Working on Model.Group[{}]: {}".format(m, Mdl.Label))
+                        # make stock-model-voidShapes STL model for avoidance detection on transitions
+                        if obj.Algorithm == "OCL Dropcutter":
+                            PathSurfaceSupport._makeSafeSTL(
+                                self, JOB, obj, m, FACES[m], VOIDS[m], ocl
+                            )
+                        # Process model/faces - OCL objects must be ready
+                        CMDS.extend(self._processWaterlineAreas(JOB, obj, m, FACES[m], VOIDS[m]))
+            except PathSurfaceSupport.ScanCancelled:
+                Path.Log.warning(translate("PathWaterline", "Drop-cutter scan canceled."))
+                CMDS = []
 
             # Save gcode produced
             self.commandlist.extend(CMDS)
@@ -1270,25 +1285,24 @@ class ObjectWaterline(PathOp.ObjectOp):
     def _waterlineDropCutScan(self, stl, smplInt, xmin, xmax, ymin, fd, numScanLines):
         """_waterlineDropCutScan(stl, smplInt, xmin, xmax, ymin, fd, numScanLines) ...
         Perform OCL scan for waterline purpose."""
-        pdc = ocl.PathDropCutter()  # create a pdc
-        pdc.setSTL(stl)
-        pdc.setCutter(self.cutter)
-        pdc.setZ(fd)  # set minimumZ (final / target depth value)
-        pdc.setSampling(smplInt)
-
-        # Create line object as path
-        path = ocl.Path()  # create an empty path object
+        scanner = PathSurfaceSupport.DropCutterScanner(
+            ocl,
+            stl,
+            self.cutter,
+            fd,
+            smplInt,
+            cancelHook=self.scanCancelHook,
+            cache=self.surfaceCache,
+        )
+
+        # Create scan lines, the scanner drops them in tiles
+        lines = []
         for nSL in range(0, numScanLines):
             yVal = ymin + (nSL * smplInt)
-            p1 = ocl.Point(xmin, yVal, fd)  # start-point of line
-            p2 = ocl.Point(xmax, yVal, fd)  # end-point of line
-            path.append(ocl.Line(p1, p2))
-            # path.append(l)        # add the line to the path
-        pdc.setPath(path)
-        pdc.run()  # run drop-cutter on the path
+            lines.append(((xmin, yVal), (xmax, yVal)))
 
         # return the list of points
-        return pdc.getCLPoints()
+        return [P for scan in scanner.scanLines(lines) for P in scan]
 
     def _getWaterline(self, obj, scanLines, layDep, lyr, lenSL, pntsPerLine):
         """_getWaterline(obj, scanLines, layDep, lyr, lenSL, pntsPerLine) ... Get waterline."""
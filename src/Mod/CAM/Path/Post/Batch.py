@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+"""Post process the jobs of many documents with several postprocessors, without the GUI.
+
+The documents are opened and their stale objects recomputed, then every job is
+postprocessed with every postprocessor. Both steps run in FreeCADCmd worker processes,
+the gcode of each postprocessor is written to a directory of its own:
+
+    FreeCADCmd -c "import sys, Path.Post.Batch; sys.exit(Path.Post.Batch.main())" --pass \\
+        --post linuxcnc --post grbl --output /srv/gcode part1.FCStd part2.FCStd
+
+The exit status is 1 if a document or a job failed, 0 otherwise.
+
+Without --output the files go to the output directory of each job. A summary of the
+written files, their sizes and the time taken is printed and can be saved as json."""
+
+import FreeCAD
+import Path
+import Path.Main.Recompute as PathRecompute
+import argparse
+import concurrent.futures
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+DEBUG = False
+if DEBUG:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+def _jobs(doc, names):
+    import Path.Main.Job as PathJob
+
+    jobs = [
+        obj
+        for obj in doc.Objects
+        if hasattr(obj, "Proxy") and isinstance(obj.Proxy, PathJob.ObjectJob)
+    ]
+    if names:
+        jobs = [job for job in jobs if job.Name in names or job.Label in names]
+    return jobs
+
+
+def prepareDocument(task):
+    """prepareDocument(task) ... open a document and recompute its stale objects.
+    If objects were recomputed the document is saved, or a copy of it if task["save"] is
+    False, the jobs are postprocessed from it. Returns the jobs of the document with
+    their default postprocessor and output directory."""
+    from Path.Post.Utils import FilenameGenerator
+
+    doc = FreeCAD.openDocument(task["file"])
+    try:
+        jobs = []
+        for job in _jobs(doc, task["jobs"]):
+            jobs.append(
+                {
+                    "name": job.Name,
+                    "label": job.Label,
+                    "post": job.PostProcessor or Path.Preferences.defaultPostProcessor(),
+                    # %D refers to the directory of the document, not of its copy
+                    "directory": FilenameGenerator(job=job).qualified_path,
+                }
+            )
+        stale = [
+            obj.Name for obj in doc.Objects if "Touched" in obj.State or "Invalid" in obj.State
+        ]
+        document = task["file"]
+        if stale and jobs:
+            doc.recompute()
+            if task["save"]:
+                doc.save()
+            else:
+                document = task["copy"]
+                doc.saveCopy(document)
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+    return {"document": document, "jobs": jobs, "stale": stale}
+
+
+def postJob(task):
+    """postJob(task) ... postprocess a job with a postprocessor and write its gcode to
+    the directory of the postprocessor. Returns the written files and their sizes."""
+    from Path.Post.Processor import PostProcessorFactory
+    from Path.Post.Utils import FilenameGenerator
+    import Path.Post.UtilsExport as PostUtilsExport
+
+    doc = FreeCAD.openDocument(task["document"])
+    try:
+        job = doc.getObject(task["job"])
+        if task["args"] is not None:
+            job.PostProcessorArgs = task["args"]
+        postprocessor = PostProcessorFactory.get_post_processor(job, task["post"])
+        if postprocessor is None:
+            raise ValueError("Postprocessor {} not found".format(task["post"]))
+
+        directory = os.path.join(task["directory"], task["post"])
+        os.makedirs(directory, exist_ok=True)
+        generator = FilenameGenerator(job=job)
+        filenames = generator.generate_filenames()
+        written = []
+
+        def get_output(subpart):
+            generator.set_subpartname("" if subpart == "allitems" else subpart)
+            filename = os.path.join(directory, os.path.basename(next(filenames)))
+            written.append(filename)
+            return filename
+
+        if postprocessor.supports_streaming:
+            if postprocessor.export_stream(get_output) is None:
+                raise ValueError("Postprocessing failed")
+        else:
+            post_data = postprocessor.export()
+            if not post_data:
+                raise ValueError("Postprocessing failed")
+            for subpart, gcode in post_data:
+                # None means the postprocessor doesn't want a file to be written
+                if gcode is not None:
+                    PostUtilsExport.write_gcode(get_output(subpart), gcode)
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+    return {"files": [{"name": name, "bytes": os.path.getsize(name)} for name in written]}
+
+
+Tasks = {"prepare": prepareDocument, "post": postJob}
+
+
+def runTask(task):
+    """runTask(task) ... run a task in this process, the result is the task with the
+    values returned by the task function, the time taken and the error if it failed."""
+    result = dict(task)
+    result["error"] = None
+    start = time.perf_counter()
+    try:
+        result.update(Tasks[task["kind"]](task))
+    except Exception as e:
+        Path.Log.error("{}: {}".format(task.get("file"), e))
+        result["error"] = str(e) or type(e).__name__
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def runWorker(taskFile):
+    """runWorker(taskFile) ... run the task of a json file in a worker process, the result
+    is written to the file named by the task's result."""
+    with open(taskFile) as fp:
+        task = json.load(fp)
+    result = runTask(task)
+    with open(task["result"], "w") as fp:
+        json.dump(result, fp)
+
+
+def _runWorkerProcess(executable, directory, index, task):
+    taskFile = os.path.join(directory, "task{}.json".format(index))
+    scriptFile = os.path.join(directory, "worker{}.py".format(index))
+    task = dict(task, result=os.path.join(directory, "result{}.json".format(index)))
+    with open(taskFile, "w") as fp:
+        json.dump(task, fp)
+    with open(scriptFile, "w") as fp:
+        fp.write("import Path.Post.Batch\n")
+        fp.write("Path.Post.Batch.runWorker({!r})\n".format(taskFile))
+    proc = subprocess.run(
+        [executable, scriptFile],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        with open(task["result"]) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        output = proc.stdout.decode("utf-8", "replace").strip()
+        return dict(task, error="worker failed: {}".format(output[-1000:]), seconds=0.0)
+
+
+class Runner:
+    """Runner(workers, directory) ... run tasks in up to workers FreeCADCmd processes, or in
+    this process if workers is 1 or FreeCADCmd can't be found. directory holds the task
+    and result files."""
+
+    def __init__(self, workers, directory):
+        self.workers = workers
+        self.directory = directory
+        self.count = 0
+        self.executable = PathRecompute.consoleExecutable() if workers > 1 else None
+        if workers > 1 and self.executable is None:
+            Path.Log.warning("FreeCADCmd not found, jobs are postprocessed serially.")
+
+    def run(self, tasks):
+        """run(tasks) ... return the results of tasks, in the same order"""
+        if self.executable is None or len(tasks) < 2:
+            return [runTask(task) for task in tasks]
+        first = self.count
+        self.count += len(tasks)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(_runWorkerProcess, self.executable, self.directory, first + i, task)
+                for i, task in enumerate(tasks)
+            ]
+            return [future.result() for future in futures]
+
+
+def batchPost(files, posts=None, args=None, output=None, workers=None, jobs=None, save=False):
+    """batchPost(files, posts=None, args=None, output=None, workers=None, jobs=None, save=False)
+    ... postprocess the jobs of the documents in files with each of the postprocessors in
+    posts, the postprocessor of each job if posts is empty. args replaces the arguments of
+    the jobs, output the output directory of the jobs. jobs limits the jobs to those with
+    these names or labels, save saves recomputed documents. Returns the summary, a dict
+    with the results of the "documents" and "posts" tasks and the total "seconds"."""
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    directory = tempfile.mkdtemp(prefix="cam-post-")
+    try:
+        runner = Runner(workers, directory)
+        documents = runner.run(
+            [
+                {
+                    "kind": "prepare",
+                    "file": os.path.abspath(name),
+                    "jobs": jobs,
+                    "save": save,
+                    "copy": os.path.join(directory, "document{}.FCStd".format(i)),
+                }
+                for i, name in enumerate(files)
+            ]
+        )
+
+        tasks = []
+        for document in documents:
+            for job in document.get("jobs", []):
+                for post in posts or [job["post"]]:
+                    tasks.append(
+                        {
+                            "kind": "post",
+                            "file": document["file"],
+                            "document": document["document"],
+                            "job": job["name"],
+                            "label": job["label"],
+                            "post": post,
+                            "args": args,
+                            "directory": output or job["directory"],
+                        }
+                    )
+        results = runner.run(tasks)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return {"documents": documents, "posts": results, "seconds": time.perf_counter() - start}
+
+
+def printSummary(summary):
+    """printSummary(summary) ... print the summary returned by batchPost()"""
+    for document in summary["documents"]:
+        if document["error"]:
+            print("{}: {}".format(document["file"], document["error"]))
+        else:
+            print(
+                "{}: {} jobs, {} stale objects, {:.1f}s".format(
+                    document["file"],
+                    len(document["jobs"]),
+                    len(document["stale"]),
+                    document["seconds"],
+                )
+            )
+    for result in summary["posts"]:
+        text = "  {} {}: ".format(result["label"], result["post"])
+        if result["error"]:
+            text += result["error"]
+        else:
+            files = result["files"]
+            size = sum(f["bytes"] for f in files)
+            text += "{} files, {} bytes, {:.1f}s".format(len(files), size, result["seconds"])
+        print(text)
+    print("Total {:.1f}s".format(summary["seconds"]))
+
+
+def main(argv=None):
+    """main(argv=None) ... the command line entry point, argv defaults to the arguments
+    after --pass. Returns 0 if all jobs were postprocessed, 1 otherwise, pass it to
+    sys.exit() to make it the exit status of FreeCADCmd."""
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--pass") + 1 :] if "--pass" in sys.argv else []
+    parser = argparse.ArgumentParser(
+        prog="Path.Post.Batch", description="Postprocess the CAM jobs of FreeCAD documents."
+    )
+    parser.add_argument("files", nargs="+", help="FreeCAD documents")
+    parser.add_argument(
+        "-p",
+        "--post",
+        action="append",
+        help="postprocessor to use, can be repeated (default: the postprocessor of each job)",
+    )
+    parser.add_argument("--args", help="postprocessor arguments to use for all jobs")
+    parser.add_argument("-o", "--output", help="output directory (default: that of each job)")
+    parser.add_argument("-j", "--job", action="append", help="name or label of a job to post")
+    parser.add_argument("-w", "--workers", type=int, help="number of worker processes")
+    parser.add_argument("--save", action="store_true", help="save recomputed documents")
+    parser.add_argument("--summary", help="json file to write the summary to")
+    options = parser.parse_args(argv)
+
+    summary = batchPost(
+        options.files,
+        options.post,
+        options.args,
+        options.output and os.path.abspath(options.output),
+        options.workers,
+        options.job,
+        options.save,
+    )
+    printSummary(summary)
+    if options.summary:
+        with open(options.summary, "w") as fp:
+            json.dump(summary, fp, indent=2)
+    failed = [r for r in summary["documents"] + summary["posts"] if r["error"]]
+    return 1 if failed else 0
@@ -31,6 +31,7 @@ from PathScripts import PathUtils
 from Path.Post.Utils import FilenameGenerator
 import os
 from Path.Post.Processor import PostProcessor, PostProcessorFactory
+import Path.Post.UtilsExport as PostUtilsExport
 from PySide import QtCore, QtGui
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
@@ -64,6 +65,42 @@ def _resolve_post_processor_name(job):
         raise ValueError(f"Post processor not identified.")
 
 
+def _resolve_filename(filename, policy):
+    """Return the name of the file to write according to policy, None to skip it."""
+    if policy == "Open File Dialog":
+        dlg = QtGui.QFileDialog()
+        dlg.setFileMode(QtGui.QFileDialog.FileMode.AnyFile)
+        dlg.setAcceptMode(QtGui.QFileDialog.AcceptMode.AcceptSave)
+        dlg.setDirectory(os.path.dirname(filename))
+        dlg.selectFile(os.path.basename(filename))
+        if dlg.exec_():
+            filename = dlg.selectedFiles()[0]
+            Path.Log.debug(filename)
+        else:
+            return None
+
+    elif policy == "Append Unique ID on conflict":
+        while os.path.isfile(filename):
+            base, ext = os.path.splitext(filename)
+            filename = f"{base}-1{ext}"
+
+    elif policy == "Open File Dialog on conflict":
+        if os.path.isfile(filename):
+            dlg = QtGui.QFileDialog()
+            dlg.setFileMode(QtGui.QFileDialog.FileMode.AnyFile)
+            dlg.setAcceptMode(QtGui.QFileDialog.AcceptSave)
+            dlg.setDirectory(os.path.dirname(filename))
+            dlg.selectFile(os.path.basename(filename))
+            if dlg.exec_():
+                filename = dlg.selectedFiles()[0]
+                Path.Log.debug(filename)
+            else:
+                return None
+
+    # else Overwrite
+    return filename
+
+
 class DlgSelectPostProcessor:
     """Provide user with list of available and active post processor
     choices."""
@@ -122,76 +159,10 @@ class CommandPathPost:
         return self.candidate is not None
 
     def _write_file(self, filename, gcode, policy):
-        #
-        # Up to this point the postprocessors have been using "\n" as the end-of-line
-        # characters in the gcode and using the process of writing out the file as a way
-        # to convert the "\n" into whatever end-of-line characters match the system
-        # running the postprocessor.  This can be a problem if the controller which will
-        # run the gcode doesn't like the same end-of-line characters as the system that
-        # ran the postprocessor to generate the gcode.
-        # The refactored code base now allows for four possible types of end-of-line
-        # characters in the gcode.
-        #
-        if len(gcode) > 1 and gcode[0:2] == "\n\n":
-            # The gcode shouldn't normally start with "\n\n".
-            # This means that the gcode contains "\n" as the end-of-line characters and
-            # that the gcode should be written out exactly that way.
-            newline_handling = ""
-            gcode = gcode[2:]
-        elif "\r" in gcode:
-            # Write out the gcode with whatever end-of-line characters it already has,
-            # presumably either "\r" or "\r\n".
-            newline_handling = ""
-        else:
-            # The gcode is assumed to contain "\n" as the end-of-line characters (if
-            # there are any end-of-line characters in the gcode).  This case also
-            # handles a zero-length gcode string.
-            # Write out the gcode but convert "\n" to whatever the system uses.
-            # This is also backwards compatible with the "previous" way of doing things.
-            newline_handling = None
-
-        if policy == "Open File Dialog":
-            dlg = QtGui.QFileDialog()
-            dlg.setFileMode(QtGui.QFileDialog.FileMode.AnyFile)
-            dlg.setAcceptMode(QtGui.QFileDialog.AcceptMode.AcceptSave)
-            dlg.setDirectory(os.path.dirname(filename))
-            dlg.selectFile(os.path.basename(filename))
-            if dlg.exec_():
-                filename = dlg.selectedFiles()[0]
-                Path.Log.debug(filename)
-                with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
-                    f.write(gcode)
-            else:
-                return
-
-        elif policy == "Append Unique ID on conflict":
-            while os.path.isfile(filename):
-                base, ext = os.path.splitext(filename)
-                filename = f"{base}-1{ext}"
-            with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
-                f.write(gcode)
-
-        elif policy == "Open File Dialog on conflict":
-            if os.path.isfile(filename):
-                dlg = QtGui.QFileDialog()
-                dlg.setFileMode(QtGui.QFileDialog.FileMode.AnyFile)
-                dlg.setAcceptMode(QtGui.QFileDialog.AcceptSave)
-                dlg.setDirectory(os.path.dirname(filename))
-                dlg.selectFile(os.path.basename(filename))
-                if dlg.exec_():
-                    filename = dlg.selectedFiles()[0]
-                    Path.Log.debug(filename)
-                    with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
-                        f.write(gcode)
-                else:
-                    return
-            else:
-                with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
-                    f.write(gcode)
-
-        else:  # Overwrite
-            with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
-                f.write(gcode)
+        filename = _resolve_filename(filename, policy)
+        if filename is None:
+            return
+        PostUtilsExport.write_gcode(filename, gcode)
 
         FreeCAD.Console.PrintMessage(f"File written to {filename}\n")
 
@@ -213,6 +184,10 @@ class CommandPathPost:
         # get a postprocessor
         postprocessor = PostProcessorFactory.get_post_processor(self.candidate, postprocessor_name)
 
+        if Path.Preferences.streamPostProcessorOutput() and postprocessor.supports_streaming:
+            self._export_stream(postprocessor)
+            return
+
         post_data = postprocessor.export()
         # None is returned if there was an error during argument processing
         # otherwise the "usual" post_data data structure is returned.
@@ -257,6 +232,30 @@ class CommandPathPost:
         FreeCAD.ActiveDocument.commitTransaction()
         FreeCAD.ActiveDocument.recompute()
 
+    def _export_stream(self, postprocessor):
+        """Postprocess writing the gcode of each section directly to its file."""
+        policy = Path.Preferences.defaultOutputPolicy()
+        generator = FilenameGenerator(job=self.candidate)
+        generated_filename = generator.generate_filenames()
+        written = []
+
+        def get_output(subpart):
+            generator.set_subpartname("" if subpart == "allitems" else subpart)
+            filename = _resolve_filename(next(generated_filename), policy)
+            if filename is not None:
+                written.append(filename)
+            return filename
+
+        if postprocessor.export_stream(get_output) is None:
+            FreeCAD.ActiveDocument.abortTransaction()
+            return
+
+        for filename in written:
+            FreeCAD.Console.PrintMessage(f"File written to {filename}\n")
+
+        FreeCAD.ActiveDocument.commitTransaction()
+        FreeCAD.ActiveDocument.recompute()
+
 
 if FreeCAD.GuiUp:
     # register the FreeCAD command
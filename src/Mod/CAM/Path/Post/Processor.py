@@ -33,7 +33,7 @@ import os
 from PySide import QtCore, QtGui
 import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import Path.Base.Util as PathUtil
 import Path.Post.UtilsArguments as PostUtilsArguments
@@ -68,6 +68,8 @@ Defaults = Dict[str, bool]
 FormatHelp = str
 GCodeOrNone = Optional[str]
 GCodeSections = List[Tuple[str, GCodeOrNone]]
+LineCounts = List[Tuple[str, int]]
+OutputGetter = Callable[[str], Any]
 Parser = argparse.ArgumentParser
 ParserArgs = Union[None, str, argparse.Namespace]
 Postables = Union[List, List[Tuple[str, List]]]
@@ -147,6 +149,17 @@ class PostProcessor:
         """Get the units used by the post processor."""
         return self._units
 
+    @property
+    def supports_streaming(self) -> bool:
+        """True if export_stream writes the same gcode as export.
+
+        This is not the case for postprocessors which override export or process_postables.
+        """
+        return (
+            type(self).export is PostProcessor.export
+            and type(self).process_postables is PostProcessor.process_postables
+        )
+
     def _buildPostList(self):
         """
         determines the specific objects and order to postprocess
@@ -329,6 +342,33 @@ class PostProcessor:
         #
         return [("allitems", args)]  # type: ignore
 
+    def export_stream(self, get_output: OutputGetter) -> Optional[LineCounts]:
+        """Process the parser arguments, then postprocess the 'postables' writing the
+        gcode of each section line by line instead of returning it.
+
+        get_output is called with the name of each section and returns the file name
+        or the open text file (or pipe) to write the section to, or None to skip it.
+        Returns the number of lines written for each section, None on an error.
+        """
+        args: ParserArgs
+        flag: bool
+        output: Any
+
+        Path.Log.debug("Exporting the job as a stream")
+
+        (flag, args) = self.process_arguments()
+        if flag:
+            return self.process_postables_stream(get_output)
+        if args is None:
+            return None
+        #
+        # Otherwise args contains the argument list formatted for output.
+        #
+        output = get_output("allitems")
+        if output is None:
+            return []
+        return [("allitems", PostUtilsExport.write_lines(self.values, args.splitlines(), output))]
+
     def init_arguments(
         self,
         values: Values,
@@ -433,6 +473,31 @@ class PostProcessor:
 
         return g_code_sections
 
+    def process_postables_stream(self, get_output: OutputGetter) -> Optional[LineCounts]:
+        """Postprocess the 'postables' in the job writing each section to its output."""
+        count: Optional[int]
+        line_counts: LineCounts
+        output: Any
+        partname: str
+        postables: Postables
+        sublist: Sublist
+
+        postables = self._buildPostList()
+
+        Path.Log.debug(f"postables count: {len(postables)}")
+
+        line_counts = []
+        for partname, sublist in postables:
+            output = get_output(partname)
+            if output is None:
+                continue
+            count = PostUtilsExport.export_stream(self.values, sublist, output)
+            if count is None:
+                return None
+            line_counts.append((partname, count))
+
+        return line_counts
+
     def reinitialize(self) -> None:
         """Initialize or reinitialize the 'core' data structures for the postprocessor."""
         #
@@ -28,8 +28,9 @@
 # ***************************************************************************
 
 import datetime
+import itertools
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import FreeCAD
 import Path.Base.Util as PathUtil
@@ -51,6 +52,16 @@ def check_canned_cycles(values: Values) -> None:
             values["SUPPRESS_COMMANDS"] += ["G99", "G98", "G80"]
 
 
+def check_objects(objectslist) -> bool:
+    """Check that all of the objects in objectslist can be postprocessed."""
+    for obj in objectslist:
+        if not hasattr(obj, "Path"):
+            print(f"The object {obj.Name} is not a path.")
+            print("Please select only path and Compounds.")
+            return False
+    return True
+
+
 def output_coolant_off(values: Values, gcode: Gcode, coolant_mode: str) -> None:
     """Output the commands to turn coolant off if necessary."""
     comment: str
@@ -269,53 +280,17 @@ def output_units(values: Values, gcode: Gcode) -> None:
 
 def export_common(values: Values, objectslist, filename: str) -> str:
     """Do the common parts of postprocessing the objects in objectslist to filename."""
-    coolant_mode: str
     dia: PostUtils.GCodeEditorDialog
     final: str
     final_for_editor: str
-    gcode: Gcode = []
+    gcode: Gcode
 
-    for obj in objectslist:
-        if not hasattr(obj, "Path"):
-            print(f"The object {obj.Name} is not a path.")
-            print("Please select only path and Compounds.")
-            return ""
+    if not check_objects(objectslist):
+        return ""
 
     print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} postprocessing...')
 
-    check_canned_cycles(values)
-    output_header(values, gcode)
-    output_safetyblock(values, gcode)
-    output_tool_list(values, gcode, objectslist)
-    output_preamble(values, gcode)
-    output_motion_mode(values, gcode)
-    output_units(values, gcode)
-
-    for obj in objectslist:
-        # Skip inactive operations
-        if not PathUtil.activeForOp(obj):
-            continue
-        coolant_mode = PathUtil.coolantModeForOp(obj)
-        output_start_bcnc(values, gcode, obj)
-        output_preop(values, gcode, obj)
-        output_coolant_on(values, gcode, coolant_mode)
-        # output the G-code for the group (compound) or simple path
-        PostUtilsParse.parse_a_group(values, gcode, obj)
-        output_postop(values, gcode, obj)
-        output_coolant_off(values, gcode, coolant_mode)
-
-    output_return_to(values, gcode)
-    #
-    # This doesn't make sense to me.  It seems that both output_start_bcnc and
-    # output_end_bcnc should be in the for loop or both should be out of the
-    # for loop.  However, that is the way that grbl post code was written, so
-    # for now I will leave it that way until someone has time to figure it out.
-    #
-    output_end_bcnc(values, gcode)
-    output_postamble_header(values, gcode)
-    output_tool_return(values, gcode)
-    output_safetyblock(values, gcode)
-    output_postamble(values, gcode)
+    gcode = list(export_lines(values, objectslist))
 
     # add the appropriate end-of-line characters to the gcode, including after the last line
     gcode.append("")
@@ -377,3 +352,146 @@ def export_common(values: Values, objectslist, filename: str) -> str:
                 gfile.write(final)
 
     return final
+
+
+def export_lines(values: Values, objectslist) -> Iterator[str]:
+    """Generate the lines of gcode for the objects in objectslist one by one.
+
+    The lines are formatted while they are consumed, so the program is never held
+    in memory as a whole.  The end-of-line characters are not included.
+    """
+    coolant_mode: str
+    gcode: Gcode = []  # the lines that are not yielded yet
+
+    check_canned_cycles(values)
+    output_header(values, gcode)
+    output_safetyblock(values, gcode)
+    output_tool_list(values, gcode, objectslist)
+    output_preamble(values, gcode)
+    output_motion_mode(values, gcode)
+    output_units(values, gcode)
+
+    for obj in objectslist:
+        # Skip inactive operations
+        if not PathUtil.activeForOp(obj):
+            continue
+        coolant_mode = PathUtil.coolantModeForOp(obj)
+        output_start_bcnc(values, gcode, obj)
+        output_preop(values, gcode, obj)
+        output_coolant_on(values, gcode, coolant_mode)
+        yield from gcode
+        gcode.clear()
+        # output the G-code for the group (compound) or simple path
+        yield from PostUtilsParse.iter_a_group(values, obj)
+        output_postop(values, gcode, obj)
+        output_coolant_off(values, gcode, coolant_mode)
+
+    output_return_to(values, gcode)
+    #
+    # This doesn't make sense to me.  It seems that both output_start_bcnc and
+    # output_end_bcnc should be in the for loop or both should be out of the
+    # for loop.  However, that is the way that grbl post code was written, so
+    # for now I will leave it that way until someone has time to figure it out.
+    #
+    output_end_bcnc(values, gcode)
+    output_postamble_header(values, gcode)
+    output_tool_return(values, gcode)
+    output_safetyblock(values, gcode)
+    output_postamble(values, gcode)
+    yield from gcode
+
+
+def export_stream(values: Values, objectslist, output) -> Optional[int]:
+    """Postprocess the objects in objectslist writing the gcode line by line to output.
+
+    output is a file name or an open text file (or pipe), see write_lines.
+    Unlike export_common the gcode is not kept in memory, so the editor is not shown.
+    Returns the number of lines written, or None if the objects can't be postprocessed.
+    """
+    count: int
+
+    if not check_objects(objectslist):
+        return None
+
+    print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} postprocessing...')
+    count = write_lines(values, export_lines(values, objectslist), output)
+    print("done postprocessing.")
+
+    return count
+
+
+def gcode_newline(values: Values) -> Tuple[str, Optional[str]]:
+    """Return the end-of-line characters written after each line and the 'newline'
+    argument to open the output file with, matching the file written by export_common."""
+    if values["END_OF_LINE_CHARACTERS"] == "\n\n":
+        # write out the gcode using "\n" as the end-of-line characters
+        return ("\n", "")
+    if "\r" in values["END_OF_LINE_CHARACTERS"]:
+        # write out "\r" or "\r\n" as they are
+        return (values["END_OF_LINE_CHARACTERS"], "")
+    # "\n" means "use the end-of-line characters that match the system"
+    return ("\n", None)
+
+
+def write_lines(values: Values, lines: Iterable[str], output, chunk_size: int = 1000) -> int:
+    """Write the lines of gcode to output as they are generated.
+
+    output is either a file name, which is opened with the right end-of-line handling,
+    or an open text file (or pipe), which is not closed.  The lines are written in
+    chunks of chunk_size lines, so the memory used does not depend on the program size.
+    Returns the number of lines written.
+    """
+    chunk: List[str]
+    count: int = 0
+    eol: str
+    newline: Optional[str]
+
+    eol, newline = gcode_newline(values)
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "w", encoding="utf-8", newline=newline) as gfile:
+            return write_lines(values, lines, gfile, chunk_size)
+
+    lines = iter(lines)
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            break
+        output.write(eol.join(chunk) + eol)
+        count += len(chunk)
+    return count
+
+
+def write_gcode(filename: str, gcode: str) -> None:
+    """Write the gcode returned by a postprocessor to filename.
+
+    Up to this point the postprocessors have been using "\n" as the end-of-line
+    characters in the gcode and using the process of writing out the file as a way
+    to convert the "\n" into whatever end-of-line characters match the system
+    running the postprocessor.  This can be a problem if the controller which will
+    run the gcode doesn't like the same end-of-line characters as the system that
+    ran the postprocessor to generate the gcode.
+    The refactored code base now allows for four possible types of end-of-line
+    characters in the gcode.
+    """
+    newline_handling: Optional[str]
+
+    if len(gcode) > 1 and gcode[0:2] == "\n\n":
+        # The gcode shouldn't normally start with "\n\n".
+        # This means that the gcode contains "\n" as the end-of-line characters and
+        # that the gcode should be written out exactly that way.
+        newline_handling = ""
+        gcode = gcode[2:]
+    elif "\r" in gcode:
+        # Write out the gcode with whatever end-of-line characters it already has,
+        # presumably either "\r" or "\r\n".
+        newline_handling = ""
+    else:
+        # The gcode is assumed to contain "\n" as the end-of-line characters (if
+        # there are any end-of-line characters in the gcode).  This case also
+        # handles a zero-length gcode string.
+        # Write out the gcode but convert "\n" to whatever the system uses.
+        # This is also backwards compatible with the "previous" way of doing things.
+        newline_handling = None
+
+    with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
+        f.write(gcode)
@@ -30,7 +30,7 @@
 
 import math
 import re
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 
 import FreeCAD
 from FreeCAD import Units
@@ -47,6 +47,199 @@ Values = Dict[str, Any]
 ParameterFunction = Callable[[Values, str, str, PathParameter, PathParameters], str]
 
 
+class CommandFormatter:
+    """Format the motion commands of a path with the post configuration compiled once.
+
+    The values are looked up once when the formatter is created, the format strings
+    and unit conversions are precomputed and every parameter gets a specialized
+    function.  Commands which need any of the special processing of iter_a_path
+    (comments, tool changes, drill cycles, suppressed commands, ...) are not
+    handled, see is_fast_command().  The output is the same as the one of the
+    parameter functions in values["PARAMETER_FUNCTIONS"].
+    """
+
+    # the motion commands without any special processing
+    FAST_COMMANDS = ("G0", "G00", "G1", "G01", "G2", "G02", "G3", "G03")
+
+    def __init__(self, values: Values, adaptive_op_variables: Tuple[bool, float, float]):
+        self.values = values
+        self.command_space = values["COMMAND_SPACE"]
+        self.modal = values["MODAL"]
+        self.output_doubles = values["OUTPUT_DOUBLES"]
+        self.line_numbers = values["OUTPUT_LINE_NUMBERS"]
+        self.rapid_moves = frozenset(values["RAPID_MOVES"])
+        self.motion_commands = frozenset(values["MOTION_COMMANDS"])
+        self.axis_format = f'.{str(values["AXIS_PRECISION"])}f'
+        self.feed_format = f'.{str(values["FEED_PRECISION"])}f'
+        self.spindle_format = f'.{str(values["SPINDLE_DECIMALS"])}f'
+        self.length_divisor = self._divisor(Units.Length, values["UNIT_FORMAT"])
+        self.speed_divisor = self._divisor(Units.Velocity, values["UNIT_SPEED_FORMAT"])
+
+        excluded = set(values["SUPPRESS_COMMANDS"])
+        if values["TRANSLATE_DRILL_CYCLES"]:
+            excluded.update(values["DRILL_CYCLES_TO_TRANSLATE"])
+        if values["OUTPUT_ADAPTIVE"] and adaptive_op_variables[0]:
+            # the rapid moves of adaptive ops are changed, see check_for_an_adaptive_op
+            excluded.update(values["RAPID_MOVES"])
+        self.fast_commands = frozenset(self.FAST_COMMANDS) - excluded
+
+        self.parameters = []
+        for parameter in values["PARAMETER_ORDER"]:
+            function = values["PARAMETER_FUNCTIONS"].get(parameter)
+            if function is not None:
+                self.parameters.append((parameter, self._compile(parameter, function)))
+
+    @staticmethod
+    def _divisor(unit, unit_format: str) -> Union[float, None]:
+        """Return the value to divide by to convert to unit_format, None if dividing
+        does not give exactly the same numbers as Quantity.getValueAs()."""
+        divisor = Units.Quantity(unit_format).Value
+        for number in (0.1, 1.0 / 3.0, 2.54, 25.4, 123.456789, -7.77, 1.0e-3, 6000.0):
+            if number / divisor != float(Units.Quantity(number, unit).getValueAs(unit_format)):
+                return None
+        return divisor
+
+    def _to_length(self, number: float) -> float:
+        if self.length_divisor is None:
+            return float(
+                Units.Quantity(number, Units.Length).getValueAs(self.values["UNIT_FORMAT"])
+            )
+        return number / self.length_divisor
+
+    def _to_speed(self, number: float) -> float:
+        if self.speed_divisor is None:
+            return float(
+                Units.Quantity(number, Units.Velocity).getValueAs(self.values["UNIT_SPEED_FORMAT"])
+            )
+        return number / self.speed_divisor
+
+    def _compile(self, parameter: str, function: ParameterFunction) -> Callable:
+        """Return the specialized function for a parameter, it is called with the
+        command, the parameter value, the parameters and the current location."""
+        epsilon: float = 0.00001
+        values = self.values
+        axis_format = self.axis_format
+        to_length = self._to_length
+
+        if function is default_axis_parameter:
+
+            def axis(command, value, parameters, current_location):
+                if (
+                    not self.output_doubles
+                    and parameter in current_location
+                    and math.fabs(current_location[parameter] - value) < epsilon
+                ):
+                    return ""
+                return format(to_length(value), axis_format)
+
+            return axis
+
+        if function is default_rotary_parameter:
+
+            def rotary(command, value, parameters, current_location):
+                if (
+                    not self.output_doubles
+                    and parameter in current_location
+                    and math.fabs(current_location[parameter] - value) < epsilon
+                ):
+                    return ""
+                return format(float(value), axis_format)
+
+            return rotary
+
+        if function is default_length_parameter:
+
+            def length(command, value, parameters, current_location):
+                return format(to_length(value), axis_format)
+
+            return length
+
+        if function is default_int_parameter:
+
+            def integer(command, value, parameters, current_location):
+                return str(int(value))
+
+            return integer
+
+        if function is default_S_parameter:
+
+            def spindle(command, value, parameters, current_location):
+                return format(float(value), self.spindle_format)
+
+            return spindle
+
+        if function is default_F_parameter:
+            return self._compile_feed(parameter)
+
+        # anything else is done by the configured function
+        def other(command, value, parameters, current_location):
+            return function(values, command, parameter, value, parameters, current_location)
+
+        return other
+
+    def _compile_feed(self, parameter: str) -> Callable:
+        epsilon: float = 0.00001
+        feed_format = self.feed_format
+        to_speed = self._to_speed
+
+        def feed(command, value, parameters, current_location):
+            if (
+                not self.output_doubles
+                and parameter in current_location
+                and math.fabs(current_location[parameter] - value) < epsilon
+            ):
+                return ""
+            if command in self.rapid_moves:
+                return ""
+            speed = to_speed(value)
+            if speed <= 0.0:
+                return ""
+            # feed is in linear units if any of the linear axes moves
+            for key in ("X", "Y", "Z", "U", "V", "W"):
+                if (
+                    key in parameters
+                    and math.fabs(current_location[key] - parameters[key]) > epsilon
+                ):
+                    return format(speed, feed_format)
+            # else in degrees (per second) if only rotary axes are given
+            for key in ("A", "B", "C"):
+                if key in parameters:
+                    return format(float(value * 60.0), feed_format)
+            return format(speed, feed_format)
+
+        return feed
+
+    def is_fast_command(self, command: str) -> bool:
+        """Return True if format_command() can be used for the command."""
+        return command in self.fast_commands
+
+    def format_command(
+        self,
+        command: str,
+        parameters: PathParameters,
+        lastcommand: str,
+        current_location: PathParameters,
+    ) -> str:
+        """Return the line for a fast command, an empty string if nothing is output."""
+        command_line: CommandLine = []
+        parameter_value: str
+
+        if not (self.modal and command == lastcommand):
+            command_line.append(command)
+        for parameter, function in self.parameters:
+            if parameter in parameters:
+                parameter_value = function(
+                    command, parameters[parameter], parameters, current_location
+                )
+                if parameter_value:
+                    command_line.append(f"{parameter}{parameter_value}")
+        if not command_line:
+            return ""
+        if self.line_numbers:
+            return f"{linenumber(self.values)}{self.command_space.join(command_line)}"
+        return self.command_space.join(command_line)
+
+
 def check_for_an_adaptive_op(
     values: Values,
     command: str,
@@ -644,38 +837,42 @@ def output_G81_G82_drill_moves(
     gcode.append(f"{linenumber(values)}{G0_retract_z}")
 
 
-def parse_a_group(values: Values, gcode: Gcode, pathobj) -> None:
-    """Parse a Group (compound, project, or simple path)."""
+def iter_a_group(values: Values, pathobj) -> Iterator[str]:
+    """Generate the lines of a Group (compound, project, or simple path) one by one."""
     comment: str
 
     if hasattr(pathobj, "Group"):  # We have a compound or project.
         if values["OUTPUT_COMMENTS"]:
             comment = create_comment(values, f"Compound: {pathobj.Label}")
-            gcode.append(f"{linenumber(values)}{comment}")
+            yield f"{linenumber(values)}{comment}"
         for p in pathobj.Group:
-            parse_a_group(values, gcode, p)
+            yield from iter_a_group(values, p)
     else:  # parsing simple path
         # groups might contain non-path things like stock.
         if not hasattr(pathobj, "Path"):
             return
         if values["OUTPUT_PATH_LABELS"] and values["OUTPUT_COMMENTS"]:
             comment = create_comment(values, f"Path: {pathobj.Label}")
-            gcode.append(f"{linenumber(values)}{comment}")
-        parse_a_path(values, gcode, pathobj)
+            yield f"{linenumber(values)}{comment}"
+        yield from iter_a_path(values, pathobj)
 
 
-def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
-    """Parse a simple Path."""
+def iter_a_path(values: Values, pathobj) -> Iterator[str]:
+    """Generate the lines of a simple Path, the lines of each command are generated
+    as soon as the command is parsed."""
     adaptive_op_variables: Tuple[bool, float, float]
     cmd: str
     command: str
     command_line: CommandLine
     current_location: PathParameters = {}  # keep track for no doubles
     drill_retract_mode: str = "G98"
+    formatter: CommandFormatter
+    gcode: Gcode = []  # the lines of the current command
     lastcommand: str = ""
     motion_location: PathParameters = {}  # keep track of last motion location
     parameter: str
     parameter_value: str
+    parameters: PathParameters
 
     # Check to see if values["TOOL_BEFORE_CHANGE"] is set and value is true
     # doing it here to reduce the number of times it is checked
@@ -702,9 +899,23 @@ def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
         ).Parameters
     )
     adaptive_op_variables = determine_adaptive_op(values, pathobj)
+    formatter = CommandFormatter(values, adaptive_op_variables)
 
     for c in pathobj.Path.Commands:
         command = c.Name
+
+        if formatter.is_fast_command(command):
+            parameters = c.Parameters
+            cmd = formatter.format_command(command, parameters, lastcommand, current_location)
+            # Remember the current command and location
+            lastcommand = command
+            current_location.update(parameters)
+            if command in formatter.motion_commands:
+                motion_location.update(parameters)
+            if cmd:
+                yield cmd
+            continue
+
         command_line = []
 
         # Skip blank lines if requested
@@ -789,6 +1000,19 @@ def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
         check_for_tlo(values, gcode, command, c.Parameters)
         check_for_machine_specific_commands(values, gcode, command)
 
+        yield from gcode
+        gcode.clear()
+
+
+def parse_a_group(values: Values, gcode: Gcode, pathobj) -> None:
+    """Parse a Group (compound, project, or simple path)."""
+    gcode.extend(iter_a_group(values, pathobj))
+
+
+def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
+    """Parse a simple Path."""
+    gcode.extend(iter_a_path(values, pathobj))
+
 
 def set_adaptive_op_speed(
     values: Values,
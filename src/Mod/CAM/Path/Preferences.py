@@ -43,6 +43,7 @@ PostProcessorDefaultArgs = "PostProcessorDefaultArgs"
 PostProcessorBlacklist = "PostProcessorBlacklist"
 PostProcessorOutputFile = "PostProcessorOutputFile"
 PostProcessorOutputPolicy = "PostProcessorOutputPolicy"
+PostProcessorStreamOutput = "PostProcessorStreamOutput"
 
 LastPathToolBit = "LastPathToolBit"
 LastPathToolLibrary = "LastPathToolLibrary"
@@ -68,6 +69,21 @@ WarningSuppressVelocity = "WarningSuppressVelocity"
 EnableExperimentalFeatures = "EnableExperimentalFeatures"
 EnableAdvancedOCLFeatures = "EnableAdvancedOCLFeatures"
 
+# Compute the toolpaths of Adaptive operations in a background thread
+AdaptiveBackground = "AdaptiveBackground"
+# Number of worker processes recomputing the operations of a job, 0 uses the number of CPUs
+RecomputeWorkers = "RecomputeWorkers"
+# Size limit in MB of the OCL surface and scan cache of a job, 0 disables the cache
+SurfaceCacheSize = "SurfaceCacheSize"
+# Directory to keep the surface cache across sessions, empty keeps it in memory only
+SurfaceCacheDirectory = "SurfaceCacheDirectory"
+# Acceleration limits in mm/s^2 and jerk limit in mm/s^3 of the machine used to estimate
+# cycle times, 0 ignores the limit. The junction deviation in mm sets the cornering speed.
+MachineAccelerationXY = "MachineAccelerationXY"
+MachineAccelerationZ = "MachineAccelerationZ"
+MachineJerk = "MachineJerk"
+MachineJunctionDeviation = "MachineJunctionDeviation"
+
 
 def preferences():
     return FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/CAM")
@@ -231,6 +247,10 @@ def defaultOutputPolicy():
     return pref.GetString(PostProcessorOutputPolicy, "")
 
 
+def streamPostProcessorOutput():
+    return preferences().GetBool(PostProcessorStreamOutput, False)
+
+
 def defaultStockTemplate():
     return preferences().GetString(DefaultStockTemplate, "")
 
@@ -251,6 +271,38 @@ def advancedOCLFeaturesEnabled():
     return preferences().GetBool(EnableAdvancedOCLFeatures, False)
 
 
+def adaptiveBackground():
+    return preferences().GetBool(AdaptiveBackground, False)
+
+
+def recomputeWorkers():
+    return preferences().GetInt(RecomputeWorkers, 0)
+
+
+def surfaceCacheSize():
+    return preferences().GetInt(SurfaceCacheSize, 256)
+
+
+def surfaceCacheDirectory():
+    return preferences().GetString(SurfaceCacheDirectory, "")
+
+
+def machineAccelerationXY():
+    return preferences().GetFloat(MachineAccelerationXY, 0.0)
+
+
+def machineAccelerationZ():
+    return preferences().GetFloat(MachineAccelerationZ, 0.0)
+
+
+def machineJerk():
+    return preferences().GetFloat(MachineJerk, 0.0)
+
+
+def machineJunctionDeviation():
+    return preferences().GetFloat(MachineJunctionDeviation, 0.01)
+
+
 def experimentalFeaturesEnabled():
     return preferences().GetBool(EnableExperimentalFeatures, False)
 
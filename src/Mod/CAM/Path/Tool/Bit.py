@@ -24,9 +24,9 @@ import FreeCAD
 import Path
 import Path.Base.Util as PathUtil
 import Path.Base.PropertyBag as PathPropertyBag
+import Path.Tool.Index as PathToolIndex
 import json
 import os
-import zipfile
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
 # lazily loaded modules
@@ -63,23 +63,12 @@ def _findToolFile(name, containerFile, typ):
         paths = []
     paths.extend(Path.Preferences.searchPathsTool(typ))
 
-    def _findFile(path, name):
-        Path.Log.track(path, name)
-        fullPath = os.path.join(path, name)
-        if os.path.exists(fullPath):
-            return (True, fullPath)
-        for root, ds, fs in os.walk(path):
-            for d in ds:
-                found, fullPath = _findFile(d, name)
-                if found:
-                    return (True, fullPath)
-        return (False, None)
-
     for p in paths:
-        found, path = _findFile(p, name)
-        if found:
-            return path
-    return None
+        fullPath = os.path.join(p, name)
+        if os.path.exists(fullPath):
+            return fullPath
+    # subdirectories are looked up in the tool index, it only lists changed directories
+    return PathToolIndex.index().find(name, paths)
 
 
 def findToolShape(name, path=None):
@@ -134,8 +123,8 @@ def findRelativePathLibrary(path):
 
 
 class ToolBit(object):
-    def __init__(self, obj, shapeFile, path=None):
-        Path.Log.track(obj.Label, shapeFile, path)
+    def __init__(self, obj, shapeFile, path=None, lazy=False):
+        Path.Log.track(obj.Label, shapeFile, path, lazy)
         self.obj = obj
         obj.addProperty(
             "App::PropertyFile",
@@ -172,11 +161,11 @@ class ToolBit(object):
             obj.File = path
         if shapeFile is None:
             obj.BitShape = "endmill.fcstd"
-            self._setupBitShape(obj)
+            self._setupBitShape(obj, lazy=lazy)
             self.unloadBitBody(obj)
         else:
             obj.BitShape = shapeFile
-            self._setupBitShape(obj)
+            self._setupBitShape(obj, lazy=lazy)
         self.onDocumentRestored(obj)
 
     def dumps(self):
@@ -334,8 +323,42 @@ class ToolBit(object):
         obj.setEditorMode(prop, 1)
         PathUtil.setProperty(obj, prop, val)
 
-    def _setupBitShape(self, obj, path=None):
-        Path.Log.track(obj.Label)
+    def _setupBitProperties(self, obj, path=None):
+        # set up the bit's properties from the tool index, the body is only loaded once
+        # the shape is needed, see ensureShape
+        p = path if path else obj.BitShape
+        if any(FreeCAD.getDocument(d).FileName == p for d in FreeCAD.listDocuments()):
+            return False
+        p = findToolShape(p, path if path else obj.File)
+        info = PathToolIndex.index().shape(p) if p else None
+        if not info or not info["properties"]:
+            return False
+
+        if not path and p != obj.BitShape:
+            obj.BitShape = p
+        obj.Label = info["label"]
+        obj.ShapeName = info["name"]
+        self._removeBitBody(obj)
+        for prop in obj.BitPropertyNames:
+            obj.removeProperty(prop)
+
+        propNames = []
+        for spec in info["properties"]:
+            prop = spec["name"]
+            obj.addProperty(spec["type"], prop, spec["group"], spec["doc"])
+            if "enum" in spec:
+                setattr(obj, prop, spec["enum"])
+            obj.setEditorMode(prop, 1)
+            PathUtil.setProperty(obj, prop, spec["value"])
+            propNames.append(prop)
+        obj.BitPropertyNames = propNames
+        obj.Shape = Part.Shape()
+        return True
+
+    def _setupBitShape(self, obj, path=None, lazy=False):
+        Path.Log.track(obj.Label, lazy)
+        if lazy and self._setupBitProperties(obj, path):
+            return
 
         activeDoc = FreeCAD.ActiveDocument
         try:
@@ -376,6 +399,25 @@ class ToolBit(object):
         obj.BitBody = bitBody
         self._copyBitShape(obj)
 
+    def ensureShape(self, obj):
+        """ensureShape(obj) ... return the shape of the tool bit, it is created from the bit
+        body if the bit was set up without one"""
+        if obj.Shape.isNull() and obj.BitPropertyNames:
+            if obj.BitBody:
+                self._updateBitShape(obj)
+            else:
+                try:
+                    self.loadBitBody(obj)
+                except FileNotFoundError:
+                    Path.Log.error(
+                        "Could not find shape file {} for tool bit {}".format(
+                            obj.BitShape, obj.Label
+                        )
+                    )
+                    return obj.Shape
+                self.unloadBitBody(obj)
+        return obj.Shape
+
     def toolShapeProperties(self, obj):
         """toolShapeProperties(obj) ... return all properties defining it's shape"""
         return sorted(
@@ -411,15 +453,7 @@ class ToolBit(object):
         if obj.BitShape:
             path = findToolShape(obj.BitShape)
             if path:
-                with open(path, "rb") as fd:
-                    try:
-                        zf = zipfile.ZipFile(fd)
-                        pf = zf.open("thumbnails/Thumbnail.png", "r")
-                        data = pf.read()
-                        pf.close()
-                        return data
-                    except KeyError:
-                        pass
+                return PathToolIndex.index().thumbnail(path)
         return None
 
     def saveToFile(self, obj, path, setFile=True):
@@ -458,14 +492,19 @@ class ToolBit(object):
 
 def Declaration(path):
     Path.Log.track(path)
-    with open(path, "r") as fp:
-        return json.load(fp)
+    data = PathToolIndex.index().bit(path)
+    if data is None:
+        # let the caller see why the file can't be read
+        with open(path, "r") as fp:
+            return json.load(fp)
+    return data
 
 
 class ToolBitFactory(object):
     def CreateFromAttrs(self, attrs, name="ToolBit", path=None):
         Path.Log.track(attrs, path)
-        obj = Factory.Create(name, attrs["shape"], path)
+        # the bit body is only loaded when the shape of the tool is needed
+        obj = Factory.Create(name, attrs["shape"], path, lazy=True)
         obj.Label = attrs["name"]
         params = attrs["parameter"]
         for prop in params:
@@ -490,11 +529,19 @@ class ToolBitFactory(object):
             Path.Log.error("%s not a valid tool file (%s)" % (path, e))
             raise
 
-    def Create(self, name="ToolBit", shapeFile=None, path=None):
-        Path.Log.track(name, shapeFile, path)
+    def Create(self, name="ToolBit", shapeFile=None, path=None, lazy=False):
+        Path.Log.track(name, shapeFile, path, lazy)
         obj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython", name)
-        obj.Proxy = ToolBit(obj, shapeFile, path)
+        obj.Proxy = ToolBit(obj, shapeFile, path, lazy)
         return obj
 
 
 Factory = ToolBitFactory()
+
+
+def toolShape(tool):
+    """toolShape(tool) ... return the shape of tool, the shape of a tool bit is created if
+    it hasn't been yet"""
+    if hasattr(tool, "Proxy") and hasattr(tool.Proxy, "ensureShape"):
+        return tool.Proxy.ensureShape(tool)
+    return tool.Shape
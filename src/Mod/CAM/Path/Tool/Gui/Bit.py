@@ -76,6 +76,13 @@ class ViewProvider(object):
     def loads(self, state):
         return None
 
+    def onChanged(self, vobj, prop):
+        obj = vobj.Object
+        if prop == "Visibility" and vobj.Visibility and "Restore" not in obj.State:
+            # lazily created bits get their shape once they're shown
+            if hasattr(obj.Proxy, "ensureShape"):
+                obj.Proxy.ensureShape(obj)
+
     def onDelete(self, vobj, arg2=None):
         Path.Log.track(vobj.Object.Label)
         vobj.Object.Proxy.onDelete(vobj.Object)
@@ -162,14 +169,14 @@ class TaskPanel:
 
 
 class ToolBitGuiFactory(PathToolBit.ToolBitFactory):
-    def Create(self, name="ToolBit", shapeFile=None, path=None):
+    def Create(self, name="ToolBit", shapeFile=None, path=None, lazy=False):
         """Create(name = 'ToolBit') ... creates a new tool bit.
         It is assumed the tool will be edited immediately so the internal bit body is still attached.
         """
 
-        Path.Log.track(name, shapeFile, path)
+        Path.Log.track(name, shapeFile, path, lazy)
         FreeCAD.ActiveDocument.openTransaction("Create ToolBit")
-        tool = PathToolBit.ToolBitFactory.Create(self, name, shapeFile, path)
+        tool = PathToolBit.ToolBitFactory.Create(self, name, shapeFile, path, lazy)
         PathIconViewProvider.Attach(tool.ViewObject, name)
         FreeCAD.ActiveDocument.commitTransaction()
         return tool
@@ -29,6 +29,7 @@ import Path.Tool.Bit as PathToolBit
 import Path.Tool.Gui.Bit as PathToolBitGui
 import Path.Tool.Gui.BitEdit as PathToolBitEdit
 import Path.Tool.Gui.Controller as PathToolControllerGui
+import Path.Tool.Index as PathToolIndex
 import PathGui
 import PathScripts.PathUtilsGui as PathUtilsGui
 import PySide
@@ -273,8 +274,11 @@ class ModelFactory:
         Path.Preferences.setLastFileToolLibrary(path)
 
         try:
-            with open(path) as fp:
-                library = json.load(fp)
+            library = PathToolIndex.index().library(path)
+            if library is None:
+                # not readable, let json tell why
+                with open(path) as fp:
+                    library = json.load(fp)
         except Exception as e:
             Path.Log.error(f"Failed to load library from {path}: {e}")
             return
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+__title__ = "Tool Index"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "On-disk index of the tool bit, shape and library files."
+
+import FreeCAD
+import Path
+import Path.Base.PropertyBag as PathPropertyBag
+import Path.Base.Util as PathUtil
+import atexit
+import base64
+import collections
+import copy
+import json
+import os
+import time
+import zipfile
+
+# The index keeps the listings of the tool directories and what has been read from the
+# files in them. A directory is listed again if its mtime changed, the entry of a file
+# is dropped if its mtime or size changed. Reading a shape means opening it as a
+# document, so the properties of its attribute bags are kept in the index and tool
+# bits can be set up from them without opening the shape again.
+
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+Extensions = (".fctb", ".fctl", ".fcstd")
+
+
+def _readJson(path):
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def _readThumbnail(path):
+    with zipfile.ZipFile(path) as zf:
+        try:
+            data = zf.read("thumbnails/Thumbnail.png")
+        except KeyError:
+            return None
+    return base64.b64encode(data).decode("ascii")
+
+
+def _propertyValue(bag, prop):
+    value = bag.getPropertyByName(prop)
+    if isinstance(value, FreeCAD.Units.Quantity):
+        # the user string depends on the unit schema, this one doesn't
+        return str(value)
+    if isinstance(value, (bool, int, float, str, list)):
+        return value
+    return PathUtil.getPropertyValueString(bag, prop)
+
+
+def _readShape(path):
+    activeDoc = FreeCAD.ActiveDocument
+    doc = None
+    for name in FreeCAD.listDocuments():
+        if FreeCAD.getDocument(name).FileName == path:
+            doc = FreeCAD.getDocument(name)
+            break
+    opened = doc is None
+    if opened:
+        doc = FreeCAD.openDocument(path, True)
+    try:
+        body = doc.RootObjects[0]
+        properties = []
+        for bag in [o for o in body.Group if PathPropertyBag.IsPropertyBag(o)]:
+            for prop in bag.Proxy.getCustomProperties():
+                spec = {
+                    "name": prop,
+                    "type": bag.getTypeIdOfProperty(prop),
+                    "group": bag.getGroupOfProperty(prop),
+                    "doc": bag.getDocumentationOfProperty(prop),
+                    "value": _propertyValue(bag, prop),
+                }
+                if spec["type"] == "App::PropertyEnumeration":
+                    spec["enum"] = bag.getEnumerationsOfProperty(prop)
+                properties.append(spec)
+        return {"name": doc.Name, "label": body.Label, "properties": properties}
+    finally:
+        if opened:
+            FreeCAD.closeDocument(doc.Name)
+            if activeDoc:
+                FreeCAD.setActiveDocument(activeDoc.Name)
+
+
+class ToolIndex(object):
+    """ToolIndex(fileName=None) ... index of the tool files, kept in fileName.
+    Without a fileName the index only lives as long as the object."""
+
+    Version = 1
+
+    def __init__(self, fileName=None):
+        self.fileName = fileName
+        self.dirs = {}
+        self.files = {}
+        self.dirty = False
+        if fileName:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.fileName) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.Version:
+            self.dirs = data.get("dirs", {})
+            self.files = data.get("files", {})
+
+    def save(self):
+        """save() ... write the index to its file if it changed"""
+        if not self.fileName or not self.dirty:
+            return
+        tmpName = "{}.{}".format(self.fileName, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(self.fileName), exist_ok=True)
+            with open(tmpName, "w") as fp:
+                json.dump({"version": self.Version, "dirs": self.dirs, "files": self.files}, fp)
+            os.replace(tmpName, self.fileName)
+            self.dirty = False
+        except OSError as e:
+            Path.Log.warning("Could not save tool index {} ({})".format(self.fileName, e))
+
+    def listFiles(self, root):
+        """listFiles(root) ... return the tool files in root and its subdirectories,
+        shallower directories first"""
+        found = []
+        pending = collections.deque([os.path.normpath(root)])
+        while pending:
+            directory = pending.popleft()
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                if self.dirs.pop(directory, None) is not None:
+                    self.dirty = True
+                continue
+            entry = self.dirs.get(directory)
+            if entry is None or entry["mtime"] != mtime or entry["racy"]:
+                Path.Log.debug("index {}".format(directory))
+                files = []
+                dirs = []
+                try:
+                    with os.scandir(directory) as it:
+                        for e in it:
+                            if e.is_dir():
+                                dirs.append(e.name)
+                            elif e.name.lower().endswith(Extensions):
+                                files.append(e.name)
+                except OSError:
+                    continue
+                # a change within the granularity of the mtime could go unnoticed, such
+                # a listing is taken again the next time
+                racy = time.time_ns() - mtime < 2 * 10**9
+                entry = {"mtime": mtime, "racy": racy, "files": sorted(files), "dirs": sorted(dirs)}
+                self.dirs[directory] = entry
+                self.dirty = True
+            found.extend(os.path.join(directory, name) for name in entry["files"])
+            pending.extend(os.path.join(directory, name) for name in entry["dirs"])
+        return found
+
+    def find(self, name, roots):
+        """find(name, roots) ... return the first file in roots or their subdirectories
+        whose path ends with name, None if there is none"""
+        suffix = os.sep + os.path.normpath(name)
+        for root in roots:
+            for path in self.listFiles(root):
+                if path.endswith(suffix):
+                    return path
+        return None
+
+    def _get(self, path, kind, read):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = os.path.normpath(os.path.abspath(path))
+        entry = self.files.get(key)
+        if entry is None or entry["mtime"] != st.st_mtime_ns or entry["size"] != st.st_size:
+            entry = {"mtime": st.st_mtime_ns, "size": st.st_size}
+            self.files[key] = entry
+            self.dirty = True
+        if kind not in entry:
+            Path.Log.debug("read {} of {}".format(kind, path))
+            try:
+                entry[kind] = read(path)
+            except Exception as e:
+                Path.Log.debug("Could not read {} ({})".format(path, e))
+                return None
+            self.dirty = True
+        return entry[kind]
+
+    def bit(self, path):
+        """bit(path) ... return the declaration of the tool bit file path"""
+        return copy.deepcopy(self._get(path, "bit", _readJson))
+
+    def library(self, path):
+        """library(path) ... return the content of the tool library file path"""
+        return copy.deepcopy(self._get(path, "library", _readJson))
+
+    def shape(self, path):
+        """shape(path) ... return a dictionary with the name and label of the tool shape file
+        path and the specs of its properties, each with name, type, group, doc, value and
+        for enumerations enum"""
+        info = self._get(path, "shape", _readShape)
+        # opening the shape is the expensive part, don't risk doing it again
+        self.save()
+        return copy.deepcopy(info)
+
+    def thumbnail(self, path):
+        """thumbnail(path) ... return the PNG thumbnail of the shape file path, None if it
+        doesn't have one"""
+        data = self._get(path, "thumbnail", _readThumbnail)
+        return base64.b64decode(data) if data else None
+
+
+_Index = None
+
+
+def index():
+    """index() ... return the tool index kept in the cache directory of FreeCAD"""
+    global _Index
+    if _Index is None:
+        _Index = ToolIndex(os.path.join(FreeCAD.getUserCachePath(), "CAM", "ToolIndex.json"))
+        atexit.register(_Index.save)
+    return _Index
@@ -26,12 +26,16 @@ from CAMTests.TestCAMSanity import TestCAMSanity
 from CAMTests.TestPathProfile import TestPathProfile
 
 from CAMTests.TestPathAdaptive import TestPathAdaptive
+from CAMTests.TestPathBoundBoxTree import TestPathBoundBoxTree
+from CAMTests.TestPathCommandArray import TestPathCommandArray
 from CAMTests.TestPathCore import TestPathCore
+from CAMTests.TestPathCycleTime import TestPathCycleTime
 from CAMTests.TestPathDepthParams import depthTestCases
 from CAMTests.TestPathDressupDogbone import TestDressupDogbone
 from CAMTests.TestPathDressupDogboneII import TestDressupDogboneII
 from CAMTests.TestPathDressupHoldingTags import TestHoldingTags
 from CAMTests.TestPathDrillable import TestPathDrillable
+from CAMTests.TestPathDropCutterScanner import TestPathDropCutterScanner
 from CAMTests.TestPathDrillGenerator import TestPathDrillGenerator
 from CAMTests.TestPathGeneratorDogboneII import TestGeneratorDogboneII
 from CAMTests.TestPathGeom import TestPathGeom
@@ -44,6 +48,7 @@ from CAMTests.TestPathLog import TestPathLog
 from CAMTests.TestPathOpUtil import TestPathOpUtil
 
 # from CAMTests.TestPathPost import TestPathPost
+from CAMTests.TestPathPost import TestBatchPost
 from CAMTests.TestPathPost import TestPathPostUtils
 from CAMTests.TestPathPost import TestBuildPostList
 
@@ -55,15 +60,19 @@ from CAMTests.TestPathPost import TestFileNameGenerator
 from CAMTests.TestPathPreferences import TestPathPreferences
 from CAMTests.TestPathProfile import TestPathProfile
 from CAMTests.TestPathPropertyBag import TestPathPropertyBag
+from CAMTests.TestPathRecompute import TestPathRecompute
 from CAMTests.TestPathRotationGenerator import TestPathRotationGenerator
 from CAMTests.TestPathSetupSheet import TestPathSetupSheet
+from CAMTests.TestPathSimulation import TestPathSimulation
 from CAMTests.TestPathStock import TestPathStock
+from CAMTests.TestPathSurfaceCache import TestPathSurfaceCache
 from CAMTests.TestPathTapGenerator import TestPathTapGenerator
 from CAMTests.TestPathThreadMilling import TestPathThreadMilling
 from CAMTests.TestPathThreadMillingGenerator import TestPathThreadMillingGenerator
 from CAMTests.TestPathToolBit import TestPathToolBit
 from CAMTests.TestPathToolChangeGenerator import TestPathToolChangeGenerator
 from CAMTests.TestPathToolController import TestPathToolController
+from CAMTests.TestPathToolIndex import TestPathToolIndex
 from CAMTests.TestPathUtil import TestPathUtil
 from CAMTests.TestPathVcarve import TestPathVcarve
 from CAMTests.TestPathVoronoi import TestPathVoronoi
@@ -87,6 +96,7 @@ from CAMTests.TestSnapmakerPost import TestSnapmakerPost
 False if TestCAMSanity.__name__ else True
 False if depthTestCases.__name__ else True
 False if TestApp.__name__ else True
+False if TestBatchPost.__name__ else True
 False if TestBuildPostList.__name__ else True
 False if TestDressupDogbone.__name__ else True
 False if TestDressupDogboneII.__name__ else True
@@ -96,9 +106,13 @@ False if TestHoldingTags.__name__ else True
 False if TestPathLanguage.__name__ else True
 # False if TestOutputNameSubstitution.__name__ else True
 False if TestPathAdaptive.__name__ else True
+False if TestPathBoundBoxTree.__name__ else True
+False if TestPathCommandArray.__name__ else True
 False if TestPathCore.__name__ else True
+False if TestPathCycleTime.__name__ else True
 False if TestPathOpDeburr.__name__ else True
 False if TestPathDrillable.__name__ else True
+False if TestPathDropCutterScanner.__name__ else True
 False if TestPathGeom.__name__ else True
 False if TestPathHelpers.__name__ else True
 False if TestPathHelix.__name__ else True
@@ -111,15 +125,19 @@ False if TestPathPostUtils.__name__ else True
 False if TestPathPreferences.__name__ else True
 False if TestPathProfile.__name__ else True
 False if TestPathPropertyBag.__name__ else True
+False if TestPathRecompute.__name__ else True
 False if TestPathRotationGenerator.__name__ else True
 False if TestPathSetupSheet.__name__ else True
+False if TestPathSimulation.__name__ else True
 False if TestPathStock.__name__ else True
+False if TestPathSurfaceCache.__name__ else True
 False if TestPathTapGenerator.__name__ else True
 False if TestPathThreadMilling.__name__ else True
 False if TestPathThreadMillingGenerator.__name__ else True
 False if TestPathToolBit.__name__ else True
 False if TestPathToolChangeGenerator.__name__ else True
 False if TestPathToolController.__name__ else True
+False if TestPathToolIndex.__name__ else True
 False if TestPathUtil.__name__ else True
 False if TestPathVcarve.__name__ else True
 False if TestPathVoronoi.__name__ else True
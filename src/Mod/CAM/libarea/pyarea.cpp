@@ -411,7 +411,8 @@ void init_pyarea(py::module& m)
 
     py::class_<Adaptive2d>(m, "Adaptive2d")
         .def(py::init<>())
-        .def("Execute", &Adaptive2d::Execute)
+        // the progress callback acquires the GIL, Python threads can run meanwhile
+        .def("Execute", &Adaptive2d::Execute, py::call_guard<py::gil_scoped_release>())
         .def_readwrite("stepOverFactor", &Adaptive2d::stepOverFactor)
         .def_readwrite("toolDiameter", &Adaptive2d::toolDiameter)
         .def_readwrite("stockToLeave", &Adaptive2d::stockToLeave)
@@ -30,11 +30,15 @@
 #include <SMESHDS_Mesh.hxx>
 #include <SMESH_Group.hxx>
 #include <SMESH_Mesh.hxx>
+#include <SMESH_MeshEditor.hxx>
 #include <TopoDS.hxx>
 #include <TopoDS_Face.hxx>
 #include <TopoDS_Shape.hxx>
 #include <algorithm>
+#include <cstdint>
+#include <cstring>
 #include <stdexcept>
+#include <type_traits>
 #endif
 
 #include "Mod/Fem/App/FemMesh.h"
@@ -1078,6 +1082,239 @@ PyObject* FemMeshPy::addVolumeList(PyObject* args)
 }
 
 
+namespace
+{
+
+bool isIntFormat(char type)
+{
+    return type == 'i' || type == 'l' || type == 'q' || type == 'n';
+}
+
+template<typename T, typename Source>
+void copyBufferValues(const Py_buffer& view, std::vector<T>& values)
+{
+    const auto* data = static_cast<const Source*>(view.buf);
+    values.assign(data, data + view.len / view.itemsize);
+}
+
+template<typename T>
+void appendSequenceValues(const Py::Object& obj, std::vector<T>& values)
+{
+    Py::Sequence seq(obj);
+    values.reserve(values.size() + seq.size());
+    for (Py::Sequence::iterator it = seq.begin(); it != seq.end(); ++it) {
+        Py::Object item(*it);
+        if (PySequence_Check(item.ptr()) && !PyUnicode_Check(item.ptr())) {
+            // nested sequences like [(x, y, z), ...]
+            appendSequenceValues(item, values);
+        }
+        else if constexpr (std::is_floating_point_v<T>) {
+            values.push_back(static_cast<double>(Py::Float(item)));
+        }
+        else {
+            values.push_back(static_cast<int>(Py::Long(item)));
+        }
+    }
+}
+
+// Copies the values of a C contiguous buffer (e.g. a NumPy array) or a sequence of numbers.
+// Returns false with a Python exception set if the object can not be used.
+template<typename T>
+bool getArrayValues(PyObject* obj, std::vector<T>& values)
+{
+    Py_buffer view;
+    if (PyObject_CheckBuffer(obj)
+        && PyObject_GetBuffer(obj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0) {
+        const char* format = view.format ? view.format : "B";
+        char type = format[std::strlen(format) - 1];
+        bool valid = true;
+        if constexpr (std::is_floating_point_v<T>) {
+            if (type == 'd' && view.itemsize == sizeof(double)) {
+                copyBufferValues<T, double>(view, values);
+            }
+            else if (type == 'f' && view.itemsize == sizeof(float)) {
+                copyBufferValues<T, float>(view, values);
+            }
+            else {
+                valid = false;
+            }
+        }
+        else {
+            if (isIntFormat(type) && view.itemsize == sizeof(std::int32_t)) {
+                copyBufferValues<T, std::int32_t>(view, values);
+            }
+            else if (isIntFormat(type) && view.itemsize == sizeof(std::int64_t)) {
+                copyBufferValues<T, std::int64_t>(view, values);
+            }
+            else {
+                valid = false;
+            }
+        }
+        PyBuffer_Release(&view);
+        if (!valid) {
+            PyErr_SetString(PyExc_TypeError,
+                            std::is_floating_point_v<T>
+                                ? "Buffer of float or double values expected"
+                                : "Buffer of 32 or 64 bit integer values expected");
+        }
+        return valid;
+    }
+    PyErr_Clear();
+
+    try {
+        appendSequenceValues(Py::Object(obj), values);
+    }
+    catch (const Py::Exception&) {
+        return false;
+    }
+    return true;
+}
+
+// Returns the values as memoryview with the struct format of T, e.g. "i" or "d"
+template<typename T>
+Py::Object makeMemoryView(const std::vector<T>& values, const char* format)
+{
+    Py::Object bytes(PyBytes_FromStringAndSize(reinterpret_cast<const char*>(values.data()),
+                                               static_cast<Py_ssize_t>(values.size() * sizeof(T))),
+                     true);
+    Py::Object view(PyMemoryView_FromObject(bytes.ptr()), true);
+    return Py::Object(PyObject_CallMethod(view.ptr(), "cast", "s", format), true);
+}
+
+bool getBulkElementType(const char* typeStr, SMDSAbs_ElementType& type)
+{
+    std::string typeName(typeStr);
+    if (typeName == "Edge") {
+        type = SMDSAbs_Edge;
+    }
+    else if (typeName == "Face") {
+        type = SMDSAbs_Face;
+    }
+    else if (typeName == "Volume") {
+        type = SMDSAbs_Volume;
+    }
+    else {
+        PyErr_SetString(PyExc_ValueError, "Invalid element type, [Edge|Face|Volume] are allowed");
+        return false;
+    }
+    return true;
+}
+
+}  // namespace
+
+PyObject* FemMeshPy::addNodes(PyObject* args)
+{
+    PyObject* coordsObj = nullptr;
+    PyObject* idsObj = Py_None;
+    if (!PyArg_ParseTuple(args, "O|O", &coordsObj, &idsObj)) {
+        return nullptr;
+    }
+
+    std::vector<double> coords;
+    std::vector<int> ids;
+    if (!getArrayValues(coordsObj, coords)) {
+        return nullptr;
+    }
+    if (idsObj != Py_None && !getArrayValues(idsObj, ids)) {
+        return nullptr;
+    }
+    if (coords.size() % 3 != 0) {
+        PyErr_SetString(PyExc_ValueError, "Number of coordinates is not a multiple of 3");
+        return nullptr;
+    }
+    std::size_t count = coords.size() / 3;
+    if (idsObj != Py_None && ids.size() != count) {
+        PyErr_SetString(PyExc_ValueError, "Number of IDs differs from number of nodes");
+        return nullptr;
+    }
+
+    SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+    for (std::size_t i = 0; i < count; ++i) {
+        const double* xyz = &coords[3 * i];
+        SMDS_MeshNode* node = ids.empty() ? meshDS->AddNode(xyz[0], xyz[1], xyz[2])
+                                          : meshDS->AddNodeWithID(xyz[0], xyz[1], xyz[2], ids[i]);
+        if (!node) {
+            PyErr_Format(Base::PyExc_FC_GeneralError, "Failed to add node %zu", i);
+            return nullptr;
+        }
+    }
+    Py_Return;
+}
+
+PyObject* FemMeshPy::addElements(PyObject* args)
+{
+    const char* typeStr = nullptr;
+    PyObject* nodesObj = nullptr;
+    int nodeCount = 0;
+    PyObject* idsObj = Py_None;
+    if (!PyArg_ParseTuple(args, "sOi|O", &typeStr, &nodesObj, &nodeCount, &idsObj)) {
+        return nullptr;
+    }
+
+    SMDSAbs_ElementType type {};
+    if (!getBulkElementType(typeStr, type)) {
+        return nullptr;
+    }
+    std::vector<int> validCounts;
+    switch (type) {
+        case SMDSAbs_Edge:
+            validCounts = {2, 3};
+            break;
+        case SMDSAbs_Face:
+            validCounts = {3, 4, 6, 8};
+            break;
+        default:
+            validCounts = {4, 5, 6, 8, 10, 13, 15, 20};
+            break;
+    }
+    if (std::find(validCounts.begin(), validCounts.end(), nodeCount) == validCounts.end()) {
+        PyErr_Format(PyExc_ValueError,
+                     "Unknown node count %d for element type %s",
+                     nodeCount,
+                     typeStr);
+        return nullptr;
+    }
+
+    std::vector<int> nodeIds;
+    std::vector<int> ids;
+    if (!getArrayValues(nodesObj, nodeIds)) {
+        return nullptr;
+    }
+    if (idsObj != Py_None && !getArrayValues(idsObj, ids)) {
+        return nullptr;
+    }
+    if (nodeIds.size() % nodeCount != 0) {
+        PyErr_SetString(PyExc_ValueError, "Number of node IDs is not a multiple of the node count");
+        return nullptr;
+    }
+    std::size_t count = nodeIds.size() / nodeCount;
+    if (idsObj != Py_None && ids.size() != count) {
+        PyErr_SetString(PyExc_ValueError, "Number of IDs differs from number of elements");
+        return nullptr;
+    }
+
+    SMESH_MeshEditor editor(getFemMeshPtr()->getSMesh());
+    SMESHDS_Mesh* meshDS = editor.GetMeshDS();
+    SMESH_MeshEditor::ElemFeatures features(type);
+    std::vector<const SMDS_MeshNode*> elemNodes(nodeCount);
+    for (std::size_t i = 0; i < count; ++i) {
+        for (int j = 0; j < nodeCount; ++j) {
+            int nodeId = nodeIds[i * nodeCount + j];
+            elemNodes[j] = meshDS->FindNode(nodeId);
+            if (!elemNodes[j]) {
+                PyErr_Format(PyExc_ValueError, "Node %d of element %zu not found", nodeId, i);
+                return nullptr;
+            }
+        }
+        features.SetID(ids.empty() ? -1 : ids[i]);
+        if (!editor.AddElement(elemNodes, features)) {
+            PyErr_Format(Base::PyExc_FC_GeneralError, "Failed to add element %zu", i);
+            return nullptr;
+        }
+    }
+    Py_Return;
+}
+
 PyObject* FemMeshPy::copy(PyObject* args) const
 {
     if (!PyArg_ParseTuple(args, "")) {
@@ -1783,6 +2020,87 @@ PyObject* FemMeshPy::getIdByElementType(PyObject* args) const
     return Py::new_reference_to(tuple);
 }
 
+PyObject* FemMeshPy::getNodeArrays(PyObject* args) const
+{
+    if (!PyArg_ParseTuple(args, "")) {
+        return nullptr;
+    }
+
+    SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+    std::vector<const SMDS_MeshNode*> nodes;
+    nodes.reserve(meshDS->NbNodes());
+    SMDS_NodeIteratorPtr aNodeIter = meshDS->nodesIterator();
+    while (aNodeIter->more()) {
+        nodes.push_back(aNodeIter->next());
+    }
+    std::sort(nodes.begin(), nodes.end(), [](const SMDS_MeshNode* a, const SMDS_MeshNode* b) {
+        return a->GetID() < b->GetID();
+    });
+
+    // get the actual transform of the FemMesh, see getNodes()
+    Base::Matrix4D Mtrx = getFemMeshPtr()->getTransform();
+    std::vector<int> ids;
+    std::vector<double> coords;
+    ids.reserve(nodes.size());
+    coords.reserve(3 * nodes.size());
+    for (const SMDS_MeshNode* aNode : nodes) {
+        Base::Vector3d vec = Mtrx * Base::Vector3d(aNode->X(), aNode->Y(), aNode->Z());
+        ids.push_back(aNode->GetID());
+        coords.push_back(vec.x);
+        coords.push_back(vec.y);
+        coords.push_back(vec.z);
+    }
+
+    Py::Tuple result(2);
+    result.setItem(0, makeMemoryView(ids, "i"));
+    result.setItem(1, makeMemoryView(coords, "d"));
+    return Py::new_reference_to(result);
+}
+
+PyObject* FemMeshPy::getElementArrays(PyObject* args) const
+{
+    const char* typeStr = nullptr;
+    if (!PyArg_ParseTuple(args, "s", &typeStr)) {
+        return nullptr;
+    }
+
+    SMDSAbs_ElementType type {};
+    if (!getBulkElementType(typeStr, type)) {
+        return nullptr;
+    }
+
+    std::vector<const SMDS_MeshElement*> elements;
+    SMDS_ElemIteratorPtr aElemIter =
+        getFemMeshPtr()->getSMesh()->GetMeshDS()->elementsIterator(type);
+    while (aElemIter->more()) {
+        elements.push_back(aElemIter->next());
+    }
+    std::sort(elements.begin(),
+              elements.end(),
+              [](const SMDS_MeshElement* a, const SMDS_MeshElement* b) {
+                  return a->GetID() < b->GetID();
+              });
+
+    std::vector<int> ids;
+    std::vector<int> nodeCounts;
+    std::vector<int> nodes;
+    ids.reserve(elements.size());
+    nodeCounts.reserve(elements.size());
+    for (const SMDS_MeshElement* elem : elements) {
+        ids.push_back(elem->GetID());
+        nodeCounts.push_back(elem->NbNodes());
+        for (int i = 0; i < elem->NbNodes(); i++) {
+            nodes.push_back(elem->GetNode(i)->GetID());
+        }
+    }
+
+    Py::Tuple result(3);
+    result.setItem(0, makeMemoryView(ids, "i"));
+    result.setItem(1, makeMemoryView(nodeCounts, "i"));
+    result.setItem(2, makeMemoryView(nodes, "i"));
+    return Py::new_reference_to(result);
+}
+
 // ===== Attributes ============================================================
 
 Py::Dict FemMeshPy::getNodes() const
@@ -59,6 +59,9 @@ FreeCAD.__unit_test__ += ["TestFemApp"]
 # add import and export file types
 FreeCAD.addExportType("FEM mesh Python (*.meshpy)", "feminout.importPyMesh")
 
+FreeCAD.addImportType("FEM mesh NumPy (*.npz *.NPZ)", "feminout.importNpzMesh")
+FreeCAD.addExportType("FEM mesh NumPy (*.npz)", "feminout.importNpzMesh")
+
 FreeCAD.addExportType("FEM mesh TetGen (*.poly)", "feminout.convert2TetGen")
 
 # see FemMesh::read() and FemMesh::write() methods in src/Mod/Fem/App/FemMesh.cpp
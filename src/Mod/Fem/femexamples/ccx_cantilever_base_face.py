@@ -23,7 +23,6 @@
 
 import FreeCAD
 
-import Fem
 import ObjectsFem
 
 from .manager import get_meshname
@@ -104,15 +103,9 @@ def setup_cantilever_base_face(doc=None, solvertype="ccxtools"):
     analysis.addObject(con_force)
 
     # mesh
-    from .meshes.mesh_canticcx_tria6 import create_nodes, create_elements
-
-    fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
-    if not control:
-        FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
-    if not control:
-        FreeCAD.Console.PrintError("Error on creating elements.\n")
+    from .meshes import load_mesh
+
+    fem_mesh = load_mesh("mesh_canticcx_tria6")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
     femmesh_obj.FemMesh = fem_mesh
     femmesh_obj.Shape = geom_obj
@@ -22,10 +22,6 @@
 # *                                                                         *
 # ***************************************************************************
 
-import FreeCAD
-
-import Fem
-
 from . import manager
 from .ccx_cantilever_faceload import setup as setup_with_faceload
 from .manager import get_meshname
@@ -82,15 +78,9 @@ def setup(doc=None, solvertype="ccxtools"):
     doc.recompute()
 
     # load the hexa20 mesh
-    from .meshes.mesh_canticcx_hexa20 import create_nodes, create_elements
-
-    new_fem_mesh = Fem.FemMesh()
-    control = create_nodes(new_fem_mesh)
-    if not control:
-        FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(new_fem_mesh)
-    if not control:
-        FreeCAD.Console.PrintError("Error on creating elements.\n")
+    from .meshes import load_mesh
+
+    new_fem_mesh = load_mesh("mesh_canticcx_hexa20")
 
     # overwrite mesh with the hexa20 mesh
     femmesh_obj.FemMesh = new_fem_mesh
@@ -28,7 +28,6 @@ from FreeCAD import Vector
 
 from CompoundTools import CompoundFilter
 
-import Fem
 import ObjectsFem
 
 from . import manager
@@ -173,15 +172,9 @@ def setup(doc=None, solvertype="ccxtools"):
     analysis.addObject(con_transform2)
 
     # mesh
-    from .meshes.mesh_transform_beam_hinged_tetra10 import create_nodes, create_elements
-
-    fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
-    if not control:
-        FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
-    if not control:
-        FreeCAD.Console.PrintError("Error on creating elements.\n")
+    from .meshes import load_mesh
+
+    fem_mesh = load_mesh("mesh_transform_beam_hinged_tetra10")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
     femmesh_obj.FemMesh = fem_mesh
     femmesh_obj.Shape = geom_obj
@@ -24,7 +24,6 @@
 import sys
 import FreeCAD
 
-import Fem
 import ObjectsFem
 
 from BOPTools import SplitFeatures
@@ -221,18 +220,9 @@ def setup(doc=None, solvertype="elmer"):
         FreeCAD.Console.PrintError(f"Unexpected error when creating mesh: {error}\n")
     if error:
         # try to create from existing rough mesh
-        from .meshes.mesh_capacitance_two_balls_tetra10 import (
-            create_nodes,
-            create_elements,
-        )
+        from .meshes import load_mesh
 
-        fem_mesh = Fem.FemMesh()
-        control = create_nodes(fem_mesh)
-        if not control:
-            FreeCAD.Console.PrintError("Error on creating nodes.\n")
-        control = create_elements(fem_mesh)
-        if not control:
-            FreeCAD.Console.PrintError("Error on creating elements.\n")
+        fem_mesh = load_mesh("mesh_capacitance_two_balls_tetra10")
         femmesh_obj.FemMesh = fem_mesh
 
     doc.recompute()
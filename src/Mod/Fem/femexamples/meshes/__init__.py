@@ -0,0 +1,44 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM example meshes"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+# The meshes of the examples are stored as compressed NumPy archives,
+# see feminout/importNpzMesh.py for the file layout. A new example mesh
+# is written with importNpzMesh.write("mesh_<name>.npz", femmesh_obj.FemMesh).
+
+import os
+
+
+def get_mesh_file(name):
+    """Returns the file of the example mesh name, e.g. "mesh_canticcx_tetra10"."""
+    return os.path.join(os.path.dirname(__file__), name + ".npz")
+
+
+def load_mesh(name):
+    """Returns a new FemMesh of the example mesh name, e.g. "mesh_canticcx_tetra10"."""
+    from feminout import importNpzMesh
+
+    return importNpzMesh.read(get_mesh_file(name))
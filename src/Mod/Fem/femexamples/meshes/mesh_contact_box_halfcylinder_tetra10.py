@@ -1,4307 +0,0 @@
-def create_nodes(femmesh):
-    # nodes
-    femmesh.addNode(286.0, 25.0, -247.0, 1)
-    femmesh.addNode(286.0, 25.0, 253.0, 2)
-    femmesh.addNode(286.0, 0.0, -247.0, 3)
-    femmesh.addNode(286.0, 0.0, 253.0, 4)
-    femmesh.addNode(186.0, 25.0, -247.0, 5)
-    femmesh.addNode(186.0, 25.0, 253.0, 6)
-    femmesh.addNode(186.0, 0.0, -247.0, 7)
-    femmesh.addNode(186.0, 0.0, 253.0, 8)
-    femmesh.addNode(6.661338147750939e-15, -42.00000000000001, -30.0, 9)
-    femmesh.addNode(-6.661338147750939e-15, -41.99999999999999, 30.0, 10)
-    femmesh.addNode(500.0, -41.99999999999999, 30.00000000000011, 11)
-    femmesh.addNode(500.0, -42.00000000000001, -29.99999999999989, 12)
-    femmesh.addNode(210.6, 25.0, 253.0, 13)
-    femmesh.addNode(235.1, 25.0, 253.0, 14)
-    femmesh.addNode(260.3, 25.0, 253.0, 15)
-    femmesh.addNode(219.4, 0.0, 253.0, 16)
-    femmesh.addNode(253.0, 0.0, 253.0, 17)
-    femmesh.addNode(210.6, 25.0, -247.0, 18)
-    femmesh.addNode(235.1, 25.0, -247.0, 19)
-    femmesh.addNode(260.3, 25.0, -247.0, 20)
-    femmesh.addNode(219.4, 0.0, -247.0, 21)
-    femmesh.addNode(253.0, 0.0, -247.0, 22)
-    femmesh.addNode(286.0, 25.0, -218.0, 23)
-    femmesh.addNode(286.0, 25.0, -191.0, 24)
-    femmesh.addNode(286.0, 25.0, -163.5, 25)
-    femmesh.addNode(286.0, 25.0, -136.5, 26)
-    femmesh.addNode(286.0, 25.0, -108.5, 27)
-    femmesh.addNode(286.0, 25.0, -79.5, 28)
-    femmesh.addNode(286.0, 25.0, -52.5, 29)
-    femmesh.addNode(286.0, 25.0, -24.0, 30)
-    femmesh.addNode(286.0, 25.0, 2.5, 31)
-    femmesh.addNode(286.0, 25.0, 29.0, 32)
-    femmesh.addNode(286.0, 25.0, 58.0, 33)
-    femmesh.addNode(286.0, 25.0, 85.5, 34)
-    femmesh.addNode(286.0, 25.0, 112.5, 35)
-    femmesh.addNode(286.0, 25.0, 140.0, 36)
-    femmesh.addNode(286.0, 25.0, 167.5, 37)
-    femmesh.addNode(286.0, 25.0, 196.5, 38)
-    femmesh.addNode(286.0, 25.0, 224.0, 39)
-    femmesh.addNode(186.0, 25.0, -218.0, 40)
-    femmesh.addNode(186.0, 25.0, -191.0, 41)
-    femmesh.addNode(186.0, 25.0, -163.5, 42)
-    femmesh.addNode(186.0, 25.0, -136.5, 43)
-    femmesh.addNode(186.0, 25.0, -108.5, 44)
-    femmesh.addNode(186.0, 25.0, -79.5, 45)
-    femmesh.addNode(186.0, 25.0, -52.5, 46)
-    femmesh.addNode(186.0, 25.0, -24.0, 47)
-    femmesh.addNode(186.0, 25.0, 2.5, 48)
-    femmesh.addNode(186.0, 25.0, 29.0, 49)
-    femmesh.addNode(186.0, 25.0, 58.0, 50)
-    femmesh.addNode(186.0, 25.0, 85.5, 51)
-    femmesh.addNode(186.0, 25.0, 112.5, 52)
-    femmesh.addNode(186.0, 25.0, 140.0, 53)
-    femmesh.addNode(186.0, 25.0, 167.5, 54)
-    femmesh.addNode(186.0, 25.0, 196.5, 55)
-    femmesh.addNode(186.0, 25.0, 224.0, 56)
-    femmesh.addNode(286.0, 0.0, -218.0, 57)
-    femmesh.addNode(286.0, 0.0, -188.0, 58)
-    femmesh.addNode(286.0, 0.0, -158.5, 59)
-    femmesh.addNode(286.0, 0.0, -128.5, 60)
-    femmesh.addNode(286.0, 0.0, -99.0, 61)
-    femmesh.addNode(286.0, 0.0, -71.5, 62)
-    femmesh.addNode(286.0, 0.0, -43.0, 63)
-    femmesh.addNode(286.0, 0.0, -17.5, 64)
-    femmesh.addNode(286.0, 0.0, 2.0, 65)
-    femmesh.addNode(286.0, 0.0, 22.0, 66)
-    femmesh.addNode(286.0, 0.0, 49.5, 67)
-    femmesh.addNode(286.0, 0.0, 77.5, 68)
-    femmesh.addNode(286.0, 0.0, 107.0, 69)
-    femmesh.addNode(286.0, 0.0, 137.0, 70)
-    femmesh.addNode(286.0, 0.0, 166.5, 71)
-    femmesh.addNode(286.0, 0.0, 194.5, 72)
-    femmesh.addNode(286.0, 0.0, 224.0, 73)
-    femmesh.addNode(186.0, 0.0, -218.0, 74)
-    femmesh.addNode(186.0, 0.0, -188.0, 75)
-    femmesh.addNode(186.0, 0.0, -158.0, 76)
-    femmesh.addNode(186.0, 0.0, -128.0, 77)
-    femmesh.addNode(186.0, 0.0, -98.5, 78)
-    femmesh.addNode(186.0, 0.0, -70.5, 79)
-    femmesh.addNode(186.0, 0.0, -42.0, 80)
-    femmesh.addNode(186.0, 0.0, -18.5, 81)
-    femmesh.addNode(186.0, 0.0, 1.0, 82)
-    femmesh.addNode(186.0, 0.0, 21.0, 83)
-    femmesh.addNode(186.0, 0.0, 48.5, 84)
-    femmesh.addNode(186.0, 0.0, 76.5, 85)
-    femmesh.addNode(186.0, 0.0, 106.5, 86)
-    femmesh.addNode(186.0, 0.0, 136.0, 87)
-    femmesh.addNode(186.0, 0.0, 166.0, 88)
-    femmesh.addNode(186.0, 0.0, 194.0, 89)
-    femmesh.addNode(186.0, 0.0, 223.5, 90)
-    femmesh.addNode(2.033928581113287e-15, -42.0, -11.16, 91)
-    femmesh.addNode(-3.148592497836944e-15, -42.0, 12.18, 92)
-    femmesh.addNode(5.765397028143619e-15, -26.972801239178704, -25.96503990759057, 93)
-    femmesh.addNode(3.3185794468392703e-15, -15.987878965065299, -14.945553160184724, 94)
-    femmesh.addNode(-2.092717656418627e-17, -12.000148043944254, 0.09424762457638586, 95)
-    femmesh.addNode(-3.336708411976486e-15, -16.034960092409435, 15.027198760821301, 96)
-    femmesh.addNode(-5.775851138464172e-15, -27.054446839815274, 26.0121210349347, 97)
-    femmesh.addNode(500.0, -42.0, -11.15999999999989, 98)
-    femmesh.addNode(500.0, -42.0, 12.180000000000106, 99)
-    femmesh.addNode(15.499999999999993, -42.0, 30.000000000000004, 100)
-    femmesh.addNode(30.499999999999993, -42.0, 30.000000000000007, 101)
-    femmesh.addNode(45.49999999999999, -42.0, 30.00000000000001, 102)
-    femmesh.addNode(60.99999999999999, -42.0, 30.000000000000014, 103)
-    femmesh.addNode(76.0, -42.0, 30.000000000000018, 104)
-    femmesh.addNode(91.0, -42.0, 30.00000000000002, 105)
-    femmesh.addNode(106.5, -42.0, 30.000000000000025, 106)
-    femmesh.addNode(121.5, -42.0, 30.00000000000003, 107)
-    femmesh.addNode(136.5, -42.0, 30.000000000000032, 108)
-    femmesh.addNode(152.0, -42.0, 30.000000000000036, 109)
-    femmesh.addNode(167.0, -42.0, 30.000000000000036, 110)
-    femmesh.addNode(182.0, -42.0, 30.00000000000004, 111)
-    femmesh.addNode(197.0, -42.0, 30.000000000000043, 112)
-    femmesh.addNode(212.5, -42.0, 30.000000000000046, 113)
-    femmesh.addNode(227.5, -42.0, 30.00000000000005, 114)
-    femmesh.addNode(242.5, -42.0, 30.000000000000053, 115)
-    femmesh.addNode(258.0, -42.0, 30.000000000000057, 116)
-    femmesh.addNode(273.0, -42.0, 30.00000000000006, 117)
-    femmesh.addNode(288.0, -42.0, 30.000000000000064, 118)
-    femmesh.addNode(303.5, -42.0, 30.000000000000068, 119)
-    femmesh.addNode(318.5, -42.0, 30.00000000000007, 120)
-    femmesh.addNode(333.5, -42.0, 30.000000000000075, 121)
-    femmesh.addNode(348.5, -42.0, 30.000000000000078, 122)
-    femmesh.addNode(364.0, -42.0, 30.00000000000008, 123)
-    femmesh.addNode(379.0, -42.0, 30.000000000000085, 124)
-    femmesh.addNode(394.0, -42.0, 30.00000000000009, 125)
-    femmesh.addNode(409.5, -42.0, 30.000000000000092, 126)
-    femmesh.addNode(424.5, -42.0, 30.000000000000096, 127)
-    femmesh.addNode(439.5, -42.0, 30.000000000000096, 128)
-    femmesh.addNode(455.0, -42.0, 30.0000000000001, 129)
-    femmesh.addNode(470.0, -42.0, 30.000000000000103, 130)
-    femmesh.addNode(485.0, -42.0, 30.000000000000107, 131)
-    femmesh.addNode(15.500000000000007, -42.00000000000001, -29.999999999999996, 132)
-    femmesh.addNode(30.500000000000007, -42.00000000000001, -29.999999999999993, 133)
-    femmesh.addNode(45.50000000000001, -42.00000000000001, -29.99999999999999, 134)
-    femmesh.addNode(61.00000000000001, -42.00000000000001, -29.999999999999986, 135)
-    femmesh.addNode(76.0, -42.00000000000001, -29.999999999999982, 136)
-    femmesh.addNode(91.0, -42.00000000000001, -29.99999999999998, 137)
-    femmesh.addNode(106.5, -42.00000000000001, -29.999999999999975, 138)
-    femmesh.addNode(121.5, -42.00000000000001, -29.99999999999997, 139)
-    femmesh.addNode(136.5, -42.00000000000001, -29.999999999999968, 140)
-    femmesh.addNode(152.0, -42.00000000000001, -29.999999999999964, 141)
-    femmesh.addNode(167.0, -42.00000000000001, -29.999999999999964, 142)
-    femmesh.addNode(182.0, -42.00000000000001, -29.99999999999996, 143)
-    femmesh.addNode(197.0, -42.00000000000001, -29.999999999999957, 144)
-    femmesh.addNode(212.5, -42.00000000000001, -29.999999999999954, 145)
-    femmesh.addNode(227.5, -42.00000000000001, -29.99999999999995, 146)
-    femmesh.addNode(242.5, -42.00000000000001, -29.999999999999947, 147)
-    femmesh.addNode(258.0, -42.00000000000001, -29.999999999999943, 148)
-    femmesh.addNode(273.0, -42.00000000000001, -29.99999999999994, 149)
-    femmesh.addNode(288.0, -42.00000000000001, -29.999999999999936, 150)
-    femmesh.addNode(303.5, -42.00000000000001, -29.999999999999932, 151)
-    femmesh.addNode(318.5, -42.00000000000001, -29.99999999999993, 152)
-    femmesh.addNode(333.5, -42.00000000000001, -29.999999999999925, 153)
-    femmesh.addNode(348.5, -42.00000000000001, -29.999999999999922, 154)
-    femmesh.addNode(364.0, -42.00000000000001, -29.99999999999992, 155)
-    femmesh.addNode(379.0, -42.00000000000001, -29.999999999999915, 156)
-    femmesh.addNode(394.0, -42.00000000000001, -29.99999999999991, 157)
-    femmesh.addNode(409.5, -42.00000000000001, -29.999999999999908, 158)
-    femmesh.addNode(424.5, -42.00000000000001, -29.999999999999904, 159)
-    femmesh.addNode(439.5, -42.00000000000001, -29.999999999999904, 160)
-    femmesh.addNode(455.0, -42.00000000000001, -29.9999999999999, 161)
-    femmesh.addNode(470.0, -42.00000000000001, -29.999999999999897, 162)
-    femmesh.addNode(485.0, -42.00000000000001, -29.999999999999893, 163)
-    femmesh.addNode(500.0, -26.972801239178704, -25.96503990759046, 164)
-    femmesh.addNode(500.0, -15.987878965065299, -14.945553160184613, 165)
-    femmesh.addNode(500.0, -12.000148043944254, 0.09424762457649688, 166)
-    femmesh.addNode(500.0, -16.034960092409435, 15.027198760821413, 167)
-    femmesh.addNode(500.0, -27.054446839815274, 26.01212103493481, 168)
-    femmesh.addNode(219.01094776796427, 25.0, -225.94776586682863, 169)
-    femmesh.addNode(248.36090071567412, 25.0, -220.99121178749652, 170)
-    femmesh.addNode(266.0362235555465, 25.0, -200.0952744559916, 171)
-    femmesh.addNode(264.7575525808734, 25.0, -175.4409671181077, 172)
-    femmesh.addNode(263.47078235540437, 25.0, -149.75576600029245, 173)
-    femmesh.addNode(263.06542009199734, 25.0, -122.29786772854173, 174)
-    femmesh.addNode(262.47287278185854, 25.0, -94.92583872276805, 175)
-    femmesh.addNode(262.6215127112912, 25.0, -65.03438686941885, 176)
-    femmesh.addNode(261.8892123186845, 25.0, -37.51063255308287, 177)
-    femmesh.addNode(261.1938192337153, 25.0, -10.907108753258427, 178)
-    femmesh.addNode(261.0501265652292, 25.0, 15.617897192431542, 179)
-    femmesh.addNode(261.06965064941016, 25.0, 42.314800358461696, 180)
-    femmesh.addNode(262.28249557755555, 25.0, 71.96398055206328, 181)
-    femmesh.addNode(262.879614496454, 25.0, 99.14338912375575, 182)
-    femmesh.addNode(262.95263530044645, 25.0, 126.63095511867982, 183)
-    femmesh.addNode(262.67796278329354, 25.0, 154.4350528444885, 184)
-    femmesh.addNode(261.8491435094554, 25.0, 182.35660309511707, 185)
-    femmesh.addNode(263.7438788821728, 25.0, 210.10084597017777, 186)
-    femmesh.addNode(268.254333440523, 25.0, 233.18712171573134, 187)
-    femmesh.addNode(219.60143553307407, 25.0, 230.2177938082126, 188)
-    femmesh.addNode(244.75793121010977, 25.0, 230.34313022111496, 189)
-    femmesh.addNode(204.64174271399176, 25.0, -204.49178759711384, 190)
-    femmesh.addNode(211.37459282223494, 25.0, -150.44077808282955, 191)
-    femmesh.addNode(210.1549314144909, 25.0, -94.1138097461228, 192)
-    femmesh.addNode(210.90489928475017, 25.0, -36.9807708004285, 193)
-    femmesh.addNode(210.86850647824724, 25.0, 15.571859388234031, 194)
-    femmesh.addNode(210.3536651130794, 25.0, 71.3390596559862, 195)
-    femmesh.addNode(210.50218549686542, 25.0, 126.5364673239788, 196)
-    femmesh.addNode(210.01547543207315, 25.0, 181.9433613476341, 197)
-    femmesh.addNode(210.18165314339572, 25.0, -65.82597141217167, 198)
-    femmesh.addNode(213.4298624276899, 25.0, -179.19420054719802, 199)
-    femmesh.addNode(210.48653691358842, 25.0, -122.41080256909662, 200)
-    femmesh.addNode(211.04239411776445, 25.0, -10.79923796955066, 201)
-    femmesh.addNode(210.04326011389614, 25.0, 42.18599725442766, 202)
-    femmesh.addNode(210.49924025067475, 25.0, 98.99200130270015, 203)
-    femmesh.addNode(210.35256436502146, 25.0, 154.2128080088586, 204)
-    femmesh.addNode(207.35597255856896, 25.0, 207.48770726494564, 205)
-    femmesh.addNode(244.0155467128818, 25.0, -189.4497732303327, 206)
-    femmesh.addNode(236.21084098167265, 25.0, -50.63056954193752, 207)
-    femmesh.addNode(239.143330567885, 25.0, -163.18649041968698, 208)
-    femmesh.addNode(237.1515715212895, 25.0, -136.0137363442572, 209)
-    femmesh.addNode(236.09483248571726, 25.0, -108.62500910825025, 210)
-    femmesh.addNode(235.51320829477328, 25.0, -79.54341336386108, 211)
-    femmesh.addNode(235.8217294265968, 25.0, 28.300078021601678, 212)
-    femmesh.addNode(236.05596063423116, 25.0, 2.1981376498451652, 213)
-    femmesh.addNode(227.16290669206938, 25.0, -204.4569944076646, 214)
-    femmesh.addNode(236.6672812890968, 25.0, 112.89949221120179, 215)
-    femmesh.addNode(236.56243141587842, 25.0, 140.7350475087402, 216)
-    femmesh.addNode(235.79789723975057, 25.0, 169.10302296771692, 217)
-    femmesh.addNode(234.95378672146072, 25.0, 201.58799004291564, 218)
-    femmesh.addNode(236.2566606721575, 25.0, -24.1874750696378, 219)
-    femmesh.addNode(236.0081686035295, 25.0, 57.22091669200495, 220)
-    femmesh.addNode(236.4288124823278, 25.0, 85.23162303895066, 221)
-    femmesh.addNode(233.27935944678393, 0.0, -224.1761374230519, 222)
-    femmesh.addNode(263.0033308716532, 0.0, -219.7795252760468, 223)
-    femmesh.addNode(259.0073180103244, 0.0, -171.1673880940639, 224)
-    femmesh.addNode(261.42927737501566, 0.0, -112.61075761555827, 225)
-    femmesh.addNode(260.2641883821176, 0.0, -54.77442990249932, 226)
-    femmesh.addNode(268.37528736388293, 0.0, -7.287322497572973, 227)
-    femmesh.addNode(260.7877909297746, 0.0, 33.71976836099975, 228)
-    femmesh.addNode(261.17252015862573, 0.0, 91.43219880542182, 229)
-    femmesh.addNode(261.58891220039686, 0.0, 151.18248307406344, 230)
-    femmesh.addNode(262.4560658374062, 0.0, 206.4600635201353, 231)
-    femmesh.addNode(264.4748968087673, 0.0, 233.3699215160467, 232)
-    femmesh.addNode(211.38805484440377, 0.0, -201.3688030612116, 233)
-    femmesh.addNode(219.36719373821418, 0.0, -171.67407076806364, 234)
-    femmesh.addNode(212.47105237208595, 0.0, -142.13355384950762, 235)
-    femmesh.addNode(209.21091567434905, 0.0, -112.38686476347053, 236)
-    femmesh.addNode(209.58355335216265, 0.0, -84.33459313145846, 237)
-    femmesh.addNode(209.24718110323946, 0.0, -55.57514355021863, 238)
-    femmesh.addNode(208.78151118634355, 0.0, -29.777760904622767, 239)
-    femmesh.addNode(207.5604205200544, 0.0, -9.529479858889317, 240)
-    femmesh.addNode(208.61566866012626, 0.0, 10.833810681460932, 241)
-    femmesh.addNode(211.21722410963017, 0.0, 33.330355572740984, 242)
-    femmesh.addNode(209.99701111755303, 0.0, 60.79909357866154, 243)
-    femmesh.addNode(209.531121130093, 0.0, 91.44646783856115, 244)
-    femmesh.addNode(209.30672186833868, 0.0, 121.1897983433264, 245)
-    femmesh.addNode(209.35248563992695, 0.0, 150.7844968570202, 246)
-    femmesh.addNode(209.48499412117226, 0.0, 179.76698525876463, 247)
-    femmesh.addNode(209.02827990191176, 0.0, 208.2382801103617, 248)
-    femmesh.addNode(206.2559622034555, 0.0, 232.73812085523184, 249)
-    femmesh.addNode(206.67154999118895, 0.0, -227.40643855858053, 250)
-    femmesh.addNode(259.18891252348726, 0.0, -25.801072450162394, 251)
-    femmesh.addNode(246.07076462129123, 0.0, -195.05742903317673, 252)
-    femmesh.addNode(253.2503156187158, 0.0, -144.5885928181776, 253)
-    femmesh.addNode(261.6796509094196, 0.0, -84.97508640901643, 254)
-    femmesh.addNode(264.19746775495054, 0.0, 11.075041274664613, 255)
-    femmesh.addNode(260.4445386187658, 0.0, 61.19341081692011, 256)
-    femmesh.addNode(261.4676913119073, 0.0, 121.46710012390247, 257)
-    femmesh.addNode(261.99748856896576, 0.0, 180.55075498867672, 258)
-    femmesh.addNode(234.02457060401434, 0.0, 226.75121772306647, 259)
-    femmesh.addNode(233.85289236040649, 0.0, -41.10666627282188, 260)
-    femmesh.addNode(247.45851865456666, 0.0, -3.822610695035195, 261)
-    femmesh.addNode(236.5059769729549, 0.0, 18.559246959776317, 262)
-    femmesh.addNode(234.60430752631274, 0.0, 194.0975298088366, 263)
-    femmesh.addNode(235.70195572609737, 0.0, 44.796744787622174, 264)
-    femmesh.addNode(226.29870199673758, 0.0, -0.1691605428058267, 265)
-    femmesh.addNode(234.89387354327866, 0.0, 75.75086851689724, 266)
-    femmesh.addNode(234.00763626322936, 0.0, 106.21089098480701, 267)
-    femmesh.addNode(234.00456446354855, 0.0, 136.09971952696702, 268)
-    femmesh.addNode(234.94260127301618, 0.0, -96.73178242094309, 269)
-    femmesh.addNode(235.17695451783447, 0.0, -69.72032076872637, 270)
-    femmesh.addNode(234.46776945645325, 0.0, 165.86706025533925, 271)
-    femmesh.addNode(233.6172828965191, 0.0, -122.57279008167161, 272)
-    femmesh.addNode(230.20360936404782, 0.0, -18.401824010759128, 273)
-    femmesh.addNode(-9.171148756375701e-16, -26.703765524531267, 4.1303182121773, 274)
-    femmesh.addNode(485.9939936400858, -42.0, 5.872275534821917, 275)
-    femmesh.addNode(21.865112747142394, -42.0, 13.008248341535491, 276)
-    femmesh.addNode(37.0723460137244, -42.0, 16.329261490241734, 277)
-    femmesh.addNode(51.483841238968076, -42.0, 12.344766231202868, 278)
-    femmesh.addNode(68.41571915001211, -42.0, 16.008110719532965, 279)
-    femmesh.addNode(83.73735904799737, -42.0, 16.435408469820842, 280)
-    femmesh.addNode(98.87267006484566, -42.0, 16.51638605692915, 281)
-    femmesh.addNode(113.99809217490856, -42.0, 16.492639247453425, 282)
-    femmesh.addNode(129.09590515473994, -42.0, 16.492171493753858, 283)
-    femmesh.addNode(144.25527348939224, -42.0, 16.51771288645685, 284)
-    femmesh.addNode(159.41513843996805, -42.0, 16.49175018649626, 285)
-    femmesh.addNode(174.51203156175086, -42.0, 16.48862488014518, 286)
-    femmesh.addNode(189.61048118005021, -42.0, 16.48894784587108, 287)
-    femmesh.addNode(204.7796977668202, -42.0, 16.513497832356762, 288)
-    femmesh.addNode(219.95639754368756, -42.0, 16.487505414025094, 289)
-    femmesh.addNode(235.0869316728625, -42.0, 16.489231099619175, 290)
-    femmesh.addNode(250.26809966371462, -42.0, 16.5164408660213, 291)
-    femmesh.addNode(265.4477559261988, -42.0, 16.49159441178189, 292)
-    femmesh.addNode(280.5755907408505, -42.0, 16.49229683131398, 293)
-    femmesh.addNode(295.7499219984785, -42.0, 16.51917735178516, 294)
-    femmesh.addNode(310.9167326241355, -42.0, 16.494380086938335, 295)
-    femmesh.addNode(326.01601763436, -42.0, 16.493210525527104, 296)
-    femmesh.addNode(341.11569001186837, -42.0, 16.494240099206337, 297)
-    femmesh.addNode(356.2837359684864, -42.0, 16.518965793457866, 298)
-    femmesh.addNode(371.45957144528916, -42.0, 16.49219750867816, 299)
-    femmesh.addNode(386.58465346660273, -42.0, 16.493049637239025, 300)
-    femmesh.addNode(401.7512336651522, -42.0, 16.519051976748585, 301)
-    femmesh.addNode(416.9036284946566, -42.0, 16.4931498092254, 302)
-    femmesh.addNode(431.96875722635906, -42.0, 16.5036545200509, 303)
-    femmesh.addNode(446.9547918552717, -42.0, 16.58738218595876, 304)
-    femmesh.addNode(461.52082355654437, -42.0, 16.76359061646508, 305)
-    femmesh.addNode(18.15451988374015, -42.0, -9.182573895937352, 306)
-    femmesh.addNode(52.8002878652568, -42.0, -12.710001142234091, 307)
-    femmesh.addNode(83.84603772410253, -42.0, -15.597163473444347, 308)
-    femmesh.addNode(114.00413173140855, -42.0, -15.54521826189881, 309)
-    femmesh.addNode(144.25418910384195, -42.0, -15.567523682591762, 310)
-    femmesh.addNode(174.5116241476956, -42.0, -15.527968575729417, 311)
-    femmesh.addNode(204.78153771870586, -42.0, -15.566422333717398, 312)
-    femmesh.addNode(235.09135778027004, -42.0, -15.525717014306345, 313)
-    femmesh.addNode(265.4477603478134, -42.0, -15.524033153845444, 314)
-    femmesh.addNode(295.7510526235118, -42.0, -15.561780020055572, 315)
-    femmesh.addNode(326.0176500123843, -42.0, -15.522735766112902, 316)
-    femmesh.addNode(356.2861513541365, -42.0, -15.56124428679692, 317)
-    femmesh.addNode(386.5894314132528, -42.0, -15.524698951113557, 318)
-    femmesh.addNode(416.94457133234715, -42.0, -15.52595612199076, 319)
-    femmesh.addNode(447.43143954532894, -42.0, -15.46617862421742, 320)
-    femmesh.addNode(479.5283080843179, -42.0, -14.017493208300252, 321)
-    femmesh.addNode(36.219700992125894, -42.0, -5.922135720189402, 322)
-    femmesh.addNode(189.61471057387098, -42.0, -15.527844709893095, 323)
-    femmesh.addNode(159.41120642280904, -42.0, -15.527134909142582, 324)
-    femmesh.addNode(129.1011241251587, -42.0, -15.531655793629128, 325)
-    femmesh.addNode(68.77030413285499, -42.0, -15.409085013697165, 326)
-    femmesh.addNode(98.91045357763346, -42.0, -15.604869708177489, 327)
-    femmesh.addNode(219.95523572027437, -42.0, -15.525318600663425, 328)
-    femmesh.addNode(250.26787966576296, -42.0, -15.558766010749082, 329)
-    femmesh.addNode(280.57734929344304, -42.0, -15.521775741040436, 330)
-    femmesh.addNode(310.912921465958, -42.0, -15.523165646030165, 331)
-    femmesh.addNode(341.1192908147064, -42.0, -15.522898729935036, 332)
-    femmesh.addNode(371.4564512801671, -42.0, -15.521392911153711, 333)
-    femmesh.addNode(401.7618957047684, -42.0, -15.560765752706672, 334)
-    femmesh.addNode(432.11662792615505, -42.0, -15.506231827005166, 335)
-    femmesh.addNode(463.0530422616464, -42.0, -15.10858892480119, 336)
-    femmesh.addNode(76.9926299087664, -42.0, 0.841152839009979, 337)
-    femmesh.addNode(182.07869493471483, -42.0, 0.9749276489552443, 338)
-    femmesh.addNode(63.196339991330404, -42.0, 0.5511306534567382, 339)
-    femmesh.addNode(106.52203148081547, -42.0, 0.9614214518553794, 340)
-    femmesh.addNode(121.58447464710116, -42.0, 0.9731147732922452, 341)
-    femmesh.addNode(136.69741088728512, -42.0, 0.9752749033829673, 342)
-    femmesh.addNode(151.826399168752, -42.0, 0.9763634741976333, 343)
-    femmesh.addNode(166.9563428380294, -42.0, 0.979646531037929, 344)
-    femmesh.addNode(212.37141000959585, -42.0, 0.9723539856384988, 345)
-    femmesh.addNode(227.531152914707, -42.0, 0.9767879646728019, 346)
-    femmesh.addNode(242.69333712836155, -42.0, 0.9775340347459718, 347)
-    femmesh.addNode(257.8547723426169, -42.0, 0.9782909999662621, 348)
-    femmesh.addNode(273.01503252791287, -42.0, 0.9806382740311292, 349)
-    femmesh.addNode(288.17187500924763, -42.0, 0.9793429196790626, 350)
-    femmesh.addNode(303.3208060331422, -42.0, 0.9801139972174227, 351)
-    femmesh.addNode(318.459698774248, -42.0, 0.9820577432451643, 352)
-    femmesh.addNode(333.5843655597885, -42.0, 0.9823336836596184, 353)
-    femmesh.addNode(348.7240586743257, -42.0, 0.9799131414156861, 354)
-    femmesh.addNode(363.8746148827545, -42.0, 0.9799014828182848, 355)
-    femmesh.addNode(379.0292776614799, -42.0, 0.9804787633532328, 356)
-    femmesh.addNode(394.18055434709163, -42.0, 0.9778766221318023, 357)
-    femmesh.addNode(409.32797226578305, -42.0, 0.9750264032432483, 358)
-    femmesh.addNode(424.4765475207445, -42.0, 0.9781045871059888, 359)
-    femmesh.addNode(439.6323412200513, -42.0, 1.0065183629353172, 360)
-    femmesh.addNode(454.8186957481373, -42.0, 1.1592837020295832, 361)
-    femmesh.addNode(474.84088726679875, -42.0, 17.264942937472313, 362)
-    femmesh.addNode(470.1594666836982, -42.0, 1.8745236119281472, 363)
-    femmesh.addNode(91.6064231400529, -42.0, 0.9361426339075933, 364)
-    femmesh.addNode(197.21734972564443, -42.0, 0.9760433949091905, 365)
-    femmesh.addNode(500.0, -27.114119775936658, -2.872340480487605, 366)
-    femmesh.addNode(487.6413091928042, -19.526844564069396, -19.873532266622824, 367)
-    femmesh.addNode(487.42981347217403, -13.090131887094735, -8.013708610526198, 368)
-    femmesh.addNode(487.33208566013167, -12.768285594180938, 6.745878215372108, 369)
-    femmesh.addNode(486.3487965789357, -19.204362996749165, 19.50279296962426, 370)
-    femmesh.addNode(482.9369499032484, -30.359942718924863, 27.64975707837766, 371)
-    femmesh.addNode(21.06691951553042, -29.092918188291453, 27.081492556834135, 372)
-    femmesh.addNode(52.27467264399592, -29.56093524367516, 27.299627616287328, 373)
-    femmesh.addNode(82.97167018122923, -28.8447588008302, 26.961817983801957, 374)
-    femmesh.addNode(114.27124085297969, -28.862313139890226, 26.970376044202652, 375)
-    femmesh.addNode(144.99586280676536, -29.133510922442714, 27.10080181133209, 376)
-    femmesh.addNode(175.286271399431, -29.141983286565612, 27.104822563467266, 377)
-    femmesh.addNode(205.59317854251827, -29.15276182504482, 27.10993307398557, 378)
-    femmesh.addNode(235.94151794694608, -29.11685711416709, 27.09288890803666, 379)
-    femmesh.addNode(266.2914779960582, -29.12943492449523, 27.098866298005902, 380)
-    femmesh.addNode(296.4771469265164, -29.19695846618965, 27.130833519881595, 381)
-    femmesh.addNode(326.2694435858752, -29.493880041081095, 27.26897437699361, 382)
-    femmesh.addNode(355.933234886371, -29.51269468696224, 27.277595312251833, 383)
-    femmesh.addNode(385.89761377112654, -29.138800460860036, 27.103312462029997, 384)
-    femmesh.addNode(416.686583347773, -28.947388987523627, 27.01165203679674, 385)
-    femmesh.addNode(448.30248825602484, -28.89844567033225, 26.987946830886738, 386)
-    femmesh.addNode(464.1002517674928, -30.002246317129003, 27.49643443367087, 387)
-    femmesh.addNode(13.03386926438596, -19.069826603044127, -19.344434548095144, 388)
-    femmesh.addNode(13.824813517988611, -13.123515933208225, 8.133183137020886, 389)
-    femmesh.addNode(24.529544291096187, -32.65847442948109, -28.508523287173976, 390)
-    femmesh.addNode(37.520700252727494, -30.167427665422444, -27.567920341349463, 391)
-    femmesh.addNode(52.6501984160283, -29.112217917538068, -27.090682401795874, 392)
-    femmesh.addNode(68.31666556792611, -29.156128864360284, -27.11152843812167, 393)
-    femmesh.addNode(83.55873162114602, -29.427794453801944, -27.238569119984, 394)
-    femmesh.addNode(98.65733380308633, -29.632848967644456, -27.332280829504626, 395)
-    femmesh.addNode(113.63352629887997, -29.496497029428106, -27.27017443040837, 396)
-    femmesh.addNode(128.4847050675656, -29.283740972094698, -27.171616741283824, 397)
-    femmesh.addNode(143.48447611924175, -29.211123453834983, -27.137513458070334, 398)
-    femmesh.addNode(158.55870060406744, -29.148071319137305, -27.10770977382665, 399)
-    femmesh.addNode(173.60109153707748, -29.12360923170266, -27.096098626593918, 400)
-    femmesh.addNode(188.6778049415174, -29.11467168463713, -27.091849589965346, 401)
-    femmesh.addNode(203.85555559704224, -29.13506006134808, -27.10153723268989, 402)
-    femmesh.addNode(219.06711386237313, -29.11888442276321, -27.093852835760824, 403)
-    femmesh.addNode(234.2171010285104, -29.129703664171622, -27.098993933870677, 404)
-    femmesh.addNode(249.40703185034027, -29.16109132849325, -27.113878810024687, 405)
-    femmesh.addNode(264.59002280061276, -29.141522705380897, -27.104604067644335, 406)
-    femmesh.addNode(279.7059658558054, -29.135808044470892, -27.101892283220685, 407)
-    femmesh.addNode(294.90388868329546, -29.1340267426551, -27.10104669826024, 408)
-    femmesh.addNode(310.19357312656047, -29.038809604593176, -27.05563792509817, 409)
-    femmesh.addNode(325.54425245156426, -28.881218092070057, -26.97957674338436, 410)
-    femmesh.addNode(340.98025245265063, -28.789137006566513, -26.934607830238136, 411)
-    femmesh.addNode(356.5050241580312, -28.897297918237484, -26.987389613606055, 412)
-    femmesh.addNode(371.96288094685923, -29.025997234403214, -27.049496339826412, 413)
-    femmesh.addNode(387.2107433550031, -29.11669361801788, -27.09281116215101, 414)
-    femmesh.addNode(402.3662240013042, -29.237421785116588, -27.149891294607027, 415)
-    femmesh.addNode(417.3874499314312, -29.380776360836563, -27.216818233305187, 416)
-    femmesh.addNode(432.4389659130214, -29.35081696171998, -27.202907353150394, 417)
-    femmesh.addNode(447.7679234746828, -28.869427687206404, -26.97384048923128, 418)
-    femmesh.addNode(463.40686649767207, -28.245510950556394, -26.661095832480903, 419)
-    femmesh.addNode(479.39104345474715, -28.827637912350866, -26.95345760810397, 420)
-    femmesh.addNode(36.755251835100225, -29.258844341948816, 27.159951260952415, 421)
-    femmesh.addNode(67.45411501398166, -29.077508535887446, 27.074142910901887, 422)
-    femmesh.addNode(98.63770026528789, -28.77420122512995, 26.927277002449525, 423)
-    femmesh.addNode(129.707121657156, -29.023733394178713, 27.048410396447494, 424)
-    femmesh.addNode(160.2234460901728, -29.131954096602247, 27.100062631441467, 425)
-    femmesh.addNode(190.43026150675576, -29.13182811702125, 27.10000281162564, 426)
-    femmesh.addNode(220.82975893015868, -29.114913830332927, 27.091964757105693, 427)
-    femmesh.addNode(251.1653785710911, -29.138769886107312, 27.103297953524088, 428)
-    femmesh.addNode(281.4054557680455, -29.13731415338411, 27.10260712203294, 429)
-    femmesh.addNode(311.49479438673467, -29.270488125363478, 27.1654104963185, 430)
-    femmesh.addNode(341.056915007696, -29.63946768513668, 27.335274662845876, 431)
-    femmesh.addNode(370.82998412754966, -29.25736365444854, 27.15925659816622, 432)
-    femmesh.addNode(401.16848116939855, -29.07918129345594, 27.074941254832407, 433)
-    femmesh.addNode(432.265661347843, -28.924207278172577, 27.000437861186807, 434)
-    femmesh.addNode(13.529652785052722, -12.7216292265427, -6.540413201928563, 435)
-    femmesh.addNode(12.8584805625372, -19.673630096309864, 20.038293513261042, 436)
-    femmesh.addNode(12.822022651013201, -29.575021525128644, -27.306041637318714, 437)
-    femmesh.addNode(475.92985728233367, -12.040732848568151, -1.5627897328611857, 438)
-    femmesh.addNode(473.1892748358605, -14.318711316697932, 11.564871673810105, 439)
-    femmesh.addNode(472.80745720219943, -21.611845229205368, 22.00734298006301, 440)
-    femmesh.addNode(27.762029293810766, -12.055269973493381, 1.8202042851374949, 441)
-    femmesh.addNode(44.04887660724049, -20.034394948155725, 20.43311514934504, 442)
-    femmesh.addNode(90.27076841129181, -18.180988723831835, 18.238824025297646, 443)
-    femmesh.addNode(73.87358579610671, -18.51628283132969, 18.66855720032751, 444)
-    femmesh.addNode(153.61835899583804, -18.70273533469325, 18.900726417644666, 445)
-    femmesh.addNode(183.89549421656673, -18.712005572150968, 18.912147300834825, 446)
-    femmesh.addNode(138.37629748848144, -18.650443207465287, 18.836087640277036, 447)
-    femmesh.addNode(214.26712134314897, -18.702432646530948, 18.900353314437666, 448)
-    femmesh.addNode(244.66030361361555, -18.694528080993454, 18.890605565529107, 449)
-    femmesh.addNode(274.91699010765467, -18.703399141577275, 18.90154460469672, 450)
-    femmesh.addNode(304.94835276809926, -18.793516848064144, 19.012078784786265, 451)
-    femmesh.addNode(333.8791175375166, -19.52965271408958, 19.876707293980584, 452)
-    femmesh.addNode(362.5118872101588, -18.993782352773692, 19.253933353173736, 453)
-    femmesh.addNode(392.53829410261227, -18.683593915509192, 18.877108022764595, 454)
-    femmesh.addNode(424.0586649944002, -18.351112494633448, 18.45887644897493, 455)
-    femmesh.addNode(168.8005518706591, -18.70851877058564, 18.907852922525077, 456)
-    femmesh.addNode(229.50538960372452, -18.688260588464928, 18.882870693003337, 457)
-    femmesh.addNode(58.06526906961566, -18.82874359685402, 19.05499610862377, 458)
-    femmesh.addNode(122.8339210324715, -18.507616815895688, 18.657650772034884, 459)
-    femmesh.addNode(28.688020609298427, -17.38752415707795, 17.153018185776485, 460)
-    femmesh.addNode(199.10739936008258, -18.709623456638585, 18.90921363961077, 461)
-    femmesh.addNode(472.5219432308752, -16.868484410678363, -16.383129254928072, 462)
-    femmesh.addNode(42.63682228913443, -18.68914979474376, -18.883968404657548, 463)
-    femmesh.addNode(60.5504714705189, -18.689294051965877, -18.884146478045704, 464)
-    femmesh.addNode(76.40181595130588, -18.916551914838884, -19.1612740834129, 465)
-    femmesh.addNode(91.20732947408764, -19.493785831233936, -19.83608640305927, 466)
-    femmesh.addNode(105.82823019011535, -19.522028509585247, -19.86808490207601, 467)
-    femmesh.addNode(120.19012742530235, -19.002176009612676, -19.2639583602946, 468)
-    femmesh.addNode(134.95666747286964, -18.807023716723887, -19.028553574126192, 469)
-    femmesh.addNode(149.91496232259433, -18.737858485550472, -18.943937609740026, 470)
-    femmesh.addNode(164.94786579257212, -18.703089185524828, -18.90116257012749, 471)
-    femmesh.addNode(180.02742028947065, -18.688015500181816, -18.882568116658163, 472)
-    femmesh.addNode(195.1702170088982, -18.689376990030095, -18.884248856839925, 473)
-    femmesh.addNode(210.36477325138827, -18.69443497834168, -18.890490703559145, 474)
-    femmesh.addNode(225.57243794269806, -18.698746898622836, -18.89580916249842, 475)
-    femmesh.addNode(240.7634899807546, -18.712517957725446, -18.912778223485258, 476)
-    femmesh.addNode(255.92987246507116, -18.718448991228577, -18.920078821875244, 477)
-    femmesh.addNode(271.07459170777423, -18.711985759418614, -18.912122903853927, 478)
-    femmesh.addNode(286.2357572855509, -18.702416004192767, -18.90033280019969, 479)
-    femmesh.addNode(301.4942245673521, -18.658341231225858, -18.84587397607515, 480)
-    femmesh.addNode(316.98056229818457, -18.517121845840958, -18.66961257222328, 481)
-    femmesh.addNode(332.91480360186114, -18.196340339785312, -18.258855023814203, 482)
-    femmesh.addNode(349.0408917369611, -18.198166187475607, -18.261235094072024, 483)
-    femmesh.addNode(365.02835885825556, -18.513620483241333, -18.665207665460777, 484)
-    femmesh.addNode(380.5590839010981, -18.65031789275448, -18.835932296825003, 485)
-    femmesh.addNode(395.7931202577917, -18.74573802314167, -18.953609152655794, 486)
-    femmesh.addNode(410.73146973737056, -18.916016727421663, -19.160629328686465, 487)
-    femmesh.addNode(425.25056396208777, -19.309316397383405, -19.62480261419061, 488)
-    femmesh.addNode(440.0905801251331, -18.965177792845907, -19.21970254412895, 489)
-    femmesh.addNode(455.4021873772085, -17.64862014146645, -17.52170936254231, 490)
-    femmesh.addNode(26.9571809802172, -14.81775449508999, -12.693523124444189, 491)
-    femmesh.addNode(106.70211810550617, -18.185142749710224, 18.24424770025669, 492)
-    femmesh.addNode(259.8392975661982, -18.696350014308695, 18.89285307581657, 493)
-    femmesh.addNode(290.011399392059, -18.72789256067043, 18.93169340899814, 494)
-    femmesh.addNode(319.68161440863304, -18.998416557248365, 19.259469336566276, 495)
-    femmesh.addNode(348.23051213097773, -19.537625219600713, 19.885716462448247, 496)
-    femmesh.addNode(377.3288532481738, -18.777163197468617, 18.992099695478576, 497)
-    femmesh.addNode(408.03999271263285, -18.5755293423727, 18.742843285103813, 498)
-    femmesh.addNode(440.26054797705973, -18.554894794859543, 18.717025455982572, 499)
-    femmesh.addNode(458.1393212831353, -17.963598641418628, 17.9513623363017, 500)
-    femmesh.addNode(26.29900890016255, -22.609650358342698, -22.89135952219265, 501)
-    femmesh.addNode(147.27031999441985, -12.78388509222492, 6.813121875886515, 502)
-    femmesh.addNode(80.28591447004588, -12.672138536869682, 6.3147875656617165, 503)
-    femmesh.addNode(460.995431589287, -12.009908942461756, -0.7709982883018778, 504)
-    femmesh.addNode(353.73372292318874, -13.033270611411908, 7.805676686124546, 505)
-    femmesh.addNode(45.16175716239633, -12.959904503314714, 7.5281374551345115, 506)
-    femmesh.addNode(268.614163368618, -12.789113618927669, 6.835504138838911, 507)
-    femmesh.addNode(298.78611374034995, -12.808587998747932, 6.91819813052197, 508)
-    femmesh.addNode(328.3337974520055, -13.03183702787842, 7.800354736844051, 509)
-    femmesh.addNode(341.0340439850676, -13.80708275871023, 10.254726589518981, 510)
-    femmesh.addNode(116.18887626393558, -12.663652762809782, 6.275247467550763, 511)
-    femmesh.addNode(383.50278542168957, -12.804429150146639, 6.90062625789819, 512)
-    femmesh.addNode(223.11325106343884, -12.790760524804007, 6.8425382191590876, 513)
-    femmesh.addNode(253.4940003031216, -12.788312518383165, 6.832079806058403, 514)
-    femmesh.addNode(431.7718252167359, -12.45232525575532, 5.1898860496475345, 515)
-    femmesh.addNode(238.3298373583552, -12.78803853758317, 6.8309082498797125, 516)
-    femmesh.addNode(63.505410174209, -12.791928873838678, 6.847523719499004, 517)
-    femmesh.addNode(131.95775825911764, -12.752639252334426, 6.677715874152747, 518)
-    femmesh.addNode(53.81324024647044, -12.740556111387363, -6.624571180773011, 519)
-    femmesh.addNode(414.5601526315719, -12.701175755357095, 6.448170118841955, 520)
-    femmesh.addNode(69.91702624542454, -12.830602604042355, -7.010439041650611, 521)
-    femmesh.addNode(85.34473121368869, -13.015148877989802, -7.738113816357562, 522)
-    femmesh.addNode(98.44488012905524, -13.783679762350019, -10.19015565368771, 523)
-    femmesh.addNode(111.33101250535886, -13.030482239705204, -7.795321721132744, 524)
-    femmesh.addNode(126.03485449944938, -12.863247865934387, -7.144905533176946, 525)
-    femmesh.addNode(141.06848217531066, -12.81334983873819, -6.9382600386635565, 526)
-    femmesh.addNode(156.13845928001712, -12.796113516242311, -6.8653488071469795, 527)
-    femmesh.addNode(171.221717511133, -12.788895325137187, -6.834571213632003, 528)
-    femmesh.addNode(186.3527587831071, -12.786435781150011, -6.824050529643457, 529)
-    femmesh.addNode(201.53279447959463, -12.788429884298605, -6.832581604010345, 530)
-    femmesh.addNode(216.74747823113893, -12.790438035062095, -6.841161437683827, 531)
-    femmesh.addNode(231.96193854235608, -12.793974612341277, -6.856243946610524, 532)
-    femmesh.addNode(247.1424029036264, -12.79640409145836, -6.866584741384121, 533)
-    femmesh.addNode(262.28875349759363, -12.796520179727732, -6.867078446249866, 534)
-    femmesh.addNode(277.4217989375392, -12.794214451040688, -6.857265524113713, 535)
-    femmesh.addNode(292.5918306732299, -12.78514399803737, -6.818518078335447, 536)
-    femmesh.addNode(307.8827136528345, -12.75626443629135, -6.693573804768352, 537)
-    femmesh.addNode(323.56273290043526, -12.66183922208647, -6.266763292904501, 538)
-    femmesh.addNode(341.0092549562979, -12.357278775803557, -4.616175735884974, 539)
-    femmesh.addNode(358.4692142136484, -12.661129775842717, -6.263441064627018, 540)
-    femmesh.addNode(374.21124489584713, -12.754549587906968, -6.686077339801439, 541)
-    femmesh.addNode(389.57819333189065, -12.791464232451116, -6.845541491789852, 542)
-    femmesh.addNode(404.74674699947656, -12.836546559049715, -7.035124973838334, 543)
-    femmesh.addNode(419.46910608292166, -12.970960186503685, -7.570657006260718, 544)
-    femmesh.addNode(432.42381667058527, -13.584559085988545, -9.620952014344626, 545)
-    femmesh.addNode(445.2983528287617, -12.621479617698128, -6.074746097300877, 546)
-    femmesh.addNode(447.52976699767623, -13.004720528082402, 7.698945924306478, 547)
-    femmesh.addNode(177.54257007545235, -12.795748674769133, 6.863796655842273, 548)
-    femmesh.addNode(313.7853595689452, -12.861904293560226, 7.139424248660171, 549)
-    femmesh.addNode(368.3747538735091, -12.861061037529762, 7.135981792397947, 550)
-    femmesh.addNode(162.42742574014426, -12.79320751770899, 6.852975477585611, 551)
-    femmesh.addNode(283.7181772226015, -12.795429653704332, 6.862439135487378, 552)
-    femmesh.addNode(98.37768987340587, -12.365413238775929, 4.668111769386334, 553)
-    femmesh.addNode(39.38687902961321, -12.62382179150713, -6.0860622624870055, 554)
-    femmesh.addNode(398.8579467253089, -12.770579871319548, 6.755812234002006, 555)
-    femmesh.addNode(207.89776883885975, -12.793712565325482, 6.855127590583117, 556)
-    femmesh.addNode(192.7218659096443, -12.796029004284541, 6.864989299438912, 557)
-    femmesh.addNode(201.25051207930875, 12.938213486742617, -21.271546003544096, 558)
-    femmesh.addNode(186.0, 12.5, 253.0, 559)
-    femmesh.addNode(198.3, 25.0, 253.0, 560)
-    femmesh.addNode(222.85, 25.0, 253.0, 561)
-    femmesh.addNode(247.7, 25.0, 253.0, 562)
-    femmesh.addNode(273.15, 25.0, 253.0, 563)
-    femmesh.addNode(286.0, 12.5, 253.0, 564)
-    femmesh.addNode(202.7, 0.0, 253.0, 565)
-    femmesh.addNode(236.2, 0.0, 253.0, 566)
-    femmesh.addNode(269.5, 0.0, 253.0, 567)
-    femmesh.addNode(186.0, 12.5, -247.0, 568)
-    femmesh.addNode(198.3, 25.0, -247.0, 569)
-    femmesh.addNode(222.85, 25.0, -247.0, 570)
-    femmesh.addNode(247.7, 25.0, -247.0, 571)
-    femmesh.addNode(273.15, 25.0, -247.0, 572)
-    femmesh.addNode(286.0, 12.5, -247.0, 573)
-    femmesh.addNode(202.7, 0.0, -247.0, 574)
-    femmesh.addNode(236.2, 0.0, -247.0, 575)
-    femmesh.addNode(269.5, 0.0, -247.0, 576)
-    femmesh.addNode(286.0, 25.0, -232.5, 577)
-    femmesh.addNode(286.0, 25.0, -204.5, 578)
-    femmesh.addNode(286.0, 25.0, -177.25, 579)
-    femmesh.addNode(286.0, 25.0, -150.0, 580)
-    femmesh.addNode(286.0, 25.0, -122.5, 581)
-    femmesh.addNode(286.0, 25.0, -94.0, 582)
-    femmesh.addNode(286.0, 25.0, -66.0, 583)
-    femmesh.addNode(286.0, 25.0, -38.25, 584)
-    femmesh.addNode(286.0, 25.0, -10.75, 585)
-    femmesh.addNode(286.0, 25.0, 15.75, 586)
-    femmesh.addNode(286.0, 25.0, 43.5, 587)
-    femmesh.addNode(286.0, 25.0, 71.75, 588)
-    femmesh.addNode(286.0, 25.0, 99.0, 589)
-    femmesh.addNode(286.0, 25.0, 126.25, 590)
-    femmesh.addNode(286.0, 25.0, 153.75, 591)
-    femmesh.addNode(286.0, 25.0, 182.0, 592)
-    femmesh.addNode(286.0, 25.0, 210.25, 593)
-    femmesh.addNode(286.0, 25.0, 238.5, 594)
-    femmesh.addNode(186.0, 25.0, -232.5, 595)
-    femmesh.addNode(186.0, 25.0, -204.5, 596)
-    femmesh.addNode(186.0, 25.0, -177.25, 597)
-    femmesh.addNode(186.0, 25.0, -150.0, 598)
-    femmesh.addNode(186.0, 25.0, -122.5, 599)
-    femmesh.addNode(186.0, 25.0, -94.0, 600)
-    femmesh.addNode(186.0, 25.0, -66.0, 601)
-    femmesh.addNode(186.0, 25.0, -38.25, 602)
-    femmesh.addNode(186.0, 25.0, -10.75, 603)
-    femmesh.addNode(186.0, 25.0, 15.75, 604)
-    femmesh.addNode(186.0, 25.0, 43.5, 605)
-    femmesh.addNode(186.0, 25.0, 71.75, 606)
-    femmesh.addNode(186.0, 25.0, 99.0, 607)
-    femmesh.addNode(186.0, 25.0, 126.25, 608)
-    femmesh.addNode(186.0, 25.0, 153.75, 609)
-    femmesh.addNode(186.0, 25.0, 182.0, 610)
-    femmesh.addNode(186.0, 25.0, 210.25, 611)
-    femmesh.addNode(186.0, 25.0, 238.5, 612)
-    femmesh.addNode(286.0, 0.0, -232.5, 613)
-    femmesh.addNode(286.0, 0.0, -203.0, 614)
-    femmesh.addNode(286.0, 0.0, -173.25, 615)
-    femmesh.addNode(286.0, 0.0, -143.5, 616)
-    femmesh.addNode(286.0, 0.0, -113.75, 617)
-    femmesh.addNode(286.0, 0.0, -85.25, 618)
-    femmesh.addNode(286.0, 0.0, -57.25, 619)
-    femmesh.addNode(286.0, 0.0, -30.25, 620)
-    femmesh.addNode(286.0, 0.0, -7.75, 621)
-    femmesh.addNode(286.0, 0.0, 12.0, 622)
-    femmesh.addNode(286.0, 0.0, 35.75, 623)
-    femmesh.addNode(286.0, 0.0, 63.5, 624)
-    femmesh.addNode(286.0, 0.0, 92.25, 625)
-    femmesh.addNode(286.0, 0.0, 122.0, 626)
-    femmesh.addNode(286.0, 0.0, 151.75, 627)
-    femmesh.addNode(286.0, 0.0, 180.5, 628)
-    femmesh.addNode(286.0, 0.0, 209.25, 629)
-    femmesh.addNode(286.0, 0.0, 238.5, 630)
-    femmesh.addNode(186.0, 0.0, -232.5, 631)
-    femmesh.addNode(186.0, 0.0, -203.0, 632)
-    femmesh.addNode(186.0, 0.0, -173.0, 633)
-    femmesh.addNode(186.0, 0.0, -143.0, 634)
-    femmesh.addNode(186.0, 0.0, -113.25, 635)
-    femmesh.addNode(186.0, 0.0, -84.5, 636)
-    femmesh.addNode(186.0, 0.0, -56.25, 637)
-    femmesh.addNode(186.0, 0.0, -30.25, 638)
-    femmesh.addNode(186.0, 0.0, -8.75, 639)
-    femmesh.addNode(186.0, 0.0, 11.0, 640)
-    femmesh.addNode(186.0, 0.0, 34.75, 641)
-    femmesh.addNode(186.0, 0.0, 62.5, 642)
-    femmesh.addNode(186.0, 0.0, 91.5, 643)
-    femmesh.addNode(186.0, 0.0, 121.25, 644)
-    femmesh.addNode(186.0, 0.0, 151.0, 645)
-    femmesh.addNode(186.0, 0.0, 180.0, 646)
-    femmesh.addNode(186.0, 0.0, 208.75, 647)
-    femmesh.addNode(186.0, 0.0, 238.25, 648)
-    femmesh.addNode(4.125588759507081e-15, -42.0, -20.58, 649)
-    femmesh.addNode(-5.573319583618281e-16, -42.0, 0.509999999999998, 650)
-    femmesh.addNode(-5.127009927718974e-15, -42.0, 21.090000000000003, 651)
-    femmesh.addNode(6.433454945796423e-15, -34.22025698456939, -28.973705296593646, 652)
-    femmesh.addNode(4.702872681622913e-15, -20.753501126805716, -21.179855656527835, 653)
-    femmesh.addNode(1.7072301781140045e-15, -13.001996939492777, -7.688681193989896, 654)
-    femmesh.addNode(-1.7375534763657081e-15, -13.038550835001782, 7.825245188696913, 655)
-    femmesh.addNode(-4.717670448338546e-15, -20.82014434347216, 21.246498873194277, 656)
-    femmesh.addNode(-6.43616047978389e-15, -34.26577835357819, 28.98588993845144, 657)
-    femmesh.addNode(500.0, -42.0, -20.57999999999989, 658)
-    femmesh.addNode(500.0, -42.0, 0.5100000000001081, 659)
-    femmesh.addNode(500.0, -42.0, 21.09000000000011, 660)
-    femmesh.addNode(7.749999999999993, -42.0, 30.0, 661)
-    femmesh.addNode(22.999999999999993, -42.0, 30.000000000000004, 662)
-    femmesh.addNode(37.99999999999999, -42.0, 30.000000000000007, 663)
-    femmesh.addNode(53.24999999999999, -42.0, 30.00000000000001, 664)
-    femmesh.addNode(68.5, -42.0, 30.000000000000014, 665)
-    femmesh.addNode(83.5, -42.0, 30.000000000000018, 666)
-    femmesh.addNode(98.75, -42.0, 30.00000000000002, 667)
-    femmesh.addNode(114.0, -42.0, 30.000000000000025, 668)
-    femmesh.addNode(129.0, -42.0, 30.00000000000003, 669)
-    femmesh.addNode(144.25, -42.0, 30.000000000000032, 670)
-    femmesh.addNode(159.5, -42.0, 30.000000000000036, 671)
-    femmesh.addNode(174.5, -42.0, 30.00000000000004, 672)
-    femmesh.addNode(189.5, -42.0, 30.000000000000043, 673)
-    femmesh.addNode(204.75, -42.0, 30.000000000000046, 674)
-    femmesh.addNode(220.0, -42.0, 30.00000000000005, 675)
-    femmesh.addNode(235.0, -42.0, 30.000000000000053, 676)
-    femmesh.addNode(250.25, -42.0, 30.000000000000057, 677)
-    femmesh.addNode(265.5, -42.0, 30.00000000000006, 678)
-    femmesh.addNode(280.5, -42.0, 30.000000000000064, 679)
-    femmesh.addNode(295.75, -42.0, 30.000000000000064, 680)
-    femmesh.addNode(311.0, -42.0, 30.000000000000068, 681)
-    femmesh.addNode(326.0, -42.0, 30.00000000000007, 682)
-    femmesh.addNode(341.0, -42.0, 30.000000000000075, 683)
-    femmesh.addNode(356.25, -42.0, 30.000000000000078, 684)
-    femmesh.addNode(371.5, -42.0, 30.00000000000008, 685)
-    femmesh.addNode(386.5, -42.0, 30.000000000000085, 686)
-    femmesh.addNode(401.75, -42.0, 30.00000000000009, 687)
-    femmesh.addNode(417.0, -42.0, 30.000000000000092, 688)
-    femmesh.addNode(432.0, -42.0, 30.000000000000096, 689)
-    femmesh.addNode(447.25, -42.0, 30.0000000000001, 690)
-    femmesh.addNode(462.5, -42.0, 30.000000000000103, 691)
-    femmesh.addNode(477.5, -42.0, 30.000000000000107, 692)
-    femmesh.addNode(492.5, -42.0, 30.00000000000011, 693)
-    femmesh.addNode(7.750000000000007, -42.00000000000001, -30.0, 694)
-    femmesh.addNode(23.000000000000007, -42.00000000000001, -29.999999999999996, 695)
-    femmesh.addNode(38.00000000000001, -42.00000000000001, -29.999999999999993, 696)
-    femmesh.addNode(53.25000000000001, -42.00000000000001, -29.99999999999999, 697)
-    femmesh.addNode(68.5, -42.00000000000001, -29.999999999999986, 698)
-    femmesh.addNode(83.5, -42.00000000000001, -29.999999999999982, 699)
-    femmesh.addNode(98.75, -42.00000000000001, -29.99999999999998, 700)
-    femmesh.addNode(114.0, -42.00000000000001, -29.999999999999975, 701)
-    femmesh.addNode(129.0, -42.00000000000001, -29.99999999999997, 702)
-    femmesh.addNode(144.25, -42.00000000000001, -29.999999999999968, 703)
-    femmesh.addNode(159.5, -42.00000000000001, -29.999999999999964, 704)
-    femmesh.addNode(174.5, -42.00000000000001, -29.99999999999996, 705)
-    femmesh.addNode(189.5, -42.00000000000001, -29.999999999999957, 706)
-    femmesh.addNode(204.75, -42.00000000000001, -29.999999999999954, 707)
-    femmesh.addNode(220.0, -42.00000000000001, -29.99999999999995, 708)
-    femmesh.addNode(235.0, -42.00000000000001, -29.999999999999947, 709)
-    femmesh.addNode(250.25, -42.00000000000001, -29.999999999999943, 710)
-    femmesh.addNode(265.5, -42.00000000000001, -29.99999999999994, 711)
-    femmesh.addNode(280.5, -42.00000000000001, -29.999999999999936, 712)
-    femmesh.addNode(295.75, -42.00000000000001, -29.999999999999936, 713)
-    femmesh.addNode(311.0, -42.00000000000001, -29.999999999999932, 714)
-    femmesh.addNode(326.0, -42.00000000000001, -29.99999999999993, 715)
-    femmesh.addNode(341.0, -42.00000000000001, -29.999999999999925, 716)
-    femmesh.addNode(356.25, -42.00000000000001, -29.999999999999922, 717)
-    femmesh.addNode(371.5, -42.00000000000001, -29.99999999999992, 718)
-    femmesh.addNode(386.5, -42.00000000000001, -29.999999999999915, 719)
-    femmesh.addNode(401.75, -42.00000000000001, -29.99999999999991, 720)
-    femmesh.addNode(417.0, -42.00000000000001, -29.999999999999908, 721)
-    femmesh.addNode(432.0, -42.00000000000001, -29.999999999999904, 722)
-    femmesh.addNode(447.25, -42.00000000000001, -29.9999999999999, 723)
-    femmesh.addNode(462.5, -42.00000000000001, -29.999999999999897, 724)
-    femmesh.addNode(477.5, -42.00000000000001, -29.999999999999893, 725)
-    femmesh.addNode(492.5, -42.00000000000001, -29.99999999999989, 726)
-    femmesh.addNode(500.0, -34.22025698456939, -28.973705296593536, 727)
-    femmesh.addNode(500.0, -20.753501126805716, -21.179855656527725, 728)
-    femmesh.addNode(500.0, -13.001996939492777, -7.688681193989785, 729)
-    femmesh.addNode(500.0, -13.038550835001782, 7.825245188697024, 730)
-    femmesh.addNode(500.0, -20.82014434347216, 21.246498873194387, 731)
-    femmesh.addNode(500.0, -34.26577835357819, 28.98588993845155, 732)
-    femmesh.addNode(198.3, 12.5, 253.0, 733)
-    femmesh.addNode(215.0, 12.5, 253.0, 734)
-    femmesh.addNode(227.25, 12.5, 253.0, 735)
-    femmesh.addNode(244.05, 12.5, 253.0, 736)
-    femmesh.addNode(256.65, 12.5, 253.0, 737)
-    femmesh.addNode(273.15, 12.5, 253.0, 738)
-    femmesh.addNode(198.3, 12.5, -247.0, 739)
-    femmesh.addNode(227.25, 12.5, -247.0, 740)
-    femmesh.addNode(215.0, 12.5, -247.0, 741)
-    femmesh.addNode(256.65, 12.5, -247.0, 742)
-    femmesh.addNode(244.05, 12.5, -247.0, 743)
-    femmesh.addNode(273.15, 12.5, -247.0, 744)
-    femmesh.addNode(198.3, 25.0, -232.5, 745)
-    femmesh.addNode(214.80547388398213, 25.0, -236.4738829334143, 746)
-    femmesh.addNode(227.05547388398213, 25.0, -236.4738829334143, 747)
-    femmesh.addNode(241.73045035783707, 25.0, -233.99560589374826, 748)
-    femmesh.addNode(254.3304503578371, 25.0, -233.99560589374826, 749)
-    femmesh.addNode(233.68592424181918, 25.0, -223.4694888271626, 750)
-    femmesh.addNode(273.15, 25.0, -232.5, 751)
-    femmesh.addNode(276.01811177777324, 25.0, -209.0476372279958, 752)
-    femmesh.addNode(276.01811177777324, 25.0, -195.5476372279958, 753)
-    femmesh.addNode(275.3787762904367, 25.0, -183.22048355905383, 754)
-    femmesh.addNode(275.3787762904367, 25.0, -169.47048355905383, 755)
-    femmesh.addNode(265.39688806820993, 25.0, -187.76812078704967, 756)
-    femmesh.addNode(274.7353911777022, 25.0, -156.62788300014623, 757)
-    femmesh.addNode(274.7353911777022, 25.0, -143.12788300014623, 758)
-    femmesh.addNode(264.11416746813893, 25.0, -162.5983665592001, 759)
-    femmesh.addNode(274.53271004599867, 25.0, -129.39893386427087, 760)
-    femmesh.addNode(274.53271004599867, 25.0, -115.39893386427087, 761)
-    femmesh.addNode(263.2681012237009, 25.0, -136.0268168644171, 762)
-    femmesh.addNode(274.23643639092927, 25.0, -101.71291936138402, 763)
-    femmesh.addNode(274.23643639092927, 25.0, -87.21291936138402, 764)
-    femmesh.addNode(262.76914643692794, 25.0, -108.6118532256549, 765)
-    femmesh.addNode(274.3107563556456, 25.0, -72.26719343470944, 766)
-    femmesh.addNode(274.3107563556456, 25.0, -58.76719343470944, 767)
-    femmesh.addNode(262.54719274657486, 25.0, -79.98011279609347, 768)
-    femmesh.addNode(273.94460615934224, 25.0, -45.005316276541436, 769)
-    femmesh.addNode(273.94460615934224, 25.0, -30.755316276541436, 770)
-    femmesh.addNode(273.59690961685766, 25.0, -17.4535543766292, 771)
-    femmesh.addNode(273.59690961685766, 25.0, -4.203554376629199, 772)
-    femmesh.addNode(261.54151577619996, 25.0, -24.208870653170663, 773)
-    femmesh.addNode(273.5250632826146, 25.0, 9.058948596215771, 774)
-    femmesh.addNode(273.5250632826146, 25.0, 22.30894859621577, 775)
-    femmesh.addNode(261.1219728994723, 25.0, 2.3553942195865716, 776)
-    femmesh.addNode(273.5348253247051, 25.0, 35.657400179230876, 777)
-    femmesh.addNode(273.5348253247051, 25.0, 50.157400179230876, 778)
-    femmesh.addNode(261.05988860731975, 25.0, 28.96634877544659, 779)
-    femmesh.addNode(274.1412477887778, 25.0, 64.98199027603164, 780)
-    femmesh.addNode(274.1412477887778, 25.0, 78.73199027603164, 781)
-    femmesh.addNode(274.439807248227, 25.0, 92.32169456187785, 782)
-    femmesh.addNode(274.439807248227, 25.0, 105.82169456187785, 783)
-    femmesh.addNode(262.58105503700483, 25.0, 85.55368483790949, 784)
-    femmesh.addNode(274.4763176502232, 25.0, 119.56547755933991, 785)
-    femmesh.addNode(274.4763176502232, 25.0, 133.3154775593399, 786)
-    femmesh.addNode(262.9161248984502, 25.0, 112.88717212121776, 787)
-    femmesh.addNode(274.33898139164677, 25.0, 147.21752642224425, 788)
-    femmesh.addNode(274.33898139164677, 25.0, 160.96752642224425, 789)
-    femmesh.addNode(262.81529904187005, 25.0, 140.53300398158416, 790)
-    femmesh.addNode(273.9245717547277, 25.0, 174.92830154755853, 791)
-    femmesh.addNode(273.9245717547277, 25.0, 189.42830154755853, 792)
-    femmesh.addNode(262.26355314637453, 25.0, 168.39582796980278, 793)
-    femmesh.addNode(274.8719394410864, 25.0, 203.30042298508886, 794)
-    femmesh.addNode(274.8719394410864, 25.0, 217.05042298508886, 795)
-    femmesh.addNode(262.7965111958141, 25.0, 196.22872453264745, 796)
-    femmesh.addNode(277.12716672026147, 25.0, 228.59356085786567, 797)
-    femmesh.addNode(277.12716672026147, 25.0, 243.09356085786567, 798)
-    femmesh.addNode(264.2771667202615, 25.0, 243.09356085786567, 799)
-    femmesh.addNode(265.99910616134787, 25.0, 221.64398384295453, 800)
-    femmesh.addNode(198.3, 25.0, 238.5, 801)
-    femmesh.addNode(227.35071776653703, 25.0, 241.6088969041063, 802)
-    femmesh.addNode(215.10071776653703, 25.0, 241.6088969041063, 803)
-    femmesh.addNode(252.5289656050549, 25.0, 241.67156511055748, 804)
-    femmesh.addNode(239.92896560505488, 25.0, 241.67156511055748, 805)
-    femmesh.addNode(232.17968337159192, 25.0, 230.28046201466378, 806)
-    femmesh.addNode(256.5061323253164, 25.0, 231.76512596842315, 807)
-    femmesh.addNode(195.3208713569959, 25.0, -197.74589379855692, 808)
-    femmesh.addNode(195.3208713569959, 25.0, -211.24589379855692, 809)
-    femmesh.addNode(198.68729641111747, 25.0, -143.47038904141476, 810)
-    femmesh.addNode(198.68729641111747, 25.0, -156.97038904141476, 811)
-    femmesh.addNode(198.07746570724544, 25.0, -86.8069048730614, 812)
-    femmesh.addNode(198.07746570724544, 25.0, -101.3069048730614, 813)
-    femmesh.addNode(198.4524496423751, 25.0, -30.49038540021425, 814)
-    femmesh.addNode(198.4524496423751, 25.0, -44.74038540021425, 815)
-    femmesh.addNode(198.43425323912362, 25.0, 22.285929694117044, 816)
-    femmesh.addNode(198.43425323912362, 25.0, 9.035929694117044, 817)
-    femmesh.addNode(198.1768325565397, 25.0, 78.41952982799307, 818)
-    femmesh.addNode(198.1768325565397, 25.0, 64.66952982799307, 819)
-    femmesh.addNode(198.2510927484327, 25.0, 133.26823366198937, 820)
-    femmesh.addNode(198.2510927484327, 25.0, 119.51823366198937, 821)
-    femmesh.addNode(198.00773771603656, 25.0, 189.22168067381705, 822)
-    femmesh.addNode(198.00773771603656, 25.0, 174.72168067381705, 823)
-    femmesh.addNode(202.80071776653705, 25.0, 227.1088969041063, 824)
-    femmesh.addNode(211.82634524097801, 25.0, -215.21977673197125, 825)
-    femmesh.addNode(202.50547388398212, 25.0, -221.9738829334143, 826)
-    femmesh.addNode(262.25536251498784, 25.0, -51.27250971125085, 827)
-    femmesh.addNode(261.67607311348286, 25.0, 57.139390455262514, 828)
-    femmesh.addNode(198.09082657169785, 25.0, -72.66298570608583, 829)
-    femmesh.addNode(210.1682922789433, 25.0, -79.96989057914723, 830)
-    femmesh.addNode(198.09082657169785, 25.0, -59.162985706085834, 831)
-    femmesh.addNode(267.180450357837, 25.0, -219.49560589374826, 832)
-    femmesh.addNode(199.71493121384495, 25.0, -171.347100273599, 833)
-    femmesh.addNode(199.71493121384495, 25.0, -185.097100273599, 834)
-    femmesh.addNode(198.24326845679423, 25.0, -115.45540128454832, 835)
-    femmesh.addNode(198.24326845679423, 25.0, -129.45540128454832, 836)
-    femmesh.addNode(210.54327621407293, 25.0, -51.403371106300085, 837)
-    femmesh.addNode(198.52119705888222, 25.0, -4.149618984775316, 838)
-    femmesh.addNode(198.52119705888222, 25.0, -17.399618984775316, 839)
-    femmesh.addNode(198.02163005694808, 25.0, 50.09299862721383, 840)
-    femmesh.addNode(198.02163005694808, 25.0, 35.59299862721383, 841)
-    femmesh.addNode(198.24962012533737, 25.0, 105.74600065135007, 842)
-    femmesh.addNode(198.24962012533737, 25.0, 92.24600065135007, 843)
-    femmesh.addNode(198.17628218251073, 25.0, 160.8564040044293, 844)
-    femmesh.addNode(198.17628218251073, 25.0, 147.1064040044293, 845)
-    femmesh.addNode(196.67798627928448, 25.0, 215.7438536324728, 846)
-    femmesh.addNode(196.67798627928448, 25.0, 201.9938536324728, 847)
-    femmesh.addNode(210.97364670125728, 25.0, -23.890004384989595, 848)
-    femmesh.addNode(210.4558832960717, 25.0, 28.878928321330818, 849)
-    femmesh.addNode(210.42645268187707, 25.0, 85.16553047934315, 850)
-    femmesh.addNode(210.42737493094344, 25.0, 140.37463766641872, 851)
-    femmesh.addNode(208.68572399532104, 25.0, 194.7155343062899, 852)
-    femmesh.addNode(210.50071287377008, 25.0, 112.76423431333944, 853)
-    femmesh.addNode(210.18401989854732, 25.0, 168.07808467824634, 854)
-    femmesh.addNode(213.47870404582153, 25.0, 218.85275053657915, 855)
-    femmesh.addNode(209.03580257084081, 25.0, -191.84299407215593, 856)
-    femmesh.addNode(210.19846261348778, 25.0, 56.76252845520696, 857)
-    femmesh.addNode(210.32073416403966, 25.0, -108.26230615760971, 858)
-    femmesh.addNode(212.40222762496242, 25.0, -164.8174893150138, 859)
-    femmesh.addNode(210.9305648679117, 25.0, -136.42579032596308, 860)
-    femmesh.addNode(210.95545029800584, 25.0, 2.3863107093416716, 861)
-    femmesh.addNode(255.02588513421415, 25.0, -194.77252384316216, 862)
-    femmesh.addNode(254.3865496468776, 25.0, -182.44537017422022, 863)
-    femmesh.addNode(257.1985621356103, 25.0, -210.54324312174407, 864)
-    femmesh.addNode(249.4161768464819, 25.0, -57.83247820567817, 865)
-    femmesh.addNode(249.05002665017855, 25.0, -44.070601047510195, 866)
-    femmesh.addNode(251.95044157437917, 25.0, -169.31372876889733, 867)
-    femmesh.addNode(251.30705646164466, 25.0, -156.47112820998973, 868)
-    femmesh.addNode(241.5794386403834, 25.0, -176.31813182500986, 869)
-    femmesh.addNode(250.31117693834693, 25.0, -142.88475117227483, 870)
-    femmesh.addNode(250.10849580664342, 25.0, -129.15580203639948, 871)
-    femmesh.addNode(238.14745104458723, 25.0, -149.6001133819721, 872)
-    femmesh.addNode(249.5801262888573, 25.0, -115.461438418396, 873)
-    femmesh.addNode(249.2838526337879, 25.0, -101.77542391550915, 874)
-    femmesh.addNode(236.62320200350337, 25.0, -122.31937272625373, 875)
-    femmesh.addNode(248.99304053831588, 25.0, -87.23462604331456, 876)
-    femmesh.addNode(249.0673605030322, 25.0, -72.28890011663998, 877)
-    femmesh.addNode(235.80402039024528, 25.0, -94.08421123605567, 878)
-    femmesh.addNode(222.93249477024648, 25.0, 35.2430376380147, 879)
-    femmesh.addNode(223.34511795242202, 25.0, 21.935968704917855, 880)
-    femmesh.addNode(248.62488993397324, 25.0, -4.354485551706631, 881)
-    femmesh.addNode(248.5530435997302, 25.0, 8.908017421138368, 882)
-    femmesh.addNode(248.435927995913, 25.0, 21.95898760701664, 883)
-    femmesh.addNode(248.44569003800348, 25.0, 35.30743919003169, 884)
-    femmesh.addNode(222.8474307190845, 25.0, -72.68469238801637, 885)
-    femmesh.addNode(222.8340698546321, 25.0, -86.82861155499194, 886)
-    femmesh.addNode(215.90232470303056, 25.0, -204.4743910023892, 887)
-    femmesh.addNode(223.08692723001684, 25.0, -215.20238013724662, 888)
-    femmesh.addNode(237.76190370387172, 25.0, -212.72410309758055, 889)
-    femmesh.addNode(220.29638455987964, 25.0, -191.8255974774313, 890)
-    femmesh.addNode(249.77344789277538, 25.0, 106.02144066747877, 891)
-    femmesh.addNode(249.8099582947716, 25.0, 119.76522366494078, 892)
-    femmesh.addNode(249.75753335816245, 25.0, 133.68300131371, 893)
-    femmesh.addNode(249.620197099586, 25.0, 147.58505017661435, 894)
-    femmesh.addNode(236.6148563524876, 25.0, 126.81726985997102, 895)
-    femmesh.addNode(249.23793001152205, 25.0, 161.7690379061027, 896)
-    femmesh.addNode(248.823520374603, 25.0, 175.729813031417, 897)
-    femmesh.addNode(236.1801643278145, 25.0, 154.91903523822856, 898)
-    femmesh.addNode(248.40146511545805, 25.0, 191.97229656901635, 899)
-    femmesh.addNode(249.34883280181674, 25.0, 205.84441800654668, 900)
-    femmesh.addNode(235.37584198060563, 25.0, 185.34550650531628, 901)
-    femmesh.addNode(254.25090504614127, 25.0, 220.22198809564634, 902)
-    femmesh.addNode(223.4622335562392, 25.0, 8.884998519039584, 903)
-    femmesh.addNode(223.54917737599783, 25.0, -4.300550159852747, 904)
-    femmesh.addNode(223.81905421743897, 25.0, -129.21226945667692, 905)
-    femmesh.addNode(224.26308217176222, 25.0, -143.2272572135434, 906)
-    femmesh.addNode(225.25896169505995, 25.0, -156.81363425125826, 907)
-    femmesh.addNode(226.28659649778746, 25.0, -171.1903454834425, 908)
-    femmesh.addNode(223.5578701332114, 25.0, -43.80567017118301, 909)
-    femmesh.addNode(223.1962470625342, 25.0, -58.22827047705459, 910)
-    femmesh.addNode(223.1248819501041, 25.0, -101.36940942718653, 911)
-    femmesh.addNode(223.29068469965284, 25.0, -115.51790583867344, 912)
-    femmesh.addNode(223.45749789044993, 25.0, 147.4739277587994, 913)
-    femmesh.addNode(223.53230845637194, 25.0, 133.63575741635952, 914)
-    femmesh.addNode(222.90668633591184, 25.0, 175.5231921576755, 915)
-    femmesh.addNode(223.07523080238605, 25.0, 161.65791548828776, 916)
-    femmesh.addNode(221.15487964001483, 25.0, 204.5378486539306, 917)
-    femmesh.addNode(222.48463107676696, 25.0, 191.76567569527487, 918)
-    femmesh.addNode(227.2776111272674, 25.0, 215.90289192556412, 919)
-    femmesh.addNode(223.5847333929811, 25.0, 119.7179797675903, 920)
-    femmesh.addNode(223.58326076988578, 25.0, 105.94574675695094, 921)
-    femmesh.addNode(223.64952739496096, 25.0, -17.493356519594215, 922)
-    femmesh.addNode(223.58077997845385, 25.0, -30.58412293503315, 923)
-    femmesh.addNode(236.23375082691507, 25.0, -37.40902230578766, 924)
-    femmesh.addNode(236.15631065319434, 25.0, -10.994668709896303, 925)
-    femmesh.addNode(249.072936495421, 25.0, -30.849053811360335, 926)
-    femmesh.addNode(248.72523995293642, 25.0, -17.5472919114481, 927)
-    femmesh.addNode(246.18822371427797, 25.0, -205.22049250891462, 928)
-    femmesh.addNode(235.86202463822298, 25.0, -65.0869914528993, 929)
-    femmesh.addNode(235.93884503041397, 25.0, 15.249107835723407, 930)
-    femmesh.addNode(223.02571435871283, 25.0, 49.703456973216305, 931)
-    femmesh.addNode(235.91494901506314, 25.0, 42.760497356803285, 932)
-    femmesh.addNode(248.53890962646983, 25.0, 49.76785852523335, 933)
-    femmesh.addNode(223.18091685830444, 25.0, 64.27998817399555, 934)
-    femmesh.addNode(249.14533209054252, 25.0, 64.59244862203411, 935)
-    femmesh.addNode(236.21849054292863, 25.0, 71.22626986547778, 936)
-    femmesh.addNode(249.35565402994166, 25.0, 78.59780179550694, 937)
-    femmesh.addNode(249.65421348939088, 25.0, 92.1875060813532, 938)
-    femmesh.addNode(223.39123879770358, 25.0, 78.28534134746843, 939)
-    femmesh.addNode(239.85585896578527, 25.0, 215.9655601320153, 940)
-    femmesh.addNode(223.4640263665013, 25.0, 92.11181217082537, 941)
-    femmesh.addNode(236.5480468857123, 25.0, 99.06555762507622, 942)
-    femmesh.addNode(228.72270457028583, 25.0, -184.32198688876537, 943)
-    femmesh.addNode(235.58922670247557, 25.0, -196.95338381899865, 944)
-    femmesh.addNode(243.13967972339196, 0.0, -235.58806871152595, 945)
-    femmesh.addNode(226.33967972339195, 0.0, -235.58806871152595, 946)
-    femmesh.addNode(274.50166543582657, 0.0, -233.3897626380234, 947)
-    femmesh.addNode(258.00166543582657, 0.0, -233.3897626380234, 948)
-    femmesh.addNode(248.14134515921856, 0.0, -221.97783134954938, 949)
-    femmesh.addNode(274.50166543582657, 0.0, -218.8897626380234, 950)
-    femmesh.addNode(274.50166543582657, 0.0, -203.8897626380234, 951)
-    femmesh.addNode(272.5036590051622, 0.0, -164.83369404703194, 952)
-    femmesh.addNode(272.5036590051622, 0.0, -179.58369404703194, 953)
-    femmesh.addNode(273.71463868750783, 0.0, -105.80537880777914, 954)
-    femmesh.addNode(273.71463868750783, 0.0, -120.55537880777914, 955)
-    femmesh.addNode(273.1320941910588, 0.0, -48.88721495124966, 956)
-    femmesh.addNode(273.1320941910588, 0.0, -63.13721495124966, 957)
-    femmesh.addNode(277.1876436819415, 0.0, -2.6436612487864863, 958)
-    femmesh.addNode(277.1876436819415, 0.0, -12.393661248786486, 959)
-    femmesh.addNode(273.3938954648873, 0.0, 41.609884180499876, 960)
-    femmesh.addNode(273.3938954648873, 0.0, 27.859884180499876, 961)
-    femmesh.addNode(273.58626007931286, 0.0, 99.21609940271094, 962)
-    femmesh.addNode(273.58626007931286, 0.0, 84.46609940271094, 963)
-    femmesh.addNode(273.79445610019843, 0.0, 158.8412415370317, 964)
-    femmesh.addNode(273.79445610019843, 0.0, 144.0912415370317, 965)
-    femmesh.addNode(274.2280329187031, 0.0, 215.23003176006762, 966)
-    femmesh.addNode(274.2280329187031, 0.0, 200.48003176006762, 967)
-    femmesh.addNode(275.23744840438366, 0.0, 243.18496075802335, 968)
-    femmesh.addNode(275.23744840438366, 0.0, 228.68496075802335, 969)
-    femmesh.addNode(263.4654813230867, 0.0, 219.91499251809103, 970)
-    femmesh.addNode(258.73744840438366, 0.0, 243.18496075802335, 971)
-    femmesh.addNode(198.69402742220188, 0.0, -209.68440153060578, 972)
-    femmesh.addNode(198.69402742220188, 0.0, -194.68440153060578, 973)
-    femmesh.addNode(202.68359686910708, 0.0, -179.83703538403182, 974)
-    femmesh.addNode(202.68359686910708, 0.0, -164.83703538403182, 975)
-    femmesh.addNode(215.37762429130896, 0.0, -186.5214369146376, 976)
-    femmesh.addNode(199.235526186043, 0.0, -150.0667769247538, 977)
-    femmesh.addNode(199.235526186043, 0.0, -135.0667769247538, 978)
-    femmesh.addNode(215.91912305515007, 0.0, -156.90381230878563, 979)
-    femmesh.addNode(197.60545783717453, 0.0, -120.19343238173526, 980)
-    femmesh.addNode(197.60545783717453, 0.0, -105.44343238173525, 981)
-    femmesh.addNode(210.84098402321752, 0.0, -127.26020930648907, 982)
-    femmesh.addNode(197.79177667608133, 0.0, -91.41729656572923, 983)
-    femmesh.addNode(197.79177667608133, 0.0, -77.41729656572923, 984)
-    femmesh.addNode(209.39723451325585, 0.0, -98.36072894746451, 985)
-    femmesh.addNode(197.6235905516197, 0.0, -63.03757177510931, 986)
-    femmesh.addNode(197.6235905516197, 0.0, -48.78757177510931, 987)
-    femmesh.addNode(209.41536722770104, 0.0, -69.95486834083854, 988)
-    femmesh.addNode(197.39075559317178, 0.0, -35.88888045231138, 989)
-    femmesh.addNode(197.39075559317178, 0.0, -24.138880452311383, 990)
-    femmesh.addNode(209.0143461447915, 0.0, -42.6764522274207, 991)
-    femmesh.addNode(196.78021026002722, 0.0, -14.014739929444659, 992)
-    femmesh.addNode(196.78021026002722, 0.0, -4.264739929444659, 993)
-    femmesh.addNode(208.170965853199, 0.0, -19.653620381756042, 994)
-    femmesh.addNode(197.30783433006314, 0.0, 5.916905340730466, 995)
-    femmesh.addNode(197.30783433006314, 0.0, 15.916905340730466, 996)
-    femmesh.addNode(208.08804459009033, 0.0, 0.6521654112858073, 997)
-    femmesh.addNode(198.60861205481507, 0.0, 27.165177786370464, 998)
-    femmesh.addNode(198.60861205481507, 0.0, 40.915177786370464, 999)
-    femmesh.addNode(209.9164463848782, 0.0, 22.082083127100987, 1000)
-    femmesh.addNode(197.99850555877651, 0.0, 54.64954678933077, 1001)
-    femmesh.addNode(197.99850555877651, 0.0, 68.64954678933077, 1002)
-    femmesh.addNode(210.60711761359158, 0.0, 47.064724575701234, 1003)
-    femmesh.addNode(197.76556056504648, 0.0, 83.97323391928057, 1004)
-    femmesh.addNode(197.76556056504648, 0.0, 98.97323391928057, 1005)
-    femmesh.addNode(209.764066123823, 0.0, 76.12278070861134, 1006)
-    femmesh.addNode(197.65336093416934, 0.0, 113.8448991716632, 1007)
-    femmesh.addNode(197.65336093416934, 0.0, 128.5948991716632, 1008)
-    femmesh.addNode(209.41892149921586, 0.0, 106.31813309094377, 1009)
-    femmesh.addNode(197.67624281996348, 0.0, 143.39224842851013, 1010)
-    femmesh.addNode(197.67624281996348, 0.0, 158.39224842851013, 1011)
-    femmesh.addNode(209.32960375413282, 0.0, 135.98714760017333, 1012)
-    femmesh.addNode(197.74249706058612, 0.0, 172.88349262938232, 1013)
-    femmesh.addNode(197.74249706058612, 0.0, 186.88349262938232, 1014)
-    femmesh.addNode(209.4187398805496, 0.0, 165.27574105789245, 1015)
-    femmesh.addNode(197.5141399509559, 0.0, 201.11914005518088, 1016)
-    femmesh.addNode(197.5141399509559, 0.0, 215.86914005518088, 1017)
-    femmesh.addNode(209.256637011542, 0.0, 194.0026326845632, 1018)
-    femmesh.addNode(196.12798110172776, 0.0, 228.11906042761592, 1019)
-    femmesh.addNode(196.12798110172776, 0.0, 242.86906042761592, 1020)
-    femmesh.addNode(212.82798110172774, 0.0, 242.86906042761592, 1021)
-    femmesh.addNode(207.64212105268365, 0.0, 220.48820048279674, 1022)
-    femmesh.addNode(213.03577499559447, 0.0, -237.20321927929027, 1023)
-    femmesh.addNode(196.33577499559448, 0.0, -237.20321927929027, 1024)
-    femmesh.addNode(272.59445626174363, 0.0, -34.4005362250812, 1025)
-    femmesh.addNode(259.7265504528025, 0.0, -40.28775117633086, 1026)
-    femmesh.addNode(272.59445626174363, 0.0, -21.650536225081197, 1027)
-    femmesh.addNode(266.0353823106456, 0.0, -191.52871451658837, 1028)
-    femmesh.addNode(254.5370477464722, 0.0, -207.41847715461176, 1029)
-    femmesh.addNode(239.67506203403758, 0.0, -209.61678322811434, 1030)
-    femmesh.addNode(252.53904131580782, 0.0, -183.1124085636203, 1031)
-    femmesh.addNode(269.6251578093579, 0.0, -136.54429640908882, 1032)
-    femmesh.addNode(269.6251578093579, 0.0, -151.54429640908882, 1033)
-    femmesh.addNode(273.8398254547098, 0.0, -78.2375432045082, 1034)
-    femmesh.addNode(273.8398254547098, 0.0, -91.9875432045082, 1035)
-    femmesh.addNode(263.7820999436851, 0.0, -16.544197473867683, 1036)
-    femmesh.addNode(262.49262934236253, 0.0, 22.397404817832182, 1037)
-    femmesh.addNode(275.0987338774753, 0.0, 16.537520637332307, 1038)
-    femmesh.addNode(275.0987338774753, 0.0, 6.537520637332307, 1039)
-    femmesh.addNode(273.2222693093829, 0.0, 69.34670540846002, 1040)
-    femmesh.addNode(273.2222693093829, 0.0, 55.346705408460025, 1041)
-    femmesh.addNode(273.73384565595364, 0.0, 129.23355006195123, 1042)
-    femmesh.addNode(273.73384565595364, 0.0, 114.23355006195123, 1043)
-    femmesh.addNode(273.9987442844829, 0.0, 187.5253774943384, 1044)
-    femmesh.addNode(273.9987442844829, 0.0, 173.5253774943384, 1045)
-    femmesh.addNode(219.97545471898644, 0.0, -225.79128799081622, 1046)
-    femmesh.addNode(226.71228530200716, 0.0, 239.87560886153324, 1047)
-    femmesh.addNode(243.51228530200717, 0.0, 239.87560886153324, 1048)
-    femmesh.addNode(220.14026640373493, 0.0, 229.74466928914916, 1049)
-    femmesh.addNode(196.33577499559448, 0.0, -222.70321927929027, 1050)
-    femmesh.addNode(260.61616477427026, 0.0, 47.4565895889599, 1051)
-    femmesh.addNode(249.24973370639083, 0.0, 230.0605696195566, 1052)
-    femmesh.addNode(261.5544641422176, 0.0, -98.79292201228736, 1053)
-    femmesh.addNode(256.1288168145202, 0.0, -157.87799045612076, 1054)
-    femmesh.addNode(266.28637755941674, 0.0, 1.8938593885458204, 1055)
-    femmesh.addNode(261.32010573526657, 0.0, 106.44964946466212, 1056)
-    femmesh.addNode(261.7932003846813, 0.0, 165.86661903137008, 1057)
-    femmesh.addNode(261.52830175615213, 0.0, 136.32479159898298, 1058)
-    femmesh.addNode(262.226777203186, 0.0, 193.505409254406, 1059)
-    femmesh.addNode(257.3397964968658, 0.0, -128.59967521686792, 1060)
-    femmesh.addNode(260.9719196457686, 0.0, -69.87475815575789, 1061)
-    femmesh.addNode(260.8085293886958, 0.0, 76.31280481117096, 1062)
-    femmesh.addNode(246.52090244194687, 0.0, -33.45386936149214, 1063)
-    femmesh.addNode(247.05854037126204, 0.0, -47.9405480876606, 1064)
-    femmesh.addNode(255.8279932047586, 0.0, 3.626215289814695, 1065)
-    femmesh.addNode(257.9169030092248, 0.0, -5.554966596304098, 1066)
-    femmesh.addNode(253.32371558902696, 0.0, -14.81184157259878, 1067)
-    femmesh.addNode(248.64688395136474, 0.0, 26.139507660388063, 1068)
-    femmesh.addNode(250.35172236395272, 0.0, 14.817144117220437, 1069)
-    femmesh.addNode(248.53018668185945, 0.0, 200.27879666448598, 1070)
-    femmesh.addNode(248.30089804763924, 0.0, 187.32414239875663, 1071)
-    femmesh.addNode(248.24031822071026, 0.0, 216.60564062160086, 1072)
-    femmesh.addNode(209.02980241779636, 0.0, -214.38762080989608, 1073)
-    femmesh.addNode(221.52642525296307, 0.0, 217.49474891671412, 1074)
-    femmesh.addNode(248.0732471724316, 0.0, 52.99507780227111, 1075)
-    femmesh.addNode(248.24487332793598, 0.0, 39.25825657431096, 1076)
-    femmesh.addNode(221.55003673182296, 0.0, -48.340904911520255, 1077)
-    femmesh.addNode(221.31720177337502, 0.0, -35.442213588722325, 1078)
-    femmesh.addNode(216.929561258396, 0.0, -4.849320200847558, 1079)
-    femmesh.addNode(217.45718532843193, 0.0, 5.332325069327567, 1080)
-    femmesh.addNode(222.56082281654056, 0.0, 14.696528820618596, 1081)
-    femmesh.addNode(223.86160054129255, 0.0, 25.94480126625865, 1082)
-    femmesh.addNode(223.45958991786375, 0.0, 39.06355018018155, 1083)
-    femmesh.addNode(222.8494834218252, 0.0, 52.79791918314186, 1084)
-    femmesh.addNode(222.44544233041586, 0.0, 68.27498104777942, 1085)
-    femmesh.addNode(222.21249733668583, 0.0, 83.59866817772922, 1086)
-    femmesh.addNode(235.29791463468803, 0.0, 60.273806652259736, 1087)
-    femmesh.addNode(221.7693786966612, 0.0, 98.8286794116841, 1088)
-    femmesh.addNode(221.65717906578402, 0.0, 113.70034466406673, 1089)
-    femmesh.addNode(234.450754903254, 0.0, 90.98087975085213, 1090)
-    femmesh.addNode(221.65564316594362, 0.0, 128.64475893514668, 1091)
-    femmesh.addNode(221.67852505173775, 0.0, 143.4421081919936, 1092)
-    femmesh.addNode(234.00610036338895, 0.0, 121.15530525588701, 1093)
-    femmesh.addNode(222.04465082374253, 0.0, 186.93225753380062, 1094)
-    femmesh.addNode(221.81629371411225, 0.0, 201.16790495959913, 1095)
-    femmesh.addNode(222.33370714559385, 0.0, -212.77247024213176, 1096)
-    femmesh.addNode(234.31443906516353, 0.0, 210.42437376595154, 1097)
-    femmesh.addNode(248.3111260912179, 0.0, -90.85343441497974, 1098)
-    femmesh.addNode(248.18593932401592, 0.0, -104.67127001825068, 1099)
-    femmesh.addNode(228.7294097328475, 0.0, -198.21311604719415, 1100)
-    femmesh.addNode(241.98224781376078, 0.0, 7.368318132370575, 1101)
-    femmesh.addNode(232.7189791797527, 0.0, -183.3657499006202, 1102)
-    femmesh.addNode(239.18725587426928, 0.0, -171.42072943106376, 1103)
-    femmesh.addNode(247.72057144997603, 0.0, -62.247375335612844, 1104)
-    femmesh.addNode(248.42830271362703, 0.0, -77.34770358887141, 1105)
-    femmesh.addNode(236.308754678465, 0.0, -158.13133179312064, 1106)
-    femmesh.addNode(248.0331968509522, 0.0, 83.59153366115953, 1107)
-    femmesh.addNode(247.66920608102225, 0.0, 68.47213966690867, 1108)
-    femmesh.addNode(236.10396634952613, 0.0, 31.677995873699274, 1109)
-    femmesh.addNode(234.536038491383, 0.0, 179.9822950320879, 1110)
-    femmesh.addNode(248.23262901270954, 0.0, 173.20890762200798, 1111)
-    femmesh.addNode(248.0283408284251, 0.0, 158.52477166470135, 1112)
-    femmesh.addNode(221.97638178881277, 0.0, 172.81702275705197, 1113)
-    femmesh.addNode(247.73766378756832, 0.0, 113.83899555435471, 1114)
-    femmesh.addNode(247.59007821092754, 0.0, 98.82154489511441, 1115)
-    femmesh.addNode(234.51492343912048, 0.0, -55.413493520774125, 1116)
-    femmesh.addNode(247.73612788772792, 0.0, 128.78340982543477, 1117)
-    femmesh.addNode(247.7967383319727, 0.0, 143.64110130051523, 1118)
-    femmesh.addNode(247.52328013576738, 0.0, -117.59177384861493, 1119)
-    femmesh.addNode(243.43379925761747, 0.0, -133.58069144992461, 1120)
-    femmesh.addNode(222.21206781053695, 0.0, -62.6477321594725, 1121)
-    femmesh.addNode(222.38025393499856, 0.0, -77.02745695009241, 1122)
-    femmesh.addNode(232.02825086222714, 0.0, -29.754245141790506, 1123)
-    femmesh.addNode(219.49256027519567, 0.0, -24.089792457690947, 1124)
-    femmesh.addNode(218.88201494205111, 0.0, -13.965651934824223, 1125)
-    femmesh.addNode(244.69626094376753, 0.0, -22.10144823046076, 1126)
-    femmesh.addNode(232.86068399540088, 0.0, -143.36107333384263, 1127)
-    femmesh.addNode(223.04416763430254, 0.0, -132.3531719655896, 1128)
-    femmesh.addNode(221.41409928543408, 0.0, -117.47982742257108, 1129)
-    femmesh.addNode(222.07675847368262, 0.0, -104.5593235922068, 1130)
-    femmesh.addNode(222.26307731258942, 0.0, -90.53318777620078, 1131)
-    femmesh.addNode(228.25115568039269, 0.0, -9.285492276782463, 1132)
-    femmesh.addNode(234.27994208476764, 0.0, -109.65228625130734, 1133)
-    femmesh.addNode(234.2361669600009, 0.0, 150.98338989115314, 1134)
-    femmesh.addNode(221.91012754819008, 0.0, 158.32577855617973, 1135)
-    femmesh.addNode(235.05977789542533, 0.0, -83.22605159483473, 1136)
-    femmesh.addNode(238.83106400930723, 0.0, -11.112217352897176, 1137)
-    femmesh.addNode(236.87861032565212, 0.0, -1.9958856189205108, 1138)
-    femmesh.addNode(231.40233948484624, 0.0, 9.195043208485231, 1139)
-    femmesh.addNode(286.0, 12.5, -232.5, 1140)
-    femmesh.addNode(286.0, 12.5, -204.5, 1141)
-    femmesh.addNode(286.0, 12.5, -189.5, 1142)
-    femmesh.addNode(286.0, 12.5, -175.75, 1143)
-    femmesh.addNode(286.0, 12.5, -161.0, 1144)
-    femmesh.addNode(286.0, 12.5, -147.5, 1145)
-    femmesh.addNode(286.0, 12.5, -132.5, 1146)
-    femmesh.addNode(286.0, 12.5, -118.5, 1147)
-    femmesh.addNode(286.0, 12.5, -103.75, 1148)
-    femmesh.addNode(286.0, 12.5, -89.25, 1149)
-    femmesh.addNode(286.0, 12.5, -75.5, 1150)
-    femmesh.addNode(286.0, 12.5, -62.0, 1151)
-    femmesh.addNode(286.0, 12.5, -47.75, 1152)
-    femmesh.addNode(286.0, 12.5, -33.5, 1153)
-    femmesh.addNode(286.0, 12.5, -20.75, 1154)
-    femmesh.addNode(286.0, 12.5, -7.5, 1155)
-    femmesh.addNode(286.0, 12.5, 2.25, 1156)
-    femmesh.addNode(286.0, 12.5, 12.25, 1157)
-    femmesh.addNode(286.0, 12.5, 25.5, 1158)
-    femmesh.addNode(286.0, 12.5, 39.25, 1159)
-    femmesh.addNode(286.0, 12.5, 53.75, 1160)
-    femmesh.addNode(286.0, 12.5, 67.75, 1161)
-    femmesh.addNode(286.0, 12.5, 81.5, 1162)
-    femmesh.addNode(286.0, 12.5, 96.25, 1163)
-    femmesh.addNode(286.0, 12.5, 109.75, 1164)
-    femmesh.addNode(286.0, 12.5, 124.75, 1165)
-    femmesh.addNode(286.0, 12.5, 138.5, 1166)
-    femmesh.addNode(286.0, 12.5, 153.25, 1167)
-    femmesh.addNode(286.0, 12.5, 167.0, 1168)
-    femmesh.addNode(286.0, 12.5, 181.0, 1169)
-    femmesh.addNode(286.0, 12.5, 195.5, 1170)
-    femmesh.addNode(286.0, 12.5, 210.25, 1171)
-    femmesh.addNode(286.0, 12.5, 238.5, 1172)
-    femmesh.addNode(286.0, 12.5, -218.0, 1173)
-    femmesh.addNode(286.0, 12.5, 224.0, 1174)
-    femmesh.addNode(186.0, 12.5, -232.5, 1175)
-    femmesh.addNode(186.0, 12.5, -189.5, 1176)
-    femmesh.addNode(186.0, 12.5, -204.5, 1177)
-    femmesh.addNode(186.0, 12.5, -160.75, 1178)
-    femmesh.addNode(186.0, 12.5, -175.75, 1179)
-    femmesh.addNode(186.0, 12.5, -132.25, 1180)
-    femmesh.addNode(186.0, 12.5, -147.25, 1181)
-    femmesh.addNode(186.0, 12.5, -103.5, 1182)
-    femmesh.addNode(186.0, 12.5, -118.25, 1183)
-    femmesh.addNode(186.0, 12.5, -75.0, 1184)
-    femmesh.addNode(186.0, 12.5, -89.0, 1185)
-    femmesh.addNode(186.0, 12.5, -47.25, 1186)
-    femmesh.addNode(186.0, 12.5, -61.5, 1187)
-    femmesh.addNode(186.0, 12.5, -21.25, 1188)
-    femmesh.addNode(186.0, 12.5, -33.0, 1189)
-    femmesh.addNode(186.0, 12.5, 1.75, 1190)
-    femmesh.addNode(186.0, 12.5, -8.0, 1191)
-    femmesh.addNode(186.0, 12.5, 11.75, 1192)
-    femmesh.addNode(186.0, 12.5, 38.75, 1193)
-    femmesh.addNode(186.0, 12.5, 25.0, 1194)
-    femmesh.addNode(186.0, 12.5, 67.25, 1195)
-    femmesh.addNode(186.0, 12.5, 53.25, 1196)
-    femmesh.addNode(186.0, 12.5, 96.0, 1197)
-    femmesh.addNode(186.0, 12.5, 81.0, 1198)
-    femmesh.addNode(186.0, 12.5, 124.25, 1199)
-    femmesh.addNode(186.0, 12.5, 109.5, 1200)
-    femmesh.addNode(186.0, 12.5, 153.0, 1201)
-    femmesh.addNode(186.0, 12.5, 138.0, 1202)
-    femmesh.addNode(186.0, 12.5, 180.75, 1203)
-    femmesh.addNode(186.0, 12.5, 166.75, 1204)
-    femmesh.addNode(186.0, 12.5, 210.0, 1205)
-    femmesh.addNode(186.0, 12.5, 195.25, 1206)
-    femmesh.addNode(186.0, 12.5, 238.5, 1207)
-    femmesh.addNode(186.0, 12.5, 223.75, 1208)
-    femmesh.addNode(186.0, 12.5, -218.0, 1209)
-    femmesh.addNode(3.899662804628453e-15, -34.486400619589354, -18.562519953795285, 1210)
-    femmesh.addNode(-4.462221818150558e-15, -34.527223419907635, 19.09606051746735, 1211)
-    femmesh.addNode(-3.3464830070508713e-15, -26.879106182173274, 15.071219623556, 1212)
-    femmesh.addNode(-1.810809081812226e-15, -34.35188276226563, 8.15515910608865, 1213)
-    femmesh.addNode(7.804514576628895e-16, -34.35188276226563, -3.51484089391135, 1214)
-    femmesh.addNode(-2.126911643807028e-15, -21.36936280847035, 9.5787584864993, 1215)
-    femmesh.addNode(2.6762540139762788e-15, -28.99393948253265, -13.052776580092363, 1216)
-    femmesh.addNode(-4.690210261008783e-16, -19.35195678423776, 2.112282918376843, 1217)
-    femmesh.addNode(1.2007322856008502e-15, -21.345822244798285, -5.407617474003713, 1218)
-    femmesh.addNode(492.5, -42.0, -20.57999999999989, 1219)
-    femmesh.addNode(492.9969968200429, -42.0, 9.026137767411015, 1220)
-    femmesh.addNode(492.9969968200429, -42.0, -2.6438622325889867, 1221)
-    femmesh.addNode(492.5, -42.0, 21.090000000000106, 1222)
-    femmesh.addNode(7.749999999999995, -42.0, 21.090000000000003, 1223)
-    femmesh.addNode(18.682556373571195, -42.0, 21.50412417076774, 1224)
-    femmesh.addNode(26.182556373571195, -42.0, 21.504124170767753, 1225)
-    femmesh.addNode(33.7861730068622, -42.0, 23.164630745120874, 1226)
-    femmesh.addNode(41.2861730068622, -42.0, 23.164630745120874, 1227)
-    femmesh.addNode(29.468729380433395, -42.0, 14.668754915888613, 1228)
-    femmesh.addNode(48.491920619484034, -42.0, 21.172383115601434, 1229)
-    femmesh.addNode(56.241920619484034, -42.0, 21.172383115601434, 1230)
-    femmesh.addNode(44.278093626346234, -42.0, 14.337013860722294, 1231)
-    femmesh.addNode(64.70785957500605, -42.0, 23.004055359766483, 1232)
-    femmesh.addNode(72.20785957500605, -42.0, 23.004055359766483, 1233)
-    femmesh.addNode(59.94978019449009, -42.0, 14.176438475367917, 1234)
-    femmesh.addNode(79.86867952399868, -42.0, 23.21770423491043, 1235)
-    femmesh.addNode(87.36867952399868, -42.0, 23.21770423491043, 1236)
-    femmesh.addNode(76.07653909900475, -42.0, 16.22175959467691, 1237)
-    femmesh.addNode(94.93633503242283, -42.0, 23.25819302846459, 1238)
-    femmesh.addNode(102.68633503242283, -42.0, 23.25819302846459, 1239)
-    femmesh.addNode(91.30501455642153, -42.0, 16.475897263375003, 1240)
-    femmesh.addNode(110.24904608745427, -42.0, 23.24631962372672, 1241)
-    femmesh.addNode(117.74904608745427, -42.0, 23.24631962372672, 1242)
-    femmesh.addNode(106.43538111987712, -42.0, 16.504512652191295, 1243)
-    femmesh.addNode(125.29795257736998, -42.0, 23.246085746876943, 1244)
-    femmesh.addNode(132.79795257736998, -42.0, 23.246085746876943, 1245)
-    femmesh.addNode(121.54699866482426, -42.0, 16.49240537060365, 1246)
-    femmesh.addNode(140.37763674469613, -42.0, 23.25885644322844, 1247)
-    femmesh.addNode(148.12763674469613, -42.0, 23.25885644322844, 1248)
-    femmesh.addNode(136.6755893220661, -42.0, 16.504942190105353, 1249)
-    femmesh.addNode(155.707569219984, -42.0, 23.245875093248145, 1250)
-    femmesh.addNode(163.207569219984, -42.0, 23.245875093248145, 1251)
-    femmesh.addNode(151.83520596468014, -42.0, 16.504731536476555, 1252)
-    femmesh.addNode(170.75601578087543, -42.0, 23.244312440072605, 1253)
-    femmesh.addNode(178.25601578087543, -42.0, 23.244312440072605, 1254)
-    femmesh.addNode(166.96358500085944, -42.0, 16.49018753332072, 1255)
-    femmesh.addNode(185.8052405900251, -42.0, 23.244473922935555, 1256)
-    femmesh.addNode(193.3052405900251, -42.0, 23.244473922935555, 1257)
-    femmesh.addNode(182.06125637090054, -42.0, 16.48878636300813, 1258)
-    femmesh.addNode(200.88984888341008, -42.0, 23.256748916178395, 1259)
-    femmesh.addNode(208.63984888341008, -42.0, 23.256748916178395, 1260)
-    femmesh.addNode(197.1950894734352, -42.0, 16.50122283911392, 1261)
-    femmesh.addNode(216.22819877184378, -42.0, 23.24375270701256, 1262)
-    femmesh.addNode(223.72819877184378, -42.0, 23.243752707012575, 1263)
-    femmesh.addNode(212.36804765525386, -42.0, 16.500501623190928, 1264)
-    femmesh.addNode(231.29346583643127, -42.0, 23.24461554980961, 1265)
-    femmesh.addNode(238.79346583643127, -42.0, 23.244615549809623, 1266)
-    femmesh.addNode(227.52166460827505, -42.0, 16.488368256822127, 1267)
-    femmesh.addNode(246.38404983185728, -42.0, 23.258220433010678, 1268)
-    femmesh.addNode(254.13404983185728, -42.0, 23.258220433010678, 1269)
-    femmesh.addNode(242.67751566828855, -42.0, 16.502835982820244, 1270)
-    femmesh.addNode(261.7238779630994, -42.0, 23.245797205890966, 1271)
-    femmesh.addNode(269.2238779630994, -42.0, 23.245797205890966, 1272)
-    femmesh.addNode(257.8579277949567, -42.0, 16.504017638901587, 1273)
-    femmesh.addNode(276.7877953704252, -42.0, 23.246148415657018, 1274)
-    femmesh.addNode(284.2877953704252, -42.0, 23.246148415657018, 1275)
-    femmesh.addNode(273.01167333352464, -42.0, 16.491945621547927, 1276)
-    femmesh.addNode(291.87496099923925, -42.0, 23.259588675892616, 1277)
-    femmesh.addNode(299.62496099923925, -42.0, 23.259588675892616, 1278)
-    femmesh.addNode(288.1627563696645, -42.0, 16.505737091549577, 1279)
-    femmesh.addNode(307.2083663120677, -42.0, 23.247190043469203, 1280)
-    femmesh.addNode(314.7083663120677, -42.0, 23.247190043469203, 1281)
-    femmesh.addNode(303.333327311307, -42.0, 16.506778719361748, 1282)
-    femmesh.addNode(322.25800881718, -42.0, 23.24660526276358, 1283)
-    femmesh.addNode(329.75800881718, -42.0, 23.24660526276358, 1284)
-    femmesh.addNode(318.46637512924775, -42.0, 16.493795306232727, 1285)
-    femmesh.addNode(337.30784500593415, -42.0, 23.24712004960321, 1286)
-    femmesh.addNode(344.80784500593415, -42.0, 23.24712004960321, 1287)
-    femmesh.addNode(333.5658538231142, -42.0, 16.49372531236672, 1288)
-    femmesh.addNode(352.39186798424316, -42.0, 23.25948289672897, 1289)
-    femmesh.addNode(360.14186798424316, -42.0, 23.25948289672897, 1290)
-    femmesh.addNode(348.6997129901774, -42.0, 16.506602946332094, 1291)
-    femmesh.addNode(367.7297857226446, -42.0, 23.24609875433913, 1292)
-    femmesh.addNode(375.2297857226446, -42.0, 23.24609875433913, 1293)
-    femmesh.addNode(363.87165370688774, -42.0, 16.505581651068013, 1294)
-    femmesh.addNode(382.79232673330137, -42.0, 23.246524818619548, 1295)
-    femmesh.addNode(390.29232673330137, -42.0, 23.246524818619548, 1296)
-    femmesh.addNode(379.02211245594594, -42.0, 16.492623572958593, 1297)
-    femmesh.addNode(397.8756168325761, -42.0, 23.259525988374335, 1298)
-    femmesh.addNode(405.6256168325761, -42.0, 23.259525988374335, 1299)
-    femmesh.addNode(394.16794356587747, -42.0, 16.506050806993812, 1300)
-    femmesh.addNode(413.2018142473283, -42.0, 23.246574904612743, 1301)
-    femmesh.addNode(420.7018142473283, -42.0, 23.246574904612743, 1302)
-    femmesh.addNode(409.3274310799044, -42.0, 16.506100892986993, 1303)
-    femmesh.addNode(428.2343786131795, -42.0, 23.251827260025493, 1304)
-    femmesh.addNode(435.7343786131795, -42.0, 23.251827260025493, 1305)
-    femmesh.addNode(424.43619286050784, -42.0, 16.49840216463815, 1306)
-    femmesh.addNode(443.2273959276358, -42.0, 23.29369109297943, 1307)
-    femmesh.addNode(450.9773959276358, -42.0, 23.29369109297943, 1308)
-    femmesh.addNode(439.4617745408154, -42.0, 16.545518353004837, 1309)
-    femmesh.addNode(458.2604117782722, -42.0, 23.381795308232597, 1310)
-    femmesh.addNode(465.7604117782722, -42.0, 23.381795308232597, 1311)
-    femmesh.addNode(454.23780770590804, -42.0, 16.675486401211913, 1312)
-    femmesh.addNode(10.932556373571195, -42.0, 12.594124170767742, 1313)
-    femmesh.addNode(7.750000000000004, -42.0, -20.58, 1314)
-    femmesh.addNode(9.077259941870075, -42.0, -10.171286947968674, 1315)
-    femmesh.addNode(9.077259941870075, -42.0, 1.49871305203132, 1316)
-    femmesh.addNode(20.00981631544127, -42.0, 1.9128372227990695, 1317)
-    femmesh.addNode(16.82725994187008, -42.0, -19.591286947968676, 1318)
-    femmesh.addNode(24.327259941870082, -42.0, -19.59128694796867, 1319)
-    femmesh.addNode(56.900143932628396, -42.0, -21.35500057111704, 1320)
-    femmesh.addNode(49.1501439326284, -42.0, -21.35500057111704, 1321)
-    femmesh.addNode(87.42301886205126, -42.0, -22.798581736722163, 1322)
-    femmesh.addNode(79.92301886205126, -42.0, -22.798581736722163, 1323)
-    femmesh.addNode(117.75206586570428, -42.0, -22.77260913094939, 1324)
-    femmesh.addNode(110.25206586570428, -42.0, -22.77260913094939, 1325)
-    femmesh.addNode(148.12709455192098, -42.0, -22.783761841295863, 1326)
-    femmesh.addNode(140.37709455192098, -42.0, -22.783761841295863, 1327)
-    femmesh.addNode(178.2558120738478, -42.0, -22.763984287864687, 1328)
-    femmesh.addNode(170.7558120738478, -42.0, -22.76398428786469, 1329)
-    femmesh.addNode(208.64076885935293, -42.0, -22.783211166858678, 1330)
-    femmesh.addNode(200.89076885935293, -42.0, -22.783211166858678, 1331)
-    femmesh.addNode(238.79567889013504, -42.0, -22.762858507153148, 1332)
-    femmesh.addNode(231.29567889013504, -42.0, -22.762858507153148, 1333)
-    femmesh.addNode(269.2238801739067, -42.0, -22.76201657692269, 1334)
-    femmesh.addNode(261.7238801739067, -42.0, -22.762016576922694, 1335)
-    femmesh.addNode(299.6255263117559, -42.0, -22.780890010027754, 1336)
-    femmesh.addNode(291.8755263117559, -42.0, -22.780890010027754, 1337)
-    femmesh.addNode(329.7588250061922, -42.0, -22.761367883056415, 1338)
-    femmesh.addNode(322.2588250061922, -42.0, -22.761367883056415, 1339)
-    femmesh.addNode(360.1430756770683, -42.0, -22.780622143398418, 1340)
-    femmesh.addNode(352.3930756770683, -42.0, -22.78062214339842, 1341)
-    femmesh.addNode(390.2947157066264, -42.0, -22.762349475556732, 1342)
-    femmesh.addNode(382.7947157066264, -42.0, -22.762349475556736, 1343)
-    femmesh.addNode(420.72228566617355, -42.0, -22.76297806099533, 1344)
-    femmesh.addNode(413.22228566617355, -42.0, -22.762978060995334, 1345)
-    femmesh.addNode(451.21571977266444, -42.0, -22.73308931210866, 1346)
-    femmesh.addNode(443.46571977266444, -42.0, -22.73308931210866, 1347)
-    femmesh.addNode(482.26415404215896, -42.0, -22.008746604150073, 1348)
-    femmesh.addNode(474.76415404215896, -42.0, -22.008746604150076, 1349)
-    femmesh.addNode(489.76415404215896, -42.0, -12.588746604150074, 1350)
-    femmesh.addNode(485.4969968200429, -42.0, 17.93613776741101, 1351)
-    femmesh.addNode(33.35985049606295, -42.0, -17.9610678600947, 1352)
-    femmesh.addNode(27.187110437933022, -42.0, -7.552354808063377, 1353)
-    femmesh.addNode(185.8073552869355, -42.0, -22.76392235494653, 1354)
-    femmesh.addNode(182.0631673607833, -42.0, -15.52790664281126, 1355)
-    femmesh.addNode(193.3073552869355, -42.0, -22.763922354946526, 1356)
-    femmesh.addNode(155.70560321140454, -42.0, -22.763567454571273, 1357)
-    femmesh.addNode(151.83269776332548, -42.0, -15.547329295867172, 1358)
-    femmesh.addNode(163.20560321140454, -42.0, -22.763567454571273, 1359)
-    femmesh.addNode(44.50999442869134, -42.0, -9.316068431211747, 1360)
-    femmesh.addNode(40.85985049606295, -42.0, -17.961067860094694, 1361)
-    femmesh.addNode(125.30056206257933, -42.0, -22.76582789681455, 1362)
-    femmesh.addNode(121.55262792828361, -42.0, -15.538437027763969, 1363)
-    femmesh.addNode(132.80056206257933, -42.0, -22.76582789681455, 1364)
-    femmesh.addNode(64.8851520664275, -42.0, -22.704542506848576, 1365)
-    femmesh.addNode(60.78529599905589, -42.0, -14.059543077965628, 1366)
-    femmesh.addNode(72.3851520664275, -42.0, -22.704542506848576, 1367)
-    femmesh.addNode(76.30817092847876, -42.0, -15.503124243570753, 1368)
-    femmesh.addNode(102.70522678881673, -42.0, -22.80243485408873, 1369)
-    femmesh.addNode(94.95522678881673, -42.0, -22.802434854088734, 1370)
-    femmesh.addNode(136.67765661450034, -42.0, -15.549589738110441, 1371)
-    femmesh.addNode(166.96141528525231, -42.0, -15.527551742436003, 1372)
-    femmesh.addNode(197.19812414628842, -42.0, -15.54713352180525, 1373)
-    femmesh.addNode(223.72761786013717, -42.0, -22.762659300331688, 1374)
-    femmesh.addNode(216.22761786013717, -42.0, -22.76265930033169, 1375)
-    femmesh.addNode(254.13393983288148, -42.0, -22.779383005374513, 1376)
-    femmesh.addNode(246.38393983288148, -42.0, -22.779383005374513, 1377)
-    femmesh.addNode(284.2886746467215, -42.0, -22.760887870520186, 1378)
-    femmesh.addNode(276.7886746467215, -42.0, -22.760887870520186, 1379)
-    femmesh.addNode(314.706460732979, -42.0, -22.761582823015047, 1380)
-    femmesh.addNode(307.206460732979, -42.0, -22.761582823015047, 1381)
-    femmesh.addNode(344.8096454073532, -42.0, -22.76144936496748, 1382)
-    femmesh.addNode(337.3096454073532, -42.0, -22.761449364967483, 1383)
-    femmesh.addNode(375.22822564008356, -42.0, -22.760696455576813, 1384)
-    femmesh.addNode(367.72822564008356, -42.0, -22.760696455576813, 1385)
-    femmesh.addNode(405.6309478523842, -42.0, -22.78038287635329, 1386)
-    femmesh.addNode(397.8809478523842, -42.0, -22.780382876353293, 1387)
-    femmesh.addNode(435.8083139630775, -42.0, -22.753115913502533, 1388)
-    femmesh.addNode(428.3083139630775, -42.0, -22.753115913502533, 1389)
-    femmesh.addNode(466.5265211308232, -42.0, -22.55429446240054, 1390)
-    femmesh.addNode(459.0265211308232, -42.0, -22.554294462400545, 1391)
-    femmesh.addNode(482.7611508622019, -42.0, -4.072608836739164, 1392)
-    femmesh.addNode(212.3683867194901, -42.0, -15.545870467190412, 1393)
-    femmesh.addNode(242.67961872301652, -42.0, -15.54224151252771, 1394)
-    femmesh.addNode(273.0125548206282, -42.0, -15.52290444744294, 1395)
-    femmesh.addNode(303.3319870447349, -42.0, -15.542472833042865, 1396)
-    femmesh.addNode(333.56847041354536, -42.0, -15.52281724802397, 1397)
-    femmesh.addNode(363.8713013171518, -42.0, -15.541318598975316, 1398)
-    femmesh.addNode(394.17566355901056, -42.0, -15.542732351910118, 1399)
-    femmesh.addNode(424.5305996292511, -42.0, -15.516093974497963, 1400)
-    femmesh.addNode(455.24224090348764, -42.0, -15.287383774509308, 1401)
-    femmesh.addNode(439.774033735742, -42.0, -15.486205225611293, 1402)
-    femmesh.addNode(471.29067517298216, -42.0, -14.563041066550724, 1403)
-    femmesh.addNode(91.378245650868, -42.0, -15.601016590810914, 1404)
-    femmesh.addNode(409.3532335185578, -42.0, -15.543360937348716, 1405)
-    femmesh.addNode(348.70272108442146, -42.0, -15.542071508365979, 1406)
-    femmesh.addNode(106.45729265452101, -42.0, -15.57504398503815, 1407)
-    femmesh.addNode(379.0229413467099, -42.0, -15.523045931133638, 1408)
-    femmesh.addNode(288.1642009584774, -42.0, -15.541777880548004, 1409)
-    femmesh.addNode(257.8578200067882, -42.0, -15.54139958229726, 1410)
-    femmesh.addNode(318.4652857391711, -42.0, -15.522950706071533, 1411)
-    femmesh.addNode(227.5232967502722, -42.0, -15.525517807484889, 1412)
-    femmesh.addNode(29.042406869634142, -42.0, 3.5430563106730446, 1413)
-    femmesh.addNode(80.41933381643446, -42.0, -7.3780053172171876, 1414)
-    femmesh.addNode(72.8814670208107, -42.0, -7.283966087343593, 1415)
-    femmesh.addNode(185.8467027542929, -42.0, -7.276458530468929, 1416)
-    femmesh.addNode(178.29515954120524, -42.0, -7.276520463387087, 1417)
-    femmesh.addNode(57.340090615149236, -42.0, 6.447948442329803, 1418)
-    femmesh.addNode(65.80602957067126, -42.0, 8.279620686494852, 1419)
-    femmesh.addNode(72.70417452938926, -42.0, 8.424631779271472, 1420)
-    femmesh.addNode(80.36499447838189, -42.0, 8.63828065441541, 1421)
-    femmesh.addNode(102.69735077283056, -42.0, 8.738903754392268, 1422)
-    femmesh.addNode(110.26006182786202, -42.0, 8.727030349654399, 1423)
-    femmesh.addNode(117.79128341100485, -42.0, 8.732877010372832, 1424)
-    femmesh.addNode(125.34018990092056, -42.0, 8.732643133523055, 1425)
-    femmesh.addNode(114.05325306395832, -42.0, 0.9672681125738123, 1426)
-    femmesh.addNode(132.8966580210125, -42.0, 8.733723198568413, 1427)
-    femmesh.addNode(140.47634218833866, -42.0, 8.746493894919908, 1428)
-    femmesh.addNode(129.14094276719314, -42.0, 0.9741948383376098, 1429)
-    femmesh.addNode(148.04083632907214, -42.0, 8.747038180327237, 1430)
-    femmesh.addNode(155.62076880436, -42.0, 8.734056830346944, 1431)
-    femmesh.addNode(144.26190502801856, -42.0, 0.9758191887902967, 1432)
-    femmesh.addNode(163.1857406389987, -42.0, 8.735698358767095, 1433)
-    femmesh.addNode(170.73418719989013, -42.0, 8.734135705591555, 1434)
-    femmesh.addNode(159.3913710033907, -42.0, 0.9780050026177776, 1435)
-    femmesh.addNode(178.29536324823283, -42.0, 8.731776264550213, 1436)
-    femmesh.addNode(185.8445880573825, -42.0, 8.731937747413163, 1437)
-    femmesh.addNode(208.57555388820802, -42.0, 8.742925908997634, 1438)
-    femmesh.addNode(216.1639037766417, -42.0, 8.7299296998318, 1439)
-    femmesh.addNode(223.7437752291973, -42.0, 8.732146689348951, 1440)
-    femmesh.addNode(231.30904229378476, -42.0, 8.733009532145985, 1441)
-    femmesh.addNode(219.95128146215143, -42.0, 0.9745709751556504, 1442)
-    femmesh.addNode(238.89013440061203, -42.0, 8.733382567182574, 1443)
-    femmesh.addNode(246.48071839603807, -42.0, 8.746987450383635, 1444)
-    femmesh.addNode(235.11224502153428, -42.0, 0.9771609997093833, 1445)
-    femmesh.addNode(254.0614360031658, -42.0, 8.74736593299378, 1446)
-    femmesh.addNode(261.6512641344078, -42.0, 8.734942705874076, 1447)
-    femmesh.addNode(250.27405473548924, -42.0, 0.977912517356117, 1448)
-    femmesh.addNode(269.23139422705583, -42.0, 8.736116342906513, 1449)
-    femmesh.addNode(276.7953116343817, -42.0, 8.73646755267255, 1450)
-    femmesh.addNode(265.4349024352649, -42.0, 0.9794646369986992, 1451)
-    femmesh.addNode(284.3737328750491, -42.0, 8.735819875496517, 1452)
-    femmesh.addNode(291.96089850386306, -42.0, 8.749260135732115, 1453)
-    femmesh.addNode(280.5934537685803, -42.0, 0.9799905968550959, 1454)
-    femmesh.addNode(299.5353640158104, -42.0, 8.749645674501295, 1455)
-    femmesh.addNode(307.11876932863885, -42.0, 8.737247042077882, 1456)
-    femmesh.addNode(295.74634052119495, -42.0, 0.9797284584482426, 1457)
-    femmesh.addNode(314.68821569919174, -42.0, 8.73821891509175, 1458)
-    femmesh.addNode(322.237858204304, -42.0, 8.737634134386134, 1459)
-    femmesh.addNode(310.8902524036951, -42.0, 0.981085870231297, 1460)
-    femmesh.addNode(329.8001915970743, -42.0, 8.737772104593361, 1461)
-    femmesh.addNode(337.35002778582844, -42.0, 8.738286891432978, 1462)
-    femmesh.addNode(326.02203216701827, -42.0, 0.9821957134523913, 1463)
-    femmesh.addNode(344.91987434309704, -42.0, 8.737076620311015, 1464)
-    femmesh.addNode(352.50389732140604, -42.0, 8.749439467436773, 1465)
-    femmesh.addNode(341.1542121170571, -42.0, 0.9811234125376558, 1466)
-    femmesh.addNode(360.0791754256204, -42.0, 8.749433638138072, 1467)
-    femmesh.addNode(367.6670931640218, -42.0, 8.736049495748219, 1468)
-    femmesh.addNode(356.2993367785401, -42.0, 0.9799073121169855, 1469)
-    femmesh.addNode(375.24442455338453, -42.0, 8.736338136015696, 1470)
-    femmesh.addNode(382.8069655640413, -42.0, 8.736764200296129, 1471)
-    femmesh.addNode(371.4519462721172, -42.0, 0.9801901230857624, 1472)
-    femmesh.addNode(390.3826039068472, -42.0, 8.735463129685414, 1473)
-    femmesh.addNode(397.9658940061219, -42.0, 8.748464299440194, 1474)
-    femmesh.addNode(386.60491600428577, -42.0, 0.9791776927425175, 1475)
-    femmesh.addNode(405.5396029654676, -42.0, 8.747039189995917, 1476)
-    femmesh.addNode(413.1158003802198, -42.0, 8.734088106234324, 1477)
-    femmesh.addNode(401.75426330643734, -42.0, 0.9764515126875253, 1478)
-    femmesh.addNode(420.6900880077005, -42.0, 8.735627198165695, 1479)
-    femmesh.addNode(428.2226523735518, -42.0, 8.740879553578445, 1480)
-    femmesh.addNode(416.90225989326376, -42.0, 0.9765654951746185, 1481)
-    femmesh.addNode(435.80054922320517, -42.0, 8.755086441493106, 1482)
-    femmesh.addNode(443.2935665376615, -42.0, 8.796950274447042, 1483)
-    femmesh.addNode(432.05444437039785, -42.0, 0.9923114750206565, 1484)
-    femmesh.addNode(450.8867438017045, -42.0, 8.873332943994171, 1485)
-    femmesh.addNode(458.1697596523409, -42.0, 8.961437159247332, 1486)
-    femmesh.addNode(447.2255184840943, -42.0, 1.0829010324824537, 1487)
-    femmesh.addNode(472.4204436333994, -42.0, 23.632471468736213, 1488)
-    femmesh.addNode(479.9204436333994, -42.0, 23.632471468736213, 1489)
-    femmesh.addNode(52.14206455211244, -42.0, -0.18261745551561148, 1490)
-    femmesh.addNode(57.9983139282936, -42.0, -6.0794352443886766, 1491)
-    femmesh.addNode(125.34279938612991, -42.0, -7.279270510168445, 1492)
-    femmesh.addNode(117.79430318925486, -42.0, -7.286051744303279, 1493)
-    femmesh.addNode(413.13627179906507, -42.0, -7.275464859373756, 1494)
-    femmesh.addNode(405.54493398527575, -42.0, -7.292869674731712, 1495)
-    femmesh.addNode(382.80935453736635, -42.0, -7.272110093880158, 1496)
-    femmesh.addNode(375.2428644708235, -42.0, -7.270457073900239, 1497)
-    femmesh.addNode(140.47579999556353, -42.0, -7.296124389604401, 1498)
-    femmesh.addNode(132.89926750622192, -42.0, -7.27819044512308, 1499)
-    femmesh.addNode(65.9833220620927, -42.0, -7.428977180120214, 1500)
-    femmesh.addNode(155.61880279578054, -42.0, -7.275385717472474, 1501)
-    femmesh.addNode(148.04029413629698, -42.0, -7.2955801041970645, 1502)
-    femmesh.addNode(276.796190910678, -42.0, -7.270568733504653, 1503)
-    femmesh.addNode(269.23139643786317, -42.0, -7.2716974399071574, 1504)
-    femmesh.addNode(322.23867439331616, -42.0, -7.270339011433869, 1505)
-    femmesh.addNode(314.68631012010303, -42.0, -7.2705539513925, 1506)
-    femmesh.addNode(307.11686374955013, -42.0, -7.271525824406368, 1507)
-    femmesh.addNode(299.53592932832703, -42.0, -7.290833011419075, 1508)
-    femmesh.addNode(261.65126634521516, -42.0, -7.272871076939595, 1509)
-    femmesh.addNode(254.06132600418994, -42.0, -7.29023750539141, 1510)
-    femmesh.addNode(337.35182818724746, -42.0, -7.270282523137709, 1511)
-    femmesh.addNode(329.8010077860864, -42.0, -7.270201041226642, 1512)
-    femmesh.addNode(231.31125534748853, -42.0, -7.274464524816771, 1513)
-    femmesh.addNode(223.7431943174907, -42.0, -7.274265317995315, 1514)
-    femmesh.addNode(367.6655330814608, -42.0, -7.270745714167717, 1515)
-    femmesh.addNode(360.0803831184455, -42.0, -7.290671401989314, 1516)
-    femmesh.addNode(110.26308160611201, -42.0, -7.291898405021712, 1517)
-    femmesh.addNode(102.71624252922447, -42.0, -7.321724128161051, 1518)
-    femmesh.addNode(397.97122502593004, -42.0, -7.291444565287435, 1519)
-    femmesh.addNode(390.3849928801722, -42.0, -7.273411164490881, 1520)
-    femmesh.addNode(291.9614638163797, -42.0, -7.291218550188255, 1521)
-    femmesh.addNode(284.37461215134533, -42.0, -7.271216410680687, 1522)
-    femmesh.addNode(428.29658772344976, -42.0, -7.264063619949589, 1523)
-    femmesh.addNode(420.71055942654584, -42.0, -7.273925767442385, 1524)
-    femmesh.addNode(352.5051050142311, -42.0, -7.290665572690614, 1525)
-    femmesh.addNode(344.92167474451605, -42.0, -7.271492794259672, 1526)
-    femmesh.addNode(458.93586900489186, -42.0, -6.974652611385807, 1527)
-    femmesh.addNode(451.1250676467331, -42.0, -7.1534474610939185, 1528)
-    femmesh.addNode(474.8438873840081, -42.0, -6.071484798186049, 1529)
-    femmesh.addNode(466.6062544726723, -42.0, -6.617032656436521, 1530)
-    femmesh.addNode(462.48908121591774, -42.0, 1.5169036569788688, 1531)
-    femmesh.addNode(478.076730161892, -42.0, 3.873399573375032, 1532)
-    femmesh.addNode(443.5318903826901, -42.0, -7.229830130641048, 1533)
-    femmesh.addNode(435.87448457310313, -42.0, -7.249856732034928, 1534)
-    femmesh.addNode(95.25843835884318, -42.0, -7.334363537134948, 1535)
-    femmesh.addNode(87.72623043207771, -42.0, -7.330510419768373, 1536)
-    femmesh.addNode(84.29952652440966, -42.0, 0.8886477364587861, 1537)
-    femmesh.addNode(99.06422731043418, -42.0, 0.9487820428814899, 1538)
-    femmesh.addNode(216.1633228649351, -42.0, -7.276482307512467, 1539)
-    femmesh.addNode(208.57647386415084, -42.0, -7.297034174039453, 1540)
-    femmesh.addNode(246.48060839706227, -42.0, -7.290615988001555, 1541)
-    femmesh.addNode(238.8923474543158, -42.0, -7.27409148978019, 1542)
-    femmesh.addNode(170.7339834928625, -42.0, -7.274161022345744, 1543)
-    femmesh.addNode(163.18377463041924, -42.0, -7.273744189052323, 1544)
-    femmesh.addNode(174.5175188863721, -42.0, 0.9772870899965866, 1545)
-    femmesh.addNode(36.646023502925146, -42.0, 5.203562885026166, 1546)
-    femmesh.addNode(70.09448495004841, -42.0, 0.6961417462333586, 1547)
-    femmesh.addNode(468.1808554116716, -42.0, 17.014266776968697, 1548)
-    femmesh.addNode(43.85177111554698, -42.0, 3.211315255506733, 1549)
-    femmesh.addNode(87.67189109402514, -42.0, 8.685775551864218, 1550)
-    femmesh.addNode(95.23954660244928, -42.0, 8.726264345418372, 1551)
-    femmesh.addNode(189.64802233017963, -42.0, 0.9754855219322138, 1552)
-    femmesh.addNode(193.41391545284733, -42.0, 8.73249562039014, 1553)
-    femmesh.addNode(200.9985237462323, -42.0, 8.74477061363298, 1554)
-    femmesh.addNode(193.41603014975772, -42.0, -7.2759006574919525, 1555)
-    femmesh.addNode(465.8401451201213, -42.0, 9.31905711419661, 1556)
-    femmesh.addNode(472.50017697524845, -42.0, 9.569733274700226, 1557)
-    femmesh.addNode(200.99944372217516, -42.0, -7.295189469404107, 1558)
-    femmesh.addNode(204.79437986762014, -42.0, 0.9741986902738446, 1559)
-    femmesh.addNode(480.4174404534423, -42.0, 11.568609236147111, 1560)
-    femmesh.addNode(500.0, -34.486400619589354, -18.562519953795174, 1561)
-    femmesh.addNode(500.0, -34.527223419907635, 19.096060517467457, 1562)
-    femmesh.addNode(500.0, -29.017480046204717, 13.60359938041076, 1563)
-    femmesh.addNode(500.0, -21.55099937050098, -8.908946820336109, 1564)
-    femmesh.addNode(500.0, -27.043460507557683, -14.41869019403903, 1565)
-    femmesh.addNode(500.0, -34.55705988796833, -7.016170240243747, 1566)
-    femmesh.addNode(500.0, -19.557133909940454, -1.389046427955554, 1567)
-    femmesh.addNode(500.0, -21.574539934173046, 6.077429140166904, 1568)
-    femmesh.addNode(500.0, -34.55705988796833, 4.653829759756251, 1569)
-    femmesh.addNode(492.5, -34.22025698456939, -28.973705296593536, 1570)
-    femmesh.addNode(493.8206545964021, -23.00405944535907, -23.21969514107674, 1571)
-    femmesh.addNode(493.8206545964021, -17.63246518146668, -17.49923560809336, 1572)
-    femmesh.addNode(493.714906736087, -14.321148141513873, -11.570702649190174, 1573)
-    femmesh.addNode(493.714906736087, -12.26746700618289, -3.9970591403651032, 1574)
-    femmesh.addNode(487.5355613324891, -15.63302005265906, -14.310219021961812, 1575)
-    femmesh.addNode(493.66604283006586, -12.198059445744203, 3.4415605763380497, 1576)
-    femmesh.addNode(493.66604283006586, -14.092734114968803, 11.008383660745857, 1577)
-    femmesh.addNode(487.3809495661528, -12.007129926210531, -0.6540219696493353, 1578)
-    femmesh.addNode(493.17439828946783, -17.517176652164224, 17.33757079058861, 1579)
-    femmesh.addNode(493.17439828946783, -22.850791225128745, 23.09345801945648, 1580)
-    femmesh.addNode(486.8404411195337, -15.215750109952566, 13.51310319014463, 1581)
-    femmesh.addNode(491.4684749516242, -28.68199964009979, 26.881794330247075, 1582)
-    femmesh.addNode(491.4684749516242, -36.062522099044465, 29.40656994917413, 1583)
-    femmesh.addNode(483.9684749516242, -36.062522099044465, 29.406569949174127, 1584)
-    femmesh.addNode(484.64287324109205, -24.30685114915355, 24.227102256394517, 1585)
-    femmesh.addNode(7.749999999999994, -34.265778353578206, 28.985889938451443, 1586)
-    femmesh.addNode(25.783459757765208, -35.38353480720441, 29.26127796854616, 1587)
-    femmesh.addNode(18.283459757765208, -35.38353480720441, 29.261277968546157, 1588)
-    femmesh.addNode(56.63733632199796, -35.63560012603753, 29.317135164342154, 1589)
-    femmesh.addNode(48.88733632199796, -35.63560012603753, 29.31713516434215, 1590)
-    femmesh.addNode(86.98583509061461, -35.24924224675919, 29.23058791329829, 1591)
-    femmesh.addNode(79.48583509061461, -35.24924224675919, 29.23058791329829, 1592)
-    femmesh.addNode(117.88562042648985, -35.258756840394206, 29.232783662577695, 1593)
-    femmesh.addNode(110.38562042648985, -35.258756840394206, 29.232783662577695, 1594)
-    femmesh.addNode(148.49793140338267, -35.40545886129985, 29.26622673270323, 1595)
-    femmesh.addNode(140.74793140338267, -35.405458861299834, 29.266226732703227, 1596)
-    femmesh.addNode(178.64313569971551, -35.4100332665497, 29.267257105031568, 1597)
-    femmesh.addNode(171.14313569971551, -35.4100332665497, 29.267257105031568, 1598)
-    femmesh.addNode(209.04658927125914, -35.41585207561315, 29.268566690389793, 1599)
-    femmesh.addNode(201.29658927125914, -35.41585207561315, 29.268566690389793, 1600)
-    femmesh.addNode(239.22075897347304, -35.39646561457883, 29.26419883783876, 1601)
-    femmesh.addNode(231.72075897347304, -35.39646561457883, 29.264198837838755, 1602)
-    femmesh.addNode(269.64573899802906, -35.40325796093998, 29.26573071819841, 1603)
-    femmesh.addNode(262.14573899802906, -35.40325796093998, 29.265730718198405, 1604)
-    femmesh.addNode(299.9885734632582, -35.439702963907074, 29.273921889597137, 1605)
-    femmesh.addNode(292.2385734632582, -35.439702963907074, 29.273921889597133, 1606)
-    femmesh.addNode(329.8847217929376, -35.59957936186231, 29.309292309008512, 1607)
-    femmesh.addNode(322.3847217929376, -35.59957936186231, 29.30929230900851, 1608)
-    femmesh.addNode(359.9666174431855, -35.6096893411802, 29.31149825040983, 1609)
-    femmesh.addNode(352.2166174431855, -35.6096893411802, 29.31149825040983, 1610)
-    femmesh.addNode(389.9488068855633, -35.408314853579455, 29.266870125287806, 1611)
-    femmesh.addNode(382.4488068855633, -35.408314853579455, 29.266870125287806, 1612)
-    femmesh.addNode(420.5932916738865, -35.30483611492381, 29.243371566082747, 1613)
-    femmesh.addNode(413.0932916738865, -35.30483611492381, 29.243371566082747, 1614)
-    femmesh.addNode(451.6512441280124, -35.278333723199665, 29.237291298328767, 1615)
-    femmesh.addNode(443.9012441280124, -35.278333723199665, 29.237291298328767, 1616)
-    femmesh.addNode(476.4684749516242, -36.062522099044465, 29.406569949174127, 1617)
-    femmesh.addNode(473.5186008353706, -30.180845895320683, 27.573675784157757, 1618)
-    femmesh.addNode(467.05012588374643, -35.87191028990828, 29.36743973357354, 1619)
-    femmesh.addNode(6.411011325506604, -35.64316309472855, -29.318775973082147, 1620)
-    femmesh.addNode(6.411011325506603, -28.257544609686587, -26.667300572897247, 1621)
-    femmesh.addNode(6.5169346321929815, -17.430209902591905, -17.214105105096436, 1622)
-    femmesh.addNode(6.516934632192982, -22.734781882560007, -22.9967687053521, 1623)
-    femmesh.addNode(6.912406758994304, -14.363429105377598, 11.671330223522508, 1624)
-    femmesh.addNode(6.9124067589943055, -12.288691430498652, 4.151884281609473, 1625)
-    femmesh.addNode(20.014772145548097, -37.2700792086557, -29.62478437571502, 1626)
-    femmesh.addNode(27.514772145548097, -37.2700792086557, -29.624784375715016, 1627)
-    femmesh.addNode(34.01035012636375, -35.96003353653637, -29.385690482277838, 1628)
-    femmesh.addNode(41.51035012636375, -35.96003353653637, -29.385690482277834, 1629)
-    femmesh.addNode(31.02512227191184, -31.40251025010752, -28.065872710481024, 1630)
-    femmesh.addNode(49.07509920801415, -35.39396003849127, -29.263633336052944, 1631)
-    femmesh.addNode(56.82509920801415, -35.39396003849127, -29.26363333605294, 1632)
-    femmesh.addNode(45.0854493343779, -29.63751968095608, -27.33439372587677, 1633)
-    femmesh.addNode(64.65833278396306, -35.417669605058904, -29.26897549576742, 1634)
-    femmesh.addNode(72.15833278396306, -35.417669605058904, -29.268975495767418, 1635)
-    femmesh.addNode(60.483431991977206, -29.134169168939465, -27.10111431337338, 1636)
-    femmesh.addNode(79.77936581057301, -35.56404916113734, -29.30151082793756, 1637)
-    femmesh.addNode(87.27936581057301, -35.56404916113734, -29.30151082793756, 1638)
-    femmesh.addNode(75.93769859453607, -29.291802908831777, -27.17538825282948, 1639)
-    femmesh.addNode(94.82866690154316, -35.67419668678873, -29.32548742037486, 1640)
-    femmesh.addNode(102.57866690154316, -35.67419668678873, -29.325487420374863, 1641)
-    femmesh.addNode(91.10803271211617, -29.530233678645516, -27.28561760141801, 1642)
-    femmesh.addNode(110.06676314943999, -35.60098573654692, -29.30959939091837, 1643)
-    femmesh.addNode(117.56676314943999, -35.60098573654692, -29.30959939091837, 1644)
-    femmesh.addNode(106.14543005098315, -29.56463422594515, -27.301312753519085, 1645)
-    femmesh.addNode(124.9923525337828, -35.486494885183696, -29.284368716420374, 1646)
-    femmesh.addNode(132.49235253378282, -35.48649488518369, -29.28436871642037, 1647)
-    femmesh.addNode(121.05911568322279, -29.390022711381278, -27.2211034453146, 1648)
-    femmesh.addNode(139.9922380596209, -35.44734419270036, -29.275633244578337, 1649)
-    femmesh.addNode(147.7422380596209, -35.44734419270036, -29.275633244578337, 1650)
-    femmesh.addNode(135.98459059340368, -29.247420812972443, -27.154589374147974, 1651)
-    femmesh.addNode(155.27935030203372, -35.41332000226291, -29.267996969512758, 1652)
-    femmesh.addNode(162.77935030203372, -35.41332000226291, -29.267996969512758, 1653)
-    femmesh.addNode(151.0215883616546, -29.17958872588357, -27.12262993816246, 1654)
-    femmesh.addNode(170.30054576853874, -35.40011207662738, -29.26502143171807, 1655)
-    femmesh.addNode(177.80054576853874, -35.40011207662738, -29.26502143171807, 1656)
-    femmesh.addNode(166.07989607057246, -29.135838965397248, -27.10190696013486, 1657)
-    femmesh.addNode(185.33890247075868, -35.39528530892456, -29.263932474113755, 1658)
-    femmesh.addNode(192.83890247075868, -35.39528530892456, -29.263932474113755, 1659)
-    femmesh.addNode(181.13944823929745, -29.11914028296505, -27.093974476810597, 1660)
-    femmesh.addNode(200.4277777985211, -35.406295312220855, -29.266415197122395, 1661)
-    femmesh.addNode(208.1777777985211, -35.406295312220855, -29.266415197122395, 1662)
-    femmesh.addNode(196.26668026927982, -29.12486496183299, -27.09669532893194, 1663)
-    femmesh.addNode(215.78355693118658, -35.39756049148682, -29.26444587782966, 1664)
-    femmesh.addNode(223.28355693118658, -35.39756049148682, -29.264445877829658, 1665)
-    femmesh.addNode(211.4613347297077, -29.12697166866728, -27.097696241206606, 1666)
-    femmesh.addNode(230.8585505142552, -35.403403074923524, -29.265763427733585, 1667)
-    femmesh.addNode(238.3585505142552, -35.403403074923524, -29.26576342773358, 1668)
-    femmesh.addNode(226.64210744544175, -29.124293786870904, -27.096423924813145, 1669)
-    femmesh.addNode(245.95351592517014, -35.42034819693171, -29.26957775832062, 1670)
-    femmesh.addNode(253.70351592517014, -35.420348196931705, -29.269577758320615, 1671)
-    femmesh.addNode(241.81206643942534, -29.14539534185586, -27.106440915081716, 1672)
-    femmesh.addNode(261.2950114003064, -35.409784602509255, -29.267201113442205, 1673)
-    femmesh.addNode(268.7950114003064, -35.409784602509255, -29.2672011134422, 1674)
-    femmesh.addNode(256.9985273254765, -29.15130618007332, -27.10924320451928, 1675)
-    femmesh.addNode(276.3529829279027, -35.40669917630945, -29.26650618451608, 1676)
-    femmesh.addNode(283.8529829279027, -35.406699176309445, -29.266506184516075, 1677)
-    femmesh.addNode(272.14799432820905, -29.138665303454165, -27.103248326047986, 1678)
-    femmesh.addNode(291.45194434164773, -35.4057373781381, -29.266289489340995, 1679)
-    femmesh.addNode(299.20194434164773, -35.4057373781381, -29.26628948934099, 1680)
-    femmesh.addNode(287.30492726955043, -29.13491738661576, -27.101469505375444, 1681)
-    femmesh.addNode(306.84678656328026, -35.35429227820612, -29.25465038034954, 1682)
-    femmesh.addNode(314.34678656328026, -35.35429227820612, -29.254650380349535, 1683)
-    femmesh.addNode(302.548730904928, -29.0863982144533, -27.078384163836688, 1684)
-    femmesh.addNode(322.02212622578213, -35.269000902599494, -29.235144110313353, 1685)
-    femmesh.addNode(329.52212622578213, -35.26900090259949, -29.235144110313346, 1686)
-    femmesh.addNode(317.8689127890624, -28.95995839111147, -27.017722236310966, 1687)
-    femmesh.addNode(337.2401262263253, -35.219079520712114, -29.223605483471232, 1688)
-    femmesh.addNode(344.7401262263253, -35.219079520712114, -29.22360548347123, 1689)
-    femmesh.addNode(333.2622524521074, -28.83515834851172, -26.957131603552245, 1690)
-    femmesh.addNode(352.50251207901556, -35.27771201183092, -29.237148359648774, 1691)
-    femmesh.addNode(360.25251207901556, -35.27771201183092, -29.23714835964877, 1692)
-    femmesh.addNode(348.7426383053409, -28.843190993983093, -26.961052961247418, 1693)
-    femmesh.addNode(367.98144047342964, -35.347364815158876, -29.253075822849965, 1694)
-    femmesh.addNode(375.48144047342964, -35.34736481515887, -29.25307582284996, 1695)
-    femmesh.addNode(364.2339525524452, -28.96161059657162, -27.018519607198357, 1696)
-    femmesh.addNode(383.1053716775016, -35.39637731485798, -29.26417891266168, 1697)
-    femmesh.addNode(390.6053716775016, -35.39637731485798, -29.26417891266168, 1698)
-    femmesh.addNode(379.58681215093117, -29.07132728653768, -27.071191733430766, 1699)
-    femmesh.addNode(398.1831120006521, -35.46152689224101, -29.278804098171552, 1700)
-    femmesh.addNode(405.9331120006521, -35.46152689224101, -29.278804098171552, 1701)
-    femmesh.addNode(394.7884836781536, -29.1770259407454, -27.12141840456872, 1702)
-    femmesh.addNode(413.4437249657156, -35.538751939414496, -29.29594295290006, 1703)
-    femmesh.addNode(420.9437249657156, -35.538751939414496, -29.29594295290006, 1704)
-    femmesh.addNode(409.8768369663677, -29.309054954681077, -27.183449263415596, 1705)
-    femmesh.addNode(428.46948295651066, -35.52262478292782, -29.2923814377946, 1706)
-    femmesh.addNode(435.96948295651066, -35.52262478292782, -29.2923814377946, 1707)
-    femmesh.addNode(424.9132079222263, -29.36579474670789, -27.20986691657423, 1708)
-    femmesh.addNode(443.6339617373414, -35.262612326613436, -29.23367249146937, 1709)
-    femmesh.addNode(451.3839617373414, -35.262612326613436, -29.23367249146937, 1710)
-    femmesh.addNode(440.1034446938521, -29.10961348921846, -27.08944325014185, 1711)
-    femmesh.addNode(459.20343324883606, -34.92302589288463, -29.153326353732137, 1712)
-    femmesh.addNode(466.70343324883606, -34.92302589288464, -29.153326353732137, 1713)
-    femmesh.addNode(455.5873949861774, -28.556559836935474, -26.819282551591463, 1714)
-    femmesh.addNode(474.6955217273736, -35.23996036413934, -29.228442724879933, 1715)
-    femmesh.addNode(482.1955217273736, -35.23996036413935, -29.228442724879933, 1716)
-    femmesh.addNode(471.3989549762096, -28.535780865874564, -26.80885680345667, 1717)
-    femmesh.addNode(10.533459757765208, -28.06342195579044, 26.566365811259473, 1718)
-    femmesh.addNode(489.6955217273736, -27.891561021880644, -26.475497154929435, 1719)
-    femmesh.addNode(483.51617632377565, -23.82908737594172, -23.87085952388046, 1720)
-    femmesh.addNode(33.627625917550105, -35.47307644554428, 29.28138092567172, 1721)
-    femmesh.addNode(28.91108567531532, -29.175821263396244, 27.120848801828465, 1722)
-    femmesh.addNode(41.127625917550105, -35.473076445544265, 29.28138092567172, 1723)
-    femmesh.addNode(44.51496223954807, -29.40969609579659, 27.23020836497218, 1724)
-    femmesh.addNode(71.72705750699083, -35.37520895903437, 29.259394109645235, 1725)
-    femmesh.addNode(64.22705750699083, -35.37520895903437, 29.259394109645235, 1726)
-    femmesh.addNode(102.56885013264395, -35.21097614061813, 29.221724025744013, 1727)
-    femmesh.addNode(94.81885013264395, -35.21097614061813, 29.221724025744013, 1728)
-    femmesh.addNode(133.103560828578, -35.346140664751665, 29.25279740378226, 1729)
-    femmesh.addNode(125.603560828578, -35.346140664751665, 29.25279740378226, 1730)
-    femmesh.addNode(163.61172304508642, -35.404618242408695, 29.26603730387211, 1731)
-    femmesh.addNode(156.11172304508642, -35.404618242408695, 29.26603730387211, 1732)
-    femmesh.addNode(193.71513075337788, -35.40455021809691, 29.266021973858987, 1733)
-    femmesh.addNode(186.21513075337788, -35.40455021809691, 29.266021973858987, 1734)
-    femmesh.addNode(224.16487946507934, -35.3954160885485, 29.263961990075764, 1735)
-    femmesh.addNode(216.66487946507934, -35.3954160885485, 29.263961990075764, 1736)
-    femmesh.addNode(254.58268928554554, -35.40829834586474, 29.266866407302196, 1737)
-    femmesh.addNode(246.83268928554554, -35.40829834586474, 29.266866407302192, 1738)
-    femmesh.addNode(284.70272788402275, -35.407512368650465, 29.26668937257009, 1739)
-    femmesh.addNode(277.20272788402275, -35.407512368650465, 29.266689372570088, 1740)
-    femmesh.addNode(314.9973971933673, -35.47935259692575, 29.282779196052843, 1741)
-    femmesh.addNode(307.4973971933673, -35.47935259692575, 29.28277919605284, 1742)
-    femmesh.addNode(344.778457503848, -35.67774723240858, 29.326253083929547, 1743)
-    femmesh.addNode(337.278457503848, -35.67774723240858, 29.326253083929544, 1744)
-    femmesh.addNode(374.91499206377483, -35.47227826669189, 29.281202997358246, 1745)
-    femmesh.addNode(367.41499206377483, -35.47227826669189, 29.281202997358246, 1746)
-    femmesh.addNode(405.3342405846993, -35.37611283478485, 29.259598746778863, 1747)
-    femmesh.addNode(397.5842405846993, -35.37611283478485, 29.259598746778863, 1748)
-    femmesh.addNode(435.8828306739215, -35.29228562905547, 29.240495343236404, 1749)
-    femmesh.addNode(428.3828306739215, -35.29228562905547, 29.240495343236404, 1750)
-    femmesh.addNode(459.55012588374643, -35.87191028990828, 29.36743973357354, 1751)
-    femmesh.addNode(59.864393828988796, -29.318720714427407, 27.18795975576888, 1752)
-    femmesh.addNode(6.764826392526361, -12.175821829208289, -3.243207738778255, 1753)
-    femmesh.addNode(6.764826392526363, -14.037145790657672, -10.86640623513892, 1754)
-    femmesh.addNode(6.429240281268596, -23.126189678961833, 23.319075538397172, 1755)
-    femmesh.addNode(6.429240281268598, -17.72464556294294, 17.6268876139622, 1756)
-    femmesh.addNode(198.01172002463701, -29.14229401236558, 27.10496996374562, 1757)
-    femmesh.addNode(14.161011325506603, -35.64316309472855, -29.318775973082143, 1758)
-    femmesh.addNode(13.28176102471934, -15.122151095060694, -13.325961062649585, 1759)
-    femmesh.addNode(121.98918125506785, -28.94296497112626, 27.009513810040445, 1760)
-    femmesh.addNode(152.6096544484691, -29.13273250421456, 27.10043223256606, 1761)
-    femmesh.addNode(182.8582664530934, -29.136905476050636, 27.102413163184305, 1762)
-    femmesh.addNode(213.21146873633847, -29.133834690969003, 27.10095552265067, 1763)
-    femmesh.addNode(243.55344825901858, -29.127812447982784, 27.098095645740422, 1764)
-    femmesh.addNode(273.84846688205187, -29.133374402989457, 27.10073699636887, 1765)
-    femmesh.addNode(303.98597065662557, -29.23371158947821, 27.148146902125397, 1766)
-    femmesh.addNode(333.6631792967856, -29.566629670186934, 27.302221562388073, 1767)
-    femmesh.addNode(363.38160950696033, -29.384890407262933, 27.218725355226276, 1768)
-    femmesh.addNode(393.53304747026255, -29.108983072055743, 27.089143260049024, 1769)
-    femmesh.addNode(424.476122347808, -28.93579692958162, 27.00604743635907, 1770)
-    femmesh.addNode(456.20137001175885, -29.447770891685444, 27.24778054103465, 1771)
-    femmesh.addNode(228.38563843855238, -29.115885463964077, 27.09242684999464, 1772)
-    femmesh.addNode(258.72842828357466, -29.13410221449093, 27.10108252769317, 1773)
-    femmesh.addNode(288.94130134728096, -29.167128549152608, 27.116736719709277, 1774)
-    femmesh.addNode(318.88211898630493, -29.38207783036232, 27.2174216288202, 1775)
-    femmesh.addNode(348.49507494703346, -29.57604771328763, 27.30650855707296, 1776)
-    femmesh.addNode(378.3637989493381, -29.198051498340384, 27.131349294881367, 1777)
-    femmesh.addNode(408.92753225858576, -29.013246586482687, 27.043376929971252, 1778)
-    femmesh.addNode(440.2840748019339, -28.911324984167976, 26.99419541919966, 1779)
-    femmesh.addNode(167.7548587448019, -29.136968471408835, 27.10244306136389, 1780)
-    femmesh.addNode(137.35149223196066, -29.078595604858293, 27.07466174224923, 1781)
-    femmesh.addNode(106.4544705591338, -28.81823956793718, 26.948862534654488, 1782)
-    femmesh.addNode(75.21289259760545, -28.961012714297258, 27.01823107761282, 1783)
-    femmesh.addNode(90.80468522325856, -28.809468706764676, 26.944570588565348, 1784)
-    femmesh.addNode(13.677233151520667, -12.011245561840703, 0.8213447800900743, 1785)
-    femmesh.addNode(13.341647040262906, -15.715670506017556, 14.461466836104997, 1786)
-    femmesh.addNode(481.6798353772539, -12.389235736235058, -4.816911844298171, 1787)
-    femmesh.addNode(481.63097147123267, -12.114358544675607, 2.616951433213195, 1788)
-    femmesh.addNode(480.2606802479961, -13.441671011004605, 9.18813611981817, 1789)
-    femmesh.addNode(479.7690357073981, -16.451366860121905, 15.724736712706067, 1790)
-    femmesh.addNode(474.55956605909705, -12.441713636675136, 5.129103943544556, 1791)
-    femmesh.addNode(479.57812689056755, -20.371820217948862, 20.78994563040699, 1792)
-    femmesh.addNode(477.87220355272393, -25.739286577025712, 25.21089445013622, 1793)
-    femmesh.addNode(468.45385448484615, -25.576105886884864, 25.104893988248328, 1794)
-    femmesh.addNode(472.99836601902996, -17.40469251580449, 17.177626429686967, 1795)
-    femmesh.addNode(20.79342140589969, -12.42049303405323, 5.005273983660292, 1796)
-    femmesh.addNode(20.645841039431744, -12.094834923011536, -2.3835061816722134, 1797)
-    femmesh.addNode(48.16177462561821, -24.458404447799623, 24.337058685942814, 1798)
-    femmesh.addNode(40.402064221170356, -24.323677114241107, 24.239381370785786, 1799)
-    femmesh.addNode(94.45423433828985, -22.97496933738575, 23.195866189616385, 1800)
-    femmesh.addNode(86.62121929626052, -23.00535621740891, 23.220755964706974, 1801)
-    femmesh.addNode(78.42262798866797, -23.21708592428332, 23.392352143900474, 1802)
-    femmesh.addNode(70.66385040504419, -23.318017382036842, 23.473038266533013, 1803)
-    femmesh.addNode(82.07217710369926, -18.3476597937548, 18.454452112377584, 1804)
-    femmesh.addNode(156.9209025430054, -23.458433164388993, 23.58411116155476, 1805)
-    femmesh.addNode(149.3071109013017, -23.459110584732848, 23.58464372617988, 1806)
-    femmesh.addNode(187.16287786166123, -23.46416079481551, 23.588613035944856, 1807)
-    femmesh.addNode(179.59088280799887, -23.468580401216386, 23.592085275655908, 1808)
-    femmesh.addNode(141.6860801476234, -23.426447036216818, 23.558928886974943, 1809)
-    femmesh.addNode(134.04170957281872, -23.378723925170608, 23.521226102076138, 1810)
-    femmesh.addNode(145.99732824215974, -18.67656687850565, 18.868425144329922, 1811)
-    femmesh.addNode(217.54844013665382, -23.450829439008896, 23.578131213038564, 1812)
-    femmesh.addNode(209.93014994283362, -23.46729804834184, 23.591077939996893, 1813)
-    femmesh.addNode(247.91284109235335, -23.456276990607172, 23.582415842125197, 1814)
-    femmesh.addNode(240.30091078028082, -23.446743590923095, 23.574916259003956, 1815)
-    femmesh.addNode(278.1612229378501, -23.46117963953457, 23.58627015113656, 1816)
-    femmesh.addNode(270.60423405185645, -23.457751116464898, 23.583574927076775, 1817)
-    femmesh.addNode(308.22157357741696, -23.575338832505807, 23.675554077212947, 1818)
-    femmesh.addNode(300.7127498473078, -23.543293586464596, 23.65058114221645, 1819)
-    femmesh.addNode(337.4680162726063, -24.1897473280162, 24.141145369681563, 1820)
-    femmesh.addNode(330.0742805616959, -24.12544494571053, 24.09357345042819, 1821)
-    femmesh.addNode(366.6709356688542, -23.69375313311966, 23.76723218317265, 1822)
-    femmesh.addNode(359.2225610482649, -23.80543128180617, 23.852833566663026, 1823)
-    femmesh.addNode(396.85338763600544, -23.423530137181753, 23.5566289488927, 1824)
-    femmesh.addNode(389.21795393686943, -23.449463699561534, 23.57705670702174, 1825)
-    femmesh.addNode(428.1621631711216, -23.14754386592945, 23.336342852146952, 1826)
-    femmesh.addNode(420.3726241710866, -23.157561438929644, 23.344432078598384, 1827)
-    femmesh.addNode(172.04341163504506, -23.46640541601181, 23.59037667771258, 1828)
-    femmesh.addNode(164.51199898041597, -23.462040953873647, 23.586947119204382, 1829)
-    femmesh.addNode(176.3480230436129, -18.71026207238863, 18.910000192046056, 1830)
-    femmesh.addNode(232.72345377533532, -23.44283222302301, 23.57183752059074, 1831)
-    femmesh.addNode(225.16757426694159, -23.441986855341693, 23.571171971768646, 1832)
-    femmesh.addNode(237.08284660867002, -18.691394013880668, 18.886738389246673, 1833)
-    femmesh.addNode(16.96270003903381, -24.034736485730313, 24.026013128749653, 1834)
-    femmesh.addNode(62.75969204179866, -23.51307657733785, 23.626968962705018, 1835)
-    femmesh.addNode(55.16997085680579, -23.72386171959687, 23.790392379185, 1836)
-    femmesh.addNode(65.96942743286118, -18.671713018222274, 18.862423664413342, 1837)
-    femmesh.addNode(126.27052134481374, -23.28925933738259, 23.450121190652226, 1838)
-    femmesh.addNode(118.5525809427256, -23.21926896461061, 23.394104850931203, 1839)
-    femmesh.addNode(130.60510926047647, -18.578860080629077, 18.747005224228506, 1840)
-    femmesh.addNode(20.773250585917815, -18.48628031478408, 18.630753784135774, 1841)
-    femmesh.addNode(21.256417063643518, -14.877932156038785, 12.821600362964258, 1842)
-    femmesh.addNode(28.225024951554595, -13.664580934849113, 9.854137527063635, 1843)
-    femmesh.addNode(24.877470062414424, -22.594512310070833, 22.87852808893107, 1844)
-    femmesh.addNode(32.72163622219932, -22.664588859545454, 22.937782718248652, 1845)
-    femmesh.addNode(202.35028895130043, -23.471785051098305, 23.594602154037222, 1846)
-    femmesh.addNode(194.76883043341917, -23.46267514202511, 23.58744554015776, 1847)
-    femmesh.addNode(191.50144678832464, -18.710814468201832, 18.910680507731193, 1848)
-    femmesh.addNode(206.68726035161578, -18.70602763030967, 18.904783818920155, 1849)
-    femmesh.addNode(475.9564933428112, -22.13219383911328, -22.47821786426644, 1850)
-    femmesh.addNode(480.0816262118397, -18.133770633976667, -18.176993586629273, 1851)
-    femmesh.addNode(12.927945957699581, -23.879749233777446, -23.90933943397874, 1852)
-    femmesh.addNode(40.07876127093096, -23.89978474539469, -23.92451060600724, 1853)
-    femmesh.addNode(47.643510352581366, -23.441369028587737, -23.5706855323925, 1854)
-    femmesh.addNode(56.6003349432736, -23.441459058146847, -23.57075641784878, 1855)
-    femmesh.addNode(64.4335685192225, -23.46056056661712, -23.58578354636384, 1856)
-    femmesh.addNode(51.593646879826665, -18.689221923184775, -18.884057441489375, 1857)
-    femmesh.addNode(72.359240759616, -23.601774469410525, -23.696102998711936, 1858)
-    femmesh.addNode(79.98027378622595, -23.720446319814307, -23.78776822766711, 1859)
-    femmesh.addNode(68.4761437109124, -18.80250914341433, -19.023049649270845, 1860)
-    femmesh.addNode(87.38303054761684, -24.074513395212804, -24.055704728433838, 1861)
-    femmesh.addNode(94.93233163858699, -24.165030618683467, -24.1228909371887, 1862)
-    femmesh.addNode(83.80457271269677, -19.2026718884981, -19.500816161805243, 1863)
-    femmesh.addNode(102.24278199660084, -24.182194407910107, -24.135571339466757, 1864)
-    femmesh.addNode(109.73087824449766, -24.121979382142204, -24.091002029543112, 1865)
-    femmesh.addNode(98.5177798321015, -19.50790148005533, -19.852090675017127, 1866)
-    femmesh.addNode(116.91182686209116, -23.80354628127889, -23.851395599889734, 1867)
-    femmesh.addNode(124.33741624643397, -23.710475765429003, -23.780103096350086, 1868)
-    femmesh.addNode(113.00917880770885, -19.260095957270273, -19.567748059688505, 1869)
-    femmesh.addNode(131.72068627021764, -23.58952296667809, -23.686585558191478, 1870)
-    femmesh.addNode(139.2205717960557, -23.557867778922997, -23.66194749255251, 1871)
-    femmesh.addNode(127.573397449086, -18.9042999384365, -19.14650460701103, 1872)
-    femmesh.addNode(146.69971922091804, -23.514799241090174, -23.62831675982862, 1873)
-    femmesh.addNode(154.23683146333087, -23.487347286119103, -23.606814471572324, 1874)
-    femmesh.addNode(142.43581489773197, -18.772402570099967, -18.98627708726753, 1875)
-    femmesh.addNode(161.75328319831976, -23.46566689987044, -23.58979644959744, 1876)
-    femmesh.addNode(169.2744786648248, -23.4550227529947, -23.58142953487031, 1877)
-    femmesh.addNode(157.43141405758323, -18.7204640108981, -18.92255807580223, 1878)
-    femmesh.addNode(176.81425591327405, -23.445616501864095, -23.574029205973684, 1879)
-    femmesh.addNode(184.35261261549402, -23.441728546628823, -23.57096859831998, 1880)
-    femmesh.addNode(172.48764304102139, -18.69555048830558, -18.89186684679109, 1881)
-    femmesh.addNode(191.9240109752078, -23.442578289669036, -23.571637606770878, 1882)
-    femmesh.addNode(199.51288630297023, -23.451447611056203, -23.57861752254795, 1883)
-    femmesh.addNode(187.5988186491844, -18.688696229958328, -18.883408499019435, 1884)
-    femmesh.addNode(207.11016442421527, -23.454604923409093, -23.58110093810625, 1885)
-    femmesh.addNode(214.7159435568807, -23.447567524455962, -23.57556466429546, 1886)
-    femmesh.addNode(202.76749513014323, -18.691905775242105, -18.88736994951404, 1887)
-    femmesh.addNode(222.31977590253558, -23.45025793128208, -23.577681590521877, 1888)
-    femmesh.addNode(229.89476948560423, -23.454965428170066, -23.581384453200158, 1889)
-    femmesh.addNode(217.96860559704317, -18.6965907867555, -18.89315005604067, 1890)
-    femmesh.addNode(237.4902955046325, -23.463555728666833, -23.588137564796366, 1891)
-    femmesh.addNode(245.08526091554745, -23.477215673424574, -23.59886566746735, 1892)
-    femmesh.addNode(233.16796396172634, -18.70563088300974, -18.90429494695341, 1893)
-    femmesh.addNode(252.6684521577057, -23.48091548050774, -23.601769182836687, 1894)
-    femmesh.addNode(260.25994763284194, -23.472398298292276, -23.595083707901406, 1895)
-    femmesh.addNode(248.34668122291288, -18.71548318834944, -18.916428755131356, 1896)
-    femmesh.addNode(267.8323072541935, -23.46836759805431, -23.59191811869382, 1897)
-    femmesh.addNode(275.3902787817898, -23.465880548746753, -23.589964310415418, 1898)
-    femmesh.addNode(263.5022320864227, -18.71521703552747, -18.916101138908296, 1899)
-    femmesh.addNode(282.97086157067815, -23.459910882710336, -23.585272852416917, 1900)
-    femmesh.addNode(290.5698229844232, -23.459135796571893, -23.584663546254696, 1901)
-    femmesh.addNode(278.65517449666254, -18.707200135831894, -18.906228457516534, 1902)
-    femmesh.addNode(298.1990566253238, -23.43160956348168, -23.562998039235406, 1903)
-    femmesh.addNode(305.8438988469563, -23.39021036164068, -23.53031511935212, 1904)
-    femmesh.addNode(293.86499092645147, -18.68036272035368, -18.873116254231235, 1905)
-    femmesh.addNode(313.5870677123725, -23.301767772965132, -23.460096154616917, 1906)
-    femmesh.addNode(321.26240737487444, -23.23342716539134, -23.40546397838174, 1907)
-    femmesh.addNode(309.23739343276833, -18.587565664109057, -18.75787617156037, 1908)
-    femmesh.addNode(329.2295280267127, -23.030829758110105, -23.241570091846107, 1909)
-    femmesh.addNode(336.9475280272559, -22.991162752317177, -23.209138426298864, 1910)
-    femmesh.addNode(324.94768295002285, -18.355839091681794, -18.46493040716792, 1911)
-    femmesh.addNode(345.01057209480587, -22.992323133335024, -23.21008875753054, 1912)
-    femmesh.addNode(352.77295794749614, -23.038917869281153, -23.24816905547899, 1913)
-    femmesh.addNode(340.9778476694111, -18.197253233882133, -18.260045081764247, 1914)
-    femmesh.addNode(360.76669150814337, -23.238206345066157, -23.409295137822507, 1915)
-    femmesh.addNode(368.4956199025574, -23.294013172579074, -23.45391346475788, 1916)
-    femmesh.addNode(357.03462529760833, -18.355030589392705, -18.463895081250936, 1917)
-    femmesh.addNode(376.2609824239787, -23.37962999139095, -23.52194338787696, 1918)
-    femmesh.addNode(383.88491362805064, -23.419058800365097, -23.553102218937237, 1919)
-    femmesh.addNode(372.79372137967687, -18.581813609145176, -18.750694551487385, 1920)
-    femmesh.addNode(391.5019318063974, -23.478590386791915, -23.599944617302793, 1921)
-    femmesh.addNode(399.07967212954793, -23.531162608682926, -23.64110922552248, 1922)
-    femmesh.addNode(388.17610207944495, -18.697953673353723, -18.894830959572715, 1923)
-    femmesh.addNode(406.54884686933735, -23.63696459436556, -23.723383626527895, 1924)
-    femmesh.addNode(414.05945983440085, -23.69958222164433, -23.77172078621233, 1925)
-    femmesh.addNode(403.26229499758114, -18.83064615623569, -19.05730942348475, 1926)
-    femmesh.addNode(421.3190069467595, -23.94156533234384, -23.956062642971812, 1927)
-    femmesh.addNode(428.8447649375546, -23.92837966844817, -23.946117401203853, 1928)
-    femmesh.addNode(417.99101684972914, -19.111489867326203, -19.393712999487366, 1929)
-    femmesh.addNode(436.2647730190772, -23.716949178413522, -23.785080463502357, 1930)
-    femmesh.addNode(443.92925179990795, -23.506336111690846, -23.621693334438266, 1931)
-    femmesh.addNode(432.67057204361043, -19.136349877884015, -19.423014778696484, 1932)
-    femmesh.addNode(451.58505542594565, -22.672302766433557, -22.944282940366293, 1933)
-    femmesh.addNode(459.4045269374403, -22.406725450561098, -22.717913469997747, 1934)
-    femmesh.addNode(447.7463837511708, -18.29169276891065, -18.38249624605627, 1935)
-    femmesh.addNode(467.96440486427366, -21.889319045995773, -22.261188458082085, 1936)
-    femmesh.addNode(20.24341688263496, -13.602544338217598, -9.673908824105306, 1937)
-    femmesh.addNode(19.99552512230158, -16.724076916157273, -16.1594465332098, 1938)
-    femmesh.addNode(27.359605137013983, -12.529083757513416, -5.609375707540049, 1939)
-    femmesh.addNode(479.9758783515246, -14.65718396738253, -12.343841031317371, 1940)
-    femmesh.addNode(474.2259002566044, -13.475287878147846, -9.291974944297836, 1941)
-    femmesh.addNode(51.05707283842807, -19.4210525372783, 19.753256224624174, 1942)
-    femmesh.addNode(36.36844860826946, -18.653283657386513, 18.839608170488695, 1943)
-    femmesh.addNode(102.66990918539703, -22.977610582284115, 23.198032262258188, 1944)
-    femmesh.addNode(98.48644325839899, -18.18306558238377, 18.241535981023315, 1945)
-    femmesh.addNode(110.48667947924292, -23.015560107643367, 23.22909903490661, 1946)
-    femmesh.addNode(161.20945543324856, -18.7056267801108, 18.904289891252464, 1947)
-    femmesh.addNode(221.88625547343673, -18.69534497811483, 18.89161333266495, 1948)
-    femmesh.addNode(18.675783471054693, -31.100152977263434, -27.949836043900877, 1949)
-    femmesh.addNode(263.06538778112815, -23.453352807741748, 23.58011615590351, 1950)
-    femmesh.addNode(255.50233806864463, -23.457414165581223, 23.583310000362857, 1951)
-    femmesh.addNode(293.2442731592877, -23.50241723905439, 23.618624684811156, 1952)
-    femmesh.addNode(285.7084275800522, -23.47645338546191, 23.59826732662882, 1953)
-    femmesh.addNode(322.9755289972541, -23.80007436928936, 23.84874644581147, 1954)
-    femmesh.addNode(315.58820439768385, -23.702356174894742, 23.773856028200196, 1955)
-    femmesh.addNode(352.08187350867433, -24.138589000558678, 24.103319213524106, 1956)
-    femmesh.addNode(344.64371356933685, -24.194588070290763, 24.14471590251937, 1957)
-    femmesh.addNode(381.6132335096502, -23.507775612091276, 23.622820263195454, 1958)
-    femmesh.addNode(374.07941868786173, -23.559435267335672, 23.663169110252763, 1959)
-    femmesh.addNode(412.36328803020297, -23.29872540881588, 23.45767099831387, 1960)
-    femmesh.addNode(404.6042369410157, -23.355939849763878, 23.50317044814128, 1961)
-    femmesh.addNode(444.2815181165423, -23.26456256486773, 23.43039445067558, 1962)
-    femmesh.addNode(436.2631046624514, -23.27574496497467, 23.439331760597035, 1963)
-    femmesh.addNode(461.11978652531405, -23.361540226623333, 23.50761190074876, 1964)
-    femmesh.addNode(453.2209047695801, -22.889220240725045, 23.12526966313023, 1965)
-    femmesh.addNode(19.666439082274255, -20.765550707437306, -21.191936278726008, 1966)
-    femmesh.addNode(19.560515775587877, -25.93992122264032, -25.339176578275012, 1967)
-    femmesh.addNode(25.414276595629367, -27.36209388291075, -26.18647942177949, 1968)
-    femmesh.addNode(26.628094940189875, -18.161992082593702, -18.213988539846905, 1969)
-    femmesh.addNode(463.96206530404186, -17.252003583295764, -16.956906361680215, 1970)
-    femmesh.addNode(449.1999346300975, -18.25616024326732, 18.336577477997473, 1971)
-    femmesh.addNode(252.24980058990687, -18.695439020557114, 18.891729342636427, 1972)
-    femmesh.addNode(31.90985457644502, -26.2143967661248, -25.511070744730976, 1973)
-    femmesh.addNode(432.15960648572997, -18.452649881955367, 18.588230212105373, 1974)
-    femmesh.addNode(400.28914340762253, -18.629465209148208, 18.810053258552703, 1975)
-    femmesh.addNode(369.92037022916634, -18.88510203254748, 19.123323245562275, 1976)
-    femmesh.addNode(341.05481483424717, -19.533638515252676, 19.881212277843243, 1977)
-    femmesh.addNode(312.31498358836615, -18.895635582729266, 19.13604830872761, 1978)
-    femmesh.addNode(282.4641947498568, -18.715640971504364, 18.916622971136157, 1979)
-    femmesh.addNode(34.46791559464849, -20.55558550615692, -20.97944439245836, 1980)
-    femmesh.addNode(416.0493288535165, -18.462892669735723, 18.60119830880858, 1981)
-    femmesh.addNode(384.93357367539306, -18.73030752468977, 18.93466165804115, 1982)
-    femmesh.addNode(114.76801956898883, -18.3454766502402, 18.451653722516838, 1983)
-    femmesh.addNode(355.3711996705683, -19.26350924589122, 19.571713981875195, 1984)
-    femmesh.addNode(326.7803659730748, -19.261940128452505, 19.569890987890663, 1985)
-    femmesh.addNode(297.4798760800791, -18.76066994748392, 18.971914471402865, 1986)
-    femmesh.addNode(267.3781438369264, -18.699874172673308, 18.897199168944212, 1987)
-    femmesh.addNode(150.44433949512893, -15.056702049746757, 13.19313062028419, 1988)
-    femmesh.addNode(142.82330874145066, -15.038446135856525, 13.155782501656482, 1989)
-    femmesh.addNode(85.27834144066884, -14.765955462611245, 12.582003740880316, 1990)
-    femmesh.addNode(77.07975013307629, -14.881378806393837, 12.828888671965908, 1991)
-    femmesh.addNode(466.7586874100811, -13.355060862997895, -8.914452413774118, 1992)
-    femmesh.addNode(468.4626444358104, -12.022706579149414, -1.1669957841517502, 1993)
-    femmesh.addNode(458.19880948324777, -13.567704178105423, -9.571026815147594, 1994)
-    femmesh.addNode(358.1228050666738, -15.390557107005648, 13.854152768194618, 1995)
-    femmesh.addNode(350.98211752708323, -15.585609430547745, 14.222516333069688, 1996)
-    femmesh.addNode(36.92488888584738, -14.745474043607036, 12.537576117109019, 1997)
-    femmesh.addNode(36.46189322810355, -12.36982052419128, 4.696005135363875, 1998)
-    femmesh.addNode(44.60531688481841, -15.693537211673007, 14.421165541188667, 1999)
-    femmesh.addNode(271.76557673813636, -15.061989917917852, 13.2039241446489, 2000)
-    femmesh.addNode(264.22673046740806, -15.059527689718575, 13.198899639703354, 2001)
-    femmesh.addNode(301.86723325422463, -15.112264107199142, 13.306000847699886, 2002)
-    femmesh.addNode(294.3987565662045, -15.089291439567027, 13.25947829951998, 2003)
-    femmesh.addNode(331.10645749476106, -15.581452402478352, 14.21479309865202, 2004)
-    femmesh.addNode(324.0077059303193, -15.39095149279244, 13.854910232155133, 2005)
-    femmesh.addNode(344.6322780580227, -16.218637663347078, 15.340187615091821, 2006)
-    femmesh.addNode(337.4565807612921, -16.21556242018175, 15.335018053215943, 2007)
-    femmesh.addNode(347.3838834541282, -13.393955847225993, 9.038486484447791, 2008)
-    femmesh.addNode(119.51139864820354, -14.86976470098039, 12.80430914262191, 2009)
-    femmesh.addNode(111.44549718472088, -14.758911984648961, 12.566746744480001, 2010)
-    femmesh.addNode(388.0205397621509, -15.069794667431253, 13.219835125510762, 2011)
-    femmesh.addNode(380.4158193349317, -15.102541055411557, 13.286335172807487, 2012)
-    femmesh.addNode(226.3093203335817, -15.058290564158966, 13.196374224563183, 2013)
-    femmesh.addNode(218.6901862032939, -15.063242269091393, 13.20647882466544, 2014)
-    femmesh.addNode(256.66664893465986, -15.058754106529541, 13.197320550307273, 2015)
-    femmesh.addNode(249.07715195836857, -15.058117757837113, 13.196021417435999, 2016)
-    femmesh.addNode(261.0540818358698, -12.788713018477662, 6.833791984187419, 2017)
-    femmesh.addNode(436.0161865968978, -14.653984626264911, 12.336751727235443, 2018)
-    femmesh.addNode(427.91524510556803, -14.586771708743935, 12.186669547151935, 2019)
-    femmesh.addNode(241.49507048598537, -15.05785314643009, 13.195481155330203, 2020)
-    femmesh.addNode(233.91761348103987, -15.055664082098708, 13.191010649047923, 2021)
-    femmesh.addNode(245.9119188307384, -12.788175522109931, 6.8314940293425765, 2022)
-    femmesh.addNode(68.68949798515786, -14.999252851716253, 13.075154050122988, 2023)
-    femmesh.addNode(60.78533962191233, -15.108475617056985, 13.298342617092617, 2024)
-    femmesh.addNode(71.89566232212744, -12.73082162108193, 6.581428190223999, 2025)
-    femmesh.addNode(135.16702787379955, -15.008048705521972, 13.093302307535968, 2026)
-    femmesh.addNode(127.39583964579457, -14.958368068170625, 12.990386540186815, 2027)
-    femmesh.addNode(139.61403912676874, -12.76818376965089, 6.7454369669502325, 2028)
-    femmesh.addNode(465.4733892426674, -19.695335878595678, 20.062451456174117, 2029)
-    femmesh.addNode(467.09235321257376, -12.512029024811074, 5.519018732203812, 2030)
-    femmesh.addNode(51.61351311600599, -15.265688069329578, 13.611633465297736, 2031)
-    femmesh.addNode(48.225031267802436, -15.009591326691481, -13.09648195691469, 2032)
-    femmesh.addNode(57.18185585849467, -15.009641349562582, -13.096585048048127, 2033)
-    femmesh.addNode(419.309408812986, -14.853558031895016, 12.769913408958995, 2034)
-    femmesh.addNode(411.3000726721024, -14.931084184913665, 12.933437153199883, 2035)
-    femmesh.addNode(423.1659889241539, -12.570024965828054, 5.820358192415404, 2036)
-    femmesh.addNode(65.23374885797172, -15.096718716478335, -13.274541656106718, 2037)
-    femmesh.addNode(73.15942109836521, -15.176490474372216, -13.43500415811455, 2038)
-    femmesh.addNode(61.86513324594749, -12.784942290560323, -6.817653777811618, 2039)
-    femmesh.addNode(80.87327358249729, -15.346687012614048, -13.769564510050524, 2040)
-    femmesh.addNode(88.27603034388817, -15.553399341845168, -14.162532034494532, 2041)
-    femmesh.addNode(77.63087872955661, -12.920599510704704, -7.3748537058827335, 2042)
-    femmesh.addNode(94.82610480157143, -16.184212792208864, -15.282183444849988, 2043)
-    femmesh.addNode(102.1365551595853, -16.195089961661242, -15.300543059422525, 2044)
-    femmesh.addNode(91.89480567137196, -13.373148469971301, -8.972367105602247, 2045)
-    femmesh.addNode(108.5796213477371, -15.57749178718478, -14.207429737419485, 2046)
-    femmesh.addNode(115.7605699653306, -15.391100008675576, -13.855195460609513, 2047)
-    femmesh.addNode(104.88794631720705, -13.382019213911594, -9.000620852312036, 2048)
-    femmesh.addNode(123.11249096237586, -15.237687557393162, -13.556497804532354, 2049)
-    femmesh.addNode(130.4957609861595, -15.168947248598833, -13.419933243184449, 2050)
-    femmesh.addNode(118.68293350240413, -12.945044991198962, -7.47058159961774, 2051)
-    femmesh.addNode(138.01257482409017, -15.121567827331472, -13.32478457384045, 2052)
-    femmesh.addNode(145.4917222489525, -15.0973419427429, -13.275804663156912, 2053)
-    femmesh.addNode(133.55166833738002, -12.838115811632616, -7.0416269841740355, 2054)
-    femmesh.addNode(153.02671080130574, -15.080785666318317, -13.242201465666716, 2055)
-    femmesh.addNode(160.54316253629463, -15.068631069479263, -13.217464489386053, 2056)
-    femmesh.addNode(148.60347072766388, -12.804708916757459, -6.90180980357602, 2057)
-    femmesh.addNode(168.08479165185256, -15.061670812793558, -13.203273101837311, 2058)
-    femmesh.addNode(175.62456890030182, -15.056405557967935, -13.192525101105469, 2059)
-    femmesh.addNode(163.68008839557507, -12.79250036667819, -6.8499609611665635, 2060)
-    femmesh.addNode(183.1900895362889, -15.054030382107655, -13.187673083285825, 2061)
-    femmesh.addNode(190.76148789600265, -15.054505813868332, -13.188644474135437, 2062)
-    femmesh.addNode(178.78723814712004, -12.787665079521787, -6.82931098236187, 2063)
-    femmesh.addNode(198.35150574424642, -15.056431870002712, -13.192578839036486, 2064)
-    femmesh.addNode(205.94878386549146, -15.058198580604024, -13.19618642933752, 2065)
-    femmesh.addNode(193.94277663135085, -12.787432521303415, -6.828316139620236, 2066)
-    femmesh.addNode(213.5561257412636, -15.060136887059958, -13.200143008924226, 2067)
-    femmesh.addNode(221.1599580869185, -15.061643374650231, -13.203217120288254, 2068)
-    femmesh.addNode(209.1401363553668, -12.789433644667856, -6.836871594577253, 2069)
-    femmesh.addNode(228.76718824252708, -15.065053253659602, -13.210171981159268, 2070)
-    femmesh.addNode(236.36271426155534, -15.06986659397182, -13.21998164648967, 2071)
-    femmesh.addNode(224.35470838674752, -12.792205350151296, -6.848702920427245, 2072)
-    femmesh.addNode(243.9529464421905, -15.072207471429902, -13.224749129502719, 2073)
-    femmesh.addNode(251.53613768434877, -15.074281038009605, -13.228970420252267, 2074)
-    femmesh.addNode(239.55217072299124, -12.79518889421822, -6.8614144515256035, 2075)
-    femmesh.addNode(259.1093129813324, -15.0743928611606, -13.229198018205008, 2076)
-    femmesh.addNode(266.68167260268393, -15.07213318546065, -13.224597869819293, 2077)
-    femmesh.addNode(254.71557820061003, -12.796462134549742, -6.866831594062312, 2078)
-    femmesh.addNode(274.2481953226567, -15.069911795585199, -13.22007372530264, 2079)
-    femmesh.addNode(281.82877811154503, -15.066566859335232, -13.213257707974183, 2080)
-    femmesh.addNode(269.8552762175664, -12.79536690323453, -6.862172082024031, 2081)
-    femmesh.addNode(289.4137939793904, -15.057809102205425, -13.19539122674252, 2082)
-    femmesh.addNode(297.043027620291, -15.042419736104137, -13.16392290753826, 2083)
-    femmesh.addNode(285.0068148053846, -12.789672799736298, -6.837893305217167, 2084)
-    femmesh.addNode(304.6884691100933, -15.014345956804021, -13.10627620115412, 2085)
-    femmesh.addNode(312.43163797550955, -14.965201597233982, -13.004602082409065, 2086)
-    femmesh.addNode(300.23727216303223, -12.770637456003808, -6.756061372695751, 2087)
-    femmesh.addNode(320.2716475993099, -14.871173891462828, -12.80729456102069, 2088)
-    femmesh.addNode(328.2387682511482, -14.760950165429804, -12.571163991842582, 2089)
-    femmesh.addNode(315.7227232766349, -12.708274435458723, -6.480340535156946, 2090)
-    femmesh.addNode(336.9620292790795, -14.419942314261544, -11.804254235288957, 2091)
-    femmesh.addNode(345.0250733466295, -14.420532510754796, -11.805633104991236, 2092)
-    femmesh.addNode(332.28599392836657, -12.498013282872762, -5.4435998881665935, 2093)
-    femmesh.addNode(353.75505297530475, -14.760866904914351, -12.570983582369662, 2094)
-    femmesh.addNode(361.748786535952, -14.869247960056171, -12.803214195938523, 2095)
-    femmesh.addNode(349.73923458497313, -12.497705119585234, -5.4419295097466955, 2096)
-    femmesh.addNode(369.6198018770514, -14.962315876704348, -12.99860135741089, 2097)
-    femmesh.addNode(377.3851643984726, -15.009877083442756, -13.097070853787468, 2098)
-    femmesh.addNode(366.3402295547478, -12.70707745106304, -6.474927686235527, 2099)
-    femmesh.addNode(385.06863861649435, -15.045706567265512, -13.170651674918908, 2100)
-    femmesh.addNode(392.6856567948412, -15.079048820432305, -13.238670159322284, 2101)
-    femmesh.addNode(381.89471911386886, -12.772898154685532, -6.765834591801256, 2102)
-    femmesh.addNode(400.26993362863413, -15.12218779949212, -13.326035093538787, 2103)
-    femmesh.addNode(407.73910836842356, -15.181990663951186, -13.445979891833696, 2104)
-    femmesh.addNode(397.1624701656836, -12.813851461464598, -6.940369837879435, 2105)
-    femmesh.addNode(415.1002879101461, -15.306861211145662, -13.692200027714955, 2106)
-    femmesh.addNode(422.35983502250474, -15.44707070502253, -13.962161217230111, 2107)
-    femmesh.addNode(412.1079265411991, -12.902521304559038, -7.303200227869829, 2108)
-    femmesh.addNode(428.83719031633655, -15.961984570952769, -14.900394374535713, 2109)
-    femmesh.addNode(436.25719839785916, -15.831003138397573, -14.669137781663906, 2110)
-    femmesh.addNode(425.94646137675346, -13.25947079613362, -8.601277874926609, 2111)
-    femmesh.addNode(442.6944664769474, -14.98172673268735, -13.038899863593404, 2112)
-    femmesh.addNode(450.3502701029851, -14.532131735945452, -12.063010114749249, 2113)
-    femmesh.addNode(453.1468922090244, -12.197475924360969, -3.4365038514390136, 2114)
-    femmesh.addNode(438.8610847496735, -13.048672143035297, -7.862608684052511, 2115)
-    femmesh.addNode(452.8345441404058, -14.993189683004221, 13.062625942045994, 2116)
-    femmesh.addNode(443.895157487368, -15.207314330007879, 13.496369681844135, 2117)
-    femmesh.addNode(180.71903214600954, -15.071397095901858, 13.223098942131465, 2118)
-    femmesh.addNode(173.1715609730557, -15.070178111414087, 13.220616212909293, 2119)
-    femmesh.addNode(465.6642980594979, -15.944737929497116, 14.870215816773365, 2120)
-    femmesh.addNode(459.56737643621113, -13.410715861767585, 9.091360319743922, 2121)
-    femmesh.addNode(124.07331726152661, -12.707454779103063, 6.476634502711128, 2122)
-    femmesh.addNode(334.68392071853657, -13.393125684744717, 9.035858670385952, 2123)
-    femmesh.addNode(309.3668561685222, -15.162922748579298, 13.407881435979332, 2124)
-    femmesh.addNode(306.28573665464756, -12.835036386028918, 7.028861742540094, 2125)
-    femmesh.addNode(316.7334869887891, -15.235089974401692, 13.551368614336678, 2126)
-    femmesh.addNode(54.333583668302666, -12.87392856056606, 7.1883212577757565, 2127)
-    femmesh.addNode(365.44332054183394, -15.232659322043794, 13.546566835557753, 2128)
-    femmesh.addNode(361.05423839834896, -12.94523625214849, 7.471325421672844, 2129)
-    femmesh.addNode(372.85180356084146, -15.15636438093729, 13.39474623690161, 2130)
-    femmesh.addNode(165.61398880540168, -15.067729333930878, 13.215626991164422, 2131)
-    femmesh.addNode(158.02289236799115, -15.065708104389074, 13.211507108654507, 2132)
-    femmesh.addNode(279.3175836651281, -15.068081026568667, 13.216343685321258, 2133)
-    femmesh.addNode(276.16617029560973, -12.79226853142713, 6.8489723652339976, 2134)
-    femmesh.addNode(286.8647883073303, -15.076642992863167, 13.233776765015259, 2135)
-    femmesh.addNode(102.53990398945602, -14.426668083303564, 11.819956303290219, 2136)
-    femmesh.addNode(94.32422914234884, -14.425322421306248, 11.816816679253531, 2137)
-    femmesh.addNode(154.84887286728207, -12.7885395083633, 6.833050266575583, 2138)
-    femmesh.addNode(34.797001634675816, -16.56442291217234, -15.906961312871049, 2139)
-    femmesh.addNode(291.25214548147574, -12.801995515957628, 6.890321774042373, 2140)
-    femmesh.addNode(89.33180217172588, -12.50728122998953, 5.493590770440806, 2141)
-    femmesh.addNode(321.0595785104754, -12.944991280632447, 7.470372702715484, 2142)
-    femmesh.addNode(375.9387696475993, -12.832507704330762, 7.01836114645554, 2143)
-    femmesh.addNode(169.9849979077983, -12.794477595058591, 6.85838618440707, 2144)
-    femmesh.addNode(107.28328306867073, -12.503585210242715, 5.473711222798301, 2145)
-    femmesh.addNode(33.17203000491521, -13.528462317662303, -9.453652310256846, 2146)
-    femmesh.addNode(41.01185065937382, -14.890456640257643, -12.848060508351008, 2147)
-    femmesh.addNode(403.4489697189709, -14.999439226395282, 13.075538914740013, 2148)
-    femmesh.addNode(395.6981204139606, -15.037110392135958, 13.153044666317356, 2149)
-    femmesh.addNode(439.6507961072061, -12.701651625858258, 6.450331971877664, 2150)
-    femmesh.addNode(230.72154421089704, -12.789398952396073, 6.836723369986605, 2151)
-    femmesh.addNode(46.60005963804183, -12.680952562499403, -6.3555847376610055, 2152)
-    femmesh.addNode(211.08244509100436, -15.066089077368197, 13.212283769724918, 2153)
-    femmesh.addNode(203.50258409947116, -15.06860234178254, 13.217405954836991, 2154)
-    femmesh.addNode(215.5055099511493, -12.792235866767896, 6.848833063922711, 2155)
-    femmesh.addNode(406.7090496784404, -12.735473551181126, 6.602082378036634, 2156)
-    femmesh.addNode(33.57445416171199, -12.077269490622555, -2.151789688415738, 2157)
-    femmesh.addNode(391.1803660734993, -12.787414775720059, 6.828240220890197, 2158)
-    femmesh.addNode(347.37148893974336, -12.04432391546381, 1.6301749348909744, 2159)
-    femmesh.addNode(341.02164947068275, -12.141563953037487, 2.9109786721049713, 2160)
-    femmesh.addNode(378.8570151587684, -12.000202164051942, 0.11013538144590256, 2161)
-    femmesh.addNode(371.2929993846781, -12.000890674494027, 0.23117023238436393, 2162)
-    femmesh.addNode(91.86121054354729, -12.04105754941136, -1.5690019892650893, 2163)
-    femmesh.addNode(82.81532284186729, -12.008932636991869, -0.732037176315809, 2164)
-    femmesh.addNode(174.38214379329267, -12.000003754562208, 0.015009121173037019, 2165)
-    femmesh.addNode(166.8245716256386, -12.000001488799775, 0.009451348269481906, 2166)
-    femmesh.addNode(42.27431809600477, -12.009136943272303, 0.7403601235924233, 2167)
-    femmesh.addNode(325.9482651762204, -12.010371797458095, 0.7887967249573326, 2168)
-    femmesh.addNode(318.6740462346902, -12.003340032499136, 0.4476503033965044, 2169)
-    femmesh.addNode(280.5699880800704, -12.00000011767905, 0.002657205869888139, 2170)
-    femmesh.addNode(273.0179811530786, -12.000002081568311, -0.01117560263827495, 2171)
-    femmesh.addNode(394.21807002859975, -12.000035364588523, -0.04606380423633086, 2172)
-    femmesh.addNode(386.5404893767901, -12.000013343421916, 0.028294966637207986, 2173)
-    femmesh.addNode(159.2829425100807, -12.000000673100473, -0.0063550002320634175, 2174)
-    femmesh.addNode(151.70438963721847, -12.000011988280324, -0.026819706853279668, 2175)
-    femmesh.addNode(310.8340366108898, -12.00087477274445, 0.22909735799327496, 2176)
-    femmesh.addNode(303.33441369659226, -12.000221641830866, 0.11531895215829346, 2177)
-    femmesh.addNode(334.67152620415175, -12.044174292575363, 1.6274231737312492, 2178)
-    femmesh.addNode(356.10146856841857, -12.010489248379326, 0.7932495688168005, 2179)
-    femmesh.addNode(409.65344981552425, -12.001511876664065, -0.30118153009895926, 2180)
-    femmesh.addNode(417.0146293572468, -12.005553682605324, -0.577226223355108, 2181)
-    femmesh.addNode(363.42198404357873, -12.003338935104036, 0.4475767618572625, 2182)
-    femmesh.addNode(288.1550039479157, -12.000008478559423, 0.02255467786185051, 2183)
-    femmesh.addNode(295.6889722067899, -12.000043690590037, 0.0511999364575514, 2184)
-    femmesh.addNode(75.10147035773521, -12.002121082635796, -0.3567358394611664, 2185)
-    femmesh.addNode(144.16940108486526, -12.000068865625167, -0.06428011175704403, 2186)
-    femmesh.addNode(136.51312021721415, -12.000298205802782, -0.13376194989695653, 2187)
-    femmesh.addNode(425.6204656498288, -12.024747926578023, -1.2183033837312738, 2188)
-    femmesh.addNode(195.91463263486344, -15.070834289242459, 13.221952734848259, 2189)
-    femmesh.addNode(188.3086800631055, -15.071667105355036, 13.223648797332112, 2190)
-    femmesh.addNode(181.9476644292797, -12.000006943686365, 0.020411299170704264, 2191)
-    femmesh.addNode(98.41128500123055, -12.135742302009149, -2.850633639735931, 2192)
-    femmesh.addNode(235.14588795035564, -12.000002821393934, -0.013010904199528672, 2193)
-    femmesh.addNode(227.53759480289744, -12.000000825738862, -0.0070387733934215895, 2194)
-    femmesh.addNode(66.71121820981676, -12.000116821309117, -0.08372135271099723, 2195)
-    femmesh.addNode(219.93036464728888, -12.000000008331362, 0.0007070231366317122, 2196)
-    femmesh.addNode(104.85435118938236, -12.04262093764834, -1.598574275588856, 2197)
-    femmesh.addNode(113.75994438464721, -12.010190020615006, -0.7818551019083347, 2198)
-    femmesh.addNode(121.11186538169248, -12.003317447408872, -0.4461343285098448, 2199)
-    femmesh.addNode(128.9963063792835, -12.000960433885957, -0.24005230830849653, 2200)
-    femmesh.addNode(197.12733019461945, -12.000004616689303, 0.016643357139799475, 2201)
-    femmesh.addNode(189.5373123463757, -12.000007366720915, 0.02102387216025428, 2202)
-    femmesh.addNode(204.71528165922717, -12.00000223428437, 0.011578301142243426, 2203)
-    femmesh.addNode(212.32262353499934, -12.000000857399908, 0.007172446847362251, 2204)
-    femmesh.addNode(242.7361201309908, -12.000005594977761, -0.018322080515587803, 2205)
-    femmesh.addNode(250.318201603374, -12.000005233600941, -0.017720497429817902, 2206)
-    femmesh.addNode(257.8913769003576, -12.000005384460984, -0.017974082173888736, 2207)
-    femmesh.addNode(265.4514584331058, -12.00000438247545, -0.016215687091114046, 2208)
-    femmesh.addNode(432.0978209436606, -12.087278204039109, -2.286717026097872, 2209)
-    femmesh.addNode(185.1322179925483, -12.795888833438656, 6.864392979071612, 2210)
-    femmesh.addNode(49.487498704433385, -12.003602490170593, 0.46490475616000193, 2211)
-    femmesh.addNode(438.5350890227488, -12.00338181770357, -0.45044158946875323, 2212)
-    femmesh.addNode(200.30981737425202, -12.794870368554065, 6.860058542785135, 2213)
-    femmesh.addNode(58.659325210339716, -12.000218113273078, 0.11439732868986141, 2214)
-    femmesh.addNode(454.2625992934816, -12.204807890106295, 3.499503841193587, 2215)
-    femmesh.addNode(446.414059913219, -12.011605989455848, 0.8344007840119737, 2216)
-    femmesh.addNode(401.8023468623927, -12.000343198673605, -0.14349844121395394, 2217)
-    femmesh.addNode(273.5348253247051, 12.5, 45.90740017923085, 2218)
-    femmesh.addNode(276.01811177777324, 12.5, -209.0476372279958, 2219)
-    femmesh.addNode(222.54838082346797, 12.5, -81.93900324765977, 2220)
-    femmesh.addNode(235.34508140630388, 12.5, -74.63186706629372, 2221)
-    femmesh.addNode(235.22790478389473, 12.5, -88.13759789240208, 2222)
-    femmesh.addNode(235.85506216481343, 12.5, 51.00883073981356, 2223)
-    femmesh.addNode(248.22635361114766, 12.5, 59.20716375446253, 2224)
-    femmesh.addNode(248.38580318775377, 12.5, 43.555772573041935, 2225)
-    femmesh.addNode(260.757094634088, 12.5, 51.7541055876909, 2226)
-    femmesh.addNode(262.1334374918452, 12.5, 152.80876795927597, 2227)
-    femmesh.addNode(249.07567180813766, 12.5, 145.95876529140182, 2228)
-    femmesh.addNode(248.5728661198734, 12.5, 160.15105654991387, 2229)
-    femmesh.addNode(235.51510043616582, 12.5, 153.30105388203972, 2230)
-    femmesh.addNode(218.670548057251, 12.5, -5.484199256178243, 2231)
-    femmesh.addNode(209.82903138894534, 12.5, 0.017286355955135946, 2232)
-    femmesh.addNode(209.3014073189094, 12.5, -10.164358914219989, 2233)
-    femmesh.addNode(196.12798110172776, 12.5, 228.36906042761592, 2234)
-    femmesh.addNode(212.9286988682648, 12.5, 231.47795733172222, 2235)
-    femmesh.addNode(206.80596738101224, 12.5, 220.11291406008874, 2236)
-    femmesh.addNode(235.33592287632268, 12.5, 124.4996058690844, 2237)
-    femmesh.addNode(235.28349793971347, 12.5, 138.4173835178536, 2238)
-    femmesh.addNode(248.4785998819975, 12.5, 131.36533732282342, 2239)
-    femmesh.addNode(197.30783433006314, 12.5, 6.666905340730466, 2240)
-    femmesh.addNode(210.1753381153162, 12.5, 66.06907661732387, 2241)
-    femmesh.addNode(222.62376932817904, 12.5, 73.54496408644172, 2242)
-    femmesh.addNode(209.94239312158618, 12.5, 81.39276374727368, 2243)
-    femmesh.addNode(209.90445368260205, 12.5, 123.8631328336526, 2244)
-    femmesh.addNode(197.65336093416934, 12.5, 116.8448991716632, 2245)
-    femmesh.addNode(209.90298105950671, 12.5, 110.09089982301327, 2246)
-    femmesh.addNode(248.3047601781857, 12.5, 31.009923191300715, 2247)
-    femmesh.addNode(235.76184257634708, 12.5, 36.548411404611926, 2248)
-    femmesh.addNode(236.16385319977584, 12.5, 23.429662490688997, 2249)
-    femmesh.addNode(222.9799668062104, 12.5, 88.3390454387559, 2250)
-    femmesh.addNode(235.2182243727786, 12.5, 95.72125701187883, 2251)
-    femmesh.addNode(210.0151806903839, 12.5, 95.21923457063065, 2252)
-    femmesh.addNode(222.25343825695205, 12.5, 102.60144614375358, 2253)
-    femmesh.addNode(262.6956434943329, 12.5, 0.0839662607030931, 2254)
-    femmesh.addNode(254.326168944141, 12.5, -7.364859724146811, 2255)
-    femmesh.addNode(264.7845532987991, 12.5, -9.0972156254157, 2256)
-    femmesh.addNode(234.77904712388673, 12.5, 197.84275992587612, 2257)
-    femmesh.addNode(234.48917866273752, 12.5, 214.16960388299105, 2258)
-    femmesh.addNode(248.70492627943344, 12.5, 204.02402678152546, 2259)
-    femmesh.addNode(198.07746570724544, 12.5, -96.3069048730614, 2260)
-    femmesh.addNode(197.60545783717453, 12.5, -110.44343238173526, 2261)
-    femmesh.addNode(209.68292354441996, 12.5, -103.25033725479666, 2262)
-    femmesh.addNode(193.62525603965437, 6.4691067433713085, -19.885773001772048, 2263)
-    femmesh.addNode(193.62525603965437, 6.4691067433713085, -31.635773001772048, 2264)
-    femmesh.addNode(193.62525603965437, 18.96910674337131, -22.635773001772048, 2265)
-    femmesh.addNode(197.67624281996348, 12.5, 145.3922484285101, 2266)
-    femmesh.addNode(196.67798627928448, 12.5, 215.49385363247282, 2267)
-    femmesh.addNode(251.5114323616031, 12.5, -180.30858066219832, 2268)
-    femmesh.addNode(231.69137022554798, 12.5, -180.56192199919818, 2269)
-    femmesh.addNode(245.04315566708652, 12.5, -192.25360113175472, 2270)
-    femmesh.addNode(214.3148577174929, 12.5, 219.22803695928715, 2271)
-    femmesh.addNode(221.99103331168624, 12.5, 204.91313507663867, 2272)
-    femmesh.addNode(226.81300306854422, 12.5, 228.48450576563954, 2273)
-    femmesh.addNode(234.85605769111817, 12.5, -115.59889959496093, 2274)
-    femmesh.addNode(235.3844272089043, 12.5, -129.2932632129644, 2275)
-    femmesh.addNode(222.05190990505378, 12.5, -122.49179632538412, 2276)
-    femmesh.addNode(209.84320523554686, 12.5, -33.379265852525634, 2277)
-    femmesh.addNode(198.4524496423751, 12.5, -39.49038540021425, 2278)
-    femmesh.addNode(210.0760401939948, 12.5, -46.277957175323564, 2279)
-    femmesh.addNode(198.24326845679423, 12.5, -125.20540128454832, 2280)
-    femmesh.addNode(209.84872629396875, 12.5, -117.39883366628356, 2281)
-    femmesh.addNode(198.24962012533737, 12.5, 102.74600065135007, 2282)
-    femmesh.addNode(197.76556056504648, 12.5, 88.47323391928057, 2283)
-    femmesh.addNode(235.69389774975355, 12.5, -60.17544515533194, 2284)
-    femmesh.addNode(248.89923361456283, 12.5, -67.37735381907261, 2285)
-    femmesh.addNode(248.2375146818951, 12.5, -52.70249972221842, 2286)
-    femmesh.addNode(261.4428505467044, 12.5, -59.90440838595909, 2287)
-    femmesh.addNode(264.10938784547005, 12.5, 221.73538374311224, 2288)
-    femmesh.addNode(266.3646151246452, 12.5, 233.27852161588902, 2289)
-    femmesh.addNode(274.8719394410864, 12.5, 217.0504229850889, 2290)
-    femmesh.addNode(277.12716672026147, 12.5, 228.59356085786567, 2291)
-    femmesh.addNode(261.07670035040104, 12.5, -46.142531227791096, 2292)
-    femmesh.addNode(234.56228530200718, 12.5, 239.87560886153324, 2293)
-    femmesh.addNode(239.39125090706204, 12.5, 228.54717397209072, 2294)
-    femmesh.addNode(248.87896560505487, 12.5, 241.67156511055748, 2295)
-    femmesh.addNode(273.5250632826146, 12.5, 18.80894859621577, 2296)
-    femmesh.addNode(273.8398254547098, 12.5, -82.23754320450821, 2297)
-    femmesh.addNode(262.1505818103554, 12.5, -75.00473663921764, 2298)
-    femmesh.addNode(274.3107563556456, 12.5, -68.26719343470943, 2299)
-    femmesh.addNode(219.50071776653704, 12.5, 241.6088969041063, 2300)
-    femmesh.addNode(274.7353911777022, 12.5, -154.12788300014623, 2301)
-    femmesh.addNode(275.3787762904367, 12.5, -166.97048355905383, 2302)
-    femmesh.addNode(208.42798110172777, 12.5, 242.86906042761592, 2303)
-    femmesh.addNode(256.05349408841886, 12.5, -197.57635174458417, 2304)
-    femmesh.addNode(247.21583266848268, 12.5, -208.02432041033663, 2305)
-    femmesh.addNode(263.0999723597895, 12.5, 208.28045474515653, 2306)
-    femmesh.addNode(262.1526046734308, 12.5, 194.40833330762618, 2307)
-    femmesh.addNode(274.2280329187031, 12.5, 201.48003176006765, 2308)
-    femmesh.addNode(489.76415404215896, -34.486400619589354, -19.991266557945355, 2309)
-    femmesh.addNode(260.9287207895924, 12.5, 38.01728435973072, 2310)
-    femmesh.addNode(196.67798627928448, 12.5, 200.74385363247282, 2311)
-    femmesh.addNode(208.19212623024038, 12.5, 207.86299368765367, 2312)
-    femmesh.addNode(198.00773771603656, 12.5, 187.97168067381705, 2313)
-    femmesh.addNode(209.52187766699245, 12.5, 195.0908207289979, 2314)
-    femmesh.addNode(274.23643639092927, 12.5, -96.96291936138402, 2315)
-    femmesh.addNode(199.235526186043, 12.5, -139.3167769247538, 2316)
-    femmesh.addNode(211.92282259716046, 12.5, -146.28716596616857, 2317)
-    femmesh.addNode(211.4787946428372, 12.5, -132.27217820930213, 2318)
-    femmesh.addNode(261.2390501828644, 12.5, -160.4615770471782, 2319)
-    femmesh.addNode(258.3605489870601, 12.5, -147.172179409235, 2320)
-    femmesh.addNode(262.17365290418064, 12.5, 110.30524462382911, 2321)
-    femmesh.addNode(249.06748630050203, 12.5, 117.18329616755213, 2322)
-    femmesh.addNode(262.21016330617687, 12.5, 124.04902762129115, 2323)
-    femmesh.addNode(274.33898139164677, 12.5, 160.46752642224425, 2324)
-    femmesh.addNode(235.4510210734041, 12.5, 66.4858926044511, 2325)
-    femmesh.addNode(198.2510927484327, 12.5, 131.2682336619894, 2326)
-    femmesh.addNode(205.01601163282615, 6.4691067433713085, -25.52465345408343, 2327)
-    femmesh.addNode(209.86924238332676, 12.5, -89.22420143879063, 2328)
-    femmesh.addNode(222.54876634375353, 12.5, -95.42279608353294, 2329)
-    femmesh.addNode(241.8575896633621, 12.5, -14.005042882336497, 2330)
-    femmesh.addNode(247.7227865978224, 12.5, -24.994273759900096, 2331)
-    femmesh.addNode(260.1913658786013, 12.5, -18.35409060171041, 2332)
-    femmesh.addNode(209.74208756918676, 12.5, 13.202835034847482, 2333)
-    femmesh.addNode(218.5836042374924, 12.5, 7.701349422714102, 2334)
-    femmesh.addNode(223.68724172560107, 12.5, 17.065553174005174, 2335)
-    femmesh.addNode(209.88260324777917, 12.5, -75.08028227181507, 2336)
-    femmesh.addNode(198.09082657169785, 12.5, -68.16298570608583, 2337)
-    femmesh.addNode(209.7144171233176, 12.5, -60.70055748119515, 2338)
-    femmesh.addNode(273.94460615934224, 12.5, -40.255316276541436, 2339)
-    femmesh.addNode(273.1320941910588, 12.5, -53.63721495124966, 2340)
-    femmesh.addNode(262.27077375042165, 12.5, 138.90671909637163, 2341)
-    femmesh.addNode(254.61641400943853, 12.5, 231.85652586858083, 2342)
-    femmesh.addNode(162.17953610769058, -30.351544592762416, -17.214148739635036, 2343)
-    femmesh.addNode(157.77483285141307, -27.398056758121157, -11.19624185814478, 2344)
-    femmesh.addNode(154.6630843727017, -30.368929242775238, -17.235536259441304, 2345)
-    femmesh.addNode(262.52177078293545, 12.5, -185.63133127502778, 2346)
-    femmesh.addNode(276.01811177777324, 12.5, -194.0476372279958, 2347)
-    femmesh.addNode(196.33577499559448, 12.5, -237.20321927929027, 2348)
-    femmesh.addNode(229.25526215304959, 12.5, -167.4302805938753, 2349)
-    femmesh.addNode(249.07532428910469, 12.5, -167.17693925687544, 2350)
-    femmesh.addNode(273.73384565595364, 12.5, 116.98355006195123, 2351)
-    femmesh.addNode(209.7502347766227, 12.5, 180.85517330319936, 2352)
-    femmesh.addNode(222.6414456804614, 12.5, 174.43500411324078, 2353)
-    femmesh.addNode(209.91877924309688, 12.5, 166.9898966338116, 2354)
-    femmesh.addNode(274.7353911777022, 12.5, -139.12788300014623, 2355)
-    femmesh.addNode(274.53271004599867, 12.5, -125.39893386427087, 2356)
-    femmesh.addNode(241.7572396443989, 12.5, -0.8122365225950148, 2357)
-    femmesh.addNode(254.25432260989794, 12.5, 5.897643248698174, 2358)
-    femmesh.addNode(273.58626007931286, 12.5, 88.46609940271091, 2359)
-    femmesh.addNode(275.3787762904367, 12.5, -181.72048355905383, 2360)
-    femmesh.addNode(261.3635170981607, 12.5, 66.57869568449169, 2361)
-    femmesh.addNode(233.23013501810266, 12.5, -21.294649540198463, 2362)
-    femmesh.addNode(235.054776516282, 12.5, -32.64707067122984, 2363)
-    femmesh.addNode(220.55425432439898, 12.5, -27.691297405593815, 2364)
-    femmesh.addNode(222.37889582257833, 12.5, -39.04371853662519, 2365)
-    femmesh.addNode(212.8412488795766, 12.5, -226.6771022127046, 2366)
-    femmesh.addNode(208.6357749955945, 12.5, -237.20321927929027, 2367)
-    femmesh.addNode(196.33577499559448, 12.5, -222.70321927929027, 2368)
-    femmesh.addNode(248.44362537984168, 12.5, 102.67714005428138, 2369)
-    femmesh.addNode(235.3374587761631, 12.5, 109.5551915980044, 2370)
-    femmesh.addNode(273.3938954648873, 12.5, 31.359884180499876, 2371)
-    femmesh.addNode(198.1768325565397, 12.5, 73.9195298279931, 2372)
-    femmesh.addNode(261.8824352955989, 12.5, -173.3041776060858, 2373)
-    femmesh.addNode(274.439807248227, 12.5, 103.07169456187788, 2374)
-    femmesh.addNode(209.8525250024742, 12.5, 152.4986524329394, 2375)
-    femmesh.addNode(209.9273355683962, 12.5, 138.6604820904995, 2376)
-    femmesh.addNode(210.63024211176315, 12.5, 37.75817641358432, 2377)
-    femmesh.addNode(223.51947676811346, 12.5, 30.81521679717133, 2378)
-    femmesh.addNode(211.0428652939387, 12.5, 24.451107480487508, 2379)
-    femmesh.addNode(235.66134301280323, 12.5, 80.49124577792395, 2380)
-    femmesh.addNode(248.58818456041712, 12.5, 73.85742453448026, 2381)
-    femmesh.addNode(248.80066632047675, 12.5, 88.33191092218624, 2382)
-    femmesh.addNode(261.72750786809064, 12.5, 81.69808967874255, 2383)
-    femmesh.addNode(262.02606732753986, 12.5, 95.28779396458879, 2384)
-    femmesh.addNode(246.1968230933004, 12.5, -153.8875416189323, 2385)
-    femmesh.addNode(260.5390624210859, 12.5, -31.655852501622633, 2386)
-    femmesh.addNode(272.59445626174363, 12.5, -24.900536225081197, 2387)
-    femmesh.addNode(262.6237971600899, 12.5, 13.346469233548078, 2388)
-    femmesh.addNode(260.9189587475019, 12.5, 24.668832776715647, 2389)
-    femmesh.addNode(248.77805176909206, 12.5, 17.08857207610393, 2390)
-    femmesh.addNode(205.65664635259037, 12.5, -215.9491130778472, 2391)
-    femmesh.addNode(195.3208713569959, 12.5, -211.24589379855692, 2392)
-    femmesh.addNode(277.12716672026147, 12.5, 243.09356085786567, 2393)
-    femmesh.addNode(262.3874484043837, 12.5, 243.18496075802335, 2394)
-    femmesh.addNode(275.0987338774753, 12.5, 6.787520637332307, 2395)
-    femmesh.addNode(277.1876436819415, 12.5, -2.3936612487864863, 2396)
-    femmesh.addNode(215.7270607216783, 6.4691067433713085, -19.836685007151612, 2397)
-    femmesh.addNode(204.40546629968156, 6.4691067433713085, -15.400512931216706, 2398)
-    femmesh.addNode(193.62525603965437, 18.96910674337131, -9.385773001772048, 2399)
-    femmesh.addNode(206.1464530985366, 18.96910674337131, -16.035391986547378, 2400)
-    femmesh.addNode(233.12978499913947, 12.5, -8.101843180456981, 2401)
-    femmesh.addNode(222.98700157871775, 12.5, 117.0446452772641, 2402)
-    femmesh.addNode(222.25337498020698, 12.5, 131.3180934254729, 2403)
-    femmesh.addNode(197.6235905516197, 12.5, -54.03757177510931, 2404)
-    femmesh.addNode(206.07770568202946, 18.96910674337131, -29.1261584019863, 2405)
-    femmesh.addNode(248.59642960209644, 12.5, -82.25924988643875, 2406)
-    femmesh.addNode(273.9245717547277, 12.5, 188.42830154755853, 2407)
-    femmesh.addNode(261.9233160392106, 12.5, 181.4536790418969, 2408)
-    femmesh.addNode(248.22672551788406, 12.5, 188.22706645197684, 2409)
-    femmesh.addNode(219.20547388398214, 12.5, -236.4738829334143, 2410)
-    femmesh.addNode(226.14515360737408, 12.5, -225.06195164494028, 2411)
-    femmesh.addNode(234.18967972339198, 12.5, -235.58806871152595, 2412)
-    femmesh.addNode(240.82013008122902, 12.5, -222.5836746052742, 2413)
-    femmesh.addNode(250.68045035783706, 12.5, -233.99560589374826, 2414)
-    femmesh.addNode(197.79177667608133, 12.5, -81.91729656572923, 2415)
-    femmesh.addNode(235.5187168793667, 12.5, -102.67839576459667, 2416)
-    femmesh.addNode(222.65287408003314, 12.5, -110.50593693586039, 2417)
-    femmesh.addNode(198.60861205481507, 12.5, 31.165177786370492, 2418)
-    femmesh.addNode(222.67930383061508, 12.5, -67.77314609044902, 2419)
-    femmesh.addNode(198.68729641111747, 12.5, -154.22038904141476, 2420)
-    femmesh.addNode(273.9987442844829, 12.5, 174.02537749433836, 2421)
-    femmesh.addNode(262.33772567612965, 12.5, 167.4929039165826, 2422)
-    femmesh.addNode(208.01489877919778, 12.5, -202.93029532916273, 2423)
-    femmesh.addNode(195.3208713569959, 12.5, -196.24589379855692, 2424)
-    femmesh.addNode(222.72901104245605, 12.5, -53.10285654607807, 2425)
-    femmesh.addNode(247.87105233954549, 12.5, -39.30864941295238, 2426)
-    femmesh.addNode(235.03186667103955, 12.5, -45.8686179073797, 2427)
-    femmesh.addNode(248.76205493036645, 12.5, -110.61788336190426, 2428)
-    femmesh.addNode(261.9510750784371, 12.5, -103.76829816916316, 2429)
-    femmesh.addNode(262.2473487335065, 12.5, -117.45431267205001, 2430)
-    femmesh.addNode(248.34135149425822, 12.5, -122.43532890510667, 2431)
-    femmesh.addNode(262.07626184563907, 12.5, -89.95046256589224, 2432)
-    femmesh.addNode(236.28096880359303, 12.5, 10.378692304810741, 2433)
-    femmesh.addNode(253.60699852375797, 12.5, 218.40159687062513, 2434)
-    femmesh.addNode(222.9574585279027, 12.5, 145.7597721828802, 2435)
-    femmesh.addNode(216.39852808295205, 12.5, -175.43413565763083, 2436)
-    femmesh.addNode(215.37089328022455, 12.5, -161.05742442544658, 2437)
-    femmesh.addNode(222.41016691073736, 12.5, 160.03993413209892, 2438)
-    femmesh.addNode(199.71493121384495, 12.5, -183.597100273599, 2439)
-    femmesh.addNode(273.71463868750783, 12.5, -110.55537880777914, 2440)
-    femmesh.addNode(236.6168356566803, 12.5, -199.75721172042068, 2441)
-    femmesh.addNode(230.22113306942666, 12.5, -214.31656591535824, 2442)
-    femmesh.addNode(219.27548076823658, 12.5, -202.9128987344381, 2443)
-    femmesh.addNode(274.1412477887778, 12.5, 74.73199027603164, 2444)
-    femmesh.addNode(210.0201356157246, 12.5, 51.4925454165446, 2445)
-    femmesh.addNode(223.00258986054126, 12.5, 59.010005135333245, 2446)
-    femmesh.addNode(198.43425323912362, 12.5, 18.285929694117016, 2447)
-    femmesh.addNode(198.17628218251073, 12.5, 160.1064040044293, 2448)
-    femmesh.addNode(273.2222693093829, 12.5, 59.59670540846005, 2449)
-    femmesh.addNode(255.68211579366366, 12.5, -220.38536853177166, 2450)
-    femmesh.addNode(231.17733131548437, 12.5, 1.0144885535196693, 2451)
-    femmesh.addNode(197.99850555877651, 12.5, 59.39954678933077, 2452)
-    femmesh.addNode(248.70773702743736, 12.5, -95.82881057185557, 2453)
-    femmesh.addNode(215.199501306184, 12.5, -213.6582844640201, 2454)
-    femmesh.addNode(245.20094357000266, 12.5, -140.3011645812174, 2455)
-    femmesh.addNode(258.1578678553566, 12.5, -133.44323027335966, 2456)
-    femmesh.addNode(274.50166543582657, 12.5, -218.8897626380234, 2457)
-    femmesh.addNode(261.6516654358266, 12.5, -233.3897626380234, 2458)
-    femmesh.addNode(274.50166543582657, 12.5, -233.3897626380234, 2459)
-    femmesh.addNode(222.30989147919294, 12.5, 188.02044557823535, 2460)
-    femmesh.addNode(235.20110238303164, 12.5, 181.60027638827677, 2461)
-    femmesh.addNode(248.89769290435817, 12.5, 174.82688897819682, 2462)
-    femmesh.addNode(222.87260791999677, 12.5, 43.49137102102492, 2463)
-    femmesh.addNode(489.76415404215896, -34.55705988796833, -8.444916844393928, 2464)
-    femmesh.addNode(492.9969968200429, -34.55705988796833, 1.4999675271671558, 2465)
-    femmesh.addNode(223.2650502151418, 12.5, -188.06553258786414, 2466)
-    femmesh.addNode(220.62300174090615, 12.5, -14.600530990154894, 2467)
-    femmesh.addNode(277.1876436819415, 12.5, -15.643661248786486, 2468)
-    femmesh.addNode(225.80719146998547, 12.5, -152.66002213459728, 2469)
-    femmesh.addNode(224.81131194668774, 12.5, -139.07364509688242, 2470)
-    femmesh.addNode(235.1328333481019, 12.5, 167.4850416115281, 2471)
-    femmesh.addNode(196.78021026002722, 12.5, -3.5147399294446586, 2472)
-    femmesh.addNode(212.40895863604683, 12.5, -190.28150180420482, 2473)
-    femmesh.addNode(199.71493121384495, 12.5, -168.597100273599, 2474)
-    femmesh.addNode(264.5197772135998, 12.5, -209.9373998660192, 2475)
-    femmesh.addNode(197.74249706058612, 12.5, 173.63349262938232, 2476)
-    femmesh.addNode(198.02163005694808, 12.5, 45.34299862721383, 2477)
-    femmesh.addNode(98.67766685334435, -27.89183988117501, -12.8975126809326, 2478)
-    femmesh.addNode(102.3693418838744, -30.761014254792624, -17.736477305126748, 2479)
-    femmesh.addNode(95.05889152586056, -30.746892915616968, -17.72047805561838, 2480)
-    femmesh.addNode(273.79445610019843, 12.5, 145.59124153703172, 2481)
-    femmesh.addNode(274.4763176502232, 12.5, 131.8154775593399, 2482)
-    femmesh.addNode(416.7951059212148, -35.47369449376181, 21.75240092301107, 2483)
-    femmesh.addNode(424.32767028706604, -35.47369449376181, 21.75765327842382, 2484)
-    femmesh.addNode(386.24113361886464, -35.56940023043002, 21.79818104963451, 2485)
-    femmesh.addNode(393.87656731800064, -35.53959064672797, 21.783995446035718, 2486)
-    femmesh.addNode(389.56147378460753, -30.341796957754596, 17.68507883000181, 2487)
-    femmesh.addNode(471.2220428581968, -35.41381895617543, -21.03102326645258, 2488)
-    femmesh.addNode(463.22995437965926, -35.1227554752782, -20.884842378641046, 2489)
-    femmesh.addNode(15.488271267376675, -35.787510762564324, -18.244307766628033, 2490)
-    femmesh.addNode(6.4110113255066015, -35.787510762564324, -19.233020818659355, 2491)
-    femmesh.addNode(356.1084854274287, -35.756347343481124, 21.89828055285485, 2492)
-    femmesh.addNode(52.72524314064255, -35.55610895876903, -19.900341772014983, 2493)
-    femmesh.addNode(333.73174154865256, -30.76482635704479, 10.429520488820101, 2494)
-    femmesh.addNode(330.959081505897, -27.515918513939212, 4.391344210251835, 2495)
-    femmesh.addNode(329.9475675859383, -30.76482635704479, 18.184958909753846, 2496)
-    femmesh.addNode(327.17490754318277, -27.515918513939212, 12.146782631185577, 2497)
-    femmesh.addNode(415.73189056311423, -27.35058787767855, 11.470659964033677, 2498)
-    femmesh.addNode(412.4718106036447, -30.287764671186352, 17.61799654716461, 2499)
-    femmesh.addNode(411.94406244867747, -27.35058787767855, 3.7115982610426017, 2500)
-    femmesh.addNode(408.68398248920795, -30.287764671186352, 9.85893484417353, 2501)
-    femmesh.addNode(6.516934632192981, -30.534913301522064, -15.252217274047572, 2502)
-    femmesh.addNode(394.9868373024417, -30.372869011570835, -8.987866265261996, 2503)
-    femmesh.addNode(391.8793738394911, -27.39573211622556, -2.933832434829025, 2504)
-    femmesh.addNode(399.46365067328406, -27.418273279524858, -3.028624175853266, 2505)
-    femmesh.addNode(15.594194574063055, -30.534913301522064, -14.263504222016248, 2506)
-    femmesh.addNode(396.5192505362003, -27.385289935659774, 3.866844428066904, 2507)
-    femmesh.addNode(158.98495351343826, -35.57403565956865, -21.317422341484615, 2508)
-    femmesh.addNode(157.12691245444813, -27.396603758854496, 3.914669475891622, 2509)
-    femmesh.addNode(152.72237908229502, -30.351367667346626, 9.93854494592115, 2510)
-    femmesh.addNode(149.54835958158594, -27.39194254611246, 3.894742675042074, 2511)
-    femmesh.addNode(379.276156180056, -35.5129986172016, -21.287097645469984, 2512)
-    femmesh.addNode(386.9000873841279, -35.55834680900894, -21.308755056632283, 2513)
-    femmesh.addNode(165.95210431530074, -30.351544592762416, -8.96075801954478, 2514)
-    femmesh.addNode(161.54740105902326, -27.398056758121157, -2.9428511380545253, 2515)
-    femmesh.addNode(217.11175944341826, -30.351216323265476, 17.69392936423138, 2516)
-    femmesh.addNode(212.77478804310292, -35.57638091252241, 21.798719244005333, 2517)
-    femmesh.addNode(209.5234095549846, -30.351216323265476, 17.706925573397214, 2518)
-    femmesh.addNode(205.18643815466925, -35.57638091252241, 21.811715453171168, 2519)
-    femmesh.addNode(483.479060778246, -27.545065943547367, -11.015600909413225, 2520)
-    femmesh.addNode(483.58480863856107, -30.763422282034696, -16.945512737461538, 2521)
-    femmesh.addNode(493.714906736087, -20.102125831515696, -5.443024545506901, 2522)
-    femmesh.addNode(493.8206545964021, -23.320482170003025, -11.372936373555214, 2523)
-    femmesh.addNode(409.21890850646264, -35.47369449376181, 21.765352006772662, 2524)
-    femmesh.addNode(401.4598574172754, -35.53959064672797, 21.796996615790498, 2525)
-    femmesh.addNode(465.57744913649265, -27.004954471230878, 0.5517626618131347, 2526)
-    femmesh.addNode(464.14939398341676, -29.981799320709314, 9.912942974114923, 2527)
-    femmesh.addNode(471.6743707597793, -28.159355658348964, 6.719697642869126, 2528)
-    femmesh.addNode(144.6255681480788, -35.566755461221355, 21.80925734889447, 2529)
-    femmesh.addNode(152.2055006233667, -35.566755461221355, 21.796275998914176, 2530)
-    femmesh.addNode(439.9464445985555, -30.27744739742977, 9.861771909458945, 2531)
-    femmesh.addNode(435.70208321839357, -27.22616262787766, 3.098202206291426, 2532)
-    femmesh.addNode(443.5810541088638, -27.5023602640412, 4.352732143620898, 2533)
-    femmesh.addNode(486.6630396501088, -27.38414279709047, 6.309076875097013, 2534)
-    femmesh.addNode(479.59163423797315, -28.159355658348964, 8.71857360431601, 2535)
-    femmesh.addNode(486.17139510951074, -30.602181498374584, 12.687534252223088, 2536)
-    femmesh.addNode(61.87340573092465, -30.344647025982937, -9.166507912294483, 2537)
-    femmesh.addNode(58.504790118900424, -27.37027805569368, -3.0367202636581365, 2538)
-    femmesh.addNode(66.55668311837746, -27.415301302021177, -3.2296541940969363, 2539)
-    femmesh.addNode(148.93681624261512, -30.351367667346626, 17.709219652050756, 2540)
-    femmesh.addNode(156.51674871790306, -30.351367667346626, 17.696238302070462, 2541)
-    femmesh.addNode(432.2702222983702, -27.792279542994272, -12.563591920674895, 2542)
-    femmesh.addNode(436.02807894531827, -27.792279542994272, -4.307216825704654, 2543)
-    femmesh.addNode(428.4501820956649, -27.792279542994272, -4.3214237136193185, 2544)
-    femmesh.addNode(322.84881602149653, -30.49920827862418, 17.87633993104669, 2545)
-    femmesh.addNode(277.7462904242526, -30.35169957078864, 17.69692071800535, 2546)
-    femmesh.addNode(285.29349506645474, -30.363946280335213, 17.71199512015606, 2547)
-    femmesh.addNode(280.990523254448, -35.568657076692055, 21.797451976673457, 2548)
-    femmesh.addNode(393.359424224852, -30.341796957754596, 9.927492322448199, 2549)
-    femmesh.addNode(397.1447638838822, -30.341796957754596, 17.69807999975659, 2550)
-    femmesh.addNode(199.37507210261953, -27.394214942149304, -2.9282691045505773, 2551)
-    femmesh.addNode(196.1937833672713, -30.34468849501505, -8.954102730965367, 2552)
-    femmesh.addNode(203.15716609915023, -27.394214942149304, -11.19950196886387, 2553)
-    femmesh.addNode(199.97587736380203, -30.34468849501505, -17.22533559527866, 2554)
-    femmesh.addNode(36.870200622426694, -36.083713832711226, -16.745028030769433, 2555)
-    femmesh.addNode(111.35545387237553, -27.33182638140489, 3.618334459703071, 2556)
-    femmesh.addNode(115.09348421942207, -27.33182638140489, 11.383943357502094, 2557)
-    femmesh.addNode(118.88667545551837, -27.33182638140489, 3.624181120421504, 2558)
-    femmesh.addNode(348.5244624491197, -35.756347343481124, 21.885917705729085, 2559)
-    femmesh.addNode(341.0863025097822, -35.81973384256834, 21.914757381026106, 2560)
-    femmesh.addNode(337.4974037746925, -30.76482635704479, 18.185473696593462, 2561)
-    femmesh.addNode(135.82703918007738, -30.403511858361945, -9.026639335371613, 2562)
-    femmesh.addNode(131.36613269336726, -27.43162393296719, -3.0848153148969892, 2563)
-    femmesh.addNode(132.02889579901415, -30.403511858361945, -17.28010468387766, 2564)
-    femmesh.addNode(127.56798931230404, -27.43162393296719, -11.338280663403037, 2565)
-    femmesh.addNode(265.01889157421306, -35.57076135269045, -21.31431861074489, 2566)
-    femmesh.addNode(257.42895123318783, -35.57076135269045, -21.331685039196707, 2567)
-    femmesh.addNode(36.91379892441231, -35.62942217097441, 21.744606375597073, 2568)
-    femmesh.addNode(47.76635892310428, -31.01719747407786, 16.388940690273955, 2569)
-    femmesh.addNode(54.77455515429187, -30.414371798427013, 15.699881169913319, 2570)
-    femmesh.addNode(48.3227992006822, -27.47995225165736, 9.93645184316869, 2571)
-    femmesh.addNode(213.31926567637242, -30.351216323265476, 9.936353650038082, 2572)
-    femmesh.addNode(39.42826164063016, -30.344574897371878, -12.403052062423475, 2573)
-    femmesh.addNode(31.25935494614422, -32.304825179171345, -14.406747621191027, 2574)
-    femmesh.addNode(374.3942123467315, -30.38858159873431, 17.742148602078366, 2575)
-    femmesh.addNode(378.67859260820785, -35.56940023043002, 21.79775498535408, 2576)
-    femmesh.addNode(381.95675335738827, -30.38858159873431, 17.7425746663588, 2577)
-    femmesh.addNode(351.2288907987572, -27.516635305705954, 4.392794913770116, 2578)
-    femmesh.addNode(344.8666568153118, -27.17863938790178, -1.8181312972346442, 2579)
-    femmesh.addNode(344.87905132969667, -27.903541379355115, 5.6173198654673335, 2580)
-    femmesh.addNode(383.57425765717545, -30.32515894637724, -17.18031562396928, 2581)
-    femmesh.addNode(391.1912758355222, -30.372869011570835, -17.239154051884675, 2582)
-    femmesh.addNode(388.08381237257174, -27.39573211622556, -11.185120221451704, 2583)
-    femmesh.addNode(22.95827458877546, -27.02763498674669, -3.681184805399929, 2584)
-    femmesh.addNode(22.555850431978676, -28.408877247544993, -10.938048510190772, 2585)
-    femmesh.addNode(15.842086334396436, -27.36081461327135, -7.861493548932957, 2586)
-    femmesh.addNode(98.62517996912577, -27.182706619387965, 10.592248913157743, 2587)
-    femmesh.addNode(94.57171923806874, -30.090494361915916, 17.377605041113398, 2588)
-    femmesh.addNode(94.99205650672938, -27.182706619387965, 2.8021272016469636, 2589)
-    femmesh.addNode(90.93859577567235, -30.090494361915916, 9.58748332960262, 2590)
-    femmesh.addNode(102.44986067711068, -27.182706619387965, 2.8147666106208566, 2591)
-    femmesh.addNode(363.9807377190991, -35.44864895911874, -21.254391262379883, 2592)
-    femmesh.addNode(371.70966611351315, -35.5129986172016, -21.28544462549006, 2593)
-    femmesh.addNode(206.33873330283996, -27.39685628266274, 11.68431271146994, 2594)
-    femmesh.addNode(210.13458942422778, -27.39685628266274, 3.913740788110808, 2595)
-    femmesh.addNode(106.61207479316082, -30.092571374855112, 9.602834576056035, 2596)
-    femmesh.addNode(124.64562577523051, -30.501088004806338, -17.39780707696186, 2597)
-    femmesh.addNode(117.09712957835545, -30.501088004806338, -17.404588311096703, 2598)
-    femmesh.addNode(120.88730103620176, -30.501088004806338, -9.145421793501177, 2599)
-    femmesh.addNode(443.761009835231, -30.482588896422953, -17.342940584173185, 2600)
-    femmesh.addNode(436.1036040256441, -30.482588896422953, -17.362967185567058, 2601)
-    femmesh.addNode(439.8614606725922, -30.482588896422953, -9.106592090596816, 2602)
-    femmesh.addNode(318.2285869587611, -35.44060904603503, -21.25137119470726, 2603)
-    femmesh.addNode(325.7809512319743, -35.44060904603503, -21.25115625474863, 2604)
-    femmesh.addNode(313.94674188207125, -30.25856092292048, -17.096389109126722, 2605)
-    femmesh.addNode(321.49910615528444, -30.25856092292048, -17.09617416916809, 2606)
-    femmesh.addNode(424.7520389287931, -35.69038818041828, -21.36152503015518, 2607)
-    femmesh.addNode(417.1660106318892, -35.69038818041828, -21.371387177647975, 2608)
-    femmesh.addNode(333.24958458082483, -30.098170169892654, -8.638260670077292, 2609)
-    femmesh.addNode(337.01704720828377, -30.098170169892654, -16.89087687687462, 2610)
-    femmesh.addNode(329.4662268071227, -30.098170169892654, -16.890795394963554, 2611)
-    femmesh.addNode(215.16000448583134, -30.347217489170838, -17.207904652111285, 2612)
-    femmesh.addNode(219.51117479132375, -35.55944221138161, -21.309585718212126, 2613)
-    femmesh.addNode(222.76383683148623, -30.34937344931142, -17.210563881580924, 2614)
-    femmesh.addNode(106.57195545891267, -35.43115656994512, 21.7433810505659, 2615)
-    femmesh.addNode(98.75518516506678, -35.38710061256498, 21.72183152968934, 2616)
-    femmesh.addNode(102.78739408517592, -30.092571374855112, 17.38031687859292, 2617)
-    femmesh.addNode(189.14625775769417, -35.557335842318565, -21.30984714992922, 2618)
-    femmesh.addNode(181.59471454460652, -35.557335842318565, -21.309909082847383, 2619)
-    femmesh.addNode(184.82106543167083, -30.34400775009091, -17.20520641327563, 2620)
-    femmesh.addNode(177.26952221858312, -30.34400775009091, -17.20526834619379, 2621)
-    femmesh.addNode(479.4596757695325, -35.41381895617543, -20.485475408202113, 2622)
-    femmesh.addNode(179.20376288915878, -30.356002786075486, 17.700386090490003, 2623)
-    femmesh.addNode(171.65629171620498, -30.35425938529282, 17.69823890133513, 2624)
-    femmesh.addNode(174.89915148059094, -35.57099164328281, 21.796723721806224, 2625)
-    femmesh.addNode(160.92128209005614, -27.396603758854496, 11.672362832040935, 2626)
-    femmesh.addNode(345.08009127583375, -30.099083093737804, -16.89206691200353, 2627)
-    femmesh.addNode(341.0497716336785, -35.39456850328325, -21.228753280086586, 2628)
-    femmesh.addNode(376.0077675906326, -30.32515894637724, -17.17866260398936, 2629)
-    femmesh.addNode(145.76279674190604, -27.39194254611246, 11.665417381171682, 2630)
-    femmesh.addNode(106.17513083546541, -30.761014254792624, -9.453331725110315, 2631)
-    femmesh.addNode(102.48345580493535, -27.89183988117501, -4.614367100916165, 2632)
-    femmesh.addNode(108.92652199308716, -27.515241119852604, -3.4169501346386824, 2633)
-    femmesh.addNode(6.429240281268599, -23.188697810420564, 12.084305862719171, 2634)
-    femmesh.addNode(341.0642728855022, -27.17863938790178, -10.069537232910005, 2635)
-    femmesh.addNode(153.98242922438456, -27.398056758121157, -2.944492666474673, 2636)
-    femmesh.addNode(169.72974497013388, -30.351544592762416, -17.214565572928453, 2637)
-    femmesh.addNode(174.05635784238655, -35.56180461585133, -21.312033601161666, 2638)
-    femmesh.addNode(372.83384808800713, -27.377274793953482, -11.103735125477575, 2639)
-    femmesh.addNode(369.0429298893008, -27.377274793953482, -2.853087928491577, 2640)
-    femmesh.addNode(368.2424050692113, -30.256810241620666, -17.093300288307244, 2641)
-    femmesh.addNode(364.45148687050505, -30.256810241620666, -8.842653091321246, 2642)
-    femmesh.addNode(442.46534702440647, -27.310739808849064, -2.53411386718278, 2643)
-    femmesh.addNode(326.1427306101176, -35.74694002054055, 21.881092451260358, 2644)
-    femmesh.addNode(333.6925667988718, -35.74694002054055, 21.881607238099974, 2645)
-    femmesh.addNode(30.37462264161104, -37.329237214740544, -17.215329503681687, 2646)
-    femmesh.addNode(141.31578548893685, -30.325221603732643, 17.676900263366942, 2647)
-    femmesh.addNode(201.94354856345137, -30.35481172831929, 17.711355735983766, 2648)
-    femmesh.addNode(308.55308280104373, -27.430952146780115, 4.059769122938796, 2649)
-    femmesh.addNode(312.35104609654036, -27.430952146780115, 11.816902167799253, 2650)
-    femmesh.addNode(316.1225291715966, -27.430952146780115, 4.060740995952667, 2651)
-    femmesh.addNode(204.31854665787404, -35.56753003067404, -21.333979783203645, 2652)
-    femmesh.addNode(333.49895123251747, -35.39456850328325, -21.22867179817552, 2653)
-    femmesh.addNode(21.34203208741817, -37.329237214740544, -18.845548591555662, 2654)
-    femmesh.addNode(164.69188428908683, -27.396603758854496, 3.91631100431177, 2655)
-    femmesh.addNode(311.2057635054351, -35.635244062681735, 21.829895291628418, 2656)
-    femmesh.addNode(134.32758457320136, -27.376319626167213, 3.826495388767857, 2657)
-    femmesh.addNode(137.53685418788328, -30.325221603732643, 9.905681271830002, 2658)
-    femmesh.addNode(141.98386544085247, -27.39194254611246, 3.894198389634741, 2659)
-    femmesh.addNode(121.24441839948707, -35.64187048604735, -21.35841750159132, 2660)
-    femmesh.addNode(128.79291459636215, -35.64187048604735, -21.351636267456477, 2661)
-    femmesh.addNode(129.40151340594798, -35.51186669708936, 21.770290945100676, 2662)
-    femmesh.addNode(136.98119757327413, -35.51186669708936, 21.78306164145217, 2663)
-    femmesh.addNode(491.4684749516242, -36.17997135946243, 19.914878539188884, 2664)
-    femmesh.addNode(484.4654717716671, -36.17997135946243, 16.76101630659979, 2665)
-    femmesh.addNode(164.10784515531356, -30.35425938529282, 17.69980155451067, 2666)
-    femmesh.addNode(159.81929226507043, -35.56597704830112, 21.795906408968865, 2667)
-    femmesh.addNode(167.36773882596185, -35.56597704830112, 21.794343755793324, 2668)
-    femmesh.addNode(371.1447777864194, -35.62868182722427, 21.82572705342219, 2669)
-    femmesh.addNode(116.45774357623, -27.515241119852604, -3.4111034739202495, 2670)
-    femmesh.addNode(123.80966457327527, -27.43162393296719, -3.0858953799423503, 2671)
-    femmesh.addNode(309.39781755939623, -27.378132218145673, -11.108369725399259, 2672)
-    femmesh.addNode(305.6017598429884, -27.378132218145673, -2.8567299037754648, 2673)
-    femmesh.addNode(306.203573016655, -30.32917061561293, -17.18451981105266, 2674)
-    femmesh.addNode(302.40751530024716, -30.32917061561293, -8.932879989428864, 2675)
-    femmesh.addNode(307.93254269611737, -30.396758424032072, 17.753229435862302, 2676)
-    femmesh.addNode(315.29917351638426, -30.49920827862418, 17.876924711752306, 2677)
-    femmesh.addNode(398.77750798128005, -30.372869011570835, -17.257187452681233, 2678)
-    femmesh.addNode(176.0273008186016, -27.397874337384565, 11.676210767993727, 2679)
-    femmesh.addNode(172.24945645674086, -27.397874337384565, 3.921721593440101, 2680)
-    femmesh.addNode(167.87844735434425, -30.35425938529282, 9.943749726781503, 2681)
-    femmesh.addNode(337.3092047724281, -27.903541379355115, 5.6185301365893, 2682)
-    femmesh.addNode(341.074866998468, -27.903541379355115, 13.374483344362659, 2683)
-    femmesh.addNode(230.33189786148404, -30.34937344931142, -17.21076308840238, 2684)
-    femmesh.addNode(233.52664816131306, -27.396987306170637, -11.190980480458435, 2685)
-    femmesh.addNode(226.55179542870252, -30.34937344931142, -8.959510598912809, 2686)
-    femmesh.addNode(229.74654572853154, -27.396987306170637, -2.939727990968861, 2687)
-    femmesh.addNode(268.2611760277938, -30.355992879709305, -17.218078028849686, 2688)
-    femmesh.addNode(272.04481211784355, -30.355992879709305, -8.965742314911399, 2689)
-    femmesh.addNode(275.8259705006086, -30.355992879709305, -17.21694932244718, 2690)
-    femmesh.addNode(455.4104828681646, -35.434713843603205, -21.041214707016234, 2691)
-    femmesh.addNode(459.22761481942746, -29.824310070733226, -16.31514914367175, 2692)
-    femmesh.addNode(83.3545146146133, -35.422379400415096, 21.6986132268114, 2693)
-    femmesh.addNode(75.69369466562067, -35.422379400415096, 21.48496435166746, 2694)
-    femmesh.addNode(138.88294653129788, -27.406674919369095, -2.9814925676402946, 2695)
-    femmesh.addNode(477.7290826833258, -27.020366424284077, -7.790141470580719, 2696)
-    femmesh.addNode(473.04466198301594, -27.020366424284077, 0.15586693953348074, 2697)
-    femmesh.addNode(476.02512565759656, -29.43424220533918, -15.200311231614162, 2698)
-    femmesh.addNode(471.3407049572867, -29.43424220533918, -7.254302821499962, 2699)
-    femmesh.addNode(169.08903017458118, -27.394447662568595, -2.927462341297037, 2700)
-    femmesh.addNode(113.81882901514426, -35.74824851471405, -21.407696346153593, 2701)
-    femmesh.addNode(106.27198993825672, -35.74824851471405, -21.437522069292932, 2702)
-    femmesh.addNode(348.4772854026517, -30.768812609800356, 10.432814801931967, 2703)
-    femmesh.addNode(344.67310107142305, -30.768812609800356, 18.18997828082729, 2704)
-    femmesh.addNode(51.879256941482, -35.78046762183758, 19.822196923745096, 2705)
-    femmesh.addNode(493.17439828946783, -30.602181498374584, 15.841396484812183, 2706)
-    femmesh.addNode(303.696939775326, -35.59847923309482, 21.812606803409963, 2707)
-    femmesh.addNode(296.11353446249746, -35.59847923309482, 21.825005435833376, 2708)
-    femmesh.addNode(249.83745575805162, -35.58054566424663, -21.336322410386884, 2709)
-    femmesh.addNode(304.13457940062074, -30.396758424032072, 9.996096391001844, 2710)
-    femmesh.addNode(471.4834619429488, -31.805922614602686, 11.94093329599558, 2711)
-    femmesh.addNode(479.4007254211426, -31.805922614602686, 13.939809257442464, 2712)
-    femmesh.addNode(352.6635215455488, -30.099083093737804, -16.91123969043447, 2713)
-    femmesh.addNode(348.8824752056434, -30.099083093737804, -8.640660976328169, 2714)
-    femmesh.addNode(67.93491708199689, -35.53875426794372, 21.541126815217424, 2715)
-    femmesh.addNode(31.99086514296833, -27.02763498674669, -2.050965717525954, 2716)
-    femmesh.addNode(31.58844098617155, -28.408877247544993, -9.307829422316797, 2717)
-    femmesh.addNode(37.80329001086955, -27.311910895753563, -6.0040989913382035, 2718)
-    femmesh.addNode(301.05345988674605, -27.404293999373966, 3.9491560638696965, 2719)
-    femmesh.addNode(207.57315548504707, -30.347217489170838, -17.22845651863827, 2720)
-    femmesh.addNode(211.9243257905395, -35.55944221138161, -21.330137584739113, 2721)
-    femmesh.addNode(142.6613356395763, -27.406674919369095, -11.25289186062766, 2722)
-    femmesh.addNode(139.6054282883558, -30.403511858361945, -17.298038628358977, 2723)
-    femmesh.addNode(146.44744067203135, -27.406674919369095, -2.9809482822329616, 2724)
-    femmesh.addNode(91.18752965664262, -35.38710061256498, 21.681342736135186, 2725)
-    femmesh.addNode(87.0040637296446, -30.090494361915916, 17.337116247559244, 2726)
-    femmesh.addNode(82.01163675902163, -27.33606926843484, 11.37509801774128, 2727)
-    femmesh.addNode(78.80547242205205, -30.258141415664845, 17.551982835074178, 2728)
-    femmesh.addNode(78.63927218940614, -27.33606926843484, 3.5779702023358477, 2729)
-    femmesh.addNode(75.43310785243656, -30.258141415664845, 9.754855019668744, 2730)
-    femmesh.addNode(64.66038780168694, -30.344647025982937, -17.146615745871436, 2731)
-    femmesh.addNode(72.58606004208043, -30.458275957419442, -17.285179548555032, 2732)
-    femmesh.addNode(69.34366518913976, -27.415301302021177, -11.209762027673888, 2733)
-    femmesh.addNode(285.9450261159246, -27.397714826852166, 3.9208910275832203, 2734)
-    femmesh.addNode(282.7968369733934, -27.397107225520344, -2.9389613022173253, 2735)
-    femmesh.addNode(290.38185284123875, -27.392571999018685, -2.919587579328192, 2736)
-    femmesh.addNode(95.02565163455407, -27.89183988117501, -4.627006509890058, 2737)
-    femmesh.addNode(228.51827125921577, -30.344130294232464, 9.92982932883807, 2738)
-    femmesh.addNode(232.29616063829351, -30.344130294232464, 17.686050896311258, 2739)
-    femmesh.addNode(232.9304951365311, -27.394019268791585, 3.903848107276257, 2740)
-    femmesh.addNode(236.70838451560886, -27.394019268791585, 11.660069674749444, 2741)
-    femmesh.addNode(295.3274706534036, -35.56701337132755, -21.331413359157906, 2742)
-    femmesh.addNode(302.9723128750361, -35.51940480229659, -21.308708972576873, 2743)
-    femmesh.addNode(298.6226385954319, -30.32917061561293, -17.20382699806536, 2744)
-    femmesh.addNode(278.9995741154911, -27.397107225520344, -11.189520632577075, 2745)
-    femmesh.addNode(275.21841573272604, -27.397107225520344, -2.938313625041292, 2746)
-    femmesh.addNode(263.2344678556175, -27.394556809463836, 3.9068975694025867, 2747)
-    femmesh.addNode(260.07176292010524, -27.398260089863868, -2.944393723141802, 2748)
-    femmesh.addNode(255.67438632286925, -27.394156259191583, 3.9051854030123327, 2749)
-    femmesh.addNode(473.8241722344991, -31.805922614602686, 19.636142958767664, 2750)
-    femmesh.addNode(211.36809163049207, -30.347217489170838, -8.959068358960323, 2751)
-    femmesh.addNode(218.35135697570666, -27.395219017531048, -11.183240019173626, 2752)
-    femmesh.addNode(214.5594441203674, -27.395219017531048, -2.934403726022664, 2753)
-    femmesh.addNode(428.6835959441214, -30.654658198691703, -17.56551722059789, 2754)
-    femmesh.addNode(32.417187653767584, -27.02763498674669, 9.074732887689615, 2755)
-    femmesh.addNode(41.11705158806036, -27.47995225165736, 11.928699472688123, 2756)
-    femmesh.addNode(32.880183311511416, -29.693762078538974, 16.74113983800911, 2757)
-    femmesh.addNode(385.0437194441462, -27.40221457507332, 11.696837947568607, 2758)
-    femmesh.addNode(480.9619254612097, -27.020366424284077, 2.1547429009803656, 2759)
-    femmesh.addNode(255.0536986149564, -30.348175007154346, 17.704646970918937, 2760)
-    femmesh.addNode(251.8810499834181, -27.394156259191583, 11.67426033603985, 2761)
-    femmesh.addNode(258.84703495440755, -30.348175007154346, 9.935572037891417, 2762)
-    femmesh.addNode(348.63320190339357, -35.39456850328325, -21.24792605851753, 2763)
-    femmesh.addNode(282.146883981726, -27.397714826852166, 11.677367983400678, 2764)
-    femmesh.addNode(278.36660487525717, -27.397714826852166, 3.9215387047592536, 2765)
-    femmesh.addNode(273.9660113177838, -30.35169957078864, 9.941091439363925, 2766)
-    femmesh.addNode(363.55686004801805, -35.62868182722427, 21.839111195812045, 2767)
-    femmesh.addNode(404.8956131888925, -30.287764671186352, 17.6309476309262, 2768)
-    femmesh.addNode(40.69072907726111, -27.47995225165736, 0.8030008674725546, 2769)
-    femmesh.addNode(182.98709457564078, -30.356002786075486, 9.943537474895034, 2770)
-    femmesh.addNode(179.8106325050836, -27.397874337384565, 3.9193621523987585, 2771)
-    femmesh.addNode(235.5142248099043, -35.558428557083545, 21.791060003827916, 2772)
-    femmesh.addNode(388.8416698843906, -27.40221457507332, 3.939251440014996, 2773)
-    femmesh.addNode(220.39307823692312, -35.55745691516646, 21.789735085565393, 2774)
-    femmesh.addNode(84.59538446889562, -27.5075744389949, -11.667638644900954, 2775)
-    femmesh.addNode(80.1239268377042, -30.458275957419442, -17.379218778428623, 2776)
-    femmesh.addNode(87.5266835990951, -30.746892915616968, -17.716624938251808, 2777)
-    femmesh.addNode(76.69722293003613, -30.458275957419442, -9.16006062220146, 2778)
-    femmesh.addNode(73.45482807709547, -27.415301302021177, -3.084643101320316, 2779)
-    femmesh.addNode(357.37768278389245, -27.33056488792136, -10.912342675711969, 2780)
-    femmesh.addNode(360.65725510619603, -30.256810241620666, -17.11322597612885, 2781)
-    femmesh.addNode(356.39558775608384, -35.44864895911874, -21.274316950201488, 2782)
-    femmesh.addNode(319.0706565914405, -30.49920827862418, 10.12076353990572, 2783)
-    femmesh.addNode(91.25168576359442, -35.81642448382223, -21.464722151474486, 2784)
-    femmesh.addNode(98.78389369035989, -35.81642448382223, -21.468575268841057, 2785)
-    femmesh.addNode(272.5768631018094, -35.567904022235446, -21.312962718533065, 2786)
-    femmesh.addNode(280.1416575746242, -35.567904022235446, -21.31183401213056, 2787)
-    femmesh.addNode(83.70238467262428, -35.71389722690097, -21.417866296714173, 2788)
-    femmesh.addNode(287.20381614739927, -30.351208002096385, -8.960494940260313, 2789)
-    femmesh.addNode(283.40655328949697, -30.351208002096385, -17.21105427062006, 2790)
-    femmesh.addNode(263.8682569227035, -27.398260089863868, -11.195555800047655, 2791)
-    femmesh.addNode(260.6888164064423, -30.35922449561429, -17.222055987860344, 2792)
-    femmesh.addNode(256.89232240384405, -30.35922449561429, -8.97089391095449, 2793)
-    femmesh.addNode(297.2680178694142, -27.404293999373966, 11.718687741153566, 2794)
-    femmesh.addNode(292.8806606952687, -30.363946280335213, 17.72543538039165, 2795)
-    femmesh.addNode(300.34913738328885, -30.396758424032072, 17.765628068285714, 2796)
-    femmesh.addNode(29.069632764627407, -35.546459094145725, 21.705377023537935, 2797)
-    femmesh.addNode(318.75540601054735, -35.635244062681735, 21.829310510922802, 2798)
-    femmesh.addNode(181.05305761209274, -30.34400775009091, -8.95382023385146, 2799)
-    femmesh.addNode(184.21572685891095, -27.393217890575006, -2.9245614403441063, 2800)
-    femmesh.addNode(176.6502062229239, -27.394447662568595, -2.9298217823383794, 2801)
-    femmesh.addNode(126.7711164531094, -27.376319626167213, 3.825415323722496, 2802)
-    femmesh.addNode(122.20919783978633, -30.253808407947844, 9.815382772663565, 2803)
-    femmesh.addNode(409.6553976668257, -35.6187108925583, -21.337923708298895, 2804)
-    femmesh.addNode(402.06405985303627, -35.6187108925583, -21.35532852365685, 2805)
-    femmesh.addNode(414.3985391743523, -27.485480093251844, -3.297815301508735, 2806)
-    femmesh.addNode(407.0373596326298, -27.418273279524858, -3.030049285297543, 2807)
-    femmesh.addNode(48.98102251382656, -27.47995225165736, -2.59093184354979, 2808)
-    femmesh.addNode(54.179048576863366, -27.47995225165736, 4.039634054295625, 2809)
-    femmesh.addNode(53.306764055863624, -27.37027805569368, -9.66728616150355, 2810)
-    femmesh.addNode(366.985729327724, -30.496891176386846, 17.873065430925948, 2811)
-    femmesh.addNode(46.09358344743501, -27.311910895753563, -9.398031702360548, 2812)
-    femmesh.addNode(206.95210224459524, -27.394214942149304, -2.930113809185923, 2813)
-    femmesh.addNode(242.24919481530515, -35.58054566424663, -21.319797912165516, 2814)
-    femmesh.addNode(237.92742388051232, -30.356258978862723, -17.2192476188958, 2815)
-    femmesh.addNode(234.6542294043902, -35.56485183208581, -21.312355474088513, 2816)
-    femmesh.addNode(247.4642016386651, -30.347264040496725, 17.703523215775203, 2817)
-    femmesh.addNode(250.71673911740288, -35.569384943053656, 21.809869409772695, 2818)
-    femmesh.addNode(91.40687630707026, -30.746892915616968, -9.449971884575838, 2819)
-    femmesh.addNode(421.9728268018331, -27.485480093251844, -3.2962762095773646, 2820)
-    femmesh.addNode(424.8635557414161, -30.654658198691703, -9.32334901354231, 2821)
-    femmesh.addNode(262.6435267461985, -30.348175007154346, 17.692223743799232, 2822)
-    femmesh.addNode(265.8696169611285, -35.564717462247614, 21.795230354893896, 2823)
-    femmesh.addNode(258.30656724864497, -35.569384943053656, 21.79744618265299, 2824)
-    femmesh.addNode(369.91716265939914, -27.430530518764883, 11.814089650538055, 2825)
-    femmesh.addNode(363.1932510464567, -30.496891176386846, 10.11691741799601, 2826)
-    femmesh.addNode(366.1246843781318, -27.430530518764883, 4.057941637608116, 2827)
-    femmesh.addNode(297.956318353186, -27.392571999018685, -2.919202040559012, 2828)
-    femmesh.addNode(70.2490200414877, -27.39596443691934, 3.8443382792544916, 2829)
-    femmesh.addNode(65.96056466211056, -27.39596443691934, 11.427817219515985, 2830)
-    femmesh.addNode(71.14465247305941, -30.258141415664845, 17.33833395993024, 2831)
-    femmesh.addNode(114.13466651394413, -35.43115656994512, 21.73150764582804, 2832)
-    femmesh.addNode(121.6835730038598, -35.43115656994512, 21.731273768978255, 2833)
-    femmesh.addNode(118.41600660369002, -30.253808407947844, 17.575145009744155, 2834)
-    femmesh.addNode(125.96491309360572, -30.253808407947844, 17.57491113289437, 2835)
-    femmesh.addNode(273.43353436845433, -35.564717462247614, 21.79558156465994, 2836)
-    femmesh.addNode(310.5532472962592, -35.51940480229659, -21.289401785564166, 2837)
-    femmesh.addNode(81.16868056122755, -27.5075744389949, -3.4484804886737916, 2838)
-    femmesh.addNode(56.67537966788785, -30.344647025982937, -15.797073810139898, 2839)
-    femmesh.addNode(47.71855507719562, -30.344574897371878, -15.79698477344582, 2840)
-    femmesh.addNode(222.13931557292295, -27.395219017531048, -2.9321867365055123, 2841)
-    femmesh.addNode(63.350875082769704, -27.39596443691934, 3.699327186477871, 2842)
-    femmesh.addNode(252.49858762312164, -27.398202045729178, -2.9441468707089293, 2843)
-    femmesh.addNode(313.17120621354127, -27.378132218145673, -2.855758030761594, 2844)
-    femmesh.addNode(60.710251274441646, -35.55610895876903, -21.24988370774652, 2845)
-    femmesh.addNode(376.6202612786635, -27.377274793953482, -2.852799288224103, 2846)
-    femmesh.addNode(381.26603154158477, -27.40221457507332, 3.9405525106257113, 2847)
-    femmesh.addNode(384.30373549668525, -27.39573211622556, -2.9325313642183097, 2848)
-    femmesh.addNode(224.73089357370606, -30.344130294232464, 17.685188053514217, 2849)
-    femmesh.addNode(221.5348243035632, -27.395380262402004, 11.665021816592091, 2850)
-    femmesh.addNode(288.577688883262, -35.568657076692055, 21.810892236909048, 2851)
-    femmesh.addNode(60.63080453047303, -30.414371798427013, 9.803063381040253, 2852)
-    femmesh.addNode(403.2543213521225, -27.418273279524858, -11.297945363272504, 2853)
-    femmesh.addNode(243.10480880533035, -35.558428557083545, 21.804664887028977, 2854)
-    femmesh.addNode(328.5735492301119, -27.330919611043235, -2.642214804622441, 2855)
-    femmesh.addNode(321.01121583734164, -27.330919611043235, -2.6423527748296682, 2856)
-    femmesh.addNode(323.39674811312676, -27.515918513939212, 4.391206240044608, 2857)
-    femmesh.addNode(373.7020157674945, -27.430530518764883, 4.05823027787559, 2858)
-    femmesh.addNode(353.59663644398705, -27.33056488792136, -2.641763961605666, 2859)
-    femmesh.addNode(337.29681025804325, -27.17863938790178, -1.816921026112678, 2860)
-    femmesh.addNode(317.7201305362163, -30.25856092292048, -8.843777414489058, 2861)
-    femmesh.addNode(361.17191454820147, -27.33056488792136, -2.6417697909043665, 2862)
-    femmesh.addNode(352.25712404973206, -30.768812609800356, 18.202341127953055, 2863)
-    femmesh.addNode(355.00872944583756, -27.516635305705954, 12.162321239791206, 2864)
-    femmesh.addNode(359.3978115893226, -30.496891176386846, 17.8864495733158, 2865)
-    femmesh.addNode(244.91787001599397, -27.398202045729178, -2.9445253533190745, 2866)
-    femmesh.addNode(241.72841355455807, -30.356258978862723, -8.967622094369643, 2867)
-    femmesh.addNode(237.32763783535881, -27.396987306170637, -2.9393549559322762, 2868)
-    femmesh.addNode(6.76482639252636, -19.712697375536983, -1.2050474948756316, 2869)
-    femmesh.addNode(22.22676439195135, -32.304825179171345, -16.036966709065002, 2870)
-    femmesh.addNode(25.276566678220412, -29.693762078538974, 15.080633263655988, 2871)
-    femmesh.addNode(17.361796654839797, -30.836815048154932, 16.523270927398265, 2872)
-    femmesh.addNode(17.844963132565503, -27.561757966604112, 10.570715739278189, 2873)
-    femmesh.addNode(432.27779691958824, -35.675408480859986, -21.35456959007778, 2874)
-    femmesh.addNode(436.1146526017094, -30.27744739742977, 17.610339988016737, 2875)
-    femmesh.addNode(443.6076699161657, -30.27744739742977, 17.652203820970666, 2876)
-    femmesh.addNode(358.8041689029716, -27.516635305705954, 4.392789084471415, 2877)
-    femmesh.addNode(10.932556373571197, -34.35188276226563, 8.569283276856396, 2878)
-    femmesh.addNode(9.077259941870075, -34.35188276226563, -2.5261278418800264, 2879)
-    femmesh.addNode(248.09366871574156, -27.394156259191583, 3.9048069204021876, 2880)
-    femmesh.addNode(240.51158724335838, -27.394019268791585, 3.904221142312842, 2881)
-    femmesh.addNode(196.7351330854566, -35.56753003067404, -21.31469097129149, 2882)
-    femmesh.addNode(202.5575592822521, -27.39685628266274, 3.9155854927461538, 2883)
-    femmesh.addNode(186.75298769830846, -30.356002786075486, 17.700547573352953, 2884)
-    femmesh.addNode(172.86667082941432, -27.394447662568595, -11.18126989468071, 2885)
-    femmesh.addNode(68.54348485039054, -35.57806443218014, -21.260306725909416, 2886)
-    femmesh.addNode(197.60497963678796, -35.56591405851063, 21.806750321991203, 2887)
-    femmesh.addNode(217.74233053651733, -27.395380262402004, 3.907446102398793, 2888)
-    femmesh.addNode(287.74061898836925, -35.56701337132755, -21.31141121965034, 2889)
-    femmesh.addNode(293.4789943747988, -27.404293999373966, 3.9487705251005165, 2890)
-    femmesh.addNode(289.0916372006533, -30.363946280335213, 9.955518164338601, 2891)
-    femmesh.addNode(324.7901914564098, -27.330919611043235, -10.894749529508701, 2892)
-    femmesh.addNode(493.66604283006586, -19.941202685058798, 1.9367688674422514, 2893)
-    femmesh.addNode(428.1241863687402, -27.22616262787766, 3.0839953183767617, 2894)
-    femmesh.addNode(419.5183500761582, -27.35058787767855, 3.713137352973972, 2895)
-    femmesh.addNode(424.2676062575723, -30.175556247316724, 9.71849051804046, 2896)
-    femmesh.addNode(143.86933261154184, -35.60556172691749, -21.35251857033105, 2897)
-    femmesh.addNode(147.08457571321816, -30.368929242775238, -17.255730646165894, 2898)
-    femmesh.addNode(253.09887606541707, -30.35922449561429, -17.239422416312163, 2899)
-    femmesh.addNode(6.429240281268598, -30.836815048154932, 16.109146756630523, 2900)
-    femmesh.addNode(431.8702912215475, -27.22616262787766, 10.846770284849217, 2901)
-    femmesh.addNode(245.51568482325877, -30.356258978862723, -17.235772117117172, 2902)
-    femmesh.addNode(227.0861683743924, -35.56485183208581, -21.31215626726705, 2903)
-    femmesh.addNode(239.87361764323902, -30.347264040496725, 17.68991833257414, 2904)
-    femmesh.addNode(420.48114674452836, -30.175556247316724, 17.476013129100167, 2905)
-    femmesh.addNode(294.17144164837083, -27.392571999018685, -11.19014904919551, 2906)
-    femmesh.addNode(413.83802053485886, -30.45800836371083, -17.343292725338614, 2907)
-    femmesh.addNode(60.34519589700402, -35.78046762183758, 21.653869167910145, 2908)
-    femmesh.addNode(63.24049410981388, -30.414371798427013, 17.531553414078367, 2909)
-    femmesh.addNode(88.47557717687079, -27.5075744389949, -3.4009855912249845, 2910)
-    femmesh.addNode(85.94616880504938, -27.33606926843484, 3.625465099784655, 2911)
-    femmesh.addNode(151.4064448539547, -35.57403565956865, -21.337616728209206, 2912)
-    femmesh.addNode(150.87068074567316, -30.368929242775238, -8.983787067771196, 2913)
-    femmesh.addNode(456.47900851563634, -29.981799320709314, 9.555323019165641, 2914)
-    femmesh.addNode(459.83007241983984, -29.981799320709314, 17.35747647638339, 2915)
-    femmesh.addNode(493.17439828946783, -23.159241386342913, 8.315226244568327, 2916)
-    femmesh.addNode(133.7361013216107, -30.325221603732643, 17.664129567015447, 2917)
-    femmesh.addNode(136.29280012220022, -35.60556172691749, -21.33458462584973, 2918)
-    femmesh.addNode(400.30459019523056, -27.385289935659774, 11.637432105375296, 2919)
-    femmesh.addNode(110.35010514020738, -30.092571374855112, 17.36844347385506, 2920)
-    femmesh.addNode(40.56061131048244, -31.01719747407786, 18.381188319793388, 2921)
-    femmesh.addNode(44.67350932886016, -35.78046762183758, 21.81444455326453, 2922)
-    femmesh.addNode(404.092959495546, -27.385289935659774, 3.865419318622627, 2923)
-    femmesh.addNode(248.70514128469466, -27.398202045729178, -11.212675376066601, 2924)
-    femmesh.addNode(243.67682037098854, -30.347264040496725, 9.93406980013754, 2925)
-    femmesh.addNode(410.02972100157683, -30.45800836371083, -9.092801462721608, 2926)
-    femmesh.addNode(406.2466827210695, -30.45800836371083, -17.36069754069657, 2927)
-    femmesh.addNode(225.32220198907294, -27.395380262402004, 3.9096630919159447, 2928)
-    femmesh.addNode(450.0585242884495, -27.310739808849064, -2.457731197635647, 2929)
-    femmesh.addNode(446.36489618704536, -27.310739808849064, -10.770462360759149, 2930)
-    femmesh.addNode(191.78505425437578, -27.393217890575006, -2.924003567367133, 2931)
-    femmesh.addNode(187.98373467848904, -27.393217890575006, -11.175947619768277, 2932)
-    femmesh.addNode(192.39246379138459, -30.34468849501505, -17.20604678336651, 2933)
-    femmesh.addNode(486.7119035561299, -27.545065943547367, -1.0707165378521406, 2934)
-    femmesh.addNode(182.44837628974062, -35.57099164328281, 21.796885204669174, 2935)
-    femmesh.addNode(190.02037134340299, -35.56591405851063, 21.794475328748362, 2936)
-    femmesh.addNode(457.90706366871217, -27.004954471230878, 0.1941427068638527, 2937)
-    femmesh.addNode(455.1104415626729, -29.824310070733226, -8.181212830256364, 2938)
-    femmesh.addNode(452.5470565692035, -29.981799320709314, 17.26937226113023, 2939)
-    femmesh.addNode(447.24227942647394, -27.5023602640412, 12.143164055132619, 2940)
-    femmesh.addNode(462.8105376620186, -36.0011231585645, 22.130012525067976, 2941)
-    femmesh.addNode(270.1823730169267, -30.35169957078864, 17.696569508239307, 2942)
-    femmesh.addNode(21.466016131336406, -35.546459094145725, 20.044870449184813, 2943)
-    femmesh.addNode(10.533459757765208, -35.546459094145725, 19.630746278417067, 2944)
-    femmesh.addNode(379.794180781289, -30.32515894637724, -8.927726766735885, 2945)
-    femmesh.addNode(290.99340495453134, -30.351208002096385, -17.23105641012763, 2946)
-    femmesh.addNode(432.117209287101, -35.46210363908629, 21.752046190618856, 2947)
-    femmesh.addNode(439.6102266015573, -35.46210363908629, 21.793910023572785, 2948)
-    femmesh.addNode(418.2068387076344, -27.485480093251844, -11.548306564125738, 2949)
-    femmesh.addNode(467.16414037937193, -31.805922614602686, 19.385466798264048, 2950)
-    femmesh.addNode(447.5996815100059, -35.434713843603205, -21.22000955672435, 2951)
-    femmesh.addNode(439.93520272917516, -35.675408480859986, -21.334542988683907, 2952)
-    femmesh.addNode(447.62864005564825, -35.449222835166125, 21.78766450842275, 2953)
-    femmesh.addNode(191.16617354484725, -27.39801450214227, 11.676968572654996, 2954)
-    femmesh.addNode(187.40028042217955, -27.39801450214227, 3.9199584741970783, 2955)
-    femmesh.addNode(451.4168134612687, -29.824310070733226, -16.493943993379865, 2956)
-    femmesh.addNode(469.4705695171458, -36.0011231585645, 22.38068868557159, 2957)
-    femmesh.addNode(451.1742313729068, -27.5023602640412, 4.429114813168031, 2958)
-    femmesh.addNode(6.912406758994305, -19.913640728869744, 6.131750674599093, 2959)
-    femmesh.addNode(109.91618096076195, -30.761014254792624, -17.70665158198741, 2960)
-    femmesh.addNode(112.6675721183837, -27.515241119852604, -11.670269991515777, 2961)
-    femmesh.addNode(394.48631952988575, -35.55834680900894, -21.32678845742884, 2962)
-    femmesh.addNode(270.81459794826543, -27.394556809463836, 3.9080712064350203, 2963)
-    femmesh.addNode(267.0309596474084, -27.394556809463836, 11.6635492753104, 2964)
-    femmesh.addNode(478.8889185850236, -36.17997135946243, 22.457350007924987, 2965)
-    femmesh.addNode(428.01371111037963, -30.175556247316724, 17.481265484512917, 2966)
-    femmesh.addNode(462.0242369254667, -27.004954471230878, -7.939793606551533, 2967)
-    femmesh.addNode(467.7874927462608, -29.43424220533918, -15.74585908986463, 2968)
-    femmesh.addNode(454.91165590628464, -35.449222835166125, 21.87576872367591, 2969)
-    femmesh.addNode(130.5268317069288, -27.376319626167213, 11.584943683953302, 2970)
-    femmesh.addNode(267.65189301275325, -27.398260089863868, -2.9432200861093682, 2971)
-    femmesh.addNode(45.16049405899214, -36.083713832711226, -20.138960741791777, 2972)
-    femmesh.addNode(24.81357102047658, -27.02763498674669, 7.414226313336493, 2973)
-    femmesh.addNode(76.1645178770005, -35.71389722690097, -21.323827066840582, 2974)
-    femmesh.addNode(378.17906545482685, -30.38858159873431, 9.986289229415904, 2975)
-    femmesh.addNode(6.516934632192979, -22.8867960637877, -7.607058167958922, 2976)
-    femmesh.addNode(421.0975676472175, -30.654658198691703, -17.575379368090687, 2977)
-    femmesh.addNode(227.95834530151058, -35.55745691516646, 21.790597928362434, 2978)
-    femmesh.addNode(194.96960781764437, -27.39801450214227, 3.9205163471740514, 2979)
-    femmesh.addNode(15.98966670086438, -27.561757966604112, -0.5246953794582332, 2980)
-    femmesh.addNode(166.50614897994325, -35.56180461585133, -21.31161676786825, 2981)
-    femmesh.addNode(194.3589402700664, -30.35481172831929, 17.699080742740925, 2982)
-    femmesh.addNode(198.16237454286352, -30.35481172831929, 9.94262851725998, 2983)
-    return True
-
-
-def create_elements(femmesh):
-    # elements
-    femmesh.addVolume([67, 32, 33, 180, 1159, 587, 1160, 2218, 777, 778], 1281)
-    femmesh.addVolume([171, 23, 57, 24, 752, 1173, 2219, 753, 578, 1141], 1282)
-    femmesh.addVolume([237, 270, 211, 269, 1122, 2221, 2220, 1131, 1136, 2222], 1283)
-    femmesh.addVolume([220, 180, 264, 256, 933, 2225, 2223, 2224, 2226, 1075], 1284)
-    femmesh.addVolume([230, 184, 271, 216, 2227, 2229, 1112, 2228, 894, 2230], 1285)
-    femmesh.addVolume([265, 241, 240, 201, 1080, 997, 1079, 2231, 2232, 2233], 1286)
-    femmesh.addVolume([56, 188, 205, 249, 824, 855, 846, 2234, 2235, 2236], 1287)
-    femmesh.addVolume([215, 268, 216, 183, 2237, 2238, 895, 892, 2239, 893], 1288)
-    femmesh.addVolume([241, 83, 82, 48, 996, 640, 995, 2240, 1192, 1190], 1289)
-    femmesh.addVolume([243, 195, 266, 244, 2241, 2242, 1085, 1006, 2243, 1086], 1290)
-    femmesh.addVolume([196, 52, 245, 203, 821, 2245, 2244, 853, 842, 2246], 1291)
-    femmesh.addVolume([228, 264, 262, 212, 1076, 1109, 1068, 2247, 2248, 2249], 1292)
-    femmesh.addVolume([221, 244, 203, 267, 2250, 2252, 941, 2251, 1088, 2253], 1293)
-    femmesh.addVolume([255, 178, 261, 227, 2254, 2255, 1065, 1055, 2256, 1066], 1294)
-    femmesh.addVolume([263, 259, 218, 231, 1097, 2258, 2257, 1070, 1072, 2259], 1295)
-    femmesh.addVolume([78, 44, 236, 192, 1182, 2261, 981, 2260, 813, 2262], 1296)
-    femmesh.addVolume([558, 81, 80, 47, 2263, 638, 2264, 2265, 1188, 1189], 1297)
-    femmesh.addVolume([246, 87, 53, 88, 1010, 1202, 2266, 1011, 645, 1201], 1298)
-    femmesh.addVolume([56, 90, 205, 55, 1208, 2267, 846, 611, 1205, 847], 1299)
-    femmesh.addVolume([224, 206, 234, 252, 2268, 2269, 1103, 1031, 2270, 1102], 1300)
-    femmesh.addVolume([248, 188, 218, 259, 2271, 919, 2272, 1074, 2273, 2258], 1301)
-    femmesh.addVolume([210, 272, 209, 200, 2274, 2275, 875, 912, 2276, 905], 1302)
-    femmesh.addVolume([239, 193, 80, 238, 2277, 2278, 989, 991, 2279, 987], 1303)
-    femmesh.addVolume([44, 200, 77, 236, 835, 2280, 1183, 2261, 2281, 980], 1304)
-    femmesh.addVolume([52, 86, 245, 203, 1200, 1007, 2245, 842, 2282, 2246], 1305)
-    femmesh.addVolume([195, 244, 51, 203, 2243, 2283, 818, 850, 2252, 843], 1306)
-    femmesh.addVolume([270, 226, 207, 176, 1104, 2286, 2284, 2285, 2287, 865], 1307)
-    femmesh.addVolume([232, 186, 73, 187, 2288, 2290, 969, 2289, 800, 2291], 1308)
-    femmesh.addVolume([226, 177, 207, 176, 2292, 866, 2286, 2287, 827, 865], 1309)
-    femmesh.addVolume([259, 17, 14, 189, 1048, 736, 2293, 2294, 2295, 805], 1310)
-    femmesh.addVolume([66, 32, 179, 31, 1158, 775, 2296, 1157, 586, 774], 1311)
-    femmesh.addVolume([254, 28, 62, 176, 2297, 1150, 1034, 2298, 766, 2299], 1312)
-    femmesh.addVolume([188, 259, 249, 16, 2273, 1049, 2235, 2300, 1047, 1021], 1313)
-    femmesh.addVolume([173, 59, 25, 172, 2301, 1144, 757, 759, 2302, 755], 1314)
-    femmesh.addVolume([13, 188, 249, 16, 803, 2235, 2303, 734, 2300, 1021], 1315)
-    femmesh.addVolume([188, 259, 14, 189, 2273, 2293, 802, 806, 2294, 805], 1316)
-    femmesh.addVolume([78, 44, 77, 236, 1182, 1183, 635, 981, 2261, 980], 1317)
-    femmesh.addVolume([206, 252, 171, 170, 2270, 2304, 862, 928, 2305, 864], 1318)
-    femmesh.addVolume([231, 186, 185, 38, 2306, 796, 2307, 2308, 794, 792], 1319)
-    femmesh.addVolume([244, 86, 51, 203, 1005, 1197, 2283, 2252, 2282, 843], 1320)
-    femmesh.addVolume([8, 13, 249, 16, 733, 2303, 1020, 565, 734, 1021], 1321)
-    femmesh.addVolume([163, 321, 164, 98, 1348, 2309, 1570, 1219, 1350, 1561], 1322)
-    femmesh.addVolume([228, 180, 264, 212, 2310, 2225, 1076, 2247, 884, 2248], 1323)
-    femmesh.addVolume([205, 89, 248, 197, 2311, 1016, 2312, 852, 2313, 2314], 1324)
-    femmesh.addVolume([28, 175, 61, 27, 764, 2315, 1149, 582, 763, 1148], 1325)
-    femmesh.addVolume([43, 191, 235, 200, 810, 2317, 2316, 836, 860, 2318], 1326)
-    femmesh.addVolume([173, 59, 224, 253, 2301, 952, 2319, 2320, 1033, 1054], 1327)
-    femmesh.addVolume([182, 215, 183, 257, 891, 892, 787, 2321, 2322, 2323], 1328)
-    femmesh.addVolume([215, 257, 268, 183, 2322, 1117, 2237, 892, 2323, 2239], 1329)
-    femmesh.addVolume([86, 52, 51, 203, 1200, 607, 1197, 2282, 842, 843], 1330)
-    femmesh.addVolume([56, 8, 13, 249, 1207, 733, 801, 2234, 1020, 2303], 1331)
-    femmesh.addVolume([184, 37, 36, 71, 789, 591, 788, 2324, 1168, 1167], 1332)
-    femmesh.addVolume([266, 220, 264, 256, 2325, 2223, 1087, 1108, 2224, 1075], 1333)
-    femmesh.addVolume([52, 87, 53, 196, 1199, 1202, 608, 821, 2326, 820], 1334)
-    femmesh.addVolume([558, 80, 81, 239, 2264, 638, 2263, 2327, 989, 990], 1335)
-    femmesh.addVolume([211, 237, 269, 192, 2220, 1131, 2222, 886, 2328, 2329], 1336)
-    femmesh.addVolume([261, 219, 251, 178, 2330, 2331, 1067, 2255, 927, 2332], 1337)
-    femmesh.addVolume([241, 265, 262, 194, 1080, 1139, 1081, 2333, 2334, 2335], 1338)
-    femmesh.addVolume([188, 248, 249, 259, 2271, 1022, 2235, 2273, 1074, 1049], 1339)
-    femmesh.addVolume([237, 79, 198, 238, 984, 2337, 2336, 988, 986, 2338], 1340)
-    femmesh.addVolume([177, 63, 29, 226, 2339, 1152, 769, 2292, 956, 2340], 1341)
-    femmesh.addVolume([268, 230, 216, 183, 1118, 2228, 2238, 2239, 2341, 893], 1342)
-    femmesh.addVolume([17, 232, 189, 259, 971, 2342, 2295, 1048, 1052, 2294], 1343)
-    femmesh.addVolume([324, 471, 527, 470, 2343, 2056, 2344, 2345, 1878, 2055], 1344)
-    femmesh.addVolume([224, 171, 252, 58, 2346, 2304, 1031, 953, 2347, 1028], 1345)
-    femmesh.addVolume([74, 250, 5, 7, 1050, 2348, 1175, 631, 1024, 568], 1346)
-    femmesh.addVolume([234, 206, 224, 208, 2269, 2268, 1103, 2349, 869, 2350], 1347)
-    femmesh.addVolume([257, 70, 35, 69, 1042, 1165, 2351, 1043, 626, 1164], 1348)
-    femmesh.addVolume([197, 217, 204, 247, 915, 916, 854, 2352, 2353, 2354], 1349)
-    femmesh.addVolume([188, 13, 14, 16, 803, 561, 802, 2300, 734, 735], 1350)
-    femmesh.addVolume([173, 26, 60, 174, 758, 1146, 2355, 762, 760, 2356], 1351)
-    femmesh.addVolume([213, 261, 179, 178, 2357, 2358, 882, 881, 2255, 776], 1352)
-    femmesh.addVolume([68, 34, 69, 229, 1162, 1163, 625, 963, 2359, 962], 1353)
-    femmesh.addVolume([272, 235, 200, 236, 1128, 2318, 2276, 1129, 982, 2281], 1354)
-    femmesh.addVolume([24, 172, 25, 58, 754, 755, 579, 1142, 2360, 1143], 1355)
-    femmesh.addVolume([180, 220, 181, 256, 933, 935, 828, 2226, 2224, 2361], 1356)
-    femmesh.addVolume([219, 193, 273, 260, 923, 2364, 2362, 2363, 2365, 1123], 1357)
-    femmesh.addVolume([169, 250, 18, 40, 2366, 2367, 746, 826, 2368, 745], 1358)
-    femmesh.addVolume([44, 200, 236, 192, 835, 2281, 2261, 813, 858, 2262], 1359)
-    femmesh.addVolume([182, 221, 215, 267, 938, 942, 891, 2369, 2251, 2370], 1360)
-    femmesh.addVolume([32, 67, 228, 180, 1159, 960, 2371, 777, 2218, 2310], 1361)
-    femmesh.addVolume([243, 85, 195, 244, 1002, 2372, 2241, 1006, 1004, 2243], 1362)
-    femmesh.addVolume([224, 171, 58, 172, 2346, 2347, 953, 2373, 756, 2360], 1363)
-    femmesh.addVolume([215, 257, 267, 268, 2322, 1114, 2370, 2237, 1117, 1093], 1364)
-    femmesh.addVolume([257, 182, 69, 35, 2321, 2374, 1043, 2351, 783, 1164], 1365)
-    femmesh.addVolume([54, 89, 55, 197, 1203, 1206, 610, 823, 2313, 822], 1366)
-    femmesh.addVolume([246, 204, 53, 196, 2375, 845, 2266, 2376, 851, 820], 1367)
-    femmesh.addVolume([202, 242, 212, 194, 2377, 2378, 879, 849, 2379, 880], 1368)
-    femmesh.addVolume([85, 195, 244, 51, 2372, 2243, 1004, 1198, 818, 2283], 1369)
-    femmesh.addVolume([67, 228, 180, 256, 960, 2310, 2218, 1041, 1051, 2226], 1370)
-    femmesh.addVolume([266, 221, 181, 229, 2380, 937, 2381, 1107, 2382, 2383], 1371)
-    femmesh.addVolume([34, 182, 69, 229, 782, 2374, 1163, 2359, 2384, 962], 1372)
-    femmesh.addVolume([8, 56, 90, 249, 1207, 1208, 648, 1020, 2234, 1019], 1373)
-    femmesh.addVolume([224, 208, 253, 234, 2350, 2385, 1054, 1103, 2349, 1106], 1374)
-    femmesh.addVolume([242, 262, 212, 194, 1082, 2249, 2378, 2379, 2335, 880], 1375)
-    femmesh.addVolume([177, 30, 251, 178, 770, 2387, 2386, 773, 771, 2332], 1376)
-    femmesh.addVolume([255, 228, 262, 179, 1037, 1068, 1069, 2388, 2389, 2390], 1377)
-    femmesh.addVolume([221, 266, 181, 220, 2380, 2381, 937, 936, 2325, 935], 1378)
-    femmesh.addVolume([32, 228, 179, 180, 2371, 2389, 775, 777, 2310, 779], 1379)
-    femmesh.addVolume([178, 261, 227, 251, 2255, 1066, 2256, 2332, 1067, 1036], 1380)
-    femmesh.addVolume([250, 74, 40, 190, 1050, 1209, 2368, 2391, 2392, 809], 1381)
-    femmesh.addVolume([4, 232, 187, 15, 968, 2289, 2393, 738, 2394, 799], 1382)
-    femmesh.addVolume([255, 178, 227, 31, 2254, 2256, 1055, 2395, 772, 2396], 1383)
-    femmesh.addVolume([273, 558, 240, 239, 2397, 2398, 1125, 1124, 2327, 994], 1384)
-    femmesh.addVolume([4, 15, 187, 2, 738, 799, 2393, 564, 563, 798], 1385)
-    femmesh.addVolume([13, 8, 56, 6, 733, 1207, 801, 560, 559, 612], 1386)
-    femmesh.addVolume([224, 171, 172, 206, 2346, 756, 2373, 2268, 862, 863], 1387)
-    femmesh.addVolume([17, 15, 14, 189, 737, 562, 736, 2295, 804, 805], 1388)
-    femmesh.addVolume([17, 259, 14, 16, 1048, 2293, 736, 566, 1047, 735], 1389)
-    femmesh.addVolume([48, 558, 201, 47, 2399, 2400, 838, 603, 2265, 839], 1390)
-    femmesh.addVolume([239, 193, 238, 260, 2277, 2279, 991, 1078, 2365, 1077], 1391)
-    femmesh.addVolume([28, 176, 29, 62, 766, 767, 583, 1150, 2299, 1151], 1392)
-    femmesh.addVolume([48, 558, 47, 81, 2399, 2265, 603, 1191, 2263, 1188], 1393)
-    femmesh.addVolume([219, 261, 273, 213, 2330, 1137, 2362, 925, 2357, 2401], 1394)
-    femmesh.addVolume([215, 268, 245, 196, 2237, 1091, 2402, 920, 2403, 2244], 1395)
-    femmesh.addVolume([200, 235, 77, 236, 2318, 978, 2280, 2281, 982, 980], 1396)
-    femmesh.addVolume([211, 270, 207, 176, 2221, 2284, 929, 877, 2285, 865], 1397)
-    femmesh.addVolume([79, 46, 238, 80, 1187, 2404, 986, 637, 1186, 987], 1398)
-    femmesh.addVolume([229, 266, 256, 181, 1107, 1108, 1062, 2383, 2381, 2361], 1399)
-    femmesh.addVolume([558, 80, 193, 47, 2264, 2278, 2405, 2265, 1189, 814], 1400)
-    femmesh.addVolume([270, 254, 176, 211, 1105, 2298, 2285, 2221, 2406, 877], 1401)
-    femmesh.addVolume([195, 221, 266, 244, 939, 2380, 2242, 2243, 2250, 1086], 1402)
-    femmesh.addVolume([72, 231, 258, 185, 967, 1059, 1044, 2407, 2307, 2408], 1403)
-    femmesh.addVolume([205, 89, 197, 55, 2311, 2313, 852, 847, 1206, 822], 1404)
-    femmesh.addVolume([79, 46, 198, 238, 1187, 831, 2337, 986, 2404, 2338], 1405)
-    femmesh.addVolume([74, 41, 40, 190, 1177, 596, 1209, 2392, 808, 809], 1406)
-    femmesh.addVolume([218, 188, 248, 205, 919, 2271, 2272, 917, 855, 2312], 1407)
-    femmesh.addVolume([263, 231, 218, 185, 1070, 2259, 2257, 2409, 2307, 899], 1408)
-    femmesh.addVolume([250, 21, 222, 169, 1023, 946, 1046, 2366, 2410, 2411], 1409)
-    femmesh.addVolume([222, 19, 22, 170, 2412, 743, 945, 2413, 748, 2414], 1410)
-    femmesh.addVolume([219, 177, 251, 178, 926, 2386, 2331, 927, 773, 2332], 1411)
-    femmesh.addVolume([45, 78, 237, 192, 1185, 983, 2415, 812, 2260, 2328], 1412)
-    femmesh.addVolume([272, 210, 269, 236, 2274, 2416, 1133, 1129, 2417, 1130], 1413)
-    femmesh.addVolume([30, 177, 63, 29, 770, 2339, 1153, 584, 769, 1152], 1414)
-    femmesh.addVolume([177, 226, 29, 176, 2292, 2340, 769, 827, 2287, 767], 1415)
-    femmesh.addVolume([219, 261, 251, 273, 2330, 1067, 2331, 2362, 1137, 1126], 1416)
-    femmesh.addVolume([242, 83, 49, 84, 998, 1194, 2418, 999, 641, 1193], 1417)
-    femmesh.addVolume([254, 270, 269, 211, 1105, 1136, 1098, 2406, 2221, 2222], 1418)
-    femmesh.addVolume([237, 270, 238, 198, 1122, 1121, 988, 2336, 2419, 2338], 1419)
-    femmesh.addVolume([43, 76, 191, 42, 1181, 2420, 810, 598, 1178, 811], 1420)
-    femmesh.addVolume([169, 19, 222, 170, 747, 2412, 2411, 750, 748, 2413], 1421)
-    femmesh.addVolume([37, 184, 185, 258, 789, 793, 791, 2421, 2422, 2408], 1422)
-    femmesh.addVolume([72, 37, 185, 258, 1169, 791, 2407, 1044, 2421, 2408], 1423)
-    femmesh.addVolume([231, 263, 258, 185, 1070, 1071, 1059, 2307, 2409, 2408], 1424)
-    femmesh.addVolume([184, 37, 71, 258, 789, 1168, 2324, 2422, 2421, 1045], 1425)
-    femmesh.addVolume([72, 231, 185, 38, 967, 2307, 2407, 1170, 2308, 792], 1426)
-    femmesh.addVolume([233, 74, 190, 75, 972, 2392, 2423, 973, 632, 2424], 1427)
-    femmesh.addVolume([180, 228, 264, 256, 2310, 1076, 2225, 2226, 1051, 1075], 1428)
-    femmesh.addVolume([198, 193, 207, 238, 837, 909, 910, 2338, 2279, 2425], 1429)
-    femmesh.addVolume([74, 250, 233, 190, 1050, 1073, 972, 2392, 2391, 2423], 1430)
-    femmesh.addVolume([86, 244, 245, 203, 1005, 1009, 1007, 2282, 2252, 2246], 1431)
-    femmesh.addVolume([180, 220, 264, 212, 933, 2223, 2225, 884, 932, 2248], 1432)
-    femmesh.addVolume([177, 226, 207, 260, 2292, 2286, 866, 2426, 1064, 2427], 1433)
-    femmesh.addVolume([210, 175, 174, 225, 874, 765, 873, 2428, 2429, 2430], 1434)
-    femmesh.addVolume([173, 208, 253, 224, 868, 2385, 2320, 2319, 2350, 1054], 1435)
-    femmesh.addVolume([272, 210, 174, 225, 2274, 873, 2431, 1119, 2428, 2430], 1436)
-    femmesh.addVolume([175, 254, 28, 61, 2432, 2297, 764, 2315, 1035, 1149], 1437)
-    femmesh.addVolume([270, 198, 207, 238, 2419, 910, 2284, 1121, 2338, 2425], 1438)
-    femmesh.addVolume([244, 85, 51, 86, 1004, 1198, 2283, 1005, 643, 1197], 1439)
-    femmesh.addVolume([213, 262, 212, 179, 2433, 2249, 930, 882, 2390, 883], 1440)
-    femmesh.addVolume([228, 180, 212, 179, 2310, 884, 2247, 2389, 779, 883], 1441)
-    femmesh.addVolume([186, 232, 231, 189, 2288, 970, 2306, 902, 2342, 2434], 1442)
-    femmesh.addVolume([268, 246, 216, 271, 1092, 2435, 2238, 1134, 1135, 2230], 1443)
-    femmesh.addVolume([32, 67, 66, 228, 1159, 623, 1158, 2371, 960, 961], 1444)
-    femmesh.addVolume([37, 72, 71, 258, 1169, 628, 1168, 2421, 1044, 1045], 1445)
-    femmesh.addVolume([193, 207, 238, 260, 909, 2425, 2279, 2365, 2427, 1077], 1446)
-    femmesh.addVolume([199, 208, 234, 191, 908, 2349, 2436, 859, 907, 2437], 1447)
-    femmesh.addVolume([87, 52, 86, 245, 1199, 1200, 644, 1008, 2245, 1007], 1448)
-    femmesh.addVolume([246, 204, 271, 247, 2375, 2438, 1135, 1015, 2354, 1113], 1449)
-    femmesh.addVolume([188, 248, 205, 249, 2271, 2312, 855, 2235, 1022, 2236], 1450)
-    femmesh.addVolume([228, 255, 66, 179, 1037, 1038, 961, 2389, 2388, 2296], 1451)
-    femmesh.addVolume([41, 199, 190, 75, 834, 856, 808, 1176, 2439, 2424], 1452)
-    femmesh.addVolume([61, 27, 225, 60, 1148, 2440, 954, 617, 1147, 955], 1453)
-    femmesh.addVolume([232, 186, 231, 73, 2288, 2306, 970, 969, 2290, 966], 1454)
-    femmesh.addVolume([270, 226, 260, 207, 1104, 1064, 1116, 2284, 2286, 2427], 1455)
-    femmesh.addVolume([210, 192, 269, 236, 911, 2329, 2416, 2417, 2262, 1130], 1456)
-    femmesh.addVolume([171, 24, 57, 58, 753, 1141, 2219, 2347, 1142, 614], 1457)
-    femmesh.addVolume([252, 222, 214, 233, 1030, 2442, 2441, 1100, 1096, 2443], 1458)
-    femmesh.addVolume([34, 68, 33, 181, 1162, 1161, 588, 781, 2444, 780], 1459)
-    femmesh.addVolume([19, 21, 222, 22, 740, 946, 2412, 743, 575, 945], 1460)
-    femmesh.addVolume([243, 195, 202, 220, 2241, 857, 2445, 2446, 934, 931], 1461)
-    femmesh.addVolume([26, 174, 27, 60, 760, 761, 581, 1146, 2356, 1147], 1462)
-    femmesh.addVolume([221, 195, 266, 220, 939, 2242, 2380, 936, 934, 2325], 1463)
-    femmesh.addVolume([262, 228, 212, 179, 1068, 2247, 2249, 2390, 2389, 883], 1464)
-    femmesh.addVolume([241, 83, 48, 194, 996, 1192, 2240, 2333, 2447, 817], 1465)
-    femmesh.addVolume([32, 228, 66, 179, 2371, 961, 1158, 775, 2389, 2296], 1466)
-    femmesh.addVolume([226, 63, 29, 62, 956, 1152, 2340, 957, 619, 1151], 1467)
-    femmesh.addVolume([208, 173, 172, 224, 868, 759, 867, 2350, 2319, 2373], 1468)
-    femmesh.addVolume([204, 246, 53, 88, 2375, 2266, 845, 2448, 1011, 1201], 1469)
-    femmesh.addVolume([221, 244, 267, 266, 2250, 1088, 2251, 2380, 1086, 1090], 1470)
-    femmesh.addVolume([67, 180, 33, 256, 2218, 778, 1160, 1041, 2226, 2449], 1471)
-    femmesh.addVolume([252, 222, 223, 170, 1030, 949, 1029, 2305, 2413, 2450], 1472)
-    femmesh.addVolume([242, 202, 49, 194, 2377, 841, 2418, 2379, 849, 816], 1473)
-    femmesh.addVolume([265, 213, 262, 194, 2451, 2433, 1139, 2334, 903, 2335], 1474)
-    femmesh.addVolume([558, 193, 80, 239, 2405, 2278, 2264, 2327, 2277, 989], 1475)
-    femmesh.addVolume([195, 243, 202, 50, 2241, 2445, 857, 819, 2452, 840], 1476)
-    femmesh.addVolume([27, 174, 225, 60, 761, 2430, 2440, 1147, 2356, 955], 1477)
-    femmesh.addVolume([232, 4, 187, 73, 968, 2393, 2289, 969, 630, 2291], 1478)
-    femmesh.addVolume([85, 243, 195, 50, 1002, 2241, 2372, 1195, 2452, 819], 1479)
-    femmesh.addVolume([59, 173, 60, 253, 2301, 2355, 616, 1033, 2320, 1032], 1480)
-    femmesh.addVolume([210, 175, 225, 269, 874, 2429, 2428, 2416, 2453, 1099], 1481)
-    femmesh.addVolume([265, 213, 194, 201, 2451, 903, 2334, 2231, 904, 861], 1482)
-    femmesh.addVolume([169, 233, 190, 214, 2454, 2423, 825, 888, 2443, 887], 1483)
-    femmesh.addVolume([237, 78, 236, 192, 983, 981, 985, 2328, 2260, 2262], 1484)
-    femmesh.addVolume([52, 87, 196, 245, 1199, 2326, 821, 2245, 1008, 2244], 1485)
-    femmesh.addVolume([173, 209, 174, 253, 870, 871, 762, 2320, 2455, 2456], 1486)
-    femmesh.addVolume([169, 250, 40, 190, 2366, 2368, 826, 825, 2391, 809], 1487)
-    femmesh.addVolume([76, 191, 234, 235, 2420, 2437, 975, 977, 2317, 979], 1488)
-    femmesh.addVolume([268, 215, 216, 196, 2237, 895, 2238, 2403, 920, 914], 1489)
-    femmesh.addVolume([208, 173, 253, 209, 868, 2320, 2385, 872, 870, 2455], 1490)
-    femmesh.addVolume([23, 20, 223, 1, 751, 2458, 2457, 577, 572, 2459], 1491)
-    femmesh.addVolume([41, 199, 75, 42, 834, 2439, 1176, 597, 833, 1179], 1492)
-    femmesh.addVolume([45, 46, 198, 79, 601, 831, 829, 1184, 1187, 2337], 1493)
-    femmesh.addVolume([270, 211, 207, 198, 2221, 929, 2284, 2419, 885, 910], 1494)
-    femmesh.addVolume([3, 57, 223, 1, 613, 950, 947, 573, 1140, 2459], 1495)
-    femmesh.addVolume([193, 46, 47, 80, 815, 602, 814, 2278, 1186, 1189], 1496)
-    femmesh.addVolume([253, 272, 174, 225, 1120, 2431, 2456, 1060, 1119, 2430], 1497)
-    femmesh.addVolume([175, 61, 27, 225, 2315, 1148, 763, 2429, 954, 2440], 1498)
-    femmesh.addVolume([266, 221, 229, 267, 2380, 2382, 1107, 1090, 2251, 1115], 1499)
-    femmesh.addVolume([263, 197, 217, 218, 2460, 915, 2461, 2257, 918, 901], 1500)
-    femmesh.addVolume([72, 231, 38, 73, 967, 2308, 1170, 629, 966, 1171], 1501)
-    femmesh.addVolume([220, 266, 181, 256, 2325, 2381, 935, 2224, 1108, 2361], 1502)
-    femmesh.addVolume([217, 184, 258, 185, 896, 2422, 2462, 897, 793, 2408], 1503)
-    femmesh.addVolume([186, 39, 73, 187, 795, 1174, 2290, 800, 797, 2291], 1504)
-    femmesh.addVolume([210, 200, 192, 236, 912, 858, 911, 2417, 2281, 2262], 1505)
-    femmesh.addVolume([202, 243, 264, 242, 2445, 1084, 2463, 2377, 1003, 1083], 1506)
-    femmesh.addVolume([33, 180, 181, 256, 778, 828, 780, 2449, 2226, 2361], 1507)
-    femmesh.addVolume([210, 272, 200, 236, 2274, 2276, 912, 2417, 1129, 2281], 1508)
-    femmesh.addVolume([268, 215, 245, 267, 2237, 2402, 1091, 1093, 2370, 1089], 1509)
-    femmesh.addVolume([76, 43, 235, 77, 1181, 2316, 977, 634, 1180, 978], 1510)
-    femmesh.addVolume([22, 19, 20, 170, 743, 571, 742, 2414, 748, 749], 1511)
-    femmesh.addVolume([558, 193, 201, 47, 2405, 848, 2400, 2265, 814, 839], 1512)
-    femmesh.addVolume([175, 254, 225, 269, 2432, 1053, 2429, 2453, 1098, 1099], 1513)
-    femmesh.addVolume([270, 237, 211, 198, 1122, 2220, 2221, 2419, 2336, 885], 1514)
-    femmesh.addVolume([259, 188, 14, 16, 2273, 802, 2293, 1047, 2300, 735], 1515)
-    femmesh.addVolume([321, 98, 275, 366, 1350, 1221, 1392, 2464, 1566, 2465], 1516)
-    femmesh.addVolume([246, 87, 245, 196, 1010, 1008, 1012, 2376, 2326, 2244], 1517)
-    femmesh.addVolume([188, 56, 13, 249, 824, 801, 803, 2235, 2234, 2303], 1518)
-    femmesh.addVolume([18, 250, 5, 40, 2367, 2348, 569, 745, 2368, 595], 1519)
-    femmesh.addVolume([246, 204, 247, 88, 2375, 2354, 1015, 1011, 2448, 1013], 1520)
-    femmesh.addVolume([192, 237, 269, 236, 2328, 1131, 2329, 2262, 985, 1130], 1521)
-    femmesh.addVolume([241, 265, 194, 201, 1080, 2334, 2333, 2232, 2231, 861], 1522)
-    femmesh.addVolume([21, 250, 18, 169, 1023, 2367, 741, 2410, 2366, 746], 1523)
-    femmesh.addVolume([169, 222, 214, 170, 2411, 2442, 888, 750, 2413, 889], 1524)
-    femmesh.addVolume([207, 270, 238, 260, 2284, 1121, 2425, 2427, 1116, 1077], 1525)
-    femmesh.addVolume([19, 21, 18, 169, 740, 741, 570, 747, 2410, 746], 1526)
-    femmesh.addVolume([7, 250, 5, 18, 1024, 2348, 568, 739, 2367, 569], 1527)
-    femmesh.addVolume([252, 233, 214, 234, 1100, 2443, 2441, 1102, 976, 2466], 1528)
-    femmesh.addVolume([87, 246, 53, 196, 1010, 2266, 1202, 2326, 2376, 820], 1529)
-    femmesh.addVolume([176, 226, 29, 62, 2287, 2340, 767, 2299, 957, 1151], 1530)
-    femmesh.addVolume([273, 558, 201, 240, 2397, 2400, 2467, 1125, 2398, 2233], 1531)
-    femmesh.addVolume([175, 254, 269, 211, 2432, 1098, 2453, 876, 2406, 2222], 1532)
-    femmesh.addVolume([68, 34, 229, 181, 1162, 2359, 963, 2444, 781, 2383], 1533)
-    femmesh.addVolume([30, 64, 251, 227, 1154, 1027, 2387, 2468, 959, 1036], 1534)
-    femmesh.addVolume([78, 45, 44, 192, 1185, 600, 1182, 2260, 812, 813], 1535)
-    femmesh.addVolume([208, 191, 209, 235, 907, 906, 872, 2469, 2317, 2470], 1536)
-    femmesh.addVolume([191, 208, 234, 235, 907, 2349, 2437, 2317, 2469, 979], 1537)
-    femmesh.addVolume([197, 263, 247, 248, 2460, 1094, 2352, 2314, 1095, 1018], 1538)
-    femmesh.addVolume([255, 178, 179, 261, 2254, 776, 2388, 1065, 2255, 2358], 1539)
-    femmesh.addVolume([266, 243, 264, 220, 1085, 1084, 1087, 2325, 2446, 2223], 1540)
-    femmesh.addVolume([89, 197, 247, 248, 2313, 2352, 1014, 1016, 2314, 1018], 1541)
-    femmesh.addVolume([199, 208, 206, 234, 908, 869, 943, 2436, 2349, 2269], 1542)
-    femmesh.addVolume([250, 74, 5, 40, 1050, 1175, 2348, 2368, 1209, 595], 1543)
-    femmesh.addVolume([250, 21, 18, 7, 1023, 741, 2367, 1024, 574, 739], 1544)
-    femmesh.addVolume([206, 252, 214, 234, 2270, 2441, 944, 2269, 1102, 2466], 1545)
-    femmesh.addVolume([217, 263, 271, 247, 2461, 1110, 2471, 2353, 1094, 1113], 1546)
-    femmesh.addVolume([241, 48, 240, 201, 2240, 2472, 997, 2232, 838, 2233], 1547)
-    femmesh.addVolume([184, 217, 271, 216, 896, 2471, 2229, 894, 898, 2230], 1548)
-    femmesh.addVolume([48, 81, 82, 240, 1191, 639, 1190, 2472, 992, 993], 1549)
-    femmesh.addVolume([268, 230, 271, 216, 1118, 1112, 1134, 2238, 2228, 2230], 1550)
-    femmesh.addVolume([90, 56, 205, 249, 1208, 846, 2267, 1019, 2234, 2236], 1551)
-    femmesh.addVolume([248, 90, 205, 249, 1017, 2267, 2312, 1022, 1019, 2236], 1552)
-    femmesh.addVolume([204, 217, 271, 247, 916, 2471, 2438, 2354, 2353, 1113], 1553)
-    femmesh.addVolume([254, 175, 176, 211, 2432, 768, 2298, 2406, 876, 877], 1554)
-    femmesh.addVolume([48, 83, 49, 194, 1192, 1194, 604, 817, 2447, 816], 1555)
-    femmesh.addVolume([248, 218, 197, 263, 2272, 918, 2314, 1095, 2257, 2460], 1556)
-    femmesh.addVolume([215, 221, 203, 267, 942, 941, 921, 2370, 2251, 2253], 1557)
-    femmesh.addVolume([222, 169, 214, 233, 2411, 888, 2442, 1096, 2454, 2443], 1558)
-    femmesh.addVolume([250, 169, 233, 190, 2366, 2454, 1073, 2391, 825, 2423], 1559)
-    femmesh.addVolume([28, 254, 62, 61, 2297, 1034, 1150, 1149, 1035, 618], 1560)
-    femmesh.addVolume([233, 199, 234, 75, 2473, 2436, 976, 973, 2439, 974], 1561)
-    femmesh.addVolume([232, 17, 189, 15, 971, 2295, 2342, 2394, 737, 804], 1562)
-    femmesh.addVolume([259, 189, 218, 231, 2294, 940, 2258, 1072, 2434, 2259], 1563)
-    femmesh.addVolume([189, 186, 218, 231, 902, 900, 940, 2434, 2306, 2259], 1564)
-    femmesh.addVolume([254, 175, 28, 176, 2432, 764, 2297, 2298, 768, 766], 1565)
-    femmesh.addVolume([37, 72, 185, 38, 1169, 2407, 791, 592, 1170, 792], 1566)
-    femmesh.addVolume([78, 45, 237, 79, 1185, 2415, 983, 636, 1184, 984], 1567)
-    femmesh.addVolume([186, 232, 189, 187, 2288, 2342, 902, 800, 2289, 807], 1568)
-    femmesh.addVolume([199, 76, 42, 191, 2474, 1178, 833, 859, 2420, 811], 1569)
-    femmesh.addVolume([193, 46, 80, 238, 815, 1186, 2278, 2279, 2404, 987], 1570)
-    femmesh.addVolume([204, 217, 216, 271, 916, 898, 913, 2438, 2471, 2230], 1571)
-    femmesh.addVolume([217, 263, 258, 271, 2461, 1071, 2462, 2471, 1110, 1111], 1572)
-    femmesh.addVolume([74, 41, 190, 75, 1177, 808, 2392, 632, 1176, 2424], 1573)
-    femmesh.addVolume([224, 171, 206, 252, 2346, 862, 2268, 1031, 2304, 2270], 1574)
-    femmesh.addVolume([199, 233, 214, 190, 2473, 2443, 890, 856, 2423, 887], 1575)
-    femmesh.addVolume([211, 237, 192, 198, 2220, 2328, 886, 885, 2336, 830], 1576)
-    femmesh.addVolume([237, 45, 192, 198, 2415, 812, 2328, 2336, 829, 830], 1577)
-    femmesh.addVolume([85, 195, 51, 50, 2372, 818, 1198, 1195, 819, 606], 1578)
-    femmesh.addVolume([272, 235, 209, 200, 1128, 2470, 2275, 2276, 2318, 905], 1579)
-    femmesh.addVolume([232, 259, 231, 189, 1052, 1072, 970, 2342, 2294, 2434], 1580)
-    femmesh.addVolume([48, 241, 194, 201, 2240, 2333, 817, 838, 2232, 861], 1581)
-    femmesh.addVolume([202, 220, 212, 264, 931, 932, 879, 2463, 2223, 2248], 1582)
-    femmesh.addVolume([241, 48, 82, 240, 2240, 1190, 995, 997, 2472, 993], 1583)
-    femmesh.addVolume([30, 177, 251, 63, 770, 2386, 2387, 1153, 2339, 1025], 1584)
-    femmesh.addVolume([235, 191, 209, 200, 2317, 906, 2470, 2318, 860, 905], 1585)
-    femmesh.addVolume([263, 217, 258, 185, 2461, 2462, 1071, 2409, 897, 2408], 1586)
-    femmesh.addVolume([199, 233, 190, 75, 2473, 2423, 856, 2439, 973, 2424], 1587)
-    femmesh.addVolume([171, 57, 223, 58, 2219, 950, 2475, 2347, 614, 951], 1588)
-    femmesh.addVolume([219, 213, 273, 201, 925, 2401, 2362, 922, 904, 2467], 1589)
-    femmesh.addVolume([257, 230, 268, 183, 1058, 1118, 1117, 2323, 2341, 2239], 1590)
-    femmesh.addVolume([221, 195, 203, 244, 939, 850, 941, 2250, 2243, 2252], 1591)
-    femmesh.addVolume([199, 76, 191, 234, 2474, 2420, 859, 2436, 975, 2437], 1592)
-    femmesh.addVolume([204, 54, 247, 88, 844, 2476, 2354, 2448, 1204, 1013], 1593)
-    femmesh.addVolume([221, 182, 229, 267, 938, 2384, 2382, 2251, 2369, 1115], 1594)
-    femmesh.addVolume([182, 34, 69, 35, 782, 1163, 2374, 783, 589, 1164], 1595)
-    femmesh.addVolume([22, 20, 223, 170, 742, 2458, 948, 2414, 749, 2450], 1596)
-    femmesh.addVolume([219, 251, 260, 273, 2331, 1063, 2363, 2362, 1126, 1123], 1597)
-    femmesh.addVolume([199, 76, 234, 75, 2474, 975, 2436, 2439, 633, 974], 1598)
-    femmesh.addVolume([226, 254, 176, 270, 1061, 2298, 2287, 1104, 1105, 2285], 1599)
-    femmesh.addVolume([193, 219, 207, 260, 923, 924, 909, 2365, 2363, 2427], 1600)
-    femmesh.addVolume([68, 229, 256, 181, 963, 1062, 1040, 2444, 2383, 2361], 1601)
-    femmesh.addVolume([177, 63, 226, 251, 2339, 956, 2292, 2386, 1025, 1026], 1602)
-    femmesh.addVolume([197, 263, 217, 247, 2460, 2461, 915, 2352, 1094, 2353], 1603)
-    femmesh.addVolume([22, 222, 170, 223, 945, 2413, 2414, 948, 949, 2450], 1604)
-    femmesh.addVolume([54, 204, 53, 88, 844, 845, 609, 1204, 2448, 1201], 1605)
-    femmesh.addVolume([188, 259, 189, 218, 2273, 2294, 806, 919, 2258, 940], 1606)
-    femmesh.addVolume([30, 63, 251, 64, 1153, 1025, 2387, 1154, 620, 1027], 1607)
-    femmesh.addVolume([196, 215, 203, 245, 920, 921, 853, 2244, 2402, 2246], 1608)
-    femmesh.addVolume([246, 204, 216, 271, 2375, 913, 2435, 1135, 2438, 2230], 1609)
-    femmesh.addVolume([204, 246, 216, 196, 2375, 2435, 913, 851, 2376, 914], 1610)
-    femmesh.addVolume([89, 54, 247, 197, 1203, 2476, 1014, 2313, 823, 2352], 1611)
-    femmesh.addVolume([177, 219, 251, 260, 926, 2331, 2386, 2426, 2363, 1063], 1612)
-    femmesh.addVolume([272, 210, 225, 269, 2274, 2428, 1119, 1133, 2416, 1099], 1613)
-    femmesh.addVolume([265, 240, 273, 201, 1079, 1125, 1132, 2231, 2233, 2467], 1614)
-    femmesh.addVolume([31, 30, 227, 64, 585, 2468, 2396, 1155, 1154, 959], 1615)
-    femmesh.addVolume([43, 200, 77, 44, 836, 2280, 1180, 599, 835, 1183], 1616)
-    femmesh.addVolume([231, 186, 38, 73, 2306, 794, 2308, 966, 2290, 1171], 1617)
-    femmesh.addVolume([50, 202, 49, 84, 840, 841, 605, 1196, 2477, 1193], 1618)
-    femmesh.addVolume([46, 193, 198, 238, 815, 837, 831, 2404, 2279, 2338], 1619)
-    femmesh.addVolume([210, 211, 269, 192, 878, 2222, 2416, 911, 886, 2329], 1620)
-    femmesh.addVolume([219, 177, 207, 260, 926, 866, 924, 2363, 2426, 2427], 1621)
-    femmesh.addVolume([254, 175, 225, 61, 2432, 2429, 1053, 1035, 2315, 954], 1622)
-    femmesh.addVolume([182, 221, 229, 181, 938, 2382, 2384, 784, 937, 2383], 1623)
-    femmesh.addVolume([217, 263, 218, 185, 2461, 2257, 901, 897, 2409, 899], 1624)
-    femmesh.addVolume([4, 2, 187, 73, 564, 798, 2393, 630, 1172, 2291], 1625)
-    femmesh.addVolume([2, 39, 187, 73, 594, 797, 798, 1172, 1174, 2291], 1626)
-    femmesh.addVolume([83, 242, 49, 194, 998, 2418, 1194, 2447, 2379, 816], 1627)
-    femmesh.addVolume([208, 235, 253, 234, 2469, 1127, 2385, 2349, 979, 1106], 1628)
-    femmesh.addVolume([208, 235, 209, 253, 2469, 2470, 872, 2385, 1127, 2455], 1629)
-    femmesh.addVolume([235, 272, 209, 253, 1128, 2275, 2470, 1127, 1120, 2455], 1630)
-    femmesh.addVolume([243, 202, 264, 220, 2445, 2463, 1084, 2446, 931, 2223], 1631)
-    femmesh.addVolume([202, 242, 49, 84, 2377, 2418, 841, 2477, 999, 1193], 1632)
-    femmesh.addVolume([261, 265, 273, 213, 1138, 1132, 1137, 2357, 2451, 2401], 1633)
-    femmesh.addVolume([202, 243, 242, 84, 2445, 1003, 2377, 2477, 1001, 999], 1634)
-    femmesh.addVolume([262, 213, 212, 194, 2433, 930, 2249, 2335, 903, 880], 1635)
-    femmesh.addVolume([255, 178, 31, 179, 2254, 772, 2395, 2388, 776, 774], 1636)
-    femmesh.addVolume([237, 45, 198, 79, 2415, 829, 2336, 984, 1184, 2337], 1637)
-    femmesh.addVolume([50, 243, 202, 84, 2452, 2445, 840, 1196, 1001, 2477], 1638)
-    femmesh.addVolume([171, 23, 223, 57, 752, 2457, 2475, 2219, 1173, 950], 1639)
-    femmesh.addVolume([253, 174, 60, 225, 2456, 2356, 1032, 1060, 2430, 955], 1640)
-    femmesh.addVolume([174, 175, 27, 225, 765, 763, 761, 2430, 2429, 2440], 1641)
-    femmesh.addVolume([213, 265, 273, 201, 2451, 1132, 2401, 904, 2231, 2467], 1642)
-    femmesh.addVolume([226, 254, 62, 176, 1061, 1034, 957, 2287, 2298, 2299], 1643)
-    femmesh.addVolume([232, 15, 189, 187, 2394, 804, 2342, 2289, 799, 807], 1644)
-    femmesh.addVolume([232, 17, 15, 4, 971, 737, 2394, 968, 567, 738], 1645)
-    femmesh.addVolume([253, 173, 60, 174, 2320, 2355, 1032, 2456, 762, 2356], 1646)
-    femmesh.addVolume([231, 186, 218, 185, 2306, 900, 2259, 2307, 796, 899], 1647)
-    femmesh.addVolume([172, 59, 25, 58, 2302, 1144, 755, 2360, 615, 1143], 1648)
-    femmesh.addVolume([171, 24, 58, 172, 753, 1142, 2347, 756, 754, 2360], 1649)
-    femmesh.addVolume([252, 171, 223, 58, 2304, 2475, 1029, 1028, 2347, 951], 1650)
-    femmesh.addVolume([26, 173, 60, 59, 758, 2355, 1146, 1145, 2301, 616], 1651)
-    femmesh.addVolume([206, 208, 172, 224, 869, 867, 863, 2268, 2350, 2373], 1652)
-    femmesh.addVolume([59, 173, 224, 172, 2301, 2319, 952, 2302, 759, 2373], 1653)
-    femmesh.addVolume([59, 224, 58, 172, 952, 953, 615, 2302, 2373, 2360], 1654)
-    femmesh.addVolume([523, 467, 466, 327, 2044, 1866, 2043, 2478, 2479, 2480], 1655)
-    femmesh.addVolume([173, 26, 25, 59, 758, 580, 757, 2301, 1145, 1144], 1656)
-    femmesh.addVolume([186, 39, 38, 73, 795, 593, 794, 2290, 1174, 1171], 1657)
-    femmesh.addVolume([230, 184, 258, 271, 2227, 2422, 1057, 1112, 2229, 1111], 1658)
-    femmesh.addVolume([230, 184, 71, 258, 2227, 2324, 964, 1057, 2422, 1045], 1659)
-    femmesh.addVolume([230, 184, 36, 71, 2227, 788, 2481, 964, 2324, 1167], 1660)
-    femmesh.addVolume([35, 70, 183, 36, 1165, 2482, 785, 590, 1166, 786], 1661)
-    femmesh.addVolume([246, 268, 216, 196, 1092, 2238, 2435, 2376, 2403, 914], 1662)
-    femmesh.addVolume([230, 184, 183, 36, 2227, 790, 2341, 2481, 788, 786], 1663)
-    femmesh.addVolume([20, 3, 223, 1, 744, 947, 2458, 572, 573, 2459], 1664)
-    femmesh.addVolume([242, 264, 212, 262, 1083, 2248, 2378, 1082, 1109, 2249], 1665)
-    femmesh.addVolume([85, 243, 50, 84, 1002, 2452, 1195, 642, 1001, 1196], 1666)
-    femmesh.addVolume([255, 65, 66, 31, 1039, 622, 1038, 2395, 1156, 1157], 1667)
-    femmesh.addVolume([169, 250, 233, 222, 2366, 1073, 2454, 2411, 1046, 1096], 1668)
-    femmesh.addVolume([70, 230, 183, 36, 965, 2341, 2482, 1166, 2481, 786], 1669)
-    femmesh.addVolume([242, 202, 212, 264, 2377, 879, 2378, 1083, 2463, 2248], 1670)
-    femmesh.addVolume([199, 76, 75, 42, 2474, 633, 2439, 833, 1178, 1179], 1671)
-    femmesh.addVolume([171, 252, 223, 170, 2304, 1029, 2475, 864, 2305, 2450], 1672)
-    femmesh.addVolume([23, 171, 223, 170, 752, 2475, 2457, 832, 864, 2450], 1673)
-    femmesh.addVolume([184, 217, 258, 271, 896, 2462, 2422, 2229, 2471, 1111], 1674)
-    femmesh.addVolume([70, 257, 35, 183, 1042, 2351, 1165, 2482, 2323, 785], 1675)
-    femmesh.addVolume([70, 230, 36, 71, 965, 2481, 1166, 627, 964, 1167], 1676)
-    femmesh.addVolume([230, 184, 216, 183, 2227, 894, 2228, 2341, 790, 893], 1677)
-    femmesh.addVolume([182, 215, 257, 267, 891, 2322, 2321, 2369, 2370, 1114], 1678)
-    femmesh.addVolume([242, 241, 262, 194, 1000, 1081, 1082, 2379, 2333, 2335], 1679)
-    femmesh.addVolume([48, 558, 81, 240, 2399, 2263, 1191, 2472, 2398, 992], 1680)
-    femmesh.addVolume([197, 54, 247, 204, 823, 2476, 2352, 854, 844, 2354], 1681)
-    femmesh.addVolume([68, 33, 181, 256, 1161, 780, 2444, 1040, 2449, 2361], 1682)
-    femmesh.addVolume([54, 89, 247, 88, 1203, 1014, 2476, 1204, 646, 1013], 1683)
-    femmesh.addVolume([21, 19, 222, 169, 740, 2412, 946, 2410, 747, 2411], 1684)
-    femmesh.addVolume([20, 23, 223, 170, 751, 2457, 2458, 749, 832, 2450], 1685)
-    femmesh.addVolume([252, 206, 214, 170, 2270, 944, 2441, 2305, 928, 889], 1686)
-    femmesh.addVolume([273, 558, 239, 193, 2397, 2327, 1124, 2364, 2405, 2277], 1687)
-    femmesh.addVolume([193, 219, 273, 201, 923, 2362, 2364, 848, 922, 2467], 1688)
-    femmesh.addVolume([68, 67, 33, 256, 624, 1160, 1161, 1040, 1041, 2449], 1689)
-    femmesh.addVolume([83, 241, 242, 194, 996, 1000, 998, 2447, 2333, 2379], 1690)
-    femmesh.addVolume([20, 22, 223, 3, 742, 948, 2458, 744, 576, 947], 1691)
-    femmesh.addVolume([244, 203, 267, 245, 2252, 2253, 1088, 1009, 2246, 1089], 1692)
-    femmesh.addVolume([203, 215, 267, 245, 921, 2370, 2253, 2246, 2402, 1089], 1693)
-    femmesh.addVolume([182, 257, 229, 267, 2321, 1056, 2384, 2369, 1114, 1115], 1694)
-    femmesh.addVolume([199, 206, 214, 234, 943, 944, 890, 2436, 2269, 2466], 1695)
-    femmesh.addVolume([248, 218, 263, 259, 2272, 2257, 1095, 1074, 2258, 1097], 1696)
-    femmesh.addVolume([265, 261, 262, 213, 1138, 1101, 1139, 2451, 2357, 2433], 1697)
-    femmesh.addVolume([226, 177, 251, 260, 2292, 2386, 1026, 1064, 2426, 1063], 1698)
-    femmesh.addVolume([219, 261, 213, 178, 2330, 2357, 925, 927, 2255, 881], 1699)
-    femmesh.addVolume([178, 30, 251, 227, 771, 2387, 2332, 2256, 2468, 1036], 1700)
-    femmesh.addVolume([127, 302, 303, 385, 1302, 1306, 1304, 1613, 2483, 2484], 1701)
-    femmesh.addVolume([193, 239, 273, 260, 2277, 1124, 2364, 2365, 1078, 1123], 1702)
-    femmesh.addVolume([384, 300, 433, 454, 2485, 2486, 1769, 1825, 2487, 1824], 1703)
-    femmesh.addVolume([336, 420, 419, 162, 2488, 1717, 2489, 1390, 1715, 1713], 1704)
-    femmesh.addVolume([248, 218, 205, 197, 2272, 917, 2312, 2314, 918, 852], 1705)
-    femmesh.addVolume([34, 182, 229, 181, 782, 2384, 2359, 781, 784, 2383], 1706)
-    femmesh.addVolume([261, 255, 262, 179, 1065, 1069, 1101, 2358, 2388, 2390], 1707)
-    femmesh.addVolume([213, 261, 262, 179, 2357, 1101, 2433, 882, 2358, 2390], 1708)
-    femmesh.addVolume([43, 235, 77, 200, 2316, 978, 1180, 836, 2318, 2280], 1709)
-    femmesh.addVolume([233, 199, 214, 234, 2473, 890, 2443, 976, 2436, 2466], 1710)
-    femmesh.addVolume([182, 257, 69, 229, 2321, 1043, 2374, 2384, 1056, 962], 1711)
-    femmesh.addVolume([57, 23, 223, 1, 1173, 2457, 950, 1140, 577, 2459], 1712)
-    femmesh.addVolume([43, 76, 235, 191, 1181, 977, 2316, 810, 2420, 2317], 1713)
-    femmesh.addVolume([210, 175, 269, 211, 874, 2453, 2416, 878, 876, 2222], 1714)
-    femmesh.addVolume([222, 252, 214, 170, 1030, 2441, 2442, 2413, 2305, 889], 1715)
-    femmesh.addVolume([209, 272, 174, 253, 2275, 2431, 871, 2455, 1120, 2456], 1716)
-    femmesh.addVolume([210, 272, 174, 209, 2274, 2431, 873, 875, 2275, 871], 1717)
-    femmesh.addVolume([239, 81, 558, 240, 990, 2263, 2327, 994, 992, 2398], 1718)
-    femmesh.addVolume([178, 30, 227, 31, 771, 2468, 2256, 772, 585, 2396], 1719)
-    femmesh.addVolume([65, 31, 227, 64, 1156, 2396, 958, 621, 1155, 959], 1720)
-    femmesh.addVolume([255, 66, 179, 31, 1038, 2296, 2388, 2395, 1157, 774], 1721)
-    femmesh.addVolume([195, 243, 266, 220, 2241, 1085, 2242, 934, 2446, 2325], 1722)
-    femmesh.addVolume([230, 70, 183, 257, 965, 2482, 2341, 1058, 1042, 2323], 1723)
-    femmesh.addVolume([257, 182, 35, 183, 2321, 783, 2351, 2323, 787, 785], 1724)
-    femmesh.addVolume([255, 65, 31, 227, 1039, 1156, 2395, 1055, 958, 2396], 1725)
-    femmesh.addVolume([268, 246, 245, 196, 1092, 1012, 1091, 2403, 2376, 2244], 1726)
-    femmesh.addVolume([306, 91, 132, 437, 1315, 1314, 1318, 2490, 2491, 1758], 1727)
-    femmesh.addVolume([122, 298, 123, 383, 1289, 1290, 684, 1610, 2492, 1609], 1728)
-    femmesh.addVolume([307, 134, 135, 392, 1321, 697, 1320, 2493, 1631, 1632], 1729)
-    femmesh.addVolume([353, 452, 296, 509, 2494, 2496, 1461, 2495, 2004, 2497], 1730)
-    femmesh.addVolume([302, 358, 520, 498, 1477, 2500, 2498, 2499, 2501, 2035], 1731)
-    femmesh.addVolume([93, 91, 388, 437, 1210, 2502, 1623, 1621, 2491, 1852], 1732)
-    femmesh.addVolume([100, 97, 10, 92, 1586, 657, 661, 1223, 1211, 651], 1733)
-    femmesh.addVolume([486, 357, 542, 543, 2503, 2504, 2101, 2103, 2505, 2105], 1734)
-    femmesh.addVolume([91, 306, 388, 437, 1315, 2506, 2502, 2491, 2490, 1852], 1735)
-    femmesh.addVolume([357, 555, 542, 543, 2507, 2172, 2504, 2505, 2217, 2105], 1736)
-    femmesh.addVolume([471, 324, 399, 470, 2343, 2508, 1876, 1878, 2345, 1874], 1737)
-    femmesh.addVolume([551, 445, 343, 502, 2132, 2510, 2509, 2138, 1988, 2511], 1738)
-    femmesh.addVolume([156, 413, 414, 318, 1695, 1699, 1697, 1343, 2512, 2513], 1739)
-    femmesh.addVolume([471, 324, 527, 344, 2343, 2344, 2056, 2514, 1544, 2515], 1740)
-    femmesh.addVolume([289, 288, 448, 378, 1264, 2518, 2516, 2517, 2519, 1813], 1741)
-    femmesh.addVolume([321, 368, 367, 366, 2520, 1575, 2521, 2464, 2522, 2523], 1742)
-    femmesh.addVolume([385, 126, 301, 433, 1614, 1299, 2524, 1778, 1747, 2525], 1743)
-    femmesh.addVolume([504, 500, 439, 363, 2121, 2120, 2030, 2526, 2527, 2528], 1744)
-    femmesh.addVolume([288, 112, 378, 113, 1259, 1600, 2519, 1260, 674, 1599], 1745)
-    femmesh.addVolume([284, 376, 285, 109, 2529, 2530, 1252, 1248, 1595, 1250], 1746)
-    femmesh.addVolume([499, 515, 360, 547, 2018, 2532, 2531, 2117, 2150, 2533], 1747)
-    femmesh.addVolume([369, 439, 370, 275, 1789, 1790, 1581, 2534, 2535, 2536], 1748)
-    femmesh.addVolume([464, 339, 519, 521, 2537, 2538, 2033, 2037, 2539, 2039], 1749)
-    femmesh.addVolume([284, 445, 285, 376, 2540, 2541, 1252, 2529, 1806, 2530], 1750)
-    femmesh.addVolume([335, 545, 360, 359, 2542, 2543, 1534, 1523, 2544, 1484], 1751)
-    femmesh.addVolume([296, 452, 495, 509, 2496, 1985, 2545, 2497, 2004, 2005], 1752)
-    femmesh.addVolume([450, 494, 293, 429, 1979, 2547, 2546, 1816, 1953, 2548], 1753)
-    femmesh.addVolume([357, 300, 454, 301, 1473, 2487, 2549, 1474, 1300, 2550], 1754)
-    femmesh.addVolume([365, 530, 473, 312, 2551, 2064, 2552, 1558, 2553, 2554], 1755)
-    femmesh.addVolume([133, 134, 322, 391, 696, 1361, 1352, 1628, 1629, 2555], 1756)
-    femmesh.addVolume([511, 340, 282, 341, 2556, 1423, 2557, 2558, 1426, 1424], 1757)
-    femmesh.addVolume([383, 122, 297, 431, 1610, 1287, 2559, 1776, 1743, 2560], 1758)
-    femmesh.addVolume([452, 353, 296, 297, 2494, 1461, 2496, 2561, 1462, 1288], 1759)
-    femmesh.addVolume([342, 325, 469, 525, 1499, 2564, 2562, 2563, 2565, 2050], 1760)
-    femmesh.addVolume([148, 314, 329, 406, 1335, 1410, 1376, 1673, 2566, 2567], 1761)
-    femmesh.addVolume([101, 277, 102, 421, 1226, 1227, 663, 1721, 2568, 1723], 1762)
-    femmesh.addVolume([12, 163, 164, 98, 726, 1570, 727, 658, 1219, 1561], 1763)
-    femmesh.addVolume([442, 278, 458, 506, 2569, 2570, 1942, 1999, 2571, 2031], 1764)
-    femmesh.addVolume([289, 288, 345, 448, 1264, 1438, 1439, 2516, 2518, 2572], 1765)
-    femmesh.addVolume([391, 463, 322, 501, 1853, 2573, 2555, 1973, 1980, 2574], 1766)
-    femmesh.addVolume([299, 497, 300, 384, 2575, 2577, 1297, 2576, 1958, 2485], 1767)
-    femmesh.addVolume([505, 354, 539, 510, 2578, 2579, 2159, 2008, 2580, 2160], 1768)
-    femmesh.addVolume([485, 486, 318, 542, 1923, 2582, 2581, 2100, 2101, 2583], 1769)
-    femmesh.addVolume([441, 306, 491, 435, 2584, 2585, 1939, 1797, 2586, 1937], 1770)
-    femmesh.addVolume([486, 357, 318, 542, 2503, 1520, 2582, 2101, 2504, 2583], 1771)
-    femmesh.addVolume([281, 364, 553, 443, 1551, 2589, 2587, 2588, 2590, 2137], 1772)
-    femmesh.addVolume([364, 281, 553, 340, 1551, 2587, 2589, 1538, 1422, 2591], 1773)
-    femmesh.addVolume([412, 155, 333, 413, 1692, 1385, 2592, 1696, 1694, 2593], 1774)
-    femmesh.addVolume([155, 156, 333, 413, 718, 1384, 1385, 1694, 1695, 2593], 1775)
-    femmesh.addVolume([288, 556, 345, 448, 2594, 2595, 1438, 2518, 2153, 2572], 1776)
-    femmesh.addVolume([340, 511, 492, 553, 2556, 2010, 2596, 2591, 2145, 2136], 1777)
-    femmesh.addVolume([325, 309, 468, 341, 1363, 2598, 2597, 1492, 1493, 2599], 1778)
-    femmesh.addVolume([320, 335, 489, 360, 1402, 2601, 2600, 1533, 1534, 2602], 1779)
-    femmesh.addVolume([410, 331, 481, 316, 2603, 2605, 1907, 2604, 1411, 2606], 1780)
-    femmesh.addVolume([159, 335, 319, 416, 1389, 1400, 1344, 1704, 2607, 2608], 1781)
-    femmesh.addVolume([482, 353, 332, 316, 2609, 1511, 2610, 2611, 1512, 1397], 1782)
-    femmesh.addVolume([328, 474, 403, 475, 2612, 1886, 2613, 2614, 1890, 1888], 1783)
-    femmesh.addVolume([375, 423, 281, 492, 1782, 2616, 2615, 1946, 1944, 2617], 1784)
-    femmesh.addVolume([401, 472, 323, 311, 1880, 2620, 2618, 2619, 2621, 1355], 1785)
-    femmesh.addVolume([336, 420, 162, 321, 2488, 1715, 1390, 1403, 2622, 1349], 1786)
-    femmesh.addVolume([446, 456, 377, 286, 1830, 1828, 1808, 2623, 2624, 2625], 1787)
-    femmesh.addVolume([445, 551, 343, 285, 2132, 2509, 2510, 2541, 2626, 1431], 1788)
-    femmesh.addVolume([482, 332, 483, 411, 2610, 2627, 1914, 1910, 2628, 1912], 1789)
-    femmesh.addVolume([485, 413, 333, 318, 1918, 2593, 2629, 2581, 2512, 1408], 1790)
-    femmesh.addVolume([445, 284, 343, 502, 2540, 1430, 2510, 1988, 2630, 2511], 1791)
-    femmesh.addVolume([467, 523, 524, 340, 2044, 2048, 2046, 2631, 2632, 2633], 1792)
-    femmesh.addVolume([274, 97, 96, 436, 1212, 656, 1215, 2634, 1755, 1756], 1793)
-    femmesh.addVolume([332, 482, 483, 539, 2610, 1914, 2627, 2635, 2091, 2092], 1794)
-    femmesh.addVolume([551, 343, 527, 502, 2509, 2636, 2174, 2138, 2511, 2175], 1795)
-    femmesh.addVolume([471, 472, 400, 311, 1881, 1879, 1877, 2637, 2621, 2638], 1796)
-    femmesh.addVolume([541, 333, 484, 355, 2639, 2641, 2097, 2640, 1515, 2642], 1797)
-    femmesh.addVolume([515, 546, 360, 547, 2212, 2643, 2532, 2150, 2216, 2533], 1798)
-    femmesh.addVolume([452, 296, 382, 297, 2496, 2644, 1821, 2561, 1288, 2645], 1799)
-    femmesh.addVolume([133, 390, 391, 322, 1627, 1630, 1628, 1352, 2646, 2555], 1800)
-    femmesh.addVolume([284, 445, 447, 502, 2540, 1811, 2647, 2630, 1988, 1989], 1801)
-    femmesh.addVolume([556, 288, 461, 448, 2594, 2648, 2154, 2153, 2518, 1849], 1802)
-    femmesh.addVolume([351, 295, 549, 352, 1456, 2650, 2649, 1460, 1458, 2651], 1803)
-    femmesh.addVolume([145, 144, 402, 312, 707, 1661, 1662, 1330, 1331, 2652], 1804)
-    femmesh.addVolume([332, 153, 411, 316, 1383, 1688, 2628, 1397, 1338, 2653], 1805)
-    femmesh.addVolume([390, 133, 306, 322, 1627, 1319, 2654, 2646, 1352, 1353], 1806)
-    femmesh.addVolume([324, 343, 527, 344, 1501, 2636, 2344, 1544, 1435, 2515], 1807)
-    femmesh.addVolume([523, 467, 327, 340, 2044, 2479, 2478, 2632, 2631, 1518], 1808)
-    femmesh.addVolume([343, 551, 344, 285, 2509, 2655, 1435, 1431, 2626, 1433], 1809)
-    femmesh.addVolume([430, 119, 120, 295, 1742, 681, 1741, 2656, 1280, 1281], 1810)
-    femmesh.addVolume([518, 342, 447, 502, 2657, 2658, 2026, 2028, 2659, 1989], 1811)
-    femmesh.addVolume([397, 309, 325, 139, 2660, 1363, 2661, 1646, 1324, 1362], 1812)
-    femmesh.addVolume([108, 424, 107, 283, 1729, 1730, 669, 1245, 2662, 1244], 1813)
-    femmesh.addVolume([376, 284, 447, 424, 2529, 2647, 1809, 1781, 2663, 1810], 1814)
-    femmesh.addVolume([99, 131, 275, 371, 1222, 1351, 1220, 2664, 1584, 2665], 1815)
-    femmesh.addVolume([456, 285, 425, 286, 2666, 2667, 1829, 2624, 1255, 2668], 1816)
-    femmesh.addVolume([299, 123, 432, 124, 1292, 1746, 2669, 1293, 685, 1745], 1817)
-    femmesh.addVolume([468, 524, 525, 341, 2047, 2051, 2049, 2599, 2670, 2671], 1818)
-    femmesh.addVolume([537, 331, 480, 351, 2672, 2674, 2085, 2673, 1507, 2675], 1819)
-    femmesh.addVolume([549, 295, 451, 495, 2650, 2676, 2124, 2126, 2677, 1978], 1820)
-    femmesh.addVolume([486, 357, 334, 318, 2503, 1519, 2678, 2582, 1520, 1399], 1821)
-    femmesh.addVolume([548, 456, 286, 344, 2119, 2624, 2679, 2680, 2681, 1434], 1822)
-    femmesh.addVolume([452, 353, 297, 510, 2494, 1462, 2561, 2007, 2682, 2683], 1823)
-    femmesh.addVolume([122, 431, 121, 297, 1743, 1744, 683, 1287, 2560, 1286], 1824)
-    femmesh.addVolume([285, 456, 344, 286, 2666, 2681, 1433, 1255, 2624, 1434], 1825)
-    femmesh.addVolume([285, 109, 425, 110, 1250, 1732, 2667, 1251, 671, 1731], 1826)
-    femmesh.addVolume([313, 346, 475, 532, 1513, 2686, 2684, 2685, 2687, 2070], 1827)
-    femmesh.addVolume([478, 314, 349, 330, 2688, 1504, 2689, 2690, 1395, 1503], 1828)
-    femmesh.addVolume([419, 336, 418, 490, 2489, 2691, 1714, 1934, 2692, 1933], 1829)
-    femmesh.addVolume([104, 280, 374, 279, 1235, 2693, 1592, 1233, 1237, 2694], 1830)
-    femmesh.addVolume([342, 518, 525, 526, 2657, 2200, 2563, 2695, 2187, 2054], 1831)
-    femmesh.addVolume([438, 321, 462, 363, 2696, 2698, 1941, 2697, 1529, 2699], 1832)
-    femmesh.addVolume([471, 527, 528, 344, 2056, 2060, 2058, 2514, 2515, 2700], 1833)
-    femmesh.addVolume([353, 354, 297, 510, 1466, 1464, 1462, 2682, 2580, 2683], 1834)
-    femmesh.addVolume([456, 445, 425, 285, 1947, 1805, 1829, 2666, 2541, 2667], 1835)
-    femmesh.addVolume([309, 138, 396, 327, 1325, 1643, 2701, 1407, 1369, 2702], 1836)
-    femmesh.addVolume([168, 371, 11, 99, 1582, 1583, 732, 1562, 2664, 660], 1837)
-    femmesh.addVolume([354, 496, 297, 510, 2703, 2704, 1464, 2580, 2006, 2683], 1838)
-    femmesh.addVolume([108, 284, 109, 376, 1247, 1248, 670, 1596, 2529, 1595], 1839)
-    femmesh.addVolume([102, 373, 278, 103, 1590, 2705, 1229, 664, 1589, 1230], 1840)
-    femmesh.addVolume([168, 370, 371, 99, 1580, 1585, 1582, 1562, 2706, 2664], 1841)
-    femmesh.addVolume([295, 119, 294, 381, 1280, 1278, 1282, 2707, 1605, 2708], 1842)
-    femmesh.addVolume([405, 148, 329, 406, 1671, 1376, 2709, 1675, 1673, 2567], 1843)
-    femmesh.addVolume([295, 351, 549, 451, 1456, 2649, 2650, 2676, 2710, 2124], 1844)
-    femmesh.addVolume([363, 275, 440, 439, 1532, 2712, 2711, 2528, 2535, 1795], 1845)
-    femmesh.addVolume([317, 332, 483, 354, 1406, 2627, 2713, 1525, 1526, 2714], 1846)
-    femmesh.addVolume([366, 98, 275, 99, 1566, 1221, 2465, 1569, 659, 1220], 1847)
-    femmesh.addVolume([103, 104, 422, 279, 665, 1725, 1726, 1232, 1233, 2715], 1848)
-    femmesh.addVolume([322, 441, 491, 554, 2716, 1939, 2717, 2718, 2157, 2146], 1849)
-    femmesh.addVolume([351, 508, 549, 451, 2719, 2125, 2649, 2710, 2002, 2124], 1850)
-    femmesh.addVolume([328, 474, 312, 403, 2612, 2720, 1393, 2613, 1886, 2721], 1851)
-    femmesh.addVolume([371, 131, 11, 99, 1584, 693, 1583, 2664, 1222, 660], 1852)
-    femmesh.addVolume([526, 342, 310, 469, 2695, 1498, 2722, 2052, 2562, 2723], 1853)
-    femmesh.addVolume([325, 342, 341, 525, 1499, 1429, 1492, 2565, 2563, 2671], 1854)
-    femmesh.addVolume([342, 526, 343, 502, 2695, 2724, 1432, 2659, 2186, 2511], 1855)
-    femmesh.addVolume([321, 420, 367, 462, 2622, 1720, 2521, 2698, 1850, 1851], 1856)
-    femmesh.addVolume([280, 423, 374, 443, 2725, 1784, 2693, 2726, 1800, 1801], 1857)
-    femmesh.addVolume([280, 337, 503, 444, 1421, 2729, 2727, 2728, 2730, 1991], 1858)
-    femmesh.addVolume([464, 465, 326, 521, 1860, 2732, 2731, 2037, 2038, 2733], 1859)
-    femmesh.addVolume([350, 552, 535, 536, 2734, 2170, 2735, 2736, 2183, 2084], 1860)
-    femmesh.addVolume([497, 299, 432, 384, 2575, 2669, 1959, 1958, 2576, 1777], 1861)
-    femmesh.addVolume([339, 464, 326, 521, 2537, 2731, 1500, 2539, 2037, 2733], 1862)
-    femmesh.addVolume([523, 364, 553, 340, 2737, 2589, 2192, 2632, 1538, 2591], 1863)
-    femmesh.addVolume([457, 346, 290, 516, 2738, 1441, 2739, 2021, 2740, 2741], 1864)
-    femmesh.addVolume([408, 409, 315, 480, 1684, 2743, 2742, 1903, 1904, 2744], 1865)
-    femmesh.addVolume([535, 350, 330, 349, 2735, 1522, 2745, 2746, 1454, 1503], 1866)
-    femmesh.addVolume([507, 534, 514, 348, 2208, 2207, 2017, 2747, 2748, 2749], 1867)
-    femmesh.addVolume([430, 295, 451, 381, 2656, 2676, 1818, 1766, 2707, 1819], 1868)
-    femmesh.addVolume([440, 275, 363, 362, 2712, 1532, 2711, 2750, 1560, 1557], 1869)
-    femmesh.addVolume([474, 328, 345, 531, 2612, 1539, 2751, 2067, 2752, 2753], 1870)
-    femmesh.addVolume([335, 489, 545, 488, 2601, 2110, 2542, 2754, 1932, 2109], 1871)
-    femmesh.addVolume([277, 441, 506, 460, 2755, 1998, 2756, 2757, 1843, 1997], 1872)
-    femmesh.addVolume([368, 438, 321, 462, 1787, 2696, 2520, 1940, 1941, 2698], 1873)
-    femmesh.addVolume([512, 497, 454, 300, 2012, 1982, 2011, 2758, 2577, 2487], 1874)
-    femmesh.addVolume([321, 438, 275, 363, 2696, 2759, 1392, 1529, 2697, 1532], 1875)
-    femmesh.addVolume([291, 493, 514, 348, 2760, 2015, 2761, 1446, 2762, 2749], 1876)
-    femmesh.addVolume([104, 374, 422, 279, 1592, 1783, 1725, 1233, 2694, 2715], 1877)
-    femmesh.addVolume([317, 332, 411, 483, 1406, 2628, 2763, 2713, 2627, 1912], 1878)
-    femmesh.addVolume([552, 450, 293, 349, 2133, 2546, 2764, 2765, 2766, 1450], 1879)
-    femmesh.addVolume([298, 383, 432, 123, 2492, 1768, 2767, 1290, 1609, 1746], 1880)
-    femmesh.addVolume([298, 123, 432, 299, 1290, 1746, 2767, 1294, 1292, 2669], 1881)
-    femmesh.addVolume([358, 302, 301, 498, 1477, 1303, 1476, 2501, 2499, 2768], 1882)
-    femmesh.addVolume([277, 278, 506, 322, 1231, 2571, 2756, 1546, 1549, 2769], 1883)
-    femmesh.addVolume([446, 548, 286, 338, 2118, 2679, 2623, 2770, 2771, 1436], 1884)
-    femmesh.addVolume([115, 379, 114, 290, 1601, 1602, 676, 1266, 2772, 1265], 1885)
-    femmesh.addVolume([328, 474, 345, 312, 2612, 2751, 1539, 1393, 2720, 1540], 1886)
-    femmesh.addVolume([357, 555, 454, 512, 2507, 2149, 2549, 2773, 2158, 2011], 1887)
-    femmesh.addVolume([113, 427, 289, 114, 1736, 2774, 1262, 675, 1735, 1263], 1888)
-    femmesh.addVolume([522, 465, 308, 466, 2040, 2776, 2775, 2041, 1863, 2777], 1889)
-    femmesh.addVolume([465, 326, 521, 337, 2732, 2733, 2038, 2778, 1415, 2779], 1890)
-    femmesh.addVolume([540, 317, 484, 483, 2780, 2781, 2095, 2094, 2713, 1917], 1891)
-    femmesh.addVolume([317, 412, 484, 483, 2782, 1915, 2781, 2713, 1913, 1917], 1892)
-    femmesh.addVolume([549, 295, 495, 352, 2650, 2677, 2126, 2651, 1458, 2783], 1893)
-    femmesh.addVolume([308, 395, 327, 466, 2784, 2785, 1404, 2777, 1862, 2480], 1894)
-    femmesh.addVolume([309, 138, 139, 396, 1325, 701, 1324, 2701, 1643, 1644], 1895)
-    femmesh.addVolume([295, 296, 495, 352, 1285, 2545, 2677, 1458, 1459, 2783], 1896)
-    femmesh.addVolume([149, 314, 407, 330, 1334, 2786, 1676, 1379, 1395, 2787], 1897)
-    femmesh.addVolume([478, 314, 407, 406, 2688, 2786, 1898, 1897, 2566, 1678], 1898)
-    femmesh.addVolume([465, 394, 308, 466, 1859, 2788, 2776, 1863, 1861, 2777], 1899)
-    femmesh.addVolume([350, 479, 535, 330, 2789, 2080, 2735, 1522, 2790, 2745], 1900)
-    femmesh.addVolume([534, 314, 477, 348, 2791, 2792, 2076, 2748, 1509, 2793], 1901)
-    femmesh.addVolume([326, 339, 521, 337, 1500, 2539, 2733, 1415, 1547, 2779], 1902)
-    femmesh.addVolume([508, 494, 451, 294, 2003, 1986, 2002, 2794, 2795, 2796], 1903)
-    femmesh.addVolume([478, 479, 407, 330, 1902, 1900, 1898, 2690, 2790, 2787], 1904)
-    femmesh.addVolume([313, 346, 328, 475, 1513, 1514, 1412, 2684, 2686, 2614], 1905)
-    femmesh.addVolume([277, 372, 460, 421, 2797, 1844, 2757, 2568, 1722, 1845], 1906)
-    femmesh.addVolume([474, 328, 531, 475, 2612, 2752, 2067, 1890, 2614, 2068], 1907)
-    femmesh.addVolume([430, 296, 382, 495, 2798, 2644, 1775, 1955, 2545, 1954], 1908)
-    femmesh.addVolume([336, 419, 418, 161, 2489, 1714, 2691, 1391, 1712, 1710], 1909)
-    femmesh.addVolume([551, 456, 548, 344, 2131, 2119, 2144, 2655, 2681, 2680], 1910)
-    femmesh.addVolume([472, 529, 338, 528, 2061, 2800, 2799, 2059, 2063, 2801], 1911)
-    femmesh.addVolume([431, 452, 382, 297, 1820, 1821, 1767, 2560, 2561, 2645], 1912)
-    femmesh.addVolume([518, 511, 459, 341, 2122, 2009, 2027, 2802, 2558, 2803], 1913)
-    femmesh.addVolume([319, 158, 415, 334, 1345, 1701, 2804, 1405, 1386, 2805], 1914)
-    femmesh.addVolume([544, 358, 543, 520, 2806, 2807, 2108, 2181, 2500, 2180], 1915)
-    femmesh.addVolume([506, 307, 339, 519, 2808, 1491, 2809, 2211, 2810, 2538], 1916)
-    femmesh.addVolume([453, 299, 432, 497, 2811, 2669, 1822, 1976, 2575, 1959], 1917)
-    femmesh.addVolume([506, 307, 519, 554, 2808, 2810, 2211, 2167, 2812, 2152], 1918)
-    femmesh.addVolume([530, 474, 312, 345, 2065, 2720, 2553, 2813, 2751, 1540], 1919)
-    femmesh.addVolume([313, 405, 476, 404, 2814, 1892, 2815, 2816, 1672, 1891], 1920)
-    femmesh.addVolume([381, 119, 294, 118, 1605, 1278, 2708, 1606, 680, 1277], 1921)
-    femmesh.addVolume([48, 558, 240, 201, 2399, 2398, 2472, 838, 2400, 2233], 1922)
-    femmesh.addVolume([291, 449, 493, 428, 2817, 1972, 2760, 2818, 1814, 1951], 1923)
-    femmesh.addVolume([364, 523, 466, 327, 2737, 2043, 2819, 1535, 2478, 2480], 1924)
-    femmesh.addVolume([544, 545, 488, 359, 2111, 2109, 2107, 2820, 2544, 2821], 1925)
-    femmesh.addVolume([292, 493, 380, 428, 2822, 1950, 2823, 2824, 1951, 1773], 1926)
-    femmesh.addVolume([299, 453, 355, 550, 2811, 2826, 1468, 2825, 2128, 2827], 1927)
-    femmesh.addVolume([291, 493, 292, 428, 2760, 2822, 1273, 2818, 1951, 2824], 1928)
-    femmesh.addVolume([537, 508, 351, 536, 2177, 2719, 2673, 2087, 2184, 2828], 1929)
-    femmesh.addVolume([337, 279, 517, 444, 1420, 2830, 2829, 2730, 2831, 2023], 1930)
-    femmesh.addVolume([317, 412, 411, 154, 2782, 1693, 2763, 1341, 1691, 1689], 1931)
-    femmesh.addVolume([375, 282, 283, 459, 2832, 1246, 2833, 1839, 2834, 2835], 1932)
-    femmesh.addVolume([339, 307, 506, 278, 1491, 2808, 2809, 1418, 1490, 2571], 1933)
-    femmesh.addVolume([450, 380, 429, 293, 1817, 1765, 1816, 2546, 2836, 2548], 1934)
-    femmesh.addVolume([331, 152, 409, 151, 1380, 1683, 2837, 1381, 714, 1682], 1935)
-    femmesh.addVolume([493, 507, 514, 348, 2001, 2017, 2015, 2762, 2747, 2749], 1936)
-    femmesh.addVolume([380, 117, 429, 293, 1603, 1740, 1765, 2836, 1274, 2548], 1937)
-    femmesh.addVolume([465, 522, 337, 521, 2040, 2838, 2778, 2038, 2042, 2779], 1938)
-    femmesh.addVolume([464, 463, 519, 307, 1857, 2032, 2033, 2839, 2840, 2810], 1939)
-    femmesh.addVolume([285, 425, 286, 110, 2667, 2668, 1255, 1251, 1731, 1253], 1940)
-    femmesh.addVolume([346, 328, 531, 345, 1514, 2752, 2841, 1442, 1539, 2753], 1941)
-    femmesh.addVolume([328, 346, 531, 475, 1514, 2841, 2752, 2614, 2686, 2068], 1942)
-    femmesh.addVolume([339, 519, 517, 506, 2538, 2214, 2842, 2809, 2211, 2127], 1943)
-    femmesh.addVolume([533, 534, 477, 348, 2078, 2076, 2074, 2843, 2748, 2793], 1944)
-    femmesh.addVolume([537, 351, 549, 352, 2673, 2649, 2176, 2844, 1460, 2651], 1945)
-    femmesh.addVolume([307, 135, 326, 392, 1320, 1365, 1366, 2493, 1632, 2845], 1946)
-    femmesh.addVolume([333, 541, 356, 355, 2639, 2846, 1497, 1515, 2640, 1472], 1947)
-    femmesh.addVolume([412, 317, 484, 333, 2782, 2781, 1915, 2592, 1398, 2641], 1948)
-    femmesh.addVolume([413, 485, 414, 318, 1918, 1919, 1699, 2512, 2581, 2513], 1949)
-    femmesh.addVolume([541, 512, 542, 356, 2161, 2173, 2102, 2846, 2847, 2848], 1950)
-    femmesh.addVolume([517, 337, 444, 503, 2829, 2730, 2023, 2025, 2729, 1991], 1951)
-    femmesh.addVolume([289, 457, 448, 513, 2849, 1948, 2516, 2850, 2013, 2014], 1952)
-    femmesh.addVolume([91, 9, 132, 437, 649, 694, 1314, 2491, 1620, 1758], 1953)
-    femmesh.addVolume([293, 494, 294, 429, 2547, 2795, 1279, 2548, 1953, 2851], 1954)
-    femmesh.addVolume([342, 526, 525, 469, 2695, 2054, 2563, 2562, 2052, 2050], 1955)
-    femmesh.addVolume([458, 506, 339, 517, 2031, 2809, 2852, 2024, 2127, 2842], 1956)
-    femmesh.addVolume([357, 486, 334, 543, 2503, 2678, 1519, 2505, 2103, 2853], 1957)
-    femmesh.addVolume([331, 537, 352, 351, 2672, 2844, 1506, 1507, 2673, 1460], 1958)
-    femmesh.addVolume([555, 357, 542, 512, 2507, 2504, 2172, 2158, 2773, 2173], 1959)
-    femmesh.addVolume([291, 379, 449, 428, 2854, 1815, 2817, 2818, 1764, 1814], 1960)
-    femmesh.addVolume([124, 384, 300, 125, 1612, 2485, 1295, 686, 1611, 1296], 1961)
-    femmesh.addVolume([538, 353, 352, 509, 2855, 1463, 2856, 2168, 2495, 2857], 1962)
-    femmesh.addVolume([355, 541, 356, 550, 2640, 2846, 1472, 2827, 2162, 2858], 1963)
-    femmesh.addVolume([540, 354, 539, 505, 2859, 2579, 2096, 2179, 2578, 2159], 1964)
-    femmesh.addVolume([353, 482, 332, 539, 2609, 2610, 1511, 2860, 2091, 2635], 1965)
-    femmesh.addVolume([331, 352, 481, 316, 1506, 2861, 2605, 1411, 1505, 2606], 1966)
-    femmesh.addVolume([549, 509, 352, 495, 2142, 2857, 2651, 2126, 2005, 2783], 1967)
-    femmesh.addVolume([454, 300, 433, 301, 2487, 2486, 1824, 2550, 1300, 2525], 1968)
-    femmesh.addVolume([314, 478, 407, 330, 2688, 1898, 2786, 1395, 2690, 2787], 1969)
-    femmesh.addVolume([540, 541, 484, 355, 2099, 2097, 2095, 2862, 2640, 2642], 1970)
-    femmesh.addVolume([523, 340, 553, 524, 2632, 2591, 2192, 2048, 2633, 2197], 1971)
-    femmesh.addVolume([485, 541, 333, 484, 2098, 2639, 2629, 1920, 2097, 2641], 1972)
-    femmesh.addVolume([339, 506, 458, 278, 2809, 2031, 2852, 1418, 2571, 2570], 1973)
-    femmesh.addVolume([343, 551, 527, 344, 2509, 2174, 2636, 1435, 2655, 2515], 1974)
-    femmesh.addVolume([273, 558, 193, 201, 2397, 2405, 2364, 2467, 2400, 848], 1975)
-    femmesh.addVolume([281, 375, 282, 106, 2615, 2832, 1243, 1239, 1594, 1241], 1976)
-    femmesh.addVolume([498, 454, 433, 301, 1975, 1824, 1961, 2768, 2550, 2525], 1977)
-    femmesh.addVolume([298, 496, 505, 453, 2863, 1996, 2864, 2865, 1984, 1995], 1978)
-    femmesh.addVolume([533, 347, 476, 532, 2866, 2867, 2073, 2075, 2868, 2071], 1979)
-    femmesh.addVolume([498, 302, 301, 385, 2499, 1303, 2768, 1960, 2483, 2524], 1980)
-    femmesh.addVolume([435, 94, 95, 274, 1754, 654, 1753, 2869, 1218, 1217], 1981)
-    femmesh.addVolume([339, 337, 517, 521, 1547, 2829, 2842, 2539, 2779, 2195], 1982)
-    femmesh.addVolume([300, 125, 433, 301, 1296, 1748, 2486, 1300, 1298, 2525], 1983)
-    femmesh.addVolume([113, 427, 378, 289, 1736, 1763, 1599, 1262, 2774, 2517], 1984)
-    femmesh.addVolume([138, 395, 396, 327, 1641, 1645, 1643, 1369, 2785, 2702], 1985)
-    femmesh.addVolume([430, 119, 295, 381, 1742, 1280, 2656, 1766, 1605, 2707], 1986)
-    femmesh.addVolume([501, 306, 388, 491, 2870, 2506, 1966, 1969, 2585, 1938], 1987)
-    femmesh.addVolume([276, 460, 436, 389, 2871, 1841, 2872, 2873, 1842, 1786], 1988)
-    femmesh.addVolume([159, 335, 417, 160, 1389, 2874, 1706, 722, 1388, 1707], 1989)
-    femmesh.addVolume([494, 381, 451, 294, 1952, 1819, 1986, 2795, 2708, 2796], 1990)
-    femmesh.addVolume([498, 385, 301, 433, 1960, 2524, 2768, 1961, 1778, 2525], 1991)
-    femmesh.addVolume([527, 551, 528, 344, 2174, 2166, 2060, 2515, 2655, 2700], 1992)
-    femmesh.addVolume([126, 125, 301, 433, 687, 1298, 1299, 1747, 1748, 2525], 1993)
-    femmesh.addVolume([394, 137, 136, 308, 1638, 699, 1637, 2788, 1322, 1323], 1994)
-    femmesh.addVolume([540, 541, 355, 550, 2099, 2640, 2862, 2182, 2162, 2827], 1995)
-    femmesh.addVolume([512, 357, 356, 300, 2773, 1475, 2847, 2758, 1473, 1471], 1996)
-    femmesh.addVolume([306, 390, 501, 437, 2654, 1968, 2870, 2490, 1949, 1967], 1997)
-    femmesh.addVolume([303, 304, 499, 360, 1309, 2876, 2875, 1482, 1483, 2531], 1998)
-    femmesh.addVolume([540, 505, 550, 355, 2179, 2129, 2182, 2862, 2877, 2827], 1999)
-    femmesh.addVolume([306, 390, 437, 132, 2654, 1949, 2490, 1318, 1626, 1758], 2000)
-    femmesh.addVolume([276, 306, 274, 92, 1317, 2879, 2878, 1313, 1316, 1213], 2001)
-    femmesh.addVolume([347, 533, 514, 516, 2866, 2206, 2880, 2881, 2205, 2022], 2002)
-    femmesh.addVolume([533, 347, 514, 348, 2866, 2880, 2206, 2843, 1448, 2749], 2003)
-    femmesh.addVolume([401, 144, 323, 402, 1659, 1356, 2618, 1663, 1661, 2882], 2004)
-    femmesh.addVolume([505, 453, 550, 355, 1995, 2128, 2129, 2877, 2826, 2827], 2005)
-    femmesh.addVolume([475, 346, 531, 532, 2686, 2841, 2068, 2070, 2687, 2072], 2006)
-    femmesh.addVolume([463, 307, 322, 554, 2840, 1360, 2573, 2147, 2812, 2718], 2007)
-    femmesh.addVolume([291, 115, 290, 379, 1268, 1266, 1270, 2854, 1601, 2772], 2008)
-    femmesh.addVolume([365, 530, 345, 556, 2551, 2813, 1559, 2883, 2203, 2595], 2009)
-    femmesh.addVolume([287, 446, 286, 338, 2884, 2623, 1258, 1437, 2770, 1436], 2010)
-    femmesh.addVolume([472, 471, 528, 311, 1881, 2058, 2059, 2621, 2637, 2885], 2011)
-    femmesh.addVolume([464, 326, 393, 392, 2731, 2886, 1856, 1855, 2845, 1636], 2012)
-    femmesh.addVolume([346, 347, 516, 532, 1445, 2881, 2740, 2687, 2868, 2193], 2013)
-    femmesh.addVolume([506, 307, 554, 322, 2808, 2812, 2167, 2769, 1360, 2718], 2014)
-    femmesh.addVolume([384, 299, 432, 124, 2576, 2669, 1777, 1612, 1293, 1745], 2015)
-    femmesh.addVolume([461, 288, 426, 378, 2648, 2887, 1847, 1846, 2519, 1757], 2016)
-    femmesh.addVolume([531, 556, 513, 345, 2204, 2155, 2196, 2753, 2595, 2888], 2017)
-    femmesh.addVolume([408, 150, 330, 315, 1679, 1378, 2889, 2742, 1337, 1409], 2018)
-    femmesh.addVolume([508, 350, 536, 552, 2890, 2736, 2184, 2140, 2734, 2183], 2019)
-    femmesh.addVolume([438, 504, 439, 363, 1993, 2030, 1791, 2697, 2526, 2528], 2020)
-    femmesh.addVolume([452, 353, 510, 509, 2494, 2682, 2007, 2004, 2495, 2123], 2021)
-    femmesh.addVolume([508, 350, 494, 294, 2890, 2891, 2003, 2794, 1453, 2795], 2022)
-    femmesh.addVolume([430, 120, 382, 296, 1741, 1608, 1775, 2798, 1283, 2644], 2023)
-    femmesh.addVolume([298, 122, 297, 383, 1289, 1287, 1291, 2492, 1610, 2559], 2024)
-    femmesh.addVolume([463, 519, 307, 554, 2032, 2810, 2840, 2147, 2152, 2812], 2025)
-    femmesh.addVolume([538, 482, 481, 316, 2089, 1911, 2088, 2892, 2611, 2606], 2026)
-    femmesh.addVolume([383, 298, 432, 453, 2492, 2767, 1768, 1823, 2865, 1822], 2027)
-    femmesh.addVolume([368, 166, 366, 369, 1574, 1567, 2522, 1578, 1576, 2893], 2028)
-    femmesh.addVolume([538, 537, 549, 352, 2090, 2176, 2169, 2856, 2844, 2651], 2029)
-    femmesh.addVolume([419, 336, 162, 161, 2489, 1390, 1713, 1712, 1391, 724], 2030)
-    femmesh.addVolume([538, 353, 316, 352, 2855, 1512, 2892, 2856, 1463, 1505], 2031)
-    femmesh.addVolume([509, 353, 510, 539, 2495, 2682, 2123, 2178, 2860, 2160], 2032)
-    femmesh.addVolume([468, 325, 341, 525, 2597, 1492, 2599, 2049, 2565, 2671], 2033)
-    femmesh.addVolume([354, 332, 483, 539, 1526, 2627, 2714, 2579, 2635, 2092], 2034)
-    femmesh.addVolume([515, 520, 455, 359, 2036, 2034, 2019, 2894, 2895, 2896], 2035)
-    femmesh.addVolume([496, 354, 505, 510, 2703, 2578, 1996, 2006, 2580, 2008], 2036)
-    femmesh.addVolume([398, 310, 469, 470, 2897, 2723, 1871, 1873, 2898, 1875], 2037)
-    femmesh.addVolume([508, 350, 552, 494, 2890, 2734, 2140, 2003, 2891, 2135], 2038)
-    femmesh.addVolume([329, 314, 477, 406, 1410, 2792, 2899, 2567, 2566, 1895], 2039)
-    femmesh.addVolume([97, 274, 92, 436, 1212, 1213, 1211, 1755, 2634, 2900], 2040)
-    femmesh.addVolume([373, 442, 278, 458, 1798, 2569, 2705, 1836, 1942, 2570], 2041)
-    femmesh.addVolume([303, 515, 359, 360, 2901, 2894, 1480, 1482, 2532, 1484], 2042)
-    femmesh.addVolume([326, 135, 393, 392, 1365, 1634, 2886, 2845, 1632, 1636], 2043)
-    femmesh.addVolume([346, 313, 347, 532, 1513, 1542, 1445, 2687, 2685, 2868], 2044)
-    femmesh.addVolume([405, 329, 476, 477, 2709, 2902, 1892, 1894, 2899, 1896], 2045)
-    femmesh.addVolume([405, 313, 329, 147, 2814, 1394, 2709, 1670, 1332, 1377], 2046)
-    femmesh.addVolume([328, 313, 404, 146, 1412, 2816, 2903, 1374, 1333, 1667], 2047)
-    femmesh.addVolume([274, 276, 92, 436, 2878, 1313, 1213, 2634, 2872, 2900], 2048)
-    femmesh.addVolume([449, 457, 290, 516, 1833, 2739, 2904, 2020, 2021, 2741], 2049)
-    femmesh.addVolume([529, 548, 338, 528, 2191, 2771, 2800, 2063, 2165, 2801], 2050)
-    femmesh.addVolume([475, 328, 404, 403, 2614, 2903, 1889, 1888, 2613, 1669], 2051)
-    femmesh.addVolume([302, 498, 520, 455, 2499, 2035, 2498, 2905, 1981, 2034], 2052)
-    femmesh.addVolume([315, 351, 536, 480, 1508, 2828, 2906, 2744, 2675, 2083], 2053)
-    femmesh.addVolume([352, 538, 481, 316, 2856, 2088, 2861, 1505, 2892, 2606], 2054)
-    femmesh.addVolume([482, 410, 481, 316, 1909, 1907, 1911, 2611, 2604, 2606], 2055)
-    femmesh.addVolume([390, 133, 132, 306, 1627, 695, 1626, 2654, 1319, 1318], 2056)
-    femmesh.addVolume([341, 282, 459, 283, 1424, 2834, 2803, 1425, 1246, 2835], 2057)
-    femmesh.addVolume([487, 416, 415, 319, 1925, 1705, 1924, 2907, 2608, 2804], 2058)
-    femmesh.addVolume([319, 416, 415, 158, 2608, 1705, 2804, 1345, 1703, 1701], 2059)
-    femmesh.addVolume([373, 278, 279, 458, 2705, 1234, 2908, 1836, 2570, 2909], 2060)
-    femmesh.addVolume([339, 458, 517, 279, 2852, 2024, 2842, 1419, 2909, 2830], 2061)
-    femmesh.addVolume([522, 337, 521, 503, 2838, 2779, 2042, 2164, 2729, 2185], 2062)
-    femmesh.addVolume([511, 282, 459, 341, 2557, 2834, 2009, 2558, 1424, 2803], 2063)
-    femmesh.addVolume([522, 364, 503, 553, 2910, 2911, 2164, 2163, 2589, 2141], 2064)
-    femmesh.addVolume([482, 332, 411, 316, 2610, 2628, 1910, 2611, 1397, 2653], 2065)
-    femmesh.addVolume([517, 458, 444, 279, 2024, 1837, 2023, 2830, 2909, 2831], 2066)
-    femmesh.addVolume([279, 458, 444, 422, 2909, 1837, 2831, 2715, 1835, 1803], 2067)
-    femmesh.addVolume([324, 310, 399, 470, 1358, 2912, 2508, 2345, 2898, 1874], 2068)
-    femmesh.addVolume([324, 343, 470, 527, 1501, 2913, 2345, 2344, 2636, 2055], 2069)
-    femmesh.addVolume([370, 99, 275, 371, 2706, 1220, 2536, 1585, 2664, 2665], 2070)
-    femmesh.addVolume([120, 296, 121, 382, 1283, 1284, 682, 1608, 2644, 1607], 2071)
-    femmesh.addVolume([108, 284, 376, 424, 1247, 2529, 1596, 1729, 2663, 1781], 2072)
-    femmesh.addVolume([439, 438, 363, 275, 1791, 2697, 2528, 2535, 2759, 1532], 2073)
-    femmesh.addVolume([331, 409, 481, 480, 2837, 1906, 2605, 2674, 1904, 1908], 2074)
-    femmesh.addVolume([364, 308, 327, 466, 1536, 1404, 1535, 2819, 2777, 2480], 2075)
-    femmesh.addVolume([500, 361, 305, 363, 2914, 1486, 2915, 2527, 1531, 1556], 2076)
-    femmesh.addVolume([369, 366, 275, 370, 2893, 2465, 2534, 1581, 2916, 2536], 2077)
-    femmesh.addVolume([394, 395, 308, 466, 1642, 2784, 2788, 1861, 1862, 2777], 2078)
-    femmesh.addVolume([278, 373, 279, 103, 2705, 2908, 1234, 1230, 1589, 1232], 2079)
-    femmesh.addVolume([342, 284, 283, 447, 1428, 1249, 1427, 2658, 2647, 2917], 2080)
-    femmesh.addVolume([284, 108, 283, 424, 1247, 1245, 1249, 2663, 1729, 2662], 2081)
-    femmesh.addVolume([324, 310, 470, 343, 1358, 2898, 2345, 1501, 1502, 2913], 2082)
-    femmesh.addVolume([106, 375, 282, 107, 1594, 2832, 1241, 668, 1593, 1242], 2083)
-    femmesh.addVolume([535, 478, 349, 330, 2079, 2689, 2746, 2745, 2690, 1503], 2084)
-    femmesh.addVolume([310, 398, 469, 325, 2897, 1871, 2723, 1371, 2918, 2564], 2085)
-    femmesh.addVolume([454, 555, 301, 498, 2149, 2919, 2550, 1975, 2148, 2768], 2086)
-    femmesh.addVolume([357, 555, 301, 454, 2507, 2919, 1474, 2549, 2149, 2550], 2087)
-    femmesh.addVolume([116, 291, 292, 428, 1269, 1273, 1271, 1737, 2818, 2824], 2088)
-    femmesh.addVolume([340, 281, 492, 282, 1422, 2617, 2596, 1423, 1243, 2920], 2089)
-    femmesh.addVolume([280, 104, 374, 105, 1235, 1592, 2693, 1236, 666, 1591], 2090)
-    femmesh.addVolume([351, 331, 480, 315, 1507, 2674, 2675, 1508, 1396, 2744], 2091)
-    femmesh.addVolume([456, 548, 286, 446, 2119, 2679, 2624, 1830, 2118, 2623], 2092)
-    femmesh.addVolume([350, 351, 536, 315, 1457, 2828, 2736, 1521, 1508, 2906], 2093)
-    femmesh.addVolume([313, 475, 476, 532, 2684, 1893, 2815, 2685, 2070, 2071], 2094)
-    femmesh.addVolume([405, 329, 477, 406, 2709, 2899, 1894, 1675, 2567, 1895], 2095)
-    femmesh.addVolume([277, 442, 373, 421, 2921, 1798, 2922, 2568, 1799, 1724], 2096)
-    femmesh.addVolume([374, 279, 444, 422, 2694, 2831, 1802, 1783, 2715, 1803], 2097)
-    femmesh.addVolume([358, 555, 543, 520, 2923, 2217, 2807, 2500, 2156, 2180], 2098)
-    femmesh.addVolume([329, 533, 477, 348, 2924, 2074, 2899, 1510, 2843, 2793], 2099)
-    femmesh.addVolume([347, 449, 290, 516, 2925, 2904, 1443, 2881, 2020, 2741], 2100)
-    femmesh.addVolume([487, 358, 334, 543, 2926, 1495, 2927, 2104, 2807, 2853], 2101)
-    femmesh.addVolume([463, 501, 491, 322, 1980, 1969, 2139, 2573, 2574, 2717], 2102)
-    femmesh.addVolume([358, 544, 543, 487, 2806, 2108, 2807, 2926, 2106, 2104], 2103)
-    femmesh.addVolume([486, 487, 334, 543, 1926, 2927, 2678, 2103, 2104, 2853], 2104)
-    femmesh.addVolume([555, 358, 301, 498, 2923, 1476, 2919, 2148, 2501, 2768], 2105)
-    femmesh.addVolume([346, 457, 289, 513, 2738, 2849, 1440, 2928, 2013, 2850], 2106)
-    femmesh.addVolume([326, 465, 308, 337, 2732, 2776, 1368, 1415, 2778, 1414], 2107)
-    femmesh.addVolume([361, 320, 546, 360, 1528, 2930, 2929, 1487, 1533, 2643], 2108)
-    femmesh.addVolume([529, 365, 530, 473, 2931, 2551, 2066, 2062, 2552, 2064], 2109)
-    femmesh.addVolume([489, 335, 417, 488, 2601, 2874, 1930, 1932, 2754, 1928], 2110)
-    femmesh.addVolume([545, 335, 488, 359, 2542, 2754, 2109, 2544, 1523, 2821], 2111)
-    femmesh.addVolume([365, 529, 323, 473, 2931, 2932, 1555, 2552, 2062, 2933], 2112)
-    femmesh.addVolume([369, 368, 275, 366, 1578, 2934, 2534, 2893, 2522, 2465], 2113)
-    femmesh.addVolume([446, 287, 377, 426, 2884, 2935, 1808, 1807, 2936, 1762], 2114)
-    femmesh.addVolume([504, 361, 490, 546, 2937, 2938, 1994, 2114, 2929, 2113], 2115)
-    femmesh.addVolume([517, 279, 337, 339, 2830, 1420, 2829, 2842, 1419, 1547], 2116)
-    femmesh.addVolume([103, 373, 279, 422, 1589, 2908, 1232, 1726, 1752, 2715], 2117)
-    femmesh.addVolume([284, 424, 283, 447, 2663, 2662, 1249, 2647, 1810, 2917], 2118)
-    femmesh.addVolume([555, 357, 301, 358, 2507, 1474, 2919, 2923, 1478, 1476], 2119)
-    femmesh.addVolume([500, 304, 547, 499, 2939, 2940, 2116, 1971, 2876, 2117], 2120)
-    femmesh.addVolume([116, 292, 380, 428, 1271, 2823, 1604, 1737, 2824, 1773], 2121)
-    femmesh.addVolume([115, 291, 116, 428, 1268, 1269, 677, 1738, 2818, 1737], 2122)
-    femmesh.addVolume([529, 472, 323, 473, 2061, 2620, 2932, 2062, 1884, 2933], 2123)
-    femmesh.addVolume([109, 376, 285, 425, 1595, 2530, 1250, 1732, 1761, 2667], 2124)
-    femmesh.addVolume([105, 423, 281, 106, 1728, 2616, 1238, 667, 1727, 1239], 2125)
-    femmesh.addVolume([423, 375, 281, 106, 1782, 2615, 2616, 1727, 1594, 1239], 2126)
-    femmesh.addVolume([472, 401, 323, 473, 1880, 2618, 2620, 1884, 1882, 2933], 2127)
-    femmesh.addVolume([387, 130, 305, 129, 1619, 1311, 2941, 1751, 691, 1310], 2128)
-    femmesh.addVolume([381, 429, 118, 294, 1774, 1739, 1606, 2708, 2851, 1277], 2129)
-    femmesh.addVolume([544, 358, 520, 359, 2806, 2500, 2181, 2820, 1481, 2895], 2130)
-    femmesh.addVolume([292, 380, 450, 293, 2823, 1817, 2942, 1276, 2836, 2546], 2131)
-    femmesh.addVolume([372, 276, 460, 436, 2943, 2871, 1844, 1834, 2872, 1841], 2132)
-    femmesh.addVolume([340, 511, 553, 524, 2556, 2145, 2591, 2633, 2198, 2197], 2133)
-    femmesh.addVolume([97, 100, 372, 92, 1586, 1588, 1718, 1211, 1223, 2944], 2134)
-    femmesh.addVolume([141, 310, 140, 398, 1326, 1327, 703, 1650, 2897, 1649], 2135)
-    femmesh.addVolume([365, 530, 312, 345, 2551, 2553, 1558, 1559, 2813, 1540], 2136)
-    femmesh.addVolume([366, 167, 99, 370, 1568, 1563, 1569, 2916, 1579, 2706], 2137)
-    femmesh.addVolume([518, 511, 341, 525, 2122, 2558, 2802, 2200, 2199, 2671], 2138)
-    femmesh.addVolume([311, 471, 528, 344, 2637, 2058, 2885, 1543, 2514, 2700], 2139)
-    femmesh.addVolume([346, 457, 290, 289, 2738, 2739, 1441, 1440, 2849, 1267], 2140)
-    femmesh.addVolume([485, 318, 333, 356, 2581, 1408, 2629, 2945, 1496, 1497], 2141)
-    femmesh.addVolume([167, 168, 99, 370, 731, 1562, 1563, 1579, 1580, 2706], 2142)
-    femmesh.addVolume([366, 370, 99, 275, 2916, 2706, 1569, 2465, 2536, 1220], 2143)
-    femmesh.addVolume([498, 302, 385, 455, 2499, 2483, 1960, 1981, 2905, 1827], 2144)
-    femmesh.addVolume([544, 515, 545, 359, 2188, 2209, 2111, 2820, 2894, 2544], 2145)
-    femmesh.addVolume([346, 289, 345, 513, 1440, 1439, 1442, 2928, 2850, 2888], 2146)
-    femmesh.addVolume([150, 149, 407, 330, 712, 1676, 1677, 1378, 1379, 2787], 2147)
-    femmesh.addVolume([474, 530, 531, 345, 2065, 2069, 2067, 2751, 2813, 2753], 2148)
-    femmesh.addVolume([440, 275, 371, 370, 2712, 2665, 1793, 1792, 2536, 1585], 2149)
-    femmesh.addVolume([408, 409, 151, 315, 1684, 1682, 1680, 2742, 2743, 1336], 2150)
-    femmesh.addVolume([331, 409, 315, 151, 2837, 2743, 1396, 1381, 1682, 1336], 2151)
-    femmesh.addVolume([429, 293, 118, 294, 2548, 1275, 1739, 2851, 1279, 1277], 2152)
-    femmesh.addVolume([479, 408, 315, 480, 1901, 2742, 2946, 1905, 1903, 2744], 2153)
-    femmesh.addVolume([380, 292, 117, 293, 2823, 1272, 1603, 2836, 1276, 1274], 2154)
-    femmesh.addVolume([295, 430, 296, 120, 2656, 2798, 1285, 1281, 1741, 1283], 2155)
-    femmesh.addVolume([303, 434, 304, 128, 2947, 2948, 1309, 1305, 1749, 1307], 2156)
-    femmesh.addVolume([544, 358, 319, 487, 2806, 1494, 2949, 2106, 2926, 2907], 2157)
-    femmesh.addVolume([363, 500, 440, 305, 2527, 2029, 2711, 1556, 2915, 2950], 2158)
-    femmesh.addVolume([489, 320, 418, 417, 2600, 2951, 1931, 1930, 2952, 1711], 2159)
-    femmesh.addVolume([127, 434, 303, 128, 1750, 2947, 1304, 689, 1749, 1305], 2160)
-    femmesh.addVolume([386, 500, 499, 304, 1965, 1971, 1962, 2953, 2939, 2876], 2161)
-    femmesh.addVolume([342, 518, 526, 502, 2657, 2187, 2695, 2659, 2028, 2186], 2162)
-    femmesh.addVolume([277, 373, 102, 421, 2922, 1590, 1227, 2568, 1724, 1723], 2163)
-    femmesh.addVolume([280, 423, 281, 105, 2725, 2616, 1240, 1236, 1728, 1238], 2164)
-    femmesh.addVolume([281, 340, 492, 553, 1422, 2596, 2617, 2587, 2591, 2136], 2165)
-    femmesh.addVolume([386, 128, 129, 304, 1616, 690, 1615, 2953, 1307, 1308], 2166)
-    femmesh.addVolume([344, 311, 338, 528, 1543, 1417, 1545, 2700, 2885, 2801], 2167)
-    femmesh.addVolume([111, 287, 377, 286, 1256, 2935, 1597, 1254, 1258, 2625], 2168)
-    femmesh.addVolume([311, 401, 143, 323, 2619, 1658, 1328, 1355, 2618, 1354], 2169)
-    femmesh.addVolume([314, 149, 407, 406, 1334, 1676, 2786, 2566, 1674, 1678], 2170)
-    femmesh.addVolume([314, 329, 477, 348, 1410, 2899, 2792, 1509, 1510, 2793], 2171)
-    femmesh.addVolume([145, 328, 312, 403, 1375, 1393, 1330, 1664, 2613, 2721], 2172)
-    femmesh.addVolume([346, 531, 513, 345, 2841, 2196, 2928, 1442, 2753, 2888], 2173)
-    femmesh.addVolume([401, 144, 143, 323, 1659, 706, 1658, 2618, 1356, 1354], 2174)
-    femmesh.addVolume([446, 287, 557, 338, 2884, 2954, 2190, 2770, 1437, 2955], 2175)
-    femmesh.addVolume([156, 318, 414, 157, 1343, 2513, 1697, 719, 1342, 1698], 2176)
-    femmesh.addVolume([121, 431, 382, 297, 1744, 1767, 1607, 1286, 2560, 2645], 2177)
-    femmesh.addVolume([533, 534, 348, 514, 2078, 2748, 2843, 2206, 2207, 2749], 2178)
-    femmesh.addVolume([397, 325, 140, 139, 2661, 1364, 1647, 1646, 1362, 702], 2179)
-    femmesh.addVolume([548, 344, 338, 528, 2680, 1545, 2771, 2165, 2700, 2801], 2180)
-    femmesh.addVolume([395, 467, 396, 327, 1864, 1865, 1645, 2785, 2479, 2702], 2181)
-    femmesh.addVolume([446, 548, 338, 557, 2118, 2771, 2770, 2190, 2210, 2955], 2182)
-    femmesh.addVolume([117, 293, 118, 429, 1274, 1275, 679, 1740, 2548, 1739], 2183)
-    femmesh.addVolume([541, 512, 356, 550, 2161, 2847, 2846, 2162, 2143, 2858], 2184)
-    femmesh.addVolume([409, 331, 315, 480, 2837, 1396, 2743, 1904, 2674, 2744], 2185)
-    femmesh.addVolume([474, 402, 312, 403, 1885, 2652, 2720, 1886, 1666, 2721], 2186)
-    femmesh.addVolume([434, 386, 304, 128, 1779, 2953, 2948, 1749, 1616, 1307], 2187)
-    femmesh.addVolume([336, 320, 418, 490, 1401, 2951, 2691, 2692, 2956, 1933], 2188)
-    femmesh.addVolume([130, 387, 305, 362, 1619, 2941, 1311, 1488, 2957, 1548], 2189)
-    femmesh.addVolume([500, 361, 547, 304, 2914, 2958, 2116, 2939, 1485, 2940], 2190)
-    femmesh.addVolume([163, 321, 162, 420, 1348, 1349, 725, 1716, 2622, 1715], 2191)
-    femmesh.addVolume([548, 344, 286, 338, 2680, 1434, 2679, 2771, 1545, 1436], 2192)
-    femmesh.addVolume([311, 472, 338, 528, 2621, 2799, 1417, 2885, 2059, 2801], 2193)
-    femmesh.addVolume([478, 314, 406, 477, 2688, 2566, 1897, 1899, 2792, 1895], 2194)
-    femmesh.addVolume([475, 313, 476, 404, 2684, 2815, 1893, 1889, 2816, 1891], 2195)
-    femmesh.addVolume([436, 274, 389, 96, 2634, 2959, 1786, 1756, 1215, 1624], 2196)
-    femmesh.addVolume([155, 412, 317, 154, 1692, 2782, 1340, 717, 1691, 1341], 2197)
-    femmesh.addVolume([150, 408, 151, 315, 1679, 1680, 713, 1337, 2742, 1336], 2198)
-    femmesh.addVolume([309, 467, 396, 468, 2960, 1865, 2701, 2598, 1869, 1867], 2199)
-    femmesh.addVolume([358, 357, 334, 543, 1478, 1519, 1495, 2807, 2505, 2853], 2200)
-    femmesh.addVolume([489, 335, 545, 360, 2601, 2542, 2110, 2602, 1534, 2543], 2201)
-    femmesh.addVolume([340, 511, 524, 341, 2556, 2198, 2633, 1426, 2558, 2670], 2202)
-    femmesh.addVolume([372, 97, 92, 436, 1718, 1211, 2944, 1834, 1755, 2900], 2203)
-    femmesh.addVolume([309, 340, 524, 341, 1517, 2633, 2961, 1493, 1426, 2670], 2204)
-    femmesh.addVolume([423, 280, 374, 105, 2725, 2693, 1784, 1728, 1236, 1591], 2205)
-    femmesh.addVolume([160, 320, 418, 161, 1347, 2951, 1709, 723, 1346, 1710], 2206)
-    femmesh.addVolume([489, 320, 490, 418, 2600, 2956, 1935, 1931, 2951, 1933], 2207)
-    femmesh.addVolume([274, 435, 389, 95, 2869, 1785, 2959, 1217, 1753, 1625], 2208)
-    femmesh.addVolume([313, 328, 404, 475, 1412, 2903, 2816, 2684, 2614, 1889], 2209)
-    femmesh.addVolume([282, 375, 492, 459, 2832, 1946, 2920, 2834, 1839, 1983], 2210)
-    femmesh.addVolume([291, 449, 290, 347, 2817, 2904, 1270, 1444, 2925, 1443], 2211)
-    femmesh.addVolume([364, 522, 503, 337, 2910, 2164, 2911, 1537, 2838, 2729], 2212)
-    femmesh.addVolume([347, 533, 516, 532, 2866, 2205, 2881, 2868, 2075, 2193], 2213)
-    femmesh.addVolume([370, 439, 440, 275, 1790, 1795, 1792, 2536, 2535, 2712], 2214)
-    femmesh.addVolume([401, 402, 323, 473, 1663, 2882, 2618, 1882, 1883, 2933], 2215)
-    femmesh.addVolume([158, 157, 415, 334, 720, 1700, 1701, 1386, 1387, 2805], 2216)
-    femmesh.addVolume([291, 115, 379, 428, 1268, 1601, 2854, 2818, 1738, 1764], 2217)
-    femmesh.addVolume([350, 508, 351, 294, 2890, 2719, 1457, 1453, 2794, 1455], 2218)
-    femmesh.addVolume([486, 487, 415, 334, 1926, 1924, 1922, 2678, 2927, 2805], 2219)
-    femmesh.addVolume([157, 318, 414, 334, 1342, 2513, 1698, 1387, 1399, 2962], 2220)
-    femmesh.addVolume([552, 507, 349, 535, 2134, 2963, 2765, 2170, 2171, 2746], 2221)
-    femmesh.addVolume([413, 156, 333, 318, 1695, 1384, 2593, 2512, 1343, 1408], 2222)
-    femmesh.addVolume([361, 320, 490, 546, 1528, 2956, 2938, 2929, 2930, 2113], 2223)
-    femmesh.addVolume([450, 552, 293, 494, 2133, 2764, 2546, 1979, 2135, 2547], 2224)
-    femmesh.addVolume([552, 350, 293, 494, 2734, 1452, 2764, 2135, 2891, 2547], 2225)
-    femmesh.addVolume([507, 292, 450, 349, 2964, 2942, 2000, 2963, 1449, 2766], 2226)
-    femmesh.addVolume([318, 486, 414, 334, 2582, 1921, 2513, 1399, 2678, 2962], 2227)
-    femmesh.addVolume([494, 350, 293, 294, 2891, 1452, 2547, 2795, 1453, 1279], 2228)
-    femmesh.addVolume([131, 362, 275, 371, 1489, 1560, 1351, 1584, 2965, 2665], 2229)
-    femmesh.addVolume([496, 298, 505, 354, 2863, 2864, 1996, 2703, 1465, 2578], 2230)
-    femmesh.addVolume([152, 153, 316, 410, 715, 1338, 1339, 1685, 1686, 2604], 2231)
-    femmesh.addVolume([398, 397, 469, 325, 1651, 1870, 1871, 2918, 2661, 2564], 2232)
-    femmesh.addVolume([362, 387, 440, 371, 2957, 1794, 2750, 2965, 1618, 1793], 2233)
-    femmesh.addVolume([130, 387, 362, 371, 1619, 2957, 1488, 1617, 1618, 2965], 2234)
-    femmesh.addVolume([153, 332, 411, 154, 1383, 2628, 1688, 716, 1382, 1689], 2235)
-    femmesh.addVolume([515, 303, 455, 499, 2901, 2966, 2019, 2018, 2875, 1974], 2236)
-    femmesh.addVolume([412, 317, 411, 483, 2782, 2763, 1693, 1913, 2713, 1912], 2237)
-    femmesh.addVolume([540, 317, 354, 355, 2780, 1525, 2859, 2862, 1516, 1469], 2238)
-    femmesh.addVolume([303, 434, 455, 499, 2947, 1826, 2966, 2875, 1963, 1974], 2239)
-    femmesh.addVolume([371, 275, 440, 362, 2665, 2712, 1793, 2965, 1560, 2750], 2240)
-    femmesh.addVolume([280, 364, 503, 337, 1550, 2911, 2727, 1421, 1537, 2729], 2241)
-    femmesh.addVolume([515, 544, 520, 359, 2188, 2181, 2036, 2894, 2820, 2895], 2242)
-    femmesh.addVolume([397, 309, 139, 396, 2660, 1324, 1646, 1648, 2701, 1644], 2243)
-    femmesh.addVolume([205, 89, 55, 90, 2311, 1206, 847, 2267, 647, 1205], 2244)
-    femmesh.addVolume([292, 493, 450, 380, 2822, 1987, 2942, 2823, 1950, 1817], 2245)
-    femmesh.addVolume([116, 292, 117, 380, 1271, 1272, 678, 1604, 2823, 1603], 2246)
-    femmesh.addVolume([333, 317, 484, 355, 1398, 2781, 2641, 1515, 1516, 2642], 2247)
-    femmesh.addVolume([336, 504, 462, 363, 2967, 1992, 2968, 1530, 2526, 2699], 2248)
-    femmesh.addVolume([336, 420, 321, 462, 2488, 2622, 1403, 2968, 1850, 2698], 2249)
-    femmesh.addVolume([288, 365, 345, 556, 1554, 1559, 1438, 2594, 2883, 2595], 2250)
-    femmesh.addVolume([332, 317, 411, 154, 1406, 2763, 2628, 1382, 1341, 1689], 2251)
-    femmesh.addVolume([500, 386, 305, 304, 1965, 2969, 2915, 2939, 2953, 1312], 2252)
-    femmesh.addVolume([342, 518, 447, 283, 2657, 2026, 2658, 1427, 2970, 2917], 2253)
-    femmesh.addVolume([534, 507, 349, 348, 2208, 2963, 2971, 2748, 2747, 1451], 2254)
-    femmesh.addVolume([342, 518, 341, 525, 2657, 2802, 1429, 2563, 2200, 2671], 2255)
-    femmesh.addVolume([339, 464, 519, 307, 2537, 2033, 2538, 1491, 2839, 2810], 2256)
-    femmesh.addVolume([387, 386, 129, 305, 1771, 1615, 1751, 2941, 2969, 1310], 2257)
-    femmesh.addVolume([336, 419, 462, 490, 2489, 1936, 2968, 2692, 1934, 1970], 2258)
-    femmesh.addVolume([100, 276, 372, 92, 1224, 2943, 1588, 1223, 1313, 2944], 2259)
-    femmesh.addVolume([391, 134, 307, 392, 1629, 1321, 2972, 1633, 1631, 2493], 2260)
-    femmesh.addVolume([414, 486, 415, 334, 1921, 1922, 1702, 2962, 2678, 2805], 2261)
-    femmesh.addVolume([320, 336, 418, 161, 1401, 2691, 2951, 1346, 1391, 1710], 2262)
-    femmesh.addVolume([166, 368, 366, 165, 1574, 2522, 1567, 729, 1573, 1564], 2263)
-    femmesh.addVolume([365, 529, 338, 323, 2931, 2800, 1552, 1555, 2932, 1416], 2264)
-    femmesh.addVolume([518, 341, 459, 283, 2802, 2803, 2027, 2970, 1425, 2835], 2265)
-    femmesh.addVolume([522, 364, 308, 337, 2910, 1536, 2775, 2838, 1537, 1414], 2266)
-    femmesh.addVolume([479, 408, 330, 315, 1901, 2889, 2790, 2946, 2742, 1409], 2267)
-    femmesh.addVolume([518, 342, 341, 283, 2657, 1429, 2802, 2970, 1427, 1425], 2268)
-    femmesh.addVolume([138, 137, 395, 327, 700, 1640, 1641, 1369, 1370, 2785], 2269)
-    femmesh.addVolume([405, 313, 147, 404, 2814, 1332, 1670, 1672, 2816, 1668], 2270)
-    femmesh.addVolume([325, 397, 469, 468, 2661, 1870, 2564, 2597, 1868, 1872], 2271)
-    femmesh.addVolume([464, 339, 326, 307, 2537, 1500, 2731, 2839, 1491, 1366], 2272)
-    femmesh.addVolume([377, 111, 286, 110, 1597, 1254, 2625, 1598, 672, 1253], 2273)
-    femmesh.addVolume([512, 357, 542, 356, 2773, 2504, 2173, 2847, 1475, 2848], 2274)
-    femmesh.addVolume([337, 517, 521, 503, 2829, 2195, 2779, 2729, 2025, 2185], 2275)
-    femmesh.addVolume([277, 373, 278, 102, 2922, 2705, 1231, 1227, 1590, 1229], 2276)
-    femmesh.addVolume([277, 442, 278, 373, 2921, 2569, 1231, 2922, 1798, 2705], 2277)
-    femmesh.addVolume([391, 134, 322, 307, 1629, 1361, 2555, 2972, 1321, 1360], 2278)
-    femmesh.addVolume([299, 298, 355, 453, 1294, 1467, 1468, 2811, 2865, 2826], 2279)
-    femmesh.addVolume([318, 485, 542, 356, 2581, 2100, 2583, 1496, 2945, 2848], 2280)
-    femmesh.addVolume([464, 307, 326, 392, 2839, 1366, 2731, 1855, 2493, 2845], 2281)
-    femmesh.addVolume([507, 493, 450, 292, 2001, 1987, 2000, 2964, 2822, 2942], 2282)
-    femmesh.addVolume([354, 540, 539, 483, 2859, 2096, 2579, 2714, 2094, 2092], 2283)
-    femmesh.addVolume([441, 322, 506, 554, 2716, 2769, 1998, 2157, 2718, 2167], 2284)
-    femmesh.addVolume([465, 522, 308, 337, 2040, 2775, 2776, 2778, 2838, 1414], 2285)
-    femmesh.addVolume([111, 287, 112, 426, 1256, 1257, 673, 1734, 2936, 1733], 2286)
-    femmesh.addVolume([423, 281, 492, 443, 2616, 2617, 1944, 1800, 2588, 1945], 2287)
-    femmesh.addVolume([368, 321, 275, 366, 2520, 1392, 2934, 2522, 2464, 2465], 2288)
-    femmesh.addVolume([368, 438, 275, 321, 1787, 2759, 2934, 2520, 2696, 1392], 2289)
-    femmesh.addVolume([276, 441, 306, 322, 2973, 2584, 1317, 1413, 2716, 1353], 2290)
-    femmesh.addVolume([556, 513, 345, 448, 2155, 2888, 2595, 2153, 2014, 2572], 2291)
-    femmesh.addVolume([364, 523, 327, 340, 2737, 2478, 1535, 1538, 2632, 1518], 2292)
-    femmesh.addVolume([461, 288, 378, 448, 2648, 2519, 1846, 1849, 2518, 1813], 2293)
-    femmesh.addVolume([394, 465, 308, 326, 1859, 2776, 2788, 2974, 2732, 1368], 2294)
-    femmesh.addVolume([277, 441, 460, 276, 2755, 1843, 2757, 1228, 2973, 2871], 2295)
-    femmesh.addVolume([326, 394, 136, 308, 2974, 1637, 1367, 1368, 2788, 1323], 2296)
-    femmesh.addVolume([427, 457, 448, 289, 1832, 1948, 1812, 2774, 2849, 2516], 2297)
-    femmesh.addVolume([369, 438, 439, 275, 1788, 1791, 1789, 2534, 2759, 2535], 2298)
-    femmesh.addVolume([137, 394, 395, 308, 1638, 1642, 1640, 1322, 2788, 2784], 2299)
-    femmesh.addVolume([485, 541, 542, 356, 2098, 2102, 2100, 2945, 2846, 2848], 2300)
-    femmesh.addVolume([386, 500, 305, 387, 1965, 2915, 2969, 1771, 1964, 2941], 2301)
-    femmesh.addVolume([425, 377, 286, 110, 1780, 2625, 2668, 1731, 1598, 1253], 2302)
-    femmesh.addVolume([464, 463, 307, 392, 1857, 2840, 2839, 1855, 1854, 2493], 2303)
-    femmesh.addVolume([274, 95, 389, 96, 1217, 1625, 2959, 1215, 655, 1624], 2304)
-    femmesh.addVolume([295, 430, 451, 495, 2656, 1818, 2676, 2677, 1955, 1978], 2305)
-    femmesh.addVolume([397, 309, 468, 325, 2660, 2598, 1868, 2661, 1363, 2597], 2306)
-    femmesh.addVolume([314, 534, 349, 348, 2791, 2971, 1504, 1509, 2748, 1451], 2307)
-    femmesh.addVolume([534, 478, 349, 535, 2077, 2689, 2971, 2081, 2079, 2746], 2308)
-    femmesh.addVolume([512, 497, 300, 356, 2012, 2577, 2758, 2847, 2975, 1471], 2309)
-    femmesh.addVolume([497, 299, 300, 356, 2575, 1297, 2577, 2975, 1470, 1471], 2310)
-    femmesh.addVolume([489, 545, 546, 360, 2110, 2115, 2112, 2602, 2543, 2643], 2311)
-    femmesh.addVolume([148, 405, 329, 147, 1671, 2709, 1376, 710, 1670, 1377], 2312)
-    femmesh.addVolume([512, 497, 356, 550, 2012, 2975, 2847, 2143, 2130, 2858], 2313)
-    femmesh.addVolume([299, 355, 356, 550, 1468, 1472, 1470, 2825, 2827, 2858], 2314)
-    femmesh.addVolume([405, 313, 476, 329, 2814, 2815, 1892, 2709, 1394, 2902], 2315)
-    femmesh.addVolume([497, 299, 356, 550, 2575, 1470, 2975, 2130, 2825, 2858], 2316)
-    femmesh.addVolume([164, 366, 321, 367, 1565, 2464, 2309, 1571, 2523, 2521], 2317)
-    femmesh.addVolume([353, 332, 354, 539, 1511, 1526, 1466, 2860, 2635, 2579], 2318)
-    femmesh.addVolume([408, 479, 330, 407, 1901, 2790, 2889, 1681, 1900, 2787], 2319)
-    femmesh.addVolume([321, 366, 164, 98, 2464, 1565, 2309, 1350, 1566, 1561], 2320)
-    femmesh.addVolume([298, 496, 297, 354, 2863, 2704, 1291, 1465, 2703, 1464], 2321)
-    femmesh.addVolume([387, 362, 440, 305, 2957, 2750, 1794, 2941, 1548, 2950], 2322)
-    femmesh.addVolume([149, 148, 406, 314, 711, 1673, 1674, 1334, 1335, 2566], 2323)
-    femmesh.addVolume([496, 383, 297, 431, 1956, 2559, 2704, 1957, 1776, 2560], 2324)
-    femmesh.addVolume([416, 159, 158, 319, 1704, 721, 1703, 2608, 1344, 1345], 2325)
-    femmesh.addVolume([438, 368, 275, 369, 1787, 2934, 2759, 1788, 1578, 2534], 2326)
-    femmesh.addVolume([131, 130, 362, 371, 692, 1488, 1489, 1584, 1617, 2965], 2327)
-    femmesh.addVolume([504, 438, 462, 363, 1993, 1941, 1992, 2526, 2697, 2699], 2328)
-    femmesh.addVolume([141, 310, 398, 399, 1326, 2897, 1650, 1652, 2912, 1654], 2329)
-    femmesh.addVolume([164, 366, 367, 165, 1565, 2523, 1571, 728, 1564, 1572], 2330)
-    femmesh.addVolume([336, 420, 462, 419, 2488, 1850, 2968, 2489, 1717, 1936], 2331)
-    femmesh.addVolume([504, 336, 462, 490, 2967, 2968, 1992, 1994, 2692, 1970], 2332)
-    femmesh.addVolume([474, 402, 473, 312, 1885, 1883, 1887, 2720, 2652, 2554], 2333)
-    femmesh.addVolume([94, 435, 388, 274, 1754, 1759, 1622, 1218, 2869, 2976], 2334)
-    femmesh.addVolume([306, 501, 388, 437, 2870, 1966, 2506, 2490, 1967, 1852], 2335)
-    femmesh.addVolume([450, 292, 293, 349, 2942, 1276, 2546, 2766, 1449, 1450], 2336)
-    femmesh.addVolume([369, 167, 366, 370, 1577, 1568, 2893, 1581, 1579, 2916], 2337)
-    femmesh.addVolume([509, 296, 352, 495, 2497, 1459, 2857, 2005, 2545, 2783], 2338)
-    femmesh.addVolume([357, 555, 543, 358, 2507, 2217, 2505, 1478, 2923, 2807], 2339)
-    femmesh.addVolume([538, 353, 509, 539, 2855, 2495, 2168, 2093, 2860, 2178], 2340)
-    femmesh.addVolume([359, 544, 319, 488, 2820, 2949, 1524, 2821, 2107, 2977], 2341)
-    femmesh.addVolume([335, 320, 489, 417, 1402, 2600, 2601, 2874, 2952, 1930], 2342)
-    femmesh.addVolume([496, 298, 297, 383, 2863, 1291, 2704, 1956, 2492, 2559], 2343)
-    femmesh.addVolume([302, 126, 385, 127, 1301, 1614, 2483, 1302, 688, 1613], 2344)
-    femmesh.addVolume([205, 89, 90, 248, 2311, 647, 2267, 2312, 1016, 1017], 2345)
-    femmesh.addVolume([526, 342, 343, 310, 2695, 1432, 2724, 2722, 1498, 1502], 2346)
-    femmesh.addVolume([284, 445, 343, 285, 2540, 2510, 1430, 1252, 2541, 1431], 2347)
-    femmesh.addVolume([300, 384, 433, 125, 2485, 1769, 2486, 1296, 1611, 1748], 2348)
-    femmesh.addVolume([362, 363, 440, 305, 1557, 2711, 2750, 1548, 1556, 2950], 2349)
-    femmesh.addVolume([351, 508, 451, 294, 2719, 2002, 2710, 1455, 2794, 2796], 2350)
-    femmesh.addVolume([507, 493, 292, 348, 2001, 2822, 2964, 2747, 2762, 1447], 2351)
-    femmesh.addVolume([463, 391, 322, 307, 1853, 2555, 2573, 2840, 2972, 1360], 2352)
-    femmesh.addVolume([467, 309, 396, 327, 2960, 2701, 1865, 2479, 1407, 2702], 2353)
-    femmesh.addVolume([364, 280, 503, 443, 1550, 2727, 2911, 2590, 2726, 1990], 2354)
-    femmesh.addVolume([295, 351, 451, 294, 1456, 2710, 2676, 1282, 1455, 2796], 2355)
-    femmesh.addVolume([424, 375, 107, 283, 1760, 1593, 1730, 2662, 2833, 1244], 2356)
-    femmesh.addVolume([326, 394, 393, 136, 2974, 1639, 2886, 1367, 1637, 1635], 2357)
-    femmesh.addVolume([277, 441, 276, 322, 2755, 2973, 1228, 1546, 2716, 1413], 2358)
-    femmesh.addVolume([277, 372, 421, 101, 2797, 1722, 2568, 1226, 1587, 1721], 2359)
-    femmesh.addVolume([467, 395, 466, 327, 1864, 1862, 1866, 2479, 2785, 2480], 2360)
-    femmesh.addVolume([287, 112, 426, 288, 1257, 1733, 2936, 1261, 1259, 2887], 2361)
-    femmesh.addVolume([424, 375, 283, 459, 1760, 2833, 2662, 1838, 1839, 2835], 2362)
-    femmesh.addVolume([427, 289, 114, 290, 2774, 1263, 1735, 2978, 1267, 1265], 2363)
-    femmesh.addVolume([379, 427, 114, 290, 1772, 1735, 1602, 2772, 2978, 1265], 2364)
-    femmesh.addVolume([379, 449, 457, 290, 1815, 1833, 1831, 2772, 2904, 2739], 2365)
-    femmesh.addVolume([291, 379, 290, 449, 2854, 2772, 1270, 2817, 1815, 2904], 2366)
-    femmesh.addVolume([507, 552, 349, 450, 2134, 2765, 2963, 2000, 2133, 2766], 2367)
-    femmesh.addVolume([381, 295, 451, 294, 2707, 2676, 1819, 2708, 1282, 2796], 2368)
-    femmesh.addVolume([350, 552, 293, 349, 2734, 2764, 1452, 1454, 2765, 1450], 2369)
-    femmesh.addVolume([449, 347, 514, 516, 2925, 2880, 2016, 2020, 2881, 2022], 2370)
-    femmesh.addVolume([379, 427, 290, 457, 1772, 2978, 2772, 1831, 1832, 2739], 2371)
-    femmesh.addVolume([347, 291, 514, 348, 1444, 2761, 2880, 1448, 1446, 2749], 2372)
-    femmesh.addVolume([320, 489, 546, 360, 2600, 2112, 2930, 1533, 2602, 2643], 2373)
-    femmesh.addVolume([465, 394, 393, 326, 1859, 1639, 1858, 2732, 2974, 2886], 2374)
-    femmesh.addVolume([549, 538, 352, 509, 2169, 2856, 2651, 2142, 2168, 2857], 2375)
-    femmesh.addVolume([357, 512, 454, 300, 2773, 2011, 2549, 1473, 2758, 2487], 2376)
-    femmesh.addVolume([544, 487, 319, 488, 2106, 2907, 2949, 2107, 1929, 2977], 2377)
-    femmesh.addVolume([317, 540, 484, 355, 2780, 2095, 2781, 1516, 2862, 2642], 2378)
-    femmesh.addVolume([157, 414, 415, 334, 1698, 1702, 1700, 1387, 2962, 2805], 2379)
-    femmesh.addVolume([274, 306, 91, 92, 2879, 1315, 1214, 1213, 1316, 650], 2380)
-    femmesh.addVolume([511, 282, 492, 459, 2557, 2920, 2010, 2009, 2834, 1983], 2381)
-    femmesh.addVolume([277, 460, 506, 442, 2757, 1997, 2756, 2921, 1943, 1999], 2382)
-    femmesh.addVolume([335, 159, 417, 416, 1389, 1706, 2874, 2607, 1704, 1708], 2383)
-    femmesh.addVolume([515, 545, 360, 546, 2209, 2543, 2532, 2212, 2115, 2643], 2384)
-    femmesh.addVolume([314, 478, 349, 534, 2688, 2689, 1504, 2791, 2077, 2971], 2385)
-    femmesh.addVolume([497, 384, 454, 300, 1958, 1825, 1982, 2577, 2485, 2487], 2386)
-    femmesh.addVolume([328, 146, 404, 403, 1374, 1667, 2903, 2613, 1665, 1669], 2387)
-    femmesh.addVolume([513, 289, 345, 448, 2850, 1439, 2888, 2014, 2516, 2572], 2388)
-    femmesh.addVolume([303, 302, 455, 385, 1306, 2905, 2966, 2484, 2483, 1827], 2389)
-    femmesh.addVolume([313, 146, 147, 404, 1333, 709, 1332, 2816, 1667, 1668], 2390)
-    femmesh.addVolume([529, 365, 557, 530, 2931, 2979, 2202, 2066, 2551, 2201], 2391)
-    femmesh.addVolume([507, 292, 349, 348, 2964, 1449, 2963, 2747, 1447, 1451], 2392)
-    femmesh.addVolume([287, 111, 377, 426, 1256, 1597, 2935, 2936, 1734, 1762], 2393)
-    femmesh.addVolume([519, 339, 517, 521, 2538, 2842, 2214, 2039, 2539, 2195], 2394)
-    femmesh.addVolume([364, 522, 523, 553, 2910, 2045, 2737, 2589, 2163, 2192], 2395)
-    femmesh.addVolume([471, 324, 344, 311, 2343, 1544, 2514, 2637, 1372, 1543], 2396)
-    femmesh.addVolume([395, 137, 308, 327, 1640, 1322, 2784, 2785, 1370, 1404], 2397)
-    femmesh.addVolume([456, 551, 285, 344, 2131, 2626, 2666, 2681, 2655, 1433], 2398)
-    femmesh.addVolume([416, 335, 319, 488, 2607, 1400, 2608, 1927, 2754, 2977], 2399)
-    femmesh.addVolume([358, 487, 334, 319, 2926, 2927, 1495, 1494, 2907, 1405], 2400)
-    femmesh.addVolume([390, 391, 322, 501, 1630, 2555, 2646, 1968, 1973, 2574], 2401)
-    femmesh.addVolume([306, 390, 322, 501, 2654, 2646, 1353, 2870, 1968, 2574], 2402)
-    femmesh.addVolume([277, 441, 322, 506, 2755, 2716, 1546, 2756, 1998, 2769], 2403)
-    femmesh.addVolume([347, 533, 329, 348, 2866, 2924, 1541, 1448, 2843, 1510], 2404)
-    femmesh.addVolume([463, 322, 491, 554, 2573, 2717, 2139, 2147, 2718, 2146], 2405)
-    femmesh.addVolume([357, 318, 542, 356, 1520, 2583, 2504, 1475, 1496, 2848], 2406)
-    femmesh.addVolume([335, 416, 417, 488, 2607, 1708, 2874, 2754, 1927, 1928], 2407)
-    femmesh.addVolume([155, 412, 333, 317, 1692, 2592, 1385, 1340, 2782, 1398], 2408)
-    femmesh.addVolume([413, 412, 484, 333, 1696, 1915, 1916, 2593, 2592, 2641], 2409)
-    femmesh.addVolume([439, 500, 440, 363, 2120, 2029, 1795, 2528, 2527, 2711], 2410)
-    femmesh.addVolume([276, 372, 92, 436, 2943, 2944, 1313, 2872, 1834, 2900], 2411)
-    femmesh.addVolume([413, 485, 333, 484, 1918, 2629, 2593, 1916, 1920, 2641], 2412)
-    femmesh.addVolume([485, 486, 414, 318, 1923, 1921, 1919, 2581, 2582, 2513], 2413)
-    femmesh.addVolume([287, 446, 377, 286, 2884, 1808, 2935, 1258, 2623, 2625], 2414)
-    femmesh.addVolume([472, 529, 323, 338, 2061, 2932, 2620, 2799, 2800, 1416], 2415)
-    femmesh.addVolume([507, 534, 349, 535, 2208, 2971, 2963, 2171, 2081, 2746], 2416)
-    femmesh.addVolume([473, 402, 323, 312, 1883, 2882, 2933, 2554, 2652, 1373], 2417)
-    femmesh.addVolume([537, 508, 549, 351, 2177, 2125, 2176, 2673, 2719, 2649], 2418)
-    femmesh.addVolume([320, 489, 490, 546, 2600, 1935, 2956, 2930, 2112, 2113], 2419)
-    femmesh.addVolume([504, 361, 336, 490, 2937, 1527, 2967, 1994, 2938, 2692], 2420)
-    femmesh.addVolume([276, 306, 389, 274, 1317, 2980, 2873, 2878, 2879, 2959], 2421)
-    femmesh.addVolume([457, 427, 290, 289, 1832, 2978, 2739, 2849, 2774, 1267], 2422)
-    femmesh.addVolume([548, 529, 338, 557, 2191, 2800, 2771, 2210, 2202, 2955], 2423)
-    femmesh.addVolume([441, 306, 435, 389, 2584, 2586, 1797, 1796, 2980, 1785], 2424)
-    femmesh.addVolume([328, 145, 146, 403, 1375, 708, 1374, 2613, 1664, 1665], 2425)
-    femmesh.addVolume([288, 112, 426, 378, 1259, 1733, 2887, 2519, 1600, 1757], 2426)
-    femmesh.addVolume([309, 397, 468, 396, 2660, 1868, 2598, 2701, 1648, 1867], 2427)
-    femmesh.addVolume([298, 299, 432, 453, 1294, 2669, 2767, 2865, 2811, 1822], 2428)
-    femmesh.addVolume([441, 276, 306, 389, 2973, 1317, 2584, 1796, 2873, 2980], 2429)
-    femmesh.addVolume([287, 365, 557, 338, 1553, 2979, 2954, 1437, 1552, 2955], 2430)
-    femmesh.addVolume([306, 435, 389, 274, 2586, 1785, 2980, 2879, 2869, 2959], 2431)
-    femmesh.addVolume([447, 518, 459, 283, 2026, 2027, 1840, 2917, 2970, 2835], 2432)
-    femmesh.addVolume([551, 445, 456, 285, 2132, 1947, 2131, 2626, 2541, 2666], 2433)
-    femmesh.addVolume([540, 354, 505, 355, 2859, 2578, 2179, 2862, 1469, 2877], 2434)
-    femmesh.addVolume([298, 453, 505, 355, 2865, 1995, 2864, 1467, 2826, 2877], 2435)
-    femmesh.addVolume([354, 298, 505, 355, 1465, 2864, 2578, 1469, 1467, 2877], 2436)
-    femmesh.addVolume([276, 441, 460, 389, 2973, 1843, 2871, 2873, 1796, 1842], 2437)
-    femmesh.addVolume([274, 276, 436, 389, 2878, 2872, 2634, 2959, 2873, 1786], 2438)
-    femmesh.addVolume([142, 324, 400, 311, 1359, 2981, 1655, 1329, 1372, 2638], 2439)
-    femmesh.addVolume([366, 368, 367, 165, 2522, 1575, 2523, 1564, 1573, 1572], 2440)
-    femmesh.addVolume([541, 485, 333, 356, 2098, 2629, 2639, 2846, 2945, 1497], 2441)
-    femmesh.addVolume([350, 479, 330, 315, 2789, 2790, 1522, 1521, 2946, 1409], 2442)
-    femmesh.addVolume([314, 478, 534, 477, 2688, 2077, 2791, 2792, 1899, 2076], 2443)
-    femmesh.addVolume([343, 526, 527, 502, 2724, 2057, 2636, 2511, 2186, 2175], 2444)
-    femmesh.addVolume([471, 324, 400, 399, 2343, 2981, 1877, 1876, 2508, 1657], 2445)
-    femmesh.addVolume([530, 474, 473, 312, 2065, 1887, 2064, 2553, 2720, 2554], 2446)
-    femmesh.addVolume([150, 408, 330, 407, 1679, 2889, 1378, 1677, 1681, 2787], 2447)
-    femmesh.addVolume([324, 471, 400, 311, 2343, 1877, 2981, 1372, 2637, 2638], 2448)
-    femmesh.addVolume([449, 291, 514, 347, 2817, 2761, 2016, 2925, 1444, 2880], 2449)
-    femmesh.addVolume([424, 447, 459, 283, 1810, 1840, 1838, 2662, 2917, 2835], 2450)
-    femmesh.addVolume([361, 320, 336, 490, 1528, 1401, 1527, 2938, 2956, 2692], 2451)
-    femmesh.addVolume([361, 500, 305, 304, 2914, 2915, 1486, 1485, 2939, 1312], 2452)
-    femmesh.addVolume([376, 445, 285, 425, 1806, 2541, 2530, 1761, 1805, 2667], 2453)
-    femmesh.addVolume([504, 361, 546, 547, 2937, 2929, 2114, 2215, 2958, 2216], 2454)
-    femmesh.addVolume([500, 387, 440, 305, 1964, 1794, 2029, 2915, 2941, 2950], 2455)
-    femmesh.addVolume([443, 280, 503, 444, 2726, 2727, 1990, 1804, 2728, 1991], 2456)
-    femmesh.addVolume([343, 526, 470, 527, 2724, 2053, 2913, 2636, 2057, 2055], 2457)
-    femmesh.addVolume([537, 331, 481, 480, 2672, 2605, 2086, 2085, 2674, 1908], 2458)
-    femmesh.addVolume([529, 365, 338, 557, 2931, 1552, 2800, 2202, 2979, 2955], 2459)
-    femmesh.addVolume([434, 303, 304, 499, 2947, 1309, 2948, 1963, 2875, 2876], 2460)
-    femmesh.addVolume([435, 306, 388, 274, 2586, 2506, 1759, 2869, 2879, 2976], 2461)
-    femmesh.addVolume([278, 339, 279, 458, 1418, 1419, 1234, 2570, 2852, 2909], 2462)
-    femmesh.addVolume([93, 94, 388, 91, 653, 1622, 1623, 1210, 1216, 2502], 2463)
-    femmesh.addVolume([310, 342, 325, 469, 1498, 1499, 1371, 2723, 2562, 2564], 2464)
-    femmesh.addVolume([310, 526, 469, 470, 2722, 2052, 2723, 2898, 2053, 1875], 2465)
-    femmesh.addVolume([324, 142, 400, 399, 1359, 1655, 2981, 2508, 1653, 1657], 2466)
-    femmesh.addVolume([524, 511, 525, 341, 2198, 2199, 2051, 2670, 2558, 2671], 2467)
-    femmesh.addVolume([331, 152, 410, 409, 1380, 1685, 2603, 2837, 1683, 1687], 2468)
-    femmesh.addVolume([479, 478, 535, 330, 1902, 2079, 2080, 2790, 2690, 2745], 2469)
-    femmesh.addVolume([94, 274, 388, 91, 1218, 2976, 1622, 1216, 1214, 2502], 2470)
-    femmesh.addVolume([479, 350, 535, 536, 2789, 2735, 2080, 2082, 2736, 2084], 2471)
-    femmesh.addVolume([141, 324, 310, 399, 1357, 1358, 1326, 1652, 2508, 2912], 2472)
-    femmesh.addVolume([274, 306, 388, 91, 2879, 2506, 2976, 1214, 1315, 2502], 2473)
-    femmesh.addVolume([346, 457, 513, 516, 2738, 2013, 2928, 2740, 2021, 2151], 2474)
-    femmesh.addVolume([548, 551, 344, 528, 2144, 2655, 2680, 2165, 2166, 2700], 2475)
-    femmesh.addVolume([401, 472, 311, 400, 1880, 2621, 2619, 1660, 1879, 2638], 2476)
-    femmesh.addVolume([506, 307, 322, 278, 2808, 1360, 2769, 2571, 1490, 1549], 2477)
-    femmesh.addVolume([311, 142, 143, 400, 1329, 705, 1328, 2638, 1655, 1656], 2478)
-    femmesh.addVolume([310, 398, 399, 470, 2897, 1654, 2912, 2898, 1873, 1874], 2479)
-    femmesh.addVolume([310, 526, 470, 343, 2722, 2053, 2898, 1502, 2724, 2913], 2480)
-    femmesh.addVolume([398, 397, 325, 140, 1651, 2661, 2918, 1649, 1647, 1364], 2481)
-    femmesh.addVolume([310, 398, 325, 140, 2897, 2918, 1371, 1327, 1649, 1364], 2482)
-    femmesh.addVolume([482, 353, 316, 538, 2609, 1512, 2611, 2089, 2855, 2892], 2483)
-    femmesh.addVolume([499, 304, 547, 360, 2876, 2940, 2117, 2531, 1483, 2533], 2484)
-    femmesh.addVolume([386, 434, 304, 499, 1779, 2948, 2953, 1962, 1963, 2876], 2485)
-    femmesh.addVolume([410, 482, 411, 316, 1909, 1910, 1690, 2604, 2611, 2653], 2486)
-    femmesh.addVolume([537, 331, 352, 481, 2672, 1506, 2844, 2086, 2605, 2861], 2487)
-    femmesh.addVolume([358, 544, 319, 359, 2806, 2949, 1494, 1481, 2820, 1524], 2488)
-    femmesh.addVolume([538, 537, 352, 481, 2090, 2844, 2856, 2088, 2086, 2861], 2489)
-    femmesh.addVolume([479, 350, 536, 315, 2789, 2736, 2082, 2946, 1521, 2906], 2490)
-    femmesh.addVolume([320, 335, 160, 417, 1402, 1388, 1347, 2952, 2874, 1707], 2491)
-    femmesh.addVolume([320, 160, 418, 417, 1347, 1709, 2951, 2952, 1707, 1711], 2492)
-    femmesh.addVolume([331, 152, 316, 410, 1380, 1339, 1411, 2603, 1685, 2604], 2493)
-    femmesh.addVolume([409, 331, 481, 410, 2837, 2605, 1906, 1687, 2603, 1907], 2494)
-    femmesh.addVolume([325, 468, 469, 525, 2597, 1872, 2564, 2565, 2049, 2050], 2495)
-    femmesh.addVolume([276, 100, 372, 101, 1224, 1588, 2943, 1225, 662, 1587], 2496)
-    femmesh.addVolume([284, 445, 376, 447, 2540, 1806, 2529, 2647, 1811, 1809], 2497)
-    femmesh.addVolume([487, 319, 415, 334, 2907, 2804, 1924, 2927, 1405, 2805], 2498)
-    femmesh.addVolume([353, 296, 352, 509, 1461, 1459, 1463, 2495, 2497, 2857], 2499)
-    femmesh.addVolume([375, 281, 282, 492, 2615, 1243, 2832, 1946, 2617, 2920], 2500)
-    femmesh.addVolume([515, 303, 499, 360, 2901, 2875, 2018, 2532, 1482, 2531], 2501)
-    femmesh.addVolume([277, 460, 442, 421, 2757, 1943, 2921, 2568, 1845, 1799], 2502)
-    femmesh.addVolume([443, 281, 492, 553, 2588, 2617, 1945, 2137, 2587, 2136], 2503)
-    femmesh.addVolume([511, 340, 492, 282, 2556, 2596, 2010, 2557, 1423, 2920], 2504)
-    femmesh.addVolume([277, 372, 101, 276, 2797, 1587, 1226, 1228, 2943, 1225], 2505)
-    femmesh.addVolume([321, 163, 164, 420, 1348, 1570, 2309, 2622, 1716, 1719], 2506)
-    femmesh.addVolume([277, 372, 276, 460, 2797, 2943, 1228, 2757, 1844, 2871], 2507)
-    femmesh.addVolume([306, 435, 388, 491, 2586, 1759, 2506, 2585, 1937, 1938], 2508)
-    femmesh.addVolume([291, 449, 514, 493, 2817, 2016, 2761, 2760, 1972, 2015], 2509)
-    femmesh.addVolume([329, 533, 476, 477, 2924, 2073, 2902, 2899, 2074, 1896], 2510)
-    femmesh.addVolume([402, 145, 312, 403, 1662, 1330, 2652, 1666, 1664, 2721], 2511)
-    femmesh.addVolume([304, 361, 547, 360, 1485, 2958, 2940, 1483, 1487, 2533], 2512)
-    femmesh.addVolume([556, 530, 345, 531, 2203, 2813, 2595, 2204, 2069, 2753], 2513)
-    femmesh.addVolume([291, 493, 348, 292, 2760, 2762, 1446, 1273, 2822, 1447], 2514)
-    femmesh.addVolume([501, 306, 491, 322, 2870, 2585, 1969, 2574, 1353, 2717], 2515)
-    femmesh.addVolume([306, 441, 491, 322, 2584, 1939, 2585, 1353, 2716, 2717], 2516)
-    femmesh.addVolume([287, 288, 426, 461, 1261, 2887, 2936, 2982, 2648, 1847], 2517)
-    femmesh.addVolume([494, 381, 294, 429, 1952, 2708, 2795, 1953, 1774, 2851], 2518)
-    femmesh.addVolume([423, 280, 281, 443, 2725, 1240, 2616, 1800, 2726, 2588], 2519)
-    femmesh.addVolume([452, 296, 495, 382, 2496, 2545, 1985, 1821, 2644, 1954], 2520)
-    femmesh.addVolume([280, 364, 281, 443, 1550, 1551, 1240, 2726, 2590, 2588], 2521)
-    femmesh.addVolume([496, 298, 383, 453, 2863, 2492, 1956, 1984, 2865, 1823], 2522)
-    femmesh.addVolume([364, 443, 503, 553, 2590, 1990, 2911, 2589, 2137, 2141], 2523)
-    femmesh.addVolume([482, 353, 538, 539, 2609, 2855, 2089, 2091, 2860, 2093], 2524)
-    femmesh.addVolume([342, 284, 447, 502, 1428, 2647, 2658, 2659, 2630, 1989], 2525)
-    femmesh.addVolume([384, 299, 124, 300, 2576, 1293, 1612, 2485, 1297, 1295], 2526)
-    femmesh.addVolume([277, 442, 506, 278, 2921, 1999, 2756, 1231, 2569, 2571], 2527)
-    femmesh.addVolume([354, 353, 539, 510, 1466, 2860, 2579, 2580, 2682, 2160], 2528)
-    femmesh.addVolume([496, 452, 297, 510, 1977, 2561, 2704, 2006, 2007, 2683], 2529)
-    femmesh.addVolume([284, 342, 343, 502, 1428, 1432, 1430, 2630, 2659, 2511], 2530)
-    femmesh.addVolume([374, 280, 444, 279, 2693, 2728, 1802, 2694, 1237, 2831], 2531)
-    femmesh.addVolume([555, 358, 498, 520, 2923, 2501, 2148, 2156, 2500, 2035], 2532)
-    femmesh.addVolume([487, 416, 319, 488, 1925, 2608, 2907, 1929, 1927, 2977], 2533)
-    femmesh.addVolume([280, 337, 444, 279, 1421, 2730, 2728, 1237, 1420, 2831], 2534)
-    femmesh.addVolume([361, 500, 504, 363, 2914, 2121, 2937, 1531, 2527, 2526], 2535)
-    femmesh.addVolume([311, 472, 323, 338, 2621, 2620, 1355, 1417, 2799, 1416], 2536)
-    femmesh.addVolume([402, 144, 323, 312, 1661, 1356, 2882, 2652, 1331, 1373], 2537)
-    femmesh.addVolume([453, 299, 497, 550, 2811, 2575, 1976, 2128, 2825, 2130], 2538)
-    femmesh.addVolume([280, 443, 374, 444, 2726, 1801, 2693, 2728, 1804, 1802], 2539)
-    femmesh.addVolume([465, 464, 326, 393, 1860, 2731, 2732, 1858, 1856, 2886], 2540)
-    femmesh.addVolume([463, 391, 307, 392, 1853, 2972, 2840, 1854, 1633, 2493], 2541)
-    femmesh.addVolume([288, 287, 365, 461, 1261, 1553, 1554, 2648, 2982, 2983], 2542)
-    femmesh.addVolume([365, 556, 461, 557, 2883, 2154, 2983, 2979, 2213, 2189], 2543)
-    femmesh.addVolume([365, 288, 461, 556, 1554, 2648, 2983, 2883, 2594, 2154], 2544)
-    femmesh.addVolume([287, 446, 557, 461, 2884, 2190, 2954, 2982, 1848, 2189], 2545)
-    femmesh.addVolume([288, 113, 378, 289, 1260, 1599, 2519, 1264, 1262, 2517], 2546)
-    femmesh.addVolume([93, 9, 91, 437, 652, 649, 1210, 1621, 1620, 2491], 2547)
-    femmesh.addVolume([386, 304, 129, 305, 2953, 1308, 1615, 2969, 1312, 1310], 2548)
-    femmesh.addVolume([446, 287, 426, 461, 2884, 2936, 1807, 1848, 2982, 1847], 2549)
-    femmesh.addVolume([309, 467, 340, 327, 2960, 2631, 1517, 1407, 2479, 1518], 2550)
-    femmesh.addVolume([468, 309, 524, 341, 2598, 2961, 2047, 2599, 1493, 2670], 2551)
-    femmesh.addVolume([375, 282, 107, 283, 2832, 1242, 1593, 2833, 1246, 1244], 2552)
-    femmesh.addVolume([309, 467, 524, 340, 2960, 2046, 2961, 1517, 2631, 2633], 2553)
-    femmesh.addVolume([350, 552, 349, 535, 2734, 2765, 1454, 2735, 2170, 2746], 2554)
-    femmesh.addVolume([467, 309, 524, 468, 2960, 2961, 2046, 1869, 2598, 2047], 2555)
-    femmesh.addVolume([361, 504, 336, 363, 2937, 2967, 1527, 1531, 2526, 1530], 2556)
-    femmesh.addVolume([313, 347, 476, 329, 1542, 2867, 2815, 1394, 1541, 2902], 2557)
-    femmesh.addVolume([153, 410, 411, 316, 1686, 1690, 1688, 1338, 2604, 2653], 2558)
-    femmesh.addVolume([358, 302, 520, 359, 1477, 2498, 2500, 1481, 1479, 2895], 2559)
-    femmesh.addVolume([321, 336, 462, 363, 1403, 2968, 2698, 1529, 1530, 2699], 2560)
-    femmesh.addVolume([347, 533, 476, 329, 2866, 2073, 2867, 1541, 2924, 2902], 2561)
-    femmesh.addVolume([368, 321, 367, 462, 2520, 2521, 1575, 1940, 2698, 1851], 2562)
-    femmesh.addVolume([365, 530, 556, 557, 2551, 2203, 2883, 2979, 2201, 2213], 2563)
-    femmesh.addVolume([346, 516, 513, 532, 2740, 2151, 2928, 2687, 2193, 2194], 2564)
-    femmesh.addVolume([420, 321, 367, 164, 2622, 2521, 1720, 1719, 2309, 1571], 2565)
-    femmesh.addVolume([166, 167, 366, 369, 730, 1568, 1567, 1576, 1577, 2893], 2566)
-    femmesh.addVolume([520, 302, 455, 359, 2498, 2905, 2034, 2895, 1479, 2896], 2567)
-    femmesh.addVolume([377, 456, 425, 286, 1828, 1829, 1780, 2625, 2624, 2668], 2568)
-    femmesh.addVolume([531, 346, 513, 532, 2841, 2928, 2196, 2072, 2687, 2194], 2569)
-    femmesh.addVolume([324, 141, 142, 399, 1357, 704, 1359, 2508, 1652, 1653], 2570)
-    femmesh.addVolume([347, 313, 476, 532, 1542, 2815, 2867, 2868, 2685, 2071], 2571)
-    femmesh.addVolume([427, 289, 448, 378, 2774, 2516, 1812, 1763, 2517, 1813], 2572)
-    femmesh.addVolume([373, 458, 279, 422, 1836, 2909, 2908, 1752, 1835, 2715], 2573)
-    femmesh.addVolume([479, 315, 536, 480, 2946, 2906, 2082, 1905, 2744, 2083], 2574)
-    femmesh.addVolume([452, 496, 297, 431, 1977, 2704, 2561, 1820, 1957, 2560], 2575)
-    femmesh.addVolume([295, 430, 495, 296, 2656, 1955, 2677, 1285, 2798, 2545], 2576)
-    femmesh.addVolume([545, 515, 360, 359, 2209, 2532, 2543, 2544, 2894, 1484], 2577)
-    femmesh.addVolume([508, 350, 351, 536, 2890, 1457, 2719, 2184, 2736, 2828], 2578)
-    femmesh.addVolume([537, 351, 480, 536, 2673, 2675, 2085, 2087, 2828, 2083], 2579)
-    femmesh.addVolume([302, 303, 455, 359, 1306, 2966, 2905, 1479, 1480, 2896], 2580)
-    femmesh.addVolume([303, 515, 455, 359, 2901, 2019, 2966, 1480, 2894, 2896], 2581)
-    femmesh.addVolume([522, 364, 466, 308, 2910, 2819, 2041, 2775, 1536, 2777], 2582)
-    femmesh.addVolume([500, 361, 504, 547, 2914, 2937, 2121, 2116, 2958, 2215], 2583)
-    femmesh.addVolume([296, 121, 382, 297, 1284, 1607, 2644, 1288, 1286, 2645], 2584)
-    femmesh.addVolume([335, 359, 319, 488, 1523, 1524, 1400, 2754, 2821, 2977], 2585)
-    femmesh.addVolume([302, 126, 301, 385, 1301, 1299, 1303, 2483, 1614, 2524], 2586)
-    femmesh.addVolume([364, 522, 466, 523, 2910, 2041, 2819, 2737, 2045, 2043], 2587)
-    femmesh.addVolume([540, 317, 483, 354, 2780, 2713, 2094, 2859, 1525, 2714], 2588)
-    femmesh.addVolume([346, 347, 290, 516, 1445, 1443, 1441, 2740, 2881, 2741], 2589)
-    femmesh.addVolume([365, 287, 557, 461, 1553, 2954, 2979, 2983, 2982, 2189], 2590)
-    femmesh.addVolume([546, 361, 360, 547, 2929, 1487, 2643, 2216, 2958, 2533], 2591)
-    femmesh.addVolume([365, 473, 323, 312, 2552, 2933, 1555, 1558, 2554, 1373], 2592)
-    femmesh.addVolume([434, 303, 455, 385, 2947, 2966, 1826, 1770, 2484, 1827], 2593)
-    femmesh.addVolume([401, 311, 143, 400, 2619, 1328, 1658, 1660, 2638, 1656], 2594)
-    femmesh.addVolume([434, 127, 303, 385, 1750, 1304, 2947, 1770, 1613, 2484], 2595)
-    femmesh.addVolume([135, 326, 393, 136, 1365, 2886, 1634, 698, 1367, 1635], 2596)
-    return True
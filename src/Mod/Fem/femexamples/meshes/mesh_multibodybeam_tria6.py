@@ -1,1889 +0,0 @@
-def create_nodes(femmesh):
-    # nodes
-    femmesh.addNode(100.0, 10.0, 0.0, 1)
-    femmesh.addNode(100.0, 0.0, 0.0, 2)
-    femmesh.addNode(80.0, 10.0, 0.0, 3)
-    femmesh.addNode(80.0, 0.0, 0.0, 4)
-    femmesh.addNode(60.0, 10.0, 0.0, 5)
-    femmesh.addNode(60.0, 0.0, 0.0, 6)
-    femmesh.addNode(40.0, 10.0, 0.0, 7)
-    femmesh.addNode(40.0, 0.0, 0.0, 8)
-    femmesh.addNode(20.0, 10.0, 0.0, 9)
-    femmesh.addNode(20.0, 0.0, 0.0, 10)
-    femmesh.addNode(0.0, 10.0, 0.0, 11)
-    femmesh.addNode(0.0, 0.0, 0.0, 12)
-    femmesh.addNode(80.0, 2.0, 0.0, 13)
-    femmesh.addNode(80.0, 4.0, 0.0, 14)
-    femmesh.addNode(80.0, 6.0, 0.0, 15)
-    femmesh.addNode(80.0, 8.0, 0.0, 16)
-    femmesh.addNode(82.0, 0.0, 0.0, 17)
-    femmesh.addNode(84.0, 0.0, 0.0, 18)
-    femmesh.addNode(86.0, 0.0, 0.0, 19)
-    femmesh.addNode(88.0, 0.0, 0.0, 20)
-    femmesh.addNode(90.0, 0.0, 0.0, 21)
-    femmesh.addNode(92.0, 0.0, 0.0, 22)
-    femmesh.addNode(94.0, 0.0, 0.0, 23)
-    femmesh.addNode(96.0, 0.0, 0.0, 24)
-    femmesh.addNode(98.0, 0.0, 0.0, 25)
-    femmesh.addNode(82.0, 10.0, 0.0, 26)
-    femmesh.addNode(84.0, 10.0, 0.0, 27)
-    femmesh.addNode(86.0, 10.0, 0.0, 28)
-    femmesh.addNode(88.0, 10.0, 0.0, 29)
-    femmesh.addNode(90.0, 10.0, 0.0, 30)
-    femmesh.addNode(92.0, 10.0, 0.0, 31)
-    femmesh.addNode(94.0, 10.0, 0.0, 32)
-    femmesh.addNode(96.0, 10.0, 0.0, 33)
-    femmesh.addNode(98.0, 10.0, 0.0, 34)
-    femmesh.addNode(100.0, 2.0, 0.0, 35)
-    femmesh.addNode(100.0, 4.0, 0.0, 36)
-    femmesh.addNode(100.0, 6.0, 0.0, 37)
-    femmesh.addNode(100.0, 8.0, 0.0, 38)
-    femmesh.addNode(60.0, 2.0, 0.0, 39)
-    femmesh.addNode(60.0, 4.0, 0.0, 40)
-    femmesh.addNode(60.0, 6.0, 0.0, 41)
-    femmesh.addNode(60.0, 8.0, 0.0, 42)
-    femmesh.addNode(62.0, 0.0, 0.0, 43)
-    femmesh.addNode(64.0, 0.0, 0.0, 44)
-    femmesh.addNode(66.0, 0.0, 0.0, 45)
-    femmesh.addNode(68.0, 0.0, 0.0, 46)
-    femmesh.addNode(70.0, 0.0, 0.0, 47)
-    femmesh.addNode(72.0, 0.0, 0.0, 48)
-    femmesh.addNode(74.0, 0.0, 0.0, 49)
-    femmesh.addNode(76.0, 0.0, 0.0, 50)
-    femmesh.addNode(78.0, 0.0, 0.0, 51)
-    femmesh.addNode(62.0, 10.0, 0.0, 52)
-    femmesh.addNode(64.0, 10.0, 0.0, 53)
-    femmesh.addNode(66.0, 10.0, 0.0, 54)
-    femmesh.addNode(68.0, 10.0, 0.0, 55)
-    femmesh.addNode(70.0, 10.0, 0.0, 56)
-    femmesh.addNode(72.0, 10.0, 0.0, 57)
-    femmesh.addNode(74.0, 10.0, 0.0, 58)
-    femmesh.addNode(76.0, 10.0, 0.0, 59)
-    femmesh.addNode(78.0, 10.0, 0.0, 60)
-    femmesh.addNode(40.0, 2.0, 0.0, 61)
-    femmesh.addNode(40.0, 4.0, 0.0, 62)
-    femmesh.addNode(40.0, 6.0, 0.0, 63)
-    femmesh.addNode(40.0, 8.0, 0.0, 64)
-    femmesh.addNode(42.0, 0.0, 0.0, 65)
-    femmesh.addNode(44.0, 0.0, 0.0, 66)
-    femmesh.addNode(46.0, 0.0, 0.0, 67)
-    femmesh.addNode(48.0, 0.0, 0.0, 68)
-    femmesh.addNode(50.0, 0.0, 0.0, 69)
-    femmesh.addNode(52.0, 0.0, 0.0, 70)
-    femmesh.addNode(54.0, 0.0, 0.0, 71)
-    femmesh.addNode(56.0, 0.0, 0.0, 72)
-    femmesh.addNode(58.0, 0.0, 0.0, 73)
-    femmesh.addNode(42.0, 10.0, 0.0, 74)
-    femmesh.addNode(44.0, 10.0, 0.0, 75)
-    femmesh.addNode(46.0, 10.0, 0.0, 76)
-    femmesh.addNode(48.0, 10.0, 0.0, 77)
-    femmesh.addNode(50.0, 10.0, 0.0, 78)
-    femmesh.addNode(52.0, 10.0, 0.0, 79)
-    femmesh.addNode(54.0, 10.0, 0.0, 80)
-    femmesh.addNode(56.0, 10.0, 0.0, 81)
-    femmesh.addNode(58.0, 10.0, 0.0, 82)
-    femmesh.addNode(20.0, 2.0, 0.0, 83)
-    femmesh.addNode(20.0, 4.0, 0.0, 84)
-    femmesh.addNode(20.0, 6.0, 0.0, 85)
-    femmesh.addNode(20.0, 8.0, 0.0, 86)
-    femmesh.addNode(22.0, 0.0, 0.0, 87)
-    femmesh.addNode(24.0, 0.0, 0.0, 88)
-    femmesh.addNode(26.0, 0.0, 0.0, 89)
-    femmesh.addNode(28.0, 0.0, 0.0, 90)
-    femmesh.addNode(30.0, 0.0, 0.0, 91)
-    femmesh.addNode(32.0, 0.0, 0.0, 92)
-    femmesh.addNode(34.0, 0.0, 0.0, 93)
-    femmesh.addNode(36.0, 0.0, 0.0, 94)
-    femmesh.addNode(38.0, 0.0, 0.0, 95)
-    femmesh.addNode(22.0, 10.0, 0.0, 96)
-    femmesh.addNode(24.0, 10.0, 0.0, 97)
-    femmesh.addNode(26.0, 10.0, 0.0, 98)
-    femmesh.addNode(28.0, 10.0, 0.0, 99)
-    femmesh.addNode(30.0, 10.0, 0.0, 100)
-    femmesh.addNode(32.0, 10.0, 0.0, 101)
-    femmesh.addNode(34.0, 10.0, 0.0, 102)
-    femmesh.addNode(36.0, 10.0, 0.0, 103)
-    femmesh.addNode(38.0, 10.0, 0.0, 104)
-    femmesh.addNode(0.0, 2.0, 0.0, 105)
-    femmesh.addNode(0.0, 4.0, 0.0, 106)
-    femmesh.addNode(0.0, 6.0, 0.0, 107)
-    femmesh.addNode(0.0, 8.0, 0.0, 108)
-    femmesh.addNode(2.0, 0.0, 0.0, 109)
-    femmesh.addNode(4.0, 0.0, 0.0, 110)
-    femmesh.addNode(6.0, 0.0, 0.0, 111)
-    femmesh.addNode(8.0, 0.0, 0.0, 112)
-    femmesh.addNode(10.0, 0.0, 0.0, 113)
-    femmesh.addNode(12.0, 0.0, 0.0, 114)
-    femmesh.addNode(14.0, 0.0, 0.0, 115)
-    femmesh.addNode(16.0, 0.0, 0.0, 116)
-    femmesh.addNode(18.0, 0.0, 0.0, 117)
-    femmesh.addNode(2.0, 10.0, 0.0, 118)
-    femmesh.addNode(4.0, 10.0, 0.0, 119)
-    femmesh.addNode(6.0, 10.0, 0.0, 120)
-    femmesh.addNode(8.0, 10.0, 0.0, 121)
-    femmesh.addNode(10.0, 10.0, 0.0, 122)
-    femmesh.addNode(12.0, 10.0, 0.0, 123)
-    femmesh.addNode(14.0, 10.0, 0.0, 124)
-    femmesh.addNode(16.0, 10.0, 0.0, 125)
-    femmesh.addNode(18.0, 10.0, 0.0, 126)
-    femmesh.addNode(81.5392197661, 3.15476964347, 0.0, 127)
-    femmesh.addNode(81.5180910518, 4.78237613921, 0.0, 128)
-    femmesh.addNode(81.5662074653, 6.5724608991, 0.0, 129)
-    femmesh.addNode(81.7599576087, 8.30022931513, 0.0, 130)
-    femmesh.addNode(82.6716087772, 1.68867528699, 0.0, 131)
-    femmesh.addNode(86.8424063084, 1.7505519231, 0.0, 132)
-    femmesh.addNode(90.9337698074, 1.81058108381, 0.0, 133)
-    femmesh.addNode(95.0021530838, 1.84678868604, 0.0, 134)
-    femmesh.addNode(83.6543829612, 8.41370661197, 0.0, 135)
-    femmesh.addNode(85.5913872899, 8.4145034167, 0.0, 136)
-    femmesh.addNode(87.542122618, 8.41922038693, 0.0, 137)
-    femmesh.addNode(89.4732015205, 8.44983847147, 0.0, 138)
-    femmesh.addNode(91.3583903926, 8.52850937991, 0.0, 139)
-    femmesh.addNode(93.3029865146, 8.48448880356, 0.0, 140)
-    femmesh.addNode(95.1639533281, 8.42042019762, 0.0, 141)
-    femmesh.addNode(97.2474140121, 8.38478217035, 0.0, 142)
-    femmesh.addNode(98.2900931755, 2.63964686733, 0.0, 143)
-    femmesh.addNode(97.999287578, 6.57227423373, 0.0, 144)
-    femmesh.addNode(84.7606532388, 1.76672278431, 0.0, 145)
-    femmesh.addNode(88.895020277, 1.76168886648, 0.0, 146)
-    femmesh.addNode(93.0047606408, 1.90889561608, 0.0, 147)
-    femmesh.addNode(96.7744342217, 1.58124689867, 0.0, 148)
-    femmesh.addNode(98.1488197125, 4.65182661547, 0.0, 149)
-    femmesh.addNode(82.9199994949, 5.38509185329, 0.0, 150)
-    femmesh.addNode(83.3204951963, 6.84341771921, 0.0, 151)
-    femmesh.addNode(96.1929644973, 5.30378297199, 0.0, 152)
-    femmesh.addNode(91.8553990232, 3.66067934457, 0.0, 153)
-    femmesh.addNode(89.7699972769, 3.52313457422, 0.0, 154)
-    femmesh.addNode(96.4093344424, 3.38843043534, 0.0, 155)
-    femmesh.addNode(85.645954722, 3.48402622746, 0.0, 156)
-    femmesh.addNode(83.420207809, 3.60212852561, 0.0, 157)
-    femmesh.addNode(85.1673196297, 6.81843018946, 0.0, 158)
-    femmesh.addNode(87.0998428052, 6.80994755275, 0.0, 159)
-    femmesh.addNode(89.0145656138, 6.8362902391, 0.0, 160)
-    femmesh.addNode(90.8650584289, 6.92970475583, 0.0, 161)
-    femmesh.addNode(92.5068126228, 7.17021674032, 0.0, 162)
-    femmesh.addNode(87.7263576556, 3.4786736161, 0.0, 163)
-    femmesh.addNode(96.1925323214, 7.02335670706, 0.0, 164)
-    femmesh.addNode(94.1972202057, 4.03486740509, 0.0, 165)
-    femmesh.addNode(94.3378881048, 6.51819092042, 0.0, 166)
-    femmesh.addNode(90.4562016497, 5.25107562191, 0.0, 167)
-    femmesh.addNode(84.5945917648, 5.20830901224, 0.0, 168)
-    femmesh.addNode(86.5147139128, 5.1713602248, 0.0, 169)
-    femmesh.addNode(92.4420536966, 5.50235414588, 0.0, 170)
-    femmesh.addNode(88.5036576232, 5.18447404951, 0.0, 171)
-    femmesh.addNode(61.5392197661, 3.15476964347, 0.0, 172)
-    femmesh.addNode(61.5180910518, 4.78237613921, 0.0, 173)
-    femmesh.addNode(61.5662074653, 6.5724608991, 0.0, 174)
-    femmesh.addNode(61.7599576087, 8.30022931513, 0.0, 175)
-    femmesh.addNode(62.6716087772, 1.68867528699, 0.0, 176)
-    femmesh.addNode(66.8424063084, 1.7505519231, 0.0, 177)
-    femmesh.addNode(70.9337698074, 1.81058108381, 0.0, 178)
-    femmesh.addNode(75.0021530838, 1.84678868604, 0.0, 179)
-    femmesh.addNode(63.6543829612, 8.41370661197, 0.0, 180)
-    femmesh.addNode(65.5913872899, 8.4145034167, 0.0, 181)
-    femmesh.addNode(67.542122618, 8.41922038693, 0.0, 182)
-    femmesh.addNode(69.4732015205, 8.44983847147, 0.0, 183)
-    femmesh.addNode(71.3583903926, 8.52850937991, 0.0, 184)
-    femmesh.addNode(73.3029865146, 8.48448880356, 0.0, 185)
-    femmesh.addNode(75.1639533281, 8.42042019762, 0.0, 186)
-    femmesh.addNode(77.2474140121, 8.38478217035, 0.0, 187)
-    femmesh.addNode(78.2900931755, 2.63964686733, 0.0, 188)
-    femmesh.addNode(77.999287578, 6.57227423373, 0.0, 189)
-    femmesh.addNode(64.7606532388, 1.76672278431, 0.0, 190)
-    femmesh.addNode(68.895020277, 1.76168886648, 0.0, 191)
-    femmesh.addNode(73.0047606408, 1.90889561608, 0.0, 192)
-    femmesh.addNode(76.7744342217, 1.58124689867, 0.0, 193)
-    femmesh.addNode(78.1488197125, 4.65182661547, 0.0, 194)
-    femmesh.addNode(62.9199994949, 5.38509185329, 0.0, 195)
-    femmesh.addNode(63.3204951963, 6.84341771921, 0.0, 196)
-    femmesh.addNode(76.1929644973, 5.30378297199, 0.0, 197)
-    femmesh.addNode(71.8553990232, 3.66067934457, 0.0, 198)
-    femmesh.addNode(69.7699972769, 3.52313457422, 0.0, 199)
-    femmesh.addNode(76.4093344424, 3.38843043534, 0.0, 200)
-    femmesh.addNode(65.645954722, 3.48402622746, 0.0, 201)
-    femmesh.addNode(63.420207809, 3.60212852561, 0.0, 202)
-    femmesh.addNode(65.1673196297, 6.81843018946, 0.0, 203)
-    femmesh.addNode(67.0998428052, 6.80994755275, 0.0, 204)
-    femmesh.addNode(69.0145656138, 6.8362902391, 0.0, 205)
-    femmesh.addNode(70.8650584289, 6.92970475583, 0.0, 206)
-    femmesh.addNode(72.5068126228, 7.17021674032, 0.0, 207)
-    femmesh.addNode(67.7263576556, 3.4786736161, 0.0, 208)
-    femmesh.addNode(76.1925323214, 7.02335670706, 0.0, 209)
-    femmesh.addNode(74.1972202057, 4.03486740509, 0.0, 210)
-    femmesh.addNode(74.3378881048, 6.51819092042, 0.0, 211)
-    femmesh.addNode(70.4562016497, 5.25107562191, 0.0, 212)
-    femmesh.addNode(64.5945917648, 5.20830901224, 0.0, 213)
-    femmesh.addNode(66.5147139128, 5.1713602248, 0.0, 214)
-    femmesh.addNode(72.4420536966, 5.50235414588, 0.0, 215)
-    femmesh.addNode(68.5036576232, 5.18447404951, 0.0, 216)
-    femmesh.addNode(41.5392197661, 3.15476964347, 0.0, 217)
-    femmesh.addNode(41.5180910518, 4.78237613921, 0.0, 218)
-    femmesh.addNode(41.5662074653, 6.5724608991, 0.0, 219)
-    femmesh.addNode(41.7599576087, 8.30022931513, 0.0, 220)
-    femmesh.addNode(42.6716087772, 1.68867528699, 0.0, 221)
-    femmesh.addNode(46.8424063084, 1.7505519231, 0.0, 222)
-    femmesh.addNode(50.9337698074, 1.81058108381, 0.0, 223)
-    femmesh.addNode(55.0021530838, 1.84678868604, 0.0, 224)
-    femmesh.addNode(43.6543829612, 8.41370661197, 0.0, 225)
-    femmesh.addNode(45.5913872899, 8.4145034167, 0.0, 226)
-    femmesh.addNode(47.542122618, 8.41922038693, 0.0, 227)
-    femmesh.addNode(49.4732015205, 8.44983847147, 0.0, 228)
-    femmesh.addNode(51.3583903926, 8.52850937991, 0.0, 229)
-    femmesh.addNode(53.3029865146, 8.48448880356, 0.0, 230)
-    femmesh.addNode(55.1639533281, 8.42042019762, 0.0, 231)
-    femmesh.addNode(57.2474140121, 8.38478217035, 0.0, 232)
-    femmesh.addNode(58.2900931755, 2.63964686733, 0.0, 233)
-    femmesh.addNode(57.999287578, 6.57227423373, 0.0, 234)
-    femmesh.addNode(44.7606532388, 1.76672278431, 0.0, 235)
-    femmesh.addNode(48.895020277, 1.76168886648, 0.0, 236)
-    femmesh.addNode(53.0047606408, 1.90889561608, 0.0, 237)
-    femmesh.addNode(56.7744342217, 1.58124689867, 0.0, 238)
-    femmesh.addNode(58.1488197125, 4.65182661547, 0.0, 239)
-    femmesh.addNode(42.9199994949, 5.38509185329, 0.0, 240)
-    femmesh.addNode(43.3204951963, 6.84341771921, 0.0, 241)
-    femmesh.addNode(56.1929644973, 5.30378297199, 0.0, 242)
-    femmesh.addNode(51.8553990232, 3.66067934457, 0.0, 243)
-    femmesh.addNode(49.7699972769, 3.52313457422, 0.0, 244)
-    femmesh.addNode(56.4093344424, 3.38843043534, 0.0, 245)
-    femmesh.addNode(45.645954722, 3.48402622746, 0.0, 246)
-    femmesh.addNode(43.420207809, 3.60212852561, 0.0, 247)
-    femmesh.addNode(45.1673196297, 6.81843018946, 0.0, 248)
-    femmesh.addNode(47.0998428052, 6.80994755275, 0.0, 249)
-    femmesh.addNode(49.0145656138, 6.8362902391, 0.0, 250)
-    femmesh.addNode(50.8650584289, 6.92970475583, 0.0, 251)
-    femmesh.addNode(52.5068126228, 7.17021674032, 0.0, 252)
-    femmesh.addNode(47.7263576556, 3.4786736161, 0.0, 253)
-    femmesh.addNode(56.1925323214, 7.02335670706, 0.0, 254)
-    femmesh.addNode(54.1972202057, 4.03486740509, 0.0, 255)
-    femmesh.addNode(54.3378881048, 6.51819092042, 0.0, 256)
-    femmesh.addNode(50.4562016497, 5.25107562191, 0.0, 257)
-    femmesh.addNode(44.5945917648, 5.20830901224, 0.0, 258)
-    femmesh.addNode(46.5147139128, 5.1713602248, 0.0, 259)
-    femmesh.addNode(52.4420536966, 5.50235414588, 0.0, 260)
-    femmesh.addNode(48.5036576232, 5.18447404951, 0.0, 261)
-    femmesh.addNode(21.5392197661, 3.15476964347, 0.0, 262)
-    femmesh.addNode(21.5180910518, 4.78237613921, 0.0, 263)
-    femmesh.addNode(21.5662074653, 6.5724608991, 0.0, 264)
-    femmesh.addNode(21.7599576087, 8.30022931513, 0.0, 265)
-    femmesh.addNode(22.6716087772, 1.68867528699, 0.0, 266)
-    femmesh.addNode(26.8424063084, 1.7505519231, 0.0, 267)
-    femmesh.addNode(30.9337698074, 1.81058108381, 0.0, 268)
-    femmesh.addNode(35.0021530838, 1.84678868604, 0.0, 269)
-    femmesh.addNode(23.6543829612, 8.41370661197, 0.0, 270)
-    femmesh.addNode(25.5913872899, 8.4145034167, 0.0, 271)
-    femmesh.addNode(27.542122618, 8.41922038693, 0.0, 272)
-    femmesh.addNode(29.4732015205, 8.44983847147, 0.0, 273)
-    femmesh.addNode(31.3583903926, 8.52850937991, 0.0, 274)
-    femmesh.addNode(33.3029865146, 8.48448880356, 0.0, 275)
-    femmesh.addNode(35.1639533281, 8.42042019762, 0.0, 276)
-    femmesh.addNode(37.2474140121, 8.38478217035, 0.0, 277)
-    femmesh.addNode(38.2900931755, 2.63964686733, 0.0, 278)
-    femmesh.addNode(37.999287578, 6.57227423373, 0.0, 279)
-    femmesh.addNode(24.7606532388, 1.76672278431, 0.0, 280)
-    femmesh.addNode(28.895020277, 1.76168886648, 0.0, 281)
-    femmesh.addNode(33.0047606408, 1.90889561608, 0.0, 282)
-    femmesh.addNode(36.7744342217, 1.58124689867, 0.0, 283)
-    femmesh.addNode(38.1488197125, 4.65182661547, 0.0, 284)
-    femmesh.addNode(22.9199994949, 5.38509185329, 0.0, 285)
-    femmesh.addNode(23.3204951963, 6.84341771921, 0.0, 286)
-    femmesh.addNode(36.1929644973, 5.30378297199, 0.0, 287)
-    femmesh.addNode(31.8553990232, 3.66067934457, 0.0, 288)
-    femmesh.addNode(29.7699972769, 3.52313457422, 0.0, 289)
-    femmesh.addNode(36.4093344424, 3.38843043534, 0.0, 290)
-    femmesh.addNode(25.645954722, 3.48402622746, 0.0, 291)
-    femmesh.addNode(23.420207809, 3.60212852561, 0.0, 292)
-    femmesh.addNode(25.1673196297, 6.81843018946, 0.0, 293)
-    femmesh.addNode(27.0998428052, 6.80994755275, 0.0, 294)
-    femmesh.addNode(29.0145656138, 6.8362902391, 0.0, 295)
-    femmesh.addNode(30.8650584289, 6.92970475583, 0.0, 296)
-    femmesh.addNode(32.5068126228, 7.17021674032, 0.0, 297)
-    femmesh.addNode(27.7263576556, 3.4786736161, 0.0, 298)
-    femmesh.addNode(36.1925323214, 7.02335670706, 0.0, 299)
-    femmesh.addNode(34.1972202057, 4.03486740509, 0.0, 300)
-    femmesh.addNode(34.3378881048, 6.51819092042, 0.0, 301)
-    femmesh.addNode(30.4562016497, 5.25107562191, 0.0, 302)
-    femmesh.addNode(24.5945917648, 5.20830901224, 0.0, 303)
-    femmesh.addNode(26.5147139128, 5.1713602248, 0.0, 304)
-    femmesh.addNode(32.4420536966, 5.50235414588, 0.0, 305)
-    femmesh.addNode(28.5036576232, 5.18447404951, 0.0, 306)
-    femmesh.addNode(1.53921976611, 3.15476964347, 0.0, 307)
-    femmesh.addNode(1.51809105178, 4.78237613921, 0.0, 308)
-    femmesh.addNode(1.56620746532, 6.5724608991, 0.0, 309)
-    femmesh.addNode(1.75995760869, 8.30022931513, 0.0, 310)
-    femmesh.addNode(2.6716087772, 1.68867528699, 0.0, 311)
-    femmesh.addNode(6.84240630842, 1.7505519231, 0.0, 312)
-    femmesh.addNode(10.9337698074, 1.81058108381, 0.0, 313)
-    femmesh.addNode(15.0021530838, 1.84678868604, 0.0, 314)
-    femmesh.addNode(3.65438296115, 8.41370661197, 0.0, 315)
-    femmesh.addNode(5.59138728988, 8.4145034167, 0.0, 316)
-    femmesh.addNode(7.54212261796, 8.41922038693, 0.0, 317)
-    femmesh.addNode(9.47320152048, 8.44983847147, 0.0, 318)
-    femmesh.addNode(11.3583903926, 8.52850937991, 0.0, 319)
-    femmesh.addNode(13.3029865146, 8.48448880356, 0.0, 320)
-    femmesh.addNode(15.1639533281, 8.42042019762, 0.0, 321)
-    femmesh.addNode(17.2474140121, 8.38478217035, 0.0, 322)
-    femmesh.addNode(18.2900931755, 2.63964686733, 0.0, 323)
-    femmesh.addNode(17.999287578, 6.57227423373, 0.0, 324)
-    femmesh.addNode(4.76065323884, 1.76672278431, 0.0, 325)
-    femmesh.addNode(8.89502027703, 1.76168886648, 0.0, 326)
-    femmesh.addNode(13.0047606408, 1.90889561608, 0.0, 327)
-    femmesh.addNode(16.7744342217, 1.58124689867, 0.0, 328)
-    femmesh.addNode(18.1488197125, 4.65182661547, 0.0, 329)
-    femmesh.addNode(2.91999949488, 5.38509185329, 0.0, 330)
-    femmesh.addNode(3.32049519627, 6.84341771921, 0.0, 331)
-    femmesh.addNode(16.1929644973, 5.30378297199, 0.0, 332)
-    femmesh.addNode(11.8553990232, 3.66067934457, 0.0, 333)
-    femmesh.addNode(9.76999727687, 3.52313457422, 0.0, 334)
-    femmesh.addNode(16.4093344424, 3.38843043534, 0.0, 335)
-    femmesh.addNode(5.64595472198, 3.48402622746, 0.0, 336)
-    femmesh.addNode(3.42020780903, 3.60212852561, 0.0, 337)
-    femmesh.addNode(5.1673196297, 6.81843018946, 0.0, 338)
-    femmesh.addNode(7.09984280524, 6.80994755275, 0.0, 339)
-    femmesh.addNode(9.01456561376, 6.8362902391, 0.0, 340)
-    femmesh.addNode(10.8650584289, 6.92970475583, 0.0, 341)
-    femmesh.addNode(12.5068126228, 7.17021674032, 0.0, 342)
-    femmesh.addNode(7.7263576556, 3.4786736161, 0.0, 343)
-    femmesh.addNode(16.1925323214, 7.02335670706, 0.0, 344)
-    femmesh.addNode(14.1972202057, 4.03486740509, 0.0, 345)
-    femmesh.addNode(14.3378881048, 6.51819092042, 0.0, 346)
-    femmesh.addNode(10.4562016497, 5.25107562191, 0.0, 347)
-    femmesh.addNode(4.59459176476, 5.20830901224, 0.0, 348)
-    femmesh.addNode(6.51471391276, 5.1713602248, 0.0, 349)
-    femmesh.addNode(12.4420536966, 5.50235414588, 0.0, 350)
-    femmesh.addNode(8.50365762316, 5.18447404951, 0.0, 351)
-    femmesh.addNode(80.0, 1.0, 0.0, 352)
-    femmesh.addNode(80.0, 3.0, 0.0, 353)
-    femmesh.addNode(80.0, 5.0, 0.0, 354)
-    femmesh.addNode(80.0, 7.0, 0.0, 355)
-    femmesh.addNode(80.0, 9.0, 0.0, 356)
-    femmesh.addNode(81.0, 0.0, 0.0, 357)
-    femmesh.addNode(83.0, 0.0, 0.0, 358)
-    femmesh.addNode(85.0, 0.0, 0.0, 359)
-    femmesh.addNode(87.0, 0.0, 0.0, 360)
-    femmesh.addNode(89.0, 0.0, 0.0, 361)
-    femmesh.addNode(91.0, 0.0, 0.0, 362)
-    femmesh.addNode(93.0, 0.0, 0.0, 363)
-    femmesh.addNode(95.0, 0.0, 0.0, 364)
-    femmesh.addNode(97.0, 0.0, 0.0, 365)
-    femmesh.addNode(99.0, 0.0, 0.0, 366)
-    femmesh.addNode(81.0, 10.0, 0.0, 367)
-    femmesh.addNode(83.0, 10.0, 0.0, 368)
-    femmesh.addNode(85.0, 10.0, 0.0, 369)
-    femmesh.addNode(87.0, 10.0, 0.0, 370)
-    femmesh.addNode(89.0, 10.0, 0.0, 371)
-    femmesh.addNode(91.0, 10.0, 0.0, 372)
-    femmesh.addNode(93.0, 10.0, 0.0, 373)
-    femmesh.addNode(95.0, 10.0, 0.0, 374)
-    femmesh.addNode(97.0, 10.0, 0.0, 375)
-    femmesh.addNode(99.0, 10.0, 0.0, 376)
-    femmesh.addNode(100.0, 1.0, 0.0, 377)
-    femmesh.addNode(100.0, 3.0, 0.0, 378)
-    femmesh.addNode(100.0, 5.0, 0.0, 379)
-    femmesh.addNode(100.0, 7.0, 0.0, 380)
-    femmesh.addNode(100.0, 9.0, 0.0, 381)
-    femmesh.addNode(60.0, 1.0, 0.0, 382)
-    femmesh.addNode(60.0, 3.0, 0.0, 383)
-    femmesh.addNode(60.0, 5.0, 0.0, 384)
-    femmesh.addNode(60.0, 7.0, 0.0, 385)
-    femmesh.addNode(60.0, 9.0, 0.0, 386)
-    femmesh.addNode(61.0, 0.0, 0.0, 387)
-    femmesh.addNode(63.0, 0.0, 0.0, 388)
-    femmesh.addNode(65.0, 0.0, 0.0, 389)
-    femmesh.addNode(67.0, 0.0, 0.0, 390)
-    femmesh.addNode(69.0, 0.0, 0.0, 391)
-    femmesh.addNode(71.0, 0.0, 0.0, 392)
-    femmesh.addNode(73.0, 0.0, 0.0, 393)
-    femmesh.addNode(75.0, 0.0, 0.0, 394)
-    femmesh.addNode(77.0, 0.0, 0.0, 395)
-    femmesh.addNode(79.0, 0.0, 0.0, 396)
-    femmesh.addNode(61.0, 10.0, 0.0, 397)
-    femmesh.addNode(63.0, 10.0, 0.0, 398)
-    femmesh.addNode(65.0, 10.0, 0.0, 399)
-    femmesh.addNode(67.0, 10.0, 0.0, 400)
-    femmesh.addNode(69.0, 10.0, 0.0, 401)
-    femmesh.addNode(71.0, 10.0, 0.0, 402)
-    femmesh.addNode(73.0, 10.0, 0.0, 403)
-    femmesh.addNode(75.0, 10.0, 0.0, 404)
-    femmesh.addNode(77.0, 10.0, 0.0, 405)
-    femmesh.addNode(79.0, 10.0, 0.0, 406)
-    femmesh.addNode(40.0, 1.0, 0.0, 407)
-    femmesh.addNode(40.0, 3.0, 0.0, 408)
-    femmesh.addNode(40.0, 5.0, 0.0, 409)
-    femmesh.addNode(40.0, 7.0, 0.0, 410)
-    femmesh.addNode(40.0, 9.0, 0.0, 411)
-    femmesh.addNode(41.0, 0.0, 0.0, 412)
-    femmesh.addNode(43.0, 0.0, 0.0, 413)
-    femmesh.addNode(45.0, 0.0, 0.0, 414)
-    femmesh.addNode(47.0, 0.0, 0.0, 415)
-    femmesh.addNode(49.0, 0.0, 0.0, 416)
-    femmesh.addNode(51.0, 0.0, 0.0, 417)
-    femmesh.addNode(53.0, 0.0, 0.0, 418)
-    femmesh.addNode(55.0, 0.0, 0.0, 419)
-    femmesh.addNode(57.0, 0.0, 0.0, 420)
-    femmesh.addNode(59.0, 0.0, 0.0, 421)
-    femmesh.addNode(41.0, 10.0, 0.0, 422)
-    femmesh.addNode(43.0, 10.0, 0.0, 423)
-    femmesh.addNode(45.0, 10.0, 0.0, 424)
-    femmesh.addNode(47.0, 10.0, 0.0, 425)
-    femmesh.addNode(49.0, 10.0, 0.0, 426)
-    femmesh.addNode(51.0, 10.0, 0.0, 427)
-    femmesh.addNode(53.0, 10.0, 0.0, 428)
-    femmesh.addNode(55.0, 10.0, 0.0, 429)
-    femmesh.addNode(57.0, 10.0, 0.0, 430)
-    femmesh.addNode(59.0, 10.0, 0.0, 431)
-    femmesh.addNode(20.0, 1.0, 0.0, 432)
-    femmesh.addNode(20.0, 3.0, 0.0, 433)
-    femmesh.addNode(20.0, 5.0, 0.0, 434)
-    femmesh.addNode(20.0, 7.0, 0.0, 435)
-    femmesh.addNode(20.0, 9.0, 0.0, 436)
-    femmesh.addNode(21.0, 0.0, 0.0, 437)
-    femmesh.addNode(23.0, 0.0, 0.0, 438)
-    femmesh.addNode(25.0, 0.0, 0.0, 439)
-    femmesh.addNode(27.0, 0.0, 0.0, 440)
-    femmesh.addNode(29.0, 0.0, 0.0, 441)
-    femmesh.addNode(31.0, 0.0, 0.0, 442)
-    femmesh.addNode(33.0, 0.0, 0.0, 443)
-    femmesh.addNode(35.0, 0.0, 0.0, 444)
-    femmesh.addNode(37.0, 0.0, 0.0, 445)
-    femmesh.addNode(39.0, 0.0, 0.0, 446)
-    femmesh.addNode(21.0, 10.0, 0.0, 447)
-    femmesh.addNode(23.0, 10.0, 0.0, 448)
-    femmesh.addNode(25.0, 10.0, 0.0, 449)
-    femmesh.addNode(27.0, 10.0, 0.0, 450)
-    femmesh.addNode(29.0, 10.0, 0.0, 451)
-    femmesh.addNode(31.0, 10.0, 0.0, 452)
-    femmesh.addNode(33.0, 10.0, 0.0, 453)
-    femmesh.addNode(35.0, 10.0, 0.0, 454)
-    femmesh.addNode(37.0, 10.0, 0.0, 455)
-    femmesh.addNode(39.0, 10.0, 0.0, 456)
-    femmesh.addNode(0.0, 1.0, 0.0, 457)
-    femmesh.addNode(0.0, 3.0, 0.0, 458)
-    femmesh.addNode(0.0, 5.0, 0.0, 459)
-    femmesh.addNode(0.0, 7.0, 0.0, 460)
-    femmesh.addNode(0.0, 9.0, 0.0, 461)
-    femmesh.addNode(1.0, 0.0, 0.0, 462)
-    femmesh.addNode(3.0, 0.0, 0.0, 463)
-    femmesh.addNode(5.0, 0.0, 0.0, 464)
-    femmesh.addNode(7.0, 0.0, 0.0, 465)
-    femmesh.addNode(9.0, 0.0, 0.0, 466)
-    femmesh.addNode(11.0, 0.0, 0.0, 467)
-    femmesh.addNode(13.0, 0.0, 0.0, 468)
-    femmesh.addNode(15.0, 0.0, 0.0, 469)
-    femmesh.addNode(17.0, 0.0, 0.0, 470)
-    femmesh.addNode(19.0, 0.0, 0.0, 471)
-    femmesh.addNode(1.0, 10.0, 0.0, 472)
-    femmesh.addNode(3.0, 10.0, 0.0, 473)
-    femmesh.addNode(5.0, 10.0, 0.0, 474)
-    femmesh.addNode(7.0, 10.0, 0.0, 475)
-    femmesh.addNode(9.0, 10.0, 0.0, 476)
-    femmesh.addNode(11.0, 10.0, 0.0, 477)
-    femmesh.addNode(13.0, 10.0, 0.0, 478)
-    femmesh.addNode(15.0, 10.0, 0.0, 479)
-    femmesh.addNode(17.0, 10.0, 0.0, 480)
-    femmesh.addNode(19.0, 10.0, 0.0, 481)
-    femmesh.addNode(81.0, 1.0, 0.0, 482)
-    femmesh.addNode(80.7696098831, 2.57738482174, 0.0, 483)
-    femmesh.addNode(80.7696098831, 3.57738482174, 0.0, 484)
-    femmesh.addNode(80.7590455259, 4.3911880696, 0.0, 485)
-    femmesh.addNode(80.7590455259, 5.3911880696, 0.0, 486)
-    femmesh.addNode(81.5286554089, 3.96857289134, 0.0, 487)
-    femmesh.addNode(80.7831037327, 6.28623044955, 0.0, 488)
-    femmesh.addNode(80.7831037327, 7.28623044955, 0.0, 489)
-    femmesh.addNode(81.5421492586, 5.67741851915, 0.0, 490)
-    femmesh.addNode(80.8799788043, 8.15011465756, 0.0, 491)
-    femmesh.addNode(80.8799788043, 9.15011465756, 0.0, 492)
-    femmesh.addNode(81.8799788043, 9.15011465756, 0.0, 493)
-    femmesh.addNode(81.663082537, 7.43634510711, 0.0, 494)
-    femmesh.addNode(83.3358043886, 0.844337643495, 0.0, 495)
-    femmesh.addNode(82.3358043886, 0.844337643495, 0.0, 496)
-    femmesh.addNode(87.4212031542, 0.875275961552, 0.0, 497)
-    femmesh.addNode(86.4212031542, 0.875275961552, 0.0, 498)
-    femmesh.addNode(91.4668849037, 0.905290541907, 0.0, 499)
-    femmesh.addNode(90.4668849037, 0.905290541907, 0.0, 500)
-    femmesh.addNode(95.5010765419, 0.923394343021, 0.0, 501)
-    femmesh.addNode(94.5010765419, 0.923394343021, 0.0, 502)
-    femmesh.addNode(99.0, 1.0, 0.0, 503)
-    femmesh.addNode(82.8271914806, 9.20685330599, 0.0, 504)
-    femmesh.addNode(83.8271914806, 9.20685330599, 0.0, 505)
-    femmesh.addNode(82.7071702849, 8.35696796355, 0.0, 506)
-    femmesh.addNode(84.7956936449, 9.20725170835, 0.0, 507)
-    femmesh.addNode(85.7956936449, 9.20725170835, 0.0, 508)
-    femmesh.addNode(84.6228851255, 8.41410501433, 0.0, 509)
-    femmesh.addNode(86.771061309, 9.20961019347, 0.0, 510)
-    femmesh.addNode(87.771061309, 9.20961019347, 0.0, 511)
-    femmesh.addNode(86.5667549539, 8.41686190181, 0.0, 512)
-    femmesh.addNode(88.7366007602, 9.22491923573, 0.0, 513)
-    femmesh.addNode(89.7366007602, 9.22491923573, 0.0, 514)
-    femmesh.addNode(88.5076620692, 8.4345294292, 0.0, 515)
-    femmesh.addNode(90.6791951963, 9.26425468996, 0.0, 516)
-    femmesh.addNode(91.6791951963, 9.26425468996, 0.0, 517)
-    femmesh.addNode(90.4157959565, 8.48917392569, 0.0, 518)
-    femmesh.addNode(92.6514932573, 9.24224440178, 0.0, 519)
-    femmesh.addNode(93.6514932573, 9.24224440178, 0.0, 520)
-    femmesh.addNode(92.3306884536, 8.50649909174, 0.0, 521)
-    femmesh.addNode(94.581976664, 9.21021009881, 0.0, 522)
-    femmesh.addNode(95.581976664, 9.21021009881, 0.0, 523)
-    femmesh.addNode(94.2334699214, 8.45245450059, 0.0, 524)
-    femmesh.addNode(96.623707006, 9.19239108518, 0.0, 525)
-    femmesh.addNode(97.623707006, 9.19239108518, 0.0, 526)
-    femmesh.addNode(96.2056836701, 8.40260118399, 0.0, 527)
-    femmesh.addNode(99.0, 9.0, 0.0, 528)
-    femmesh.addNode(99.1450465877, 3.31982343367, 0.0, 529)
-    femmesh.addNode(99.1450465877, 2.31982343367, 0.0, 530)
-    femmesh.addNode(98.999643789, 7.28613711686, 0.0, 531)
-    femmesh.addNode(98.999643789, 6.28613711686, 0.0, 532)
-    femmesh.addNode(98.1450465877, 1.31982343367, 0.0, 533)
-    femmesh.addNode(85.3803266194, 0.883361392153, 0.0, 534)
-    femmesh.addNode(84.3803266194, 0.883361392153, 0.0, 535)
-    femmesh.addNode(89.4475101385, 0.880844433239, 0.0, 536)
-    femmesh.addNode(88.4475101385, 0.880844433239, 0.0, 537)
-    femmesh.addNode(93.5023803204, 0.95444780804, 0.0, 538)
-    femmesh.addNode(92.5023803204, 0.95444780804, 0.0, 539)
-    femmesh.addNode(85.8015297736, 1.7586373537, 0.0, 540)
-    femmesh.addNode(97.3872171108, 0.790623449336, 0.0, 541)
-    femmesh.addNode(96.3872171108, 0.790623449336, 0.0, 542)
-    femmesh.addNode(83.716131008, 1.72769903565, 0.0, 543)
-    femmesh.addNode(98.623707006, 8.19239108518, 0.0, 544)
-    femmesh.addNode(99.0744098563, 5.32591330773, 0.0, 545)
-    femmesh.addNode(99.0744098563, 4.32591330773, 0.0, 546)
-    femmesh.addNode(97.623350795, 7.47852820204, 0.0, 547)
-    femmesh.addNode(81.3358043886, 1.8443376435, 0.0, 548)
-    femmesh.addNode(91.9692652241, 1.85973834995, 0.0, 549)
-    femmesh.addNode(95.8882936527, 1.71401779236, 0.0, 550)
-    femmesh.addNode(89.9143950422, 1.78613497515, 0.0, 551)
-    femmesh.addNode(94.0034568623, 1.87784215106, 0.0, 552)
-    femmesh.addNode(98.219456444, 3.6457367414, 0.0, 553)
-    femmesh.addNode(87.8687132927, 1.75612039479, 0.0, 554)
-    femmesh.addNode(98.0740536453, 5.6120504246, 0.0, 555)
-    femmesh.addNode(82.1054142717, 2.42172246523, 0.0, 556)
-    femmesh.addNode(82.2190452733, 5.08373399625, 0.0, 557)
-    femmesh.addNode(82.2431034801, 5.9787763762, 0.0, 558)
-    femmesh.addNode(82.4433513308, 6.70793930915, 0.0, 559)
-    femmesh.addNode(82.5402264025, 7.57182351717, 0.0, 560)
-    femmesh.addNode(83.4874390787, 7.62856216559, 0.0, 561)
-    femmesh.addNode(83.1202473456, 6.11425478625, 0.0, 562)
-    femmesh.addNode(97.0961260376, 5.93802860286, 0.0, 563)
-    femmesh.addNode(97.1708921049, 4.97780479373, 0.0, 564)
-    femmesh.addNode(92.430079832, 2.78478748033, 0.0, 565)
-    femmesh.addNode(91.3945844153, 2.73563021419, 0.0, 566)
-    femmesh.addNode(90.3518835421, 2.66685782902, 0.0, 567)
-    femmesh.addNode(89.332508777, 2.64241172035, 0.0, 568)
-    femmesh.addNode(90.81269815, 3.59190695939, 0.0, 569)
-    femmesh.addNode(96.5918843321, 2.48483866701, 0.0, 570)
-    femmesh.addNode(95.7057437631, 2.61760956069, 0.0, 571)
-    femmesh.addNode(86.2441805152, 2.61728907528, 0.0, 572)
-    femmesh.addNode(85.2033039804, 2.62537450588, 0.0, 573)
-    femmesh.addNode(97.5322636986, 2.110446883, 0.0, 574)
-    femmesh.addNode(84.0904305239, 2.68442565496, 0.0, 575)
-    femmesh.addNode(83.0459082931, 2.6454019063, 0.0, 576)
-    femmesh.addNode(84.5330812655, 3.54307737653, 0.0, 577)
-    femmesh.addNode(84.4108512954, 7.61606840071, 0.0, 578)
-    femmesh.addNode(85.3793534598, 7.61646680308, 0.0, 579)
-    femmesh.addNode(84.243907413, 6.83092395433, 0.0, 580)
-    femmesh.addNode(86.3456150476, 7.61222548472, 0.0, 581)
-    femmesh.addNode(87.3209827116, 7.61458396984, 0.0, 582)
-    femmesh.addNode(86.1335812175, 6.8141888711, 0.0, 583)
-    femmesh.addNode(88.2783441159, 7.62775531302, 0.0, 584)
-    femmesh.addNode(89.2438835671, 7.64306435528, 0.0, 585)
-    femmesh.addNode(88.0572042095, 6.82311889592, 0.0, 586)
-    femmesh.addNode(90.1691299747, 7.68977161365, 0.0, 587)
-    femmesh.addNode(91.1117244107, 7.72910706787, 0.0, 588)
-    femmesh.addNode(89.9398120213, 6.88299749746, 0.0, 589)
-    femmesh.addNode(91.9326015077, 7.84936306012, 0.0, 590)
-    femmesh.addNode(92.9048995687, 7.82735277194, 0.0, 591)
-    femmesh.addNode(91.6859355259, 7.04996074807, 0.0, 592)
-    femmesh.addNode(88.3106889663, 2.62018124129, 0.0, 593)
-    femmesh.addNode(87.284381982, 2.6146127696, 0.0, 594)
-    femmesh.addNode(86.6861561888, 3.48134992178, 0.0, 595)
-    femmesh.addNode(88.7481774662, 3.50090409516, 0.0, 596)
-    femmesh.addNode(82.4797137876, 3.37844908454, 0.0, 597)
-    femmesh.addNode(96.7199731668, 7.70406943871, 0.0, 598)
-    femmesh.addNode(97.0959099497, 6.7978154704, 0.0, 599)
-    femmesh.addNode(96.1927484094, 6.16356983953, 0.0, 600)
-    femmesh.addNode(95.6782428248, 7.72188845234, 0.0, 601)
-    femmesh.addNode(82.4691494304, 4.19225233241, 0.0, 602)
-    femmesh.addNode(97.349713809, 3.01403865134, 0.0, 603)
-    femmesh.addNode(83.170103652, 4.49361018945, 0.0, 604)
-    femmesh.addNode(97.2790770775, 4.02012852541, 0.0, 605)
-    femmesh.addNode(94.5996866448, 2.94082804557, 0.0, 606)
-    femmesh.addNode(93.6009904232, 2.97188151058, 0.0, 607)
-    femmesh.addNode(93.0263096145, 3.84777337483, 0.0, 608)
-    femmesh.addNode(93.8204373097, 7.50133986199, 0.0, 609)
-    femmesh.addNode(94.7509207164, 7.46930555902, 0.0, 610)
-    femmesh.addNode(96.3011494699, 4.34610670367, 0.0, 611)
-    femmesh.addNode(95.2652102131, 6.77077381374, 0.0, 612)
-    femmesh.addNode(95.3032773241, 3.71164892022, 0.0, 613)
-    femmesh.addNode(95.1950923515, 4.66932518854, 0.0, 614)
-    femmesh.addNode(91.1558003365, 4.45587748324, 0.0, 615)
-    femmesh.addNode(90.1130994633, 4.38710509806, 0.0, 616)
-    femmesh.addNode(93.4223503638, 6.84420383037, 0.0, 617)
-    femmesh.addNode(83.9575434805, 6.02586336572, 0.0, 618)
-    femmesh.addNode(84.8809556972, 6.01336960085, 0.0, 619)
-    femmesh.addNode(83.7572956298, 5.29670043277, 0.0, 620)
-    femmesh.addNode(85.8410167712, 5.99489520713, 0.0, 621)
-    femmesh.addNode(86.807278359, 5.99065388877, 0.0, 622)
-    femmesh.addNode(85.5546528388, 5.18983461852, 0.0, 623)
-    femmesh.addNode(89.7353836317, 6.04368293051, 0.0, 624)
-    femmesh.addNode(90.6606300393, 6.09039018887, 0.0, 625)
-    femmesh.addNode(91.6535560627, 6.21602945085, 0.0, 626)
-    femmesh.addNode(92.4744331597, 6.3362854431, 0.0, 627)
-    femmesh.addNode(93.3899709007, 6.01027253315, 0.0, 628)
-    femmesh.addNode(91.4491276731, 5.3767148839, 0.0, 629)
-    femmesh.addNode(95.265426301, 5.91098694621, 0.0, 630)
-    femmesh.addNode(87.1205357842, 4.32501692045, 0.0, 631)
-    femmesh.addNode(86.0803343174, 4.32769322613, 0.0, 632)
-    femmesh.addNode(93.3196369511, 4.76861077548, 0.0, 633)
-    femmesh.addNode(94.2675541552, 5.27652916275, 0.0, 634)
-    femmesh.addNode(84.0073997869, 4.40521876893, 0.0, 635)
-    femmesh.addNode(92.1487263599, 4.58151674523, 0.0, 636)
-    femmesh.addNode(85.1202732434, 4.34616761985, 0.0, 637)
-    femmesh.addNode(87.8017502142, 5.99721080113, 0.0, 638)
-    femmesh.addNode(88.7591116185, 6.01038214431, 0.0, 639)
-    femmesh.addNode(89.4799296364, 5.21777483571, 0.0, 640)
-    femmesh.addNode(87.509185768, 5.17791713715, 0.0, 641)
-    femmesh.addNode(89.13682745, 4.35380431186, 0.0, 642)
-    femmesh.addNode(88.1150076394, 4.3315738328, 0.0, 643)
-    femmesh.addNode(61.0, 1.0, 0.0, 644)
-    femmesh.addNode(60.7696098831, 2.57738482174, 0.0, 645)
-    femmesh.addNode(60.7696098831, 3.57738482174, 0.0, 646)
-    femmesh.addNode(60.7590455259, 4.3911880696, 0.0, 647)
-    femmesh.addNode(60.7590455259, 5.3911880696, 0.0, 648)
-    femmesh.addNode(61.5286554089, 3.96857289134, 0.0, 649)
-    femmesh.addNode(60.7831037327, 6.28623044955, 0.0, 650)
-    femmesh.addNode(60.7831037327, 7.28623044955, 0.0, 651)
-    femmesh.addNode(61.5421492586, 5.67741851915, 0.0, 652)
-    femmesh.addNode(60.8799788043, 8.15011465756, 0.0, 653)
-    femmesh.addNode(60.8799788043, 9.15011465756, 0.0, 654)
-    femmesh.addNode(61.8799788043, 9.15011465756, 0.0, 655)
-    femmesh.addNode(61.663082537, 7.43634510711, 0.0, 656)
-    femmesh.addNode(63.3358043886, 0.844337643495, 0.0, 657)
-    femmesh.addNode(62.3358043886, 0.844337643495, 0.0, 658)
-    femmesh.addNode(67.4212031542, 0.875275961552, 0.0, 659)
-    femmesh.addNode(66.4212031542, 0.875275961552, 0.0, 660)
-    femmesh.addNode(71.4668849037, 0.905290541907, 0.0, 661)
-    femmesh.addNode(70.4668849037, 0.905290541907, 0.0, 662)
-    femmesh.addNode(75.5010765419, 0.923394343021, 0.0, 663)
-    femmesh.addNode(74.5010765419, 0.923394343021, 0.0, 664)
-    femmesh.addNode(79.0, 1.0, 0.0, 665)
-    femmesh.addNode(62.8271914806, 9.20685330599, 0.0, 666)
-    femmesh.addNode(63.8271914806, 9.20685330599, 0.0, 667)
-    femmesh.addNode(62.7071702849, 8.35696796355, 0.0, 668)
-    femmesh.addNode(64.7956936449, 9.20725170835, 0.0, 669)
-    femmesh.addNode(65.7956936449, 9.20725170835, 0.0, 670)
-    femmesh.addNode(64.6228851255, 8.41410501433, 0.0, 671)
-    femmesh.addNode(66.771061309, 9.20961019347, 0.0, 672)
-    femmesh.addNode(67.771061309, 9.20961019347, 0.0, 673)
-    femmesh.addNode(66.5667549539, 8.41686190181, 0.0, 674)
-    femmesh.addNode(68.7366007602, 9.22491923573, 0.0, 675)
-    femmesh.addNode(69.7366007602, 9.22491923573, 0.0, 676)
-    femmesh.addNode(68.5076620692, 8.4345294292, 0.0, 677)
-    femmesh.addNode(70.6791951963, 9.26425468996, 0.0, 678)
-    femmesh.addNode(71.6791951963, 9.26425468996, 0.0, 679)
-    femmesh.addNode(70.4157959565, 8.48917392569, 0.0, 680)
-    femmesh.addNode(72.6514932573, 9.24224440178, 0.0, 681)
-    femmesh.addNode(73.6514932573, 9.24224440178, 0.0, 682)
-    femmesh.addNode(72.3306884536, 8.50649909174, 0.0, 683)
-    femmesh.addNode(74.581976664, 9.21021009881, 0.0, 684)
-    femmesh.addNode(75.581976664, 9.21021009881, 0.0, 685)
-    femmesh.addNode(74.2334699214, 8.45245450059, 0.0, 686)
-    femmesh.addNode(76.623707006, 9.19239108518, 0.0, 687)
-    femmesh.addNode(77.623707006, 9.19239108518, 0.0, 688)
-    femmesh.addNode(76.2056836701, 8.40260118399, 0.0, 689)
-    femmesh.addNode(79.0, 9.0, 0.0, 690)
-    femmesh.addNode(79.1450465877, 3.31982343367, 0.0, 691)
-    femmesh.addNode(79.1450465877, 2.31982343367, 0.0, 692)
-    femmesh.addNode(78.999643789, 7.28613711686, 0.0, 693)
-    femmesh.addNode(78.999643789, 6.28613711686, 0.0, 694)
-    femmesh.addNode(78.1450465877, 1.31982343367, 0.0, 695)
-    femmesh.addNode(65.3803266194, 0.883361392153, 0.0, 696)
-    femmesh.addNode(64.3803266194, 0.883361392153, 0.0, 697)
-    femmesh.addNode(69.4475101385, 0.880844433239, 0.0, 698)
-    femmesh.addNode(68.4475101385, 0.880844433239, 0.0, 699)
-    femmesh.addNode(73.5023803204, 0.95444780804, 0.0, 700)
-    femmesh.addNode(72.5023803204, 0.95444780804, 0.0, 701)
-    femmesh.addNode(65.8015297736, 1.7586373537, 0.0, 702)
-    femmesh.addNode(77.3872171108, 0.790623449336, 0.0, 703)
-    femmesh.addNode(76.3872171108, 0.790623449336, 0.0, 704)
-    femmesh.addNode(63.716131008, 1.72769903565, 0.0, 705)
-    femmesh.addNode(78.623707006, 8.19239108518, 0.0, 706)
-    femmesh.addNode(79.0744098563, 5.32591330773, 0.0, 707)
-    femmesh.addNode(79.0744098563, 4.32591330773, 0.0, 708)
-    femmesh.addNode(77.623350795, 7.47852820204, 0.0, 709)
-    femmesh.addNode(61.3358043886, 1.8443376435, 0.0, 710)
-    femmesh.addNode(71.9692652241, 1.85973834995, 0.0, 711)
-    femmesh.addNode(75.8882936527, 1.71401779236, 0.0, 712)
-    femmesh.addNode(69.9143950422, 1.78613497515, 0.0, 713)
-    femmesh.addNode(74.0034568623, 1.87784215106, 0.0, 714)
-    femmesh.addNode(78.219456444, 3.6457367414, 0.0, 715)
-    femmesh.addNode(67.8687132927, 1.75612039479, 0.0, 716)
-    femmesh.addNode(78.0740536453, 5.6120504246, 0.0, 717)
-    femmesh.addNode(62.1054142717, 2.42172246523, 0.0, 718)
-    femmesh.addNode(62.2190452733, 5.08373399625, 0.0, 719)
-    femmesh.addNode(62.2431034801, 5.9787763762, 0.0, 720)
-    femmesh.addNode(62.4433513308, 6.70793930915, 0.0, 721)
-    femmesh.addNode(62.5402264025, 7.57182351717, 0.0, 722)
-    femmesh.addNode(63.4874390787, 7.62856216559, 0.0, 723)
-    femmesh.addNode(63.1202473456, 6.11425478625, 0.0, 724)
-    femmesh.addNode(77.0961260376, 5.93802860286, 0.0, 725)
-    femmesh.addNode(77.1708921049, 4.97780479373, 0.0, 726)
-    femmesh.addNode(72.430079832, 2.78478748033, 0.0, 727)
-    femmesh.addNode(71.3945844153, 2.73563021419, 0.0, 728)
-    femmesh.addNode(70.3518835421, 2.66685782902, 0.0, 729)
-    femmesh.addNode(69.332508777, 2.64241172035, 0.0, 730)
-    femmesh.addNode(70.81269815, 3.59190695939, 0.0, 731)
-    femmesh.addNode(76.5918843321, 2.48483866701, 0.0, 732)
-    femmesh.addNode(75.7057437631, 2.61760956069, 0.0, 733)
-    femmesh.addNode(66.2441805152, 2.61728907528, 0.0, 734)
-    femmesh.addNode(65.2033039804, 2.62537450588, 0.0, 735)
-    femmesh.addNode(77.5322636986, 2.110446883, 0.0, 736)
-    femmesh.addNode(64.0904305239, 2.68442565496, 0.0, 737)
-    femmesh.addNode(63.0459082931, 2.6454019063, 0.0, 738)
-    femmesh.addNode(64.5330812655, 3.54307737653, 0.0, 739)
-    femmesh.addNode(64.4108512954, 7.61606840071, 0.0, 740)
-    femmesh.addNode(65.3793534598, 7.61646680308, 0.0, 741)
-    femmesh.addNode(64.243907413, 6.83092395433, 0.0, 742)
-    femmesh.addNode(66.3456150476, 7.61222548472, 0.0, 743)
-    femmesh.addNode(67.3209827116, 7.61458396984, 0.0, 744)
-    femmesh.addNode(66.1335812175, 6.8141888711, 0.0, 745)
-    femmesh.addNode(68.2783441159, 7.62775531302, 0.0, 746)
-    femmesh.addNode(69.2438835671, 7.64306435528, 0.0, 747)
-    femmesh.addNode(68.0572042095, 6.82311889592, 0.0, 748)
-    femmesh.addNode(70.1691299747, 7.68977161365, 0.0, 749)
-    femmesh.addNode(71.1117244107, 7.72910706787, 0.0, 750)
-    femmesh.addNode(69.9398120213, 6.88299749746, 0.0, 751)
-    femmesh.addNode(71.9326015077, 7.84936306012, 0.0, 752)
-    femmesh.addNode(72.9048995687, 7.82735277194, 0.0, 753)
-    femmesh.addNode(71.6859355259, 7.04996074807, 0.0, 754)
-    femmesh.addNode(68.3106889663, 2.62018124129, 0.0, 755)
-    femmesh.addNode(67.284381982, 2.6146127696, 0.0, 756)
-    femmesh.addNode(66.6861561888, 3.48134992178, 0.0, 757)
-    femmesh.addNode(68.7481774662, 3.50090409516, 0.0, 758)
-    femmesh.addNode(62.4797137876, 3.37844908454, 0.0, 759)
-    femmesh.addNode(76.7199731668, 7.70406943871, 0.0, 760)
-    femmesh.addNode(77.0959099497, 6.7978154704, 0.0, 761)
-    femmesh.addNode(76.1927484094, 6.16356983953, 0.0, 762)
-    femmesh.addNode(75.6782428248, 7.72188845234, 0.0, 763)
-    femmesh.addNode(62.4691494304, 4.19225233241, 0.0, 764)
-    femmesh.addNode(77.349713809, 3.01403865134, 0.0, 765)
-    femmesh.addNode(63.170103652, 4.49361018945, 0.0, 766)
-    femmesh.addNode(77.2790770775, 4.02012852541, 0.0, 767)
-    femmesh.addNode(74.5996866448, 2.94082804557, 0.0, 768)
-    femmesh.addNode(73.6009904232, 2.97188151058, 0.0, 769)
-    femmesh.addNode(73.0263096145, 3.84777337483, 0.0, 770)
-    femmesh.addNode(73.8204373097, 7.50133986199, 0.0, 771)
-    femmesh.addNode(74.7509207164, 7.46930555902, 0.0, 772)
-    femmesh.addNode(76.3011494699, 4.34610670367, 0.0, 773)
-    femmesh.addNode(75.2652102131, 6.77077381374, 0.0, 774)
-    femmesh.addNode(75.3032773241, 3.71164892022, 0.0, 775)
-    femmesh.addNode(75.1950923515, 4.66932518854, 0.0, 776)
-    femmesh.addNode(71.1558003365, 4.45587748324, 0.0, 777)
-    femmesh.addNode(70.1130994633, 4.38710509806, 0.0, 778)
-    femmesh.addNode(73.4223503638, 6.84420383037, 0.0, 779)
-    femmesh.addNode(63.9575434805, 6.02586336572, 0.0, 780)
-    femmesh.addNode(64.8809556972, 6.01336960085, 0.0, 781)
-    femmesh.addNode(63.7572956298, 5.29670043277, 0.0, 782)
-    femmesh.addNode(65.8410167712, 5.99489520713, 0.0, 783)
-    femmesh.addNode(66.807278359, 5.99065388877, 0.0, 784)
-    femmesh.addNode(65.5546528388, 5.18983461852, 0.0, 785)
-    femmesh.addNode(69.7353836317, 6.04368293051, 0.0, 786)
-    femmesh.addNode(70.6606300393, 6.09039018887, 0.0, 787)
-    femmesh.addNode(71.6535560627, 6.21602945085, 0.0, 788)
-    femmesh.addNode(72.4744331597, 6.3362854431, 0.0, 789)
-    femmesh.addNode(73.3899709007, 6.01027253315, 0.0, 790)
-    femmesh.addNode(71.4491276731, 5.3767148839, 0.0, 791)
-    femmesh.addNode(75.265426301, 5.91098694621, 0.0, 792)
-    femmesh.addNode(67.1205357842, 4.32501692045, 0.0, 793)
-    femmesh.addNode(66.0803343174, 4.32769322613, 0.0, 794)
-    femmesh.addNode(73.3196369511, 4.76861077548, 0.0, 795)
-    femmesh.addNode(74.2675541552, 5.27652916275, 0.0, 796)
-    femmesh.addNode(64.0073997869, 4.40521876893, 0.0, 797)
-    femmesh.addNode(72.1487263599, 4.58151674523, 0.0, 798)
-    femmesh.addNode(65.1202732434, 4.34616761985, 0.0, 799)
-    femmesh.addNode(67.8017502142, 5.99721080113, 0.0, 800)
-    femmesh.addNode(68.7591116185, 6.01038214431, 0.0, 801)
-    femmesh.addNode(69.4799296364, 5.21777483571, 0.0, 802)
-    femmesh.addNode(67.509185768, 5.17791713715, 0.0, 803)
-    femmesh.addNode(69.13682745, 4.35380431186, 0.0, 804)
-    femmesh.addNode(68.1150076394, 4.3315738328, 0.0, 805)
-    femmesh.addNode(41.0, 1.0, 0.0, 806)
-    femmesh.addNode(40.7696098831, 2.57738482174, 0.0, 807)
-    femmesh.addNode(40.7696098831, 3.57738482174, 0.0, 808)
-    femmesh.addNode(40.7590455259, 4.3911880696, 0.0, 809)
-    femmesh.addNode(40.7590455259, 5.3911880696, 0.0, 810)
-    femmesh.addNode(41.5286554089, 3.96857289134, 0.0, 811)
-    femmesh.addNode(40.7831037327, 6.28623044955, 0.0, 812)
-    femmesh.addNode(40.7831037327, 7.28623044955, 0.0, 813)
-    femmesh.addNode(41.5421492586, 5.67741851915, 0.0, 814)
-    femmesh.addNode(40.8799788043, 8.15011465756, 0.0, 815)
-    femmesh.addNode(40.8799788043, 9.15011465756, 0.0, 816)
-    femmesh.addNode(41.8799788043, 9.15011465756, 0.0, 817)
-    femmesh.addNode(41.663082537, 7.43634510711, 0.0, 818)
-    femmesh.addNode(43.3358043886, 0.844337643495, 0.0, 819)
-    femmesh.addNode(42.3358043886, 0.844337643495, 0.0, 820)
-    femmesh.addNode(47.4212031542, 0.875275961552, 0.0, 821)
-    femmesh.addNode(46.4212031542, 0.875275961552, 0.0, 822)
-    femmesh.addNode(51.4668849037, 0.905290541907, 0.0, 823)
-    femmesh.addNode(50.4668849037, 0.905290541907, 0.0, 824)
-    femmesh.addNode(55.5010765419, 0.923394343021, 0.0, 825)
-    femmesh.addNode(54.5010765419, 0.923394343021, 0.0, 826)
-    femmesh.addNode(59.0, 1.0, 0.0, 827)
-    femmesh.addNode(42.8271914806, 9.20685330599, 0.0, 828)
-    femmesh.addNode(43.8271914806, 9.20685330599, 0.0, 829)
-    femmesh.addNode(42.7071702849, 8.35696796355, 0.0, 830)
-    femmesh.addNode(44.7956936449, 9.20725170835, 0.0, 831)
-    femmesh.addNode(45.7956936449, 9.20725170835, 0.0, 832)
-    femmesh.addNode(44.6228851255, 8.41410501433, 0.0, 833)
-    femmesh.addNode(46.771061309, 9.20961019347, 0.0, 834)
-    femmesh.addNode(47.771061309, 9.20961019347, 0.0, 835)
-    femmesh.addNode(46.5667549539, 8.41686190181, 0.0, 836)
-    femmesh.addNode(48.7366007602, 9.22491923573, 0.0, 837)
-    femmesh.addNode(49.7366007602, 9.22491923573, 0.0, 838)
-    femmesh.addNode(48.5076620692, 8.4345294292, 0.0, 839)
-    femmesh.addNode(50.6791951963, 9.26425468996, 0.0, 840)
-    femmesh.addNode(51.6791951963, 9.26425468996, 0.0, 841)
-    femmesh.addNode(50.4157959565, 8.48917392569, 0.0, 842)
-    femmesh.addNode(52.6514932573, 9.24224440178, 0.0, 843)
-    femmesh.addNode(53.6514932573, 9.24224440178, 0.0, 844)
-    femmesh.addNode(52.3306884536, 8.50649909174, 0.0, 845)
-    femmesh.addNode(54.581976664, 9.21021009881, 0.0, 846)
-    femmesh.addNode(55.581976664, 9.21021009881, 0.0, 847)
-    femmesh.addNode(54.2334699214, 8.45245450059, 0.0, 848)
-    femmesh.addNode(56.623707006, 9.19239108518, 0.0, 849)
-    femmesh.addNode(57.623707006, 9.19239108518, 0.0, 850)
-    femmesh.addNode(56.2056836701, 8.40260118399, 0.0, 851)
-    femmesh.addNode(59.0, 9.0, 0.0, 852)
-    femmesh.addNode(59.1450465877, 3.31982343367, 0.0, 853)
-    femmesh.addNode(59.1450465877, 2.31982343367, 0.0, 854)
-    femmesh.addNode(58.999643789, 7.28613711686, 0.0, 855)
-    femmesh.addNode(58.999643789, 6.28613711686, 0.0, 856)
-    femmesh.addNode(58.1450465877, 1.31982343367, 0.0, 857)
-    femmesh.addNode(45.3803266194, 0.883361392153, 0.0, 858)
-    femmesh.addNode(44.3803266194, 0.883361392153, 0.0, 859)
-    femmesh.addNode(49.4475101385, 0.880844433239, 0.0, 860)
-    femmesh.addNode(48.4475101385, 0.880844433239, 0.0, 861)
-    femmesh.addNode(53.5023803204, 0.95444780804, 0.0, 862)
-    femmesh.addNode(52.5023803204, 0.95444780804, 0.0, 863)
-    femmesh.addNode(45.8015297736, 1.7586373537, 0.0, 864)
-    femmesh.addNode(57.3872171108, 0.790623449336, 0.0, 865)
-    femmesh.addNode(56.3872171108, 0.790623449336, 0.0, 866)
-    femmesh.addNode(43.716131008, 1.72769903565, 0.0, 867)
-    femmesh.addNode(58.623707006, 8.19239108518, 0.0, 868)
-    femmesh.addNode(59.0744098563, 5.32591330773, 0.0, 869)
-    femmesh.addNode(59.0744098563, 4.32591330773, 0.0, 870)
-    femmesh.addNode(57.623350795, 7.47852820204, 0.0, 871)
-    femmesh.addNode(41.3358043886, 1.8443376435, 0.0, 872)
-    femmesh.addNode(51.9692652241, 1.85973834995, 0.0, 873)
-    femmesh.addNode(55.8882936527, 1.71401779236, 0.0, 874)
-    femmesh.addNode(49.9143950422, 1.78613497515, 0.0, 875)
-    femmesh.addNode(54.0034568623, 1.87784215106, 0.0, 876)
-    femmesh.addNode(58.219456444, 3.6457367414, 0.0, 877)
-    femmesh.addNode(47.8687132927, 1.75612039479, 0.0, 878)
-    femmesh.addNode(58.0740536453, 5.6120504246, 0.0, 879)
-    femmesh.addNode(42.1054142717, 2.42172246523, 0.0, 880)
-    femmesh.addNode(42.2190452733, 5.08373399625, 0.0, 881)
-    femmesh.addNode(42.2431034801, 5.9787763762, 0.0, 882)
-    femmesh.addNode(42.4433513308, 6.70793930915, 0.0, 883)
-    femmesh.addNode(42.5402264025, 7.57182351717, 0.0, 884)
-    femmesh.addNode(43.4874390787, 7.62856216559, 0.0, 885)
-    femmesh.addNode(43.1202473456, 6.11425478625, 0.0, 886)
-    femmesh.addNode(57.0961260376, 5.93802860286, 0.0, 887)
-    femmesh.addNode(57.1708921049, 4.97780479373, 0.0, 888)
-    femmesh.addNode(52.430079832, 2.78478748033, 0.0, 889)
-    femmesh.addNode(51.3945844153, 2.73563021419, 0.0, 890)
-    femmesh.addNode(50.3518835421, 2.66685782902, 0.0, 891)
-    femmesh.addNode(49.332508777, 2.64241172035, 0.0, 892)
-    femmesh.addNode(50.81269815, 3.59190695939, 0.0, 893)
-    femmesh.addNode(56.5918843321, 2.48483866701, 0.0, 894)
-    femmesh.addNode(55.7057437631, 2.61760956069, 0.0, 895)
-    femmesh.addNode(46.2441805152, 2.61728907528, 0.0, 896)
-    femmesh.addNode(45.2033039804, 2.62537450588, 0.0, 897)
-    femmesh.addNode(57.5322636986, 2.110446883, 0.0, 898)
-    femmesh.addNode(44.0904305239, 2.68442565496, 0.0, 899)
-    femmesh.addNode(43.0459082931, 2.6454019063, 0.0, 900)
-    femmesh.addNode(44.5330812655, 3.54307737653, 0.0, 901)
-    femmesh.addNode(44.4108512954, 7.61606840071, 0.0, 902)
-    femmesh.addNode(45.3793534598, 7.61646680308, 0.0, 903)
-    femmesh.addNode(44.243907413, 6.83092395433, 0.0, 904)
-    femmesh.addNode(46.3456150476, 7.61222548472, 0.0, 905)
-    femmesh.addNode(47.3209827116, 7.61458396984, 0.0, 906)
-    femmesh.addNode(46.1335812175, 6.8141888711, 0.0, 907)
-    femmesh.addNode(48.2783441159, 7.62775531302, 0.0, 908)
-    femmesh.addNode(49.2438835671, 7.64306435528, 0.0, 909)
-    femmesh.addNode(48.0572042095, 6.82311889592, 0.0, 910)
-    femmesh.addNode(50.1691299747, 7.68977161365, 0.0, 911)
-    femmesh.addNode(51.1117244107, 7.72910706787, 0.0, 912)
-    femmesh.addNode(49.9398120213, 6.88299749746, 0.0, 913)
-    femmesh.addNode(51.9326015077, 7.84936306012, 0.0, 914)
-    femmesh.addNode(52.9048995687, 7.82735277194, 0.0, 915)
-    femmesh.addNode(51.6859355259, 7.04996074807, 0.0, 916)
-    femmesh.addNode(48.3106889663, 2.62018124129, 0.0, 917)
-    femmesh.addNode(47.284381982, 2.6146127696, 0.0, 918)
-    femmesh.addNode(46.6861561888, 3.48134992178, 0.0, 919)
-    femmesh.addNode(48.7481774662, 3.50090409516, 0.0, 920)
-    femmesh.addNode(42.4797137876, 3.37844908454, 0.0, 921)
-    femmesh.addNode(56.7199731668, 7.70406943871, 0.0, 922)
-    femmesh.addNode(57.0959099497, 6.7978154704, 0.0, 923)
-    femmesh.addNode(56.1927484094, 6.16356983953, 0.0, 924)
-    femmesh.addNode(55.6782428248, 7.72188845234, 0.0, 925)
-    femmesh.addNode(42.4691494304, 4.19225233241, 0.0, 926)
-    femmesh.addNode(57.349713809, 3.01403865134, 0.0, 927)
-    femmesh.addNode(43.170103652, 4.49361018945, 0.0, 928)
-    femmesh.addNode(57.2790770775, 4.02012852541, 0.0, 929)
-    femmesh.addNode(54.5996866448, 2.94082804557, 0.0, 930)
-    femmesh.addNode(53.6009904232, 2.97188151058, 0.0, 931)
-    femmesh.addNode(53.0263096145, 3.84777337483, 0.0, 932)
-    femmesh.addNode(53.8204373097, 7.50133986199, 0.0, 933)
-    femmesh.addNode(54.7509207164, 7.46930555902, 0.0, 934)
-    femmesh.addNode(56.3011494699, 4.34610670367, 0.0, 935)
-    femmesh.addNode(55.2652102131, 6.77077381374, 0.0, 936)
-    femmesh.addNode(55.3032773241, 3.71164892022, 0.0, 937)
-    femmesh.addNode(55.1950923515, 4.66932518854, 0.0, 938)
-    femmesh.addNode(51.1558003365, 4.45587748324, 0.0, 939)
-    femmesh.addNode(50.1130994633, 4.38710509806, 0.0, 940)
-    femmesh.addNode(53.4223503638, 6.84420383037, 0.0, 941)
-    femmesh.addNode(43.9575434805, 6.02586336572, 0.0, 942)
-    femmesh.addNode(44.8809556972, 6.01336960085, 0.0, 943)
-    femmesh.addNode(43.7572956298, 5.29670043277, 0.0, 944)
-    femmesh.addNode(45.8410167712, 5.99489520713, 0.0, 945)
-    femmesh.addNode(46.807278359, 5.99065388877, 0.0, 946)
-    femmesh.addNode(45.5546528388, 5.18983461852, 0.0, 947)
-    femmesh.addNode(49.7353836317, 6.04368293051, 0.0, 948)
-    femmesh.addNode(50.6606300393, 6.09039018887, 0.0, 949)
-    femmesh.addNode(51.6535560627, 6.21602945085, 0.0, 950)
-    femmesh.addNode(52.4744331597, 6.3362854431, 0.0, 951)
-    femmesh.addNode(53.3899709007, 6.01027253315, 0.0, 952)
-    femmesh.addNode(51.4491276731, 5.3767148839, 0.0, 953)
-    femmesh.addNode(55.265426301, 5.91098694621, 0.0, 954)
-    femmesh.addNode(47.1205357842, 4.32501692045, 0.0, 955)
-    femmesh.addNode(46.0803343174, 4.32769322613, 0.0, 956)
-    femmesh.addNode(53.3196369511, 4.76861077548, 0.0, 957)
-    femmesh.addNode(54.2675541552, 5.27652916275, 0.0, 958)
-    femmesh.addNode(44.0073997869, 4.40521876893, 0.0, 959)
-    femmesh.addNode(52.1487263599, 4.58151674523, 0.0, 960)
-    femmesh.addNode(45.1202732434, 4.34616761985, 0.0, 961)
-    femmesh.addNode(47.8017502142, 5.99721080113, 0.0, 962)
-    femmesh.addNode(48.7591116185, 6.01038214431, 0.0, 963)
-    femmesh.addNode(49.4799296364, 5.21777483571, 0.0, 964)
-    femmesh.addNode(47.509185768, 5.17791713715, 0.0, 965)
-    femmesh.addNode(49.13682745, 4.35380431186, 0.0, 966)
-    femmesh.addNode(48.1150076394, 4.3315738328, 0.0, 967)
-    femmesh.addNode(21.0, 1.0, 0.0, 968)
-    femmesh.addNode(20.7696098831, 2.57738482174, 0.0, 969)
-    femmesh.addNode(20.7696098831, 3.57738482174, 0.0, 970)
-    femmesh.addNode(20.7590455259, 4.3911880696, 0.0, 971)
-    femmesh.addNode(20.7590455259, 5.3911880696, 0.0, 972)
-    femmesh.addNode(21.5286554089, 3.96857289134, 0.0, 973)
-    femmesh.addNode(20.7831037327, 6.28623044955, 0.0, 974)
-    femmesh.addNode(20.7831037327, 7.28623044955, 0.0, 975)
-    femmesh.addNode(21.5421492586, 5.67741851915, 0.0, 976)
-    femmesh.addNode(20.8799788043, 8.15011465756, 0.0, 977)
-    femmesh.addNode(20.8799788043, 9.15011465756, 0.0, 978)
-    femmesh.addNode(21.8799788043, 9.15011465756, 0.0, 979)
-    femmesh.addNode(21.663082537, 7.43634510711, 0.0, 980)
-    femmesh.addNode(23.3358043886, 0.844337643495, 0.0, 981)
-    femmesh.addNode(22.3358043886, 0.844337643495, 0.0, 982)
-    femmesh.addNode(27.4212031542, 0.875275961552, 0.0, 983)
-    femmesh.addNode(26.4212031542, 0.875275961552, 0.0, 984)
-    femmesh.addNode(31.4668849037, 0.905290541907, 0.0, 985)
-    femmesh.addNode(30.4668849037, 0.905290541907, 0.0, 986)
-    femmesh.addNode(35.5010765419, 0.923394343021, 0.0, 987)
-    femmesh.addNode(34.5010765419, 0.923394343021, 0.0, 988)
-    femmesh.addNode(39.0, 1.0, 0.0, 989)
-    femmesh.addNode(22.8271914806, 9.20685330599, 0.0, 990)
-    femmesh.addNode(23.8271914806, 9.20685330599, 0.0, 991)
-    femmesh.addNode(22.7071702849, 8.35696796355, 0.0, 992)
-    femmesh.addNode(24.7956936449, 9.20725170835, 0.0, 993)
-    femmesh.addNode(25.7956936449, 9.20725170835, 0.0, 994)
-    femmesh.addNode(24.6228851255, 8.41410501433, 0.0, 995)
-    femmesh.addNode(26.771061309, 9.20961019347, 0.0, 996)
-    femmesh.addNode(27.771061309, 9.20961019347, 0.0, 997)
-    femmesh.addNode(26.5667549539, 8.41686190181, 0.0, 998)
-    femmesh.addNode(28.7366007602, 9.22491923573, 0.0, 999)
-    femmesh.addNode(29.7366007602, 9.22491923573, 0.0, 1000)
-    femmesh.addNode(28.5076620692, 8.4345294292, 0.0, 1001)
-    femmesh.addNode(30.6791951963, 9.26425468996, 0.0, 1002)
-    femmesh.addNode(31.6791951963, 9.26425468996, 0.0, 1003)
-    femmesh.addNode(30.4157959565, 8.48917392569, 0.0, 1004)
-    femmesh.addNode(32.6514932573, 9.24224440178, 0.0, 1005)
-    femmesh.addNode(33.6514932573, 9.24224440178, 0.0, 1006)
-    femmesh.addNode(32.3306884536, 8.50649909174, 0.0, 1007)
-    femmesh.addNode(34.581976664, 9.21021009881, 0.0, 1008)
-    femmesh.addNode(35.581976664, 9.21021009881, 0.0, 1009)
-    femmesh.addNode(34.2334699214, 8.45245450059, 0.0, 1010)
-    femmesh.addNode(36.623707006, 9.19239108518, 0.0, 1011)
-    femmesh.addNode(37.623707006, 9.19239108518, 0.0, 1012)
-    femmesh.addNode(36.2056836701, 8.40260118399, 0.0, 1013)
-    femmesh.addNode(39.0, 9.0, 0.0, 1014)
-    femmesh.addNode(39.1450465877, 3.31982343367, 0.0, 1015)
-    femmesh.addNode(39.1450465877, 2.31982343367, 0.0, 1016)
-    femmesh.addNode(38.999643789, 7.28613711686, 0.0, 1017)
-    femmesh.addNode(38.999643789, 6.28613711686, 0.0, 1018)
-    femmesh.addNode(38.1450465877, 1.31982343367, 0.0, 1019)
-    femmesh.addNode(25.3803266194, 0.883361392153, 0.0, 1020)
-    femmesh.addNode(24.3803266194, 0.883361392153, 0.0, 1021)
-    femmesh.addNode(29.4475101385, 0.880844433239, 0.0, 1022)
-    femmesh.addNode(28.4475101385, 0.880844433239, 0.0, 1023)
-    femmesh.addNode(33.5023803204, 0.95444780804, 0.0, 1024)
-    femmesh.addNode(32.5023803204, 0.95444780804, 0.0, 1025)
-    femmesh.addNode(25.8015297736, 1.7586373537, 0.0, 1026)
-    femmesh.addNode(37.3872171108, 0.790623449336, 0.0, 1027)
-    femmesh.addNode(36.3872171108, 0.790623449336, 0.0, 1028)
-    femmesh.addNode(23.716131008, 1.72769903565, 0.0, 1029)
-    femmesh.addNode(38.623707006, 8.19239108518, 0.0, 1030)
-    femmesh.addNode(39.0744098563, 5.32591330773, 0.0, 1031)
-    femmesh.addNode(39.0744098563, 4.32591330773, 0.0, 1032)
-    femmesh.addNode(37.623350795, 7.47852820204, 0.0, 1033)
-    femmesh.addNode(21.3358043886, 1.8443376435, 0.0, 1034)
-    femmesh.addNode(31.9692652241, 1.85973834995, 0.0, 1035)
-    femmesh.addNode(35.8882936527, 1.71401779236, 0.0, 1036)
-    femmesh.addNode(29.9143950422, 1.78613497515, 0.0, 1037)
-    femmesh.addNode(34.0034568623, 1.87784215106, 0.0, 1038)
-    femmesh.addNode(38.219456444, 3.6457367414, 0.0, 1039)
-    femmesh.addNode(27.8687132927, 1.75612039479, 0.0, 1040)
-    femmesh.addNode(38.0740536453, 5.6120504246, 0.0, 1041)
-    femmesh.addNode(22.1054142717, 2.42172246523, 0.0, 1042)
-    femmesh.addNode(22.2190452733, 5.08373399625, 0.0, 1043)
-    femmesh.addNode(22.2431034801, 5.9787763762, 0.0, 1044)
-    femmesh.addNode(22.4433513308, 6.70793930915, 0.0, 1045)
-    femmesh.addNode(22.5402264025, 7.57182351717, 0.0, 1046)
-    femmesh.addNode(23.4874390787, 7.62856216559, 0.0, 1047)
-    femmesh.addNode(23.1202473456, 6.11425478625, 0.0, 1048)
-    femmesh.addNode(37.0961260376, 5.93802860286, 0.0, 1049)
-    femmesh.addNode(37.1708921049, 4.97780479373, 0.0, 1050)
-    femmesh.addNode(32.430079832, 2.78478748033, 0.0, 1051)
-    femmesh.addNode(31.3945844153, 2.73563021419, 0.0, 1052)
-    femmesh.addNode(30.3518835421, 2.66685782902, 0.0, 1053)
-    femmesh.addNode(29.332508777, 2.64241172035, 0.0, 1054)
-    femmesh.addNode(30.81269815, 3.59190695939, 0.0, 1055)
-    femmesh.addNode(36.5918843321, 2.48483866701, 0.0, 1056)
-    femmesh.addNode(35.7057437631, 2.61760956069, 0.0, 1057)
-    femmesh.addNode(26.2441805152, 2.61728907528, 0.0, 1058)
-    femmesh.addNode(25.2033039804, 2.62537450588, 0.0, 1059)
-    femmesh.addNode(37.5322636986, 2.110446883, 0.0, 1060)
-    femmesh.addNode(24.0904305239, 2.68442565496, 0.0, 1061)
-    femmesh.addNode(23.0459082931, 2.6454019063, 0.0, 1062)
-    femmesh.addNode(24.5330812655, 3.54307737653, 0.0, 1063)
-    femmesh.addNode(24.4108512954, 7.61606840071, 0.0, 1064)
-    femmesh.addNode(25.3793534598, 7.61646680308, 0.0, 1065)
-    femmesh.addNode(24.243907413, 6.83092395433, 0.0, 1066)
-    femmesh.addNode(26.3456150476, 7.61222548472, 0.0, 1067)
-    femmesh.addNode(27.3209827116, 7.61458396984, 0.0, 1068)
-    femmesh.addNode(26.1335812175, 6.8141888711, 0.0, 1069)
-    femmesh.addNode(28.2783441159, 7.62775531302, 0.0, 1070)
-    femmesh.addNode(29.2438835671, 7.64306435528, 0.0, 1071)
-    femmesh.addNode(28.0572042095, 6.82311889592, 0.0, 1072)
-    femmesh.addNode(30.1691299747, 7.68977161365, 0.0, 1073)
-    femmesh.addNode(31.1117244107, 7.72910706787, 0.0, 1074)
-    femmesh.addNode(29.9398120213, 6.88299749746, 0.0, 1075)
-    femmesh.addNode(31.9326015077, 7.84936306012, 0.0, 1076)
-    femmesh.addNode(32.9048995687, 7.82735277194, 0.0, 1077)
-    femmesh.addNode(31.6859355259, 7.04996074807, 0.0, 1078)
-    femmesh.addNode(28.3106889663, 2.62018124129, 0.0, 1079)
-    femmesh.addNode(27.284381982, 2.6146127696, 0.0, 1080)
-    femmesh.addNode(26.6861561888, 3.48134992178, 0.0, 1081)
-    femmesh.addNode(28.7481774662, 3.50090409516, 0.0, 1082)
-    femmesh.addNode(22.4797137876, 3.37844908454, 0.0, 1083)
-    femmesh.addNode(36.7199731668, 7.70406943871, 0.0, 1084)
-    femmesh.addNode(37.0959099497, 6.7978154704, 0.0, 1085)
-    femmesh.addNode(36.1927484094, 6.16356983953, 0.0, 1086)
-    femmesh.addNode(35.6782428248, 7.72188845234, 0.0, 1087)
-    femmesh.addNode(22.4691494304, 4.19225233241, 0.0, 1088)
-    femmesh.addNode(37.349713809, 3.01403865134, 0.0, 1089)
-    femmesh.addNode(23.170103652, 4.49361018945, 0.0, 1090)
-    femmesh.addNode(37.2790770775, 4.02012852541, 0.0, 1091)
-    femmesh.addNode(34.5996866448, 2.94082804557, 0.0, 1092)
-    femmesh.addNode(33.6009904232, 2.97188151058, 0.0, 1093)
-    femmesh.addNode(33.0263096145, 3.84777337483, 0.0, 1094)
-    femmesh.addNode(33.8204373097, 7.50133986199, 0.0, 1095)
-    femmesh.addNode(34.7509207164, 7.46930555902, 0.0, 1096)
-    femmesh.addNode(36.3011494699, 4.34610670367, 0.0, 1097)
-    femmesh.addNode(35.2652102131, 6.77077381374, 0.0, 1098)
-    femmesh.addNode(35.3032773241, 3.71164892022, 0.0, 1099)
-    femmesh.addNode(35.1950923515, 4.66932518854, 0.0, 1100)
-    femmesh.addNode(31.1558003365, 4.45587748324, 0.0, 1101)
-    femmesh.addNode(30.1130994633, 4.38710509806, 0.0, 1102)
-    femmesh.addNode(33.4223503638, 6.84420383037, 0.0, 1103)
-    femmesh.addNode(23.9575434805, 6.02586336572, 0.0, 1104)
-    femmesh.addNode(24.8809556972, 6.01336960085, 0.0, 1105)
-    femmesh.addNode(23.7572956298, 5.29670043277, 0.0, 1106)
-    femmesh.addNode(25.8410167712, 5.99489520713, 0.0, 1107)
-    femmesh.addNode(26.807278359, 5.99065388877, 0.0, 1108)
-    femmesh.addNode(25.5546528388, 5.18983461852, 0.0, 1109)
-    femmesh.addNode(29.7353836317, 6.04368293051, 0.0, 1110)
-    femmesh.addNode(30.6606300393, 6.09039018887, 0.0, 1111)
-    femmesh.addNode(31.6535560627, 6.21602945085, 0.0, 1112)
-    femmesh.addNode(32.4744331597, 6.3362854431, 0.0, 1113)
-    femmesh.addNode(33.3899709007, 6.01027253315, 0.0, 1114)
-    femmesh.addNode(31.4491276731, 5.3767148839, 0.0, 1115)
-    femmesh.addNode(35.265426301, 5.91098694621, 0.0, 1116)
-    femmesh.addNode(27.1205357842, 4.32501692045, 0.0, 1117)
-    femmesh.addNode(26.0803343174, 4.32769322613, 0.0, 1118)
-    femmesh.addNode(33.3196369511, 4.76861077548, 0.0, 1119)
-    femmesh.addNode(34.2675541552, 5.27652916275, 0.0, 1120)
-    femmesh.addNode(24.0073997869, 4.40521876893, 0.0, 1121)
-    femmesh.addNode(32.1487263599, 4.58151674523, 0.0, 1122)
-    femmesh.addNode(25.1202732434, 4.34616761985, 0.0, 1123)
-    femmesh.addNode(27.8017502142, 5.99721080113, 0.0, 1124)
-    femmesh.addNode(28.7591116185, 6.01038214431, 0.0, 1125)
-    femmesh.addNode(29.4799296364, 5.21777483571, 0.0, 1126)
-    femmesh.addNode(27.509185768, 5.17791713715, 0.0, 1127)
-    femmesh.addNode(29.13682745, 4.35380431186, 0.0, 1128)
-    femmesh.addNode(28.1150076394, 4.3315738328, 0.0, 1129)
-    femmesh.addNode(1.0, 1.0, 0.0, 1130)
-    femmesh.addNode(0.769609883053, 2.57738482174, 0.0, 1131)
-    femmesh.addNode(0.769609883053, 3.57738482174, 0.0, 1132)
-    femmesh.addNode(0.75904552589, 4.3911880696, 0.0, 1133)
-    femmesh.addNode(0.75904552589, 5.3911880696, 0.0, 1134)
-    femmesh.addNode(1.52865540894, 3.96857289134, 0.0, 1135)
-    femmesh.addNode(0.783103732661, 6.28623044955, 0.0, 1136)
-    femmesh.addNode(0.783103732661, 7.28623044955, 0.0, 1137)
-    femmesh.addNode(1.54214925855, 5.67741851915, 0.0, 1138)
-    femmesh.addNode(0.879978804346, 8.15011465756, 0.0, 1139)
-    femmesh.addNode(0.879978804346, 9.15011465756, 0.0, 1140)
-    femmesh.addNode(1.87997880435, 9.15011465756, 0.0, 1141)
-    femmesh.addNode(1.66308253701, 7.43634510711, 0.0, 1142)
-    femmesh.addNode(3.3358043886, 0.844337643495, 0.0, 1143)
-    femmesh.addNode(2.3358043886, 0.844337643495, 0.0, 1144)
-    femmesh.addNode(7.42120315421, 0.875275961552, 0.0, 1145)
-    femmesh.addNode(6.42120315421, 0.875275961552, 0.0, 1146)
-    femmesh.addNode(11.4668849037, 0.905290541907, 0.0, 1147)
-    femmesh.addNode(10.4668849037, 0.905290541907, 0.0, 1148)
-    femmesh.addNode(15.5010765419, 0.923394343021, 0.0, 1149)
-    femmesh.addNode(14.5010765419, 0.923394343021, 0.0, 1150)
-    femmesh.addNode(19.0, 1.0, 0.0, 1151)
-    femmesh.addNode(2.82719148058, 9.20685330599, 0.0, 1152)
-    femmesh.addNode(3.82719148058, 9.20685330599, 0.0, 1153)
-    femmesh.addNode(2.70717028492, 8.35696796355, 0.0, 1154)
-    femmesh.addNode(4.79569364494, 9.20725170835, 0.0, 1155)
-    femmesh.addNode(5.79569364494, 9.20725170835, 0.0, 1156)
-    femmesh.addNode(4.62288512552, 8.41410501433, 0.0, 1157)
-    femmesh.addNode(6.77106130898, 9.20961019347, 0.0, 1158)
-    femmesh.addNode(7.77106130898, 9.20961019347, 0.0, 1159)
-    femmesh.addNode(6.56675495392, 8.41686190181, 0.0, 1160)
-    femmesh.addNode(8.73660076024, 9.22491923573, 0.0, 1161)
-    femmesh.addNode(9.73660076024, 9.22491923573, 0.0, 1162)
-    femmesh.addNode(8.50766206922, 8.4345294292, 0.0, 1163)
-    femmesh.addNode(10.6791951963, 9.26425468996, 0.0, 1164)
-    femmesh.addNode(11.6791951963, 9.26425468996, 0.0, 1165)
-    femmesh.addNode(10.4157959565, 8.48917392569, 0.0, 1166)
-    femmesh.addNode(12.6514932573, 9.24224440178, 0.0, 1167)
-    femmesh.addNode(13.6514932573, 9.24224440178, 0.0, 1168)
-    femmesh.addNode(12.3306884536, 8.50649909174, 0.0, 1169)
-    femmesh.addNode(14.581976664, 9.21021009881, 0.0, 1170)
-    femmesh.addNode(15.581976664, 9.21021009881, 0.0, 1171)
-    femmesh.addNode(14.2334699214, 8.45245450059, 0.0, 1172)
-    femmesh.addNode(16.623707006, 9.19239108518, 0.0, 1173)
-    femmesh.addNode(17.623707006, 9.19239108518, 0.0, 1174)
-    femmesh.addNode(16.2056836701, 8.40260118399, 0.0, 1175)
-    femmesh.addNode(19.0, 9.0, 0.0, 1176)
-    femmesh.addNode(19.1450465877, 3.31982343367, 0.0, 1177)
-    femmesh.addNode(19.1450465877, 2.31982343367, 0.0, 1178)
-    femmesh.addNode(18.999643789, 7.28613711686, 0.0, 1179)
-    femmesh.addNode(18.999643789, 6.28613711686, 0.0, 1180)
-    femmesh.addNode(18.1450465877, 1.31982343367, 0.0, 1181)
-    femmesh.addNode(5.38032661942, 0.883361392153, 0.0, 1182)
-    femmesh.addNode(4.38032661942, 0.883361392153, 0.0, 1183)
-    femmesh.addNode(9.44751013852, 0.880844433239, 0.0, 1184)
-    femmesh.addNode(8.44751013852, 0.880844433239, 0.0, 1185)
-    femmesh.addNode(13.5023803204, 0.95444780804, 0.0, 1186)
-    femmesh.addNode(12.5023803204, 0.95444780804, 0.0, 1187)
-    femmesh.addNode(5.80152977363, 1.7586373537, 0.0, 1188)
-    femmesh.addNode(17.3872171108, 0.790623449336, 0.0, 1189)
-    femmesh.addNode(16.3872171108, 0.790623449336, 0.0, 1190)
-    femmesh.addNode(3.71613100802, 1.72769903565, 0.0, 1191)
-    femmesh.addNode(18.623707006, 8.19239108518, 0.0, 1192)
-    femmesh.addNode(19.0744098563, 5.32591330773, 0.0, 1193)
-    femmesh.addNode(19.0744098563, 4.32591330773, 0.0, 1194)
-    femmesh.addNode(17.623350795, 7.47852820204, 0.0, 1195)
-    femmesh.addNode(1.3358043886, 1.8443376435, 0.0, 1196)
-    femmesh.addNode(11.9692652241, 1.85973834995, 0.0, 1197)
-    femmesh.addNode(15.8882936527, 1.71401779236, 0.0, 1198)
-    femmesh.addNode(9.9143950422, 1.78613497515, 0.0, 1199)
-    femmesh.addNode(14.0034568623, 1.87784215106, 0.0, 1200)
-    femmesh.addNode(18.219456444, 3.6457367414, 0.0, 1201)
-    femmesh.addNode(7.86871329272, 1.75612039479, 0.0, 1202)
-    femmesh.addNode(18.0740536453, 5.6120504246, 0.0, 1203)
-    femmesh.addNode(2.10541427165, 2.42172246523, 0.0, 1204)
-    femmesh.addNode(2.21904527333, 5.08373399625, 0.0, 1205)
-    femmesh.addNode(2.2431034801, 5.9787763762, 0.0, 1206)
-    femmesh.addNode(2.44335133079, 6.70793930915, 0.0, 1207)
-    femmesh.addNode(2.54022640248, 7.57182351717, 0.0, 1208)
-    femmesh.addNode(3.48743907871, 7.62856216559, 0.0, 1209)
-    femmesh.addNode(3.12024734557, 6.11425478625, 0.0, 1210)
-    femmesh.addNode(17.0961260376, 5.93802860286, 0.0, 1211)
-    femmesh.addNode(17.1708921049, 4.97780479373, 0.0, 1212)
-    femmesh.addNode(12.430079832, 2.78478748033, 0.0, 1213)
-    femmesh.addNode(11.3945844153, 2.73563021419, 0.0, 1214)
-    femmesh.addNode(10.3518835421, 2.66685782902, 0.0, 1215)
-    femmesh.addNode(9.33250877695, 2.64241172035, 0.0, 1216)
-    femmesh.addNode(10.81269815, 3.59190695939, 0.0, 1217)
-    femmesh.addNode(16.5918843321, 2.48483866701, 0.0, 1218)
-    femmesh.addNode(15.7057437631, 2.61760956069, 0.0, 1219)
-    femmesh.addNode(6.2441805152, 2.61728907528, 0.0, 1220)
-    femmesh.addNode(5.20330398041, 2.62537450588, 0.0, 1221)
-    femmesh.addNode(17.5322636986, 2.110446883, 0.0, 1222)
-    femmesh.addNode(4.09043052393, 2.68442565496, 0.0, 1223)
-    femmesh.addNode(3.04590829311, 2.6454019063, 0.0, 1224)
-    femmesh.addNode(4.5330812655, 3.54307737653, 0.0, 1225)
-    femmesh.addNode(4.41085129543, 7.61606840071, 0.0, 1226)
-    femmesh.addNode(5.37935345979, 7.61646680308, 0.0, 1227)
-    femmesh.addNode(4.24390741298, 6.83092395433, 0.0, 1228)
-    femmesh.addNode(6.34561504756, 7.61222548472, 0.0, 1229)
-    femmesh.addNode(7.3209827116, 7.61458396984, 0.0, 1230)
-    femmesh.addNode(6.13358121747, 6.8141888711, 0.0, 1231)
-    femmesh.addNode(8.27834411586, 7.62775531302, 0.0, 1232)
-    femmesh.addNode(9.24388356712, 7.64306435528, 0.0, 1233)
-    femmesh.addNode(8.0572042095, 6.82311889592, 0.0, 1234)
-    femmesh.addNode(10.1691299747, 7.68977161365, 0.0, 1235)
-    femmesh.addNode(11.1117244107, 7.72910706787, 0.0, 1236)
-    femmesh.addNode(9.93981202132, 6.88299749746, 0.0, 1237)
-    femmesh.addNode(11.9326015077, 7.84936306012, 0.0, 1238)
-    femmesh.addNode(12.9048995687, 7.82735277194, 0.0, 1239)
-    femmesh.addNode(11.6859355259, 7.04996074807, 0.0, 1240)
-    femmesh.addNode(8.31068896631, 2.62018124129, 0.0, 1241)
-    femmesh.addNode(7.28438198201, 2.6146127696, 0.0, 1242)
-    femmesh.addNode(6.68615618879, 3.48134992178, 0.0, 1243)
-    femmesh.addNode(8.74817746623, 3.50090409516, 0.0, 1244)
-    femmesh.addNode(2.47971378757, 3.37844908454, 0.0, 1245)
-    femmesh.addNode(16.7199731668, 7.70406943871, 0.0, 1246)
-    femmesh.addNode(17.0959099497, 6.7978154704, 0.0, 1247)
-    femmesh.addNode(16.1927484094, 6.16356983953, 0.0, 1248)
-    femmesh.addNode(15.6782428248, 7.72188845234, 0.0, 1249)
-    femmesh.addNode(2.46914943041, 4.19225233241, 0.0, 1250)
-    femmesh.addNode(17.349713809, 3.01403865134, 0.0, 1251)
-    femmesh.addNode(3.17010365196, 4.49361018945, 0.0, 1252)
-    femmesh.addNode(17.2790770775, 4.02012852541, 0.0, 1253)
-    femmesh.addNode(14.5996866448, 2.94082804557, 0.0, 1254)
-    femmesh.addNode(13.6009904232, 2.97188151058, 0.0, 1255)
-    femmesh.addNode(13.0263096145, 3.84777337483, 0.0, 1256)
-    femmesh.addNode(13.8204373097, 7.50133986199, 0.0, 1257)
-    femmesh.addNode(14.7509207164, 7.46930555902, 0.0, 1258)
-    femmesh.addNode(16.3011494699, 4.34610670367, 0.0, 1259)
-    femmesh.addNode(15.2652102131, 6.77077381374, 0.0, 1260)
-    femmesh.addNode(15.3032773241, 3.71164892022, 0.0, 1261)
-    femmesh.addNode(15.1950923515, 4.66932518854, 0.0, 1262)
-    femmesh.addNode(11.1558003365, 4.45587748324, 0.0, 1263)
-    femmesh.addNode(10.1130994633, 4.38710509806, 0.0, 1264)
-    femmesh.addNode(13.4223503638, 6.84420383037, 0.0, 1265)
-    femmesh.addNode(3.95754348051, 6.02586336572, 0.0, 1266)
-    femmesh.addNode(4.88095569723, 6.01336960085, 0.0, 1267)
-    femmesh.addNode(3.75729562982, 5.29670043277, 0.0, 1268)
-    femmesh.addNode(5.84101677123, 5.99489520713, 0.0, 1269)
-    femmesh.addNode(6.807278359, 5.99065388877, 0.0, 1270)
-    femmesh.addNode(5.55465283876, 5.18983461852, 0.0, 1271)
-    femmesh.addNode(9.73538363172, 6.04368293051, 0.0, 1272)
-    femmesh.addNode(10.6606300393, 6.09039018887, 0.0, 1273)
-    femmesh.addNode(11.6535560627, 6.21602945085, 0.0, 1274)
-    femmesh.addNode(12.4744331597, 6.3362854431, 0.0, 1275)
-    femmesh.addNode(13.3899709007, 6.01027253315, 0.0, 1276)
-    femmesh.addNode(11.4491276731, 5.3767148839, 0.0, 1277)
-    femmesh.addNode(15.265426301, 5.91098694621, 0.0, 1278)
-    femmesh.addNode(7.12053578418, 4.32501692045, 0.0, 1279)
-    femmesh.addNode(6.08033431737, 4.32769322613, 0.0, 1280)
-    femmesh.addNode(13.3196369511, 4.76861077548, 0.0, 1281)
-    femmesh.addNode(14.2675541552, 5.27652916275, 0.0, 1282)
-    femmesh.addNode(4.0073997869, 4.40521876893, 0.0, 1283)
-    femmesh.addNode(12.1487263599, 4.58151674523, 0.0, 1284)
-    femmesh.addNode(5.12027324337, 4.34616761985, 0.0, 1285)
-    femmesh.addNode(7.8017502142, 5.99721080113, 0.0, 1286)
-    femmesh.addNode(8.75911161846, 6.01038214431, 0.0, 1287)
-    femmesh.addNode(9.47992963642, 5.21777483571, 0.0, 1288)
-    femmesh.addNode(7.50918576796, 5.17791713715, 0.0, 1289)
-    femmesh.addNode(9.13682745001, 4.35380431186, 0.0, 1290)
-    femmesh.addNode(8.11500763938, 4.3315738328, 0.0, 1291)
-    return True
-
-
-def create_elements(femmesh):
-    # elements
-    femmesh.addFace([13, 4, 17, 352, 357, 482], 131)
-    femmesh.addFace([14, 13, 127, 353, 483, 484], 132)
-    femmesh.addFace([15, 14, 128, 354, 485, 486], 133)
-    femmesh.addFace([14, 127, 128, 484, 487, 485], 134)
-    femmesh.addFace([16, 15, 129, 355, 488, 489], 135)
-    femmesh.addFace([15, 128, 129, 486, 490, 488], 136)
-    femmesh.addFace([3, 16, 130, 356, 491, 492], 137)
-    femmesh.addFace([26, 3, 130, 367, 492, 493], 138)
-    femmesh.addFace([16, 129, 130, 489, 494, 491], 139)
-    femmesh.addFace([17, 18, 131, 358, 495, 496], 140)
-    femmesh.addFace([19, 20, 132, 360, 497, 498], 141)
-    femmesh.addFace([21, 22, 133, 362, 499, 500], 142)
-    femmesh.addFace([23, 24, 134, 364, 501, 502], 143)
-    femmesh.addFace([25, 2, 35, 366, 377, 503], 144)
-    femmesh.addFace([27, 26, 135, 368, 504, 505], 145)
-    femmesh.addFace([26, 130, 135, 493, 506, 504], 146)
-    femmesh.addFace([28, 27, 136, 369, 507, 508], 147)
-    femmesh.addFace([27, 135, 136, 505, 509, 507], 148)
-    femmesh.addFace([29, 28, 137, 370, 510, 511], 149)
-    femmesh.addFace([28, 136, 137, 508, 512, 510], 150)
-    femmesh.addFace([30, 29, 138, 371, 513, 514], 151)
-    femmesh.addFace([29, 137, 138, 511, 515, 513], 152)
-    femmesh.addFace([31, 30, 139, 372, 516, 517], 153)
-    femmesh.addFace([30, 138, 139, 514, 518, 516], 154)
-    femmesh.addFace([32, 31, 140, 373, 519, 520], 155)
-    femmesh.addFace([31, 139, 140, 517, 521, 519], 156)
-    femmesh.addFace([33, 32, 141, 374, 522, 523], 157)
-    femmesh.addFace([32, 140, 141, 520, 524, 522], 158)
-    femmesh.addFace([34, 33, 142, 375, 525, 526], 159)
-    femmesh.addFace([33, 141, 142, 523, 527, 525], 160)
-    femmesh.addFace([1, 34, 38, 376, 528, 381], 161)
-    femmesh.addFace([35, 36, 143, 378, 529, 530], 162)
-    femmesh.addFace([37, 38, 144, 380, 531, 532], 163)
-    femmesh.addFace([25, 35, 143, 503, 530, 533], 164)
-    femmesh.addFace([18, 19, 145, 359, 534, 535], 165)
-    femmesh.addFace([20, 21, 146, 361, 536, 537], 166)
-    femmesh.addFace([22, 23, 147, 363, 538, 539], 167)
-    femmesh.addFace([145, 19, 132, 534, 498, 540], 168)
-    femmesh.addFace([24, 25, 148, 365, 541, 542], 169)
-    femmesh.addFace([131, 18, 145, 495, 535, 543], 170)
-    femmesh.addFace([38, 34, 142, 528, 526, 544], 171)
-    femmesh.addFace([36, 37, 149, 379, 545, 546], 172)
-    femmesh.addFace([38, 142, 144, 544, 547, 531], 173)
-    femmesh.addFace([13, 17, 131, 482, 496, 548], 174)
-    femmesh.addFace([133, 22, 147, 499, 539, 549], 175)
-    femmesh.addFace([134, 24, 148, 501, 542, 550], 176)
-    femmesh.addFace([146, 21, 133, 536, 500, 551], 177)
-    femmesh.addFace([147, 23, 134, 538, 502, 552], 178)
-    femmesh.addFace([36, 149, 143, 546, 553, 529], 179)
-    femmesh.addFace([20, 146, 132, 537, 554, 497], 180)
-    femmesh.addFace([149, 37, 144, 545, 532, 555], 181)
-    femmesh.addFace([127, 13, 131, 483, 548, 556], 182)
-    femmesh.addFace([129, 128, 150, 490, 557, 558], 183)
-    femmesh.addFace([130, 129, 151, 494, 559, 560], 184)
-    femmesh.addFace([135, 130, 151, 506, 560, 561], 185)
-    femmesh.addFace([129, 150, 151, 558, 562, 559], 186)
-    femmesh.addFace([149, 144, 152, 555, 563, 564], 187)
-    femmesh.addFace([133, 147, 153, 549, 565, 566], 188)
-    femmesh.addFace([146, 133, 154, 551, 567, 568], 189)
-    femmesh.addFace([133, 153, 154, 566, 569, 567], 190)
-    femmesh.addFace([134, 148, 155, 550, 570, 571], 191)
-    femmesh.addFace([145, 132, 156, 540, 572, 573], 192)
-    femmesh.addFace([148, 25, 143, 541, 533, 574], 193)
-    femmesh.addFace([131, 145, 157, 543, 575, 576], 194)
-    femmesh.addFace([145, 156, 157, 573, 577, 575], 195)
-    femmesh.addFace([136, 135, 158, 509, 578, 579], 196)
-    femmesh.addFace([135, 151, 158, 561, 580, 578], 197)
-    femmesh.addFace([137, 136, 159, 512, 581, 582], 198)
-    femmesh.addFace([136, 158, 159, 579, 583, 581], 199)
-    femmesh.addFace([138, 137, 160, 515, 584, 585], 200)
-    femmesh.addFace([137, 159, 160, 582, 586, 584], 201)
-    femmesh.addFace([139, 138, 161, 518, 587, 588], 202)
-    femmesh.addFace([138, 160, 161, 585, 589, 587], 203)
-    femmesh.addFace([140, 139, 162, 521, 590, 591], 204)
-    femmesh.addFace([139, 161, 162, 588, 592, 590], 205)
-    femmesh.addFace([132, 146, 163, 554, 593, 594], 206)
-    femmesh.addFace([156, 132, 163, 572, 594, 595], 207)
-    femmesh.addFace([146, 154, 163, 568, 596, 593], 208)
-    femmesh.addFace([127, 131, 157, 556, 576, 597], 209)
-    femmesh.addFace([144, 142, 164, 547, 598, 599], 210)
-    femmesh.addFace([152, 144, 164, 563, 599, 600], 211)
-    femmesh.addFace([142, 141, 164, 527, 601, 598], 212)
-    femmesh.addFace([128, 127, 157, 487, 597, 602], 213)
-    femmesh.addFace([148, 143, 155, 574, 603, 570], 214)
-    femmesh.addFace([150, 128, 157, 557, 602, 604], 215)
-    femmesh.addFace([155, 143, 149, 603, 553, 605], 216)
-    femmesh.addFace([147, 134, 165, 552, 606, 607], 217)
-    femmesh.addFace([147, 165, 153, 607, 608, 565], 218)
-    femmesh.addFace([141, 140, 166, 524, 609, 610], 219)
-    femmesh.addFace([155, 149, 152, 605, 564, 611], 220)
-    femmesh.addFace([164, 141, 166, 601, 610, 612], 221)
-    femmesh.addFace([165, 134, 155, 606, 571, 613], 222)
-    femmesh.addFace([155, 152, 165, 611, 614, 613], 223)
-    femmesh.addFace([154, 153, 167, 569, 615, 616], 224)
-    femmesh.addFace([140, 162, 166, 591, 617, 609], 225)
-    femmesh.addFace([158, 151, 168, 580, 618, 619], 226)
-    femmesh.addFace([151, 150, 168, 562, 620, 618], 227)
-    femmesh.addFace([159, 158, 169, 583, 621, 622], 228)
-    femmesh.addFace([158, 168, 169, 619, 623, 621], 229)
-    femmesh.addFace([161, 160, 167, 589, 624, 625], 230)
-    femmesh.addFace([162, 161, 170, 592, 626, 627], 231)
-    femmesh.addFace([166, 162, 170, 617, 627, 628], 232)
-    femmesh.addFace([161, 167, 170, 625, 629, 626], 233)
-    femmesh.addFace([164, 166, 152, 612, 630, 600], 234)
-    femmesh.addFace([156, 163, 169, 595, 631, 632], 235)
-    femmesh.addFace([165, 166, 170, 634, 628, 633], 236)
-    femmesh.addFace([166, 165, 152, 634, 614, 630], 237)
-    femmesh.addFace([150, 157, 168, 604, 635, 620], 238)
-    femmesh.addFace([153, 165, 170, 608, 633, 636], 239)
-    femmesh.addFace([153, 170, 167, 636, 629, 615], 240)
-    femmesh.addFace([168, 157, 156, 635, 577, 637], 241)
-    femmesh.addFace([160, 159, 171, 586, 638, 639], 242)
-    femmesh.addFace([167, 160, 171, 624, 639, 640], 243)
-    femmesh.addFace([159, 169, 171, 622, 641, 638], 244)
-    femmesh.addFace([163, 154, 171, 596, 642, 643], 245)
-    femmesh.addFace([168, 156, 169, 637, 632, 623], 246)
-    femmesh.addFace([171, 154, 167, 642, 616, 640], 247)
-    femmesh.addFace([171, 169, 163, 641, 631, 643], 248)
-    femmesh.addFace([39, 6, 43, 382, 387, 644], 249)
-    femmesh.addFace([40, 39, 172, 383, 645, 646], 250)
-    femmesh.addFace([41, 40, 173, 384, 647, 648], 251)
-    femmesh.addFace([40, 172, 173, 646, 649, 647], 252)
-    femmesh.addFace([42, 41, 174, 385, 650, 651], 253)
-    femmesh.addFace([41, 173, 174, 648, 652, 650], 254)
-    femmesh.addFace([5, 42, 175, 386, 653, 654], 255)
-    femmesh.addFace([52, 5, 175, 397, 654, 655], 256)
-    femmesh.addFace([42, 174, 175, 651, 656, 653], 257)
-    femmesh.addFace([43, 44, 176, 388, 657, 658], 258)
-    femmesh.addFace([45, 46, 177, 390, 659, 660], 259)
-    femmesh.addFace([47, 48, 178, 392, 661, 662], 260)
-    femmesh.addFace([49, 50, 179, 394, 663, 664], 261)
-    femmesh.addFace([51, 4, 13, 396, 352, 665], 262)
-    femmesh.addFace([53, 52, 180, 398, 666, 667], 263)
-    femmesh.addFace([52, 175, 180, 655, 668, 666], 264)
-    femmesh.addFace([54, 53, 181, 399, 669, 670], 265)
-    femmesh.addFace([53, 180, 181, 667, 671, 669], 266)
-    femmesh.addFace([55, 54, 182, 400, 672, 673], 267)
-    femmesh.addFace([54, 181, 182, 670, 674, 672], 268)
-    femmesh.addFace([56, 55, 183, 401, 675, 676], 269)
-    femmesh.addFace([55, 182, 183, 673, 677, 675], 270)
-    femmesh.addFace([57, 56, 184, 402, 678, 679], 271)
-    femmesh.addFace([56, 183, 184, 676, 680, 678], 272)
-    femmesh.addFace([58, 57, 185, 403, 681, 682], 273)
-    femmesh.addFace([57, 184, 185, 679, 683, 681], 274)
-    femmesh.addFace([59, 58, 186, 404, 684, 685], 275)
-    femmesh.addFace([58, 185, 186, 682, 686, 684], 276)
-    femmesh.addFace([60, 59, 187, 405, 687, 688], 277)
-    femmesh.addFace([59, 186, 187, 685, 689, 687], 278)
-    femmesh.addFace([3, 60, 16, 406, 690, 356], 279)
-    femmesh.addFace([13, 14, 188, 353, 691, 692], 280)
-    femmesh.addFace([15, 16, 189, 355, 693, 694], 281)
-    femmesh.addFace([51, 13, 188, 665, 692, 695], 282)
-    femmesh.addFace([44, 45, 190, 389, 696, 697], 283)
-    femmesh.addFace([46, 47, 191, 391, 698, 699], 284)
-    femmesh.addFace([48, 49, 192, 393, 700, 701], 285)
-    femmesh.addFace([190, 45, 177, 696, 660, 702], 286)
-    femmesh.addFace([50, 51, 193, 395, 703, 704], 287)
-    femmesh.addFace([176, 44, 190, 657, 697, 705], 288)
-    femmesh.addFace([16, 60, 187, 690, 688, 706], 289)
-    femmesh.addFace([14, 15, 194, 354, 707, 708], 290)
-    femmesh.addFace([16, 187, 189, 706, 709, 693], 291)
-    femmesh.addFace([39, 43, 176, 644, 658, 710], 292)
-    femmesh.addFace([178, 48, 192, 661, 701, 711], 293)
-    femmesh.addFace([179, 50, 193, 663, 704, 712], 294)
-    femmesh.addFace([191, 47, 178, 698, 662, 713], 295)
-    femmesh.addFace([192, 49, 179, 700, 664, 714], 296)
-    femmesh.addFace([14, 194, 188, 708, 715, 691], 297)
-    femmesh.addFace([46, 191, 177, 699, 716, 659], 298)
-    femmesh.addFace([194, 15, 189, 707, 694, 717], 299)
-    femmesh.addFace([172, 39, 176, 645, 710, 718], 300)
-    femmesh.addFace([174, 173, 195, 652, 719, 720], 301)
-    femmesh.addFace([175, 174, 196, 656, 721, 722], 302)
-    femmesh.addFace([180, 175, 196, 668, 722, 723], 303)
-    femmesh.addFace([174, 195, 196, 720, 724, 721], 304)
-    femmesh.addFace([194, 189, 197, 717, 725, 726], 305)
-    femmesh.addFace([178, 192, 198, 711, 727, 728], 306)
-    femmesh.addFace([191, 178, 199, 713, 729, 730], 307)
-    femmesh.addFace([178, 198, 199, 728, 731, 729], 308)
-    femmesh.addFace([179, 193, 200, 712, 732, 733], 309)
-    femmesh.addFace([190, 177, 201, 702, 734, 735], 310)
-    femmesh.addFace([193, 51, 188, 703, 695, 736], 311)
-    femmesh.addFace([176, 190, 202, 705, 737, 738], 312)
-    femmesh.addFace([190, 201, 202, 735, 739, 737], 313)
-    femmesh.addFace([181, 180, 203, 671, 740, 741], 314)
-    femmesh.addFace([180, 196, 203, 723, 742, 740], 315)
-    femmesh.addFace([182, 181, 204, 674, 743, 744], 316)
-    femmesh.addFace([181, 203, 204, 741, 745, 743], 317)
-    femmesh.addFace([183, 182, 205, 677, 746, 747], 318)
-    femmesh.addFace([182, 204, 205, 744, 748, 746], 319)
-    femmesh.addFace([184, 183, 206, 680, 749, 750], 320)
-    femmesh.addFace([183, 205, 206, 747, 751, 749], 321)
-    femmesh.addFace([185, 184, 207, 683, 752, 753], 322)
-    femmesh.addFace([184, 206, 207, 750, 754, 752], 323)
-    femmesh.addFace([177, 191, 208, 716, 755, 756], 324)
-    femmesh.addFace([201, 177, 208, 734, 756, 757], 325)
-    femmesh.addFace([191, 199, 208, 730, 758, 755], 326)
-    femmesh.addFace([172, 176, 202, 718, 738, 759], 327)
-    femmesh.addFace([189, 187, 209, 709, 760, 761], 328)
-    femmesh.addFace([197, 189, 209, 725, 761, 762], 329)
-    femmesh.addFace([187, 186, 209, 689, 763, 760], 330)
-    femmesh.addFace([173, 172, 202, 649, 759, 764], 331)
-    femmesh.addFace([193, 188, 200, 736, 765, 732], 332)
-    femmesh.addFace([195, 173, 202, 719, 764, 766], 333)
-    femmesh.addFace([200, 188, 194, 765, 715, 767], 334)
-    femmesh.addFace([192, 179, 210, 714, 768, 769], 335)
-    femmesh.addFace([192, 210, 198, 769, 770, 727], 336)
-    femmesh.addFace([186, 185, 211, 686, 771, 772], 337)
-    femmesh.addFace([200, 194, 197, 767, 726, 773], 338)
-    femmesh.addFace([209, 186, 211, 763, 772, 774], 339)
-    femmesh.addFace([210, 179, 200, 768, 733, 775], 340)
-    femmesh.addFace([200, 197, 210, 773, 776, 775], 341)
-    femmesh.addFace([199, 198, 212, 731, 777, 778], 342)
-    femmesh.addFace([185, 207, 211, 753, 779, 771], 343)
-    femmesh.addFace([203, 196, 213, 742, 780, 781], 344)
-    femmesh.addFace([196, 195, 213, 724, 782, 780], 345)
-    femmesh.addFace([204, 203, 214, 745, 783, 784], 346)
-    femmesh.addFace([203, 213, 214, 781, 785, 783], 347)
-    femmesh.addFace([206, 205, 212, 751, 786, 787], 348)
-    femmesh.addFace([207, 206, 215, 754, 788, 789], 349)
-    femmesh.addFace([211, 207, 215, 779, 789, 790], 350)
-    femmesh.addFace([206, 212, 215, 787, 791, 788], 351)
-    femmesh.addFace([209, 211, 197, 774, 792, 762], 352)
-    femmesh.addFace([201, 208, 214, 757, 793, 794], 353)
-    femmesh.addFace([210, 211, 215, 796, 790, 795], 354)
-    femmesh.addFace([211, 210, 197, 796, 776, 792], 355)
-    femmesh.addFace([195, 202, 213, 766, 797, 782], 356)
-    femmesh.addFace([198, 210, 215, 770, 795, 798], 357)
-    femmesh.addFace([198, 215, 212, 798, 791, 777], 358)
-    femmesh.addFace([213, 202, 201, 797, 739, 799], 359)
-    femmesh.addFace([205, 204, 216, 748, 800, 801], 360)
-    femmesh.addFace([212, 205, 216, 786, 801, 802], 361)
-    femmesh.addFace([204, 214, 216, 784, 803, 800], 362)
-    femmesh.addFace([208, 199, 216, 758, 804, 805], 363)
-    femmesh.addFace([213, 201, 214, 799, 794, 785], 364)
-    femmesh.addFace([216, 199, 212, 804, 778, 802], 365)
-    femmesh.addFace([216, 214, 208, 803, 793, 805], 366)
-    femmesh.addFace([61, 8, 65, 407, 412, 806], 367)
-    femmesh.addFace([62, 61, 217, 408, 807, 808], 368)
-    femmesh.addFace([63, 62, 218, 409, 809, 810], 369)
-    femmesh.addFace([62, 217, 218, 808, 811, 809], 370)
-    femmesh.addFace([64, 63, 219, 410, 812, 813], 371)
-    femmesh.addFace([63, 218, 219, 810, 814, 812], 372)
-    femmesh.addFace([7, 64, 220, 411, 815, 816], 373)
-    femmesh.addFace([74, 7, 220, 422, 816, 817], 374)
-    femmesh.addFace([64, 219, 220, 813, 818, 815], 375)
-    femmesh.addFace([65, 66, 221, 413, 819, 820], 376)
-    femmesh.addFace([67, 68, 222, 415, 821, 822], 377)
-    femmesh.addFace([69, 70, 223, 417, 823, 824], 378)
-    femmesh.addFace([71, 72, 224, 419, 825, 826], 379)
-    femmesh.addFace([73, 6, 39, 421, 382, 827], 380)
-    femmesh.addFace([75, 74, 225, 423, 828, 829], 381)
-    femmesh.addFace([74, 220, 225, 817, 830, 828], 382)
-    femmesh.addFace([76, 75, 226, 424, 831, 832], 383)
-    femmesh.addFace([75, 225, 226, 829, 833, 831], 384)
-    femmesh.addFace([77, 76, 227, 425, 834, 835], 385)
-    femmesh.addFace([76, 226, 227, 832, 836, 834], 386)
-    femmesh.addFace([78, 77, 228, 426, 837, 838], 387)
-    femmesh.addFace([77, 227, 228, 835, 839, 837], 388)
-    femmesh.addFace([79, 78, 229, 427, 840, 841], 389)
-    femmesh.addFace([78, 228, 229, 838, 842, 840], 390)
-    femmesh.addFace([80, 79, 230, 428, 843, 844], 391)
-    femmesh.addFace([79, 229, 230, 841, 845, 843], 392)
-    femmesh.addFace([81, 80, 231, 429, 846, 847], 393)
-    femmesh.addFace([80, 230, 231, 844, 848, 846], 394)
-    femmesh.addFace([82, 81, 232, 430, 849, 850], 395)
-    femmesh.addFace([81, 231, 232, 847, 851, 849], 396)
-    femmesh.addFace([5, 82, 42, 431, 852, 386], 397)
-    femmesh.addFace([39, 40, 233, 383, 853, 854], 398)
-    femmesh.addFace([41, 42, 234, 385, 855, 856], 399)
-    femmesh.addFace([73, 39, 233, 827, 854, 857], 400)
-    femmesh.addFace([66, 67, 235, 414, 858, 859], 401)
-    femmesh.addFace([68, 69, 236, 416, 860, 861], 402)
-    femmesh.addFace([70, 71, 237, 418, 862, 863], 403)
-    femmesh.addFace([235, 67, 222, 858, 822, 864], 404)
-    femmesh.addFace([72, 73, 238, 420, 865, 866], 405)
-    femmesh.addFace([221, 66, 235, 819, 859, 867], 406)
-    femmesh.addFace([42, 82, 232, 852, 850, 868], 407)
-    femmesh.addFace([40, 41, 239, 384, 869, 870], 408)
-    femmesh.addFace([42, 232, 234, 868, 871, 855], 409)
-    femmesh.addFace([61, 65, 221, 806, 820, 872], 410)
-    femmesh.addFace([223, 70, 237, 823, 863, 873], 411)
-    femmesh.addFace([224, 72, 238, 825, 866, 874], 412)
-    femmesh.addFace([236, 69, 223, 860, 824, 875], 413)
-    femmesh.addFace([237, 71, 224, 862, 826, 876], 414)
-    femmesh.addFace([40, 239, 233, 870, 877, 853], 415)
-    femmesh.addFace([68, 236, 222, 861, 878, 821], 416)
-    femmesh.addFace([239, 41, 234, 869, 856, 879], 417)
-    femmesh.addFace([217, 61, 221, 807, 872, 880], 418)
-    femmesh.addFace([219, 218, 240, 814, 881, 882], 419)
-    femmesh.addFace([220, 219, 241, 818, 883, 884], 420)
-    femmesh.addFace([225, 220, 241, 830, 884, 885], 421)
-    femmesh.addFace([219, 240, 241, 882, 886, 883], 422)
-    femmesh.addFace([239, 234, 242, 879, 887, 888], 423)
-    femmesh.addFace([223, 237, 243, 873, 889, 890], 424)
-    femmesh.addFace([236, 223, 244, 875, 891, 892], 425)
-    femmesh.addFace([223, 243, 244, 890, 893, 891], 426)
-    femmesh.addFace([224, 238, 245, 874, 894, 895], 427)
-    femmesh.addFace([235, 222, 246, 864, 896, 897], 428)
-    femmesh.addFace([238, 73, 233, 865, 857, 898], 429)
-    femmesh.addFace([221, 235, 247, 867, 899, 900], 430)
-    femmesh.addFace([235, 246, 247, 897, 901, 899], 431)
-    femmesh.addFace([226, 225, 248, 833, 902, 903], 432)
-    femmesh.addFace([225, 241, 248, 885, 904, 902], 433)
-    femmesh.addFace([227, 226, 249, 836, 905, 906], 434)
-    femmesh.addFace([226, 248, 249, 903, 907, 905], 435)
-    femmesh.addFace([228, 227, 250, 839, 908, 909], 436)
-    femmesh.addFace([227, 249, 250, 906, 910, 908], 437)
-    femmesh.addFace([229, 228, 251, 842, 911, 912], 438)
-    femmesh.addFace([228, 250, 251, 909, 913, 911], 439)
-    femmesh.addFace([230, 229, 252, 845, 914, 915], 440)
-    femmesh.addFace([229, 251, 252, 912, 916, 914], 441)
-    femmesh.addFace([222, 236, 253, 878, 917, 918], 442)
-    femmesh.addFace([246, 222, 253, 896, 918, 919], 443)
-    femmesh.addFace([236, 244, 253, 892, 920, 917], 444)
-    femmesh.addFace([217, 221, 247, 880, 900, 921], 445)
-    femmesh.addFace([234, 232, 254, 871, 922, 923], 446)
-    femmesh.addFace([242, 234, 254, 887, 923, 924], 447)
-    femmesh.addFace([232, 231, 254, 851, 925, 922], 448)
-    femmesh.addFace([218, 217, 247, 811, 921, 926], 449)
-    femmesh.addFace([238, 233, 245, 898, 927, 894], 450)
-    femmesh.addFace([240, 218, 247, 881, 926, 928], 451)
-    femmesh.addFace([245, 233, 239, 927, 877, 929], 452)
-    femmesh.addFace([237, 224, 255, 876, 930, 931], 453)
-    femmesh.addFace([237, 255, 243, 931, 932, 889], 454)
-    femmesh.addFace([231, 230, 256, 848, 933, 934], 455)
-    femmesh.addFace([245, 239, 242, 929, 888, 935], 456)
-    femmesh.addFace([254, 231, 256, 925, 934, 936], 457)
-    femmesh.addFace([255, 224, 245, 930, 895, 937], 458)
-    femmesh.addFace([245, 242, 255, 935, 938, 937], 459)
-    femmesh.addFace([244, 243, 257, 893, 939, 940], 460)
-    femmesh.addFace([230, 252, 256, 915, 941, 933], 461)
-    femmesh.addFace([248, 241, 258, 904, 942, 943], 462)
-    femmesh.addFace([241, 240, 258, 886, 944, 942], 463)
-    femmesh.addFace([249, 248, 259, 907, 945, 946], 464)
-    femmesh.addFace([248, 258, 259, 943, 947, 945], 465)
-    femmesh.addFace([251, 250, 257, 913, 948, 949], 466)
-    femmesh.addFace([252, 251, 260, 916, 950, 951], 467)
-    femmesh.addFace([256, 252, 260, 941, 951, 952], 468)
-    femmesh.addFace([251, 257, 260, 949, 953, 950], 469)
-    femmesh.addFace([254, 256, 242, 936, 954, 924], 470)
-    femmesh.addFace([246, 253, 259, 919, 955, 956], 471)
-    femmesh.addFace([255, 256, 260, 958, 952, 957], 472)
-    femmesh.addFace([256, 255, 242, 958, 938, 954], 473)
-    femmesh.addFace([240, 247, 258, 928, 959, 944], 474)
-    femmesh.addFace([243, 255, 260, 932, 957, 960], 475)
-    femmesh.addFace([243, 260, 257, 960, 953, 939], 476)
-    femmesh.addFace([258, 247, 246, 959, 901, 961], 477)
-    femmesh.addFace([250, 249, 261, 910, 962, 963], 478)
-    femmesh.addFace([257, 250, 261, 948, 963, 964], 479)
-    femmesh.addFace([249, 259, 261, 946, 965, 962], 480)
-    femmesh.addFace([253, 244, 261, 920, 966, 967], 481)
-    femmesh.addFace([258, 246, 259, 961, 956, 947], 482)
-    femmesh.addFace([261, 244, 257, 966, 940, 964], 483)
-    femmesh.addFace([261, 259, 253, 965, 955, 967], 484)
-    femmesh.addFace([83, 10, 87, 432, 437, 968], 485)
-    femmesh.addFace([84, 83, 262, 433, 969, 970], 486)
-    femmesh.addFace([85, 84, 263, 434, 971, 972], 487)
-    femmesh.addFace([84, 262, 263, 970, 973, 971], 488)
-    femmesh.addFace([86, 85, 264, 435, 974, 975], 489)
-    femmesh.addFace([85, 263, 264, 972, 976, 974], 490)
-    femmesh.addFace([9, 86, 265, 436, 977, 978], 491)
-    femmesh.addFace([96, 9, 265, 447, 978, 979], 492)
-    femmesh.addFace([86, 264, 265, 975, 980, 977], 493)
-    femmesh.addFace([87, 88, 266, 438, 981, 982], 494)
-    femmesh.addFace([89, 90, 267, 440, 983, 984], 495)
-    femmesh.addFace([91, 92, 268, 442, 985, 986], 496)
-    femmesh.addFace([93, 94, 269, 444, 987, 988], 497)
-    femmesh.addFace([95, 8, 61, 446, 407, 989], 498)
-    femmesh.addFace([97, 96, 270, 448, 990, 991], 499)
-    femmesh.addFace([96, 265, 270, 979, 992, 990], 500)
-    femmesh.addFace([98, 97, 271, 449, 993, 994], 501)
-    femmesh.addFace([97, 270, 271, 991, 995, 993], 502)
-    femmesh.addFace([99, 98, 272, 450, 996, 997], 503)
-    femmesh.addFace([98, 271, 272, 994, 998, 996], 504)
-    femmesh.addFace([100, 99, 273, 451, 999, 1000], 505)
-    femmesh.addFace([99, 272, 273, 997, 1001, 999], 506)
-    femmesh.addFace([101, 100, 274, 452, 1002, 1003], 507)
-    femmesh.addFace([100, 273, 274, 1000, 1004, 1002], 508)
-    femmesh.addFace([102, 101, 275, 453, 1005, 1006], 509)
-    femmesh.addFace([101, 274, 275, 1003, 1007, 1005], 510)
-    femmesh.addFace([103, 102, 276, 454, 1008, 1009], 511)
-    femmesh.addFace([102, 275, 276, 1006, 1010, 1008], 512)
-    femmesh.addFace([104, 103, 277, 455, 1011, 1012], 513)
-    femmesh.addFace([103, 276, 277, 1009, 1013, 1011], 514)
-    femmesh.addFace([7, 104, 64, 456, 1014, 411], 515)
-    femmesh.addFace([61, 62, 278, 408, 1015, 1016], 516)
-    femmesh.addFace([63, 64, 279, 410, 1017, 1018], 517)
-    femmesh.addFace([95, 61, 278, 989, 1016, 1019], 518)
-    femmesh.addFace([88, 89, 280, 439, 1020, 1021], 519)
-    femmesh.addFace([90, 91, 281, 441, 1022, 1023], 520)
-    femmesh.addFace([92, 93, 282, 443, 1024, 1025], 521)
-    femmesh.addFace([280, 89, 267, 1020, 984, 1026], 522)
-    femmesh.addFace([94, 95, 283, 445, 1027, 1028], 523)
-    femmesh.addFace([266, 88, 280, 981, 1021, 1029], 524)
-    femmesh.addFace([64, 104, 277, 1014, 1012, 1030], 525)
-    femmesh.addFace([62, 63, 284, 409, 1031, 1032], 526)
-    femmesh.addFace([64, 277, 279, 1030, 1033, 1017], 527)
-    femmesh.addFace([83, 87, 266, 968, 982, 1034], 528)
-    femmesh.addFace([268, 92, 282, 985, 1025, 1035], 529)
-    femmesh.addFace([269, 94, 283, 987, 1028, 1036], 530)
-    femmesh.addFace([281, 91, 268, 1022, 986, 1037], 531)
-    femmesh.addFace([282, 93, 269, 1024, 988, 1038], 532)
-    femmesh.addFace([62, 284, 278, 1032, 1039, 1015], 533)
-    femmesh.addFace([90, 281, 267, 1023, 1040, 983], 534)
-    femmesh.addFace([284, 63, 279, 1031, 1018, 1041], 535)
-    femmesh.addFace([262, 83, 266, 969, 1034, 1042], 536)
-    femmesh.addFace([264, 263, 285, 976, 1043, 1044], 537)
-    femmesh.addFace([265, 264, 286, 980, 1045, 1046], 538)
-    femmesh.addFace([270, 265, 286, 992, 1046, 1047], 539)
-    femmesh.addFace([264, 285, 286, 1044, 1048, 1045], 540)
-    femmesh.addFace([284, 279, 287, 1041, 1049, 1050], 541)
-    femmesh.addFace([268, 282, 288, 1035, 1051, 1052], 542)
-    femmesh.addFace([281, 268, 289, 1037, 1053, 1054], 543)
-    femmesh.addFace([268, 288, 289, 1052, 1055, 1053], 544)
-    femmesh.addFace([269, 283, 290, 1036, 1056, 1057], 545)
-    femmesh.addFace([280, 267, 291, 1026, 1058, 1059], 546)
-    femmesh.addFace([283, 95, 278, 1027, 1019, 1060], 547)
-    femmesh.addFace([266, 280, 292, 1029, 1061, 1062], 548)
-    femmesh.addFace([280, 291, 292, 1059, 1063, 1061], 549)
-    femmesh.addFace([271, 270, 293, 995, 1064, 1065], 550)
-    femmesh.addFace([270, 286, 293, 1047, 1066, 1064], 551)
-    femmesh.addFace([272, 271, 294, 998, 1067, 1068], 552)
-    femmesh.addFace([271, 293, 294, 1065, 1069, 1067], 553)
-    femmesh.addFace([273, 272, 295, 1001, 1070, 1071], 554)
-    femmesh.addFace([272, 294, 295, 1068, 1072, 1070], 555)
-    femmesh.addFace([274, 273, 296, 1004, 1073, 1074], 556)
-    femmesh.addFace([273, 295, 296, 1071, 1075, 1073], 557)
-    femmesh.addFace([275, 274, 297, 1007, 1076, 1077], 558)
-    femmesh.addFace([274, 296, 297, 1074, 1078, 1076], 559)
-    femmesh.addFace([267, 281, 298, 1040, 1079, 1080], 560)
-    femmesh.addFace([291, 267, 298, 1058, 1080, 1081], 561)
-    femmesh.addFace([281, 289, 298, 1054, 1082, 1079], 562)
-    femmesh.addFace([262, 266, 292, 1042, 1062, 1083], 563)
-    femmesh.addFace([279, 277, 299, 1033, 1084, 1085], 564)
-    femmesh.addFace([287, 279, 299, 1049, 1085, 1086], 565)
-    femmesh.addFace([277, 276, 299, 1013, 1087, 1084], 566)
-    femmesh.addFace([263, 262, 292, 973, 1083, 1088], 567)
-    femmesh.addFace([283, 278, 290, 1060, 1089, 1056], 568)
-    femmesh.addFace([285, 263, 292, 1043, 1088, 1090], 569)
-    femmesh.addFace([290, 278, 284, 1089, 1039, 1091], 570)
-    femmesh.addFace([282, 269, 300, 1038, 1092, 1093], 571)
-    femmesh.addFace([282, 300, 288, 1093, 1094, 1051], 572)
-    femmesh.addFace([276, 275, 301, 1010, 1095, 1096], 573)
-    femmesh.addFace([290, 284, 287, 1091, 1050, 1097], 574)
-    femmesh.addFace([299, 276, 301, 1087, 1096, 1098], 575)
-    femmesh.addFace([300, 269, 290, 1092, 1057, 1099], 576)
-    femmesh.addFace([290, 287, 300, 1097, 1100, 1099], 577)
-    femmesh.addFace([289, 288, 302, 1055, 1101, 1102], 578)
-    femmesh.addFace([275, 297, 301, 1077, 1103, 1095], 579)
-    femmesh.addFace([293, 286, 303, 1066, 1104, 1105], 580)
-    femmesh.addFace([286, 285, 303, 1048, 1106, 1104], 581)
-    femmesh.addFace([294, 293, 304, 1069, 1107, 1108], 582)
-    femmesh.addFace([293, 303, 304, 1105, 1109, 1107], 583)
-    femmesh.addFace([296, 295, 302, 1075, 1110, 1111], 584)
-    femmesh.addFace([297, 296, 305, 1078, 1112, 1113], 585)
-    femmesh.addFace([301, 297, 305, 1103, 1113, 1114], 586)
-    femmesh.addFace([296, 302, 305, 1111, 1115, 1112], 587)
-    femmesh.addFace([299, 301, 287, 1098, 1116, 1086], 588)
-    femmesh.addFace([291, 298, 304, 1081, 1117, 1118], 589)
-    femmesh.addFace([300, 301, 305, 1120, 1114, 1119], 590)
-    femmesh.addFace([301, 300, 287, 1120, 1100, 1116], 591)
-    femmesh.addFace([285, 292, 303, 1090, 1121, 1106], 592)
-    femmesh.addFace([288, 300, 305, 1094, 1119, 1122], 593)
-    femmesh.addFace([288, 305, 302, 1122, 1115, 1101], 594)
-    femmesh.addFace([303, 292, 291, 1121, 1063, 1123], 595)
-    femmesh.addFace([295, 294, 306, 1072, 1124, 1125], 596)
-    femmesh.addFace([302, 295, 306, 1110, 1125, 1126], 597)
-    femmesh.addFace([294, 304, 306, 1108, 1127, 1124], 598)
-    femmesh.addFace([298, 289, 306, 1082, 1128, 1129], 599)
-    femmesh.addFace([303, 291, 304, 1123, 1118, 1109], 600)
-    femmesh.addFace([306, 289, 302, 1128, 1102, 1126], 601)
-    femmesh.addFace([306, 304, 298, 1127, 1117, 1129], 602)
-    femmesh.addFace([105, 12, 109, 457, 462, 1130], 603)
-    femmesh.addFace([106, 105, 307, 458, 1131, 1132], 604)
-    femmesh.addFace([107, 106, 308, 459, 1133, 1134], 605)
-    femmesh.addFace([106, 307, 308, 1132, 1135, 1133], 606)
-    femmesh.addFace([108, 107, 309, 460, 1136, 1137], 607)
-    femmesh.addFace([107, 308, 309, 1134, 1138, 1136], 608)
-    femmesh.addFace([11, 108, 310, 461, 1139, 1140], 609)
-    femmesh.addFace([118, 11, 310, 472, 1140, 1141], 610)
-    femmesh.addFace([108, 309, 310, 1137, 1142, 1139], 611)
-    femmesh.addFace([109, 110, 311, 463, 1143, 1144], 612)
-    femmesh.addFace([111, 112, 312, 465, 1145, 1146], 613)
-    femmesh.addFace([113, 114, 313, 467, 1147, 1148], 614)
-    femmesh.addFace([115, 116, 314, 469, 1149, 1150], 615)
-    femmesh.addFace([117, 10, 83, 471, 432, 1151], 616)
-    femmesh.addFace([119, 118, 315, 473, 1152, 1153], 617)
-    femmesh.addFace([118, 310, 315, 1141, 1154, 1152], 618)
-    femmesh.addFace([120, 119, 316, 474, 1155, 1156], 619)
-    femmesh.addFace([119, 315, 316, 1153, 1157, 1155], 620)
-    femmesh.addFace([121, 120, 317, 475, 1158, 1159], 621)
-    femmesh.addFace([120, 316, 317, 1156, 1160, 1158], 622)
-    femmesh.addFace([122, 121, 318, 476, 1161, 1162], 623)
-    femmesh.addFace([121, 317, 318, 1159, 1163, 1161], 624)
-    femmesh.addFace([123, 122, 319, 477, 1164, 1165], 625)
-    femmesh.addFace([122, 318, 319, 1162, 1166, 1164], 626)
-    femmesh.addFace([124, 123, 320, 478, 1167, 1168], 627)
-    femmesh.addFace([123, 319, 320, 1165, 1169, 1167], 628)
-    femmesh.addFace([125, 124, 321, 479, 1170, 1171], 629)
-    femmesh.addFace([124, 320, 321, 1168, 1172, 1170], 630)
-    femmesh.addFace([126, 125, 322, 480, 1173, 1174], 631)
-    femmesh.addFace([125, 321, 322, 1171, 1175, 1173], 632)
-    femmesh.addFace([9, 126, 86, 481, 1176, 436], 633)
-    femmesh.addFace([83, 84, 323, 433, 1177, 1178], 634)
-    femmesh.addFace([85, 86, 324, 435, 1179, 1180], 635)
-    femmesh.addFace([117, 83, 323, 1151, 1178, 1181], 636)
-    femmesh.addFace([110, 111, 325, 464, 1182, 1183], 637)
-    femmesh.addFace([112, 113, 326, 466, 1184, 1185], 638)
-    femmesh.addFace([114, 115, 327, 468, 1186, 1187], 639)
-    femmesh.addFace([325, 111, 312, 1182, 1146, 1188], 640)
-    femmesh.addFace([116, 117, 328, 470, 1189, 1190], 641)
-    femmesh.addFace([311, 110, 325, 1143, 1183, 1191], 642)
-    femmesh.addFace([86, 126, 322, 1176, 1174, 1192], 643)
-    femmesh.addFace([84, 85, 329, 434, 1193, 1194], 644)
-    femmesh.addFace([86, 322, 324, 1192, 1195, 1179], 645)
-    femmesh.addFace([105, 109, 311, 1130, 1144, 1196], 646)
-    femmesh.addFace([313, 114, 327, 1147, 1187, 1197], 647)
-    femmesh.addFace([314, 116, 328, 1149, 1190, 1198], 648)
-    femmesh.addFace([326, 113, 313, 1184, 1148, 1199], 649)
-    femmesh.addFace([327, 115, 314, 1186, 1150, 1200], 650)
-    femmesh.addFace([84, 329, 323, 1194, 1201, 1177], 651)
-    femmesh.addFace([112, 326, 312, 1185, 1202, 1145], 652)
-    femmesh.addFace([329, 85, 324, 1193, 1180, 1203], 653)
-    femmesh.addFace([307, 105, 311, 1131, 1196, 1204], 654)
-    femmesh.addFace([309, 308, 330, 1138, 1205, 1206], 655)
-    femmesh.addFace([310, 309, 331, 1142, 1207, 1208], 656)
-    femmesh.addFace([315, 310, 331, 1154, 1208, 1209], 657)
-    femmesh.addFace([309, 330, 331, 1206, 1210, 1207], 658)
-    femmesh.addFace([329, 324, 332, 1203, 1211, 1212], 659)
-    femmesh.addFace([313, 327, 333, 1197, 1213, 1214], 660)
-    femmesh.addFace([326, 313, 334, 1199, 1215, 1216], 661)
-    femmesh.addFace([313, 333, 334, 1214, 1217, 1215], 662)
-    femmesh.addFace([314, 328, 335, 1198, 1218, 1219], 663)
-    femmesh.addFace([325, 312, 336, 1188, 1220, 1221], 664)
-    femmesh.addFace([328, 117, 323, 1189, 1181, 1222], 665)
-    femmesh.addFace([311, 325, 337, 1191, 1223, 1224], 666)
-    femmesh.addFace([325, 336, 337, 1221, 1225, 1223], 667)
-    femmesh.addFace([316, 315, 338, 1157, 1226, 1227], 668)
-    femmesh.addFace([315, 331, 338, 1209, 1228, 1226], 669)
-    femmesh.addFace([317, 316, 339, 1160, 1229, 1230], 670)
-    femmesh.addFace([316, 338, 339, 1227, 1231, 1229], 671)
-    femmesh.addFace([318, 317, 340, 1163, 1232, 1233], 672)
-    femmesh.addFace([317, 339, 340, 1230, 1234, 1232], 673)
-    femmesh.addFace([319, 318, 341, 1166, 1235, 1236], 674)
-    femmesh.addFace([318, 340, 341, 1233, 1237, 1235], 675)
-    femmesh.addFace([320, 319, 342, 1169, 1238, 1239], 676)
-    femmesh.addFace([319, 341, 342, 1236, 1240, 1238], 677)
-    femmesh.addFace([312, 326, 343, 1202, 1241, 1242], 678)
-    femmesh.addFace([336, 312, 343, 1220, 1242, 1243], 679)
-    femmesh.addFace([326, 334, 343, 1216, 1244, 1241], 680)
-    femmesh.addFace([307, 311, 337, 1204, 1224, 1245], 681)
-    femmesh.addFace([324, 322, 344, 1195, 1246, 1247], 682)
-    femmesh.addFace([332, 324, 344, 1211, 1247, 1248], 683)
-    femmesh.addFace([322, 321, 344, 1175, 1249, 1246], 684)
-    femmesh.addFace([308, 307, 337, 1135, 1245, 1250], 685)
-    femmesh.addFace([328, 323, 335, 1222, 1251, 1218], 686)
-    femmesh.addFace([330, 308, 337, 1205, 1250, 1252], 687)
-    femmesh.addFace([335, 323, 329, 1251, 1201, 1253], 688)
-    femmesh.addFace([327, 314, 345, 1200, 1254, 1255], 689)
-    femmesh.addFace([327, 345, 333, 1255, 1256, 1213], 690)
-    femmesh.addFace([321, 320, 346, 1172, 1257, 1258], 691)
-    femmesh.addFace([335, 329, 332, 1253, 1212, 1259], 692)
-    femmesh.addFace([344, 321, 346, 1249, 1258, 1260], 693)
-    femmesh.addFace([345, 314, 335, 1254, 1219, 1261], 694)
-    femmesh.addFace([335, 332, 345, 1259, 1262, 1261], 695)
-    femmesh.addFace([334, 333, 347, 1217, 1263, 1264], 696)
-    femmesh.addFace([320, 342, 346, 1239, 1265, 1257], 697)
-    femmesh.addFace([338, 331, 348, 1228, 1266, 1267], 698)
-    femmesh.addFace([331, 330, 348, 1210, 1268, 1266], 699)
-    femmesh.addFace([339, 338, 349, 1231, 1269, 1270], 700)
-    femmesh.addFace([338, 348, 349, 1267, 1271, 1269], 701)
-    femmesh.addFace([341, 340, 347, 1237, 1272, 1273], 702)
-    femmesh.addFace([342, 341, 350, 1240, 1274, 1275], 703)
-    femmesh.addFace([346, 342, 350, 1265, 1275, 1276], 704)
-    femmesh.addFace([341, 347, 350, 1273, 1277, 1274], 705)
-    femmesh.addFace([344, 346, 332, 1260, 1278, 1248], 706)
-    femmesh.addFace([336, 343, 349, 1243, 1279, 1280], 707)
-    femmesh.addFace([345, 346, 350, 1282, 1276, 1281], 708)
-    femmesh.addFace([346, 345, 332, 1282, 1262, 1278], 709)
-    femmesh.addFace([330, 337, 348, 1252, 1283, 1268], 710)
-    femmesh.addFace([333, 345, 350, 1256, 1281, 1284], 711)
-    femmesh.addFace([333, 350, 347, 1284, 1277, 1263], 712)
-    femmesh.addFace([348, 337, 336, 1283, 1225, 1285], 713)
-    femmesh.addFace([340, 339, 351, 1234, 1286, 1287], 714)
-    femmesh.addFace([347, 340, 351, 1272, 1287, 1288], 715)
-    femmesh.addFace([339, 349, 351, 1270, 1289, 1286], 716)
-    femmesh.addFace([343, 334, 351, 1244, 1290, 1291], 717)
-    femmesh.addFace([348, 336, 349, 1285, 1280, 1271], 718)
-    femmesh.addFace([351, 334, 347, 1290, 1264, 1288], 719)
-    femmesh.addFace([351, 349, 343, 1289, 1279, 1291], 720)
-    return True
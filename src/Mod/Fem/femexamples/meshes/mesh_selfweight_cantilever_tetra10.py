@@ -1,2107 +0,0 @@
-def create_nodes(femmesh):
-    # nodes
-    femmesh.addNode(0.0, 0.0, 1000.0, 1)
-    femmesh.addNode(0.0, 0.0, 0.0, 2)
-    femmesh.addNode(0.0, 1000.0, 1000.0, 3)
-    femmesh.addNode(0.0, 1000.0, 0.0, 4)
-    femmesh.addNode(0.0, 0.0, 500.0, 5)
-    femmesh.addNode(0.0, 500.0, 1000.0, 6)
-    femmesh.addNode(0.0, 1000.0, 500.0, 7)
-    femmesh.addNode(0.0, 500.0, 0.0, 8)
-    femmesh.addNode(0.0, 500.0, 500.0, 9)
-    femmesh.addNode(0.0, 250.0, 750.0, 10)
-    femmesh.addNode(0.0, 250.0, 250.0, 11)
-    femmesh.addNode(0.0, 750.0, 750.0, 12)
-    femmesh.addNode(0.0, 750.0, 250.0, 13)
-    femmesh.addNode(32000.0, 0.0, 1000.0, 14)
-    femmesh.addNode(32000.0, 0.0, 0.0, 15)
-    femmesh.addNode(32000.0, 1000.0, 1000.0, 16)
-    femmesh.addNode(32000.0, 1000.0, 0.0, 17)
-    femmesh.addNode(32000.0, 0.0, 500.0, 18)
-    femmesh.addNode(32000.0, 500.0, 1000.0, 19)
-    femmesh.addNode(32000.0, 1000.0, 500.0, 20)
-    femmesh.addNode(32000.0, 500.0, 0.0, 21)
-    femmesh.addNode(1000.0, 0.0, 0.0, 22)
-    femmesh.addNode(2000.0, 0.0, 0.0, 23)
-    femmesh.addNode(3000.0, 0.0, 0.0, 24)
-    femmesh.addNode(4000.0, 0.0, 0.0, 25)
-    femmesh.addNode(5000.0, 0.0, 0.0, 26)
-    femmesh.addNode(6000.0, 0.0, 0.0, 27)
-    femmesh.addNode(7000.0, 0.0, 0.0, 28)
-    femmesh.addNode(8000.0, 0.0, 0.0, 29)
-    femmesh.addNode(9000.0, 0.0, 0.0, 30)
-    femmesh.addNode(10000.0, 0.0, 0.0, 31)
-    femmesh.addNode(11000.0, 0.0, 0.0, 32)
-    femmesh.addNode(12000.0, 0.0, 0.0, 33)
-    femmesh.addNode(13000.0, 0.0, 0.0, 34)
-    femmesh.addNode(14000.0, 0.0, 0.0, 35)
-    femmesh.addNode(15000.0, 0.0, 0.0, 36)
-    femmesh.addNode(16000.0, 0.0, 0.0, 37)
-    femmesh.addNode(17000.0, 0.0, 0.0, 38)
-    femmesh.addNode(18000.0, 0.0, 0.0, 39)
-    femmesh.addNode(19000.0, 0.0, 0.0, 40)
-    femmesh.addNode(20000.0, 0.0, 0.0, 41)
-    femmesh.addNode(21000.0, 0.0, 0.0, 42)
-    femmesh.addNode(22000.0, 0.0, 0.0, 43)
-    femmesh.addNode(23000.0, 0.0, 0.0, 44)
-    femmesh.addNode(24000.0, 0.0, 0.0, 45)
-    femmesh.addNode(25000.0, 0.0, 0.0, 46)
-    femmesh.addNode(26000.0, 0.0, 0.0, 47)
-    femmesh.addNode(27000.0, 0.0, 0.0, 48)
-    femmesh.addNode(28000.0, 0.0, 0.0, 49)
-    femmesh.addNode(29000.0, 0.0, 0.0, 50)
-    femmesh.addNode(30000.0, 0.0, 0.0, 51)
-    femmesh.addNode(31000.0, 0.0, 0.0, 52)
-    femmesh.addNode(500.0, 0.0, 0.0, 53)
-    femmesh.addNode(1500.0, 0.0, 0.0, 54)
-    femmesh.addNode(2500.0, 0.0, 0.0, 55)
-    femmesh.addNode(3500.0, 0.0, 0.0, 56)
-    femmesh.addNode(4500.0, 0.0, 0.0, 57)
-    femmesh.addNode(5500.0, 0.0, 0.0, 58)
-    femmesh.addNode(6500.0, 0.0, 0.0, 59)
-    femmesh.addNode(7500.0, 0.0, 0.0, 60)
-    femmesh.addNode(8500.0, 0.0, 0.0, 61)
-    femmesh.addNode(9500.0, 0.0, 0.0, 62)
-    femmesh.addNode(10500.0, 0.0, 0.0, 63)
-    femmesh.addNode(11500.0, 0.0, 0.0, 64)
-    femmesh.addNode(12500.0, 0.0, 0.0, 65)
-    femmesh.addNode(13500.0, 0.0, 0.0, 66)
-    femmesh.addNode(14500.0, 0.0, 0.0, 67)
-    femmesh.addNode(15500.0, 0.0, 0.0, 68)
-    femmesh.addNode(16500.0, 0.0, 0.0, 69)
-    femmesh.addNode(17500.0, 0.0, 0.0, 70)
-    femmesh.addNode(18500.0, 0.0, 0.0, 71)
-    femmesh.addNode(19500.0, 0.0, 0.0, 72)
-    femmesh.addNode(20500.0, 0.0, 0.0, 73)
-    femmesh.addNode(21500.0, 0.0, 0.0, 74)
-    femmesh.addNode(22500.0, 0.0, 0.0, 75)
-    femmesh.addNode(23500.0, 0.0, 0.0, 76)
-    femmesh.addNode(24500.0, 0.0, 0.0, 77)
-    femmesh.addNode(25500.0, 0.0, 0.0, 78)
-    femmesh.addNode(26500.0, 0.0, 0.0, 79)
-    femmesh.addNode(27500.0, 0.0, 0.0, 80)
-    femmesh.addNode(28500.0, 0.0, 0.0, 81)
-    femmesh.addNode(29500.0, 0.0, 0.0, 82)
-    femmesh.addNode(30500.0, 0.0, 0.0, 83)
-    femmesh.addNode(31500.0, 0.0, 0.0, 84)
-    femmesh.addNode(1000.0, 0.0, 1000.0, 85)
-    femmesh.addNode(2000.0, 0.0, 1000.0, 86)
-    femmesh.addNode(3000.0, 0.0, 1000.0, 87)
-    femmesh.addNode(4000.0, 0.0, 1000.0, 88)
-    femmesh.addNode(5000.0, 0.0, 1000.0, 89)
-    femmesh.addNode(6000.0, 0.0, 1000.0, 90)
-    femmesh.addNode(7000.0, 0.0, 1000.0, 91)
-    femmesh.addNode(8000.0, 0.0, 1000.0, 92)
-    femmesh.addNode(9000.0, 0.0, 1000.0, 93)
-    femmesh.addNode(10000.0, 0.0, 1000.0, 94)
-    femmesh.addNode(11000.0, 0.0, 1000.0, 95)
-    femmesh.addNode(12000.0, 0.0, 1000.0, 96)
-    femmesh.addNode(13000.0, 0.0, 1000.0, 97)
-    femmesh.addNode(14000.0, 0.0, 1000.0, 98)
-    femmesh.addNode(15000.0, 0.0, 1000.0, 99)
-    femmesh.addNode(16000.0, 0.0, 1000.0, 100)
-    femmesh.addNode(17000.0, 0.0, 1000.0, 101)
-    femmesh.addNode(18000.0, 0.0, 1000.0, 102)
-    femmesh.addNode(19000.0, 0.0, 1000.0, 103)
-    femmesh.addNode(20000.0, 0.0, 1000.0, 104)
-    femmesh.addNode(21000.0, 0.0, 1000.0, 105)
-    femmesh.addNode(22000.0, 0.0, 1000.0, 106)
-    femmesh.addNode(23000.0, 0.0, 1000.0, 107)
-    femmesh.addNode(24000.0, 0.0, 1000.0, 108)
-    femmesh.addNode(25000.0, 0.0, 1000.0, 109)
-    femmesh.addNode(26000.0, 0.0, 1000.0, 110)
-    femmesh.addNode(27000.0, 0.0, 1000.0, 111)
-    femmesh.addNode(28000.0, 0.0, 1000.0, 112)
-    femmesh.addNode(29000.0, 0.0, 1000.0, 113)
-    femmesh.addNode(30000.0, 0.0, 1000.0, 114)
-    femmesh.addNode(31000.0, 0.0, 1000.0, 115)
-    femmesh.addNode(500.0, 0.0, 1000.0, 116)
-    femmesh.addNode(1500.0, 0.0, 1000.0, 117)
-    femmesh.addNode(2500.0, 0.0, 1000.0, 118)
-    femmesh.addNode(3500.0, 0.0, 1000.0, 119)
-    femmesh.addNode(4500.0, 0.0, 1000.0, 120)
-    femmesh.addNode(5500.0, 0.0, 1000.0, 121)
-    femmesh.addNode(6500.0, 0.0, 1000.0, 122)
-    femmesh.addNode(7500.0, 0.0, 1000.0, 123)
-    femmesh.addNode(8500.0, 0.0, 1000.0, 124)
-    femmesh.addNode(9500.0, 0.0, 1000.0, 125)
-    femmesh.addNode(10500.0, 0.0, 1000.0, 126)
-    femmesh.addNode(11500.0, 0.0, 1000.0, 127)
-    femmesh.addNode(12500.0, 0.0, 1000.0, 128)
-    femmesh.addNode(13500.0, 0.0, 1000.0, 129)
-    femmesh.addNode(14500.0, 0.0, 1000.0, 130)
-    femmesh.addNode(15500.0, 0.0, 1000.0, 131)
-    femmesh.addNode(16500.0, 0.0, 1000.0, 132)
-    femmesh.addNode(17500.0, 0.0, 1000.0, 133)
-    femmesh.addNode(18500.0, 0.0, 1000.0, 134)
-    femmesh.addNode(19500.0, 0.0, 1000.0, 135)
-    femmesh.addNode(20500.0, 0.0, 1000.0, 136)
-    femmesh.addNode(21500.0, 0.0, 1000.0, 137)
-    femmesh.addNode(22500.0, 0.0, 1000.0, 138)
-    femmesh.addNode(23500.0, 0.0, 1000.0, 139)
-    femmesh.addNode(24500.0, 0.0, 1000.0, 140)
-    femmesh.addNode(25500.0, 0.0, 1000.0, 141)
-    femmesh.addNode(26500.0, 0.0, 1000.0, 142)
-    femmesh.addNode(27500.0, 0.0, 1000.0, 143)
-    femmesh.addNode(28500.0, 0.0, 1000.0, 144)
-    femmesh.addNode(29500.0, 0.0, 1000.0, 145)
-    femmesh.addNode(30500.0, 0.0, 1000.0, 146)
-    femmesh.addNode(31500.0, 0.0, 1000.0, 147)
-    femmesh.addNode(1000.0, 1000.0, 0.0, 148)
-    femmesh.addNode(2000.0, 1000.0, 0.0, 149)
-    femmesh.addNode(3000.0, 1000.0, 0.0, 150)
-    femmesh.addNode(4000.0, 1000.0, 0.0, 151)
-    femmesh.addNode(5000.0, 1000.0, 0.0, 152)
-    femmesh.addNode(6000.0, 1000.0, 0.0, 153)
-    femmesh.addNode(7000.0, 1000.0, 0.0, 154)
-    femmesh.addNode(8000.0, 1000.0, 0.0, 155)
-    femmesh.addNode(9000.0, 1000.0, 0.0, 156)
-    femmesh.addNode(10000.0, 1000.0, 0.0, 157)
-    femmesh.addNode(11000.0, 1000.0, 0.0, 158)
-    femmesh.addNode(12000.0, 1000.0, 0.0, 159)
-    femmesh.addNode(13000.0, 1000.0, 0.0, 160)
-    femmesh.addNode(14000.0, 1000.0, 0.0, 161)
-    femmesh.addNode(15000.0, 1000.0, 0.0, 162)
-    femmesh.addNode(16000.0, 1000.0, 0.0, 163)
-    femmesh.addNode(17000.0, 1000.0, 0.0, 164)
-    femmesh.addNode(18000.0, 1000.0, 0.0, 165)
-    femmesh.addNode(19000.0, 1000.0, 0.0, 166)
-    femmesh.addNode(20000.0, 1000.0, 0.0, 167)
-    femmesh.addNode(21000.0, 1000.0, 0.0, 168)
-    femmesh.addNode(22000.0, 1000.0, 0.0, 169)
-    femmesh.addNode(23000.0, 1000.0, 0.0, 170)
-    femmesh.addNode(24000.0, 1000.0, 0.0, 171)
-    femmesh.addNode(25000.0, 1000.0, 0.0, 172)
-    femmesh.addNode(26000.0, 1000.0, 0.0, 173)
-    femmesh.addNode(27000.0, 1000.0, 0.0, 174)
-    femmesh.addNode(28000.0, 1000.0, 0.0, 175)
-    femmesh.addNode(29000.0, 1000.0, 0.0, 176)
-    femmesh.addNode(30000.0, 1000.0, 0.0, 177)
-    femmesh.addNode(31000.0, 1000.0, 0.0, 178)
-    femmesh.addNode(500.0, 1000.0, 0.0, 179)
-    femmesh.addNode(1500.0, 1000.0, 0.0, 180)
-    femmesh.addNode(2500.0, 1000.0, 0.0, 181)
-    femmesh.addNode(3500.0, 1000.0, 0.0, 182)
-    femmesh.addNode(4500.0, 1000.0, 0.0, 183)
-    femmesh.addNode(5500.0, 1000.0, 0.0, 184)
-    femmesh.addNode(6500.0, 1000.0, 0.0, 185)
-    femmesh.addNode(7500.0, 1000.0, 0.0, 186)
-    femmesh.addNode(8500.0, 1000.0, 0.0, 187)
-    femmesh.addNode(9500.0, 1000.0, 0.0, 188)
-    femmesh.addNode(10500.0, 1000.0, 0.0, 189)
-    femmesh.addNode(11500.0, 1000.0, 0.0, 190)
-    femmesh.addNode(12500.0, 1000.0, 0.0, 191)
-    femmesh.addNode(13500.0, 1000.0, 0.0, 192)
-    femmesh.addNode(14500.0, 1000.0, 0.0, 193)
-    femmesh.addNode(15500.0, 1000.0, 0.0, 194)
-    femmesh.addNode(16500.0, 1000.0, 0.0, 195)
-    femmesh.addNode(17500.0, 1000.0, 0.0, 196)
-    femmesh.addNode(18500.0, 1000.0, 0.0, 197)
-    femmesh.addNode(19500.0, 1000.0, 0.0, 198)
-    femmesh.addNode(20500.0, 1000.0, 0.0, 199)
-    femmesh.addNode(21500.0, 1000.0, 0.0, 200)
-    femmesh.addNode(22500.0, 1000.0, 0.0, 201)
-    femmesh.addNode(23500.0, 1000.0, 0.0, 202)
-    femmesh.addNode(24500.0, 1000.0, 0.0, 203)
-    femmesh.addNode(25500.0, 1000.0, 0.0, 204)
-    femmesh.addNode(26500.0, 1000.0, 0.0, 205)
-    femmesh.addNode(27500.0, 1000.0, 0.0, 206)
-    femmesh.addNode(28500.0, 1000.0, 0.0, 207)
-    femmesh.addNode(29500.0, 1000.0, 0.0, 208)
-    femmesh.addNode(30500.0, 1000.0, 0.0, 209)
-    femmesh.addNode(31500.0, 1000.0, 0.0, 210)
-    femmesh.addNode(1000.0, 1000.0, 1000.0, 211)
-    femmesh.addNode(2000.0, 1000.0, 1000.0, 212)
-    femmesh.addNode(3000.0, 1000.0, 1000.0, 213)
-    femmesh.addNode(4000.0, 1000.0, 1000.0, 214)
-    femmesh.addNode(5000.0, 1000.0, 1000.0, 215)
-    femmesh.addNode(6000.0, 1000.0, 1000.0, 216)
-    femmesh.addNode(7000.0, 1000.0, 1000.0, 217)
-    femmesh.addNode(8000.0, 1000.0, 1000.0, 218)
-    femmesh.addNode(9000.0, 1000.0, 1000.0, 219)
-    femmesh.addNode(10000.0, 1000.0, 1000.0, 220)
-    femmesh.addNode(11000.0, 1000.0, 1000.0, 221)
-    femmesh.addNode(12000.0, 1000.0, 1000.0, 222)
-    femmesh.addNode(13000.0, 1000.0, 1000.0, 223)
-    femmesh.addNode(14000.0, 1000.0, 1000.0, 224)
-    femmesh.addNode(15000.0, 1000.0, 1000.0, 225)
-    femmesh.addNode(16000.0, 1000.0, 1000.0, 226)
-    femmesh.addNode(17000.0, 1000.0, 1000.0, 227)
-    femmesh.addNode(18000.0, 1000.0, 1000.0, 228)
-    femmesh.addNode(19000.0, 1000.0, 1000.0, 229)
-    femmesh.addNode(20000.0, 1000.0, 1000.0, 230)
-    femmesh.addNode(21000.0, 1000.0, 1000.0, 231)
-    femmesh.addNode(22000.0, 1000.0, 1000.0, 232)
-    femmesh.addNode(23000.0, 1000.0, 1000.0, 233)
-    femmesh.addNode(24000.0, 1000.0, 1000.0, 234)
-    femmesh.addNode(25000.0, 1000.0, 1000.0, 235)
-    femmesh.addNode(26000.0, 1000.0, 1000.0, 236)
-    femmesh.addNode(27000.0, 1000.0, 1000.0, 237)
-    femmesh.addNode(28000.0, 1000.0, 1000.0, 238)
-    femmesh.addNode(29000.0, 1000.0, 1000.0, 239)
-    femmesh.addNode(30000.0, 1000.0, 1000.0, 240)
-    femmesh.addNode(31000.0, 1000.0, 1000.0, 241)
-    femmesh.addNode(500.0, 1000.0, 1000.0, 242)
-    femmesh.addNode(1500.0, 1000.0, 1000.0, 243)
-    femmesh.addNode(2500.0, 1000.0, 1000.0, 244)
-    femmesh.addNode(3500.0, 1000.0, 1000.0, 245)
-    femmesh.addNode(4500.0, 1000.0, 1000.0, 246)
-    femmesh.addNode(5500.0, 1000.0, 1000.0, 247)
-    femmesh.addNode(6500.0, 1000.0, 1000.0, 248)
-    femmesh.addNode(7500.0, 1000.0, 1000.0, 249)
-    femmesh.addNode(8500.0, 1000.0, 1000.0, 250)
-    femmesh.addNode(9500.0, 1000.0, 1000.0, 251)
-    femmesh.addNode(10500.0, 1000.0, 1000.0, 252)
-    femmesh.addNode(11500.0, 1000.0, 1000.0, 253)
-    femmesh.addNode(12500.0, 1000.0, 1000.0, 254)
-    femmesh.addNode(13500.0, 1000.0, 1000.0, 255)
-    femmesh.addNode(14500.0, 1000.0, 1000.0, 256)
-    femmesh.addNode(15500.0, 1000.0, 1000.0, 257)
-    femmesh.addNode(16500.0, 1000.0, 1000.0, 258)
-    femmesh.addNode(17500.0, 1000.0, 1000.0, 259)
-    femmesh.addNode(18500.0, 1000.0, 1000.0, 260)
-    femmesh.addNode(19500.0, 1000.0, 1000.0, 261)
-    femmesh.addNode(20500.0, 1000.0, 1000.0, 262)
-    femmesh.addNode(21500.0, 1000.0, 1000.0, 263)
-    femmesh.addNode(22500.0, 1000.0, 1000.0, 264)
-    femmesh.addNode(23500.0, 1000.0, 1000.0, 265)
-    femmesh.addNode(24500.0, 1000.0, 1000.0, 266)
-    femmesh.addNode(25500.0, 1000.0, 1000.0, 267)
-    femmesh.addNode(26500.0, 1000.0, 1000.0, 268)
-    femmesh.addNode(27500.0, 1000.0, 1000.0, 269)
-    femmesh.addNode(28500.0, 1000.0, 1000.0, 270)
-    femmesh.addNode(29500.0, 1000.0, 1000.0, 271)
-    femmesh.addNode(30500.0, 1000.0, 1000.0, 272)
-    femmesh.addNode(31500.0, 1000.0, 1000.0, 273)
-    femmesh.addNode(32000.0, 500.0, 500.0, 274)
-    femmesh.addNode(32000.0, 250.0, 250.0, 275)
-    femmesh.addNode(32000.0, 250.0, 750.0, 276)
-    femmesh.addNode(32000.0, 750.0, 750.0, 277)
-    femmesh.addNode(32000.0, 750.0, 250.0, 278)
-    femmesh.addNode(500.0, 0.0, 500.0, 279)
-    femmesh.addNode(31500.0, 0.0, 500.0, 280)
-    femmesh.addNode(2500.0, 0.0, 500.0, 281)
-    femmesh.addNode(1500.0, 0.0, 500.0, 282)
-    femmesh.addNode(3500.0, 0.0, 500.0, 283)
-    femmesh.addNode(4500.0, 0.0, 500.0, 284)
-    femmesh.addNode(5500.0, 0.0, 500.0, 285)
-    femmesh.addNode(7500.0, 0.0, 500.0, 286)
-    femmesh.addNode(6500.0, 0.0, 500.0, 287)
-    femmesh.addNode(8500.0, 0.0, 500.0, 288)
-    femmesh.addNode(9500.0, 0.0, 500.0, 289)
-    femmesh.addNode(11500.0, 0.0, 500.0, 290)
-    femmesh.addNode(10500.0, 0.0, 500.0, 291)
-    femmesh.addNode(12500.0, 0.0, 500.0, 292)
-    femmesh.addNode(13500.0, 0.0, 500.0, 293)
-    femmesh.addNode(14500.0, 0.0, 500.0, 294)
-    femmesh.addNode(15500.0, 0.0, 500.0, 295)
-    femmesh.addNode(16500.0, 0.0, 500.0, 296)
-    femmesh.addNode(17500.0, 0.0, 500.0, 297)
-    femmesh.addNode(19500.0, 0.0, 500.0, 298)
-    femmesh.addNode(18500.0, 0.0, 500.0, 299)
-    femmesh.addNode(20500.0, 0.0, 500.0, 300)
-    femmesh.addNode(21500.0, 0.0, 500.0, 301)
-    femmesh.addNode(22500.0, 0.0, 500.0, 302)
-    femmesh.addNode(23500.0, 0.0, 500.0, 303)
-    femmesh.addNode(24500.0, 0.0, 500.0, 304)
-    femmesh.addNode(25500.0, 0.0, 500.0, 305)
-    femmesh.addNode(26500.0, 0.0, 500.0, 306)
-    femmesh.addNode(27500.0, 0.0, 500.0, 307)
-    femmesh.addNode(28500.0, 0.0, 500.0, 308)
-    femmesh.addNode(29500.0, 0.0, 500.0, 309)
-    femmesh.addNode(30500.0, 0.0, 500.0, 310)
-    femmesh.addNode(250.0, 0.0, 250.0, 311)
-    femmesh.addNode(250.0, 0.0, 750.0, 312)
-    femmesh.addNode(750.0, 0.0, 750.0, 313)
-    femmesh.addNode(750.0, 0.0, 250.0, 314)
-    femmesh.addNode(31750.0, 0.0, 750.0, 315)
-    femmesh.addNode(31750.0, 0.0, 250.0, 316)
-    femmesh.addNode(31250.0, 0.0, 750.0, 317)
-    femmesh.addNode(31250.0, 0.0, 250.0, 318)
-    femmesh.addNode(1750.0, 0.0, 250.0, 319)
-    femmesh.addNode(1250.0, 0.0, 250.0, 320)
-    femmesh.addNode(1000.0, 0.0, 500.0, 321)
-    femmesh.addNode(1250.0, 0.0, 750.0, 322)
-    femmesh.addNode(2750.0, 0.0, 250.0, 323)
-    femmesh.addNode(2250.0, 0.0, 250.0, 324)
-    femmesh.addNode(2000.0, 0.0, 500.0, 325)
-    femmesh.addNode(2250.0, 0.0, 750.0, 326)
-    femmesh.addNode(1750.0, 0.0, 750.0, 327)
-    femmesh.addNode(3750.0, 0.0, 250.0, 328)
-    femmesh.addNode(3250.0, 0.0, 250.0, 329)
-    femmesh.addNode(3000.0, 0.0, 500.0, 330)
-    femmesh.addNode(2750.0, 0.0, 750.0, 331)
-    femmesh.addNode(3250.0, 0.0, 750.0, 332)
-    femmesh.addNode(4750.0, 0.0, 250.0, 333)
-    femmesh.addNode(4250.0, 0.0, 250.0, 334)
-    femmesh.addNode(4000.0, 0.0, 500.0, 335)
-    femmesh.addNode(3750.0, 0.0, 750.0, 336)
-    femmesh.addNode(4250.0, 0.0, 750.0, 337)
-    femmesh.addNode(5750.0, 0.0, 250.0, 338)
-    femmesh.addNode(5250.0, 0.0, 250.0, 339)
-    femmesh.addNode(5000.0, 0.0, 500.0, 340)
-    femmesh.addNode(4750.0, 0.0, 750.0, 341)
-    femmesh.addNode(5250.0, 0.0, 750.0, 342)
-    femmesh.addNode(6750.0, 0.0, 250.0, 343)
-    femmesh.addNode(6250.0, 0.0, 250.0, 344)
-    femmesh.addNode(6000.0, 0.0, 500.0, 345)
-    femmesh.addNode(5750.0, 0.0, 750.0, 346)
-    femmesh.addNode(6250.0, 0.0, 750.0, 347)
-    femmesh.addNode(7750.0, 0.0, 250.0, 348)
-    femmesh.addNode(7250.0, 0.0, 250.0, 349)
-    femmesh.addNode(7000.0, 0.0, 500.0, 350)
-    femmesh.addNode(7250.0, 0.0, 750.0, 351)
-    femmesh.addNode(6750.0, 0.0, 750.0, 352)
-    femmesh.addNode(8750.0, 0.0, 250.0, 353)
-    femmesh.addNode(8250.0, 0.0, 250.0, 354)
-    femmesh.addNode(8000.0, 0.0, 500.0, 355)
-    femmesh.addNode(7750.0, 0.0, 750.0, 356)
-    femmesh.addNode(8250.0, 0.0, 750.0, 357)
-    femmesh.addNode(9750.0, 0.0, 250.0, 358)
-    femmesh.addNode(9250.0, 0.0, 250.0, 359)
-    femmesh.addNode(9000.0, 0.0, 500.0, 360)
-    femmesh.addNode(8750.0, 0.0, 750.0, 361)
-    femmesh.addNode(9250.0, 0.0, 750.0, 362)
-    femmesh.addNode(10750.0, 0.0, 250.0, 363)
-    femmesh.addNode(10250.0, 0.0, 250.0, 364)
-    femmesh.addNode(10000.0, 0.0, 500.0, 365)
-    femmesh.addNode(9750.0, 0.0, 750.0, 366)
-    femmesh.addNode(10250.0, 0.0, 750.0, 367)
-    femmesh.addNode(11750.0, 0.0, 250.0, 368)
-    femmesh.addNode(11250.0, 0.0, 250.0, 369)
-    femmesh.addNode(11000.0, 0.0, 500.0, 370)
-    femmesh.addNode(11250.0, 0.0, 750.0, 371)
-    femmesh.addNode(10750.0, 0.0, 750.0, 372)
-    femmesh.addNode(12750.0, 0.0, 250.0, 373)
-    femmesh.addNode(12250.0, 0.0, 250.0, 374)
-    femmesh.addNode(12000.0, 0.0, 500.0, 375)
-    femmesh.addNode(11750.0, 0.0, 750.0, 376)
-    femmesh.addNode(12250.0, 0.0, 750.0, 377)
-    femmesh.addNode(13750.0, 0.0, 250.0, 378)
-    femmesh.addNode(13250.0, 0.0, 250.0, 379)
-    femmesh.addNode(13000.0, 0.0, 500.0, 380)
-    femmesh.addNode(12750.0, 0.0, 750.0, 381)
-    femmesh.addNode(13250.0, 0.0, 750.0, 382)
-    femmesh.addNode(14750.0, 0.0, 250.0, 383)
-    femmesh.addNode(14250.0, 0.0, 250.0, 384)
-    femmesh.addNode(14000.0, 0.0, 500.0, 385)
-    femmesh.addNode(13750.0, 0.0, 750.0, 386)
-    femmesh.addNode(14250.0, 0.0, 750.0, 387)
-    femmesh.addNode(15750.0, 0.0, 250.0, 388)
-    femmesh.addNode(15250.0, 0.0, 250.0, 389)
-    femmesh.addNode(15000.0, 0.0, 500.0, 390)
-    femmesh.addNode(14750.0, 0.0, 750.0, 391)
-    femmesh.addNode(15250.0, 0.0, 750.0, 392)
-    femmesh.addNode(16750.0, 0.0, 250.0, 393)
-    femmesh.addNode(16250.0, 0.0, 250.0, 394)
-    femmesh.addNode(16000.0, 0.0, 500.0, 395)
-    femmesh.addNode(15750.0, 0.0, 750.0, 396)
-    femmesh.addNode(16250.0, 0.0, 750.0, 397)
-    femmesh.addNode(17750.0, 0.0, 250.0, 398)
-    femmesh.addNode(17250.0, 0.0, 250.0, 399)
-    femmesh.addNode(17000.0, 0.0, 500.0, 400)
-    femmesh.addNode(16750.0, 0.0, 750.0, 401)
-    femmesh.addNode(17250.0, 0.0, 750.0, 402)
-    femmesh.addNode(18750.0, 0.0, 250.0, 403)
-    femmesh.addNode(18250.0, 0.0, 250.0, 404)
-    femmesh.addNode(18000.0, 0.0, 500.0, 405)
-    femmesh.addNode(17750.0, 0.0, 750.0, 406)
-    femmesh.addNode(18250.0, 0.0, 750.0, 407)
-    femmesh.addNode(19750.0, 0.0, 250.0, 408)
-    femmesh.addNode(19250.0, 0.0, 250.0, 409)
-    femmesh.addNode(19000.0, 0.0, 500.0, 410)
-    femmesh.addNode(19250.0, 0.0, 750.0, 411)
-    femmesh.addNode(18750.0, 0.0, 750.0, 412)
-    femmesh.addNode(20750.0, 0.0, 250.0, 413)
-    femmesh.addNode(20250.0, 0.0, 250.0, 414)
-    femmesh.addNode(20000.0, 0.0, 500.0, 415)
-    femmesh.addNode(19750.0, 0.0, 750.0, 416)
-    femmesh.addNode(20250.0, 0.0, 750.0, 417)
-    femmesh.addNode(21750.0, 0.0, 250.0, 418)
-    femmesh.addNode(21250.0, 0.0, 250.0, 419)
-    femmesh.addNode(21000.0, 0.0, 500.0, 420)
-    femmesh.addNode(20750.0, 0.0, 750.0, 421)
-    femmesh.addNode(21250.0, 0.0, 750.0, 422)
-    femmesh.addNode(22750.0, 0.0, 250.0, 423)
-    femmesh.addNode(22250.0, 0.0, 250.0, 424)
-    femmesh.addNode(22000.0, 0.0, 500.0, 425)
-    femmesh.addNode(21750.0, 0.0, 750.0, 426)
-    femmesh.addNode(22250.0, 0.0, 750.0, 427)
-    femmesh.addNode(23750.0, 0.0, 250.0, 428)
-    femmesh.addNode(23250.0, 0.0, 250.0, 429)
-    femmesh.addNode(23000.0, 0.0, 500.0, 430)
-    femmesh.addNode(22750.0, 0.0, 750.0, 431)
-    femmesh.addNode(23250.0, 0.0, 750.0, 432)
-    femmesh.addNode(24750.0, 0.0, 250.0, 433)
-    femmesh.addNode(24250.0, 0.0, 250.0, 434)
-    femmesh.addNode(24000.0, 0.0, 500.0, 435)
-    femmesh.addNode(23750.0, 0.0, 750.0, 436)
-    femmesh.addNode(24250.0, 0.0, 750.0, 437)
-    femmesh.addNode(25750.0, 0.0, 250.0, 438)
-    femmesh.addNode(25250.0, 0.0, 250.0, 439)
-    femmesh.addNode(25000.0, 0.0, 500.0, 440)
-    femmesh.addNode(24750.0, 0.0, 750.0, 441)
-    femmesh.addNode(25250.0, 0.0, 750.0, 442)
-    femmesh.addNode(26750.0, 0.0, 250.0, 443)
-    femmesh.addNode(26250.0, 0.0, 250.0, 444)
-    femmesh.addNode(26000.0, 0.0, 500.0, 445)
-    femmesh.addNode(25750.0, 0.0, 750.0, 446)
-    femmesh.addNode(26250.0, 0.0, 750.0, 447)
-    femmesh.addNode(27750.0, 0.0, 250.0, 448)
-    femmesh.addNode(27250.0, 0.0, 250.0, 449)
-    femmesh.addNode(27000.0, 0.0, 500.0, 450)
-    femmesh.addNode(26750.0, 0.0, 750.0, 451)
-    femmesh.addNode(27250.0, 0.0, 750.0, 452)
-    femmesh.addNode(28750.0, 0.0, 250.0, 453)
-    femmesh.addNode(28250.0, 0.0, 250.0, 454)
-    femmesh.addNode(28000.0, 0.0, 500.0, 455)
-    femmesh.addNode(27750.0, 0.0, 750.0, 456)
-    femmesh.addNode(28250.0, 0.0, 750.0, 457)
-    femmesh.addNode(29750.0, 0.0, 250.0, 458)
-    femmesh.addNode(29250.0, 0.0, 250.0, 459)
-    femmesh.addNode(29000.0, 0.0, 500.0, 460)
-    femmesh.addNode(28750.0, 0.0, 750.0, 461)
-    femmesh.addNode(29250.0, 0.0, 750.0, 462)
-    femmesh.addNode(30750.0, 0.0, 250.0, 463)
-    femmesh.addNode(30250.0, 0.0, 250.0, 464)
-    femmesh.addNode(30000.0, 0.0, 500.0, 465)
-    femmesh.addNode(29750.0, 0.0, 750.0, 466)
-    femmesh.addNode(30250.0, 0.0, 750.0, 467)
-    femmesh.addNode(31000.0, 0.0, 500.0, 468)
-    femmesh.addNode(30750.0, 0.0, 750.0, 469)
-    femmesh.addNode(500.0, 1000.0, 500.0, 470)
-    femmesh.addNode(31500.0, 1000.0, 500.0, 471)
-    femmesh.addNode(1500.0, 1000.0, 500.0, 472)
-    femmesh.addNode(2500.0, 1000.0, 500.0, 473)
-    femmesh.addNode(3500.0, 1000.0, 500.0, 474)
-    femmesh.addNode(4500.0, 1000.0, 500.0, 475)
-    femmesh.addNode(6500.0, 1000.0, 500.0, 476)
-    femmesh.addNode(5500.0, 1000.0, 500.0, 477)
-    femmesh.addNode(8500.0, 1000.0, 500.0, 478)
-    femmesh.addNode(7500.0, 1000.0, 500.0, 479)
-    femmesh.addNode(9500.0, 1000.0, 500.0, 480)
-    femmesh.addNode(11500.0, 1000.0, 500.0, 481)
-    femmesh.addNode(10500.0, 1000.0, 500.0, 482)
-    femmesh.addNode(12500.0, 1000.0, 500.0, 483)
-    femmesh.addNode(13500.0, 1000.0, 500.0, 484)
-    femmesh.addNode(14500.0, 1000.0, 500.0, 485)
-    femmesh.addNode(15500.0, 1000.0, 500.0, 486)
-    femmesh.addNode(16500.0, 1000.0, 500.0, 487)
-    femmesh.addNode(17500.0, 1000.0, 500.0, 488)
-    femmesh.addNode(18500.0, 1000.0, 500.0, 489)
-    femmesh.addNode(19500.0, 1000.0, 500.0, 490)
-    femmesh.addNode(20500.0, 1000.0, 500.0, 491)
-    femmesh.addNode(21500.0, 1000.0, 500.0, 492)
-    femmesh.addNode(22500.0, 1000.0, 500.0, 493)
-    femmesh.addNode(23500.0, 1000.0, 500.0, 494)
-    femmesh.addNode(24500.0, 1000.0, 500.0, 495)
-    femmesh.addNode(25500.0, 1000.0, 500.0, 496)
-    femmesh.addNode(26500.0, 1000.0, 500.0, 497)
-    femmesh.addNode(27500.0, 1000.0, 500.0, 498)
-    femmesh.addNode(29500.0, 1000.0, 500.0, 499)
-    femmesh.addNode(28500.0, 1000.0, 500.0, 500)
-    femmesh.addNode(30500.0, 1000.0, 500.0, 501)
-    femmesh.addNode(250.0, 1000.0, 750.0, 502)
-    femmesh.addNode(250.0, 1000.0, 250.0, 503)
-    femmesh.addNode(750.0, 1000.0, 750.0, 504)
-    femmesh.addNode(750.0, 1000.0, 250.0, 505)
-    femmesh.addNode(31750.0, 1000.0, 250.0, 506)
-    femmesh.addNode(31750.0, 1000.0, 750.0, 507)
-    femmesh.addNode(31250.0, 1000.0, 750.0, 508)
-    femmesh.addNode(31250.0, 1000.0, 250.0, 509)
-    femmesh.addNode(1250.0, 1000.0, 250.0, 510)
-    femmesh.addNode(1750.0, 1000.0, 250.0, 511)
-    femmesh.addNode(1000.0, 1000.0, 500.0, 512)
-    femmesh.addNode(1250.0, 1000.0, 750.0, 513)
-    femmesh.addNode(2250.0, 1000.0, 250.0, 514)
-    femmesh.addNode(2750.0, 1000.0, 250.0, 515)
-    femmesh.addNode(1750.0, 1000.0, 750.0, 516)
-    femmesh.addNode(2000.0, 1000.0, 500.0, 517)
-    femmesh.addNode(2250.0, 1000.0, 750.0, 518)
-    femmesh.addNode(3250.0, 1000.0, 250.0, 519)
-    femmesh.addNode(3750.0, 1000.0, 250.0, 520)
-    femmesh.addNode(2750.0, 1000.0, 750.0, 521)
-    femmesh.addNode(3000.0, 1000.0, 500.0, 522)
-    femmesh.addNode(3250.0, 1000.0, 750.0, 523)
-    femmesh.addNode(4250.0, 1000.0, 250.0, 524)
-    femmesh.addNode(4750.0, 1000.0, 250.0, 525)
-    femmesh.addNode(3750.0, 1000.0, 750.0, 526)
-    femmesh.addNode(4000.0, 1000.0, 500.0, 527)
-    femmesh.addNode(4250.0, 1000.0, 750.0, 528)
-    femmesh.addNode(5250.0, 1000.0, 250.0, 529)
-    femmesh.addNode(5750.0, 1000.0, 250.0, 530)
-    femmesh.addNode(4750.0, 1000.0, 750.0, 531)
-    femmesh.addNode(5000.0, 1000.0, 500.0, 532)
-    femmesh.addNode(5250.0, 1000.0, 750.0, 533)
-    femmesh.addNode(6250.0, 1000.0, 250.0, 534)
-    femmesh.addNode(6750.0, 1000.0, 250.0, 535)
-    femmesh.addNode(6250.0, 1000.0, 750.0, 536)
-    femmesh.addNode(6000.0, 1000.0, 500.0, 537)
-    femmesh.addNode(5750.0, 1000.0, 750.0, 538)
-    femmesh.addNode(7250.0, 1000.0, 250.0, 539)
-    femmesh.addNode(7750.0, 1000.0, 250.0, 540)
-    femmesh.addNode(6750.0, 1000.0, 750.0, 541)
-    femmesh.addNode(7000.0, 1000.0, 500.0, 542)
-    femmesh.addNode(7250.0, 1000.0, 750.0, 543)
-    femmesh.addNode(8250.0, 1000.0, 250.0, 544)
-    femmesh.addNode(8750.0, 1000.0, 250.0, 545)
-    femmesh.addNode(8250.0, 1000.0, 750.0, 546)
-    femmesh.addNode(8000.0, 1000.0, 500.0, 547)
-    femmesh.addNode(7750.0, 1000.0, 750.0, 548)
-    femmesh.addNode(9250.0, 1000.0, 250.0, 549)
-    femmesh.addNode(9750.0, 1000.0, 250.0, 550)
-    femmesh.addNode(8750.0, 1000.0, 750.0, 551)
-    femmesh.addNode(9000.0, 1000.0, 500.0, 552)
-    femmesh.addNode(9250.0, 1000.0, 750.0, 553)
-    femmesh.addNode(10250.0, 1000.0, 250.0, 554)
-    femmesh.addNode(10750.0, 1000.0, 250.0, 555)
-    femmesh.addNode(9750.0, 1000.0, 750.0, 556)
-    femmesh.addNode(10000.0, 1000.0, 500.0, 557)
-    femmesh.addNode(10250.0, 1000.0, 750.0, 558)
-    femmesh.addNode(11250.0, 1000.0, 250.0, 559)
-    femmesh.addNode(11750.0, 1000.0, 250.0, 560)
-    femmesh.addNode(11250.0, 1000.0, 750.0, 561)
-    femmesh.addNode(11000.0, 1000.0, 500.0, 562)
-    femmesh.addNode(10750.0, 1000.0, 750.0, 563)
-    femmesh.addNode(12250.0, 1000.0, 250.0, 564)
-    femmesh.addNode(12750.0, 1000.0, 250.0, 565)
-    femmesh.addNode(11750.0, 1000.0, 750.0, 566)
-    femmesh.addNode(12000.0, 1000.0, 500.0, 567)
-    femmesh.addNode(12250.0, 1000.0, 750.0, 568)
-    femmesh.addNode(13250.0, 1000.0, 250.0, 569)
-    femmesh.addNode(13750.0, 1000.0, 250.0, 570)
-    femmesh.addNode(12750.0, 1000.0, 750.0, 571)
-    femmesh.addNode(13000.0, 1000.0, 500.0, 572)
-    femmesh.addNode(13250.0, 1000.0, 750.0, 573)
-    femmesh.addNode(14250.0, 1000.0, 250.0, 574)
-    femmesh.addNode(14750.0, 1000.0, 250.0, 575)
-    femmesh.addNode(13750.0, 1000.0, 750.0, 576)
-    femmesh.addNode(14000.0, 1000.0, 500.0, 577)
-    femmesh.addNode(14250.0, 1000.0, 750.0, 578)
-    femmesh.addNode(15250.0, 1000.0, 250.0, 579)
-    femmesh.addNode(15750.0, 1000.0, 250.0, 580)
-    femmesh.addNode(14750.0, 1000.0, 750.0, 581)
-    femmesh.addNode(15000.0, 1000.0, 500.0, 582)
-    femmesh.addNode(15250.0, 1000.0, 750.0, 583)
-    femmesh.addNode(16250.0, 1000.0, 250.0, 584)
-    femmesh.addNode(16750.0, 1000.0, 250.0, 585)
-    femmesh.addNode(15750.0, 1000.0, 750.0, 586)
-    femmesh.addNode(16000.0, 1000.0, 500.0, 587)
-    femmesh.addNode(16250.0, 1000.0, 750.0, 588)
-    femmesh.addNode(17250.0, 1000.0, 250.0, 589)
-    femmesh.addNode(17750.0, 1000.0, 250.0, 590)
-    femmesh.addNode(16750.0, 1000.0, 750.0, 591)
-    femmesh.addNode(17000.0, 1000.0, 500.0, 592)
-    femmesh.addNode(17250.0, 1000.0, 750.0, 593)
-    femmesh.addNode(18250.0, 1000.0, 250.0, 594)
-    femmesh.addNode(18750.0, 1000.0, 250.0, 595)
-    femmesh.addNode(17750.0, 1000.0, 750.0, 596)
-    femmesh.addNode(18000.0, 1000.0, 500.0, 597)
-    femmesh.addNode(18250.0, 1000.0, 750.0, 598)
-    femmesh.addNode(19250.0, 1000.0, 250.0, 599)
-    femmesh.addNode(19750.0, 1000.0, 250.0, 600)
-    femmesh.addNode(18750.0, 1000.0, 750.0, 601)
-    femmesh.addNode(19000.0, 1000.0, 500.0, 602)
-    femmesh.addNode(19250.0, 1000.0, 750.0, 603)
-    femmesh.addNode(20250.0, 1000.0, 250.0, 604)
-    femmesh.addNode(20750.0, 1000.0, 250.0, 605)
-    femmesh.addNode(19750.0, 1000.0, 750.0, 606)
-    femmesh.addNode(20000.0, 1000.0, 500.0, 607)
-    femmesh.addNode(20250.0, 1000.0, 750.0, 608)
-    femmesh.addNode(21250.0, 1000.0, 250.0, 609)
-    femmesh.addNode(21750.0, 1000.0, 250.0, 610)
-    femmesh.addNode(20750.0, 1000.0, 750.0, 611)
-    femmesh.addNode(21000.0, 1000.0, 500.0, 612)
-    femmesh.addNode(21250.0, 1000.0, 750.0, 613)
-    femmesh.addNode(22250.0, 1000.0, 250.0, 614)
-    femmesh.addNode(22750.0, 1000.0, 250.0, 615)
-    femmesh.addNode(21750.0, 1000.0, 750.0, 616)
-    femmesh.addNode(22000.0, 1000.0, 500.0, 617)
-    femmesh.addNode(22250.0, 1000.0, 750.0, 618)
-    femmesh.addNode(23250.0, 1000.0, 250.0, 619)
-    femmesh.addNode(23750.0, 1000.0, 250.0, 620)
-    femmesh.addNode(22750.0, 1000.0, 750.0, 621)
-    femmesh.addNode(23000.0, 1000.0, 500.0, 622)
-    femmesh.addNode(23250.0, 1000.0, 750.0, 623)
-    femmesh.addNode(24250.0, 1000.0, 250.0, 624)
-    femmesh.addNode(24750.0, 1000.0, 250.0, 625)
-    femmesh.addNode(23750.0, 1000.0, 750.0, 626)
-    femmesh.addNode(24000.0, 1000.0, 500.0, 627)
-    femmesh.addNode(24250.0, 1000.0, 750.0, 628)
-    femmesh.addNode(25250.0, 1000.0, 250.0, 629)
-    femmesh.addNode(25750.0, 1000.0, 250.0, 630)
-    femmesh.addNode(24750.0, 1000.0, 750.0, 631)
-    femmesh.addNode(25000.0, 1000.0, 500.0, 632)
-    femmesh.addNode(25250.0, 1000.0, 750.0, 633)
-    femmesh.addNode(26250.0, 1000.0, 250.0, 634)
-    femmesh.addNode(26750.0, 1000.0, 250.0, 635)
-    femmesh.addNode(25750.0, 1000.0, 750.0, 636)
-    femmesh.addNode(26000.0, 1000.0, 500.0, 637)
-    femmesh.addNode(26250.0, 1000.0, 750.0, 638)
-    femmesh.addNode(27250.0, 1000.0, 250.0, 639)
-    femmesh.addNode(27750.0, 1000.0, 250.0, 640)
-    femmesh.addNode(26750.0, 1000.0, 750.0, 641)
-    femmesh.addNode(27000.0, 1000.0, 500.0, 642)
-    femmesh.addNode(27250.0, 1000.0, 750.0, 643)
-    femmesh.addNode(28250.0, 1000.0, 250.0, 644)
-    femmesh.addNode(28750.0, 1000.0, 250.0, 645)
-    femmesh.addNode(27750.0, 1000.0, 750.0, 646)
-    femmesh.addNode(28000.0, 1000.0, 500.0, 647)
-    femmesh.addNode(28250.0, 1000.0, 750.0, 648)
-    femmesh.addNode(29250.0, 1000.0, 250.0, 649)
-    femmesh.addNode(29750.0, 1000.0, 250.0, 650)
-    femmesh.addNode(29250.0, 1000.0, 750.0, 651)
-    femmesh.addNode(29000.0, 1000.0, 500.0, 652)
-    femmesh.addNode(28750.0, 1000.0, 750.0, 653)
-    femmesh.addNode(30250.0, 1000.0, 250.0, 654)
-    femmesh.addNode(30750.0, 1000.0, 250.0, 655)
-    femmesh.addNode(29750.0, 1000.0, 750.0, 656)
-    femmesh.addNode(30000.0, 1000.0, 500.0, 657)
-    femmesh.addNode(30250.0, 1000.0, 750.0, 658)
-    femmesh.addNode(31000.0, 1000.0, 500.0, 659)
-    femmesh.addNode(30750.0, 1000.0, 750.0, 660)
-    femmesh.addNode(500.0, 500.0, 0.0, 661)
-    femmesh.addNode(31500.0, 500.0, 0.0, 662)
-    femmesh.addNode(2500.0, 500.0, 0.0, 663)
-    femmesh.addNode(1500.0, 500.0, 0.0, 664)
-    femmesh.addNode(3500.0, 500.0, 0.0, 665)
-    femmesh.addNode(4500.0, 500.0, 0.0, 666)
-    femmesh.addNode(5500.0, 500.0, 0.0, 667)
-    femmesh.addNode(6500.0, 500.0, 0.0, 668)
-    femmesh.addNode(7500.0, 500.0, 0.0, 669)
-    femmesh.addNode(8500.0, 500.0, 0.0, 670)
-    femmesh.addNode(9500.0, 500.0, 0.0, 671)
-    femmesh.addNode(10500.0, 500.0, 0.0, 672)
-    femmesh.addNode(11500.0, 500.0, 0.0, 673)
-    femmesh.addNode(13500.0, 500.0, 0.0, 674)
-    femmesh.addNode(12500.0, 500.0, 0.0, 675)
-    femmesh.addNode(14500.0, 500.0, 0.0, 676)
-    femmesh.addNode(15500.0, 500.0, 0.0, 677)
-    femmesh.addNode(16500.0, 500.0, 0.0, 678)
-    femmesh.addNode(17500.0, 500.0, 0.0, 679)
-    femmesh.addNode(18500.0, 500.0, 0.0, 680)
-    femmesh.addNode(19500.0, 500.0, 0.0, 681)
-    femmesh.addNode(20500.0, 500.0, 0.0, 682)
-    femmesh.addNode(21500.0, 500.0, 0.0, 683)
-    femmesh.addNode(22500.0, 500.0, 0.0, 684)
-    femmesh.addNode(23500.0, 500.0, 0.0, 685)
-    femmesh.addNode(24500.0, 500.0, 0.0, 686)
-    femmesh.addNode(25500.0, 500.0, 0.0, 687)
-    femmesh.addNode(26500.0, 500.0, 0.0, 688)
-    femmesh.addNode(27500.0, 500.0, 0.0, 689)
-    femmesh.addNode(28500.0, 500.0, 0.0, 690)
-    femmesh.addNode(29500.0, 500.0, 0.0, 691)
-    femmesh.addNode(30500.0, 500.0, 0.0, 692)
-    femmesh.addNode(250.0, 750.0, 0.0, 693)
-    femmesh.addNode(250.0, 250.0, 0.0, 694)
-    femmesh.addNode(750.0, 250.0, 0.0, 695)
-    femmesh.addNode(750.0, 750.0, 0.0, 696)
-    femmesh.addNode(31750.0, 250.0, 0.0, 697)
-    femmesh.addNode(31750.0, 750.0, 0.0, 698)
-    femmesh.addNode(31250.0, 250.0, 0.0, 699)
-    femmesh.addNode(31250.0, 750.0, 0.0, 700)
-    femmesh.addNode(1250.0, 250.0, 0.0, 701)
-    femmesh.addNode(1750.0, 250.0, 0.0, 702)
-    femmesh.addNode(1000.0, 500.0, 0.0, 703)
-    femmesh.addNode(1250.0, 750.0, 0.0, 704)
-    femmesh.addNode(2250.0, 250.0, 0.0, 705)
-    femmesh.addNode(2750.0, 250.0, 0.0, 706)
-    femmesh.addNode(2000.0, 500.0, 0.0, 707)
-    femmesh.addNode(2250.0, 750.0, 0.0, 708)
-    femmesh.addNode(1750.0, 750.0, 0.0, 709)
-    femmesh.addNode(3250.0, 250.0, 0.0, 710)
-    femmesh.addNode(3750.0, 250.0, 0.0, 711)
-    femmesh.addNode(3000.0, 500.0, 0.0, 712)
-    femmesh.addNode(2750.0, 750.0, 0.0, 713)
-    femmesh.addNode(3250.0, 750.0, 0.0, 714)
-    femmesh.addNode(4250.0, 250.0, 0.0, 715)
-    femmesh.addNode(4750.0, 250.0, 0.0, 716)
-    femmesh.addNode(4000.0, 500.0, 0.0, 717)
-    femmesh.addNode(3750.0, 750.0, 0.0, 718)
-    femmesh.addNode(4250.0, 750.0, 0.0, 719)
-    femmesh.addNode(5250.0, 250.0, 0.0, 720)
-    femmesh.addNode(5750.0, 250.0, 0.0, 721)
-    femmesh.addNode(5000.0, 500.0, 0.0, 722)
-    femmesh.addNode(4750.0, 750.0, 0.0, 723)
-    femmesh.addNode(5250.0, 750.0, 0.0, 724)
-    femmesh.addNode(6250.0, 250.0, 0.0, 725)
-    femmesh.addNode(6750.0, 250.0, 0.0, 726)
-    femmesh.addNode(6000.0, 500.0, 0.0, 727)
-    femmesh.addNode(5750.0, 750.0, 0.0, 728)
-    femmesh.addNode(6250.0, 750.0, 0.0, 729)
-    femmesh.addNode(7250.0, 250.0, 0.0, 730)
-    femmesh.addNode(7750.0, 250.0, 0.0, 731)
-    femmesh.addNode(7000.0, 500.0, 0.0, 732)
-    femmesh.addNode(6750.0, 750.0, 0.0, 733)
-    femmesh.addNode(7250.0, 750.0, 0.0, 734)
-    femmesh.addNode(8250.0, 250.0, 0.0, 735)
-    femmesh.addNode(8750.0, 250.0, 0.0, 736)
-    femmesh.addNode(8000.0, 500.0, 0.0, 737)
-    femmesh.addNode(7750.0, 750.0, 0.0, 738)
-    femmesh.addNode(8250.0, 750.0, 0.0, 739)
-    femmesh.addNode(9250.0, 250.0, 0.0, 740)
-    femmesh.addNode(9750.0, 250.0, 0.0, 741)
-    femmesh.addNode(9000.0, 500.0, 0.0, 742)
-    femmesh.addNode(8750.0, 750.0, 0.0, 743)
-    femmesh.addNode(9250.0, 750.0, 0.0, 744)
-    femmesh.addNode(10250.0, 250.0, 0.0, 745)
-    femmesh.addNode(10750.0, 250.0, 0.0, 746)
-    femmesh.addNode(10000.0, 500.0, 0.0, 747)
-    femmesh.addNode(9750.0, 750.0, 0.0, 748)
-    femmesh.addNode(10250.0, 750.0, 0.0, 749)
-    femmesh.addNode(11250.0, 250.0, 0.0, 750)
-    femmesh.addNode(11750.0, 250.0, 0.0, 751)
-    femmesh.addNode(11000.0, 500.0, 0.0, 752)
-    femmesh.addNode(10750.0, 750.0, 0.0, 753)
-    femmesh.addNode(11250.0, 750.0, 0.0, 754)
-    femmesh.addNode(12250.0, 250.0, 0.0, 755)
-    femmesh.addNode(12750.0, 250.0, 0.0, 756)
-    femmesh.addNode(12000.0, 500.0, 0.0, 757)
-    femmesh.addNode(11750.0, 750.0, 0.0, 758)
-    femmesh.addNode(12250.0, 750.0, 0.0, 759)
-    femmesh.addNode(13250.0, 250.0, 0.0, 760)
-    femmesh.addNode(13750.0, 250.0, 0.0, 761)
-    femmesh.addNode(13000.0, 500.0, 0.0, 762)
-    femmesh.addNode(13250.0, 750.0, 0.0, 763)
-    femmesh.addNode(12750.0, 750.0, 0.0, 764)
-    femmesh.addNode(14250.0, 250.0, 0.0, 765)
-    femmesh.addNode(14750.0, 250.0, 0.0, 766)
-    femmesh.addNode(14000.0, 500.0, 0.0, 767)
-    femmesh.addNode(13750.0, 750.0, 0.0, 768)
-    femmesh.addNode(14250.0, 750.0, 0.0, 769)
-    femmesh.addNode(15250.0, 250.0, 0.0, 770)
-    femmesh.addNode(15750.0, 250.0, 0.0, 771)
-    femmesh.addNode(15000.0, 500.0, 0.0, 772)
-    femmesh.addNode(14750.0, 750.0, 0.0, 773)
-    femmesh.addNode(15250.0, 750.0, 0.0, 774)
-    femmesh.addNode(16250.0, 250.0, 0.0, 775)
-    femmesh.addNode(16750.0, 250.0, 0.0, 776)
-    femmesh.addNode(16000.0, 500.0, 0.0, 777)
-    femmesh.addNode(15750.0, 750.0, 0.0, 778)
-    femmesh.addNode(16250.0, 750.0, 0.0, 779)
-    femmesh.addNode(17250.0, 250.0, 0.0, 780)
-    femmesh.addNode(17750.0, 250.0, 0.0, 781)
-    femmesh.addNode(17000.0, 500.0, 0.0, 782)
-    femmesh.addNode(16750.0, 750.0, 0.0, 783)
-    femmesh.addNode(17250.0, 750.0, 0.0, 784)
-    femmesh.addNode(18250.0, 250.0, 0.0, 785)
-    femmesh.addNode(18750.0, 250.0, 0.0, 786)
-    femmesh.addNode(18000.0, 500.0, 0.0, 787)
-    femmesh.addNode(17750.0, 750.0, 0.0, 788)
-    femmesh.addNode(18250.0, 750.0, 0.0, 789)
-    femmesh.addNode(19250.0, 250.0, 0.0, 790)
-    femmesh.addNode(19750.0, 250.0, 0.0, 791)
-    femmesh.addNode(19000.0, 500.0, 0.0, 792)
-    femmesh.addNode(18750.0, 750.0, 0.0, 793)
-    femmesh.addNode(19250.0, 750.0, 0.0, 794)
-    femmesh.addNode(20250.0, 250.0, 0.0, 795)
-    femmesh.addNode(20750.0, 250.0, 0.0, 796)
-    femmesh.addNode(20000.0, 500.0, 0.0, 797)
-    femmesh.addNode(19750.0, 750.0, 0.0, 798)
-    femmesh.addNode(20250.0, 750.0, 0.0, 799)
-    femmesh.addNode(21250.0, 250.0, 0.0, 800)
-    femmesh.addNode(21750.0, 250.0, 0.0, 801)
-    femmesh.addNode(21000.0, 500.0, 0.0, 802)
-    femmesh.addNode(20750.0, 750.0, 0.0, 803)
-    femmesh.addNode(21250.0, 750.0, 0.0, 804)
-    femmesh.addNode(22250.0, 250.0, 0.0, 805)
-    femmesh.addNode(22750.0, 250.0, 0.0, 806)
-    femmesh.addNode(22000.0, 500.0, 0.0, 807)
-    femmesh.addNode(21750.0, 750.0, 0.0, 808)
-    femmesh.addNode(22250.0, 750.0, 0.0, 809)
-    femmesh.addNode(23250.0, 250.0, 0.0, 810)
-    femmesh.addNode(23750.0, 250.0, 0.0, 811)
-    femmesh.addNode(23000.0, 500.0, 0.0, 812)
-    femmesh.addNode(22750.0, 750.0, 0.0, 813)
-    femmesh.addNode(23250.0, 750.0, 0.0, 814)
-    femmesh.addNode(24250.0, 250.0, 0.0, 815)
-    femmesh.addNode(24750.0, 250.0, 0.0, 816)
-    femmesh.addNode(24000.0, 500.0, 0.0, 817)
-    femmesh.addNode(23750.0, 750.0, 0.0, 818)
-    femmesh.addNode(24250.0, 750.0, 0.0, 819)
-    femmesh.addNode(25250.0, 250.0, 0.0, 820)
-    femmesh.addNode(25750.0, 250.0, 0.0, 821)
-    femmesh.addNode(25000.0, 500.0, 0.0, 822)
-    femmesh.addNode(24750.0, 750.0, 0.0, 823)
-    femmesh.addNode(25250.0, 750.0, 0.0, 824)
-    femmesh.addNode(26250.0, 250.0, 0.0, 825)
-    femmesh.addNode(26750.0, 250.0, 0.0, 826)
-    femmesh.addNode(26000.0, 500.0, 0.0, 827)
-    femmesh.addNode(25750.0, 750.0, 0.0, 828)
-    femmesh.addNode(26250.0, 750.0, 0.0, 829)
-    femmesh.addNode(27250.0, 250.0, 0.0, 830)
-    femmesh.addNode(27750.0, 250.0, 0.0, 831)
-    femmesh.addNode(27000.0, 500.0, 0.0, 832)
-    femmesh.addNode(26750.0, 750.0, 0.0, 833)
-    femmesh.addNode(27250.0, 750.0, 0.0, 834)
-    femmesh.addNode(28250.0, 250.0, 0.0, 835)
-    femmesh.addNode(28750.0, 250.0, 0.0, 836)
-    femmesh.addNode(28000.0, 500.0, 0.0, 837)
-    femmesh.addNode(27750.0, 750.0, 0.0, 838)
-    femmesh.addNode(28250.0, 750.0, 0.0, 839)
-    femmesh.addNode(29250.0, 250.0, 0.0, 840)
-    femmesh.addNode(29750.0, 250.0, 0.0, 841)
-    femmesh.addNode(29000.0, 500.0, 0.0, 842)
-    femmesh.addNode(28750.0, 750.0, 0.0, 843)
-    femmesh.addNode(29250.0, 750.0, 0.0, 844)
-    femmesh.addNode(30250.0, 250.0, 0.0, 845)
-    femmesh.addNode(30750.0, 250.0, 0.0, 846)
-    femmesh.addNode(30000.0, 500.0, 0.0, 847)
-    femmesh.addNode(29750.0, 750.0, 0.0, 848)
-    femmesh.addNode(30250.0, 750.0, 0.0, 849)
-    femmesh.addNode(31000.0, 500.0, 0.0, 850)
-    femmesh.addNode(30750.0, 750.0, 0.0, 851)
-    femmesh.addNode(500.0, 500.0, 1000.0, 852)
-    femmesh.addNode(31500.0, 500.0, 1000.0, 853)
-    femmesh.addNode(1500.0, 500.0, 1000.0, 854)
-    femmesh.addNode(2500.0, 500.0, 1000.0, 855)
-    femmesh.addNode(3500.0, 500.0, 1000.0, 856)
-    femmesh.addNode(4500.0, 500.0, 1000.0, 857)
-    femmesh.addNode(5500.0, 500.0, 1000.0, 858)
-    femmesh.addNode(6500.0, 500.0, 1000.0, 859)
-    femmesh.addNode(7500.0, 500.0, 1000.0, 860)
-    femmesh.addNode(8500.0, 500.0, 1000.0, 861)
-    femmesh.addNode(10500.0, 500.0, 1000.0, 862)
-    femmesh.addNode(9500.0, 500.0, 1000.0, 863)
-    femmesh.addNode(11500.0, 500.0, 1000.0, 864)
-    femmesh.addNode(12500.0, 500.0, 1000.0, 865)
-    femmesh.addNode(13500.0, 500.0, 1000.0, 866)
-    femmesh.addNode(14500.0, 500.0, 1000.0, 867)
-    femmesh.addNode(15500.0, 500.0, 1000.0, 868)
-    femmesh.addNode(17500.0, 500.0, 1000.0, 869)
-    femmesh.addNode(16500.0, 500.0, 1000.0, 870)
-    femmesh.addNode(18500.0, 500.0, 1000.0, 871)
-    femmesh.addNode(19500.0, 500.0, 1000.0, 872)
-    femmesh.addNode(20500.0, 500.0, 1000.0, 873)
-    femmesh.addNode(21500.0, 500.0, 1000.0, 874)
-    femmesh.addNode(22500.0, 500.0, 1000.0, 875)
-    femmesh.addNode(23500.0, 500.0, 1000.0, 876)
-    femmesh.addNode(24500.0, 500.0, 1000.0, 877)
-    femmesh.addNode(25500.0, 500.0, 1000.0, 878)
-    femmesh.addNode(27500.0, 500.0, 1000.0, 879)
-    femmesh.addNode(26500.0, 500.0, 1000.0, 880)
-    femmesh.addNode(28500.0, 500.0, 1000.0, 881)
-    femmesh.addNode(29500.0, 500.0, 1000.0, 882)
-    femmesh.addNode(30500.0, 500.0, 1000.0, 883)
-    femmesh.addNode(250.0, 250.0, 1000.0, 884)
-    femmesh.addNode(250.0, 750.0, 1000.0, 885)
-    femmesh.addNode(750.0, 250.0, 1000.0, 886)
-    femmesh.addNode(750.0, 750.0, 1000.0, 887)
-    femmesh.addNode(31750.0, 750.0, 1000.0, 888)
-    femmesh.addNode(31750.0, 250.0, 1000.0, 889)
-    femmesh.addNode(31250.0, 250.0, 1000.0, 890)
-    femmesh.addNode(31250.0, 750.0, 1000.0, 891)
-    femmesh.addNode(1750.0, 250.0, 1000.0, 892)
-    femmesh.addNode(1250.0, 250.0, 1000.0, 893)
-    femmesh.addNode(1000.0, 500.0, 1000.0, 894)
-    femmesh.addNode(1250.0, 750.0, 1000.0, 895)
-    femmesh.addNode(2750.0, 250.0, 1000.0, 896)
-    femmesh.addNode(2250.0, 250.0, 1000.0, 897)
-    femmesh.addNode(1750.0, 750.0, 1000.0, 898)
-    femmesh.addNode(2000.0, 500.0, 1000.0, 899)
-    femmesh.addNode(2250.0, 750.0, 1000.0, 900)
-    femmesh.addNode(3750.0, 250.0, 1000.0, 901)
-    femmesh.addNode(3250.0, 250.0, 1000.0, 902)
-    femmesh.addNode(2750.0, 750.0, 1000.0, 903)
-    femmesh.addNode(3000.0, 500.0, 1000.0, 904)
-    femmesh.addNode(3250.0, 750.0, 1000.0, 905)
-    femmesh.addNode(4750.0, 250.0, 1000.0, 906)
-    femmesh.addNode(4250.0, 250.0, 1000.0, 907)
-    femmesh.addNode(3750.0, 750.0, 1000.0, 908)
-    femmesh.addNode(4000.0, 500.0, 1000.0, 909)
-    femmesh.addNode(4250.0, 750.0, 1000.0, 910)
-    femmesh.addNode(5750.0, 250.0, 1000.0, 911)
-    femmesh.addNode(5250.0, 250.0, 1000.0, 912)
-    femmesh.addNode(4750.0, 750.0, 1000.0, 913)
-    femmesh.addNode(5000.0, 500.0, 1000.0, 914)
-    femmesh.addNode(5250.0, 750.0, 1000.0, 915)
-    femmesh.addNode(6750.0, 250.0, 1000.0, 916)
-    femmesh.addNode(6250.0, 250.0, 1000.0, 917)
-    femmesh.addNode(5750.0, 750.0, 1000.0, 918)
-    femmesh.addNode(6000.0, 500.0, 1000.0, 919)
-    femmesh.addNode(6250.0, 750.0, 1000.0, 920)
-    femmesh.addNode(7750.0, 250.0, 1000.0, 921)
-    femmesh.addNode(7250.0, 250.0, 1000.0, 922)
-    femmesh.addNode(6750.0, 750.0, 1000.0, 923)
-    femmesh.addNode(7000.0, 500.0, 1000.0, 924)
-    femmesh.addNode(7250.0, 750.0, 1000.0, 925)
-    femmesh.addNode(8750.0, 250.0, 1000.0, 926)
-    femmesh.addNode(8250.0, 250.0, 1000.0, 927)
-    femmesh.addNode(7750.0, 750.0, 1000.0, 928)
-    femmesh.addNode(8000.0, 500.0, 1000.0, 929)
-    femmesh.addNode(8250.0, 750.0, 1000.0, 930)
-    femmesh.addNode(9750.0, 250.0, 1000.0, 931)
-    femmesh.addNode(9250.0, 250.0, 1000.0, 932)
-    femmesh.addNode(8750.0, 750.0, 1000.0, 933)
-    femmesh.addNode(9000.0, 500.0, 1000.0, 934)
-    femmesh.addNode(9250.0, 750.0, 1000.0, 935)
-    femmesh.addNode(10750.0, 250.0, 1000.0, 936)
-    femmesh.addNode(10250.0, 250.0, 1000.0, 937)
-    femmesh.addNode(10250.0, 750.0, 1000.0, 938)
-    femmesh.addNode(10000.0, 500.0, 1000.0, 939)
-    femmesh.addNode(9750.0, 750.0, 1000.0, 940)
-    femmesh.addNode(11750.0, 250.0, 1000.0, 941)
-    femmesh.addNode(11250.0, 250.0, 1000.0, 942)
-    femmesh.addNode(10750.0, 750.0, 1000.0, 943)
-    femmesh.addNode(11000.0, 500.0, 1000.0, 944)
-    femmesh.addNode(11250.0, 750.0, 1000.0, 945)
-    femmesh.addNode(12750.0, 250.0, 1000.0, 946)
-    femmesh.addNode(12250.0, 250.0, 1000.0, 947)
-    femmesh.addNode(11750.0, 750.0, 1000.0, 948)
-    femmesh.addNode(12000.0, 500.0, 1000.0, 949)
-    femmesh.addNode(12250.0, 750.0, 1000.0, 950)
-    femmesh.addNode(13750.0, 250.0, 1000.0, 951)
-    femmesh.addNode(13250.0, 250.0, 1000.0, 952)
-    femmesh.addNode(12750.0, 750.0, 1000.0, 953)
-    femmesh.addNode(13000.0, 500.0, 1000.0, 954)
-    femmesh.addNode(13250.0, 750.0, 1000.0, 955)
-    femmesh.addNode(14750.0, 250.0, 1000.0, 956)
-    femmesh.addNode(14250.0, 250.0, 1000.0, 957)
-    femmesh.addNode(13750.0, 750.0, 1000.0, 958)
-    femmesh.addNode(14000.0, 500.0, 1000.0, 959)
-    femmesh.addNode(14250.0, 750.0, 1000.0, 960)
-    femmesh.addNode(15750.0, 250.0, 1000.0, 961)
-    femmesh.addNode(15250.0, 250.0, 1000.0, 962)
-    femmesh.addNode(14750.0, 750.0, 1000.0, 963)
-    femmesh.addNode(15000.0, 500.0, 1000.0, 964)
-    femmesh.addNode(15250.0, 750.0, 1000.0, 965)
-    femmesh.addNode(16750.0, 250.0, 1000.0, 966)
-    femmesh.addNode(16250.0, 250.0, 1000.0, 967)
-    femmesh.addNode(15750.0, 750.0, 1000.0, 968)
-    femmesh.addNode(16000.0, 500.0, 1000.0, 969)
-    femmesh.addNode(16250.0, 750.0, 1000.0, 970)
-    femmesh.addNode(17750.0, 250.0, 1000.0, 971)
-    femmesh.addNode(17250.0, 250.0, 1000.0, 972)
-    femmesh.addNode(17250.0, 750.0, 1000.0, 973)
-    femmesh.addNode(17000.0, 500.0, 1000.0, 974)
-    femmesh.addNode(16750.0, 750.0, 1000.0, 975)
-    femmesh.addNode(18750.0, 250.0, 1000.0, 976)
-    femmesh.addNode(18250.0, 250.0, 1000.0, 977)
-    femmesh.addNode(17750.0, 750.0, 1000.0, 978)
-    femmesh.addNode(18000.0, 500.0, 1000.0, 979)
-    femmesh.addNode(18250.0, 750.0, 1000.0, 980)
-    femmesh.addNode(19750.0, 250.0, 1000.0, 981)
-    femmesh.addNode(19250.0, 250.0, 1000.0, 982)
-    femmesh.addNode(18750.0, 750.0, 1000.0, 983)
-    femmesh.addNode(19000.0, 500.0, 1000.0, 984)
-    femmesh.addNode(19250.0, 750.0, 1000.0, 985)
-    femmesh.addNode(20750.0, 250.0, 1000.0, 986)
-    femmesh.addNode(20250.0, 250.0, 1000.0, 987)
-    femmesh.addNode(19750.0, 750.0, 1000.0, 988)
-    femmesh.addNode(20000.0, 500.0, 1000.0, 989)
-    femmesh.addNode(20250.0, 750.0, 1000.0, 990)
-    femmesh.addNode(21750.0, 250.0, 1000.0, 991)
-    femmesh.addNode(21250.0, 250.0, 1000.0, 992)
-    femmesh.addNode(20750.0, 750.0, 1000.0, 993)
-    femmesh.addNode(21000.0, 500.0, 1000.0, 994)
-    femmesh.addNode(21250.0, 750.0, 1000.0, 995)
-    femmesh.addNode(22750.0, 250.0, 1000.0, 996)
-    femmesh.addNode(22250.0, 250.0, 1000.0, 997)
-    femmesh.addNode(21750.0, 750.0, 1000.0, 998)
-    femmesh.addNode(22000.0, 500.0, 1000.0, 999)
-    femmesh.addNode(22250.0, 750.0, 1000.0, 1000)
-    femmesh.addNode(23750.0, 250.0, 1000.0, 1001)
-    femmesh.addNode(23250.0, 250.0, 1000.0, 1002)
-    femmesh.addNode(22750.0, 750.0, 1000.0, 1003)
-    femmesh.addNode(23000.0, 500.0, 1000.0, 1004)
-    femmesh.addNode(23250.0, 750.0, 1000.0, 1005)
-    femmesh.addNode(24750.0, 250.0, 1000.0, 1006)
-    femmesh.addNode(24250.0, 250.0, 1000.0, 1007)
-    femmesh.addNode(23750.0, 750.0, 1000.0, 1008)
-    femmesh.addNode(24000.0, 500.0, 1000.0, 1009)
-    femmesh.addNode(24250.0, 750.0, 1000.0, 1010)
-    femmesh.addNode(25750.0, 250.0, 1000.0, 1011)
-    femmesh.addNode(25250.0, 250.0, 1000.0, 1012)
-    femmesh.addNode(24750.0, 750.0, 1000.0, 1013)
-    femmesh.addNode(25000.0, 500.0, 1000.0, 1014)
-    femmesh.addNode(25250.0, 750.0, 1000.0, 1015)
-    femmesh.addNode(26750.0, 250.0, 1000.0, 1016)
-    femmesh.addNode(26250.0, 250.0, 1000.0, 1017)
-    femmesh.addNode(25750.0, 750.0, 1000.0, 1018)
-    femmesh.addNode(26000.0, 500.0, 1000.0, 1019)
-    femmesh.addNode(26250.0, 750.0, 1000.0, 1020)
-    femmesh.addNode(27750.0, 250.0, 1000.0, 1021)
-    femmesh.addNode(27250.0, 250.0, 1000.0, 1022)
-    femmesh.addNode(27250.0, 750.0, 1000.0, 1023)
-    femmesh.addNode(27000.0, 500.0, 1000.0, 1024)
-    femmesh.addNode(26750.0, 750.0, 1000.0, 1025)
-    femmesh.addNode(28750.0, 250.0, 1000.0, 1026)
-    femmesh.addNode(28250.0, 250.0, 1000.0, 1027)
-    femmesh.addNode(27750.0, 750.0, 1000.0, 1028)
-    femmesh.addNode(28000.0, 500.0, 1000.0, 1029)
-    femmesh.addNode(28250.0, 750.0, 1000.0, 1030)
-    femmesh.addNode(29750.0, 250.0, 1000.0, 1031)
-    femmesh.addNode(29250.0, 250.0, 1000.0, 1032)
-    femmesh.addNode(28750.0, 750.0, 1000.0, 1033)
-    femmesh.addNode(29000.0, 500.0, 1000.0, 1034)
-    femmesh.addNode(29250.0, 750.0, 1000.0, 1035)
-    femmesh.addNode(30750.0, 250.0, 1000.0, 1036)
-    femmesh.addNode(30250.0, 250.0, 1000.0, 1037)
-    femmesh.addNode(29750.0, 750.0, 1000.0, 1038)
-    femmesh.addNode(30000.0, 500.0, 1000.0, 1039)
-    femmesh.addNode(30250.0, 750.0, 1000.0, 1040)
-    femmesh.addNode(31000.0, 500.0, 1000.0, 1041)
-    femmesh.addNode(30750.0, 750.0, 1000.0, 1042)
-    femmesh.addNode(25440.002243406096, 465.7778380598704, 536.1731492269341, 1043)
-    femmesh.addNode(31000.0, 499.99999999999994, 416.66666666666663, 1044)
-    femmesh.addNode(24484.67174988423, 500.0, 500.0, 1045)
-    femmesh.addNode(26097.951489895117, 499.61895995296396, 546.1066156893771, 1046)
-    femmesh.addNode(28000.0, 500.00000000000006, 500.0, 1047)
-    femmesh.addNode(25470.001121703048, 232.8889190299352, 518.0865746134671, 1048)
-    femmesh.addNode(25470.001121703048, 482.8889190299352, 268.08657461346706, 1049)
-    femmesh.addNode(25500.0, 250.0, 250.0, 1050)
-    femmesh.addNode(24992.335874942117, 250.0, 500.0, 1051)
-    femmesh.addNode(24992.335874942117, 500.0, 250.0, 1052)
-    femmesh.addNode(24962.336996645165, 482.8889190299352, 518.0865746134671, 1053)
-    femmesh.addNode(25470.001121703048, 482.8889190299352, 768.0865746134671, 1054)
-    femmesh.addNode(25500.0, 250.0, 750.0, 1055)
-    femmesh.addNode(24992.335874942117, 500.0, 750.0, 1056)
-    femmesh.addNode(25470.001121703048, 732.8889190299352, 518.0865746134671, 1057)
-    femmesh.addNode(25500.0, 750.0, 750.0, 1058)
-    femmesh.addNode(24992.335874942117, 750.0, 500.0, 1059)
-    femmesh.addNode(25500.0, 750.0, 250.0, 1060)
-    femmesh.addNode(3500.0, 250.0, 250.0, 1061)
-    femmesh.addNode(3500.0, 500.0, 500.0, 1062)
-    femmesh.addNode(3500.0, 750.0, 250.0, 1063)
-    femmesh.addNode(3750.0, 500.0, 250.0, 1064)
-    femmesh.addNode(2500.0, 500.0, 500.0, 1065)
-    femmesh.addNode(2750.0, 250.0, 500.0, 1066)
-    femmesh.addNode(2500.0, 250.0, 750.0, 1067)
-    femmesh.addNode(2500.0, 250.0, 250.0, 1068)
-    femmesh.addNode(5500.0, 250.0, 250.0, 1069)
-    femmesh.addNode(5500.0, 500.0, 500.0, 1070)
-    femmesh.addNode(5500.0, 750.0, 250.0, 1071)
-    femmesh.addNode(5750.0, 500.0, 250.0, 1072)
-    femmesh.addNode(12500.0, 250.0, 250.0, 1073)
-    femmesh.addNode(12500.0, 250.0, 750.0, 1074)
-    femmesh.addNode(12250.0, 250.0, 500.0, 1075)
-    femmesh.addNode(12500.0, 500.0, 500.0, 1076)
-    femmesh.addNode(7000.0, 750.0, 250.0, 1077)
-    femmesh.addNode(6750.0, 500.0, 250.0, 1078)
-    femmesh.addNode(7500.0, 250.0, 250.0, 1079)
-    femmesh.addNode(7000.0, 500.0, 500.0, 1080)
-    femmesh.addNode(5250.0, 500.0, 250.0, 1081)
-    femmesh.addNode(2250.0, 250.0, 500.0, 1082)
-    femmesh.addNode(7500.0, 750.0, 250.0, 1083)
-    femmesh.addNode(7750.0, 500.0, 250.0, 1084)
-    femmesh.addNode(7500.0, 500.0, 500.0, 1085)
-    femmesh.addNode(21500.0, 250.0, 750.0, 1086)
-    femmesh.addNode(21750.0, 250.0, 500.0, 1087)
-    femmesh.addNode(21500.0, 500.0, 500.0, 1088)
-    femmesh.addNode(21500.0, 250.0, 250.0, 1089)
-    femmesh.addNode(15500.0, 500.0, 500.0, 1090)
-    femmesh.addNode(15250.0, 250.0, 500.0, 1091)
-    femmesh.addNode(15500.0, 250.0, 750.0, 1092)
-    femmesh.addNode(15500.0, 250.0, 250.0, 1093)
-    femmesh.addNode(18500.0, 750.0, 750.0, 1094)
-    femmesh.addNode(18750.0, 250.0, 500.0, 1095)
-    femmesh.addNode(18750.0, 500.0, 250.0, 1096)
-    femmesh.addNode(19000.0, 750.0, 250.0, 1097)
-    femmesh.addNode(19000.0, 500.0, 500.0, 1098)
-    femmesh.addNode(16500.0, 250.0, 750.0, 1099)
-    femmesh.addNode(16750.0, 250.0, 500.0, 1100)
-    femmesh.addNode(16500.0, 500.0, 500.0, 1101)
-    femmesh.addNode(16500.0, 250.0, 250.0, 1102)
-    femmesh.addNode(16500.0, 750.0, 750.0, 1103)
-    femmesh.addNode(16250.0, 750.0, 500.0, 1104)
-    femmesh.addNode(16500.0, 750.0, 250.0, 1105)
-    femmesh.addNode(2500.0, 750.0, 250.0, 1106)
-    femmesh.addNode(2750.0, 500.0, 750.0, 1107)
-    femmesh.addNode(2500.0, 750.0, 750.0, 1108)
-    femmesh.addNode(12500.0, 750.0, 250.0, 1109)
-    femmesh.addNode(12500.0, 750.0, 750.0, 1110)
-    femmesh.addNode(12750.0, 750.0, 500.0, 1111)
-    femmesh.addNode(3500.0, 750.0, 750.0, 1112)
-    femmesh.addNode(3500.0, 250.0, 750.0, 1113)
-    femmesh.addNode(3250.0, 500.0, 750.0, 1114)
-    femmesh.addNode(10500.0, 250.0, 250.0, 1115)
-    femmesh.addNode(10500.0, 750.0, 250.0, 1116)
-    femmesh.addNode(10500.0, 500.0, 500.0, 1117)
-    femmesh.addNode(10250.0, 500.0, 250.0, 1118)
-    femmesh.addNode(1500.0, 500.0, 500.0, 1119)
-    femmesh.addNode(1500.0, 250.0, 250.0, 1120)
-    femmesh.addNode(1500.0, 250.0, 750.0, 1121)
-    femmesh.addNode(1250.0, 250.0, 500.0, 1122)
-    femmesh.addNode(17000.0, 250.0, 750.0, 1123)
-    femmesh.addNode(17000.0, 750.0, 750.0, 1124)
-    femmesh.addNode(17500.0, 500.0, 500.0, 1125)
-    femmesh.addNode(17250.0, 500.0, 750.0, 1126)
-    femmesh.addNode(13500.0, 500.0, 500.0, 1127)
-    femmesh.addNode(13250.0, 500.0, 750.0, 1128)
-    femmesh.addNode(13500.0, 750.0, 750.0, 1129)
-    femmesh.addNode(13500.0, 250.0, 750.0, 1130)
-    femmesh.addNode(5500.0, 250.0, 750.0, 1131)
-    femmesh.addNode(5250.0, 250.0, 500.0, 1132)
-    femmesh.addNode(5500.0, 750.0, 750.0, 1133)
-    femmesh.addNode(14750.0, 750.0, 500.0, 1134)
-    femmesh.addNode(14500.0, 500.0, 500.0, 1135)
-    femmesh.addNode(14500.0, 750.0, 750.0, 1136)
-    femmesh.addNode(14500.0, 750.0, 250.0, 1137)
-    femmesh.addNode(15000.0, 500.0, 500.0, 1138)
-    femmesh.addNode(15500.0, 750.0, 750.0, 1139)
-    femmesh.addNode(15000.0, 750.0, 250.0, 1140)
-    femmesh.addNode(12250.0, 750.0, 500.0, 1141)
-    femmesh.addNode(9500.0, 250.0, 250.0, 1142)
-    femmesh.addNode(9250.0, 250.0, 500.0, 1143)
-    femmesh.addNode(9500.0, 500.0, 500.0, 1144)
-    femmesh.addNode(9500.0, 250.0, 750.0, 1145)
-    femmesh.addNode(16750.0, 750.0, 500.0, 1146)
-    femmesh.addNode(11500.0, 750.0, 250.0, 1147)
-    femmesh.addNode(11500.0, 750.0, 750.0, 1148)
-    femmesh.addNode(11750.0, 750.0, 500.0, 1149)
-    femmesh.addNode(11500.0, 500.0, 500.0, 1150)
-    femmesh.addNode(15750.0, 250.0, 500.0, 1151)
-    femmesh.addNode(16000.0, 750.0, 750.0, 1152)
-    femmesh.addNode(16250.0, 250.0, 500.0, 1153)
-    femmesh.addNode(15750.0, 500.0, 250.0, 1154)
-    femmesh.addNode(16000.0, 750.0, 250.0, 1155)
-    femmesh.addNode(11750.0, 500.0, 250.0, 1156)
-    femmesh.addNode(11500.0, 250.0, 250.0, 1157)
-    femmesh.addNode(11500.0, 250.0, 750.0, 1158)
-    femmesh.addNode(7250.0, 750.0, 500.0, 1159)
-    femmesh.addNode(7250.0, 500.0, 750.0, 1160)
-    femmesh.addNode(4500.0, 750.0, 250.0, 1161)
-    femmesh.addNode(4500.0, 250.0, 250.0, 1162)
-    femmesh.addNode(4500.0, 500.0, 500.0, 1163)
-    femmesh.addNode(4250.0, 500.0, 750.0, 1164)
-    femmesh.addNode(4250.0, 750.0, 500.0, 1165)
-    femmesh.addNode(10250.0, 500.0, 750.0, 1166)
-    femmesh.addNode(10500.0, 750.0, 750.0, 1167)
-    femmesh.addNode(10500.0, 250.0, 750.0, 1168)
-    femmesh.addNode(6500.0, 250.0, 250.0, 1169)
-    femmesh.addNode(6500.0, 750.0, 250.0, 1170)
-    femmesh.addNode(6500.0, 500.0, 500.0, 1171)
-    femmesh.addNode(6250.0, 500.0, 250.0, 1172)
-    femmesh.addNode(8250.0, 750.0, 500.0, 1173)
-    femmesh.addNode(8500.0, 500.0, 500.0, 1174)
-    femmesh.addNode(8000.0, 750.0, 750.0, 1175)
-    femmesh.addNode(8000.0, 750.0, 250.0, 1176)
-    femmesh.addNode(4500.0, 750.0, 750.0, 1177)
-    femmesh.addNode(4500.0, 250.0, 750.0, 1178)
-    femmesh.addNode(7500.0, 750.0, 750.0, 1179)
-    femmesh.addNode(7500.0, 250.0, 750.0, 1180)
-    femmesh.addNode(13500.0, 750.0, 250.0, 1181)
-    femmesh.addNode(13750.0, 500.0, 250.0, 1182)
-    femmesh.addNode(13500.0, 250.0, 250.0, 1183)
-    femmesh.addNode(3750.0, 500.0, 750.0, 1184)
-    femmesh.addNode(14250.0, 250.0, 500.0, 1185)
-    femmesh.addNode(14500.0, 250.0, 250.0, 1186)
-    femmesh.addNode(14500.0, 250.0, 750.0, 1187)
-    femmesh.addNode(21000.0, 750.0, 750.0, 1188)
-    femmesh.addNode(21250.0, 250.0, 500.0, 1189)
-    femmesh.addNode(20750.0, 500.0, 250.0, 1190)
-    femmesh.addNode(21000.0, 750.0, 250.0, 1191)
-    femmesh.addNode(17000.0, 250.0, 250.0, 1192)
-    femmesh.addNode(12000.0, 250.0, 250.0, 1193)
-    femmesh.addNode(12000.0, 250.0, 750.0, 1194)
-    femmesh.addNode(9500.0, 750.0, 250.0, 1195)
-    femmesh.addNode(9250.0, 750.0, 500.0, 1196)
-    femmesh.addNode(9500.0, 750.0, 750.0, 1197)
-    femmesh.addNode(8250.0, 250.0, 500.0, 1198)
-    femmesh.addNode(10000.0, 750.0, 750.0, 1199)
-    femmesh.addNode(10000.0, 250.0, 750.0, 1200)
-    femmesh.addNode(500.0, 500.0, 500.0, 1201)
-    femmesh.addNode(500.0, 250.0, 250.0, 1202)
-    femmesh.addNode(500.0, 750.0, 250.0, 1203)
-    femmesh.addNode(750.0, 500.0, 750.0, 1204)
-    femmesh.addNode(750.0, 250.0, 500.0, 1205)
-    femmesh.addNode(8500.0, 750.0, 250.0, 1206)
-    femmesh.addNode(8500.0, 750.0, 750.0, 1207)
-    femmesh.addNode(1500.0, 750.0, 250.0, 1208)
-    femmesh.addNode(1500.0, 750.0, 750.0, 1209)
-    femmesh.addNode(1750.0, 750.0, 500.0, 1210)
-    femmesh.addNode(6500.0, 750.0, 750.0, 1211)
-    femmesh.addNode(6500.0, 250.0, 750.0, 1212)
-    femmesh.addNode(6250.0, 250.0, 500.0, 1213)
-    femmesh.addNode(8750.0, 250.0, 500.0, 1214)
-    femmesh.addNode(8750.0, 500.0, 750.0, 1215)
-    femmesh.addNode(4750.0, 500.0, 250.0, 1216)
-    femmesh.addNode(4750.0, 250.0, 500.0, 1217)
-    femmesh.addNode(8500.0, 250.0, 750.0, 1218)
-    femmesh.addNode(8500.0, 250.0, 250.0, 1219)
-    femmesh.addNode(9750.0, 250.0, 500.0, 1220)
-    femmesh.addNode(10750.0, 500.0, 250.0, 1221)
-    femmesh.addNode(10750.0, 750.0, 500.0, 1222)
-    femmesh.addNode(14750.0, 250.0, 500.0, 1223)
-    femmesh.addNode(13250.0, 500.0, 250.0, 1224)
-    femmesh.addNode(11250.0, 500.0, 250.0, 1225)
-    femmesh.addNode(11250.0, 750.0, 500.0, 1226)
-    femmesh.addNode(6750.0, 250.0, 500.0, 1227)
-    femmesh.addNode(6750.0, 500.0, 750.0, 1228)
-    femmesh.addNode(15250.0, 500.0, 250.0, 1229)
-    femmesh.addNode(14250.0, 500.0, 250.0, 1230)
-    femmesh.addNode(15500.0, 750.0, 250.0, 1231)
-    femmesh.addNode(17500.0, 250.0, 750.0, 1232)
-    femmesh.addNode(17500.0, 750.0, 750.0, 1233)
-    femmesh.addNode(20500.0, 500.0, 500.0, 1234)
-    femmesh.addNode(20250.0, 500.0, 750.0, 1235)
-    femmesh.addNode(20500.0, 250.0, 750.0, 1236)
-    femmesh.addNode(20500.0, 750.0, 750.0, 1237)
-    femmesh.addNode(5750.0, 250.0, 500.0, 1238)
-    femmesh.addNode(9750.0, 500.0, 250.0, 1239)
-    femmesh.addNode(3250.0, 250.0, 500.0, 1240)
-    femmesh.addNode(1750.0, 250.0, 500.0, 1241)
-    femmesh.addNode(2250.0, 750.0, 500.0, 1242)
-    femmesh.addNode(1250.0, 500.0, 750.0, 1243)
-    femmesh.addNode(18250.0, 750.0, 500.0, 1244)
-    femmesh.addNode(18500.0, 500.0, 500.0, 1245)
-    femmesh.addNode(18000.0, 750.0, 750.0, 1246)
-    femmesh.addNode(18000.0, 750.0, 250.0, 1247)
-    femmesh.addNode(500.0, 250.0, 750.0, 1248)
-    femmesh.addNode(500.0, 750.0, 750.0, 1249)
-    femmesh.addNode(7750.0, 500.0, 750.0, 1250)
-    femmesh.addNode(12750.0, 500.0, 250.0, 1251)
-    femmesh.addNode(17250.0, 500.0, 250.0, 1252)
-    femmesh.addNode(13750.0, 500.0, 750.0, 1253)
-    femmesh.addNode(14000.0, 750.0, 750.0, 1254)
-    femmesh.addNode(14000.0, 250.0, 750.0, 1255)
-    femmesh.addNode(13000.0, 500.0, 500.0, 1256)
-    femmesh.addNode(13000.0, 750.0, 750.0, 1257)
-    femmesh.addNode(19250.0, 500.0, 750.0, 1258)
-    femmesh.addNode(19250.0, 750.0, 500.0, 1259)
-    femmesh.addNode(19500.0, 250.0, 250.0, 1260)
-    femmesh.addNode(19000.0, 250.0, 750.0, 1261)
-    femmesh.addNode(30500.0, 500.0, 500.0, 1262)
-    femmesh.addNode(30750.0, 250.0, 500.0, 1263)
-    femmesh.addNode(30500.0, 750.0, 250.0, 1264)
-    femmesh.addNode(30750.0, 500.0, 750.0, 1265)
-    femmesh.addNode(30500.0, 750.0, 750.0, 1266)
-    femmesh.addNode(27500.0, 500.0, 500.0, 1267)
-    femmesh.addNode(27250.0, 250.0, 500.0, 1268)
-    femmesh.addNode(27500.0, 250.0, 250.0, 1269)
-    femmesh.addNode(27500.0, 250.0, 750.0, 1270)
-    femmesh.addNode(21250.0, 750.0, 500.0, 1271)
-    femmesh.addNode(30500.0, 250.0, 750.0, 1272)
-    femmesh.addNode(30500.0, 250.0, 250.0, 1273)
-    femmesh.addNode(29500.0, 500.0, 500.0, 1274)
-    femmesh.addNode(29250.0, 750.0, 500.0, 1275)
-    femmesh.addNode(29500.0, 250.0, 250.0, 1276)
-    femmesh.addNode(29250.0, 500.0, 250.0, 1277)
-    femmesh.addNode(29500.0, 250.0, 750.0, 1278)
-    femmesh.addNode(17750.0, 500.0, 750.0, 1279)
-    femmesh.addNode(19500.0, 750.0, 750.0, 1280)
-    femmesh.addNode(19500.0, 750.0, 250.0, 1281)
-    femmesh.addNode(19500.0, 500.0, 500.0, 1282)
-    femmesh.addNode(20750.0, 500.0, 750.0, 1283)
-    femmesh.addNode(20500.0, 750.0, 250.0, 1284)
-    femmesh.addNode(20500.0, 250.0, 250.0, 1285)
-    femmesh.addNode(18000.0, 250.0, 750.0, 1286)
-    femmesh.addNode(18250.0, 250.0, 500.0, 1287)
-    femmesh.addNode(17750.0, 500.0, 250.0, 1288)
-    femmesh.addNode(21500.0, 750.0, 250.0, 1289)
-    femmesh.addNode(21500.0, 750.0, 750.0, 1290)
-    femmesh.addNode(29500.0, 750.0, 750.0, 1291)
-    femmesh.addNode(29500.0, 750.0, 250.0, 1292)
-    femmesh.addNode(29750.0, 750.0, 500.0, 1293)
-    femmesh.addNode(28500.0, 500.0, 500.0, 1294)
-    femmesh.addNode(28750.0, 500.0, 250.0, 1295)
-    femmesh.addNode(28500.0, 750.0, 750.0, 1296)
-    femmesh.addNode(28750.0, 250.0, 500.0, 1297)
-    femmesh.addNode(28500.0, 250.0, 750.0, 1298)
-    femmesh.addNode(27000.0, 250.0, 750.0, 1299)
-    femmesh.addNode(27000.0, 750.0, 750.0, 1300)
-    femmesh.addNode(26750.0, 500.0, 750.0, 1301)
-    femmesh.addNode(26500.0, 500.0, 500.0, 1302)
-    femmesh.addNode(27250.0, 750.0, 500.0, 1303)
-    femmesh.addNode(27500.0, 750.0, 250.0, 1304)
-    femmesh.addNode(27500.0, 750.0, 750.0, 1305)
-    femmesh.addNode(31500.0, 750.0, 750.0, 1306)
-    femmesh.addNode(31500.0, 750.0, 250.0, 1307)
-    femmesh.addNode(31250.0, 750.0, 500.0, 1308)
-    femmesh.addNode(31500.0, 500.0, 500.0, 1309)
-    femmesh.addNode(30250.0, 750.0, 500.0, 1310)
-    femmesh.addNode(23500.0, 250.0, 750.0, 1311)
-    femmesh.addNode(23250.0, 500.0, 750.0, 1312)
-    femmesh.addNode(23500.0, 750.0, 750.0, 1313)
-    femmesh.addNode(23500.0, 500.0, 500.0, 1314)
-    femmesh.addNode(17500.0, 250.0, 250.0, 1315)
-    femmesh.addNode(17500.0, 750.0, 250.0, 1316)
-    femmesh.addNode(19500.0, 250.0, 750.0, 1317)
-    femmesh.addNode(18500.0, 750.0, 250.0, 1318)
-    femmesh.addNode(18500.0, 250.0, 750.0, 1319)
-    femmesh.addNode(18500.0, 250.0, 250.0, 1320)
-    femmesh.addNode(22500.0, 750.0, 750.0, 1321)
-    femmesh.addNode(22250.0, 250.0, 500.0, 1322)
-    femmesh.addNode(22250.0, 500.0, 250.0, 1323)
-    femmesh.addNode(22500.0, 750.0, 250.0, 1324)
-    femmesh.addNode(22500.0, 500.0, 500.0, 1325)
-    femmesh.addNode(26500.0, 750.0, 250.0, 1326)
-    femmesh.addNode(26500.0, 250.0, 250.0, 1327)
-    femmesh.addNode(26750.0, 500.0, 250.0, 1328)
-    femmesh.addNode(28500.0, 250.0, 250.0, 1329)
-    femmesh.addNode(28500.0, 750.0, 250.0, 1330)
-    femmesh.addNode(21750.0, 500.0, 250.0, 1331)
-    femmesh.addNode(19750.0, 750.0, 500.0, 1332)
-    femmesh.addNode(20250.0, 750.0, 500.0, 1333)
-    femmesh.addNode(23500.0, 750.0, 250.0, 1334)
-    femmesh.addNode(23250.0, 750.0, 500.0, 1335)
-    femmesh.addNode(23500.0, 250.0, 250.0, 1336)
-    femmesh.addNode(22500.0, 250.0, 250.0, 1337)
-    femmesh.addNode(22500.0, 250.0, 750.0, 1338)
-    femmesh.addNode(29000.0, 500.0, 500.0, 1339)
-    femmesh.addNode(29250.0, 500.0, 750.0, 1340)
-    femmesh.addNode(29000.0, 250.0, 750.0, 1341)
-    femmesh.addNode(19750.0, 250.0, 500.0, 1342)
-    femmesh.addNode(22750.0, 250.0, 500.0, 1343)
-    femmesh.addNode(22750.0, 500.0, 750.0, 1344)
-    femmesh.addNode(27000.0, 750.0, 250.0, 1345)
-    femmesh.addNode(29750.0, 250.0, 500.0, 1346)
-    femmesh.addNode(30250.0, 250.0, 500.0, 1347)
-    femmesh.addNode(31500.0, 250.0, 750.0, 1348)
-    femmesh.addNode(31500.0, 250.0, 250.0, 1349)
-    femmesh.addNode(31250.0, 500.0, 750.0, 1350)
-    femmesh.addNode(15750.0, 500.0, 750.0, 1351)
-    femmesh.addNode(23992.335874942117, 250.0, 500.0, 1352)
-    femmesh.addNode(23992.335874942117, 750.0, 500.0, 1353)
-    femmesh.addNode(23992.335874942117, 500.0, 250.0, 1354)
-    femmesh.addNode(23992.335874942117, 500.0, 750.0, 1355)
-    femmesh.addNode(26048.97574494756, 749.809479976482, 273.05330784468856, 1356)
-    femmesh.addNode(25798.97574494756, 499.80947997648195, 273.05330784468856, 1357)
-    femmesh.addNode(25798.97574494756, 749.809479976482, 523.0533078446886, 1358)
-    femmesh.addNode(26500.0, 750.0, 750.0, 1359)
-    femmesh.addNode(26048.97574494756, 749.809479976482, 773.0533078446886, 1360)
-    femmesh.addNode(26298.97574494756, 499.80947997648195, 773.0533078446886, 1361)
-    femmesh.addNode(26298.97574494756, 749.809479976482, 523.0533078446886, 1362)
-    femmesh.addNode(10750.0, 250.0, 500.0, 1363)
-    femmesh.addNode(11000.0, 250.0, 750.0, 1364)
-    femmesh.addNode(9000.0, 500.0, 500.0, 1365)
-    femmesh.addNode(5250.0, 750.0, 500.0, 1366)
-    femmesh.addNode(11750.0, 500.0, 750.0, 1367)
-    femmesh.addNode(4000.0, 500.0, 500.0, 1368)
-    femmesh.addNode(750.0, 500.0, 250.0, 1369)
-    femmesh.addNode(14250.0, 750.0, 500.0, 1370)
-    femmesh.addNode(9750.0, 750.0, 500.0, 1371)
-    femmesh.addNode(4750.0, 500.0, 750.0, 1372)
-    femmesh.addNode(5000.0, 750.0, 750.0, 1373)
-    femmesh.addNode(1250.0, 500.0, 250.0, 1374)
-    femmesh.addNode(6250.0, 500.0, 750.0, 1375)
-    femmesh.addNode(5750.0, 500.0, 750.0, 1376)
-    femmesh.addNode(3250.0, 750.0, 500.0, 1377)
-    femmesh.addNode(11250.0, 500.0, 750.0, 1378)
-    femmesh.addNode(23000.0, 500.0, 500.0, 1379)
-    femmesh.addNode(22750.0, 500.0, 250.0, 1380)
-    femmesh.addNode(23250.0, 500.0, 250.0, 1381)
-    femmesh.addNode(22250.0, 750.0, 500.0, 1382)
-    femmesh.addNode(2750.0, 500.0, 250.0, 1383)
-    femmesh.addNode(3000.0, 750.0, 250.0, 1384)
-    femmesh.addNode(20000.0, 250.0, 750.0, 1385)
-    femmesh.addNode(9000.0, 750.0, 750.0, 1386)
-    femmesh.addNode(20000.0, 500.0, 500.0, 1387)
-    femmesh.addNode(21750.0, 500.0, 750.0, 1388)
-    femmesh.addNode(22000.0, 750.0, 750.0, 1389)
-    femmesh.addNode(26048.97574494756, 249.80947997648198, 273.05330784468856, 1390)
-    femmesh.addNode(24742.335874942117, 750.0, 250.0, 1391)
-    femmesh.addNode(24742.335874942117, 750.0, 750.0, 1392)
-    femmesh.addNode(24742.335874942117, 250.0, 250.0, 1393)
-    femmesh.addNode(24742.335874942117, 250.0, 750.0, 1394)
-    femmesh.addNode(2000.0, 500.0, 500.0, 1395)
-    femmesh.addNode(1000.0, 500.0, 500.0, 1396)
-    femmesh.addNode(6000.0, 500.0, 500.0, 1397)
-    femmesh.addNode(30000.0, 500.0, 500.0, 1398)
-    femmesh.addNode(26298.97574494756, 249.80947997648198, 523.0533078446886, 1399)
-    femmesh.addNode(26048.97574494756, 249.80947997648198, 773.0533078446886, 1400)
-    femmesh.addNode(24242.335874942117, 750.0, 750.0, 1401)
-    femmesh.addNode(24242.335874942117, 750.0, 250.0, 1402)
-    femmesh.addNode(24242.335874942117, 250.0, 250.0, 1403)
-    femmesh.addNode(24242.335874942117, 250.0, 750.0, 1404)
-    femmesh.addNode(250.0, 250.0, 500.0, 1405)
-    femmesh.addNode(250.0, 500.0, 250.0, 1406)
-    femmesh.addNode(250.0, 750.0, 500.0, 1407)
-    femmesh.addNode(250.0, 500.0, 750.0, 1408)
-    femmesh.addNode(31750.0, 500.0, 250.0, 1409)
-    femmesh.addNode(31750.0, 500.0, 750.0, 1410)
-    femmesh.addNode(31750.0, 250.0, 500.0, 1411)
-    femmesh.addNode(31750.0, 750.0, 500.0, 1412)
-    femmesh.addNode(28250.0, 500.0, 750.0, 1413)
-    femmesh.addNode(28250.0, 250.00000000000003, 500.0, 1414)
-    femmesh.addNode(28250.0, 750.0, 500.0, 1415)
-    femmesh.addNode(28250.0, 500.0, 250.0, 1416)
-    femmesh.addNode(27750.0, 250.00000000000003, 500.0, 1417)
-    femmesh.addNode(27750.0, 500.0, 750.0, 1418)
-    femmesh.addNode(27750.0, 500.0, 250.0, 1419)
-    femmesh.addNode(27750.0, 750.0, 500.0, 1420)
-    femmesh.addNode(24492.335874942117, 750.0, 500.0, 1421)
-    femmesh.addNode(24492.335874942117, 500.0, 750.0, 1422)
-    femmesh.addNode(24492.335874942117, 250.0, 500.0, 1423)
-    femmesh.addNode(24492.335874942117, 500.0, 250.0, 1424)
-    femmesh.addNode(24500.0, 250.0, 250.0, 1425)
-    femmesh.addNode(24500.0, 250.0, 750.0, 1426)
-    femmesh.addNode(28000.0, 250.00000000000003, 750.0, 1427)
-    femmesh.addNode(28000.0, 750.0, 750.0, 1428)
-    femmesh.addNode(28000.0, 750.0, 250.0, 1429)
-    femmesh.addNode(28000.0, 250.00000000000003, 250.0, 1430)
-    femmesh.addNode(24500.0, 750.0, 750.0, 1431)
-    femmesh.addNode(24500.0, 750.0, 250.0, 1432)
-    femmesh.addNode(31250.0, 249.99999999999997, 458.3333333333333, 1433)
-    femmesh.addNode(31000.0, 249.99999999999997, 208.33333333333331, 1434)
-    femmesh.addNode(31250.0, 500.0, 208.33333333333331, 1435)
-    femmesh.addNode(31000.0, 750.0, 208.33333333333331, 1436)
-    femmesh.addNode(30750.0, 500.0, 208.33333333333331, 1437)
-    femmesh.addNode(30750.0, 750.0, 458.3333333333333, 1438)
-    femmesh.addNode(26548.97574494756, 249.80947997648198, 773.0533078446886, 1439)
-    femmesh.addNode(25768.976866650606, 482.69839900641716, 541.1398824581556, 1440)
-    femmesh.addNode(26250.0, 500.0, 250.0, 1441)
-    femmesh.addNode(25720.001121703048, 232.8889190299352, 768.0865746134671, 1442)
-    femmesh.addNode(31000.0, 750.0, 708.3333333333333, 1443)
-    femmesh.addNode(31000.0, 249.99999999999997, 708.3333333333333, 1444)
-    femmesh.addNode(25750.0, 250.0, 500.0, 1445)
-    femmesh.addNode(25750.0, 500.0, 750.0, 1446)
-    return True
-
-
-def create_elements(femmesh):
-    # elements
-    femmesh.addVolume([305, 687, 1043, 1045, 1050, 1049, 1048, 1051, 1052, 1053], 657)
-    femmesh.addVolume([878, 305, 1043, 1045, 1055, 1048, 1054, 1056, 1051, 1053], 658)
-    femmesh.addVolume([496, 878, 1043, 1045, 1058, 1054, 1057, 1059, 1056, 1053], 659)
-    femmesh.addVolume([687, 496, 1043, 1045, 1060, 1057, 1049, 1052, 1059, 1053], 660)
-    femmesh.addVolume([283, 665, 25, 474, 1061, 711, 328, 1062, 1063, 1064], 661)
-    femmesh.addVolume([855, 87, 663, 281, 896, 1066, 1065, 1067, 331, 1068], 662)
-    femmesh.addVolume([285, 667, 27, 477, 1069, 721, 338, 1070, 1071, 1072], 663)
-    femmesh.addVolume([292, 33, 675, 865, 374, 755, 1073, 1074, 1075, 1076], 664)
-    femmesh.addVolume([669, 28, 476, 286, 730, 1078, 1077, 1079, 349, 1080], 665)
-    femmesh.addVolume([477, 26, 285, 667, 1081, 339, 1070, 1071, 720, 1069], 666)
-    femmesh.addVolume([855, 663, 23, 281, 1065, 705, 1082, 1067, 1068, 324], 667)
-    femmesh.addVolume([669, 29, 286, 479, 731, 348, 1079, 1083, 1084, 1085], 668)
-    femmesh.addVolume([43, 874, 301, 683, 1087, 1086, 418, 801, 1088, 1089], 669)
-    femmesh.addVolume([36, 868, 677, 295, 1091, 1090, 770, 389, 1092, 1093], 670)
-    femmesh.addVolume([489, 40, 871, 681, 1096, 1095, 1094, 1097, 790, 1098], 671)
-    femmesh.addVolume([101, 870, 296, 678, 966, 1099, 401, 1100, 1101, 1102], 672)
-    femmesh.addVolume([163, 870, 487, 678, 1104, 1103, 584, 779, 1101, 1105], 673)
-    femmesh.addVolume([663, 87, 855, 473, 1066, 896, 1065, 1106, 1107, 1108], 674)
-    femmesh.addVolume([483, 160, 675, 865, 565, 764, 1109, 1110, 1111, 1076], 675)
-    femmesh.addVolume([856, 283, 474, 87, 1113, 1062, 1112, 902, 332, 1114], 676)
-    femmesh.addVolume([672, 291, 31, 482, 1115, 364, 745, 1116, 1117, 1118], 677)
-    femmesh.addVolume([854, 282, 664, 85, 1121, 1120, 1119, 893, 322, 1122], 678)
-    femmesh.addVolume([870, 297, 101, 488, 1123, 402, 966, 1124, 1125, 1126], 679)
-    femmesh.addVolume([97, 484, 293, 866, 1128, 1127, 382, 952, 1129, 1130], 680)
-    femmesh.addVolume([285, 26, 477, 858, 339, 1081, 1070, 1131, 1132, 1133], 681)
-    femmesh.addVolume([225, 867, 676, 485, 963, 1135, 1134, 581, 1136, 1137], 682)
-    femmesh.addVolume([868, 225, 676, 486, 965, 1134, 1138, 1139, 583, 1140], 683)
-    femmesh.addVolume([483, 675, 159, 865, 1109, 759, 564, 1110, 1076, 1141], 684)
-    femmesh.addVolume([30, 671, 289, 863, 740, 1142, 359, 1143, 1144, 1145], 685)
-    femmesh.addVolume([870, 164, 487, 678, 1146, 585, 1103, 1101, 783, 1105], 686)
-    femmesh.addVolume([481, 159, 673, 864, 560, 758, 1147, 1148, 1149, 1150], 687)
-    femmesh.addVolume([868, 100, 677, 295, 961, 1151, 1090, 1092, 396, 1093], 688)
-    femmesh.addVolume([486, 37, 870, 678, 1154, 1153, 1152, 1155, 775, 1101], 689)
-    femmesh.addVolume([290, 673, 159, 864, 1157, 758, 1156, 1158, 1150, 1149], 690)
-    femmesh.addVolume([476, 669, 286, 217, 1077, 1079, 1080, 541, 1159, 1160], 691)
-    femmesh.addVolume([475, 284, 666, 214, 1163, 1162, 1161, 528, 1164, 1165], 692)
-    femmesh.addVolume([220, 482, 291, 862, 558, 1117, 1166, 938, 1167, 1168], 693)
-    femmesh.addVolume([668, 287, 27, 476, 1169, 344, 725, 1170, 1171, 1172], 694)
-    femmesh.addVolume([218, 861, 670, 479, 930, 1174, 1173, 548, 1175, 1176], 695)
-    femmesh.addVolume([214, 475, 284, 857, 528, 1163, 1164, 910, 1177, 1178], 696)
-    femmesh.addVolume([217, 479, 286, 860, 543, 1085, 1160, 925, 1179, 1180], 697)
-    femmesh.addVolume([484, 35, 674, 293, 1182, 761, 1181, 1127, 378, 1183], 698)
-    femmesh.addVolume([214, 283, 474, 856, 1184, 1062, 526, 908, 1113, 1112], 699)
-    femmesh.addVolume([676, 35, 867, 294, 765, 1185, 1135, 1186, 384, 1187], 700)
-    femmesh.addVolume([491, 42, 874, 683, 1190, 1189, 1188, 1191, 800, 1088], 701)
-    femmesh.addVolume([870, 101, 297, 678, 966, 402, 1123, 1101, 1100, 1192], 702)
-    femmesh.addVolume([290, 675, 33, 865, 1193, 755, 368, 1194, 1076, 1075], 703)
-    femmesh.addVolume([156, 480, 671, 863, 549, 1195, 744, 1196, 1197, 1144], 704)
-    femmesh.addVolume([29, 479, 670, 861, 1084, 1176, 735, 1198, 1175, 1174], 705)
-    femmesh.addVolume([482, 291, 863, 220, 1117, 1200, 1199, 558, 1166, 940], 706)
-    femmesh.addVolume([470, 661, 279, 85, 1203, 1202, 1201, 1204, 1205, 313], 707)
-    femmesh.addVolume([218, 478, 670, 861, 546, 1206, 1173, 930, 1207, 1174], 708)
-    femmesh.addVolume([664, 472, 149, 854, 1208, 511, 709, 1119, 1209, 1210], 709)
-    femmesh.addVolume([476, 287, 27, 859, 1171, 344, 1172, 1211, 1212, 1213], 710)
-    femmesh.addVolume([670, 93, 861, 478, 1214, 926, 1174, 1206, 1215, 1207], 711)
-    femmesh.addVolume([284, 26, 475, 666, 333, 1216, 1163, 1162, 716, 1161], 712)
-    femmesh.addVolume([475, 26, 284, 857, 1216, 333, 1163, 1177, 1217, 1178], 713)
-    femmesh.addVolume([29, 861, 670, 288, 1198, 1174, 735, 354, 1218, 1219], 714)
-    femmesh.addVolume([479, 286, 669, 217, 1085, 1079, 1083, 543, 1160, 1159], 715)
-    femmesh.addVolume([863, 291, 482, 31, 1200, 1117, 1199, 1220, 364, 1118], 716)
-    femmesh.addVolume([482, 158, 291, 862, 555, 1221, 1117, 1167, 1222, 1168], 717)
-    femmesh.addVolume([289, 671, 31, 863, 1142, 741, 358, 1145, 1144, 1220], 718)
-    femmesh.addVolume([676, 867, 99, 294, 1135, 956, 1223, 1186, 1187, 391], 719)
-    femmesh.addVolume([291, 158, 482, 672, 1221, 555, 1117, 1115, 753, 1116], 720)
-    femmesh.addVolume([34, 293, 484, 674, 379, 1127, 1224, 760, 1183, 1181], 721)
-    femmesh.addVolume([290, 158, 673, 864, 1225, 754, 1157, 1158, 1226, 1150], 722)
-    femmesh.addVolume([91, 287, 668, 476, 352, 1169, 1227, 1228, 1171, 1170], 723)
-    femmesh.addVolume([676, 36, 868, 486, 766, 1091, 1138, 1140, 1229, 1139], 724)
-    femmesh.addVolume([867, 35, 676, 485, 1185, 765, 1135, 1136, 1230, 1137], 725)
-    femmesh.addVolume([36, 486, 677, 868, 1229, 1231, 770, 1091, 1139, 1090], 726)
-    femmesh.addVolume([869, 101, 297, 488, 972, 402, 1232, 1233, 1126, 1125], 727)
-    femmesh.addVolume([300, 230, 491, 873, 1235, 608, 1234, 1236, 990, 1237], 728)
-    femmesh.addVolume([861, 93, 670, 288, 926, 1214, 1174, 1218, 361, 1219], 729)
-    femmesh.addVolume([285, 477, 27, 858, 1070, 1072, 338, 1131, 1133, 1238], 730)
-    femmesh.addVolume([480, 31, 671, 863, 1239, 741, 1195, 1197, 1220, 1144], 731)
-    femmesh.addVolume([474, 283, 665, 87, 1062, 1061, 1063, 1114, 332, 1240], 732)
-    femmesh.addVolume([287, 859, 476, 91, 1212, 1211, 1171, 352, 916, 1228], 733)
-    femmesh.addVolume([664, 23, 282, 854, 702, 319, 1120, 1119, 1241, 1121], 734)
-    femmesh.addVolume([473, 663, 149, 855, 1106, 708, 514, 1108, 1065, 1242], 735)
-    femmesh.addVolume([854, 664, 472, 85, 1119, 1208, 1209, 893, 1122, 1243], 736)
-    femmesh.addVolume([228, 871, 680, 488, 980, 1245, 1244, 596, 1246, 1247], 737)
-    femmesh.addVolume([852, 470, 279, 85, 1249, 1201, 1248, 886, 1204, 313], 738)
-    femmesh.addVolume([286, 860, 479, 92, 1180, 1179, 1085, 356, 921, 1250], 739)
-    femmesh.addVolume([292, 675, 160, 865, 1073, 764, 1251, 1074, 1076, 1111], 740)
-    femmesh.addVolume([290, 159, 675, 865, 1156, 759, 1193, 1194, 1141, 1076], 741)
-    femmesh.addVolume([164, 870, 297, 678, 1146, 1123, 1252, 783, 1101, 1192], 742)
-    femmesh.addVolume([481, 673, 158, 864, 1147, 754, 559, 1148, 1150, 1226], 743)
-    femmesh.addVolume([224, 484, 293, 867, 576, 1127, 1253, 960, 1254, 1255], 744)
-    femmesh.addVolume([484, 292, 160, 865, 1256, 1251, 569, 1257, 1074, 1111], 745)
-    femmesh.addVolume([484, 97, 292, 865, 1128, 381, 1256, 1257, 946, 1074], 746)
-    femmesh.addVolume([867, 35, 484, 293, 1185, 1182, 1254, 1255, 378, 1127], 747)
-    femmesh.addVolume([224, 866, 293, 484, 958, 1130, 1253, 576, 1129, 1127], 748)
-    femmesh.addVolume([298, 681, 229, 871, 1260, 1259, 1258, 1261, 1098, 983], 749)
-    femmesh.addVolume([692, 115, 883, 501, 1263, 1036, 1262, 1264, 1265, 1266], 750)
-    femmesh.addVolume([689, 48, 879, 307, 830, 1268, 1267, 1269, 449, 1270], 751)
-    femmesh.addVolume([231, 874, 683, 491, 995, 1088, 1271, 611, 1188, 1191], 752)
-    femmesh.addVolume([883, 115, 692, 310, 1036, 1263, 1262, 1272, 469, 1273], 753)
-    femmesh.addVolume([691, 176, 882, 309, 844, 1275, 1274, 1276, 1277, 1278], 754)
-    femmesh.addVolume([102, 297, 488, 869, 406, 1125, 1279, 971, 1232, 1233], 755)
-    femmesh.addVolume([490, 229, 872, 681, 603, 985, 1280, 1281, 1259, 1282], 756)
-    femmesh.addVolume([873, 300, 105, 491, 1236, 421, 986, 1237, 1234, 1283], 757)
-    femmesh.addVolume([491, 300, 42, 682, 1234, 413, 1190, 1284, 1285, 796], 758)
-    femmesh.addVolume([102, 871, 488, 297, 977, 1246, 1279, 406, 1286, 1125], 759)
-    femmesh.addVolume([488, 870, 297, 164, 1124, 1123, 1125, 589, 1146, 1252], 760)
-    femmesh.addVolume([297, 39, 871, 488, 398, 1287, 1286, 1125, 1288, 1246], 761)
-    femmesh.addVolume([231, 492, 683, 874, 613, 1289, 1271, 995, 1290, 1088], 762)
-    femmesh.addVolume([874, 42, 301, 683, 1189, 419, 1086, 1088, 800, 1089], 763)
-    femmesh.addVolume([499, 882, 240, 691, 1291, 1038, 656, 1292, 1274, 1293], 764)
-    femmesh.addVolume([500, 50, 308, 881, 1295, 453, 1294, 1296, 1297, 1298], 765)
-    femmesh.addVolume([879, 111, 306, 497, 1022, 451, 1299, 1300, 1301, 1302], 766)
-    femmesh.addVolume([882, 176, 691, 499, 1275, 844, 1274, 1291, 649, 1292], 767)
-    femmesh.addVolume([237, 498, 689, 879, 643, 1304, 1303, 1023, 1305, 1267], 768)
-    femmesh.addVolume([471, 241, 853, 662, 508, 891, 1306, 1307, 1308, 1309], 769)
-    femmesh.addVolume([883, 501, 240, 692, 1266, 658, 1040, 1262, 1264, 1310], 770)
-    femmesh.addVolume([876, 233, 303, 494, 1005, 1312, 1311, 1313, 623, 1314], 771)
-    femmesh.addVolume([488, 39, 871, 680, 1288, 1287, 1246, 1247, 785, 1245], 772)
-    femmesh.addVolume([164, 297, 488, 679, 1252, 1125, 589, 784, 1315, 1316], 773)
-    femmesh.addVolume([298, 872, 229, 681, 1317, 985, 1258, 1260, 1282, 1259], 774)
-    femmesh.addVolume([489, 871, 229, 681, 1094, 983, 601, 1097, 1098, 1259], 775)
-    femmesh.addVolume([228, 489, 680, 871, 598, 1318, 1244, 980, 1094, 1245], 776)
-    femmesh.addVolume([299, 40, 871, 680, 403, 1095, 1319, 1320, 786, 1245], 777)
-    femmesh.addVolume([493, 43, 875, 684, 1323, 1322, 1321, 1324, 805, 1325], 778)
-    femmesh.addVolume([688, 306, 497, 48, 1327, 1302, 1326, 826, 443, 1328], 779)
-    femmesh.addVolume([497, 879, 48, 306, 1300, 1268, 1328, 1302, 1299, 443], 780)
-    femmesh.addVolume([308, 50, 500, 690, 453, 1295, 1294, 1329, 836, 1330], 781)
-    femmesh.addVolume([492, 874, 43, 683, 1290, 1087, 1331, 1289, 1088, 801], 782)
-    femmesh.addVolume([163, 486, 870, 678, 580, 1152, 1104, 779, 1155, 1101], 783)
-    femmesh.addVolume([490, 872, 230, 681, 1280, 988, 606, 1281, 1282, 1332], 784)
-    femmesh.addVolume([299, 871, 39, 680, 1319, 1287, 404, 1320, 1245, 785], 785)
-    femmesh.addVolume([488, 297, 39, 679, 1125, 398, 1288, 1316, 1315, 781], 786)
-    femmesh.addVolume([491, 230, 300, 682, 608, 1235, 1234, 1284, 1333, 1285], 787)
-    femmesh.addVolume([494, 233, 303, 685, 623, 1312, 1314, 1334, 1335, 1336], 788)
-    femmesh.addVolume([684, 43, 875, 302, 805, 1322, 1325, 1337, 424, 1338], 789)
-    femmesh.addVolume([500, 239, 309, 881, 653, 1340, 1339, 1296, 1033, 1341], 790)
-    femmesh.addVolume([489, 871, 40, 680, 1094, 1095, 1096, 1318, 1245, 786], 791)
-    femmesh.addVolume([872, 41, 681, 298, 1342, 791, 1282, 1317, 408, 1260], 792)
-    femmesh.addVolume([871, 298, 681, 40, 1261, 1260, 1098, 1095, 409, 790], 793)
-    femmesh.addVolume([684, 107, 875, 493, 1343, 996, 1325, 1324, 1344, 1321], 794)
-    femmesh.addVolume([875, 107, 684, 302, 996, 1343, 1325, 1338, 431, 1337], 795)
-    femmesh.addVolume([497, 879, 689, 48, 1300, 1267, 1345, 1328, 1268, 830], 796)
-    femmesh.addVolume([691, 882, 114, 309, 1274, 1031, 1346, 1276, 1278, 466], 797)
-    femmesh.addVolume([692, 114, 883, 310, 1347, 1037, 1262, 1273, 467, 1272], 798)
-    femmesh.addVolume([853, 662, 241, 280, 1309, 1308, 891, 1348, 1349, 1350], 799)
-    femmesh.addVolume([881, 309, 500, 50, 1341, 1339, 1296, 1297, 459, 1295], 800)
-    femmesh.addVolume([870, 678, 37, 296, 1101, 775, 1153, 1099, 1102, 394], 801)
-    femmesh.addVolume([677, 100, 868, 486, 1151, 961, 1090, 1231, 1351, 1139], 802)
-    femmesh.addVolume([237, 879, 689, 497, 1023, 1267, 1303, 641, 1300, 1345], 803)
-    femmesh.addVolume([303, 494, 685, 1045, 1314, 1334, 1336, 1352, 1353, 1354], 804)
-    femmesh.addVolume([494, 303, 876, 1045, 1314, 1311, 1313, 1353, 1352, 1355], 805)
-    femmesh.addVolume([173, 687, 496, 1046, 828, 1060, 630, 1356, 1357, 1358], 806)
-    femmesh.addVolume([236, 880, 497, 1046, 1020, 1359, 638, 1360, 1361, 1362], 807)
-    femmesh.addVolume([677, 295, 100, 37, 1093, 396, 1151, 771, 388, 395], 808)
-    femmesh.addVolume([861, 29, 479, 92, 1198, 1084, 1175, 927, 355, 1250], 809)
-    femmesh.addVolume([32, 290, 862, 158, 369, 1364, 1363, 752, 1225, 1222], 810)
-    femmesh.addVolume([288, 29, 861, 92, 354, 1198, 1218, 357, 355, 927], 811)
-    femmesh.addVolume([486, 677, 37, 163, 1231, 771, 1154, 580, 778, 777], 812)
-    femmesh.addVolume([28, 668, 476, 91, 726, 1170, 1078, 350, 1227, 1228], 813)
-    femmesh.addVolume([478, 670, 93, 156, 1206, 1214, 1215, 545, 743, 1365], 814)
-    femmesh.addVolume([476, 154, 669, 217, 535, 734, 1077, 541, 542, 1159], 815)
-    femmesh.addVolume([665, 283, 24, 87, 1061, 329, 710, 1240, 332, 330], 816)
-    femmesh.addVolume([291, 672, 32, 158, 1115, 746, 363, 1221, 753, 752], 817)
-    femmesh.addVolume([664, 282, 22, 85, 1120, 320, 701, 1122, 322, 321], 818)
-    femmesh.addVolume([858, 477, 152, 26, 1133, 529, 1366, 1132, 1081, 722], 819)
-    femmesh.addVolume([222, 864, 290, 159, 948, 1158, 1367, 567, 1149, 1156], 820)
-    femmesh.addVolume([479, 669, 154, 217, 1083, 734, 539, 543, 1159, 542], 821)
-    femmesh.addVolume([854, 472, 211, 85, 1209, 513, 895, 893, 1243, 894], 822)
-    femmesh.addVolume([666, 284, 25, 214, 1162, 334, 715, 1165, 1164, 1368], 823)
-    femmesh.addVolume([283, 474, 25, 214, 1062, 1064, 328, 1184, 526, 1368], 824)
-    femmesh.addVolume([475, 666, 151, 214, 1161, 719, 524, 528, 1165, 527], 825)
-    femmesh.addVolume([470, 22, 661, 85, 1369, 695, 1203, 1204, 321, 1205], 826)
-    femmesh.addVolume([161, 484, 867, 35, 570, 1254, 1370, 767, 1182, 1185], 827)
-    femmesh.addVolume([482, 157, 863, 31, 554, 1371, 1199, 1118, 747, 1220], 828)
-    femmesh.addVolume([157, 480, 863, 31, 550, 1197, 1371, 747, 1239, 1220], 829)
-    femmesh.addVolume([217, 286, 476, 91, 1160, 1080, 541, 924, 351, 1228], 830)
-    femmesh.addVolume([857, 475, 26, 89, 1177, 1216, 1217, 906, 1372, 340], 831)
-    femmesh.addVolume([858, 26, 475, 89, 1132, 1216, 1373, 912, 340, 1372], 832)
-    femmesh.addVolume([670, 288, 93, 30, 1219, 361, 1214, 736, 353, 360], 833)
-    femmesh.addVolume([34, 674, 484, 160, 760, 1181, 1224, 762, 763, 569], 834)
-    femmesh.addVolume([859, 287, 27, 90, 1212, 344, 1213, 917, 347, 345], 835)
-    femmesh.addVolume([486, 225, 676, 162, 583, 1134, 1140, 579, 582, 773], 836)
-    femmesh.addVolume([303, 876, 107, 233, 1311, 1002, 432, 1312, 1005, 1004], 837)
-    femmesh.addVolume([292, 34, 484, 160, 373, 1224, 1256, 1251, 762, 569], 838)
-    femmesh.addVolume([295, 36, 868, 99, 389, 1091, 1092, 392, 390, 962], 839)
-    femmesh.addVolume([860, 286, 217, 91, 1180, 1160, 925, 922, 351, 924], 840)
-    femmesh.addVolume([856, 214, 283, 88, 908, 1184, 1113, 901, 909, 336], 841)
-    femmesh.addVolume([857, 284, 214, 88, 1178, 1164, 910, 907, 337, 909], 842)
-    femmesh.addVolume([284, 857, 26, 89, 1178, 1217, 333, 341, 906, 340], 843)
-    femmesh.addVolume([858, 285, 26, 89, 1131, 339, 1132, 912, 342, 340], 844)
-    femmesh.addVolume([476, 859, 217, 91, 1211, 923, 541, 1228, 916, 924], 845)
-    femmesh.addVolume([22, 472, 664, 85, 1374, 1208, 701, 321, 1243, 1122], 846)
-    femmesh.addVolume([279, 661, 22, 85, 1202, 695, 314, 313, 1205, 321], 847)
-    femmesh.addVolume([859, 27, 476, 90, 1213, 1172, 1211, 917, 345, 1375], 848)
-    femmesh.addVolume([858, 477, 27, 90, 1133, 1072, 1238, 911, 1376, 345], 849)
-    femmesh.addVolume([285, 858, 27, 90, 1131, 1238, 338, 346, 911, 345], 850)
-    femmesh.addVolume([100, 868, 486, 226, 961, 1139, 1351, 969, 968, 586], 851)
-    femmesh.addVolume([213, 474, 665, 87, 523, 1063, 1377, 904, 1114, 1240], 852)
-    femmesh.addVolume([855, 213, 473, 87, 903, 521, 1108, 896, 904, 1107], 853)
-    femmesh.addVolume([856, 474, 213, 87, 1112, 523, 905, 902, 1114, 904], 854)
-    femmesh.addVolume([470, 852, 211, 85, 1249, 887, 504, 1204, 886, 894], 855)
-    femmesh.addVolume([479, 29, 286, 92, 1084, 348, 1085, 1250, 355, 356], 856)
-    femmesh.addVolume([290, 864, 221, 158, 1158, 945, 1378, 1225, 1226, 562], 857)
-    femmesh.addVolume([493, 44, 303, 170, 1380, 429, 1379, 615, 812, 1381], 858)
-    femmesh.addVolume([486, 870, 226, 163, 1152, 970, 586, 580, 1104, 587], 859)
-    femmesh.addVolume([690, 500, 176, 50, 1330, 645, 843, 836, 1295, 842], 860)
-    femmesh.addVolume([487, 226, 870, 163, 588, 970, 1103, 584, 587, 1104], 861)
-    femmesh.addVolume([870, 488, 227, 164, 1124, 593, 975, 1146, 589, 592], 862)
-    femmesh.addVolume([875, 493, 169, 43, 1321, 614, 1382, 1322, 1323, 807], 863)
-    femmesh.addVolume([309, 691, 176, 50, 1276, 844, 1277, 459, 840, 842], 864)
-    femmesh.addVolume([493, 303, 233, 170, 1379, 1312, 621, 615, 1381, 622], 865)
-    femmesh.addVolume([225, 485, 676, 162, 581, 1137, 1134, 582, 575, 773], 866)
-    femmesh.addVolume([688, 497, 174, 48, 1326, 635, 833, 826, 1328, 832], 867)
-    femmesh.addVolume([227, 487, 870, 164, 591, 1103, 975, 592, 585, 1146], 868)
-    femmesh.addVolume([310, 692, 114, 51, 1273, 1347, 467, 464, 845, 465], 869)
-    femmesh.addVolume([684, 302, 107, 44, 1337, 431, 1343, 806, 423, 430], 870)
-    femmesh.addVolume([689, 174, 497, 48, 834, 635, 1345, 830, 832, 1328], 871)
-    femmesh.addVolume([309, 114, 691, 51, 466, 1346, 1276, 458, 465, 841], 872)
-    femmesh.addVolume([309, 176, 500, 50, 1277, 645, 1339, 459, 842, 1295], 873)
-    femmesh.addVolume([24, 665, 473, 150, 710, 1384, 1383, 712, 714, 515], 874)
-    femmesh.addVolume([482, 220, 863, 157, 558, 940, 1199, 554, 557, 1371], 875)
-    femmesh.addVolume([663, 281, 87, 24, 1068, 331, 1066, 706, 323, 330], 876)
-    femmesh.addVolume([882, 309, 176, 239, 1278, 1277, 1275, 1035, 1340, 652], 877)
-    femmesh.addVolume([153, 27, 667, 477, 727, 721, 728, 530, 1072, 1071], 878)
-    femmesh.addVolume([28, 668, 91, 287, 726, 1227, 350, 343, 1169, 352], 879)
-    femmesh.addVolume([95, 862, 32, 290, 936, 1363, 370, 371, 1364, 369], 880)
-    femmesh.addVolume([663, 24, 87, 473, 706, 330, 1066, 1106, 1383, 1107], 881)
-    femmesh.addVolume([161, 867, 224, 485, 1370, 960, 577, 574, 1136, 578], 882)
-    femmesh.addVolume([93, 478, 219, 861, 1215, 551, 934, 926, 1207, 933], 883)
-    femmesh.addVolume([155, 29, 669, 479, 737, 731, 738, 540, 1084, 1083], 884)
-    femmesh.addVolume([152, 26, 477, 667, 722, 1081, 529, 724, 720, 1071], 885)
-    femmesh.addVolume([92, 479, 218, 860, 1250, 548, 929, 921, 1179, 928], 886)
-    femmesh.addVolume([161, 484, 35, 674, 570, 1182, 767, 768, 1181, 761], 887)
-    femmesh.addVolume([102, 488, 228, 869, 1279, 596, 979, 971, 1233, 978], 888)
-    femmesh.addVolume([31, 863, 94, 289, 1220, 931, 365, 358, 1145, 366], 889)
-    femmesh.addVolume([32, 862, 95, 291, 1363, 936, 370, 363, 1168, 372], 890)
-    femmesh.addVolume([104, 300, 230, 872, 417, 1235, 989, 981, 1385, 988], 891)
-    femmesh.addVolume([162, 677, 36, 486, 774, 770, 772, 579, 1231, 1229], 892)
-    femmesh.addVolume([100, 870, 37, 296, 967, 1153, 395, 397, 1099, 394], 893)
-    femmesh.addVolume([213, 87, 665, 473, 904, 1240, 1377, 521, 1107, 1384], 894)
-    femmesh.addVolume([113, 309, 239, 881, 462, 1340, 1034, 1026, 1341, 1033], 895)
-    femmesh.addVolume([486, 37, 100, 870, 1154, 395, 1351, 1152, 1153, 967], 896)
-    femmesh.addVolume([99, 676, 225, 867, 1223, 1134, 964, 956, 1135, 963], 897)
-    femmesh.addVolume([227, 870, 101, 488, 975, 966, 974, 593, 1124, 1126], 898)
-    femmesh.addVolume([290, 158, 221, 862, 1225, 562, 1378, 1364, 1222, 943], 899)
-    femmesh.addVolume([162, 36, 676, 486, 772, 766, 773, 579, 1229, 1140], 900)
-    femmesh.addVolume([158, 32, 290, 673, 752, 369, 1225, 754, 750, 1157], 901)
-    femmesh.addVolume([35, 867, 98, 293, 1185, 957, 385, 378, 1255, 386], 902)
-    femmesh.addVolume([152, 475, 26, 666, 525, 1216, 722, 723, 1161, 716], 903)
-    femmesh.addVolume([149, 23, 664, 854, 707, 702, 709, 1210, 1241, 1119], 904)
-    femmesh.addVolume([27, 153, 668, 476, 727, 729, 725, 1172, 534, 1170], 905)
-    femmesh.addVolume([28, 476, 154, 669, 1078, 535, 732, 730, 1077, 734], 906)
-    femmesh.addVolume([225, 676, 99, 868, 1134, 1223, 964, 965, 1138, 962], 907)
-    femmesh.addVolume([161, 35, 867, 485, 767, 1185, 1370, 574, 1230, 1136], 908)
-    femmesh.addVolume([152, 858, 215, 477, 1366, 915, 532, 529, 1133, 533], 909)
-    femmesh.addVolume([94, 291, 220, 863, 367, 1166, 939, 931, 1200, 940], 910)
-    femmesh.addVolume([32, 158, 862, 291, 752, 1222, 1363, 363, 1221, 1168], 911)
-    femmesh.addVolume([219, 478, 93, 863, 551, 1215, 934, 935, 1386, 932], 912)
-    femmesh.addVolume([154, 476, 28, 668, 535, 1078, 732, 733, 1170, 726], 913)
-    femmesh.addVolume([215, 858, 152, 475, 915, 1366, 532, 531, 1373, 525], 914)
-    femmesh.addVolume([218, 670, 155, 479, 1173, 739, 547, 548, 1176, 540], 915)
-    femmesh.addVolume([858, 26, 152, 475, 1132, 722, 1366, 1373, 1216, 525], 916)
-    femmesh.addVolume([212, 854, 149, 472, 898, 1210, 517, 516, 1209, 511], 917)
-    femmesh.addVolume([151, 25, 665, 474, 717, 711, 718, 520, 1064, 1063], 918)
-    femmesh.addVolume([213, 665, 150, 473, 1377, 714, 522, 521, 1384, 515], 919)
-    femmesh.addVolume([148, 22, 661, 470, 703, 695, 696, 505, 1369, 1203], 920)
-    femmesh.addVolume([148, 664, 22, 472, 704, 701, 703, 510, 1208, 1374], 921)
-    femmesh.addVolume([473, 24, 87, 665, 1383, 330, 1107, 1384, 710, 1240], 922)
-    femmesh.addVolume([155, 670, 218, 478, 739, 1173, 547, 544, 1206, 546], 923)
-    femmesh.addVolume([29, 155, 670, 479, 737, 739, 735, 1084, 540, 1176], 924)
-    femmesh.addVolume([39, 871, 102, 297, 1287, 977, 405, 398, 1286, 406], 925)
-    femmesh.addVolume([97, 223, 484, 866, 954, 573, 1128, 952, 955, 1129], 926)
-    femmesh.addVolume([485, 161, 35, 676, 574, 767, 1230, 1137, 769, 765], 927)
-    femmesh.addVolume([40, 489, 166, 681, 1096, 595, 792, 790, 1097, 794], 928)
-    femmesh.addVolume([222, 159, 481, 864, 567, 560, 566, 948, 1149, 1148], 929)
-    femmesh.addVolume([150, 665, 213, 474, 714, 1377, 522, 519, 1063, 523], 930)
-    femmesh.addVolume([673, 159, 33, 290, 758, 757, 751, 1157, 1156, 368], 931)
-    femmesh.addVolume([31, 157, 672, 482, 747, 749, 745, 1118, 554, 1116], 932)
-    femmesh.addVolume([157, 31, 671, 480, 747, 741, 748, 550, 1239, 1195], 933)
-    femmesh.addVolume([855, 212, 149, 473, 900, 517, 1242, 1108, 518, 514], 934)
-    femmesh.addVolume([219, 480, 156, 863, 553, 549, 552, 935, 1197, 1196], 935)
-    femmesh.addVolume([102, 871, 39, 299, 977, 1287, 405, 407, 1319, 404], 936)
-    femmesh.addVolume([165, 680, 228, 489, 789, 1244, 597, 594, 1318, 598], 937)
-    femmesh.addVolume([89, 475, 215, 857, 1372, 531, 914, 906, 1177, 913], 938)
-    femmesh.addVolume([156, 671, 30, 863, 744, 740, 742, 1196, 1144, 1143], 939)
-    femmesh.addVolume([222, 290, 96, 865, 1367, 376, 949, 950, 1194, 947], 940)
-    femmesh.addVolume([221, 158, 482, 862, 562, 555, 563, 943, 1222, 1167], 941)
-    femmesh.addVolume([478, 156, 93, 863, 545, 1365, 1215, 1386, 1196, 932], 942)
-    femmesh.addVolume([98, 867, 35, 294, 957, 1185, 385, 387, 1187, 384], 943)
-    femmesh.addVolume([159, 675, 33, 290, 759, 755, 757, 1156, 1193, 368], 944)
-    femmesh.addVolume([157, 220, 863, 480, 557, 940, 1371, 550, 556, 1197], 945)
-    femmesh.addVolume([224, 867, 161, 484, 960, 1370, 577, 576, 1254, 570], 946)
-    femmesh.addVolume([223, 160, 483, 865, 572, 565, 571, 953, 1111, 1110], 947)
-    femmesh.addVolume([159, 222, 483, 865, 567, 568, 564, 1141, 950, 1110], 948)
-    femmesh.addVolume([97, 484, 34, 293, 1128, 1224, 380, 382, 1127, 379], 949)
-    femmesh.addVolume([160, 34, 675, 292, 762, 756, 764, 1251, 373, 1073], 950)
-    femmesh.addVolume([676, 36, 99, 868, 766, 390, 1223, 1138, 1091, 962], 951)
-    femmesh.addVolume([99, 36, 676, 294, 390, 766, 1223, 391, 383, 1186], 952)
-    femmesh.addVolume([303, 233, 107, 493, 1312, 1004, 432, 1379, 621, 1344], 953)
-    femmesh.addVolume([229, 298, 103, 872, 1258, 411, 984, 985, 1317, 982], 954)
-    femmesh.addVolume([218, 479, 92, 861, 548, 1250, 929, 930, 1175, 927], 955)
-    femmesh.addVolume([28, 91, 476, 286, 350, 1228, 1078, 349, 351, 1080], 956)
-    femmesh.addVolume([219, 156, 478, 863, 552, 545, 551, 935, 1196, 1386], 957)
-    femmesh.addVolume([220, 291, 94, 862, 1166, 367, 939, 938, 1168, 937], 958)
-    femmesh.addVolume([477, 216, 90, 858, 538, 919, 1376, 1133, 918, 911], 959)
-    femmesh.addVolume([476, 90, 216, 859, 1375, 919, 536, 1211, 917, 920], 960)
-    femmesh.addVolume([855, 149, 23, 663, 1242, 707, 1082, 1065, 708, 705], 961)
-    femmesh.addVolume([300, 42, 105, 491, 413, 420, 421, 1234, 1190, 1283], 962)
-    femmesh.addVolume([23, 86, 855, 281, 325, 897, 1082, 324, 326, 1067], 963)
-    femmesh.addVolume([86, 23, 854, 282, 325, 1241, 892, 327, 319, 1121], 964)
-    femmesh.addVolume([875, 43, 106, 302, 1322, 425, 997, 1338, 424, 427], 965)
-    femmesh.addVolume([105, 491, 231, 873, 1283, 611, 994, 986, 1237, 993], 966)
-    femmesh.addVolume([34, 484, 97, 292, 1224, 1128, 380, 373, 1256, 381], 967)
-    femmesh.addVolume([160, 223, 484, 865, 572, 573, 569, 1111, 953, 1257], 968)
-    femmesh.addVolume([33, 865, 96, 290, 1075, 947, 375, 368, 1194, 376], 969)
-    femmesh.addVolume([96, 865, 33, 292, 947, 1075, 375, 377, 1074, 374], 970)
-    femmesh.addVolume([301, 43, 106, 874, 418, 425, 426, 1086, 1087, 991], 971)
-    femmesh.addVolume([94, 863, 31, 291, 931, 1220, 365, 367, 1200, 364], 972)
-    femmesh.addVolume([158, 221, 481, 864, 562, 561, 559, 1226, 945, 1148], 973)
-    femmesh.addVolume([222, 159, 290, 865, 567, 1156, 1367, 950, 1141, 1194], 974)
-    femmesh.addVolume([95, 290, 221, 862, 371, 1378, 944, 936, 1364, 943], 975)
-    femmesh.addVolume([221, 290, 95, 864, 1378, 371, 944, 945, 1158, 942], 976)
-    femmesh.addVolume([96, 290, 222, 864, 376, 1367, 949, 941, 1158, 948], 977)
-    femmesh.addVolume([97, 484, 223, 865, 1128, 573, 954, 946, 1257, 953], 978)
-    femmesh.addVolume([224, 293, 98, 867, 1253, 386, 959, 960, 1255, 957], 979)
-    femmesh.addVolume([98, 293, 224, 866, 386, 1253, 959, 951, 1130, 958], 980)
-    femmesh.addVolume([104, 872, 41, 300, 981, 1342, 415, 417, 1385, 414], 981)
-    femmesh.addVolume([41, 872, 230, 300, 1342, 988, 1387, 414, 1385, 1235], 982)
-    femmesh.addVolume([100, 226, 486, 870, 969, 586, 1351, 967, 970, 1152], 983)
-    femmesh.addVolume([38, 164, 297, 678, 782, 1252, 399, 776, 783, 1192], 984)
-    femmesh.addVolume([113, 882, 239, 309, 1032, 1035, 1034, 462, 1278, 1340], 985)
-    femmesh.addVolume([114, 240, 882, 691, 1039, 1038, 1031, 1346, 1293, 1274], 986)
-    femmesh.addVolume([106, 492, 232, 874, 1388, 616, 999, 991, 1290, 998], 987)
-    femmesh.addVolume([168, 491, 42, 682, 605, 1190, 802, 803, 1284, 796], 988)
-    femmesh.addVolume([115, 241, 883, 501, 1041, 1042, 1036, 1265, 660, 1266], 989)
-    femmesh.addVolume([42, 301, 105, 874, 419, 422, 420, 1189, 1086, 992], 990)
-    femmesh.addVolume([228, 488, 102, 871, 596, 1279, 979, 980, 1246, 977], 991)
-    femmesh.addVolume([104, 873, 230, 300, 987, 990, 989, 417, 1236, 1235], 992)
-    femmesh.addVolume([168, 683, 231, 492, 804, 1271, 612, 609, 1289, 613], 993)
-    femmesh.addVolume([486, 163, 37, 678, 580, 777, 1154, 1155, 779, 775], 994)
-    femmesh.addVolume([874, 105, 42, 491, 992, 420, 1189, 1188, 1283, 1190], 995)
-    femmesh.addVolume([237, 497, 111, 879, 641, 1301, 1024, 1023, 1300, 1022], 996)
-    femmesh.addVolume([233, 875, 107, 493, 1003, 996, 1004, 621, 1321, 1344], 997)
-    femmesh.addVolume([874, 43, 106, 492, 1087, 425, 991, 1290, 1331, 1388], 998)
-    femmesh.addVolume([50, 881, 113, 308, 1297, 1026, 460, 453, 1298, 461], 999)
-    femmesh.addVolume([176, 239, 309, 500, 652, 1340, 1277, 645, 653, 1339], 1000)
-    femmesh.addVolume([241, 115, 853, 280, 1041, 890, 891, 1350, 317, 1348], 1001)
-    femmesh.addVolume([111, 497, 237, 880, 1301, 641, 1024, 1016, 1359, 1025], 1002)
-    femmesh.addVolume([178, 241, 471, 662, 659, 508, 509, 700, 1308, 1307], 1003)
-    femmesh.addVolume([882, 239, 176, 499, 1035, 652, 1275, 1291, 651, 649], 1004)
-    femmesh.addVolume([875, 106, 43, 492, 997, 425, 1322, 1389, 1388, 1331], 1005)
-    femmesh.addVolume([174, 689, 237, 498, 834, 1303, 642, 639, 1304, 643], 1006)
-    femmesh.addVolume([177, 240, 501, 692, 657, 658, 654, 849, 1310, 1264], 1007)
-    femmesh.addVolume([227, 488, 101, 869, 593, 1126, 974, 973, 1233, 972], 1008)
-    femmesh.addVolume([231, 491, 105, 874, 611, 1283, 994, 995, 1188, 992], 1009)
-    femmesh.addVolume([232, 875, 169, 492, 1000, 1382, 617, 616, 1389, 610], 1010)
-    femmesh.addVolume([169, 875, 232, 493, 1382, 1000, 617, 614, 1321, 618], 1011)
-    femmesh.addVolume([232, 492, 106, 875, 616, 1388, 999, 1000, 1389, 997], 1012)
-    femmesh.addVolume([682, 230, 167, 491, 1333, 607, 799, 1284, 608, 604], 1013)
-    femmesh.addVolume([240, 177, 499, 691, 657, 650, 656, 1293, 848, 1292], 1014)
-    femmesh.addVolume([237, 689, 174, 497, 1303, 834, 642, 641, 1345, 635], 1015)
-    femmesh.addVolume([230, 41, 681, 872, 1387, 791, 1332, 988, 1342, 1282], 1016)
-    femmesh.addVolume([166, 489, 40, 680, 595, 1096, 792, 793, 1318, 786], 1017)
-    femmesh.addVolume([229, 681, 166, 489, 1259, 794, 602, 601, 1097, 595], 1018)
-    femmesh.addVolume([231, 683, 168, 491, 1271, 804, 612, 611, 1191, 605], 1019)
-    femmesh.addVolume([297, 101, 38, 678, 402, 400, 399, 1192, 1100, 776], 1020)
-    femmesh.addVolume([296, 38, 101, 678, 393, 400, 401, 1102, 776, 1100], 1021)
-    femmesh.addVolume([230, 167, 490, 681, 607, 600, 606, 1332, 798, 1281], 1022)
-    femmesh.addVolume([42, 491, 168, 683, 1190, 605, 802, 800, 1191, 804], 1023)
-    femmesh.addVolume([43, 169, 492, 683, 807, 610, 1331, 801, 808, 1289], 1024)
-    femmesh.addVolume([170, 233, 494, 685, 622, 623, 619, 814, 1335, 1334], 1025)
-    femmesh.addVolume([170, 303, 233, 685, 1381, 1312, 622, 814, 1336, 1335], 1026)
-    femmesh.addVolume([170, 44, 303, 685, 812, 429, 1381, 814, 810, 1336], 1027)
-    femmesh.addVolume([107, 493, 44, 303, 1344, 1380, 430, 432, 1379, 429], 1028)
-    femmesh.addVolume([493, 169, 43, 684, 614, 807, 1323, 1324, 809, 805], 1029)
-    femmesh.addVolume([44, 170, 493, 684, 812, 615, 1380, 806, 813, 1324], 1030)
-    femmesh.addVolume([113, 881, 50, 309, 1026, 1297, 460, 462, 1341, 459], 1031)
-    femmesh.addVolume([114, 240, 692, 883, 1039, 1310, 1347, 1037, 1040, 1262], 1032)
-    femmesh.addVolume([875, 43, 169, 492, 1322, 807, 1382, 1389, 1331, 610], 1033)
-    femmesh.addVolume([228, 680, 165, 488, 1244, 789, 597, 596, 1247, 590], 1034)
-    femmesh.addVolume([164, 38, 297, 679, 782, 399, 1252, 784, 780, 1315], 1035)
-    femmesh.addVolume([39, 488, 165, 680, 1288, 590, 787, 785, 1247, 789], 1036)
-    femmesh.addVolume([41, 872, 104, 298, 1342, 981, 415, 408, 1317, 416], 1037)
-    femmesh.addVolume([41, 300, 230, 682, 414, 1235, 1387, 795, 1285, 1333], 1038)
-    femmesh.addVolume([40, 871, 103, 299, 1095, 976, 410, 403, 1319, 412], 1039)
-    femmesh.addVolume([684, 44, 107, 493, 806, 430, 1343, 1324, 1380, 1344], 1040)
-    femmesh.addVolume([103, 871, 40, 298, 976, 1095, 410, 411, 1261, 409], 1041)
-    femmesh.addVolume([103, 298, 229, 871, 411, 1258, 984, 976, 1261, 983], 1042)
-    femmesh.addVolume([111, 879, 48, 307, 1022, 1268, 450, 452, 1270, 449], 1043)
-    femmesh.addVolume([52, 692, 115, 310, 846, 1263, 468, 463, 1273, 469], 1044)
-    femmesh.addVolume([39, 679, 165, 488, 781, 788, 787, 1288, 1316, 590], 1045)
-    femmesh.addVolume([24, 150, 473, 663, 712, 515, 1383, 706, 713, 1106], 1046)
-    femmesh.addVolume([677, 37, 100, 486, 771, 395, 1151, 1231, 1154, 1351], 1047)
-    femmesh.addVolume([229, 490, 166, 681, 603, 599, 602, 1259, 1281, 794], 1048)
-    femmesh.addVolume([89, 858, 215, 475, 912, 915, 914, 1372, 1373, 531], 1049)
-    femmesh.addVolume([93, 863, 30, 289, 932, 1143, 360, 362, 1145, 359], 1050)
-    femmesh.addVolume([111, 306, 48, 879, 451, 443, 450, 1022, 1299, 1268], 1051)
-    femmesh.addVolume([173, 47, 687, 1046, 827, 821, 828, 1356, 1390, 1357], 1052)
-    femmesh.addVolume([173, 236, 497, 1046, 637, 638, 634, 1356, 1360, 1362], 1053)
-    femmesh.addVolume([236, 173, 496, 1046, 637, 630, 636, 1360, 1356, 1358], 1054)
-    femmesh.addVolume([172, 496, 687, 1045, 629, 1060, 824, 1391, 1059, 1052], 1055)
-    femmesh.addVolume([235, 878, 496, 1045, 1015, 1058, 633, 1392, 1056, 1059], 1056)
-    femmesh.addVolume([305, 46, 687, 1045, 439, 820, 1050, 1051, 1393, 1052], 1057)
-    femmesh.addVolume([878, 109, 305, 1045, 1012, 442, 1055, 1056, 1394, 1051], 1058)
-    femmesh.addVolume([212, 854, 23, 149, 898, 1241, 1395, 517, 1210, 707], 1059)
-    femmesh.addVolume([474, 151, 25, 214, 520, 717, 1064, 526, 527, 1368], 1060)
-    femmesh.addVolume([25, 151, 666, 214, 717, 719, 715, 1368, 527, 1165], 1061)
-    femmesh.addVolume([148, 22, 85, 472, 703, 321, 1396, 510, 1374, 1243], 1062)
-    femmesh.addVolume([167, 230, 41, 681, 607, 1387, 797, 798, 1332, 791], 1063)
-    femmesh.addVolume([211, 85, 148, 470, 894, 1396, 512, 504, 1204, 505], 1064)
-    femmesh.addVolume([148, 470, 85, 22, 505, 1204, 1396, 703, 1369, 321], 1065)
-    femmesh.addVolume([148, 85, 211, 472, 1396, 894, 512, 510, 1243, 513], 1066)
-    femmesh.addVolume([283, 214, 25, 88, 1184, 1368, 328, 336, 909, 335], 1067)
-    femmesh.addVolume([214, 284, 25, 88, 1164, 334, 1368, 909, 337, 335], 1068)
-    femmesh.addVolume([153, 477, 216, 27, 530, 538, 537, 727, 1072, 1397], 1069)
-    femmesh.addVolume([212, 23, 86, 855, 1395, 325, 899, 900, 1082, 897], 1070)
-    femmesh.addVolume([212, 149, 23, 855, 517, 707, 1395, 900, 1242, 1082], 1071)
-    femmesh.addVolume([153, 27, 216, 476, 727, 1397, 537, 534, 1172, 536], 1072)
-    femmesh.addVolume([27, 477, 216, 90, 1072, 538, 1397, 345, 1376, 919], 1073)
-    femmesh.addVolume([27, 90, 216, 476, 345, 919, 1397, 1172, 1375, 536], 1074)
-    femmesh.addVolume([86, 23, 212, 854, 325, 1395, 899, 892, 1241, 898], 1075)
-    femmesh.addVolume([670, 30, 93, 156, 736, 360, 1214, 743, 742, 1365], 1076)
-    femmesh.addVolume([41, 230, 167, 682, 1387, 607, 797, 795, 1333, 799], 1077)
-    femmesh.addVolume([177, 114, 51, 691, 1398, 465, 847, 848, 1346, 841], 1078)
-    femmesh.addVolume([177, 240, 114, 691, 657, 1039, 1398, 848, 1293, 1346], 1079)
-    femmesh.addVolume([156, 30, 93, 863, 742, 360, 1365, 1196, 1143, 932], 1080)
-    femmesh.addVolume([177, 692, 114, 240, 849, 1347, 1398, 657, 1310, 1039], 1081)
-    femmesh.addVolume([51, 114, 177, 692, 465, 1398, 847, 845, 1347, 849], 1082)
-    femmesh.addVolume([306, 110, 47, 1046, 447, 445, 444, 1399, 1400, 1390], 1083)
-    femmesh.addVolume([236, 110, 880, 1046, 1019, 1017, 1020, 1360, 1400, 1361], 1084)
-    femmesh.addVolume([234, 494, 876, 1045, 626, 1313, 1008, 1401, 1353, 1355], 1085)
-    femmesh.addVolume([494, 171, 685, 1045, 620, 818, 1334, 1353, 1402, 1354], 1086)
-    femmesh.addVolume([303, 685, 45, 1045, 1336, 811, 428, 1352, 1354, 1403], 1087)
-    femmesh.addVolume([303, 108, 876, 1045, 436, 1001, 1311, 1352, 1404, 1355], 1088)
-    femmesh.addVolume([9, 661, 279, 470, 1406, 1202, 1405, 1407, 1203, 1201], 1089)
-    femmesh.addVolume([470, 279, 9, 852, 1201, 1405, 1407, 1249, 1248, 1408], 1090)
-    femmesh.addVolume([662, 853, 274, 280, 1309, 1410, 1409, 1349, 1348, 1411], 1091)
-    femmesh.addVolume([471, 853, 274, 662, 1306, 1410, 1412, 1307, 1309, 1409], 1092)
-    femmesh.addVolume([881, 308, 500, 1047, 1298, 1294, 1296, 1413, 1414, 1415], 1093)
-    femmesh.addVolume([500, 308, 690, 1047, 1294, 1329, 1330, 1415, 1414, 1416], 1094)
-    femmesh.addVolume([307, 879, 689, 1047, 1270, 1267, 1269, 1417, 1418, 1419], 1095)
-    femmesh.addVolume([498, 689, 879, 1047, 1304, 1267, 1305, 1420, 1419, 1418], 1096)
-    femmesh.addVolume([172, 687, 46, 1045, 824, 820, 822, 1391, 1052, 1393], 1097)
-    femmesh.addVolume([109, 46, 305, 1045, 440, 439, 442, 1394, 1393, 1051], 1098)
-    femmesh.addVolume([172, 235, 496, 1045, 632, 633, 629, 1391, 1392, 1059], 1099)
-    femmesh.addVolume([235, 109, 878, 1045, 1014, 1012, 1015, 1392, 1394, 1056], 1100)
-    femmesh.addVolume([235, 172, 495, 1045, 632, 625, 631, 1392, 1391, 1421], 1101)
-    femmesh.addVolume([109, 235, 877, 1045, 1014, 1013, 1006, 1394, 1392, 1422], 1102)
-    femmesh.addVolume([109, 304, 46, 1045, 441, 433, 440, 1394, 1423, 1393], 1103)
-    femmesh.addVolume([686, 172, 46, 1045, 823, 822, 816, 1424, 1391, 1393], 1104)
-    femmesh.addVolume([171, 686, 45, 1045, 819, 815, 817, 1402, 1424, 1403], 1105)
-    femmesh.addVolume([108, 45, 304, 1045, 435, 434, 437, 1404, 1403, 1423], 1106)
-    femmesh.addVolume([234, 495, 171, 1045, 628, 624, 627, 1401, 1421, 1402], 1107)
-    femmesh.addVolume([171, 45, 685, 1045, 817, 811, 818, 1402, 1403, 1354], 1108)
-    femmesh.addVolume([234, 171, 494, 1045, 627, 620, 626, 1401, 1402, 1353], 1109)
-    femmesh.addVolume([303, 45, 108, 1045, 428, 435, 436, 1352, 1403, 1404], 1110)
-    femmesh.addVolume([234, 108, 877, 1045, 1009, 1007, 1010, 1401, 1404, 1422], 1111)
-    femmesh.addVolume([108, 234, 876, 1045, 1009, 1008, 1001, 1404, 1401, 1355], 1112)
-    femmesh.addVolume([673, 33, 32, 290, 751, 64, 750, 1157, 368, 369], 1113)
-    femmesh.addVolume([95, 291, 862, 94, 372, 1168, 936, 126, 367, 937], 1114)
-    femmesh.addVolume([279, 1, 2, 9, 312, 5, 311, 1405, 10, 11], 1115)
-    femmesh.addVolume([289, 30, 31, 671, 359, 62, 358, 1142, 740, 741], 1116)
-    femmesh.addVolume([274, 14, 15, 280, 276, 18, 275, 1411, 315, 316], 1117)
-    femmesh.addVolume([294, 35, 36, 676, 384, 67, 383, 1186, 765, 766], 1118)
-    femmesh.addVolume([677, 37, 36, 295, 771, 68, 770, 1093, 388, 389], 1119)
-    femmesh.addVolume([670, 30, 29, 288, 736, 61, 735, 1219, 353, 354], 1120)
-    femmesh.addVolume([291, 31, 32, 672, 364, 63, 363, 1115, 745, 746], 1121)
-    femmesh.addVolume([674, 35, 34, 293, 761, 66, 760, 1183, 378, 379], 1122)
-    femmesh.addVolume([279, 2, 22, 661, 311, 53, 314, 1202, 694, 695], 1123)
-    femmesh.addVolume([677, 486, 162, 163, 1231, 579, 774, 778, 580, 194], 1124)
-    femmesh.addVolume([148, 661, 4, 470, 696, 693, 179, 505, 1203, 503], 1125)
-    femmesh.addVolume([4, 661, 2, 9, 693, 694, 8, 13, 1406, 11], 1126)
-    femmesh.addVolume([4, 9, 3, 470, 13, 12, 7, 503, 1407, 502], 1127)
-    femmesh.addVolume([211, 470, 3, 852, 504, 502, 242, 887, 1249, 885], 1128)
-    femmesh.addVolume([675, 34, 33, 292, 756, 65, 755, 1073, 373, 374], 1129)
-    femmesh.addVolume([91, 287, 859, 90, 352, 1212, 916, 122, 347, 917], 1130)
-    femmesh.addVolume([88, 857, 284, 89, 907, 1178, 337, 120, 906, 341], 1131)
-    femmesh.addVolume([852, 279, 1, 85, 1248, 312, 884, 886, 313, 116], 1132)
-    femmesh.addVolume([86, 282, 854, 85, 327, 1121, 892, 117, 322, 893], 1133)
-    femmesh.addVolume([858, 90, 285, 89, 911, 346, 1131, 912, 121, 342], 1134)
-    femmesh.addVolume([856, 88, 283, 87, 901, 336, 1113, 902, 119, 332], 1135)
-    femmesh.addVolume([99, 868, 295, 100, 962, 1092, 392, 131, 961, 396], 1136)
-    femmesh.addVolume([286, 91, 860, 92, 351, 922, 1180, 356, 123, 921], 1137)
-    femmesh.addVolume([288, 92, 861, 93, 357, 927, 1218, 361, 124, 926], 1138)
-    femmesh.addVolume([94, 289, 863, 93, 366, 1145, 931, 125, 362, 932], 1139)
-    femmesh.addVolume([871, 102, 103, 299, 977, 134, 976, 1319, 407, 412], 1140)
-    femmesh.addVolume([49, 308, 690, 50, 454, 1329, 835, 81, 453, 836], 1141)
-    femmesh.addVolume([304, 686, 45, 46, 1425, 815, 434, 433, 816, 77], 1142)
-    femmesh.addVolume([274, 15, 17, 662, 275, 21, 278, 1409, 697, 698], 1143)
-    femmesh.addVolume([16, 853, 14, 274, 888, 889, 19, 277, 1410, 276], 1144)
-    femmesh.addVolume([688, 47, 306, 48, 825, 444, 1327, 826, 79, 443], 1145)
-    femmesh.addVolume([303, 44, 45, 685, 429, 76, 428, 1336, 810, 811], 1146)
-    femmesh.addVolume([301, 42, 43, 683, 419, 74, 418, 1089, 800, 801], 1147)
-    femmesh.addVolume([487, 164, 163, 678, 585, 195, 584, 1105, 783, 779], 1148)
-    femmesh.addVolume([872, 103, 104, 298, 982, 135, 981, 1317, 411, 416], 1149)
-    femmesh.addVolume([681, 41, 40, 298, 791, 72, 790, 1260, 408, 409], 1150)
-    femmesh.addVolume([684, 44, 43, 302, 806, 75, 805, 1337, 423, 424], 1151)
-    femmesh.addVolume([496, 173, 172, 687, 630, 204, 629, 1060, 828, 824], 1152)
-    femmesh.addVolume([877, 108, 109, 304, 1007, 140, 1006, 1426, 437, 441], 1153)
-    femmesh.addVolume([489, 166, 165, 680, 595, 197, 594, 1318, 793, 789], 1154)
-    femmesh.addVolume([488, 165, 164, 679, 590, 196, 589, 1316, 788, 784], 1155)
-    femmesh.addVolume([692, 51, 310, 52, 845, 464, 1273, 846, 83, 463], 1156)
-    femmesh.addVolume([50, 309, 691, 51, 459, 1276, 840, 82, 458, 841], 1157)
-    femmesh.addVolume([687, 46, 305, 47, 820, 439, 1050, 821, 78, 438], 1158)
-    femmesh.addVolume([689, 48, 307, 49, 830, 449, 1269, 831, 80, 448], 1159)
-    femmesh.addVolume([662, 280, 15, 52, 1349, 316, 697, 699, 318, 84], 1160)
-    femmesh.addVolume([112, 238, 879, 1047, 1029, 1028, 1021, 1427, 1428, 1418], 1161)
-    femmesh.addVolume([175, 49, 689, 1047, 837, 831, 838, 1429, 1430, 1419], 1162)
-    femmesh.addVolume([238, 112, 881, 1047, 1029, 1027, 1030, 1428, 1427, 1413], 1163)
-    femmesh.addVolume([49, 175, 690, 1047, 837, 839, 835, 1430, 1429, 1416], 1164)
-    femmesh.addVolume([235, 878, 236, 496, 1015, 1018, 267, 633, 1058, 636], 1165)
-    femmesh.addVolume([663, 149, 150, 473, 708, 181, 713, 1106, 514, 515], 1166)
-    femmesh.addVolume([664, 148, 149, 472, 704, 180, 709, 1208, 510, 511], 1167)
-    femmesh.addVolume([29, 286, 28, 669, 348, 349, 60, 731, 1079, 730], 1168)
-    femmesh.addVolume([23, 282, 22, 664, 319, 320, 54, 702, 1120, 701], 1169)
-    femmesh.addVolume([301, 106, 105, 874, 426, 137, 422, 1086, 991, 992], 1170)
-    femmesh.addVolume([87, 855, 86, 281, 896, 897, 118, 331, 1067, 326], 1171)
-    femmesh.addVolume([666, 151, 152, 475, 719, 183, 723, 1161, 524, 525], 1172)
-    femmesh.addVolume([27, 285, 26, 667, 338, 339, 58, 721, 1069, 720], 1173)
-    femmesh.addVolume([222, 481, 221, 864, 566, 561, 253, 948, 1148, 945], 1174)
-    femmesh.addVolume([25, 283, 24, 665, 328, 329, 56, 711, 1061, 710], 1175)
-    femmesh.addVolume([28, 287, 27, 668, 343, 344, 59, 726, 1169, 725], 1176)
-    femmesh.addVolume([26, 284, 25, 666, 333, 334, 57, 716, 1162, 715], 1177)
-    femmesh.addVolume([39, 297, 38, 679, 398, 399, 70, 781, 1315, 780], 1178)
-    femmesh.addVolume([227, 869, 228, 488, 973, 978, 259, 593, 1233, 596], 1179)
-    femmesh.addVolume([227, 226, 870, 487, 258, 970, 975, 591, 588, 1103], 1180)
-    femmesh.addVolume([300, 105, 104, 873, 421, 136, 417, 1236, 986, 987], 1181)
-    femmesh.addVolume([220, 480, 219, 863, 556, 553, 251, 940, 1197, 935], 1182)
-    femmesh.addVolume([152, 153, 667, 477, 184, 728, 724, 529, 530, 1071], 1183)
-    femmesh.addVolume([482, 220, 221, 862, 558, 252, 563, 1167, 938, 943], 1184)
-    femmesh.addVolume([665, 150, 151, 474, 714, 182, 718, 1063, 519, 520], 1185)
-    femmesh.addVolume([670, 155, 156, 478, 739, 187, 743, 1206, 544, 545], 1186)
-    femmesh.addVolume([672, 157, 158, 482, 749, 189, 753, 1116, 554, 555], 1187)
-    femmesh.addVolume([154, 668, 153, 476, 733, 729, 185, 535, 1170, 534], 1188)
-    femmesh.addVolume([669, 154, 155, 479, 734, 186, 738, 1083, 539, 540], 1189)
-    femmesh.addVolume([160, 675, 159, 483, 764, 759, 191, 565, 1109, 564], 1190)
-    femmesh.addVolume([161, 674, 160, 484, 768, 763, 192, 570, 1181, 569], 1191)
-    femmesh.addVolume([162, 676, 161, 485, 773, 769, 193, 575, 1137, 574], 1192)
-    femmesh.addVolume([9, 1, 3, 852, 10, 6, 12, 1408, 884, 885], 1193)
-    femmesh.addVolume([156, 157, 671, 480, 188, 748, 744, 549, 550, 1195], 1194)
-    femmesh.addVolume([158, 159, 673, 481, 190, 758, 754, 559, 560, 1147], 1195)
-    femmesh.addVolume([213, 473, 212, 855, 521, 518, 244, 903, 1108, 900], 1196)
-    femmesh.addVolume([218, 479, 217, 860, 548, 543, 249, 928, 1179, 925], 1197)
-    femmesh.addVolume([478, 218, 219, 861, 546, 250, 551, 1207, 930, 933], 1198)
-    femmesh.addVolume([215, 475, 214, 857, 531, 528, 246, 913, 1177, 910], 1199)
-    femmesh.addVolume([95, 290, 96, 864, 371, 376, 127, 942, 1158, 941], 1200)
-    femmesh.addVolume([483, 222, 223, 865, 568, 254, 571, 1110, 950, 953], 1201)
-    femmesh.addVolume([486, 225, 226, 868, 583, 257, 586, 1139, 965, 968], 1202)
-    femmesh.addVolume([107, 875, 106, 302, 996, 997, 138, 431, 1338, 427], 1203)
-    femmesh.addVolume([217, 476, 216, 859, 541, 536, 248, 923, 1211, 920], 1204)
-    femmesh.addVolume([216, 477, 215, 858, 538, 533, 247, 918, 1133, 915], 1205)
-    femmesh.addVolume([214, 474, 213, 856, 526, 523, 245, 908, 1112, 905], 1206)
-    femmesh.addVolume([23, 663, 24, 281, 705, 706, 55, 324, 1068, 323], 1207)
-    femmesh.addVolume([212, 472, 211, 854, 516, 513, 243, 898, 1209, 895], 1208)
-    femmesh.addVolume([485, 224, 225, 867, 578, 256, 581, 1136, 960, 963], 1209)
-    femmesh.addVolume([484, 223, 224, 866, 573, 255, 576, 1129, 955, 958], 1210)
-    femmesh.addVolume([97, 293, 98, 866, 382, 386, 129, 952, 1130, 951], 1211)
-    femmesh.addVolume([292, 97, 96, 865, 381, 128, 377, 1074, 946, 947], 1212)
-    femmesh.addVolume([294, 99, 98, 867, 391, 130, 387, 1187, 956, 957], 1213)
-    femmesh.addVolume([228, 871, 229, 489, 980, 983, 260, 598, 1094, 601], 1214)
-    femmesh.addVolume([108, 876, 107, 303, 1001, 1002, 139, 436, 1311, 432], 1215)
-    femmesh.addVolume([16, 241, 853, 471, 273, 891, 888, 507, 508, 1306], 1216)
-    femmesh.addVolume([115, 883, 114, 310, 1036, 1037, 146, 469, 1272, 467], 1217)
-    femmesh.addVolume([880, 237, 236, 497, 1025, 268, 1020, 1359, 641, 638], 1218)
-    femmesh.addVolume([112, 308, 113, 881, 457, 461, 144, 1027, 1298, 1026], 1219)
-    femmesh.addVolume([874, 232, 231, 492, 998, 263, 995, 1290, 616, 613], 1220)
-    femmesh.addVolume([42, 300, 41, 682, 413, 414, 73, 796, 1285, 795], 1221)
-    femmesh.addVolume([873, 231, 230, 491, 993, 262, 990, 1237, 611, 608], 1222)
-    femmesh.addVolume([297, 102, 101, 869, 406, 133, 402, 1232, 971, 972], 1223)
-    femmesh.addVolume([100, 296, 101, 870, 397, 401, 132, 967, 1099, 966], 1224)
-    femmesh.addVolume([40, 299, 39, 680, 403, 404, 71, 786, 1320, 785], 1225)
-    femmesh.addVolume([110, 878, 109, 305, 1011, 1012, 141, 446, 1055, 442], 1226)
-    femmesh.addVolume([234, 233, 876, 494, 265, 1005, 1008, 626, 623, 1313], 1227)
-    femmesh.addVolume([237, 879, 238, 498, 1023, 1028, 269, 643, 1305, 646], 1228)
-    femmesh.addVolume([882, 240, 239, 499, 1038, 271, 1035, 1291, 656, 651], 1229)
-    femmesh.addVolume([881, 239, 238, 500, 1033, 270, 1030, 1296, 653, 648], 1230)
-    femmesh.addVolume([241, 240, 883, 501, 272, 1040, 1042, 660, 658, 1266], 1231)
-    femmesh.addVolume([14, 853, 115, 280, 889, 890, 147, 315, 1348, 317], 1232)
-    femmesh.addVolume([877, 235, 234, 495, 1013, 266, 1010, 1431, 631, 628], 1233)
-    femmesh.addVolume([177, 501, 178, 692, 654, 655, 209, 849, 1264, 851], 1234)
-    femmesh.addVolume([173, 497, 174, 688, 634, 635, 205, 829, 1326, 833], 1235)
-    femmesh.addVolume([872, 230, 229, 490, 988, 261, 985, 1280, 606, 603], 1236)
-    femmesh.addVolume([875, 233, 232, 493, 1003, 264, 1000, 1321, 621, 618], 1237)
-    femmesh.addVolume([274, 17, 16, 471, 278, 20, 277, 1412, 506, 507], 1238)
-    femmesh.addVolume([175, 174, 498, 689, 206, 639, 640, 838, 834, 1304], 1239)
-    femmesh.addVolume([112, 879, 111, 307, 1021, 1022, 143, 456, 1270, 452], 1240)
-    femmesh.addVolume([175, 500, 176, 690, 644, 645, 207, 839, 1330, 843], 1241)
-    femmesh.addVolume([171, 495, 172, 686, 624, 625, 203, 819, 1432, 823], 1242)
-    femmesh.addVolume([38, 296, 37, 678, 393, 394, 69, 776, 1102, 775], 1243)
-    femmesh.addVolume([166, 490, 167, 681, 599, 600, 198, 794, 1281, 798], 1244)
-    femmesh.addVolume([167, 491, 168, 682, 604, 605, 199, 799, 1284, 803], 1245)
-    femmesh.addVolume([168, 492, 169, 683, 609, 610, 200, 804, 1289, 808], 1246)
-    femmesh.addVolume([170, 494, 171, 685, 619, 620, 202, 814, 1334, 818], 1247)
-    femmesh.addVolume([169, 493, 170, 684, 614, 615, 201, 809, 1324, 813], 1248)
-    femmesh.addVolume([178, 471, 17, 662, 509, 506, 210, 700, 1307, 698], 1249)
-    femmesh.addVolume([177, 176, 499, 691, 208, 649, 650, 848, 844, 1292], 1250)
-    femmesh.addVolume([114, 882, 113, 309, 1031, 1032, 145, 466, 1278, 462], 1251)
-    femmesh.addVolume([308, 112, 49, 1047, 457, 455, 454, 1414, 1427, 1430], 1252)
-    femmesh.addVolume([307, 49, 112, 1047, 448, 455, 456, 1417, 1430, 1427], 1253)
-    femmesh.addVolume([175, 238, 500, 1047, 647, 648, 644, 1429, 1428, 1415], 1254)
-    femmesh.addVolume([238, 175, 498, 1047, 647, 640, 646, 1428, 1429, 1420], 1255)
-    femmesh.addVolume([280, 52, 662, 1044, 318, 699, 1349, 1433, 1434, 1435], 1256)
-    femmesh.addVolume([178, 692, 501, 1044, 851, 1264, 655, 1436, 1437, 1438], 1257)
-    femmesh.addVolume([686, 495, 172, 1045, 1432, 625, 823, 1424, 1421, 1391], 1258)
-    femmesh.addVolume([877, 235, 495, 1045, 1013, 631, 1431, 1422, 1392, 1421], 1259)
-    femmesh.addVolume([686, 46, 304, 1045, 816, 433, 1425, 1424, 1393, 1423], 1260)
-    femmesh.addVolume([877, 304, 109, 1045, 1426, 441, 1006, 1422, 1423, 1394], 1261)
-    femmesh.addVolume([2, 661, 279, 9, 694, 1202, 311, 11, 1406, 1405], 1262)
-    femmesh.addVolume([1, 9, 279, 852, 10, 1405, 312, 884, 1408, 1248], 1263)
-    femmesh.addVolume([9, 4, 661, 470, 13, 693, 1406, 1407, 503, 1203], 1264)
-    femmesh.addVolume([15, 662, 274, 280, 697, 1409, 275, 316, 1349, 1411], 1265)
-    femmesh.addVolume([49, 690, 308, 1047, 835, 1329, 454, 1430, 1416, 1414], 1266)
-    femmesh.addVolume([112, 308, 881, 1047, 457, 1298, 1027, 1427, 1414, 1413], 1267)
-    femmesh.addVolume([307, 112, 879, 1047, 456, 1021, 1270, 1417, 1427, 1418], 1268)
-    femmesh.addVolume([3, 470, 9, 852, 502, 1407, 12, 885, 1249, 1408], 1269)
-    femmesh.addVolume([274, 853, 14, 280, 1410, 889, 276, 1411, 1348, 315], 1270)
-    femmesh.addVolume([853, 274, 16, 471, 1410, 277, 888, 1306, 1412, 507], 1271)
-    femmesh.addVolume([17, 471, 274, 662, 506, 1412, 278, 698, 1307, 1409], 1272)
-    femmesh.addVolume([238, 881, 500, 1047, 1030, 1296, 648, 1428, 1413, 1415], 1273)
-    femmesh.addVolume([307, 689, 49, 1047, 1269, 831, 448, 1417, 1419, 1430], 1274)
-    femmesh.addVolume([498, 879, 238, 1047, 1305, 1028, 646, 1420, 1418, 1428], 1275)
-    femmesh.addVolume([175, 500, 690, 1047, 644, 1330, 839, 1429, 1415, 1416], 1276)
-    femmesh.addVolume([175, 689, 498, 1047, 838, 1304, 640, 1429, 1419, 1420], 1277)
-    femmesh.addVolume([171, 495, 686, 1045, 624, 1432, 819, 1402, 1421, 1424], 1278)
-    femmesh.addVolume([686, 304, 45, 1045, 1425, 434, 815, 1424, 1423, 1403], 1279)
-    femmesh.addVolume([877, 108, 304, 1045, 1007, 437, 1426, 1422, 1404, 1423], 1280)
-    femmesh.addVolume([877, 495, 234, 1045, 1431, 628, 1010, 1422, 1421, 1401], 1281)
-    femmesh.addVolume([692, 178, 52, 1044, 851, 850, 846, 1437, 1436, 1434], 1282)
-    femmesh.addVolume([178, 662, 52, 1044, 700, 699, 850, 1436, 1435, 1434], 1283)
-    femmesh.addVolume([110, 306, 111, 1046, 447, 451, 142, 1400, 1399, 1439], 1284)
-    femmesh.addVolume([110, 111, 880, 1046, 142, 1016, 1017, 1400, 1439, 1361], 1285)
-    femmesh.addVolume([687, 1043, 496, 1046, 1049, 1057, 1060, 1357, 1440, 1358], 1286)
-    femmesh.addVolume([306, 173, 47, 688, 1441, 827, 444, 1327, 829, 825], 1287)
-    femmesh.addVolume([173, 306, 47, 1046, 1441, 444, 827, 1356, 1399, 1390], 1288)
-    femmesh.addVolume([173, 306, 497, 688, 1441, 1302, 634, 829, 1327, 1326], 1289)
-    femmesh.addVolume([306, 173, 497, 1046, 1441, 634, 1302, 1399, 1356, 1362], 1290)
-    femmesh.addVolume([1046, 111, 497, 306, 1439, 1301, 1362, 1399, 451, 1302], 1291)
-    femmesh.addVolume([1046, 497, 111, 880, 1362, 1301, 1439, 1361, 1359, 1016], 1292)
-    femmesh.addVolume([878, 110, 1043, 305, 1011, 1442, 1054, 1055, 446, 1048], 1293)
-    femmesh.addVolume([241, 1044, 280, 662, 1443, 1433, 1350, 1308, 1435, 1349], 1294)
-    femmesh.addVolume([241, 1044, 178, 501, 1443, 1436, 659, 660, 1438, 655], 1295)
-    femmesh.addVolume([1044, 241, 178, 662, 1443, 659, 1436, 1435, 1308, 700], 1296)
-    femmesh.addVolume([52, 115, 1044, 280, 468, 1444, 1434, 318, 317, 1433], 1297)
-    femmesh.addVolume([52, 1044, 115, 692, 1434, 1444, 468, 846, 1437, 1263], 1298)
-    femmesh.addVolume([501, 115, 1044, 692, 1265, 1444, 1438, 1264, 1263, 1437], 1299)
-    femmesh.addVolume([687, 110, 1046, 47, 1445, 1400, 1357, 821, 445, 1390], 1300)
-    femmesh.addVolume([110, 687, 1046, 1043, 1445, 1357, 1400, 1442, 1049, 1440], 1301)
-    femmesh.addVolume([110, 687, 305, 47, 1445, 1050, 446, 445, 821, 438], 1302)
-    femmesh.addVolume([687, 110, 305, 1043, 1445, 446, 1050, 1049, 1442, 1048], 1303)
-    femmesh.addVolume([1046, 110, 496, 236, 1400, 1446, 1358, 1360, 1019, 636], 1304)
-    femmesh.addVolume([1046, 496, 110, 1043, 1358, 1446, 1400, 1440, 1057, 1442], 1305)
-    femmesh.addVolume([878, 496, 110, 236, 1058, 1446, 1011, 1018, 636, 1019], 1306)
-    femmesh.addVolume([878, 110, 496, 1043, 1011, 1446, 1058, 1054, 1442, 1057], 1307)
-    femmesh.addVolume([1044, 115, 241, 280, 1444, 1041, 1443, 1433, 317, 1350], 1308)
-    femmesh.addVolume([115, 1044, 241, 501, 1444, 1443, 1041, 1265, 1438, 660], 1309)
-    return True
@@ -28,7 +28,6 @@ from FreeCAD import Vector as vec
 import Part
 from Part import makeLine as ln
 
-import Fem
 import ObjectsFem
 
 from . import manager
@@ -165,15 +164,9 @@ def setup(doc=None, solvertype="ccxtools"):
     analysis.addObject(con_disp)
 
     # mesh
-    from .meshes.mesh_rc_wall_2d_tria6 import create_nodes, create_elements
-
-    fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
-    if not control:
-        FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
-    if not control:
-        FreeCAD.Console.PrintError("Error on creating elements.\n")
+    from .meshes import load_mesh
+
+    fem_mesh = load_mesh("mesh_rc_wall_2d_tria6")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
     femmesh_obj.FemMesh = fem_mesh
     femmesh_obj.Shape = geom_obj
@@ -102,13 +102,20 @@ def setupPipeline(doc, analysis, results_name, result_data):
 def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_type=""):
     import ObjectsFem
     from . import importToolsFem
+    from . import readCcxFrd
 
     if analysis:
         doc = analysis.Document
     else:
         doc = FreeCAD.ActiveDocument
 
-    m = read_frd_result(filename)
+    # load further result sets of multi step results on demand only
+    # see module femresult/resultloader.py
+    fem_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+    lazy_loading = fem_prefs.GetBool("LazyResultLoading", False)
+
+    # memory-mapped block reader, returns the same data as read_frd_result()
+    m = readCcxFrd.read_frd_result(filename, lazy=lazy_loading)
     result_mesh_object = None
     res_obj = None
 
@@ -131,7 +138,7 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
         multistep_result = []
         multistep_value = []
         if len(m["Results"]) > 0:
-            for result_set in m["Results"]:
+            for result_index, result_set in enumerate(m["Results"]):
                 if "number" in result_set:
                     eigenmode_number = result_set["number"]
                 else:
@@ -155,6 +162,17 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
                     results_name = f"{result_name_prefix}Results"
 
                 res_obj = make_result_mesh(results_name)
+                if lazy_loading and result_index > 0:
+                    # the result set is decoded when it is shown or queried
+                    res_obj.ResultFile = filename
+                    res_obj.ResultSetIndex = result_index
+                    res_obj.NodeNumbers = nodenumbers_for_compacted_mesh
+                    if eigenmode_number > 0:
+                        res_obj.Eigenmode = eigenmode_number
+                    if analysis:
+                        analysis.addObject(res_obj)
+                    continue
+
                 res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
                 if analysis:
                     # need to be here, becasause later on, the analysis objs are needed
@@ -163,7 +181,6 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
 
                 # more result object calculations
                 from femresult import resulttools
-                from femtools import femutils
 
                 if not res_obj.MassFlowRate:
                     # information 1:
@@ -186,40 +203,7 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
                         # all other result sets, do not compact FemMesh, only set NodeNumbers
                         res_obj.NodeNumbers = nodenumbers_for_compacted_mesh
 
-                # fill DisplacementLengths
-                res_obj = resulttools.add_disp_apps(res_obj)
-                # fill vonMises
-                res_obj = resulttools.add_von_mises(res_obj)
-                # fill principal stress
-                # if material reinforced object use add additional values to the res_obj
-                if res_obj.getParentGroup():
-                    has_reinforced_mat = False
-                    for obj in res_obj.getParentGroup().Group:
-                        if femutils.is_of_type(obj, "Fem::MaterialReinforced"):
-                            has_reinforced_mat = True
-                            Console.PrintLog(
-                                "Reinforced material object detected, "
-                                "reinforced principal stresses and standard principal "
-                                "stresses will be added.\n"
-                            )
-                            resulttools.add_principal_stress_reinforced(res_obj)
-                            break
-                    if has_reinforced_mat is False:
-                        Console.PrintLog(
-                            "No reinforced material object detected, "
-                            "standard principal stresses will be added.\n"
-                        )
-                        # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
-                        res_obj = resulttools.add_principal_stress_std(res_obj)
-                else:
-                    Console.PrintLog(
-                        "No Analysis detected, standard principal stresses will be added.\n"
-                    )
-                    # if a pure frd file was opened no analysis and thus no parent group
-                    # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
-                    res_obj = resulttools.add_principal_stress_std(res_obj)
-                # fill Stats
-                res_obj = resulttools.fill_femresult_stats(res_obj)
+                res_obj = add_derived_results(res_obj)
 
                 # if we have multiple results we delay the pipeline creation
                 if number_of_increments == 1:
@@ -228,8 +212,14 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
                     multistep_value.append(step_time)
                     multistep_result.append(res_obj)
 
+            # the multistep pipeline needs the data of all result sets, thus with lazy
+            # loading only the first result set gets a pipeline
+            if number_of_increments > 1 and lazy_loading:
+                first_res_obj = multistep_result[0]
+                setupPipeline(doc, analysis, first_res_obj.Label, [first_res_obj])
+
             # we have collected all result objects, lets create the multistep result pipeline
-            if number_of_increments > 1:
+            elif number_of_increments > 1:
                 # figure out type and unit
                 match result_analysis_type:
                     case "frequency":
@@ -303,8 +293,92 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
     return res_obj
 
 
+def importFrdLiveResult(
+    filename, analysis=None, res_obj=None, results_name="Live_Results", known_sets=0
+):
+    """Imports the last completed result set of a frd file the solver is still writing.
+
+    Only completed result sets are found in a frd file which is still written,
+    see readCcxFrd.index_frd(). The result object res_obj is filled with the
+    last one, if res_obj is None a new result object is made. Nothing is
+    imported if there are not more than known_sets completed result sets.
+    Returns the result object and the number of completed result sets.
+    """
+    import ObjectsFem
+    from . import importToolsFem
+    from . import readCcxFrd
+    from femresult import resulttools
+
+    inout_nodes = readCcxFrd.read_inout_nodes(filename)
+    with readCcxFrd.open_frd(filename) as frd_data:
+        index = readCcxFrd.index_frd(frd_data)
+        if len(index["Results"]) <= known_sets or not index["Nodes"]:
+            return res_obj, len(index["Results"])
+        ids, coords = readCcxFrd.read_frd_nodes(frd_data, index["Nodes"])
+        elem_ids, elem_types, elem_nodes = readCcxFrd.read_frd_elements(frd_data, index["Elements"])
+        result_set = readCcxFrd.read_frd_result_set(frd_data, index["Results"][-1], inout_nodes)
+    m = readCcxFrd.make_mesh_dict(ids, coords, elem_ids, elem_types, elem_nodes, inout_nodes)
+
+    doc = analysis.Document if analysis else FreeCAD.ActiveDocument
+    if res_obj is None:
+        res_obj = ObjectsFem.makeResultMechanical(doc, results_name)
+        res_obj.Mesh = ObjectsFem.makeMeshResult(doc, results_name + "_Mesh")
+        if analysis:
+            analysis.addObject(res_obj)
+    res_obj.Mesh.FemMesh = importToolsFem.make_femmesh(m)
+    res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
+    if not res_obj.MassFlowRate:
+        # see importFrd()
+        res_obj = resulttools.compact_result(res_obj)
+    res_obj = add_derived_results(res_obj)
+    doc.recompute()
+
+    return res_obj, len(index["Results"])
+
+
+def add_derived_results(res_obj):
+    """Fills the result values calculated out of the frd values and the Stats."""
+    from femresult import resulttools
+    from femtools import femutils
+
+    # fill DisplacementLengths
+    res_obj = resulttools.add_disp_apps(res_obj)
+    # fill vonMises
+    res_obj = resulttools.add_von_mises(res_obj)
+    # fill principal stress
+    # if material reinforced object use add additional values to the res_obj
+    if res_obj.getParentGroup():
+        has_reinforced_mat = False
+        for obj in res_obj.getParentGroup().Group:
+            if femutils.is_of_type(obj, "Fem::MaterialReinforced"):
+                has_reinforced_mat = True
+                Console.PrintLog(
+                    "Reinforced material object detected, "
+                    "reinforced principal stresses and standard principal "
+                    "stresses will be added.\n"
+                )
+                resulttools.add_principal_stress_reinforced(res_obj)
+                break
+        if has_reinforced_mat is False:
+            Console.PrintLog(
+                "No reinforced material object detected, "
+                "standard principal stresses will be added.\n"
+            )
+            # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
+            res_obj = resulttools.add_principal_stress_std(res_obj)
+    else:
+        Console.PrintLog("No Analysis detected, standard principal stresses will be added.\n")
+        # if a pure frd file was opened no analysis and thus no parent group
+        # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
+        res_obj = resulttools.add_principal_stress_std(res_obj)
+    # fill Stats
+    res_obj = resulttools.fill_femresult_stats(res_obj)
+    return res_obj
+
+
 # read a calculix result file and extract the nodes
 # displacement vectors and stress values.
+# line by line reader, importFrd() uses the faster block reader readCcxFrd.read_frd_result()
 def read_frd_result(frd_input):
     Console.PrintMessage(f"Read ccx results from frd file: {frd_input}\n")
     inout_nodes = []
@@ -0,0 +1,162 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD NumPy mesh reader and writer"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## @package importNpzMesh
+#  \ingroup FEM
+#  \brief FreeCAD compact NumPy mesh reader and writer for FEM workbench
+
+# A npz mesh file is a compressed NumPy archive with the arrays
+#   node_ids: (n,) node ids
+#   nodes: (n, 3) node coordinates
+#   <kind><count>_ids: (m,) ids of the elements of kind with count nodes
+#   <kind><count>: (m, count) node ids of these elements
+# kind is one of edges, faces, volumes, for example volumes10 for Tetra10.
+# The arrays are passed to and read from the FemMesh with its bulk array API
+# (addNodes, addElements, getNodeArrays, getElementArrays), thus loading such
+# a file needs a few calls only, see femexamples/meshes.
+
+import os
+
+import numpy as np
+
+import FreeCAD
+from FreeCAD import Console
+
+from femmesh import meshtools
+
+# kind in the npz file: FemMesh element type
+ELEMENT_KINDS = {"edges": "Edge", "faces": "Face", "volumes": "Volume"}
+
+
+# ****************************************************************************
+# ********* generic FreeCAD import and export methods ************************
+# names are fix given from FreeCAD, these methods are called from FreeCAD
+# they are set in FEM modules Init.py
+
+
+def open(filename):
+    """called when freecad opens a file
+    a FEM mesh object is created in a new document"""
+
+    docname = os.path.splitext(os.path.basename(filename))[0]
+    return insert(filename, docname)
+
+
+def insert(filename, docname):
+    """called when freecad wants to import a file"
+    a FEM mesh object is created in a existing document"""
+
+    try:
+        doc = FreeCAD.getDocument(docname)
+    except NameError:
+        doc = FreeCAD.newDocument(docname)
+    FreeCAD.ActiveDocument = doc
+
+    import_npz_mesh(filename)
+    return doc
+
+
+def export(objectslist, fileString):
+    "called when freecad exports a file"
+    if len(objectslist) != 1:
+        Console.PrintError("This exporter can only export one object.\n")
+        return
+    obj = objectslist[0]
+    if not obj.isDerivedFrom("Fem::FemMeshObject"):
+        Console.PrintError("No FEM mesh object selected.\n")
+        return
+
+    write(fileString, obj.FemMesh)
+
+
+# ********* reader ***********************************************************
+def import_npz_mesh(fileString):
+    """
+    read a FemMesh from a npz mesh file
+    insert a FreeCAD FEM Mesh object in the ActiveDocument
+    return the FEM mesh document object
+    """
+
+    mesh_name = os.path.basename(os.path.splitext(fileString)[0])
+
+    femmesh = read(fileString)
+    mesh_object = FreeCAD.ActiveDocument.addObject("Fem::FemMeshObject", mesh_name)
+    mesh_object.FemMesh = femmesh
+
+    return mesh_object
+
+
+def read(fileString):
+    """read a FemMesh from a npz mesh file and return the FemMesh"""
+    # no document object is created, just the FemMesh is returned
+
+    with np.load(fileString) as npz_data:
+        mesh_arrays = {key: npz_data[key] for key in npz_data.files}
+    return make_femmesh_from_arrays(mesh_arrays)
+
+
+def make_femmesh_from_arrays(mesh_arrays):
+    """makes a FemMesh from the arrays of a npz mesh file, see module description"""
+    import Fem
+
+    femmesh = Fem.FemMesh()
+    femmesh.addNodes(mesh_arrays["nodes"], mesh_arrays["node_ids"])
+    for kind, ele_type in ELEMENT_KINDS.items():
+        for key in sorted(k for k in mesh_arrays if _is_element_key(k, kind)):
+            femmesh.addElements(
+                ele_type, mesh_arrays[key], int(key[len(kind) :]), mesh_arrays[key + "_ids"]
+            )
+    return femmesh
+
+
+def _is_element_key(array_key, kind):
+    return array_key.startswith(kind) and array_key[len(kind) :].isdigit()
+
+
+# ********* writer ***********************************************************
+def write(fileString, fem_mesh):
+    """directly write a FemMesh to a npz mesh file
+    fem_mesh: a FemMesh"""
+
+    np.savez_compressed(fileString, **make_arrays_from_femmesh(fem_mesh))
+
+
+def make_arrays_from_femmesh(fem_mesh):
+    """returns the arrays of a npz mesh file for the FemMesh, see module description"""
+
+    node_ids, coords = meshtools.get_node_arrays(fem_mesh)
+    mesh_arrays = {
+        "node_ids": node_ids.astype(np.int32),
+        "nodes": coords.astype(np.float64),
+    }
+    for kind, ele_type in ELEMENT_KINDS.items():
+        ele_arrays = meshtools.get_element_arrays(fem_mesh, ele_type)
+        for count, (ele_ids, ele_nodes) in meshtools.get_element_groups(*ele_arrays).items():
+            key = f"{kind}{count}"
+            mesh_arrays[key + "_ids"] = ele_ids.astype(np.int32)
+            mesh_arrays[key] = ele_nodes.astype(np.int32)
+    return mesh_arrays
@@ -156,120 +156,50 @@ def make_femmesh(mesh_data):
 
             nds = m["Nodes"]
             FreeCAD.Console.PrintLog("Found: elements\n")
-            for i in nds:
-                n = nds[i]
-                mesh.addNode(n[0], n[1], n[2], i)
-            elms_hexa8 = m["Hexa8Elem"]
-            for i in elms_hexa8:
-                e = elms_hexa8[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_penta6 = m["Penta6Elem"]
-            for i in elms_penta6:
-                e = elms_penta6[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_tetra4 = m["Tetra4Elem"]
-            for i in elms_tetra4:
-                e = elms_tetra4[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3]], i)
-            elms_tetra10 = m["Tetra10Elem"]
-            for i in elms_tetra10:
-                e = elms_tetra10[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9]], i)
-            elms_penta15 = m["Penta15Elem"]
-            for i in elms_penta15:
-                e = elms_penta15[i]
-                mesh.addVolume(
-                    [
-                        e[0],
-                        e[1],
-                        e[2],
-                        e[3],
-                        e[4],
-                        e[5],
-                        e[6],
-                        e[7],
-                        e[8],
-                        e[9],
-                        e[10],
-                        e[11],
-                        e[12],
-                        e[13],
-                        e[14],
-                    ],
-                    i,
-                )
-            elms_hexa20 = m["Hexa20Elem"]
-            for i in elms_hexa20:
-                e = elms_hexa20[i]
-                mesh.addVolume(
-                    [
-                        e[0],
-                        e[1],
-                        e[2],
-                        e[3],
-                        e[4],
-                        e[5],
-                        e[6],
-                        e[7],
-                        e[8],
-                        e[9],
-                        e[10],
-                        e[11],
-                        e[12],
-                        e[13],
-                        e[14],
-                        e[15],
-                        e[16],
-                        e[17],
-                        e[18],
-                        e[19],
-                    ],
-                    i,
-                )
-            elms_tria3 = m["Tria3Elem"]
-            for i in elms_tria3:
-                e = elms_tria3[i]
-                mesh.addFace([e[0], e[1], e[2]], i)
-            elms_tria6 = m["Tria6Elem"]
-            for i in elms_tria6:
-                e = elms_tria6[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_quad4 = m["Quad4Elem"]
-            for i in elms_quad4:
-                e = elms_quad4[i]
-                mesh.addFace([e[0], e[1], e[2], e[3]], i)
-            elms_quad8 = m["Quad8Elem"]
-            for i in elms_quad8:
-                e = elms_quad8[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_seg2 = m["Seg2Elem"]
-            for i in elms_seg2:
-                e = elms_seg2[i]
-                mesh.addEdge([e[0], e[1]], i)
-            elms_seg3 = m["Seg3Elem"]
-            for i in elms_seg3:
-                e = elms_seg3[i]
-                mesh.addEdge([e[0], e[1], e[2]], i)
+            # the nodes and the elements of each type are added with one call each
+            mesh.addNodes([(n[0], n[1], n[2]) for n in nds.values()], list(nds.keys()))
+            for ele_key, ele_type, node_count in (
+                ("Hexa8Elem", "Volume", 8),
+                ("Penta6Elem", "Volume", 6),
+                ("Tetra4Elem", "Volume", 4),
+                ("Tetra10Elem", "Volume", 10),
+                ("Penta15Elem", "Volume", 15),
+                ("Hexa20Elem", "Volume", 20),
+                ("Tria3Elem", "Face", 3),
+                ("Tria6Elem", "Face", 6),
+                ("Quad4Elem", "Face", 4),
+                ("Quad8Elem", "Face", 8),
+                ("Seg2Elem", "Edge", 2),
+                ("Seg3Elem", "Edge", 3),
+            ):
+                elms = m[ele_key]
+                if elms:
+                    mesh.addElements(
+                        ele_type,
+                        [e[:node_count] for e in elms.values()],
+                        node_count,
+                        list(elms.keys()),
+                    )
             Console.PrintLog(
                 "imported mesh: {} nodes, {} HEXA8, {} PENTA6, {} TETRA4, {} TETRA10, {} PENTA15\n".format(
                     len(nds),
-                    len(elms_hexa8),
-                    len(elms_penta6),
-                    len(elms_tetra4),
-                    len(elms_tetra10),
-                    len(elms_penta15),
+                    len(m["Hexa8Elem"]),
+                    len(m["Penta6Elem"]),
+                    len(m["Tetra4Elem"]),
+                    len(m["Tetra10Elem"]),
+                    len(m["Penta15Elem"]),
                 )
             )
             Console.PrintLog(
                 "imported mesh: {} "
                 "HEXA20, {} TRIA3, {} TRIA6, {} QUAD4, {} QUAD8, {} SEG2, {} SEG3\n".format(
-                    len(elms_hexa20),
-                    len(elms_tria3),
-                    len(elms_tria6),
-                    len(elms_quad4),
-                    len(elms_quad8),
-                    len(elms_seg2),
-                    len(elms_seg3),
+                    len(m["Hexa20Elem"]),
+                    len(m["Tria3Elem"]),
+                    len(m["Tria6Elem"]),
+                    len(m["Quad4Elem"]),
+                    len(m["Quad8Elem"]),
+                    len(m["Seg2Elem"]),
+                    len(m["Seg3Elem"]),
                 )
             )
         else:
@@ -311,26 +241,21 @@ def make_dict_from_femmesh(femmesh):
     len_to_face = {3: tri3, 6: tri6, 4: quad4, 8: quad8}
     len_to_volume = {4: tet4, 10: tet10, 8: hex8, 20: hex20, 6: pent6, 15: pent15}
 
-    # analyze edges
-
-    for e in femmesh.Edges:
-        t = femmesh.getElementNodes(e)
-        len_to_edge[len(t)].append((e, t))
-
-    # analyze faces
-
-    for f in femmesh.Faces:
-        t = femmesh.getElementNodes(f)
-        len_to_face[len(t)].append((f, t))
-
-    # analyze volumes
+    # analyze edges, faces and volumes, the element nodes are read with one call per type
+    from femmesh import meshtools
 
-    for v in femmesh.Volumes:
-        t = femmesh.getElementNodes(v)
-        len_to_volume[len(t)].append((v, t))
+    for ele_type, len_to_elements in (
+        ("Edge", len_to_edge),
+        ("Face", len_to_face),
+        ("Volume", len_to_volume),
+    ):
+        ele_arrays = meshtools.get_element_arrays(femmesh, ele_type)
+        for count, (ele_ids, ele_nodes) in meshtools.get_element_groups(*ele_arrays).items():
+            len_to_elements[count].extend(zip(ele_ids.tolist(), map(tuple, ele_nodes.tolist())))
 
+    node_ids, node_coords = meshtools.get_node_arrays(femmesh)
     mesh_data = {
-        "Nodes": {k: (v.x, v.y, v.z) for (k, v) in femmesh.Nodes.items()},
+        "Nodes": dict(zip(node_ids.tolist(), map(tuple, node_coords.tolist()))),
         "Seg2Elem": dict(seg2),
         "Seg3Elem": dict(seg3),
         "Tria3Elem": dict(tri3),
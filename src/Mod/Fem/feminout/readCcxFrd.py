@@ -0,0 +1,443 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Block reader for Calculix frd file format"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## @package readCcxFrd
+#  \ingroup FEM
+#  \brief FreeCAD Calculix FRD block reader for FEM workbench
+#
+#  The frd file is memory-mapped. Only the record header lines are walked in
+#  Python, every node, element or result block is located by its header and
+#  its fixed width records are decoded into NumPy arrays in one go.
+#  read_frd_result() returns the same data structure as
+#  importCcxFrdResults.read_frd_result() does.
+
+import mmap
+import os
+from builtins import open as pyopen
+from contextlib import contextmanager
+
+import numpy as np
+
+import FreeCAD
+from FreeCAD import Console
+
+
+# frd result block name, key in the result set, number of components
+# the block name is compared against the beginning of the name in the -4 record
+FRD_RESULT_BLOCKS = (
+    ("DISP", "disp", 3),
+    ("STRESS", "stress", 6),
+    ("TOSTRAIN", "strain", 6),
+    ("PE", "peeq", 1),
+    ("NDTEMP", "temp", 1),
+    ("FLUX", "heatflux", 3),
+    ("MAFLOW", "mflow", 1),
+    ("STPRES", "npressure", 1),
+)
+
+# frd element type: (result key, number of nodes, frd node index for FreeCAD node order)
+# node order fits with node order in writeAbaqus() in FemMesh.cpp
+# for hexa20, penta15 and seg3 the frd file uses another node order than the inp file
+# see the notes in importCcxFrdResults.read_frd_result()
+FRD_ELEMENT_TYPES = {
+    1: ("Hexa8Elem", 8, (5, 6, 7, 4, 1, 2, 3, 0)),
+    2: ("Penta6Elem", 6, (4, 5, 3, 1, 2, 0)),
+    3: ("Tetra4Elem", 4, (1, 0, 2, 3)),
+    4: (
+        "Hexa20Elem",
+        20,
+        (7, 4, 5, 6, 3, 0, 1, 2, 19, 16, 17, 18, 11, 8, 9, 10, 15, 12, 13, 14),
+    ),
+    5: ("Penta15Elem", 15, (4, 5, 3, 1, 2, 0, 13, 14, 12, 7, 8, 6, 10, 11, 9)),
+    6: ("Tetra10Elem", 10, (1, 0, 2, 3, 4, 6, 5, 8, 7, 9)),
+    7: ("Tria3Elem", 3, (0, 1, 2)),
+    8: ("Tria6Elem", 6, (0, 1, 2, 3, 4, 5)),
+    9: ("Quad4Elem", 4, (0, 1, 2, 3)),
+    10: ("Quad8Elem", 8, (0, 1, 2, 3, 4, 5, 6, 7)),
+    11: ("Seg2Elem", 2, (0, 1)),
+    12: ("Seg3Elem", 3, (0, 1, 2)),
+}
+
+_MINUS_ONE = ord("1")
+_MINUS_TWO = ord("2")
+
+
+# ********* file access *********
+@contextmanager
+def open_frd(frd_input):
+    """Context manager which memory-maps a frd file read only.
+
+    An empty file is returned as empty bytes, because an empty file can not be mapped.
+    """
+    with pyopen(frd_input, "rb") as frd_file:
+        if os.fstat(frd_file.fileno()).st_size == 0:
+            yield b""
+            return
+        frd_map = mmap.mmap(frd_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield frd_map
+        finally:
+            frd_map.close()
+
+
+def read_inout_nodes(frd_input):
+    """Reads the special 1DFlow in- and outlet nodes file written beside the frd file."""
+    inout_nodes = []
+    inout_nodes_file = frd_input.rsplit(".", 1)[0] + "_inout_nodes.txt"
+    if os.path.exists(inout_nodes_file):
+        Console.PrintMessage(f"Read special 1DFlow nodes data form: {inout_nodes_file}\n")
+        with pyopen(inout_nodes_file, "r") as f:
+            for line in f:
+                inout_nodes.append(line.split(","))
+        Console.PrintMessage(f"{inout_nodes}\n")
+    return inout_nodes
+
+
+# ********* index *********
+def index_frd(frd_data):
+    """Scans the record headers of frd data and returns the location of all blocks.
+
+    frd_data is a bytes-like object, usually the memory-mapped file.
+    Only header lines are looked at, data records are skipped by a search for
+    the end of block record (-3). Returns a dict:
+        "Nodes": list of (start, end) byte ranges of node blocks (2C)
+        "Elements": list of (start, end) byte ranges of element blocks (3C)
+        "Results": list of result sets, every one a dict with the keys
+            "number" (eigenmode), "time" and "blocks", where "blocks" maps
+            the result key (see FRD_RESULT_BLOCKS) to the (start, end) byte range.
+    A byte range covers the data records of a block only, not its headers.
+    The grouping of blocks into result sets follows importCcxFrdResults.read_frd_result().
+    """
+    index = {"Nodes": [], "Elements": [], "Results": []}
+
+    mode_results = _new_result_set()
+    block_key = None
+    eigenmode = 0
+    timestep = 0
+    mode_time_found = False
+    end_of_section_found = False
+    node_element_section = True
+
+    size = len(frd_data)
+    pos = 0
+    while pos < size:
+        line_end = frd_data.find(b"\n", pos)
+        if line_end == -1:
+            line_end = size
+        record = frd_data[pos : pos + 3]
+
+        if record in (b" -1", b" -2"):
+            # data records of a block, jump to its end record
+            block_end = frd_data.find(b"\n -3", max(pos - 1, 0))
+            if block_end == -1:
+                block_end = size
+            else:
+                block_end += 1
+            if block_key is not None:
+                block_range = (pos, block_end)
+                if block_key in ("Nodes", "Elements"):
+                    index[block_key].append(block_range)
+                else:
+                    mode_results["blocks"][block_key] = block_range
+            pos = block_end
+            continue
+
+        line = frd_data[pos:line_end].rstrip(b"\r").decode("latin-1")
+        pos = line_end + 1
+        mode_eigen_changed = False
+        mode_time_changed = False
+        end_of_frd_data_found = False
+
+        if line[5:10] == "PMODE":
+            eigentemp = int(line[30:36])
+            if eigentemp > eigenmode:
+                eigenmode = eigentemp
+                mode_eigen_changed = True
+
+        if line[4:10] == "1PSTEP":
+            mode_time_found = True
+        if mode_time_found and (line[2:7] == "100CL"):
+            timetemp = float(line[13:25])
+            if timetemp > timestep:
+                timestep = timetemp
+                mode_time_changed = True
+
+        if line[4:6] == "2C":
+            block_key = "Nodes"
+        elif line[4:6] == "3C":
+            block_key = "Elements"
+        elif line[1:3] == "-4":
+            block_key = None
+            for name, key, ncomp in FRD_RESULT_BLOCKS:
+                if line[5:].startswith(name):
+                    block_key = key
+                    break
+
+        if line[1:3] == "-3":
+            end_of_section_found = True
+            # the end of a block not read at all does not change the section kind
+            if block_key in ("Nodes", "Elements"):
+                node_element_section = True
+            elif block_key is not None:
+                node_element_section = False
+            block_key = None
+
+        if line[1:5] == "9999":
+            end_of_frd_data_found = True
+
+        if (
+            (mode_eigen_changed or mode_time_changed or end_of_frd_data_found)
+            and end_of_section_found
+            and not node_element_section
+        ):
+            index["Results"].append(mode_results)
+            mode_results = _new_result_set()
+            end_of_section_found = False
+
+        if mode_eigen_changed:
+            mode_results["number"] = eigenmode
+        if mode_time_changed:
+            mode_results["time"] = timestep
+            mode_time_found = False
+
+        if end_of_frd_data_found:
+            break
+
+    return index
+
+
+def _new_result_set():
+    # https://forum.freecad.org/viewtopic.php?f=18&t=32649&start=10#p274686
+    return {"number": float("NaN"), "time": float("NaN"), "blocks": {}}
+
+
+# ********* block decoding *********
+def _record_table(block_data):
+    """Returns the records of a block as 2D uint8 array, one row per record.
+
+    If all records have the same length the data is reshaped without copying
+    every line, otherwise the lines are zero padded to the longest one.
+    """
+    data = bytes(block_data)
+    if b"\r" in data:
+        data = data.replace(b"\r", b"")
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    row_length = data.find(b"\n") + 1
+    if len(data) % row_length == 0:
+        table = np.frombuffer(data, dtype=np.uint8).reshape(-1, row_length)
+        if (table[:, -1] == ord("\n")).all():
+            return table[:, :-1]
+    lines = data.split(b"\n")[:-1]
+    width = max(len(line) for line in lines)
+    return np.array(lines, dtype=f"S{width}").view(np.uint8).reshape(len(lines), width)
+
+
+def _int_column(table, start, end):
+    """Decodes a right aligned unsigned integer column, blanks are read as 0."""
+    digits = table[:, start:end].astype(np.int64) - ord("0")
+    digits[(digits < 0) | (digits > 9)] = 0
+    powers = 10 ** np.arange(end - start - 1, -1, -1, dtype=np.int64)
+    return digits @ powers
+
+
+def _float_columns(table, start, ncomp, width=12):
+    """Decodes ncomp adjacent fixed width float columns into a (n, ncomp) array."""
+    end = start + ncomp * width
+    if table.shape[1] < end:
+        table = np.pad(table, ((0, 0), (0, end - table.shape[1])), constant_values=ord(" "))
+    columns = np.ascontiguousarray(table[:, start:end]).view(f"S{width}")
+    return columns.astype(np.float64).reshape(len(table), ncomp)
+
+
+def read_frd_nodes(frd_data, block_ranges):
+    """Decodes node blocks into node numbers and a (n, 3) coordinate array."""
+    ids = []
+    coords = []
+    for start, end in block_ranges:
+        table = _record_table(frd_data[start:end])
+        table = table[table[:, 2] == _MINUS_ONE]
+        ids.append(_int_column(table, 3, 13))
+        coords.append(_float_columns(table, 13, 3))
+    if not ids:
+        return np.empty(0, dtype=np.int64), np.empty((0, 3))
+    return np.concatenate(ids), np.concatenate(coords)
+
+
+def read_frd_elements(frd_data, block_ranges):
+    """Decodes element blocks.
+
+    Returns element numbers, frd element types and a (n, 20) array with the
+    element nodes in frd node order, unused node columns are 0.
+    """
+    all_ids = []
+    all_types = []
+    all_nodes = []
+    for start, end in block_ranges:
+        table = _record_table(frd_data[start:end])
+        if table.shape[1] < 103:
+            table = np.pad(table, ((0, 0), (0, 103 - table.shape[1])))
+        is_element = table[:, 2] == _MINUS_ONE
+        is_nodes = table[:, 2] == _MINUS_TWO
+        element_table = table[is_element]
+        ids = _int_column(element_table, 3, 13)
+        types = _int_column(element_table, 13, 18)
+
+        # every -2 record belongs to the last -1 record before it
+        owner = (np.cumsum(is_element) - 1)[is_nodes]
+        valid = owner >= 0
+        owner = owner[valid]
+        node_table = table[is_nodes][valid]
+        line_in_element = np.arange(len(owner)) - np.searchsorted(owner, owner)
+
+        nodes = np.zeros((len(ids), 20), dtype=np.int64)
+        for column in range(10):
+            target = line_in_element * 10 + column
+            fits = target < 20
+            nodes[owner[fits], target[fits]] = _int_column(
+                node_table[fits], 3 + 10 * column, 13 + 10 * column
+            )
+        all_ids.append(ids)
+        all_types.append(types)
+        all_nodes.append(nodes)
+    if not all_ids:
+        return (
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+            np.empty((0, 20), dtype=np.int64),
+        )
+    return np.concatenate(all_ids), np.concatenate(all_types), np.concatenate(all_nodes)
+
+
+def read_frd_values(frd_data, block_range, ncomp):
+    """Decodes a nodal result block into node numbers and a (n, ncomp) value array."""
+    start, end = block_range
+    table = _record_table(frd_data[start:end])
+    table = table[table[:, 2] == _MINUS_ONE]
+    return _int_column(table, 3, 13), _float_columns(table, 13, ncomp)
+
+
+# ********* result structure *********
+def make_mesh_dict(ids, coords, elem_ids, elem_types, elem_nodes, inout_nodes=()):
+    """Builds the mesh part of the read_frd_result() dict from the decoded arrays."""
+    mesh = {"Nodes": dict(zip(ids.tolist(), map(FreeCAD.Vector, coords.tolist())))}
+    # same key order as importCcxFrdResults.read_frd_result()
+    for frd_type in (11, 12, 7, 8, 9, 10, 3, 6, 1, 4, 2, 5):
+        key, nnodes, order = FRD_ELEMENT_TYPES[frd_type]
+        selection = elem_types == frd_type
+        connectivity = elem_nodes[selection][:, list(order)]
+        if key == "Seg3Elem" and inout_nodes:
+            mesh[key] = _seg3_with_inout_nodes(elem_ids[selection], connectivity, inout_nodes)
+        else:
+            mesh[key] = dict(zip(elem_ids[selection].tolist(), map(tuple, connectivity.tolist())))
+    return mesh
+
+
+def _seg3_with_inout_nodes(elem_ids, connectivity, inout_nodes):
+    # D elements of 1D flow, the in- and outlet nodes get their special node
+    # elements not touching an in- or outlet node are not imported at all
+    elements = {}
+    for elem, (nd1, nd2, nd3) in zip(elem_ids.tolist(), connectivity.tolist()):
+        for inout in inout_nodes:
+            if nd1 == int(inout[1]):
+                # fluid inlet node numbering
+                elements[elem] = (int(inout[2]), nd3, nd1)
+            elif nd3 == int(inout[1]):
+                # fluid outlet node numbering
+                elements[elem] = (nd1, int(inout[2]), nd3)
+    return elements
+
+
+def read_frd_result_set(frd_data, result_set, inout_nodes=()):
+    """Decodes the blocks of one entry of the index_frd() "Results" list.
+
+    Returns a result set dict as used by importToolsFem.fill_femresult_mechanical().
+    """
+    mode_results = {"number": result_set["number"], "time": result_set["time"]}
+    components = {key: ncomp for name, key, ncomp in FRD_RESULT_BLOCKS}
+    for key, block_range in result_set["blocks"].items():
+        ids, values = read_frd_values(frd_data, block_range, components[key])
+        mode_results[key] = _make_value_dict(key, ids, values, inout_nodes)
+    return mode_results
+
+
+def _make_value_dict(key, ids, values, inout_nodes):
+    if key in ("disp", "heatflux"):
+        return dict(zip(ids.tolist(), map(FreeCAD.Vector, values.tolist())))
+    if key in ("stress", "strain"):
+        # CalculiX frd files: (Sxx, Syy, Szz, Sxy, Syz, Szx)
+        # FreeCAD:            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+        # thus exchange the last two entries
+        return dict(zip(ids.tolist(), map(tuple, values[:, [0, 1, 2, 3, 5, 4]].tolist())))
+    values = values[:, 0]
+    if key == "mflow":
+        # convert units to kg/s from t/s
+        values = values * 1000
+    if key in ("mflow", "npressure") and inout_nodes:
+        # the in- and outlet nodes get the value of the element node too
+        value_dict = {}
+        for elem, value in zip(ids.tolist(), values.tolist()):
+            value_dict[elem] = value
+            for inout in inout_nodes:
+                if elem == int(inout[1]):
+                    value_dict[int(inout[2])] = value
+        return value_dict
+    return dict(zip(ids.tolist(), values.tolist()))
+
+
+def read_frd_result(frd_input, lazy=False):
+    """Reads a calculix frd file by memory-mapped block decoding.
+
+    Returns the same dict as importCcxFrdResults.read_frd_result().
+    If lazy is True only the first result set is decoded, all others
+    just have the "number" and "time" keys, see femresult.resultloader.
+    """
+    Console.PrintMessage(f"Read ccx results from frd file: {frd_input}\n")
+    inout_nodes = read_inout_nodes(frd_input)
+
+    with open_frd(frd_input) as frd_data:
+        index = index_frd(frd_data)
+        ids, coords = read_frd_nodes(frd_data, index["Nodes"])
+        elem_ids, elem_types, elem_nodes = read_frd_elements(frd_data, index["Elements"])
+        results = []
+        for i, result_set in enumerate(index["Results"]):
+            if lazy and i > 0:
+                results.append({"number": result_set["number"], "time": result_set["time"]})
+            else:
+                results.append(read_frd_result_set(frd_data, result_set, inout_nodes))
+
+    mesh = make_mesh_dict(ids, coords, elem_ids, elem_types, elem_nodes, inout_nodes)
+
+    if not inout_nodes:
+        if results:
+            if "mflow" in results[0] or "npressure" in results[0]:
+                Console.PrintError("We have mflow or npressure, but no inout_nodes file.\n")
+    if not mesh["Nodes"]:
+        Console.PrintError("FEM: No nodes found in Frd file.\n")
+
+    mesh["Results"] = results
+    return mesh
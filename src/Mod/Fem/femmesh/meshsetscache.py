@@ -0,0 +1,123 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM mesh sets cache"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+# The mesh sets of constraints (node sets, element faces, node areas) only depend on
+# the mesh and on the reference shapes of the constraint. They are kept per analysis
+# between solver runs, thus a rerun after changing a material or a load value does not
+# need to search the mesh again. The entries are invalidated by femsolver.run._DocObserver
+# if the mesh, the constraint references or a referenced shape change. The cache is only
+# used after the observer has been attached, see activate().
+
+import copy
+
+import FreeCAD
+
+# analysis: { (kind, mesh name, constraint name, references key) : mesh set }
+_caches = {}
+
+_active = False
+
+
+def activate():
+    """Enables the cache, called when the document observer is attached."""
+    global _active
+    _active = True
+
+
+def deactivate():
+    """Disables the cache, the cached mesh sets are kept."""
+    global _active
+    _active = False
+
+
+def is_active():
+    return _active
+
+
+def get_references_key(references):
+    """((object name, (sub element, ...)), ...) of a references property value"""
+    return tuple((obj.Name, tuple(sub_elements)) for obj, sub_elements in references)
+
+
+def get_mesh_set(analysis, mesh_obj, kind, constraint_obj, compute):
+    """Returns the mesh set of kind for constraint_obj.
+
+    compute is called without parameter if the mesh set is not cached yet. A copy of
+    the cached value is returned, thus the caller is free to change it.
+    """
+    if not _active or analysis is None or mesh_obj is None:
+        return compute()
+    key = (
+        kind,
+        mesh_obj.Name,
+        constraint_obj.Name,
+        get_references_key(constraint_obj.References),
+    )
+    cache = _caches.setdefault(analysis, {})
+    if key in cache:
+        FreeCAD.Console.PrintLog(f"    {kind} of {constraint_obj.Name} taken from cache.\n")
+        return copy.deepcopy(cache[key])
+    mesh_set = compute()
+    cache[key] = copy.deepcopy(mesh_set)
+    return mesh_set
+
+
+def invalidate(obj):
+    """Removes all cached mesh sets which depend on the document object obj.
+
+    These are the mesh sets of obj if obj is a mesh or a constraint
+    and the mesh sets of constraints referencing obj.
+    """
+    for analysis, cache in _caches.items():
+        if analysis.Document != obj.Document:
+            continue
+        for key in list(cache):
+            kind, mesh_name, constraint_name, references = key
+            if obj.Name in (mesh_name, constraint_name) or any(
+                ref_name == obj.Name for ref_name, _ in references
+            ):
+                del cache[key]
+
+
+def remove_document(doc):
+    """Removes the caches of all analyses of the document doc."""
+    for analysis in [a for a in _caches if a.Document == doc]:
+        del _caches[analysis]
+
+
+def clear(analysis=None):
+    """Removes the cache of analysis or all caches if analysis is None."""
+    if analysis is None:
+        _caches.clear()
+    else:
+        _caches.pop(analysis, None)
+
+
+##  @}
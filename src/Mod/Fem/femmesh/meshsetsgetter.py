@@ -32,6 +32,7 @@ import time
 
 import FreeCAD
 
+from femmesh import meshsetscache
 from femmesh import meshtools
 from femtools.femutils import type_of_obj
 
@@ -156,6 +157,34 @@ class MeshSetsGetter:
         setstime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(f"Getting mesh data time: {setstime} seconds.\n")
 
+    # ********************************************************************************************
+    # ********************************************************************************************
+    # mesh sets which only depend on the mesh and the references of a constraint
+    # are kept in the analysis cache of femmesh.meshsetscache between solver runs
+    def get_cached_mesh_set(self, kind, femobj, compute):
+        return meshsetscache.get_mesh_set(
+            self.analysis, self.mesh_object, kind, femobj["Object"], compute
+        )
+
+    def get_femnodes_by_femobj(self, femobj):
+        return self.get_cached_mesh_set(
+            "Nodes",
+            femobj,
+            lambda: meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj),
+        )
+
+    def get_femelement_tables(self):
+        # femelement_table and femnodes_ele_table, only calculated once
+        if not self.femnodes_mesh:
+            self.femnodes_mesh = self.femmesh.Nodes
+        if not self.femelement_table:
+            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+        if not self.femnodes_ele_table:
+            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
+                self.femnodes_mesh, self.femelement_table
+            )
+        return self.femelement_table, self.femnodes_ele_table
+
     # ********************************************************************************************
     # ********************************************************************************************
     # node sets
@@ -166,7 +195,7 @@ class MeshSetsGetter:
         for femobj in self.member.cons_fixed:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_femnodes_by_femobj(femobj)
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
@@ -201,7 +230,7 @@ class MeshSetsGetter:
         for femobj in self.member.cons_rigidbody:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_femnodes_by_femobj(femobj)
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
@@ -213,7 +242,7 @@ class MeshSetsGetter:
         for femobj in self.member.cons_displacement:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_femnodes_by_femobj(femobj)
             # add nodes to constraint_conflict_nodes, needed by constraint plane rotation
             for node in femobj["Nodes"]:
                 self.constraint_conflict_nodes.append(node)
@@ -225,7 +254,7 @@ class MeshSetsGetter:
         for femobj in self.member.cons_planerotation:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_femnodes_by_femobj(femobj)
 
     def get_constraints_transform_nodes(self):
         if not self.member.cons_transform:
@@ -234,7 +263,7 @@ class MeshSetsGetter:
         for femobj in self.member.cons_transform:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_femnodes_by_femobj(femobj)
 
     def get_constraints_temperature_nodes(self):
         if not self.member.cons_temperature:
@@ -243,7 +272,7 @@ class MeshSetsGetter:
         for femobj in self.member.cons_temperature:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_femnodes_by_femobj(femobj)
 
     def get_constraints_fluidsection_nodes(self):
         if not self.member.geos_fluidsection:
@@ -252,7 +281,7 @@ class MeshSetsGetter:
         for femobj in self.member.geos_fluidsection:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(self.femmesh, femobj)
+            femobj["Nodes"] = self.get_femnodes_by_femobj(femobj)
 
     def get_constraints_electrostatic_nodes(self):
         if not self.member.cons_electrostatic:
@@ -262,42 +291,11 @@ class MeshSetsGetter:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             if femobj["Object"].BoundaryCondition == "Dirichlet":
                 print_obj_info(femobj["Object"])
-                femobj["Nodes"] = meshtools.get_femnodes_by_femobj_with_references(
-                    self.femmesh, femobj
-                )
+                femobj["Nodes"] = self.get_femnodes_by_femobj(femobj)
 
     def get_constraints_force_nodeloads(self):
         if not self.member.cons_force:
             return
-        # check shape type of reference shape
-        for femobj in self.member.cons_force:
-            # femobj --> dict, FreeCAD document object is femobj["Object"]
-            print_obj_info(femobj["Object"], log=True)
-            if femobj["RefShapeType"] == "Vertex":
-                FreeCAD.Console.PrintLog(
-                    "    load on vertices --> The femelement_table "
-                    "and femnodes_mesh are not needed for node load calculation.\n"
-                )
-            elif (
-                femobj["RefShapeType"] == "Face"
-                and meshtools.is_solid_femmesh(self.femmesh)
-                and not meshtools.has_no_face_data(self.femmesh)
-            ):
-                FreeCAD.Console.PrintLog(
-                    "    solid_mesh with face data --> The femelement_table is not "
-                    "needed but the femnodes_mesh is needed for node load calculation.\n"
-                )
-                if not self.femnodes_mesh:
-                    self.femnodes_mesh = self.femmesh.Nodes
-            else:
-                FreeCAD.Console.PrintLog(
-                    "    mesh without needed data --> The femelement_table "
-                    "and femnodes_mesh are not needed for node load calculation.\n"
-                )
-                if not self.femnodes_mesh:
-                    self.femnodes_mesh = self.femmesh.Nodes
-                if not self.femelement_table:
-                    self.femelement_table = meshtools.get_femelement_table(self.femmesh)
         # get node loads
         FreeCAD.Console.PrintLog(
             "    Finite element mesh nodes will be retrieved by searching "
@@ -318,14 +316,53 @@ class MeshSetsGetter:
                     self.femmesh, frc_obj
                 )
             elif femobj["RefShapeType"] == "Edge":  # line load on edges
+                self.get_force_mesh_data(femobj)
                 femobj["NodeLoadTable"] = meshtools.get_force_obj_edge_nodeload_table(
                     self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
                 )
             elif femobj["RefShapeType"] == "Face":  # area load on faces
+                # the node areas do not depend on the force value
+                face_node_areas = self.get_cached_mesh_set(
+                    "ForceFaceNodeAreas", femobj, lambda: self.get_force_face_node_areas(femobj)
+                )
                 femobj["NodeLoadTable"] = meshtools.get_force_obj_face_nodeload_table(
-                    self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
+                    self.femmesh,
+                    self.femelement_table,
+                    self.femnodes_mesh,
+                    frc_obj,
+                    face_node_areas,
                 )
 
+    def get_force_face_node_areas(self, femobj):
+        self.get_force_mesh_data(femobj)
+        return meshtools.get_force_obj_face_node_areas(
+            self.femmesh, self.femelement_table, self.femnodes_mesh, femobj["Object"]
+        )
+
+    def get_force_mesh_data(self, femobj):
+        # check shape type of reference shape
+        print_obj_info(femobj["Object"], log=True)
+        if (
+            femobj["RefShapeType"] == "Face"
+            and meshtools.is_solid_femmesh(self.femmesh)
+            and not meshtools.has_no_face_data(self.femmesh)
+        ):
+            FreeCAD.Console.PrintLog(
+                "    solid_mesh with face data --> The femelement_table is not "
+                "needed but the femnodes_mesh is needed for node load calculation.\n"
+            )
+            if not self.femnodes_mesh:
+                self.femnodes_mesh = self.femmesh.Nodes
+        else:
+            FreeCAD.Console.PrintLog(
+                "    mesh without needed data --> The femelement_table "
+                "and femnodes_mesh are not needed for node load calculation.\n"
+            )
+            if not self.femnodes_mesh:
+                self.femnodes_mesh = self.femmesh.Nodes
+            if not self.femelement_table:
+                self.femelement_table = meshtools.get_femelement_table(self.femmesh)
+
     # ********************************************************************************************
     # ********************************************************************************************
     # faces sets
@@ -347,20 +384,15 @@ class MeshSetsGetter:
             # print(femobj["PressureFaces"])
         """
 
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh, self.femelement_table
-            )
-
         for femobj in self.member.cons_pressure:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            pressure_faces = meshtools.get_pressure_obj_faces(
-                self.femmesh, self.femelement_table, self.femnodes_ele_table, femobj
+            pressure_faces = self.get_cached_mesh_set(
+                "PressureFaces",
+                femobj,
+                lambda: meshtools.get_pressure_obj_faces(
+                    self.femmesh, *self.get_femelement_tables(), femobj
+                ),
             )
             # the data model is for compatibility reason with deprecated version
             # get_pressure_obj_faces_depreciated returns the face ids in a tuple per ref_shape
@@ -431,20 +463,16 @@ class MeshSetsGetter:
     def get_constraints_contact_faces(self):
         if not self.member.cons_contact:
             return
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh, self.femelement_table
-            )
 
         for femobj in self.member.cons_contact:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            contact_slave_faces, contact_master_faces = meshtools.get_contact_obj_faces(
-                self.femmesh, self.femelement_table, self.femnodes_ele_table, femobj
+            contact_slave_faces, contact_master_faces = self.get_cached_mesh_set(
+                "ContactFaces",
+                femobj,
+                lambda: meshtools.get_contact_obj_faces(
+                    self.femmesh, *self.get_femelement_tables(), femobj
+                ),
             )
             # [ele_id, ele_face_id], [ele_id, ele_face_id], ...]
             # whereas the ele_face_id might be ccx specific
@@ -463,20 +491,16 @@ class MeshSetsGetter:
     def get_constraints_tie_faces(self):
         if not self.member.cons_tie:
             return
-        if not self.femnodes_mesh:
-            self.femnodes_mesh = self.femmesh.Nodes
-        if not self.femelement_table:
-            self.femelement_table = meshtools.get_femelement_table(self.femmesh)
-        if not self.femnodes_ele_table:
-            self.femnodes_ele_table = meshtools.get_femnodes_ele_table(
-                self.femnodes_mesh, self.femelement_table
-            )
 
         for femobj in self.member.cons_tie:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             print_obj_info(femobj["Object"])
-            slave_faces, master_faces = meshtools.get_tie_obj_faces(
-                self.femmesh, self.femelement_table, self.femnodes_ele_table, femobj
+            slave_faces, master_faces = self.get_cached_mesh_set(
+                "TieFaces",
+                femobj,
+                lambda: meshtools.get_tie_obj_faces(
+                    self.femmesh, *self.get_femelement_tables(), femobj
+                ),
             )
             # [ele_id, ele_face_id], [ele_id, ele_face_id], ...]
             # whereas the ele_face_id might be ccx specific
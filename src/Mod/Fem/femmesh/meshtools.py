@@ -27,6 +27,8 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import itertools
+
 import numpy as np
 
 import FreeCAD
@@ -170,6 +172,68 @@ def get_femelement_edges_table(femmesh, edges_only=None):
     return table
 
 
+# ************************************************************************************************
+class FemNodesEleTable:
+    """node element incidence table of a femelement_table in compressed sparse row layout
+
+    For node n the incidences are stored in the range offsets[n]:offsets[n + 1] of the flat
+    arrays. element_index holds the index of the element in element_ids, the order of the
+    femelement_table is kept. positions holds the position of the node in the element
+    coded as a set bit in an integer, see get_femnodes_ele_table().
+    """
+
+    def __init__(self, femnodes_mesh, femelement_table):
+        ele_count = len(femelement_table)
+        self.element_ids = np.fromiter(femelement_table.keys(), dtype=np.int64, count=ele_count)
+        self.element_node_counts = np.fromiter(
+            map(len, femelement_table.values()), dtype=np.int64, count=ele_count
+        )
+        ele_nodes = np.fromiter(
+            itertools.chain.from_iterable(femelement_table.values()),
+            dtype=np.int64,
+            count=int(self.element_node_counts.sum()),
+        )
+        ele_starts = np.cumsum(self.element_node_counts) - self.element_node_counts
+        node_positions = np.arange(len(ele_nodes)) - np.repeat(ele_starts, self.element_node_counts)
+
+        self.node_count = len(femnodes_mesh)
+        max_node = max(max(femnodes_mesh, default=0), int(ele_nodes.max(initial=0)))
+        self.offsets = np.zeros(max_node + 2, dtype=np.int64)
+        np.cumsum(np.bincount(ele_nodes, minlength=max_node + 1), out=self.offsets[1:])
+        # stable sort keeps the element order for each node
+        order = np.argsort(ele_nodes, kind="stable")
+        self.element_index = np.repeat(np.arange(ele_count), self.element_node_counts)[order]
+        self.positions = np.left_shift(1, node_positions)[order]
+
+    def __len__(self):
+        return self.node_count
+
+    def __getitem__(self, node):
+        """[[eleID, NodePosition], ...] of a node"""
+        rng = slice(self.offsets[node], self.offsets[node + 1])
+        return [
+            [int(self.element_ids[e]), int(p)]
+            for e, p in zip(self.element_index[rng], self.positions[rng])
+        ]
+
+    def get_bit_patterns(self, node_set):
+        """bit patterns of all elements which have at least one node of node_set
+        returns the arrays element_ids, element_node_counts and bit_patterns
+        in the order of the femelement_table
+        """
+        nodes = np.unique(np.asarray(node_set, dtype=np.int64))
+        nodes = nodes[(nodes >= 0) & (nodes < len(self.offsets) - 1)]
+        starts = self.offsets[nodes]
+        counts = self.offsets[nodes + 1] - starts
+        incidences = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(
+            counts.sum()
+        )
+        patterns = np.zeros(len(self.element_ids), dtype=np.int64)
+        np.bitwise_or.at(patterns, self.element_index[incidences], self.positions[incidences])
+        touched = np.flatnonzero(patterns)
+        return self.element_ids[touched], self.element_node_counts[touched], patterns[touched]
+
+
 # ************************************************************************************************
 def get_femnodes_ele_table(femnodes_mesh, femelement_table):
     """the femnodes_ele_table contains for each node its membership in elements
@@ -186,19 +250,12 @@ def get_femnodes_ele_table(femnodes_mesh, femelement_table):
     volume or face or edgemesh the femnodes_ele_table only
     has either volume or face or edge elements
     see get_femelement_table()
+    The table is a FemNodesEleTable, indexing it by a nodeID returns the list above.
+    It is stored as flat arrays, thus building and searching it scales linearly
+    with the mesh size.
     """
-    femnodes_ele_table = {}  # node_dict in ulrichs class
-    for n in femnodes_mesh:  # initialize it with sorted node keys and empty lists
-        femnodes_ele_table[n] = []
-    for ele in femelement_table:
-        ele_list = femelement_table[ele]
-        # FreeCAD.Console.PrintMessage("{}\n".format(ele_list))
-        pos = int(1)
-        for ele_node in ele_list:
-            femnodes_ele_table[ele_node].append([ele, pos])
-            pos = pos << 1
+    femnodes_ele_table = FemNodesEleTable(femnodes_mesh, femelement_table)
     FreeCAD.Console.PrintLog(f"len femnodes_ele_table: {len(femnodes_ele_table)}\n")
-    FreeCAD.Console.PrintLog(f"femnodes_ele_table: {femnodes_ele_table}\n")
     return femnodes_ele_table
 
 
@@ -223,21 +280,19 @@ def get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_set):
     or has this element a face we are searching for?
     The number in the ele_dict is organized as a bit array.
     The corresponding bit is set, if the node of the node_set is contained in the element.
+    Only elements with at least one node in the node_set are added, all other elements
+    would have an empty bit array and could not match any search mask anyway.
     """
-    # print("BIT PATTERN", femelement_table, femnodes_ele_table, node_set)
     FreeCAD.Console.PrintLog("len femnodes_ele_table: " + str(len(femnodes_ele_table)) + "\n")
     FreeCAD.Console.PrintLog("len node_set: " + str(len(node_set)) + "\n")
-    FreeCAD.Console.PrintLog(f"node_set: {node_set}\n")
-    bit_pattern_dict = get_copy_of_empty_femelement_table(femelement_table)
-    # # initializing the bit_pattern_dict
-    for ele in femelement_table:
-        len_ele = len(femelement_table[ele])
-        bit_pattern_dict[ele] = [len_ele, 0]
-    for node in node_set:
-        for nList in femnodes_ele_table[node]:
-            bit_pattern_dict[nList[0]][1] += nList[1]
+    ele_ids, ele_node_counts, bit_patterns = femnodes_ele_table.get_bit_patterns(node_set)
+    bit_pattern_dict = {
+        ele: [len_ele, pattern]
+        for ele, len_ele, pattern in zip(
+            ele_ids.tolist(), ele_node_counts.tolist(), bit_patterns.tolist()
+        )
+    }
     FreeCAD.Console.PrintLog("len bit_pattern_dict: " + str(len(bit_pattern_dict)) + "\n")
-    # FreeCAD.Console.PrintMessage("bit_pattern_dict: {}\n".format(bit_pattern_dict))
     return bit_pattern_dict
 
 
@@ -355,16 +410,13 @@ def get_femelements_by_femnodes_bin(femelement_table, femnodes_ele_table, node_l
     blind fast binary search, but works for volumes only
     """
     FreeCAD.Console.PrintMessage("binary search: get_femelements_by_femnodes_bin\n")
-    vol_masks = {4: 15, 6: 63, 8: 255, 10: 1023, 15: 32767, 20: 1048575}
-    # Now we are looking for nodes inside of the Volumes = filling the bit_pattern_dict
+    # Now we are looking for nodes inside of the Volumes = filling the bit patterns
+    # an element is found if the bits of all its nodes are set
     FreeCAD.Console.PrintMessage(f"len femnodes_ele_table: {len(femnodes_ele_table)}\n")
-    bit_pattern_dict = get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_list)
+    ele_ids, ele_node_counts, bit_patterns = femnodes_ele_table.get_bit_patterns(node_list)
     # search
-    ele_list = []  # The ele_list contains the result of the search.
-    for ele in bit_pattern_dict:
-        FreeCAD.Console.PrintLog(f"bit_pattern_dict[ele][0]: {bit_pattern_dict[ele][0]}\n")
-        if bit_pattern_dict[ele][1] == vol_masks[bit_pattern_dict[ele][0]]:
-            ele_list.append(ele)
+    # The ele_list contains the result of the search.
+    ele_list = ele_ids[bit_patterns == np.left_shift(1, ele_node_counts) - 1].tolist()
     FreeCAD.Console.PrintMessage(f"found Volumes: {len(ele_list)}\n")
     # FreeCAD.Console.PrintMessage("   volumes: {}\n".format(ele_list))
     return ele_list
@@ -1027,71 +1079,55 @@ def get_ref_edgenodes_lengths(femnodes_mesh, edge_table):
 
 # ***** Face loads *******************************************************************************
 # get_force_obj_face_nodeload_table
+# get_force_obj_face_node_areas
 # get_ref_facenodes_table
 # get_ref_facenodes_areas
 # build_mesh_faces_of_volume_elements
-def get_force_obj_face_nodeload_table(femmesh, femelement_table, femnodes_mesh, frc_obj):
+def get_force_obj_face_nodeload_table(
+    femmesh, femelement_table, femnodes_mesh, frc_obj, face_node_areas=None
+):
     # force_obj_node_load_table:
     #     [
     #         ("refshape_name.elemname",node_load_table),
     #         ...,
     #         ("refshape_name.elemname",node_load_table)
     #     ]
+    # face_node_areas: see get_force_obj_face_node_areas
+    # they only depend on the mesh and the reference faces, thus they can be reused
+    # for another force value, if None they are calculated
+    if face_node_areas is None:
+        face_node_areas = get_force_obj_face_node_areas(
+            femmesh, femelement_table, femnodes_mesh, frc_obj
+        )
     force_obj_node_load_table = []
     sum_ref_face_area = 0
     sum_ref_face_node_area = 0  # for debugging
     sum_node_load = 0  # for debugging
-    for o, elem_tup in frc_obj.References:
-        for elem in elem_tup:
-            ref_face = sub_shape_at_global_placement(o, elem)
-            FreeCAD.Console.PrintMessage(
-                "    "
-                "ReferenceShape ... Type: {}, "
-                "Object name: {}, "
-                "Object label: {}, "
-                "Element name: {}\n".format(ref_face.ShapeType, o.Name, o.Label, elem)
-            )
-            sum_ref_face_area += ref_face.Area
+    for o_name, elem, ref_face_area, node_sum_area_table in face_node_areas:
+        sum_ref_face_area += ref_face_area
     if sum_ref_face_area != 0:
         force_quantity = FreeCAD.Units.Quantity(frc_obj.Force.getValueAs("N"))
         force_per_sum_ref_face_area = force_quantity / sum_ref_face_area
-    for o, elem_tup in frc_obj.References:
-        for elem in elem_tup:
-            ref_face = sub_shape_at_global_placement(o, elem)
-
-            # face_table:
-            #    { meshfaceID : ( nodeID, ... , nodeID ) }
-            face_table = get_ref_facenodes_table(femmesh, femelement_table, ref_face)
-
-            # node_area_table:
-            #    [ (nodeID, Area), ... , (nodeID, Area) ]
-            # some nodes will have more than one entry
-            node_area_table = get_ref_facenodes_areas(femnodes_mesh, face_table)
-
-            # node_sum_area_table:
-            #    { nodeID : Area, ... , nodeID : Area }
-            # AreaSum for each node, one entry for each node
-            node_sum_area_table = get_ref_shape_node_sum_geom_table(node_area_table)
+    for o_name, elem, ref_face_area, node_sum_area_table in face_node_areas:
+        # node_load_table:
+        #    { nodeID : NodeLoad, ... , nodeID : NodeLoad }
+        # NodeLoad for each node, one entry for each node
+        node_load_table = {}
+        sum_node_areas = 0  # for debugging
+        for node in node_sum_area_table:
+            sum_node_areas += node_sum_area_table[node]  # for debugging
+            node_load_table[node] = node_sum_area_table[node] * force_per_sum_ref_face_area
+        ratio_refface_areas = sum_node_areas / ref_face_area
+        if ratio_refface_areas < 0.99 or ratio_refface_areas > 1.01:
+            FreeCAD.Console.PrintError(
+                "Error on: " + frc_obj.Name + " --> " + o_name + "." + elem + "\n"
+            )
+            FreeCAD.Console.PrintMessage(f"  sum_node_areas: {sum_node_areas}\n")
+            FreeCAD.Console.PrintMessage(f"  ref_face_area:  {ref_face_area}\n")
+        sum_ref_face_node_area += sum_node_areas
 
-            # node_load_table:
-            #    { nodeID : NodeLoad, ... , nodeID : NodeLoad }
-            # NodeLoad for each node, one entry for each node
-            node_load_table = {}
-            sum_node_areas = 0  # for debugging
-            for node in node_sum_area_table:
-                sum_node_areas += node_sum_area_table[node]  # for debugging
-                node_load_table[node] = node_sum_area_table[node] * force_per_sum_ref_face_area
-            ratio_refface_areas = sum_node_areas / ref_face.Area
-            if ratio_refface_areas < 0.99 or ratio_refface_areas > 1.01:
-                FreeCAD.Console.PrintError(
-                    "Error on: " + frc_obj.Name + " --> " + o.Name + "." + elem + "\n"
-                )
-                FreeCAD.Console.PrintMessage(f"  sum_node_areas: {sum_node_areas}\n")
-                FreeCAD.Console.PrintMessage(f"  ref_face_area:  {ref_face.Area}\n")
-            sum_ref_face_node_area += sum_node_areas
-
-            elem_info_string = "node loads on shape: " + o.Name + ":" + elem
-            force_obj_node_load_table.append((elem_info_string, node_load_table))
+        elem_info_string = "node loads on shape: " + o_name + ":" + elem
+        force_obj_node_load_table.append((elem_info_string, node_load_table))
 
     for ref_shape in force_obj_node_load_table:
         for node in ref_shape[1]:
@@ -1117,6 +1153,43 @@ def get_force_obj_face_nodeload_table(femmesh, femelement_table, femnodes_mesh,
     return force_obj_node_load_table
 
 
+def get_force_obj_face_node_areas(femmesh, femelement_table, femnodes_mesh, frc_obj):
+    # face_node_areas:
+    #     [
+    #         (refshape_name, elemname, ref_face_area, node_sum_area_table),
+    #         ...,
+    #         (refshape_name, elemname, ref_face_area, node_sum_area_table)
+    #     ]
+    face_node_areas = []
+    for o, elem_tup in frc_obj.References:
+        for elem in elem_tup:
+            ref_face = sub_shape_at_global_placement(o, elem)
+            FreeCAD.Console.PrintMessage(
+                "    "
+                "ReferenceShape ... Type: {}, "
+                "Object name: {}, "
+                "Object label: {}, "
+                "Element name: {}\n".format(ref_face.ShapeType, o.Name, o.Label, elem)
+            )
+
+            # face_table:
+            #    { meshfaceID : ( nodeID, ... , nodeID ) }
+            face_table = get_ref_facenodes_table(femmesh, femelement_table, ref_face)
+
+            # node_area_table:
+            #    [ (nodeID, Area), ... , (nodeID, Area) ]
+            # some nodes will have more than one entry
+            node_area_table = get_ref_facenodes_areas(femnodes_mesh, face_table)
+
+            # node_sum_area_table:
+            #    { nodeID : Area, ... , nodeID : Area }
+            # AreaSum for each node, one entry for each node
+            node_sum_area_table = get_ref_shape_node_sum_geom_table(node_area_table)
+
+            face_node_areas.append((o.Name, elem, ref_face.Area, node_sum_area_table))
+    return face_node_areas
+
+
 # ************************************************************************************************
 def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
     face_table = {}  # { meshfaceID : ( nodeID, ... , nodeID ) }
@@ -2290,59 +2363,83 @@ def use_correct_fluidinout_ele_def(FluidInletoutlet_ele, fileName, fluid_inout_n
     inout_nodes_file.close()
 
 
+# ************************************************************************************************
+def get_node_arrays(femmesh):
+    """
+    returns the node ids and a (number of nodes, 3) array of the node coordinates,
+    both sorted by node id, read with one call of the bulk array API of the FemMesh
+    """
+    node_ids, coords = femmesh.getNodeArrays()
+    return np.asarray(node_ids), np.asarray(coords).reshape(-1, 3)
+
+
+def get_element_arrays(femmesh, ele_type):
+    """
+    returns the element ids, the node counts and the concatenated element nodes
+    of all elements of ele_type ("Edge", "Face" or "Volume") sorted by element id
+    """
+    ele_ids, node_counts, nodes = femmesh.getElementArrays(ele_type)
+    return np.asarray(ele_ids), np.asarray(node_counts), np.asarray(nodes)
+
+
+def get_element_groups(ele_ids, node_counts, nodes):
+    """
+    splits the element arrays of get_element_arrays() by the node count
+    returns {node count: (element ids, (number of elements, node count) array of nodes)}
+    """
+    offsets = np.concatenate(([0], np.cumsum(node_counts)[:-1])).astype(np.int64)
+    groups = {}
+    for count in np.unique(node_counts).tolist():
+        selected = node_counts == count
+        groups[count] = (ele_ids[selected], nodes[offsets[selected, None] + np.arange(count)])
+    return groups
+
+
+def add_element_arrays(femmesh, ele_type, ele_ids, node_counts, nodes):
+    """
+    adds elements of ele_type given by arrays like returned by get_element_arrays()
+    with one addElements() call per node count
+    """
+    for count, (ids, ele_nodes) in get_element_groups(ele_ids, node_counts, nodes).items():
+        femmesh.addElements(ele_type, ele_nodes, count, ids)
+
+
 # ************************************************************************************************
 def compact_mesh(old_femmesh):
     """
     removes all gaps in node and element ids, start ids with 1
     returns a tuple (FemMesh, node_assignment_map, element_assignment_map)
     """
-    node_map = {}  # {old_node_id: new_node_id, ...}
-    elem_map = {}  # {old_elem_id: new_elem_id, ...}
-    old_nodes = old_femmesh.Nodes
     import Fem
 
     new_mesh = Fem.FemMesh()
 
-    if old_nodes:
-        for i, n in enumerate(old_nodes):
-            nid = i + 1
-            new_mesh.addNode(old_nodes[n].x, old_nodes[n].y, old_nodes[n].z, nid)
-            node_map[n] = nid
+    old_node_ids, coords = get_node_arrays(old_femmesh)
+    new_node_ids = np.arange(1, len(old_node_ids) + 1)
+    new_mesh.addNodes(coords, new_node_ids)
+    # {old_node_id: new_node_id, ...}
+    node_map = dict(zip(old_node_ids.tolist(), new_node_ids.tolist()))
 
     # element id is one id for Edges, Faces and Volumes
     # thus should not start with 0 for each element type
     # because this will give an error for mixed meshes
     # because the id is used already
     # https://forum.freecad.org/viewtopic.php?t=48215
+    elem_map = {}  # {old_elem_id: new_elem_id, ...}
     ele_id = 1
-    if old_femmesh.Edges:
-        for ed in old_femmesh.Edges:
-            old_elem_nodes = old_femmesh.getElementNodes(ed)
-            new_elemnodes = []
-            for old_node_id in old_elem_nodes:
-                new_elemnodes.append(node_map[old_node_id])
-            new_mesh.addEdge(new_elemnodes, ele_id)
-            elem_map[ed] = ele_id
-            ele_id += 1
-    if old_femmesh.Faces:
-        for fa in old_femmesh.Faces:
-            ele_id += 1
-            old_elem_nodes = old_femmesh.getElementNodes(fa)
-            new_elemnodes = []
-            for old_node_id in old_elem_nodes:
-                new_elemnodes.append(node_map[old_node_id])
-            new_mesh.addFace(new_elemnodes, ele_id)
-            elem_map[fa] = ele_id
-            ele_id += 1
-    if old_femmesh.Volumes:
-        for vo in old_femmesh.Volumes:
-            old_elem_nodes = old_femmesh.getElementNodes(vo)
-            new_elemnodes = []
-            for old_node_id in old_elem_nodes:
-                new_elemnodes.append(node_map[old_node_id])
-            new_mesh.addVolume(new_elemnodes, ele_id)
-            elem_map[vo] = ele_id
-            ele_id += 1
+    for ele_type in ("Edge", "Face", "Volume"):
+        old_ele_ids, node_counts, old_nodes = get_element_arrays(old_femmesh, ele_type)
+        if ele_type == "Face":
+            # face ids are counted up by two, as it was done ever since
+            new_ele_ids = ele_id + 1 + 2 * np.arange(len(old_ele_ids))
+            ele_id += 2 * len(old_ele_ids)
+        else:
+            new_ele_ids = ele_id + np.arange(len(old_ele_ids))
+            ele_id += len(old_ele_ids)
+        # old_node_ids are sorted, the new id of a node is its position + 1
+        new_nodes = np.searchsorted(old_node_ids, old_nodes) + 1
+        add_element_arrays(new_mesh, ele_type, new_ele_ids, node_counts, new_nodes)
+        elem_map.update(zip(old_ele_ids.tolist(), new_ele_ids.tolist()))
 
     # may be return another value if the mesh was compacted, just check last map entries
     return (new_mesh, node_map, elem_map)
@@ -61,6 +61,8 @@ class ResultMechanical(base_fempythonobject.BaseFemPythonObject):
         )
         obj.setPropertyStatus("EigenmodeFrequency", "LockDynamic")
 
+        self.add_lazy_loading_properties(obj)
+
         # node results
         # set read only or hide a property:
         # https://forum.freecad.org/viewtopic.php?f=18&t=13460&start=10#p108072
@@ -255,3 +257,28 @@ class ResultMechanical(base_fempythonobject.BaseFemPythonObject):
             for i in range(12, -1, -1):
                 del temp[3 * i + 1]
             obj.Stats = temp
+
+        # migrate old result objects, lazy loading of result sets was added
+        if not hasattr(obj, "ResultSetIndex"):
+            self.add_lazy_loading_properties(obj)
+
+    def add_lazy_loading_properties(self, obj):
+        # result file and result set the data is loaded from on demand
+        # see module femresult/resultloader.py
+        obj.addProperty(
+            "App::PropertyString",
+            "ResultFile",
+            "Base",
+            "Result file the result set is loaded from on demand",
+            True,
+        )
+        obj.setPropertyStatus("ResultFile", "LockDynamic")
+        obj.addProperty(
+            "App::PropertyInteger",
+            "ResultSetIndex",
+            "Base",
+            "Index of the result set in the result file, -1 if data is stored in this object",
+            True,
+        )
+        obj.setPropertyStatus("ResultSetIndex", "LockDynamic")
+        obj.ResultSetIndex = -1
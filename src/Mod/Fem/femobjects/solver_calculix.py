@@ -183,6 +183,15 @@ class SolverCalculiX(base_fempythonobject.BaseFemPythonObject):
                 value=False,
             )
         )
+        prop.append(
+            _PropHelper(
+                type="App::PropertyBool",
+                name="IncrementalInputWriter",
+                group="Solver",
+                doc="Split writing of ccx input file and only rewrite the changed include files",
+                value=False,
+            )
+        )
         prop.append(
             _PropHelper(
                 type="App::PropertyString",
@@ -0,0 +1,160 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Fem lazy loading of result sets"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+# With the preference LazyResultLoading importCcxFrdResults.importFrd() fills only
+# the first result set of a multi step frd file. All other result objects get
+# the properties ResultFile and ResultSetIndex and their data is decoded when
+# the result is shown or queried. The frd block index is built once per file.
+# Only the last LazyResultCacheSize loaded result objects keep their node data,
+# older ones are unloaded again.
+
+import os
+from collections import OrderedDict
+
+import FreeCAD
+
+
+# frd file name: (modification time, size, index of readCcxFrd.index_frd())
+_frd_indices = {}
+
+# (document name, object name) of result objects loaded on demand, least recent first
+_loaded_results = OrderedDict()
+
+# node data properties which are kept when a result object is unloaded
+_KEEP_ON_UNLOAD = ("NodeNumbers", "UserDefined")
+
+
+def get_cache_size():
+    fem_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+    return max(1, fem_prefs.GetInt("LazyResultCacheSize", 4))
+
+
+def is_lazy_result(res_obj):
+    """Returns True if the data of the result object is loaded on demand."""
+    return getattr(res_obj, "ResultSetIndex", -1) >= 0 and bool(res_obj.ResultFile)
+
+
+def is_result_loaded(res_obj):
+    """Returns True if the result object holds its data."""
+    if not is_lazy_result(res_obj):
+        return True
+    return (res_obj.Document.Name, res_obj.Name) in _loaded_results
+
+
+def load_result(res_obj):
+    """Loads the data of a lazy result object if not already loaded.
+
+    Returns the result object. Result objects which are not lazy are returned untouched.
+    """
+    if not is_lazy_result(res_obj):
+        return res_obj
+    key = (res_obj.Document.Name, res_obj.Name)
+    if key in _loaded_results:
+        _loaded_results.move_to_end(key)
+        return res_obj
+
+    result_set = _read_result_set(res_obj.ResultFile, res_obj.ResultSetIndex)
+    if result_set is None:
+        return res_obj
+
+    from feminout import importCcxFrdResults
+    from feminout import importToolsFem
+
+    FreeCAD.Console.PrintLog(
+        f"Load result set {res_obj.ResultSetIndex} of {res_obj.ResultFile} "
+        f"into {res_obj.Name}.\n"
+    )
+    # NodeNumbers are set on import already, they may be compacted
+    node_numbers = res_obj.NodeNumbers
+    res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
+    if node_numbers and not res_obj.MassFlowRate:
+        res_obj.NodeNumbers = node_numbers
+    res_obj = importCcxFrdResults.add_derived_results(res_obj)
+
+    _loaded_results[key] = None
+    while len(_loaded_results) > get_cache_size():
+        (doc_name, obj_name), _ = _loaded_results.popitem(last=False)
+        doc = FreeCAD.listDocuments().get(doc_name)
+        obj = doc.getObject(obj_name) if doc else None
+        if obj:
+            unload_result(obj)
+    return res_obj
+
+
+def unload_result(res_obj):
+    """Frees the node data of a lazy result object, Stats are kept."""
+    if not is_lazy_result(res_obj):
+        return
+    _loaded_results.pop((res_obj.Document.Name, res_obj.Name), None)
+    FreeCAD.Console.PrintLog(f"Unload result data of {res_obj.Name}.\n")
+    for prop in res_obj.PropertiesList:
+        if res_obj.getGroupOfProperty(prop) == "NodeData" and prop not in _KEEP_ON_UNLOAD:
+            setattr(res_obj, prop, [])
+
+
+def clear_cache():
+    """Forgets all frd indices and loaded result objects, the objects are not unloaded."""
+    _frd_indices.clear()
+    _loaded_results.clear()
+
+
+def get_frd_index(frd_file):
+    """Returns the block index of a frd file, built on first use and if the file changed."""
+    from feminout import readCcxFrd
+
+    stat = os.stat(frd_file)
+    cached = _frd_indices.get(frd_file)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    with readCcxFrd.open_frd(frd_file) as frd_data:
+        index = readCcxFrd.index_frd(frd_data)
+    _frd_indices[frd_file] = (stat.st_mtime_ns, stat.st_size, index)
+    return index
+
+
+def _read_result_set(frd_file, result_set_index):
+    from feminout import readCcxFrd
+
+    if not os.path.isfile(frd_file):
+        FreeCAD.Console.PrintError(f"FEM: Result file {frd_file} not found.\n")
+        return None
+    result_sets = get_frd_index(frd_file)["Results"]
+    if result_set_index >= len(result_sets):
+        FreeCAD.Console.PrintError(
+            f"FEM: Result set {result_set_index} not found in {frd_file}. "
+            "The result file may have been overwritten.\n"
+        )
+        return None
+    inout_nodes = readCcxFrd.read_inout_nodes(frd_file)
+    with readCcxFrd.open_frd(frd_file) as frd_data:
+        return readCcxFrd.read_frd_result_set(frd_data, result_sets[result_set_index], inout_nodes)
+
+
+##  @}
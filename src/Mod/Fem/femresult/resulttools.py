@@ -31,6 +31,7 @@ from math import isnan
 
 import FreeCAD
 
+from femresult.resultloader import load_result
 from femtools.femutils import is_of_type
 
 
@@ -110,6 +111,7 @@ def reset_mesh_color(resultobj):
 
 def show_displacement(resultobj, displacement_factor=0.0):
     if FreeCAD.GuiUp:
+        load_result(resultobj)
         if resultobj.Mesh.ViewObject.Visibility is False:
             resultobj.Mesh.ViewObject.Visibility = True
         resultobj.Mesh.ViewObject.setNodeDisplacementByVectors(
@@ -140,6 +142,7 @@ def show_result(resultobj, result_type="Sabs", limit=None):
         reset_mesh_color(resultobj.Mesh)
         return
     if resultobj:
+        load_result(resultobj)
         if result_type == "Sabs":
             values = resultobj.vonMises
         elif result_type == "Uabs":
@@ -246,6 +249,7 @@ def get_all_stats(res_obj):
         FreeCAD FEM mechanical result object
     """
 
+    load_result(res_obj)
     m = res_obj.Stats
     stats_dict = {
         "U1": (m[0], m[1]),
@@ -284,39 +288,20 @@ def fill_femresult_stats(res_obj):
     mflow_min = mflow_max = npress_min = npress_max = 0
 
     if res_obj.DisplacementVectors:
-        x_max, y_max, z_max = map(max, zip(*res_obj.DisplacementVectors))
-        x_min, y_min, z_min = map(min, zip(*res_obj.DisplacementVectors))
-    if res_obj.DisplacementLengths:
-        a_min = min(res_obj.DisplacementLengths)
-        a_max = max(res_obj.DisplacementLengths)
-    if res_obj.vonMises:
-        s_min = min(res_obj.vonMises)
-        s_max = max(res_obj.vonMises)
-    if res_obj.PrincipalMax:
-        p1_min = min(res_obj.PrincipalMax)
-        p1_max = max(res_obj.PrincipalMax)
-    if res_obj.PrincipalMed:
-        p2_min = min(res_obj.PrincipalMed)
-        p2_max = max(res_obj.PrincipalMed)
-    if res_obj.PrincipalMin:
-        p3_min = min(res_obj.PrincipalMin)
-        p3_max = max(res_obj.PrincipalMin)
-    if res_obj.MaxShear:
-        ms_min = min(res_obj.MaxShear)
-        ms_max = max(res_obj.MaxShear)
-    if res_obj.Peeq:
-        peeq_min = min(res_obj.Peeq)
-        peeq_max = max(res_obj.Peeq)
-    if res_obj.Temperature:
-        temp_min = min(res_obj.Temperature)
-        temp_max = max(res_obj.Temperature)
-    if res_obj.MassFlowRate:
-        # DisplacementVectors is empty, no_of_values needs to be set
-        mflow_min = min(res_obj.MassFlowRate)
-        mflow_max = max(res_obj.MassFlowRate)
-    if res_obj.NetworkPressure:
-        npress_min = min(res_obj.NetworkPressure)
-        npress_max = max(res_obj.NetworkPressure)
+        disp = np.array(res_obj.DisplacementVectors, dtype=float)
+        x_min, y_min, z_min = np.nanmin(disp, axis=0).tolist()
+        x_max, y_max, z_max = np.nanmax(disp, axis=0).tolist()
+    a_min, a_max = _get_min_max(res_obj.DisplacementLengths, a_min, a_max)
+    s_min, s_max = _get_min_max(res_obj.vonMises, s_min, s_max)
+    p1_min, p1_max = _get_min_max(res_obj.PrincipalMax, p1_min, p1_max)
+    p2_min, p2_max = _get_min_max(res_obj.PrincipalMed, p2_min, p2_max)
+    p3_min, p3_max = _get_min_max(res_obj.PrincipalMin, p3_min, p3_max)
+    ms_min, ms_max = _get_min_max(res_obj.MaxShear, ms_min, ms_max)
+    peeq_min, peeq_max = _get_min_max(res_obj.Peeq, peeq_min, peeq_max)
+    temp_min, temp_max = _get_min_max(res_obj.Temperature, temp_min, temp_max)
+    # DisplacementVectors is empty for MassFlowRate and NetworkPressure
+    mflow_min, mflow_max = _get_min_max(res_obj.MassFlowRate, mflow_min, mflow_max)
+    npress_min, npress_max = _get_min_max(res_obj.NetworkPressure, npress_min, npress_max)
 
     res_obj.Stats = [
         x_min,
@@ -376,6 +361,31 @@ def fill_femresult_stats(res_obj):
     return res_obj
 
 
+def _get_min_max(values, default_min, default_max):
+    # NaN values, which can happen on Calculix frd result files, are ignored
+    if not values:
+        return default_min, default_max
+    values = np.array(values, dtype=float)
+    return float(np.nanmin(values)), float(np.nanmax(values))
+
+
+def get_stress_tensor_array(res_obj):
+    """Returns the node stresses of a result object as (n, 6) array.
+
+    The columns are (Sxx, Syy, Szz, Sxy, Sxz, Syz).
+    """
+    return np.column_stack(
+        (
+            np.array(res_obj.NodeStressXX, dtype=float),
+            np.array(res_obj.NodeStressYY, dtype=float),
+            np.array(res_obj.NodeStressZZ, dtype=float),
+            np.array(res_obj.NodeStressXY, dtype=float),
+            np.array(res_obj.NodeStressXZ, dtype=float),
+            np.array(res_obj.NodeStressYZ, dtype=float),
+        )
+    ).reshape(-1, 6)
+
+
 def add_disp_apps(res_obj):
     res_obj.DisplacementLengths = calculate_disp_abs(res_obj.DisplacementVectors)
     FreeCAD.Console.PrintLog("Added DisplacementLengths.\n")
@@ -383,18 +393,8 @@ def add_disp_apps(res_obj):
 
 
 def add_von_mises(res_obj):
-    mstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
-    )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        mstress.append(calculate_von_mises((Sxx, Syy, Szz, Sxy, Sxz, Syz)))
-    res_obj.vonMises = mstress
+    stress = get_stress_tensor_array(res_obj)
+    res_obj.vonMises = calculate_von_mises_array(stress).tolist()
     FreeCAD.Console.PrintLog("Added von Mises stress.\n")
     return res_obj
 
@@ -404,28 +404,14 @@ def add_principal_stress_std(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
+    stress = get_stress_tensor_array(res_obj)
+    prinstress1, prinstress2, prinstress3, shearstress = calculate_principal_stress_std_array(
+        stress
     )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        prin1, prin2, prin3, shear = calculate_principal_stress_std((Sxx, Syy, Szz, Sxy, Sxz, Syz))
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+    res_obj.PrincipalMax = prinstress1.tolist()
+    res_obj.PrincipalMed = prinstress2.tolist()
+    res_obj.PrincipalMin = prinstress3.tolist()
+    res_obj.MaxShear = shearstress.tolist()
     FreeCAD.Console.PrintLog("Added standard principal stresses and max shear values.\n")
 
     #
@@ -477,20 +463,17 @@ def calculate_csr(ps1, ps2, ps3, alpha, beta, res_obj):
             unless available from extensive research experiments
             T = pressure / von Mises stress (stress triaxiality)
     """
-    csr = []  # critical strain ratio
-    nsr = len(ps1)  # number of stress results
-    for i in range(nsr):
-        p = (ps1[i] + ps2[i] + ps3[i]) / 3.0  # pressure
-        svm = np.sqrt(
-            1.5 * (ps1[i] - p) ** 2 + 1.5 * (ps2[i] - p) ** 2 + 1.5 * (ps3[i] - p) ** 2
-        )  # von Mises stress: https://en.wikipedia.org/wiki/Von_Mises_yield_criterion
-        if svm != 0.0:
-            T = p / svm  # stress triaxiality
-        else:
-            T = 0.0
-        critical_strain = alpha * np.exp(-beta * T)  # critical strain
-        csr.append(abs(res_obj.Peeq[i]) / critical_strain)  # critical strain ratio
-    return csr
+    ps1 = np.asarray(ps1, dtype=float)
+    ps2 = np.asarray(ps2, dtype=float)
+    ps3 = np.asarray(ps3, dtype=float)
+    p = (ps1 + ps2 + ps3) / 3.0  # pressure
+    svm = np.sqrt(
+        1.5 * (ps1 - p) ** 2 + 1.5 * (ps2 - p) ** 2 + 1.5 * (ps3 - p) ** 2
+    )  # von Mises stress: https://en.wikipedia.org/wiki/Von_Mises_yield_criterion
+    T = np.divide(p, svm, out=np.zeros_like(p), where=svm != 0.0)  # stress triaxiality
+    critical_strain = alpha * np.exp(-beta * T)  # critical strain
+    peeq = np.abs(np.array(res_obj.Peeq, dtype=float)[: len(ps1)])
+    return (peeq / critical_strain).tolist()  # critical strain ratio
 
 
 def get_concrete_nodes(res_obj):
@@ -550,21 +533,8 @@ def add_principal_stress_reinforced(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    ps1v = []
-    ps2v = []
-    ps3v = []
-    #
-    # additional arrays to hold reinforcement ratios
-    # and mohr coulomb stress
-    #
-    rhx = []
-    rhy = []
-    rhz = []
-    moc = []
+    stress = get_stress_tensor_array(res_obj)
+    is_concrete = (ic == 1)[: len(stress)]
 
     # material parameter
     for obj in res_obj.getParentGroup().Group:
@@ -578,69 +548,41 @@ def add_principal_stress_reinforced(res_obj):
             reinforce_yield = float(
                 FreeCAD.Units.Quantity(obj.Reinforcement["YieldStrength"]).getValueAs("MPa")
             )
-    # print(matrix_af)
-    # print(matrix_cs)
-    # print(reinforce_yield)
-
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
+
+    prinstress1, prinstress2, prinstress3, shearstress, psv = (
+        calculate_principal_stress_reinforced_array(stress)
     )
-    for isv, stress_tensor in enumerate(iterator):
-
-        rhox = 0.0
-        rhoy = 0.0
-        rhoz = 0.0
-        mc = 0.0
-
-        if ic[isv] == 1:
-            #
-            # for concrete scxx etc. are affected by
-            # reinforcement (see calculate_rho(stress_tensor)). for all other
-            # materials scxx etc. are the original stresses
-            #
-            rhox, rhoy, rhoz = calculate_rho(stress_tensor, reinforce_yield)
-
-        prin1, prin2, prin3, shear, psv = calculate_principal_stress_reinforced(stress_tensor)
-
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-        ps1v.append(psv[0])
-        ps2v.append(psv[1])
-        ps3v.append(psv[2])
-
-        #
-        # reinforcement ratios and mohr coulomb criterion
-        #
-        rhx.append(rhox)
-        rhy.append(rhoy)
-        rhz.append(rhoz)
-        if ic[isv] == 1:
-            mc = calculate_mohr_coulomb(prin1, prin3, matrix_af, matrix_cs)
-        moc.append(mc)
-
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+
+    #
+    # reinforcement ratios and mohr coulomb criterion
+    # for concrete scxx etc. are affected by
+    # reinforcement (see calculate_rho(stress_tensor)). for all other
+    # materials scxx etc. are the original stresses
+    #
+    rho = np.zeros((len(stress), 3))
+    moc = np.zeros(len(stress))
+    if is_concrete.any():
+        rho[is_concrete] = calculate_rho_array(stress[is_concrete], reinforce_yield)
+        moc[is_concrete] = calculate_mohr_coulomb_array(
+            prinstress1[is_concrete], prinstress3[is_concrete], matrix_af, matrix_cs
+        )
+
+    res_obj.PrincipalMax = prinstress1.tolist()
+    res_obj.PrincipalMed = prinstress2.tolist()
+    res_obj.PrincipalMin = prinstress3.tolist()
+    res_obj.MaxShear = shearstress.tolist()
     #
     # additional concrete and principal stress plot
     # results for use in _ViewProviderFemResultMechanical
     #
-    res_obj.ReinforcementRatio_x = rhx
-    res_obj.ReinforcementRatio_y = rhy
-    res_obj.ReinforcementRatio_z = rhz
-    res_obj.MohrCoulomb = moc
+    res_obj.ReinforcementRatio_x = rho[:, 0].tolist()
+    res_obj.ReinforcementRatio_y = rho[:, 1].tolist()
+    res_obj.ReinforcementRatio_z = rho[:, 2].tolist()
+    res_obj.MohrCoulomb = moc.tolist()
 
-    res_obj.PS1Vector = ps1v
-    res_obj.PS2Vector = ps2v
-    res_obj.PS3Vector = ps3v
+    res_obj.PS1Vector = psv[:, 0].tolist()
+    res_obj.PS2Vector = psv[:, 1].tolist()
+    res_obj.PS3Vector = psv[:, 2].tolist()
 
     FreeCAD.Console.PrintLog(
         "Added reinforcement principal stresses and max shear values as well as "
@@ -692,6 +634,25 @@ def calculate_von_mises(stress_tensor):
     return von_mises
 
 
+def calculate_von_mises_array(stress):
+    """Calculate Von mises stress of all nodes at once, see calculate_von_mises().
+
+    stress ... (n, 6) array, every row (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    """
+    stress = np.asarray(stress, dtype=float).reshape(-1, 6)
+    normal = stress[:, :3]
+    shear = stress[:, 3:]
+    pressure = normal.mean(axis=1, keepdims=True)
+    return np.sqrt(1.5 * ((normal - pressure) ** 2).sum(axis=1) + 3.0 * (shear**2).sum(axis=1))
+
+
+def _get_stress_matrices(stress):
+    # (n, 3, 3) stress tensors out of (n, 6) rows (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    # https://forum.freecad.org/viewtopic.php?f=18&t=24637&start=10#p240408
+    stress = np.asarray(stress, dtype=float).reshape(-1, 6)
+    return stress[:, [[0, 3, 4], [3, 1, 5], [4, 5, 2]]]
+
+
 def calculate_principal_stress_std(stress_tensor):
     # if NaN is inside the array, which can happen on Calculix frd result files return NaN
     # https://forum.freecad.org/viewtopic.php?f=22&t=33911&start=10#p284229
@@ -717,6 +678,22 @@ def calculate_principal_stress_std(stress_tensor):
     return (eigvals[0], eigvals[1], eigvals[2], maxshear)
 
 
+def calculate_principal_stress_std_array(stress):
+    """Calculate principal stresses of all nodes at once, see calculate_principal_stress_std().
+
+    stress ... (n, 6) array, every row (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    Returns the arrays (prin1, prin2, prin3, maxshear).
+    """
+    sigma = _get_stress_matrices(stress)
+    # NaN can happen on Calculix frd result files, the results of such nodes are NaN
+    has_nan = np.isnan(sigma).any(axis=(1, 2))
+    sigma[has_nan] = 0.0
+    eigvals = np.linalg.eigvalsh(sigma)[:, ::-1]
+    eigvals[has_nan] = float("NaN")
+    maxshear = (eigvals[:, 0] - eigvals[:, 2]) / 2.0
+    return eigvals[:, 0], eigvals[:, 1], eigvals[:, 2], maxshear
+
+
 def calculate_principal_stress_reinforced(stress_tensor):
     """Calculate principal stress vectors and values.
 
@@ -767,6 +744,40 @@ def calculate_principal_stress_reinforced(stress_tensor):
     )
 
 
+def calculate_principal_stress_reinforced_array(stress):
+    """Calculate principal stress vectors and values of all nodes at once.
+
+    See calculate_principal_stress_reinforced().
+    stress ... (n, 6) array, every row (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    Returns the arrays (prin1, prin2, prin3, maxshear, vectors), vectors[i, k] is the
+    principal stress vector k of node i scaled by its principal stress.
+    """
+    sigma = _get_stress_matrices(stress)
+    if len(sigma) == 0:
+        empty = np.empty(0)
+        return empty, empty, empty, empty, np.empty((0, 3, 3))
+
+    eigenvalues, eigenvectors = np.linalg.eig(sigma)
+
+    # suppress complex eigenvalue and vectors that may occur for
+    # near-zero (numerical noise) stress fields
+    eigenvalues = eigenvalues.real
+    eigenvectors = eigenvectors.real * eigenvalues[:, np.newaxis, :]
+
+    idx = eigenvalues.argsort(axis=1)[:, ::-1]
+    eigenvalues = np.take_along_axis(eigenvalues, idx, axis=1)
+    eigenvectors = np.take_along_axis(eigenvectors, idx[:, np.newaxis, :], axis=2)
+
+    maxshear = (eigenvalues[:, 0] - eigenvalues[:, 2]) / 2.0
+    return (
+        eigenvalues[:, 0],
+        eigenvalues[:, 1],
+        eigenvalues[:, 2],
+        maxshear,
+        eigenvectors.transpose(0, 2, 1),
+    )
+
+
 def calculate_rho(stress_tensor, fy):
     """Calculation of Reinforcement Ratios and Concrete Stresses
     (in accordance with http://heronjournal.nl/53-4/3.pdf)
@@ -925,6 +936,108 @@ def calculate_rho(stress_tensor, fy):
     return rhox[eqmin], rhoy[eqmin], rhoz[eqmin]
 
 
+def calculate_rho_array(stress, fy):
+    """Calculation of Reinforcement Ratios of all nodes at once, see calculate_rho().
+
+    stress ... (n, 6) array, every row (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+    Returns a (n, 3) array with the reinforcement ratios (rhox, rhoy, rhoz).
+    """
+    stress = np.asarray(stress, dtype=float).reshape(-1, 6)
+    sxx, syy, szz, sxy, sxz, syz = stress.T
+    n = len(stress)
+
+    def div(a, b):
+        # a / b, 0.0 where b is 0.0
+        return np.divide(a, b, out=np.zeros(n), where=b != 0.0)
+
+    rhox = np.zeros((n, 15))
+    rhoy = np.zeros((n, 15))
+    rhoz = np.zeros((n, 15))
+
+    i3 = sxx * syy * szz + 2 * sxy * sxz * syz - sxx * syz**2 - syy * sxz**2 - szz * sxy**2
+
+    # Solution (5), (6), (7)
+    rhoz[:, 0] = div(i3, sxx * syy - sxy**2) / fy
+    rhoy[:, 1] = div(i3, sxx * szz - sxz**2) / fy
+    rhox[:, 2] = div(i3, syy * szz - syz**2) / fy
+
+    # Solution (9)
+    nonzero = sxx != 0.0
+    fc = div(sxz * sxy, sxx) - syz
+    fxy = div(sxy**2, sxx)
+    fxz = div(sxz**2, sxx)
+    rhoy[:, 3] = np.where(nonzero, (syy - fxy + fc) / fy, 0.0)
+    rhoz[:, 3] = np.where(nonzero, (szz - fxz + fc) / fy, 0.0)
+    rhoy[:, 4] = np.where(nonzero, (syy - fxy - fc) / fy, 0.0)
+    rhoz[:, 4] = np.where(nonzero, (szz - fxz - fc) / fy, 0.0)
+
+    # Solution (10)
+    nonzero = syy != 0.0
+    fc = div(syz * sxy, syy) - sxz
+    fxy = div(sxy**2, syy)
+    fyz = div(syz**2, syy)
+    rhox[:, 5] = np.where(nonzero, (sxx - fxy + fc) / fy, 0.0)
+    rhoz[:, 5] = np.where(nonzero, (szz - fyz + fc) / fy, 0.0)
+    rhox[:, 6] = np.where(nonzero, (sxx - fxy - fc) / fy, 0.0)
+    rhoz[:, 6] = np.where(nonzero, (szz - fyz - fc) / fy, 0.0)
+
+    # Solution (11)
+    nonzero = szz != 0.0
+    fc = div(sxz * syz, szz) - sxy
+    fxz = div(sxz**2, szz)
+    fyz = div(syz**2, szz)
+    rhox[:, 7] = np.where(nonzero, (sxx - fxz + fc) / fy, 0.0)
+    rhoy[:, 7] = np.where(nonzero, (syy - fyz + fc) / fy, 0.0)
+    rhox[:, 8] = np.where(nonzero, (sxx - fxz - fc) / fy, 0.0)
+    rhoy[:, 8] = np.where(nonzero, (syy - fyz - fc) / fy, 0.0)
+
+    # Solution (13), (14), (15), (16)
+    rhox[:, 9] = (sxx + sxy + sxz) / fy
+    rhoy[:, 9] = (syy + sxy + syz) / fy
+    rhoz[:, 9] = (szz + sxz + syz) / fy
+    rhox[:, 10] = (sxx + sxy - sxz) / fy
+    rhoy[:, 10] = (syy + sxy - syz) / fy
+    rhoz[:, 10] = (szz - sxz - syz) / fy
+    rhox[:, 11] = (sxx - sxy - sxz) / fy
+    rhoy[:, 11] = (syy - sxy + syz) / fy
+    rhoz[:, 11] = (szz - sxz + syz) / fy
+    rhox[:, 12] = (sxx - sxy + sxz) / fy
+    rhoy[:, 12] = (syy - sxy - syz) / fy
+    rhoz[:, 12] = (szz + sxz - syz) / fy
+
+    # Solution (17)
+    rhox[:, 13] = np.where(syz != 0.0, (sxx - div(sxy * sxz, syz)) / fy, 0.0)
+    rhoy[:, 13] = np.where(sxz != 0.0, (syy - div(sxy * syz, sxz)) / fy, 0.0)
+    rhoz[:, 13] = np.where(sxy != 0.0, (szz - div(sxz * syz, sxy)) / fy, 0.0)
+
+    # Concrete Stresses
+    scxx = sxx[:, np.newaxis] - rhox * fy
+    scyy = syy[:, np.newaxis] - rhoy * fy
+    sczz = szz[:, np.newaxis] - rhoz * fy
+    sxy = sxy[:, np.newaxis]
+    sxz = sxz[:, np.newaxis]
+    syz = syz[:, np.newaxis]
+    ic1 = scxx + scyy + sczz
+    ic2 = scxx * scyy + scyy * sczz + sczz * scxx - sxy**2 - sxz**2 - syz**2
+    ic3 = scxx * scyy * sczz + 2 * sxy * sxz * syz - scxx * syz**2 - scyy * sxz**2 - sczz * sxy**2
+    rsum = rhox + rhoy + rhoz
+    valid = (
+        (rhox >= -1.0e-10)
+        & (rhoy >= -1.0e-10)
+        & (rhoz > -1.0e-10)
+        & (ic1 <= 1.0e-6)
+        & (ic2 >= -1.0e-6)
+        & (ic3 <= 1.0e-6)
+        & (rsum > 0.0)
+        & (rsum < 1.0e9)
+    )
+    # smallest valid sum, the first one on equal sums, solution 14 (all zero) if none is valid
+    eqmin = np.where(valid, rsum, np.inf).argmin(axis=1)
+    eqmin[~valid.any(axis=1)] = 14
+    rows = np.arange(n)
+    return np.column_stack((rhox[rows, eqmin], rhoy[rows, eqmin], rhoz[rows, eqmin]))
+
+
 def calculate_mohr_coulomb(prin1, prin3, phi, fck):
     """Calculation of Mohr Coulomb yield criterion to judge
     concrete crushing and shear failure.
@@ -945,9 +1058,22 @@ def calculate_mohr_coulomb(prin1, prin3, phi, fck):
     return mc_stress
 
 
+def calculate_mohr_coulomb_array(prin1, prin3, phi, fck):
+    """Calculation of Mohr Coulomb yield criterion of all nodes at once.
+
+    See calculate_mohr_coulomb(), prin1 and prin3 are arrays.
+    """
+    coh = fck * (1 - np.sin(phi)) / 2 / np.cos(phi)
+    prin1 = np.asarray(prin1, dtype=float)
+    prin3 = np.asarray(prin3, dtype=float)
+    mc_stress = (prin1 - prin3) + (prin1 + prin3) * np.sin(phi) - 2.0 * coh * np.cos(phi)
+    return np.maximum(mc_stress, 0.0)
+
+
 def calculate_disp_abs(displacements):
     # see https://forum.freecad.org/viewtopic.php?f=18&t=33106&start=100#p296657
-    return [np.linalg.norm(nd) for nd in displacements]
+    displacements = np.array(displacements, dtype=float).reshape(-1, 3)
+    return np.linalg.norm(displacements, axis=1).tolist()
 
 
 ##  @}
@@ -0,0 +1,234 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Run a Solver for many variants of an analysis.
+
+Parameter sweeps execute the same analysis with different property values.
+For every variant the property values are set on the document objects, the
+solver input is written into an own working directory by a :class:`Machine
+<femsolver.run.Machine>` and the old property values are restored. Writing
+the input needs the document and is done one variant after the other. The
+solver processes run concurrently, up to *max_jobs* at the same time. No Gui
+is involved, the status and the time of every job is collected in a
+:class:`BatchJob`.
+
+Example::
+
+    from femsolver import batch
+    variants = [
+        ("force_{}".format(f), {"ConstraintForce": {"Force": "{} N".format(f)}})
+        for f in (1000, 2000, 4000)
+    ]
+    jobs = batch.run_batch(doc.SolverCalculiX, variants, max_jobs=2)
+    batch.print_summary(jobs)
+"""
+
+__title__ = "FreeCAD FEM solver batch run"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+import os
+import os.path
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import FreeCAD as App
+
+from . import report
+from . import run
+
+PENDING = "pending"
+PREPARED = "prepared"
+SOLVED = "solved"
+DONE = "done"
+FAILED = "failed"
+
+
+class BatchJob:
+    """One variant of a batch run.
+
+    :ivar name: the name of the variant, used for the working directory.
+    :ivar changes: ``{object name: {property name: value}}``
+    :ivar directory: the working directory of the variant.
+    :ivar machine: the :class:`Machine <femsolver.run.Machine>` of the variant.
+    :ivar status: one of PENDING, PREPARED, SOLVED, DONE, FAILED.
+    :ivar times: the time in seconds of the steps ``"prepare"``, ``"solve"``
+        and ``"results"``.
+    :ivar reports: the :class:`Report <femsolver.report.Report>` of every step,
+        the machine starts a new report for each of them.
+    """
+
+    def __init__(self, name, changes):
+        self.name = name
+        self.changes = changes
+        self.directory = None
+        self.machine = None
+        self.status = PENDING
+        self.times = {}
+        self.reports = {}
+
+    @property
+    def report(self):
+        """The reports of all steps run so far joined into one, ``None`` if no step ran."""
+        if not self.reports:
+            return None
+        joined = report.Report()
+        for step in ("prepare", "solve", "results"):
+            if step in self.reports:
+                joined.extend(self.reports[step])
+        return joined
+
+    @property
+    def time(self):
+        return sum(self.times.values())
+
+
+def run_batch(
+    solver, variants, working_dir=None, max_jobs=None, target=run.RESULTS, load_results=False
+):
+    """Execute *solver* for all *variants* and return a list of :class:`BatchJob`.
+
+    :param solver:
+        A framework compliant solver object, see :func:`femsolver.run.run_fem_solver`.
+
+    :param variants:
+        A list of ``(name, changes)`` tuples. *changes* is a dict
+        ``{object name: {property name: value}}`` of the document of the solver.
+
+    :param working_dir:
+        The base directory of the working directories of the variants. If ``None``
+        a temporary directory is created.
+
+    :param max_jobs:
+        The maximum number of solver processes running at the same time.
+        If ``None`` the number of processors is used.
+
+    :param target:
+        ``PREPARE`` only writes the solver input of the variants, ``SOLVE``
+        runs the solver too and ``RESULTS`` additionally loads the results if
+        *load_results* is True.
+
+    :param load_results:
+        Load the results of every variant into the analysis after its solver
+        finished. Be aware results of former runs are purged by the result
+        import if the preference KeepResultsOnReRun is not set.
+    """
+    if working_dir is None:
+        working_dir = tempfile.mkdtemp(prefix="fembatch")
+    if max_jobs is None:
+        max_jobs = os.cpu_count() or 1
+    # the mesh sets of the constraints are only searched for the first variant
+    run._DocObserver.attach()
+
+    jobs = [BatchJob(name, changes) for name, changes in variants]
+    App.Console.PrintMessage(
+        f"Batch run of {len(jobs)} variants of {solver.Label} in {working_dir}\n"
+    )
+    with ThreadPoolExecutor(max_workers=max_jobs) as executor:
+        futures = []
+        for job in jobs:
+            _prepare(solver, job, working_dir)
+            if job.status == PREPARED and target >= run.SOLVE:
+                futures.append((job, executor.submit(_solve, job)))
+        # results are imported into the document, thus not inside the pool
+        for job, future in futures:
+            future.result()
+            if job.status == SOLVED and target >= run.RESULTS and load_results:
+                _load_results(job)
+    App.Console.PrintMessage(f"Batch run of {solver.Label} finished.\n")
+    return jobs
+
+
+def print_summary(jobs):
+    """Print status and times of all jobs of a batch run."""
+    App.Console.PrintMessage(
+        "{:<24} {:<10} {:>10} {:>10} {:>10}\n".format(
+            "variant", "status", "prepare", "solve", "results"
+        )
+    )
+    for job in jobs:
+        times = [
+            "{:10.3f}".format(job.times[step]) if step in job.times else 10 * " "
+            for step in ("prepare", "solve", "results")
+        ]
+        App.Console.PrintMessage("{:<24} {:<10} {}\n".format(job.name, job.status, " ".join(times)))
+    failed = [job.name for job in jobs if job.status == FAILED]
+    if failed:
+        App.Console.PrintError(f"Failed variants: {', '.join(failed)}\n")
+
+
+def _prepare(solver, job, working_dir):
+    job.directory = run._getUniquePath(os.path.join(working_dir, job.name))
+    run._dirTypes[job.directory] = None
+    if not os.path.isdir(job.directory):
+        os.makedirs(job.directory)
+    job.machine = solver.Proxy.createMachine(solver, job.directory, testmode=False)
+    time_start = time.time()
+    old_values = _apply_changes(solver.Document, job.changes)
+    try:
+        job.machine.target = run.PREPARE
+        job.machine.start()
+        job.machine.join()
+    finally:
+        _apply_changes(solver.Document, old_values)
+    job.times["prepare"] = time.time() - time_start
+    job.reports["prepare"] = job.machine.report
+    job.status = FAILED if job.machine.failed else PREPARED
+    if job.status == FAILED:
+        App.Console.PrintError(f"Batch job {job.name}: writing the solver input failed.\n")
+
+
+def _solve(job):
+    time_start = time.time()
+    job.machine.target = run.SOLVE
+    job.machine.start()
+    job.machine.join()
+    job.times["solve"] = time.time() - time_start
+    job.reports["solve"] = job.machine.report
+    job.status = FAILED if job.machine.failed else SOLVED
+
+
+def _load_results(job):
+    time_start = time.time()
+    job.machine.target = run.RESULTS
+    job.machine.start()
+    job.machine.join()
+    job.times["results"] = time.time() - time_start
+    job.reports["results"] = job.machine.report
+    job.status = FAILED if job.machine.failed else DONE
+
+
+def _apply_changes(doc, changes):
+    # set the property values, returns the old values
+    old_values = {}
+    for obj_name, props in changes.items():
+        obj = doc.getObject(obj_name)
+        if obj is None:
+            App.Console.PrintError(f"Batch run: object {obj_name} not found.\n")
+            continue
+        old_values[obj_name] = {}
+        for prop, value in props.items():
+            old_values[obj_name][prop] = getattr(obj, prop)
+            setattr(obj, prop, value)
+    doc.recompute()
+    return old_values
@@ -0,0 +1,127 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM calculix input file fingerprints"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+# Used by the incremental input writer (solver property IncrementalInputWriter).
+# The input file is split into include files, see SplitInputWriter. For every
+# include file a fingerprint of its content is kept in the working directory.
+# On the next writing only the include files whose fingerprint changed are
+# written again. The main input file is always written.
+# The mesh file is the expensive one. Its fingerprint is made from the mesh
+# arrays and the element type parameter, thus writeABAQUS is skipped at all
+# if the mesh did not change. The fingerprints of all other include files
+# are made from the text which would be written.
+
+import hashlib
+import json
+import os
+from os.path import join
+
+import FreeCAD
+
+
+class InputFingerprints:
+    """Fingerprints of the include files of a split CalculiX input file"""
+
+    def __init__(self, dir_name, mesh_name):
+        self.dir_name = dir_name
+        self.file_name = join(dir_name, mesh_name + "_fingerprints.json")
+        self.previous = self._load()
+        self.current = {}
+        self.written = []
+        self.kept = []
+
+    def _load(self):
+        try:
+            with open(self.file_name, encoding="utf-8") as f:
+                fingerprints = json.load(f)
+            # if writing gets interrupted the fingerprints would not match the files anymore
+            os.remove(self.file_name)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(fingerprints, dict):
+            return {}
+        return fingerprints
+
+    def is_current(self, include_name, fingerprint):
+        """Register the fingerprint of an include file
+
+        Returns True if the include file from the last writing is still valid.
+        Otherwise the caller has to write the file.
+        """
+        self.current[include_name] = fingerprint
+        current = self.previous.get(include_name) == fingerprint and os.path.isfile(
+            join(self.dir_name, include_name)
+        )
+        if current:
+            self.kept.append(include_name)
+        else:
+            self.written.append(include_name)
+        return current
+
+    def write_if_changed(self, include_name, content):
+        """Write the text content to the include file if it has changed"""
+        if self.is_current(include_name, get_text_fingerprint(content)):
+            return False
+        with open(join(self.dir_name, include_name), "w", encoding="utf-8") as f:
+            f.write(content)
+        return True
+
+    def save(self):
+        with open(self.file_name, "w", encoding="utf-8") as f:
+            json.dump(self.current, f, indent=1, sort_keys=True)
+        FreeCAD.Console.PrintMessage(
+            "Incremental input writing: {} include files written, {} kept.\n".format(
+                len(self.written), len(self.kept)
+            )
+        )
+        if self.kept:
+            FreeCAD.Console.PrintLog("Kept include files: {}\n".format(", ".join(self.kept)))
+
+
+def get_text_fingerprint(content):
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def get_mesh_fingerprint(femmesh, write_params):
+    """Fingerprint of the mesh file written by writeABAQUS
+
+    write_params are all parameter passed to writeABAQUS besides the file name.
+    The node and element arrays of the mesh bulk API are hashed directly.
+    """
+    sha = hashlib.sha1(repr(write_params).encode("utf-8"))
+    for data in femmesh.getNodeArrays():
+        sha.update(data)
+    for ele_type in ("Edge", "Face", "Volume"):
+        for data in femmesh.getElementArrays(ele_type):
+            sha.update(data)
+    return sha.hexdigest()
+
+
+##  @}
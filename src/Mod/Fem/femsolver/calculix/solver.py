@@ -274,6 +274,16 @@ class _BaseSolverCalculix:
             )
             obj.SplitInputWriter = False
 
+        if not hasattr(obj, "IncrementalInputWriter"):
+            obj.addProperty(
+                "App::PropertyBool",
+                "IncrementalInputWriter",
+                "Fem",
+                "Split writing of ccx input file and only rewrite the changed include files",
+                locked=True,
+            )
+            obj.IncrementalInputWriter = False
+
         if not hasattr(obj, "IterationsControlParameterIter"):
             control_parameter_iterations = (
                 "{I_0},{I_R},{I_P},{I_C},{I_L},{I_G},{I_S},{I_A},{I_J},{I_T}".format(
@@ -438,13 +448,15 @@ class Proxy(solverbase.Proxy, _BaseSolverCalculix):
         self.on_restore_of_document(obj)
 
     def createMachine(self, obj, directory, testmode=False):
+        prepare = tasks.Prepare()
+        solve = tasks.Solve(prepare)
         return run.Machine(
             solver=obj,
             directory=directory,
             check=tasks.Check(),
-            prepare=tasks.Prepare(),
-            solve=tasks.Solve(),
-            results=tasks.Results(),
+            prepare=prepare,
+            solve=solve,
+            results=tasks.Results(prepare, solve),
             testmode=testmode,
         )
 
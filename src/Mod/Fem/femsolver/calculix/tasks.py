@@ -32,10 +32,12 @@ __url__ = "https://www.freecad.org"
 import os
 import os.path
 import subprocess
+import threading
 
 import FreeCAD
 
 from . import writer
+from .. import progress
 from .. import run
 from .. import settings
 from feminout import importCcxDatResults
@@ -45,7 +47,29 @@ from femtools import femutils
 from femtools import membertools
 
 
-_inputFileName = None
+if FreeCAD.GuiUp:
+    from PySide import QtCore
+
+    class _MainThreadCall(QtCore.QObject):
+        """Runs the functions passed to call() in the thread the object was created in.
+
+        The signal is queued if call() is used in another thread, thus the live result
+        import of the progress monitor's poller thread changes the document in the Gui
+        thread.
+        """
+
+        called = QtCore.Signal(object)
+
+        def __init__(self):
+            super().__init__()
+            self.called.connect(self._run)
+
+        def call(self, function):
+            self.called.emit(function)
+
+        @QtCore.Slot(object)
+        def _run(self, function):
+            function()
 
 
 class Check(run.Check):
@@ -72,8 +96,13 @@ class Check(run.Check):
 
 class Prepare(run.Prepare):
 
+    def __init__(self):
+        super().__init__()
+        # the solver input file name without extension, kept per task as concurrent
+        # runs (femsolver.batch) write different input files
+        self.input_file_name = None
+
     def run(self):
-        global _inputFileName
         self.pushStatus("Preparing input...\n")
 
         # get mesh set data
@@ -104,11 +133,23 @@ class Prepare(run.Prepare):
         else:
             self.pushStatus("Writing solver input failed.")
             self.fail()
-        _inputFileName = os.path.splitext(os.path.basename(path))[0]
+        self.input_file_name = os.path.splitext(os.path.basename(path))[0]
 
 
 class Solve(run.Solve):
 
+    def __init__(self, prepare=None):
+        super().__init__()
+        # the Prepare task of the same machine, holds the input file name
+        self.prepare = prepare
+        # the result object of the results imported while the solver is running, kept per
+        # task as concurrent runs (femsolver.batch) must not touch each other's results
+        self.live_result_name = None
+        self._live_import = False
+        self._live_lock = threading.Lock()
+        # created in the thread creating the machine, the Gui thread
+        self._main_thread = _MainThreadCall() if FreeCAD.GuiUp else None
+
     def run(self):
         self.pushStatus("Executing solver...\n")
 
@@ -120,26 +161,93 @@ class Solve(run.Solve):
             self.fail()
             return
 
+        # the status files of a former run are tailed by the progress monitor
+        input_file_name = self.prepare.input_file_name
+        base_name = os.path.join(self.directory, input_file_name)
+        for status_file in (base_name + ".sta", base_name + ".cvg"):
+            if os.path.isfile(status_file):
+                os.remove(status_file)
+
         # run solver
         self._process = subprocess.Popen(
-            [binary, "-i", _inputFileName],
+            [binary, "-i", input_file_name],
             cwd=self.directory,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
         )
         self.signalAbort.add(self._process.terminate)
-        # output = self._observeSolver(self._process)
+
+        # live progress of increments and iterations, see femsolver.progress
+        monitor = self._createMonitor(self._process, progress.parse_ccx_output)
+        monitor.signalProgress.add(self.push_step_status)
+        monitor.watchFile(base_name + ".sta", progress.parse_ccx_sta)
+        monitor.watchFile(base_name + ".cvg", progress.parse_ccx_cvg)
+        ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
+        if ccx_prefs.GetBool("LiveResultImport", False):
+            if self._main_thread is None:
+                # the document must not be changed in the poller thread of the monitor,
+                # without a Gui there is no event loop to pass the import to
+                FreeCAD.Console.PrintLog("FEM: Live result import skipped without Gui.\n")
+            else:
+                self._live_result_sets = 0
+                self._live_import = True
+                monitor.watchChanges(base_name + ".frd", self.import_live_result)
+        self._observeSolver(self._process, monitor, pushOutput=False)
+        # imports still queued in the Gui thread are skipped, the final results follow
+        with self._live_lock:
+            self._live_import = False
+
         self._process.communicate()
         self.signalAbort.remove(self._process.terminate)
-        # if not self.aborted:
-        #     self._updateOutput(output)
-        # del output   # get flake8 quiet
+
+    def push_step_status(self, event):
+        if event.kind == progress.STEP:
+            self.pushStatus(f"Solving step {event.step}...\n")
+
+    def import_live_result(self, monitor):
+        # called in the poller thread of the monitor, the document is changed in the Gui thread
+        self._main_thread.call(lambda: self.load_live_result(monitor))
+
+    def load_live_result(self, monitor):
+        # the last completed result set of the frd file, the solver is still writing it
+        with self._live_lock:
+            if self._live_import:
+                self._load_live_result(monitor)
+
+    def _load_live_result(self, monitor):
+        frd_result_file = os.path.join(self.directory, self.prepare.input_file_name + ".frd")
+        doc = self.analysis.Document
+        res_obj = doc.getObject(self.live_result_name) if self.live_result_name else None
+        try:
+            res_obj, result_sets = importCcxFrdResults.importFrdLiveResult(
+                frd_result_file,
+                self.analysis,
+                res_obj,
+                "CalculiX_" + self.solver.AnalysisType + "_Live_Results",
+                self._live_result_sets,
+            )
+        except Exception as e:
+            FreeCAD.Console.PrintLog(f"FEM: Live result import failed: {e}\n")
+            return
+        if res_obj is not None:
+            self.live_result_name = res_obj.Name
+        if result_sets > self._live_result_sets:
+            self._live_result_sets = result_sets
+            monitor.emit(progress.ProgressEvent(progress.RESULT, text=f"result set {result_sets}"))
 
 
 class Results(run.Results):
 
+    def __init__(self, prepare=None, solve=None):
+        super().__init__()
+        # the Prepare and Solve tasks of the same machine, hold the input file name
+        # and the live result
+        self.prepare = prepare
+        self.solve = solve
+
     def run(self):
         prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+        self.purge_live_result()
         if not prefs.GetBool("KeepResultsOnReRun", False):
             self.purge_results()
         self.load_results()
@@ -157,13 +265,25 @@ class Results(run.Results):
             self.analysis.Document.removeObject(m.Name)
         self.analysis.Document.recompute()
 
+    def purge_live_result(self):
+        # the results imported while the solver was running are replaced by the final ones
+        if self.solve is None or self.solve.live_result_name is None:
+            return
+        doc = self.analysis.Document
+        res_obj = doc.getObject(self.solve.live_result_name)
+        if res_obj is not None:
+            if res_obj.Mesh and femutils.is_of_type(res_obj.Mesh, "Fem::MeshResult"):
+                doc.removeObject(res_obj.Mesh.Name)
+            doc.removeObject(res_obj.Name)
+        self.solve.live_result_name = None
+
     def load_results(self):
         self.pushStatus("Import new results...\n")
         self.load_ccxfrd_results()
         self.load_ccxdat_results()
 
     def load_ccxfrd_results(self):
-        frd_result_file = os.path.join(self.directory, _inputFileName + ".frd")
+        frd_result_file = os.path.join(self.directory, self.prepare.input_file_name + ".frd")
         if os.path.isfile(frd_result_file):
             result_name_prefix = "CalculiX_" + self.solver.AnalysisType + "_"
             importCcxFrdResults.importFrd(frd_result_file, self.analysis, result_name_prefix)
@@ -173,7 +293,7 @@ class Results(run.Results):
             self.fail()
 
     def load_ccxdat_results(self):
-        dat_result_file = os.path.join(self.directory, _inputFileName + ".dat")
+        dat_result_file = os.path.join(self.directory, self.prepare.input_file_name + ".dat")
         if os.path.isfile(dat_result_file):
             mode_frequencies = importCcxDatResults.import_dat(dat_result_file, self.analysis)
         else:
@@ -26,12 +26,28 @@ __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
 
+import io
+
+
 def write_femelement_matgeosets(f, ccxwriter):
 
     # write mat_geo_sets to file
     f.write("\n{}\n".format(59 * "*"))
     f.write("** Element sets for materials and FEM element type (solid, shell, beam, fluid)\n")
 
+    # incremental writing, the element sets are written into an include file
+    if ccxwriter.input_fingerprints is not None:
+        file_name_split = f"{ccxwriter.mesh_name}_Element_sets.inp"
+        f.write(f"*INCLUDE,INPUT={file_name_split}\n")
+        buffer = io.StringIO()
+        write_elsets(buffer, ccxwriter)
+        ccxwriter.input_fingerprints.write_if_changed(file_name_split, buffer.getvalue())
+    else:
+        write_elsets(f, ccxwriter)
+
+
+def write_elsets(f, ccxwriter):
+
     for matgeoset in ccxwriter.mat_geo_sets:
 
         f.write("*ELSET,ELSET={}\n".format(matgeoset["ccx_elset_name"]))
@@ -30,6 +30,7 @@ import codecs
 from os.path import join
 
 from femmesh import meshtools
+from . import fingerprints
 
 
 def write_mesh(ccxwriter):
@@ -61,14 +62,25 @@ def write_mesh(ccxwriter):
         file_name_split = ccxwriter.mesh_name + "_" + write_name + ".inp"
         ccxwriter.femmesh_file = join(ccxwriter.dir_name, file_name_split)
 
-        ccxwriter.femmesh.writeABAQUS(
-            ccxwriter.femmesh_file,
-            element_param,
-            group_param,
-            volVariant=vol_variant,
-            faceVariant=face_variant,
-            edgeVariant=edge_variant,
-        )
+        # incremental writing, keep the mesh file of the last writing if the mesh did not change
+        # the mesh file is modified after writing if there are liquid inlet or outlet sections
+        mesh_file_current = False
+        if ccxwriter.input_fingerprints is not None and not ccxwriter.member.geos_fluidsection:
+            write_params = (element_param, group_param, vol_variant, face_variant, edge_variant)
+            mesh_file_current = ccxwriter.input_fingerprints.is_current(
+                file_name_split,
+                fingerprints.get_mesh_fingerprint(ccxwriter.femmesh, write_params),
+            )
+
+        if not mesh_file_current:
+            ccxwriter.femmesh.writeABAQUS(
+                ccxwriter.femmesh_file,
+                element_param,
+                group_param,
+                volVariant=vol_variant,
+                faceVariant=face_variant,
+                edgeVariant=edge_variant,
+            )
 
         inpfile = codecs.open(ccxwriter.file_name, "w", encoding="utf-8")
         inpfile.write("{}\n".format(59 * "*"))
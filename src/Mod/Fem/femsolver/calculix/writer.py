@@ -55,6 +55,7 @@ from . import write_constraint_tie as con_tie
 from . import write_constraint_transform as con_transform
 from . import write_constraint_electricchargedensity as con_electricchargedensity
 from . import write_constraint_electrostatic as con_electrostatic
+from . import fingerprints
 from . import write_femelement_geometry
 from . import write_femelement_material
 from . import write_femelement_matgeosets
@@ -130,7 +131,13 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         FreeCAD.Console.PrintMessage("CalculiX solver input writing...\n")
         FreeCAD.Console.PrintMessage(f"Input file:{self.file_name}\n")
 
-        if self.solver_obj.SplitInputWriter is True:
+        # incremental writing needs the split input file, see module fingerprints
+        incremental_writing = getattr(self.solver_obj, "IncrementalInputWriter", False)
+        if incremental_writing is True:
+            FreeCAD.Console.PrintMessage("Split input file, write changed include files only.\n")
+            self.split_inpfile = True
+            self.input_fingerprints = fingerprints.InputFingerprints(self.dir_name, self.mesh_name)
+        elif self.solver_obj.SplitInputWriter is True:
             FreeCAD.Console.PrintMessage("Split input file.\n")
             self.split_inpfile = True
         else:
@@ -215,6 +222,8 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
 
         # close file
         inpfile.close()
+        if self.input_fingerprints is not None:
+            self.input_fingerprints.save()
 
         writetime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(f"Writing time CalculiX input file: {writetime} seconds.\n")
@@ -37,6 +37,7 @@ from platform import system
 import FreeCAD
 
 from . import writer
+from .. import progress
 from .. import run
 from .. import settings
 from femtools import femutils
@@ -139,7 +140,10 @@ class Solve(run.Solve):
                 startupinfo=femutils.startProgramInfo("hide"),
             )
             self.signalAbort.add(self._process.terminate)
-            output = self._observeSolver(self._process)
+            monitor = self._createMonitor(self._process, progress.parse_elmer_output)
+            # the whole output is kept in ElmerOutput and searched for eigenfrequencies
+            monitor.outputLines = None
+            output = self._observeSolver(self._process, monitor)
             self._process.communicate()
             self.signalAbort.remove(self._process.terminate)
             if not self.aborted:
@@ -66,13 +66,14 @@ class Proxy(solverbase.Proxy):
         obj.AnalysisType = ANALYSIS_TYPES[0]
 
     def createMachine(self, obj, directory, testmode=False):
+        prepare = tasks.Prepare()
         return run.Machine(
             solver=obj,
             directory=directory,
             check=tasks.Check(),
-            prepare=tasks.Prepare(),
-            solve=tasks.Solve(),
-            results=tasks.Results(),
+            prepare=prepare,
+            solve=tasks.Solve(prepare),
+            results=tasks.Results(prepare),
             testmode=testmode,
         )
 
@@ -52,9 +52,6 @@ from femtools import femutils
 from femtools import membertools
 
 
-_inputFileName = None
-
-
 class Check(run.Check):
 
     def run(self):
@@ -69,8 +66,13 @@ class Check(run.Check):
 
 class Prepare(run.Prepare):
 
+    def __init__(self):
+        super().__init__()
+        # the solver input file name without extension, kept per task as concurrent
+        # runs (femsolver.batch) write different input files
+        self.input_file_name = None
+
     def run(self):
-        global _inputFileName
         self.pushStatus("Preparing solver input...\n")
 
         # get mesh set data
@@ -99,15 +101,20 @@ class Prepare(run.Prepare):
         else:
             self.pushStatus("Writing solver input failed.")
             self.fail()
-        _inputFileName = os.path.splitext(os.path.basename(path))[0]
+        self.input_file_name = os.path.splitext(os.path.basename(path))[0]
 
 
 class Solve(run.Solve):
 
+    def __init__(self, prepare=None):
+        super().__init__()
+        # the Prepare task of the same machine, holds the input file name
+        self.prepare = prepare
+
     def run(self):
         self.pushStatus("Executing solver...\n")
 
-        infile = _inputFileName + ".bdf"
+        infile = self.prepare.input_file_name + ".bdf"
 
         # get solver binary
         self.pushStatus("Get solver binary...\n")
@@ -132,6 +139,11 @@ class Solve(run.Solve):
 
 class Results(run.Results):
 
+    def __init__(self, prepare=None):
+        super().__init__()
+        # the Prepare task of the same machine, holds the input file name
+        self.prepare = prepare
+
     def run(self):
         prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
         if not prefs.GetBool("KeepResultsOnReRun", False):
@@ -150,7 +162,7 @@ class Results(run.Results):
 
     def load_results(self):
         self.pushStatus("Import new results...\n")
-        neu_result_file = os.path.join(self.directory, _inputFileName + ".NEU")
+        neu_result_file = os.path.join(self.directory, self.prepare.input_file_name + ".NEU")
         if os.path.isfile(neu_result_file):
             hfcMystranNeuIn.import_neu(neu_result_file)
             # Workaround to move result object into analysis
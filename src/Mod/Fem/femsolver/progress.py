@@ -0,0 +1,331 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM solver progress monitor"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+# Live progress of a running solver. The Monitor reads the solver output line
+# by line and tails files the solver writes during the run (for CalculiX the
+# .sta and .cvg files). Lines are parsed into ProgressEvent objects which are
+# passed to all callables in Monitor.signalProgress. The Solve task of the
+# solver framework adds them to its report, see femsolver.run.Solve.
+#
+# Example, print the progress of an Elmer run:
+#
+# from femsolver import run
+# machine = run.getMachine(doc.SolverElmer)
+# machine.signalProgress.add(print)
+# machine.start()
+# machine.join()
+# print(machine.report.progressEvents[-1])
+
+import collections
+import os
+import re
+import threading
+
+from . import signal
+from femtools import femutils
+
+# kinds of progress events
+STEP = "step"  # a step was started
+INCREMENT = "increment"  # an increment or time step has finished
+ITERATION = "iteration"  # an equilibrium or nonlinear iteration has finished
+RESULT = "result"  # results of a step are available in the result file
+
+
+class ProgressEvent:
+
+    def __init__(
+        self,
+        kind,
+        step=None,
+        increment=None,
+        iteration=None,
+        time=None,
+        residual=None,
+        correction=None,
+        converged=True,
+        text="",
+    ):
+        self.kind = kind
+        self.step = step
+        self.increment = increment
+        self.iteration = iteration
+        self.time = time
+        self.residual = residual
+        self.correction = correction
+        self.converged = converged
+        self.text = text
+
+    def __str__(self):
+        parts = [self.kind.capitalize()]
+        for name in ("step", "increment", "iteration", "time", "residual", "correction"):
+            value = getattr(self, name)
+            if value is not None:
+                parts.append(f"{name} {value:g}")
+        if not self.converged:
+            parts.append("not converged")
+        if self.text:
+            parts.append(self.text)
+        return ", ".join(parts)
+
+    def __repr__(self):
+        return f"<ProgressEvent: {self}>"
+
+
+class Monitor:
+    """Observes a running solver process and emits ProgressEvent objects
+
+    The output of the process is read in the calling thread, files are
+    tailed by a polling thread. outputParser and the parser of the watched
+    files get a line and return a ProgressEvent or None. Only the last
+    outputLines lines of the output are kept, None keeps all of them.
+    """
+
+    def __init__(self, process, outputParser=None, pollInterval=0.5, outputLines=1000):
+        self.process = process
+        self.outputParser = outputParser
+        self.pollInterval = pollInterval
+        self.outputLines = outputLines
+        self.signalProgress = set()
+        self.events = []
+        self._files = []
+        self._fileWatchers = []
+        self._lock = threading.RLock()
+
+    def watchFile(self, path, parser):
+        """Parse the lines appended to the file at path during the run"""
+        self._files.append(_TailedFile(path, parser))
+
+    def watchChanges(self, path, callback):
+        """Call callback with the monitor if the file at path was changed
+
+        A file left from a former run is only reported after it was written again.
+        """
+        self._fileWatchers.append([path, _fileState(path), callback])
+
+    def emit(self, event):
+        with self._lock:
+            self.events.append(event)
+            signal.notify(self.signalProgress, event)
+
+    def observe(self, lineCallback=None):
+        """Read the output until the process ends and return its last outputLines lines
+
+        lineCallback is called with every output line.
+        """
+        stop = threading.Event()
+        poller = threading.Thread(target=self._pollFiles, args=(stop,))
+        poller.daemon = True
+        poller.start()
+        output = collections.deque(maxlen=self.outputLines)
+        try:
+            for line in iter(self.process.stdout.readline, b""):
+                line = femutils.pydecode(line).rstrip()
+                output.append(line)
+                if lineCallback is not None:
+                    lineCallback(line)
+                self._parse(line, self.outputParser)
+        finally:
+            stop.set()
+            poller.join()
+        # the last lines are written just before the process ends
+        self._poll()
+        return "\n".join(output)
+
+    def _pollFiles(self, stop):
+        while not stop.wait(self.pollInterval):
+            self._poll()
+
+    def _poll(self):
+        for tailed in self._files:
+            for line in tailed.readLines():
+                self._parse(line, tailed.parser)
+        for watcher in self._fileWatchers:
+            path, state, callback = watcher
+            newState = _fileState(path)
+            if newState is not None and newState != state:
+                watcher[1] = newState
+                callback(self)
+
+    def _parse(self, line, parser):
+        if parser is None:
+            return
+        event = parser(line)
+        if event is not None:
+            self.emit(event)
+
+
+def _fileState(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+class _TailedFile:
+
+    def __init__(self, path, parser):
+        self.path = path
+        self.parser = parser
+        self._offset = 0
+        self._rest = b""
+
+    def readLines(self):
+        """Return the complete lines appended since the last call"""
+        state = _fileState(self.path)
+        if state is None:
+            return []
+        if state[0] < self._offset:
+            # the file was written again from the beginning
+            self._offset = 0
+            self._rest = b""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+        except OSError:
+            return []
+        self._offset += len(data)
+        data = self._rest + data
+        # a line may be half written, keep it for the next call
+        lines = data.split(b"\n")
+        self._rest = lines.pop()
+        return [femutils.pydecode(line).rstrip() for line in lines]
+
+
+# ********************************************************************************************
+# CalculiX
+_ccx_step = re.compile(r"^\s*STEP\s+(\d+)\s*$")
+
+
+def parse_ccx_output(line):
+    """Parse a line of the CalculiX standard output, only step starts are reported"""
+    match = _ccx_step.match(line)
+    if match:
+        return ProgressEvent(STEP, step=int(match.group(1)))
+    return None
+
+
+def parse_ccx_sta(line):
+    """Parse a line of the CalculiX .sta file
+
+    STEP INC ATT ITRS TOT-TIME STEP-TIME INC-TIME, an attempt with a U
+    appended did not converge and is followed by a cut back.
+    """
+    fields = line.split()
+    if len(fields) != 7:
+        return None
+    converged = not fields[2].endswith("U")
+    try:
+        step, increment, iterations = int(fields[0]), int(fields[1]), int(fields[3])
+        total_time = float(fields[4])
+    except ValueError:
+        return None
+    return ProgressEvent(
+        INCREMENT,
+        step=step,
+        increment=increment,
+        iteration=iterations,
+        time=total_time,
+        converged=converged,
+    )
+
+
+def parse_ccx_cvg(line):
+    """Parse a line of the CalculiX .cvg file
+
+    STEP INC ATT ITER CONT-EL RESID-FORCE CORR-DISP RESID-FLUX CORR-TEMP,
+    residuals and corrections are in percent, the larger one of the
+    mechanical and thermal value is reported.
+    """
+    fields = line.split()
+    if len(fields) != 9:
+        return None
+    try:
+        step, increment, iteration = int(fields[0]), int(fields[1]), int(fields[3])
+        resid_force, corr_disp, resid_flux, corr_temp = (float(v) for v in fields[5:9])
+    except ValueError:
+        return None
+    return ProgressEvent(
+        ITERATION,
+        step=step,
+        increment=increment,
+        iteration=iteration,
+        residual=max(resid_force, resid_flux),
+        correction=max(corr_disp, corr_temp),
+    )
+
+
+# ********************************************************************************************
+# Elmer
+_elmer_time = re.compile(r"^MAIN: Time: (\d+)/(\d+)\s+(\S+)")
+_elmer_change = re.compile(
+    r"^ComputeChange: NS \(ITER=(\d+)\) \(NRM,RELC\): \(\s*(\S+)\s+(\S+)\s*\) :: (.*)$"
+)
+
+
+def parse_elmer_output(line):
+    """Parse a line of the ElmerSolver standard output
+
+    Time steps are reported as increments, nonlinear iterations of an
+    equation with the relative change as residual.
+    """
+    match = _elmer_time.match(line)
+    if match:
+        return ProgressEvent(
+            INCREMENT,
+            increment=int(match.group(1)),
+            time=_to_float(match.group(3)),
+            text="of {}".format(match.group(2)),
+        )
+    match = _elmer_change.match(line)
+    if match:
+        return ProgressEvent(
+            ITERATION,
+            iteration=int(match.group(1)),
+            residual=_to_float(match.group(3)),
+            text=match.group(4).strip(),
+        )
+    return None
+
+
+def _to_float(value):
+    # Fortran may print exponents without the E, as 0.1234-100
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return float(re.sub(r"(\d)([+-]\d+)$", r"\1E\2", value))
+    except ValueError:
+        return None
+
+
+##  @}
@@ -60,6 +60,8 @@ def displayLog(report):
         App.Console.PrintWarning("%s\n" % w)
     for e in report.errors:
         App.Console.PrintError("%s\n" % e)
+    if report.progressEvents:
+        App.Console.PrintLog("Last solver progress: %s\n" % report.progressEvents[-1])
 
 
 class Report:
@@ -68,11 +70,14 @@ class Report:
         self.infos = []
         self.warnings = []
         self.errors = []
+        # live progress of the solver run, see femsolver.progress
+        self.progressEvents = []
 
     def extend(self, report):
         self.infos.extend(report.infos)
         self.warnings.extend(report.warnings)
         self.errors.extend(report.errors)
+        self.progressEvents.extend(report.progressEvents)
 
     def getLevel(self):
         if self.errors:
@@ -95,5 +100,8 @@ class Report:
     def error(self, msg):
         self.errors.append(msg)
 
+    def progress(self, event):
+        self.progressEvents.append(event)
+
 
 ##  @}
@@ -45,9 +45,11 @@ import tempfile
 
 import FreeCAD as App
 
+from . import progress
 from . import settings
 from . import signal
 from . import task
+from femmesh import meshsetscache
 from femtools import femutils
 from femtools import membertools
 from femtools.errors import DirectoryDoesNotExistError
@@ -308,6 +310,8 @@ class BaseTask(task.Thread):
         self.solver = None
         self.directory = None
         self.testmode = None
+        # called with a progress.ProgressEvent while the task is running
+        self.signalProgress = set()
 
     @property
     def analysis(self):
@@ -377,15 +381,20 @@ class Machine(BaseTask):
         def statusProxy(line):
             self.pushStatus(line)
 
+        def progressProxy(event):
+            signal.notify(self.signalProgress, event)
+
         def killer():
             task.abort()
 
         self.signalAbort.add(killer)
         task.signalStatus.add(statusProxy)
+        task.signalProgress.add(progressProxy)
         task.start()
         task.join()
         self.signalAbort.remove(killer)
         task.signalStatus.remove(statusProxy)
+        task.signalProgress.remove(progressProxy)
 
     def _getTask(self, state):
         if state == CHECK:
@@ -490,18 +499,32 @@ class Check(BaseTask):
 
 class Solve(BaseTask):
 
-    def _observeSolver(self, process):
-        output = ""
-        line = femutils.pydecode(process.stdout.readline())
-        self.pushStatus(line)
-        output += line
-        line = femutils.pydecode(process.stdout.readline())
-        while line:
-            line = "\n%s" % line.rstrip()
-            self.pushStatus(line)
-            output += line
-            line = femutils.pydecode(process.stdout.readline())
-        return output
+    def _createMonitor(self, process, outputParser=None):
+        """Create a :class:`femsolver.progress.Monitor` reporting to this task
+
+        The solver specific Solve task adds the files to watch and calls
+        :meth:`_observeSolver` with the monitor.
+        """
+        monitor = progress.Monitor(process, outputParser)
+        monitor.signalProgress.add(self._pushProgress)
+        return monitor
+
+    def _pushProgress(self, event):
+        self.report.progress(event)
+        signal.notify(self.signalProgress, event)
+
+    def _observeSolver(self, process, monitor=None, pushOutput=True):
+        if monitor is None:
+            monitor = self._createMonitor(process)
+        first = True
+
+        def pushLine(line):
+            nonlocal first
+            # the first line without a line break, as the status is joined
+            self.pushStatus(line if first else "\n%s" % line)
+            first = False
+
+        return monitor.observe(pushLine if pushOutput else None)
 
 
 class Prepare(BaseTask):
@@ -521,6 +544,8 @@ class _DocObserver:
         "Fem::FemMeshObject",
     ]
     _BLACKLIST_PROPS = ["Label", "ElmerOutput", "ElmerResult"]
+    # properties changing the mesh sets of constraints, see femmesh.meshsetscache
+    _MESH_SETS_PROPS = ["FemMesh", "References", "Shape", "Placement"]
 
     def __init__(self):
         self._saved = {}
@@ -534,9 +559,12 @@ class _DocObserver:
         if cls._instance is None:
             cls._instance = cls()
             App.addDocumentObserver(cls._instance)
+            meshsetscache.activate()
 
     def slotDeletedObject(self, obj):
         self._checkModel(obj)
+        meshsetscache.clear(obj)
+        meshsetscache.invalidate(obj)
         if obj in _machines:
             self._deleteMachine(obj)
 
@@ -546,8 +574,11 @@ class _DocObserver:
             self._checkEquation(obj)
             self._checkSolver(obj)
             self._checkModel(obj)
+        if prop in self._MESH_SETS_PROPS:
+            meshsetscache.invalidate(obj)
 
     def slotDeletedDocument(self, doc):
+        meshsetscache.remove_document(doc)
         for obj in doc.Objects:
             if obj in _machines:
                 self._deleteMachine(obj)
@@ -28,6 +28,7 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import io
 import os
 from os.path import join
 
@@ -103,6 +104,8 @@ class FemInputWriter:
         self.femelement_faces_table = {}
         self.femelement_edges_table = {}
         self.femelement_count_test = True
+        # fingerprints of the split input files for incremental writing, set by the solver writer
+        self.input_fingerprints = None
 
         # deprecated, leave for compatibility reasons
         # do not add new objects
@@ -173,9 +176,15 @@ class FemInputWriter:
         if self.split_inpfile is True:
             file_name_split = f"{self.mesh_name}_{write_name}.inp"
             f.write(f"*INCLUDE,INPUT={file_name_split}\n")
-            inpfile_split = open(join(self.dir_name, file_name_split), "w")
-            constraint_sets_loop_writing(inpfile_split, femobjs, write_before, write_after)
-            inpfile_split.close()
+            if self.input_fingerprints is not None:
+                # incremental writing, only write the file if the sets have changed
+                buffer = io.StringIO()
+                constraint_sets_loop_writing(buffer, femobjs, write_before, write_after)
+                self.input_fingerprints.write_if_changed(file_name_split, buffer.getvalue())
+            else:
+                inpfile_split = open(join(self.dir_name, file_name_split), "w")
+                constraint_sets_loop_writing(inpfile_split, femobjs, write_before, write_after)
+                inpfile_split.close()
         else:
             constraint_sets_loop_writing(f, femobjs, write_before, write_after)
 
@@ -26,6 +26,7 @@ __title__ = "CcxTools FEM unit tests"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+import os
 import unittest
 from os.path import join
 
@@ -120,6 +121,105 @@ class TestCcxTools(unittest.TestCase):
             res_obj_name=res_obj_name,
         )
 
+    # ********************************************************************************************
+    def test_box_static_incremental(self):
+        # set up
+        from femexamples.boxanalysis_static import setup
+
+        setup(self.document, "ccxtools")
+        base_name = get_namefromdef("test_")
+        analysis_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + base_name)
+        solver_object = self.document.CalculiXCcxTools
+        solver_object.IncrementalInputWriter = True
+        fea = ccxtools.FemToolsCcx(self.document.Analysis, solver_object, test_mode=True)
+        fea.update_objects()
+        fea.setup_working_dir(analysis_dir)
+
+        # first writing writes all include files
+        fcc_print(f"Writing incremental input files to {analysis_dir}")
+        fea.write_inp_file()
+        mesh_file = join(analysis_dir, self.mesh_name + "_femesh.inp")
+        fixed_file = join(analysis_dir, self.mesh_name + "_constraints_fixed_node_sets.inp")
+        force_file = join(analysis_dir, self.mesh_name + "_constraints_force_node_loads.inp")
+        for include_file in (mesh_file, fixed_file, force_file):
+            self.assertTrue(os.path.isfile(include_file), f"{include_file} was not written")
+        with open(force_file) as f:
+            force_loads = f.read()
+
+        # mark the include files, a kept file keeps its mark
+        marker = "** kept from last writing\n"
+        for include_file in (mesh_file, fixed_file):
+            with open(include_file, "a") as f:
+                f.write(marker)
+
+        # change the force only and write again
+        self.document.FemConstraintForce.Force = "20000.0 N"
+        self.document.recompute()
+        fea.write_inp_file()
+        for include_file in (mesh_file, fixed_file):
+            with open(include_file) as f:
+                self.assertTrue(f.read().endswith(marker), f"{include_file} was written again")
+        with open(force_file) as f:
+            self.assertNotEqual(force_loads, f.read(), "Changed force loads were not written")
+
+    # ********************************************************************************************
+    def test_progress_monitor(self):
+        import io
+        from types import SimpleNamespace
+        from femsolver import progress
+
+        analysis_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + "progress_monitor")
+        sta_file = join(analysis_dir, self.mesh_name + ".sta")
+        cvg_file = join(analysis_dir, self.mesh_name + ".cvg")
+        with open(sta_file, "w") as f:
+            f.write(
+                " SUMMARY OF JOB INFORMATION\n"
+                "  STEP      INC     ATT   ITRS     TOT TIME     STEP TIME         INC TIME\n"
+                "     1        1       1U    6   0.1000000E+01  0.1000000E+01   0.1000000E+01\n"
+                "     1        1       2     4   0.2500000E+00  0.2500000E+00   0.2500000E+00\n"
+            )
+        with open(cvg_file, "w") as f:
+            f.write(
+                "   SUMMARY OF C0NVERGENCE INFORMATION\n"
+                "  STEP   INC  ATT  ITER     CONT.   RESID.        CORR.      RESID.      CORR.\n"
+                "                            EL.   FORCE(%)      DISP(%)    FLUX(%)    TEMP(%)\n"
+                "     1     1    2    4       0   0.2000E-02   0.1000E-01   0.0000E+00   0.0000E+00\n"
+            )
+        process = SimpleNamespace(stdout=io.BytesIO(b" STEP            1\n\n Job finished\n"))
+
+        events = []
+        monitor = progress.Monitor(process, progress.parse_ccx_output)
+        monitor.signalProgress.add(events.append)
+        monitor.watchFile(sta_file, progress.parse_ccx_sta)
+        monitor.watchFile(cvg_file, progress.parse_ccx_cvg)
+        output = monitor.observe()
+
+        self.assertEqual(output, " STEP            1\n\n Job finished")
+        self.assertEqual(
+            [e.kind for e in events],
+            [progress.STEP, progress.INCREMENT, progress.INCREMENT, progress.ITERATION],
+        )
+        self.assertFalse(events[1].converged)
+        self.assertTrue(events[2].converged)
+        self.assertAlmostEqual(events[2].time, 0.25)
+        self.assertEqual(events[3].iteration, 4)
+        self.assertAlmostEqual(events[3].residual, 0.002)
+        self.assertEqual(monitor.events, events)
+
+        # only the last lines of the output are kept
+        process = SimpleNamespace(stdout=io.BytesIO(b"".join(b"line %d\n" % i for i in range(50))))
+        monitor = progress.Monitor(process, outputLines=3)
+        self.assertEqual(monitor.observe(), "line 47\nline 48\nline 49")
+
+        # elmer output
+        event = progress.parse_elmer_output(
+            "ComputeChange: NS (ITER=3) (NRM,RELC): (  0.44553852E-03  0.51220013-100 ) "
+            ":: heat equation"
+        )
+        self.assertEqual(event.iteration, 3)
+        self.assertEqual(event.text, "heat equation")
+        self.assertAlmostEqual(event.residual, 0.51220013e-100)
+
     # ********************************************************************************************
     def test_ccx_buckling_flexuralbuckling(self):
         from femexamples.ccx_buckling_flexuralbuckling import setup
@@ -31,6 +31,10 @@ from os.path import join
 import FreeCAD
 
 import Fem
+import ObjectsFem
+from femmesh import meshsetscache
+from femmesh import meshtools
+
 from . import support_utils as testtools
 from .support_utils import fcc_print
 
@@ -45,10 +49,15 @@ class TestMeshCommon(unittest.TestCase):
         # new document
         self.document = FreeCAD.newDocument(self.__class__.__name__)
 
+        # the mesh sets cache is global, test_mesh_sets_cache activates it
+        self.mesh_sets_cache_active = meshsetscache.is_active()
+
     # ********************************************************************************************
     def tearDown(self):
         # tearDown is executed after every test
         FreeCAD.closeDocument(self.document.Name)
+        if not self.mesh_sets_cache_active:
+            meshsetscache.deactivate()
 
     # ********************************************************************************************
     def test_00print(self):
@@ -192,6 +201,115 @@ class TestMeshCommon(unittest.TestCase):
             f"Problem in test_writeAbaqus_precision, \n{read_node_line}\n{expected}",
         )
 
+    # ********************************************************************************************
+    def test_femnodes_ele_table(self):
+        # two tetra4 sharing the face of the nodes 2, 3, 4
+        tetra4 = Fem.FemMesh()
+        tetra4.addNode(0, 0, 0, 1)
+        tetra4.addNode(1, 0, 0, 2)
+        tetra4.addNode(0, 1, 0, 3)
+        tetra4.addNode(0, 0, 1, 4)
+        tetra4.addNode(1, 1, 1, 5)
+        tetra4.addVolume([1, 2, 3, 4], 1)
+        tetra4.addVolume([2, 3, 4, 5], 2)
+
+        femelement_table = meshtools.get_femelement_table(tetra4)
+        femnodes_ele_table = meshtools.get_femnodes_ele_table(tetra4.Nodes, femelement_table)
+        self.assertEqual(len(femnodes_ele_table), 5)
+        self.assertEqual(femnodes_ele_table[1], [[1, 1]])
+        self.assertEqual(femnodes_ele_table[2], [[1, 2], [2, 1]])
+        self.assertEqual(femnodes_ele_table[5], [[2, 8]])
+
+        bit_pattern_dict = meshtools.get_bit_pattern_dict(
+            femelement_table, femnodes_ele_table, [2, 3, 4]
+        )
+        self.assertEqual(bit_pattern_dict, {1: [4, 14], 2: [4, 7]})
+        self.assertEqual(
+            meshtools.get_ccxelement_faces_from_binary_search(bit_pattern_dict),
+            [[1, 4], [2, 1]],
+        )
+        self.assertEqual(
+            meshtools.get_femelements_by_femnodes_bin(
+                femelement_table, femnodes_ele_table, [1, 2, 3, 4]
+            ),
+            [1],
+        )
+
+    # ********************************************************************************************
+    def test_mesh_sets_cache(self):
+        doc = self.document
+        box = doc.addObject("Part::Box", "Box")
+        analysis = ObjectsFem.makeAnalysis(doc)
+        mesh_obj = ObjectsFem.makeMeshResult(doc)
+        fixed = ObjectsFem.makeConstraintFixed(doc)
+        fixed.References = [(box, ("Face1",))]
+        analysis.addObject(mesh_obj)
+        analysis.addObject(fixed)
+        doc.recompute()
+
+        computed = []
+
+        def compute():
+            computed.append(1)
+            return [1, 2, 3]
+
+        meshsetscache.activate()
+        nodes = meshsetscache.get_mesh_set(analysis, mesh_obj, "Nodes", fixed, compute)
+        nodes.append(4)
+        nodes = meshsetscache.get_mesh_set(analysis, mesh_obj, "Nodes", fixed, compute)
+        self.assertEqual(nodes, [1, 2, 3])
+        self.assertEqual(len(computed), 1)
+
+        # the references are part of the key
+        fixed.References = [(box, ("Face2",))]
+        meshsetscache.get_mesh_set(analysis, mesh_obj, "Nodes", fixed, compute)
+        self.assertEqual(len(computed), 2)
+
+        # a change of the referenced shape removes the mesh sets
+        meshsetscache.invalidate(box)
+        meshsetscache.get_mesh_set(analysis, mesh_obj, "Nodes", fixed, compute)
+        self.assertEqual(len(computed), 3)
+        meshsetscache.invalidate(mesh_obj)
+        meshsetscache.get_mesh_set(analysis, mesh_obj, "Nodes", fixed, compute)
+        self.assertEqual(len(computed), 4)
+        meshsetscache.clear(analysis)
+
+    # ********************************************************************************************
+    def test_bulk_arrays(self):
+        # two tetra4 and a tria3 with gaps in the ids, added by the bulk array API
+        import numpy as np
+
+        femmesh = Fem.FemMesh()
+        femmesh.addNodes(
+            np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=float),
+            np.array([2, 4, 6, 8, 10]),
+        )
+        femmesh.addElements("Volume", np.array([[2, 4, 6, 8], [4, 6, 8, 10]]), 4, [5, 7])
+        femmesh.addElements("Face", [2, 4, 6], 3, [20])
+        self.assertEqual(femmesh.NodeCount, 5)
+        self.assertEqual(femmesh.Nodes[10], FreeCAD.Vector(1, 1, 1))
+        self.assertEqual(femmesh.Volumes, (5, 7))
+        self.assertEqual(femmesh.getElementNodes(7), (4, 6, 8, 10))
+        self.assertEqual(femmesh.Faces, (20,))
+
+        node_ids, coords = meshtools.get_node_arrays(femmesh)
+        self.assertEqual(node_ids.tolist(), [2, 4, 6, 8, 10])
+        self.assertEqual(coords[1].tolist(), [1.0, 0.0, 0.0])
+        ele_ids, node_counts, nodes = meshtools.get_element_arrays(femmesh, "Volume")
+        self.assertEqual(ele_ids.tolist(), [5, 7])
+        self.assertEqual(node_counts.tolist(), [4, 4])
+        self.assertEqual(nodes.tolist(), [2, 4, 6, 8, 4, 6, 8, 10])
+
+        with self.assertRaises(ValueError):
+            femmesh.addElements("Volume", [2, 4, 6, 8, 10], 4)
+        with self.assertRaises(ValueError):
+            femmesh.addElements("Volume", [2, 4, 6, 99], 4)
+
+        new_mesh, node_map, elem_map = meshtools.compact_mesh(femmesh)
+        self.assertEqual(node_map, {2: 1, 4: 2, 6: 3, 8: 4, 10: 5})
+        self.assertEqual(elem_map, {20: 2, 5: 3, 7: 4})
+        self.assertEqual(new_mesh.getElementNodes(4), (2, 3, 4, 5))
+
 
 # ************************************************************************************************
 # ************************************************************************************************
@@ -437,6 +555,22 @@ class TestMeshEleTetra10(unittest.TestCase):
 
         self.compare_mesh_files(femmesh_testfile, femmesh_outfile, file_extension)
 
+    # ********************************************************************************************
+    def test_tetra10_npz(self):
+        # tetra10 element: reading from and writing to npz mesh file format
+
+        file_extension = "npz"
+        outfile, testfile = self.get_file_paths(file_extension)
+
+        from feminout.importNpzMesh import read
+        from feminout.importNpzMesh import write
+
+        write(outfile, self.femmesh)
+        femmesh_testfile = read(outfile)
+        femmesh_outfile = read(testfile)
+
+        self.compare_mesh_files(femmesh_testfile, femmesh_outfile, file_extension)
+
     # ********************************************************************************************
     def test_tetra10_z88(self):
         # tetra10 element: reading from and writing to z88 mesh file format
@@ -486,16 +620,9 @@ class TestMeshGroups(unittest.TestCase):
         correct.
         """
 
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes import load_mesh
 
-        fm = Fem.FemMesh()
-        control = create_nodes(fm)
-        if not control:
-            fcc_print("failed to create nodes")
-        control = create_elements(fm)
-        if not control:
-            fcc_print("failed to create elements")
+        fm = load_mesh("mesh_canticcx_tetra10")
 
         # information
         # fcc_print(fm)
@@ -541,16 +668,9 @@ class TestMeshGroups(unittest.TestCase):
         Adds a number of groups to FemMesh and deletes them
         afterwards. Checks whether GroupCount is OK
         """
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes import load_mesh
 
-        fm = Fem.FemMesh()
-        control = create_nodes(fm)
-        if not control:
-            fcc_print("failed to create nodes")
-        control = create_elements(fm)
-        if not control:
-            fcc_print("failed to create elements")
+        fm = load_mesh("mesh_canticcx_tetra10")
 
         # information
         # fcc_print(fm)
@@ -576,16 +696,9 @@ class TestMeshGroups(unittest.TestCase):
         Add a node group, add elements to it. Verify that elements added
         and elements in getGroupElements are the same.
         """
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
-
-        fm = Fem.FemMesh()
-        control = create_nodes(fm)
-        if not control:
-            fcc_print("failed to create nodes")
-        control = create_elements(fm)
-        if not control:
-            fcc_print("failed to create elements")
+        from femexamples.meshes import load_mesh
+
+        fm = load_mesh("mesh_canticcx_tetra10")
 
         # information
         # fcc_print(fm)
@@ -191,3 +191,189 @@ class TestResult(unittest.TestCase):
         self.assertEqual(
             disp_abs, expected_dispabs, "Calculated displacement abs are not the expected values."
         )
+
+    # ********************************************************************************************
+    def test_stress_arrays(self):
+        import numpy as np
+        from femresult import resulttools
+
+        stress = (
+            self.get_stress_values(),
+            (2.000, -2.000, 5.000, 6.000, -4.000, 2.000),
+            (0.000, 0.000, 0.000, 10.000, 8.000, 7.000),
+            (15.000, 0.000, 0.000, 0.000, 0.000, 0.000),
+        )
+        mises = resulttools.calculate_von_mises_array(stress)
+        prin_std = resulttools.calculate_principal_stress_std_array(stress)
+        prin_rc = resulttools.calculate_principal_stress_reinforced_array(stress)
+        rho = resulttools.calculate_rho_array(stress, 500)
+        mohr = resulttools.calculate_mohr_coulomb_array(prin_rc[0], prin_rc[2], 0.5, 30.0)
+        for i, stress_tensor in enumerate(stress):
+            self.assertAlmostEqual(mises[i], resulttools.calculate_von_mises(stress_tensor))
+            expected = resulttools.calculate_principal_stress_std(stress_tensor)
+            for j in range(4):
+                self.assertAlmostEqual(prin_std[j][i], expected[j])
+            expected = resulttools.calculate_principal_stress_reinforced(stress_tensor)
+            for j in range(4):
+                self.assertAlmostEqual(prin_rc[j][i], expected[j])
+            self.assertTrue(np.allclose(prin_rc[4][i], expected[4]))
+            expected = resulttools.calculate_rho(stress_tensor, 500)
+            self.assertTrue(np.allclose(rho[i], expected), f"Different rho of {stress_tensor}.")
+            expected = resulttools.calculate_mohr_coulomb(prin_rc[0][i], prin_rc[2][i], 0.5, 30.0)
+            self.assertAlmostEqual(mohr[i], expected)
+
+    # ********************************************************************************************
+    def test_read_frd_blocks(self):
+        from feminout.importCcxFrdResults import read_frd_result as read_lines
+        from feminout.readCcxFrd import read_frd_result as read_blocks
+
+        test_file_dir = join(testtools.get_fem_test_home_dir(), "calculix")
+        for base_name in ("box_static", "box_frequency"):
+            frd_file = join(test_file_dir, base_name + ".frd")
+            expected = read_lines(frd_file)
+            read = read_blocks(frd_file)
+            self.assertEqual(list(expected), list(read), f"Different keys read from {frd_file}.")
+            for key in expected:
+                if key == "Results":
+                    continue
+                self.assertEqual(expected[key], read[key], f"Different {key} read from {frd_file}.")
+            self.assertEqual(len(expected["Results"]), len(read["Results"]))
+            for expected_set, read_set in zip(expected["Results"], read["Results"]):
+                self.assertEqual(list(expected_set), list(read_set))
+                for key in expected_set:
+                    if key in ("number", "time"):
+                        # NaN if there is no eigenmode or time
+                        self.assertEqual(str(expected_set[key]), str(read_set[key]))
+                    else:
+                        self.assertEqual(
+                            expected_set[key],
+                            read_set[key],
+                            f"Different result {key} read from {frd_file}.",
+                        )
+
+    # ********************************************************************************************
+    def test_read_frd_lazy(self):
+        from feminout.readCcxFrd import read_frd_result
+        from femresult.resultloader import get_frd_index
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", "box_frequency.frd")
+        read = read_frd_result(frd_file)
+        read_lazy = read_frd_result(frd_file, lazy=True)
+        self.assertEqual(len(read["Results"]), len(read_lazy["Results"]))
+        self.assertEqual(read["Results"][0], read_lazy["Results"][0])
+        for result_set in read_lazy["Results"][1:]:
+            self.assertEqual(sorted(result_set), ["number", "time"])
+        index = get_frd_index(frd_file)
+        self.assertEqual(len(read["Results"]), len(index["Results"]))
+        self.assertIs(index, get_frd_index(frd_file), "Index of unchanged frd file not reused.")
+
+    # ********************************************************************************************
+    def test_load_frd_lazy(self):
+        import ObjectsFem
+        from feminout.importCcxFrdResults import add_derived_results
+        from feminout.importToolsFem import fill_femresult_mechanical
+        from feminout.readCcxFrd import read_frd_result
+        from femresult import resultloader
+
+        frd_file = join(testtools.get_fem_test_tmp_dir("frd_lazy"), "box_frequency_modes.frd")
+        write_frd_eigenmodes(
+            join(testtools.get_fem_test_home_dir(), "calculix", "box_frequency.frd"), frd_file, 3
+        )
+        read = read_frd_result(frd_file)
+        read_lazy = read_frd_result(frd_file, lazy=True)
+        self.assertEqual(len(read["Results"]), 3)
+        self.assertEqual(len(read_lazy["Results"]), 3)
+        self.assertEqual(read["Results"][0], read_lazy["Results"][0])
+        for result_set, lazy_set in zip(read["Results"][1:], read_lazy["Results"][1:]):
+            self.assertEqual(sorted(lazy_set), ["number", "time"])
+            self.assertEqual(result_set["number"], lazy_set["number"])
+
+        # eager result objects are filled like importFrd() does
+        eager = []
+        lazy = []
+        for i, result_set in enumerate(read["Results"]):
+            res_obj = ObjectsFem.makeResultMechanical(self.document, f"Eager{i}")
+            res_obj = fill_femresult_mechanical(res_obj, result_set)
+            eager.append(add_derived_results(res_obj))
+            res_obj = ObjectsFem.makeResultMechanical(self.document, f"Lazy{i}")
+            res_obj.ResultFile = frd_file
+            res_obj.ResultSetIndex = i
+            lazy.append(res_obj)
+        self.assertNotEqual(eager[0].DisplacementVectors, eager[1].DisplacementVectors)
+
+        fem_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/General")
+        cache_size_set = "LazyResultCacheSize" in fem_prefs.GetInts()
+        cache_size = fem_prefs.GetInt("LazyResultCacheSize", 4)
+        fem_prefs.SetInt("LazyResultCacheSize", 2)
+        resultloader.clear_cache()
+        try:
+            for eager_obj, lazy_obj in zip(eager, lazy):
+                self.assertFalse(resultloader.is_result_loaded(lazy_obj))
+                resultloader.load_result(lazy_obj)
+                self.assertTrue(resultloader.is_result_loaded(lazy_obj))
+                self.assert_same_result(eager_obj, lazy_obj)
+
+            # the least recently used result is unloaded, its Stats are kept
+            self.assertFalse(resultloader.is_result_loaded(lazy[0]))
+            self.assertEqual(lazy[0].DisplacementVectors, [])
+            self.assertEqual(lazy[0].vonMises, [])
+            self.assertEqual(lazy[0].NodeNumbers, eager[0].NodeNumbers)
+            self.assertEqual(lazy[0].Stats, eager[0].Stats)
+
+            # loading a result again makes it the most recently used one
+            resultloader.load_result(lazy[1])
+            resultloader.load_result(lazy[0])
+            self.assertTrue(resultloader.is_result_loaded(lazy[1]))
+            self.assertFalse(resultloader.is_result_loaded(lazy[2]))
+            self.assertEqual(lazy[2].DisplacementVectors, [])
+            self.assert_same_result(eager[0], lazy[0])
+
+            resultloader.unload_result(lazy[1])
+            self.assertFalse(resultloader.is_result_loaded(lazy[1]))
+            self.assertEqual(lazy[1].DisplacementVectors, [])
+        finally:
+            resultloader.clear_cache()
+            if cache_size_set:
+                fem_prefs.SetInt("LazyResultCacheSize", cache_size)
+            else:
+                fem_prefs.RemInt("LazyResultCacheSize")
+
+    def assert_same_result(self, expected, res_obj):
+        for prop in (
+            "NodeNumbers",
+            "DisplacementVectors",
+            "DisplacementLengths",
+            "vonMises",
+            "PrincipalMax",
+            "NodeStressXX",
+            "NodeStrainXX",
+            "Stats",
+            "Eigenmode",
+        ):
+            self.assertEqual(
+                getattr(expected, prop),
+                getattr(res_obj, prop),
+                f"Different {prop} of {res_obj.Name} loaded from result set.",
+            )
+
+
+def write_frd_eigenmodes(frd_file, output_file, count):
+    """Writes a copy of a frd file with one eigenmode with its result blocks repeated
+    for count eigenmodes. The values of every second eigenmode have their sign flipped."""
+    with open(frd_file) as f:
+        lines = f.read().splitlines()
+    start = next(i for i, line in enumerate(lines) if line[4:10] == "1PSTEP")
+    end = next(i for i, line in enumerate(lines) if line[1:5] == "9999")
+    with open(output_file, "w") as f:
+        f.write("\n".join(lines[:start]) + "\n")
+        for mode in range(1, count + 1):
+            for line in lines[start:end]:
+                if line[5:10] == "PMODE":
+                    line = line[:30] + f"{mode:6d}"
+                elif line[1:3] == "-1" and mode % 2 == 0:
+                    # node number record, the values are 12 characters wide
+                    values = [line[i : i + 12] for i in range(13, len(line), 12)]
+                    flipped = [("-" if v[0] == " " else " ") + v[1:] for v in values]
+                    line = line[:13] + "".join(flipped)
+                f.write(line + "\n")
+        f.write("\n".join(lines[end:]) + "\n")
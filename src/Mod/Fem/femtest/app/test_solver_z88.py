@@ -99,6 +99,34 @@ class TestSolverZ88(unittest.TestCase):
         setup(self.document, "z88")
         self.inputfile_writing_test(get_namefromdef("test_"))
 
+    # ********************************************************************************************
+    def test_batch_faceload(self):
+        from femexamples.ccx_cantilever_faceload import setup
+        from femsolver import batch
+
+        setup(self.document, "z88")
+        self.document.recompute()
+        working_dir = testtools.get_fem_test_tmp_dir("solver_z88_batch_faceload")
+        variants = [
+            ("force_1000", {"ConstraintForce": {"Force": "1000.0 N"}}),
+            ("force_2000", {"ConstraintForce": {"Force": "2000.0 N"}}),
+        ]
+        jobs = batch.run_batch(
+            self.document.SolverZ88, variants, working_dir, max_jobs=2, target=femsolver.run.PREPARE
+        )
+
+        self.assertEqual([job.status for job in jobs], [batch.PREPARED, batch.PREPARED])
+        self.assertEqual(self.document.ConstraintForce.Force.getValueAs("N"), 9000000.0)
+        input_files = []
+        for job in jobs:
+            self.assertTrue(isfile(join(job.directory, "z88i1.txt")))
+            with open(join(job.directory, "z88i2.txt")) as f:
+                input_files.append(f.read())
+        self.assertNotEqual(input_files[0], input_files[1])
+        for job in jobs:
+            self.assertEqual(list(job.reports), ["prepare"])
+            self.assertEqual(job.report.errors, job.reports["prepare"].errors)
+
     # ********************************************************************************************
     def inputfile_writing_test(self, base_name):
         self.document.recompute()